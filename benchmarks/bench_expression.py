@@ -0,0 +1,65 @@
+"""Expression benchmark - cold vs warm bonus_expression evaluation.
+
+Cold calls clear the compiled-expression LRU first, so they pay for parsing,
+validation and compilation; warm calls find the code object in the LRU and
+only evaluate it. Both are measured for scalar variables and for a batch of
+array bindings.
+
+Usage:
+    uv run python benchmarks/bench_expression.py --rows 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable, Mapping
+
+from mcp_starter.calculator import Operand, compile_expression, evaluate
+
+EXPRESSION = "(a + b) * c / 2 - a ** 2 / (b + 1)"
+
+
+def per_call_us(fn: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    scalars = {"a": 1.5, "b": 2.0, "c": 4.0}
+    rng = random.Random(0)
+    arrays = {name: [rng.uniform(-10, 10) for _ in range(args.rows)] for name in "abc"}
+
+    def cold(variables: Mapping[str, Operand]) -> Callable[[], object]:
+        def run() -> object:
+            compile_expression.cache_clear()
+            return evaluate(EXPRESSION, variables)
+
+        return run
+
+    def warm(variables: Mapping[str, Operand]) -> Callable[[], object]:
+        return lambda: evaluate(EXPRESSION, variables)
+
+    batch_iterations = max(1, args.iterations // 100)
+    rows = [
+        ("scalar", "cold", per_call_us(cold(scalars), args.iterations)),
+        ("scalar", "warm", per_call_us(warm(scalars), args.iterations)),
+        (f"{args.rows} rows", "cold", per_call_us(cold(arrays), batch_iterations)),
+        (f"{args.rows} rows", "warm", per_call_us(warm(arrays), batch_iterations)),
+    ]
+
+    print(f"{EXPRESSION!r}")
+    for variables, state, us in rows:
+        print(f"{variables:>12}  {state}  {us:10.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
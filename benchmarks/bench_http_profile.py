@@ -0,0 +1,164 @@
+"""HTTP server profiles - hello throughput and tail latency, default vs tuned.
+
+Starts the server over HTTP once per profile and drives it from several
+load-generator processes, each running concurrent MCP sessions that call
+`hello` in a loop over keep-alive connections:
+
+- default: what FastMCP runs (asyncio loop, pure-Python h11 parser)
+- tuned: uvloop + httptools, a deeper listen backlog and longer keep-alive
+
+Reports requests/sec and p50/p99 latency per profile. The tuned profile
+needs the ``perf`` extra (uvloop, httptools) and is skipped without it.
+
+Usage:
+    uv run python benchmarks/bench_http_profile.py --clients 2 --sessions 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import anyio
+import httpx
+
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "bench", "version": "1.0"},
+    },
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+
+PROFILES = {
+    "default": ["--loop", "asyncio", "--http-parser", "h11"],
+    "tuned": [
+        "--loop",
+        "uvloop",
+        "--http-parser",
+        "httptools",
+        "--backlog",
+        "4096",
+        "--keep-alive",
+        "30",
+    ],
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.TransportError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not start")
+
+
+async def session(url: str, warm_until: float, stop_at: float, samples: list[float]) -> None:
+    async with httpx.AsyncClient(headers=HEADERS, timeout=30.0) as client:
+        response = await client.post(url, json=INITIALIZE)
+        headers = {"Mcp-Session-Id": response.headers["mcp-session-id"]}
+        await client.post(url, json=INITIALIZED, headers=headers)
+        request_id = 0
+        while (now := time.monotonic()) < stop_at:
+            request_id += 1
+            call = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "tools/call",
+                "params": {"name": "hello", "arguments": {"name": f"bench-{request_id}"}},
+            }
+            response = await client.post(url, json=call, headers=headers)
+            response.raise_for_status()
+            if now >= warm_until:
+                samples.append(time.monotonic() - now)
+        await client.delete(url, headers=headers)
+
+
+def load(
+    url: str, sessions: int, warmup: float, duration: float, results: multiprocessing.Queue
+) -> None:
+    samples: list[float] = []
+
+    async def run() -> None:
+        warm_until = time.monotonic() + warmup
+        async with anyio.create_task_group() as tg:
+            for _ in range(sessions):
+                tg.start_soon(session, url, warm_until, warm_until + duration, samples)
+
+    anyio.run(run)
+    results.put(samples)
+
+
+def measure(profile: str, clients: int, sessions: int, warmup: float, duration: float) -> None:
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/mcp"
+    command = [sys.executable, "-m", "mcp_starter.server", "--http", "--port", str(port)]
+    server = subprocess.Popen(
+        [*command, *PROFILES[profile]],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_ready(url)
+        results: multiprocessing.Queue = multiprocessing.Queue()
+        generators = [
+            multiprocessing.Process(target=load, args=(url, sessions, warmup, duration, results))
+            for _ in range(clients)
+        ]
+        for generator in generators:
+            generator.start()
+        samples = sorted(sample for _ in generators for sample in results.get())
+        for generator in generators:
+            generator.join()
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(
+        f"{profile:8s}  {len(samples) / duration:8.0f} req/s"
+        f"  p50 {statistics.median(samples) * 1000:7.2f} ms"
+        f"  p99 {samples[int(len(samples) * 0.99)] * 1000:7.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--clients", type=int, default=2, help="load-generator processes")
+    parser.add_argument("--sessions", type=int, default=16, help="sessions per client process")
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.clients} client processes x {args.sessions} sessions")
+    for profile in PROFILES:
+        if profile == "tuned" and not all(
+            importlib.util.find_spec(module) for module in ("uvloop", "httptools")
+        ):
+            print("tuned     skipped: install the perf extra (uvloop, httptools)")
+            continue
+        measure(profile, args.clients, args.sessions, args.warmup, args.duration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""HTTP worker scaling - tools/call throughput with 1..N server processes.
+
+For each worker count, starts the server (`--http --workers N`) on a free
+port and drives it from several load-generator processes, each running many
+concurrent MCP sessions that call `hello` in a loop over keep-alive
+connections. Every session initializes first, so requests carry a real
+`Mcp-Session-Id` and exercise session affinity.
+
+The load generators need CPU too: on a machine with C cores, compare
+worker counts up to about C/2.
+
+Usage:
+    uv run python benchmarks/bench_http_workers.py --workers 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import anyio
+import httpx
+
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "bench", "version": "1.0"},
+    },
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.TransportError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not start")
+
+
+async def session(url: str, stop_at: float, counts: list[int]) -> None:
+    async with httpx.AsyncClient(headers=HEADERS, timeout=30.0) as client:
+        response = await client.post(url, json=INITIALIZE)
+        headers = {"Mcp-Session-Id": response.headers["mcp-session-id"]}
+        await client.post(url, json=INITIALIZED, headers=headers)
+        request_id = 0
+        while time.monotonic() < stop_at:
+            request_id += 1
+            call = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "tools/call",
+                "params": {"name": "hello", "arguments": {"name": f"bench-{request_id}"}},
+            }
+            response = await client.post(url, json=call, headers=headers)
+            response.raise_for_status()
+            counts[0] += 1
+        await client.delete(url, headers=headers)
+
+
+def load(url: str, sessions: int, duration: float, results: multiprocessing.Queue) -> None:
+    counts = [0]
+
+    async def run() -> None:
+        stop_at = time.monotonic() + duration
+        async with anyio.create_task_group() as tg:
+            for _ in range(sessions):
+                tg.start_soon(session, url, stop_at, counts)
+
+    anyio.run(run)
+    results.put(counts[0])
+
+
+def measure(workers: int, clients: int, sessions: int, duration: float) -> float:
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/mcp"
+    command = [sys.executable, "-m", "mcp_starter.server", "--http", "--port", str(port)]
+    server = subprocess.Popen(
+        [*command, "--workers", str(workers)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_ready(url)
+        results: multiprocessing.Queue = multiprocessing.Queue()
+        generators = [
+            multiprocessing.Process(target=load, args=(url, sessions, duration, results))
+            for _ in range(clients)
+        ]
+        for generator in generators:
+            generator.start()
+        total = sum(results.get() for _ in generators)
+        for generator in generators:
+            generator.join()
+        return total / duration
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=max(2, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--sessions", type=int, default=16, help="sessions per client process")
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.clients} client processes x {args.sessions} sessions")
+    baseline = None
+    for workers in args.workers:
+        rate = measure(workers, args.clients, args.sessions, args.duration)
+        baseline = baseline or rate
+        print(f"workers={workers:3d}  {rate:9.0f} calls/s  ({rate / baseline:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""JSON encoder microbenchmark - pydantic vs orjson vs msgspec on the wire.
+
+Builds the largest messages this server sends through its real handlers,
+wrapped in the JSON-RPC envelope as the session does, and times the call
+every transport makes to encode them (``model_dump_json``) under each
+encoder that is installed:
+
+- ``tools/list`` with inline icons (stdio) and with icon URLs (HTTP)
+- ``get_weather_batch`` structured output for ``--cities`` cities
+- ``get_weather`` and ``item://1`` (typical small responses)
+- A progress notification
+
+Also checks that each encoder's output parses to the same JSON as pydantic's.
+
+Usage:
+    uv run python benchmarks/bench_json_encoder.py --cities 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import time
+from collections.abc import Sequence
+from typing import Any, cast
+
+import anyio
+import mcp.types as types
+from pydantic import AnyUrl
+
+from mcp_starter.icon_routes import register_icon_routes
+from mcp_starter.json_encoder import install_json_encoder
+from mcp_starter.server import mcp, tool_list_cache
+
+
+def response(result: types.ServerResult) -> types.JSONRPCMessage:
+    dump = result.model_dump(by_alias=True, mode="json", exclude_none=True)
+    return types.JSONRPCMessage(types.JSONRPCResponse(jsonrpc="2.0", id=1, result=dump))
+
+
+async def handle(request: Any) -> types.JSONRPCMessage:
+    return response(await mcp._mcp_server.request_handlers[type(request)](request))
+
+
+async def call(name: str, arguments: dict[str, Any]) -> types.JSONRPCMessage:
+    """A tools/call response, built as the lowlevel server does."""
+    content, structured = cast(
+        tuple[Sequence[types.ContentBlock], dict[str, Any]], await mcp.call_tool(name, arguments)
+    )
+    result = types.CallToolResult(content=list(content), structuredContent=structured)
+    return response(types.ServerResult(result))
+
+
+async def messages(cities: int) -> dict[str, types.JSONRPCMessage]:
+    built = {"tools/list (inline icons)": await handle(types.ListToolsRequest(method="tools/list"))}
+    register_icon_routes(mcp, "http://127.0.0.1:3000")
+    tool_list_cache.invalidate()
+    built["tools/list (icon URLs)"] = await handle(types.ListToolsRequest(method="tools/list"))
+    names = [f"City {i}" for i in range(cities)]
+    built[f"get_weather_batch ({cities})"] = await call("get_weather_batch", {"cities": names})
+    built["get_weather"] = await call("get_weather", {"city": "Paris"})
+    read = types.ReadResourceRequest(
+        method="resources/read", params=types.ReadResourceRequestParams(uri=AnyUrl("item://1"))
+    )
+    built["item://1"] = await handle(read)
+    progress = types.ServerNotification(
+        types.ProgressNotification(
+            method="notifications/progress",
+            params=types.ProgressNotificationParams(progressToken="t", progress=3, total=10),
+        )
+    )
+    dump = progress.model_dump(by_alias=True, mode="json", exclude_none=True)
+    built["notifications/progress"] = types.JSONRPCMessage(
+        types.JSONRPCNotification(jsonrpc="2.0", **dump)
+    )
+    return built
+
+
+def per_call(message: types.JSONRPCMessage, seconds: float) -> float:
+    """Microseconds per encode, repeating for about ``seconds``."""
+    iterations = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        for _ in range(10):
+            message.model_dump_json(by_alias=True, exclude_none=True)
+        iterations += 10
+    return elapsed / iterations * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--cities", type=int, default=5000)
+    parser.add_argument("--seconds", type=float, default=0.5, help="per message and encoder")
+    args = parser.parse_args()
+
+    encoders = ["pydantic", *(e for e in ("orjson", "msgspec") if importlib.util.find_spec(e))]
+    built = await messages(args.cities)
+    print(f"{'message':28s} {'size':>11s}" + "".join(f" {e:>16s}" for e in encoders))
+    for name, message in built.items():
+        install_json_encoder("pydantic")
+        expected = message.model_dump_json(by_alias=True, exclude_none=True)
+        row = f"{name:28s} {len(expected) / 1024:7.1f} KiB"
+        baseline = None
+        for encoder in encoders:
+            install_json_encoder(encoder)
+            encoded = message.model_dump_json(by_alias=True, exclude_none=True)
+            assert json.loads(encoded) == json.loads(expected), f"{encoder} differs on {name}"
+            micros = per_call(message, args.seconds)
+            baseline = baseline or micros
+            row += f" {micros:7.1f} us ({baseline / micros:4.1f}x)"
+        print(row)
+    print("(us per model_dump_json; speedup vs pydantic)")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
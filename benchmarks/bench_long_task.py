@@ -0,0 +1,80 @@
+"""long_task load test - event-loop lag with thousands of concurrent calls.
+
+Starts N concurrent `long_task` calls (with progress tokens) through a real
+client session over in-memory streams, while a probe task measures how late
+the event loop wakes it up. Lag is what every other request on the server
+would feel.
+
+Usage:
+    uv run python benchmarks/bench_long_task.py --calls 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+import anyio
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from mcp_starter.server import mcp
+
+PROBE_INTERVAL = 0.01
+
+
+async def probe(lags: list[float], done: anyio.Event) -> None:
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--steps", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)  # One "Processing request" line per call otherwise
+
+    received = 0
+
+    async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+        nonlocal received
+        received += 1
+
+    lags: list[float] = []
+    done = anyio.Event()
+    async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+
+        async def call(i: int) -> None:
+            await client.call_tool(
+                "long_task",
+                {"taskName": f"task-{i}", "steps": args.steps},
+                progress_callback=on_progress,
+            )
+
+        start = time.perf_counter()
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(probe, lags, done)
+            async with anyio.create_task_group() as calls:
+                for i in range(args.calls):
+                    calls.start_soon(call, i)
+            done.set()
+        elapsed = time.perf_counter() - start
+
+    lags.sort()
+    print(f"{args.calls} x long_task({args.steps} steps): {elapsed:.1f} s")
+    print(f"progress notifications received: {received}")
+    print(
+        f"loop lag  p50 {statistics.median(lags) * 1000:7.1f} ms"
+        f"  p99 {lags[int(len(lags) * 0.99)] * 1000:7.1f} ms"
+        f"  max {lags[-1] * 1000:7.1f} ms  ({len(lags)} samples)"
+    )
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -0,0 +1,140 @@
+"""Session store microbenchmark - store round trips vs the cached hot path.
+
+For each backend (in-memory, SQLite, Redis protocol) measures:
+
+- ``store.get``: one round trip to the store per lookup
+- cached ``get``: the read-through cache in front of it
+- ``attach``: what every request pays once its session is attached
+
+The Redis backend talks to a local stand-in: a minimal RESP server in this
+script (GET/SET/DEL/SELECT/AUTH), with an optional simulated network round
+trip (``--rtt-ms``). Pass ``--redis-url`` to use a real server instead.
+
+Usage:
+    uv run python benchmarks/bench_session_store.py --rtt-ms 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import mcp_starter.server  # noqa: F401  Registers the bonus tools attach restores
+from mcp_starter.session_recovery import SessionSync
+from mcp_starter.session_store import (
+    MemorySessionStore,
+    RedisSessionStore,
+    SessionRecord,
+    SessionStore,
+    SQLiteSessionStore,
+)
+from mcp_starter.tools import session_tools
+
+RECORD = SessionRecord(
+    client={
+        "protocolVersion": "2025-06-18",
+        "capabilities": {"sampling": {}, "elicitation": {}},
+        "clientInfo": {"name": "bench", "version": "1.0"},
+    },
+    tools=["bonus_calculator", "bonus_expression"],
+)
+
+
+class RespStandIn:
+    """Just enough of a Redis server for the session store."""
+
+    def __init__(self, rtt: float) -> None:
+        self.rtt = rtt
+        self.data: dict[bytes, bytes] = {}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                count = int((await reader.readuntil(b"\r\n"))[1:-2])
+                args = []
+                for _ in range(count):
+                    length = int((await reader.readuntil(b"\r\n"))[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                if self.rtt:
+                    await asyncio.sleep(self.rtt)
+                writer.write(self.execute(args))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            writer.close()
+
+    def execute(self, args: list[bytes]) -> bytes:
+        command = args[0].upper()
+        if command == b"GET":
+            value = self.data.get(args[1])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+        if command == b"SET":
+            self.data[args[1]] = args[2]  # EX is accepted and ignored
+            return b"+OK\r\n"
+        if command == b"DEL":
+            return b":%d\r\n" % (self.data.pop(args[1], None) is not None)
+        if command in (b"SELECT", b"AUTH", b"PING"):
+            return b"+OK\r\n"
+        return b"-ERR unknown command\r\n"
+
+
+async def per_op(fn: Callable[[], Awaitable[Any]], iterations: int) -> float:
+    """Microseconds per call."""
+    await fn()  # Warm-up (connects, creates tables)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def bench(name: str, store: SessionStore, iterations: int) -> None:
+    sync = SessionSync(session_tools)
+    sync.configure(store)
+    assert sync.store is not None
+    await store.put("bench-session", RECORD)
+    session = type("Session", (), {})()  # Stands in for a ServerSession
+    await sync.attach(session, "bench-session")  # type: ignore[arg-type]
+
+    raw = await per_op(lambda: store.get("bench-session"), iterations)
+    cached = await per_op(lambda: sync.store.get("bench-session"), iterations)  # type: ignore[union-attr]
+    attach = await per_op(lambda: sync.attach(session, "bench-session"), iterations)  # type: ignore[arg-type]
+    print(
+        f"{name:8s}  store.get {raw:9.2f} us   cached get {cached:6.2f} us"
+        f"   attach (per request) {attach:6.2f} us"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="stand-in network round trip")
+    parser.add_argument("--redis-url", default=None, help="use a real Redis-protocol server")
+    args = parser.parse_args()
+
+    await bench("memory", MemorySessionStore(), args.iterations)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteSessionStore(os.path.join(directory, "sessions.db"))
+        await bench("sqlite", store, args.iterations)
+
+    server = None
+    url = args.redis_url
+    if url is None:
+        stand_in = RespStandIn(args.rtt_ms / 1000)
+        server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+        url = f"redis://127.0.0.1:{server.sockets[0].getsockname()[1]}/0"
+    redis = RedisSessionStore(url)
+    try:
+        await bench("redis", redis, args.iterations)
+    finally:
+        await redis.close()
+        if server is not None:
+            server.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
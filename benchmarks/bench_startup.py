@@ -0,0 +1,89 @@
+"""Startup benchmark - cost of importing mcp_starter.server.
+
+Each sample runs in a fresh interpreter (bytecode caches warmed first) and
+reports wall-clock import time and peak resident memory. "own" is the import
+time with the MCP SDK already loaded, i.e. the cost of this package alone.
+
+Usage:
+    uv run python benchmarks/bench_startup.py
+    uv run python benchmarks/bench_startup.py --baseline HEAD~1   # before/after
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import resource, time
+t0 = time.perf_counter()
+import mcp.server.fastmcp, starlette.responses
+t1 = time.perf_counter()
+import mcp_starter.server
+t2 = time.perf_counter()
+print(t2 - t0, t2 - t1, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def measure(source_dir: Path, runs: int) -> tuple[list[float], list[float], list[int]]:
+    """Import mcp_starter.server from source_dir in `runs` fresh processes."""
+    cmd = [sys.executable, "-c", PROBE]
+    # Warm-up run compiles the .pyc files so we measure loading, not compiling
+    subprocess.run(cmd, cwd=source_dir, check=True, capture_output=True)
+
+    total: list[float] = []
+    own: list[float] = []
+    rss: list[int] = []
+    for _ in range(runs):
+        out = subprocess.run(cmd, cwd=source_dir, check=True, capture_output=True, text=True)
+        elapsed, package_only, maxrss = out.stdout.split()
+        total.append(float(elapsed))
+        own.append(float(package_only))
+        rss.append(int(maxrss))  # KiB on Linux
+    return total, own, rss
+
+
+def checkout(ref: str, dest: Path) -> Path:
+    """Extract mcp_starter/ at a git ref into dest."""
+    archive = subprocess.run(
+        ["git", "archive", ref, "mcp_starter"], cwd=ROOT, check=True, capture_output=True
+    ).stdout
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        tar.extractall(dest, filter="data")
+    return dest
+
+
+def report(label: str, total: list[float], own: list[float], rss: list[int]) -> float:
+    median = statistics.median(own)
+    print(
+        f"{label:<10} total {statistics.median(total) * 1000:7.1f} ms  "
+        f"own {median * 1000:6.1f} ms  peak RSS {statistics.median(rss) / 1024:6.1f} MiB"
+    )
+    return median
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Samples per variant")
+    parser.add_argument("--baseline", help="Git ref to compare against (e.g. HEAD~1)")
+    args = parser.parse_args()
+
+    current = report("current", *measure(ROOT, args.runs))
+
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = checkout(args.baseline, Path(tmp))
+            baseline = report(args.baseline, *measure(source, args.runs))
+        print(f"own import speedup {baseline / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
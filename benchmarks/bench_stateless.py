@@ -0,0 +1,156 @@
+"""Stateless vs stateful HTTP - per-call latency and memory per idle client.
+
+Starts the server over HTTP in each mode (`--stateless` or not) and measures:
+
+- Latency of sequential `tools/call hello` requests over one keep-alive
+  connection (stateful calls carry a session ID; stateless ones get plain
+  JSON responses)
+- Server RSS after N clients have connected and gone idle: each stateful
+  client leaves a session behind, stateless ones leave nothing
+
+Reads RSS from /proc, so the memory numbers need Linux.
+
+Usage:
+    uv run python benchmarks/bench_stateless.py --calls 2000 --idle-clients 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import anyio
+import httpx
+
+HEADERS = {
+    "Accept": "application/json, text/event-stream",
+    "Content-Type": "application/json",
+    "Mcp-Protocol-Version": "2025-06-18",
+}
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "bench", "version": "1.0"},
+    },
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_mib(pid: int) -> float | None:
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024
+    return None
+
+
+async def connect(client: httpx.AsyncClient, url: str, stateless: bool) -> dict[str, str]:
+    """Initialize like a client would; the headers to send afterwards."""
+    response = await client.post(url, json=INITIALIZE)
+    response.raise_for_status()
+    if stateless:
+        return {}
+    headers = {"Mcp-Session-Id": response.headers["mcp-session-id"]}
+    await client.post(url, json=INITIALIZED, headers=headers)
+    return headers
+
+
+async def latencies(url: str, stateless: bool, calls: int) -> list[float]:
+    samples = []
+    async with httpx.AsyncClient(headers=HEADERS) as client:
+        headers = await connect(client, url, stateless)
+        for request_id in range(1, calls + 1):
+            call = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "tools/call",
+                "params": {"name": "hello", "arguments": {"name": f"bench-{request_id}"}},
+            }
+            start = time.perf_counter()
+            response = await client.post(url, json=call, headers=headers)
+            response.raise_for_status()
+            samples.append(time.perf_counter() - start)
+    return samples[calls // 10 :]  # Drop warm-up
+
+
+async def idle_clients(url: str, stateless: bool, count: int) -> None:
+    limiter = anyio.Semaphore(32)
+
+    async def one() -> None:
+        async with limiter, httpx.AsyncClient(headers=HEADERS) as client:
+            await connect(client, url, stateless)  # ...and never come back
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(count):
+            tg.start_soon(one)
+
+
+def measure(stateless: bool, calls: int, idle: int) -> None:
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/mcp"
+    command = [sys.executable, "-m", "mcp_starter.server", "--http", "--port", str(port)]
+    server = subprocess.Popen(
+        [*command, *(["--stateless"] if stateless else [])],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        for _ in range(150):
+            try:
+                httpx.get(url, timeout=1.0)
+                break
+            except httpx.TransportError:
+                time.sleep(0.2)
+
+        samples = sorted(anyio.run(latencies, url, stateless, calls))
+        before = rss_mib(server.pid)
+        anyio.run(idle_clients, url, stateless, idle)
+        time.sleep(0.5)
+        after = rss_mib(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+
+    mode = "stateless" if stateless else "stateful"
+    print(
+        f"{mode:9s}  p50 {statistics.median(samples) * 1000:6.2f} ms"
+        f"  p99 {samples[int(len(samples) * 0.99)] * 1000:6.2f} ms",
+        end="",
+    )
+    if before is not None and after is not None:
+        per_client = (after - before) * 1024 / idle
+        print(f"  RSS {before:6.1f} -> {after:6.1f} MiB ({per_client:5.1f} KiB per idle client)")
+    else:
+        print("  (RSS not available on this platform)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--idle-clients", type=int, default=500)
+    args = parser.parse_args()
+
+    for stateless in (False, True):
+        measure(stateless, args.calls, args.idle_clients)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""tools/list microbenchmark - throughput with the response cache on and off.
+
+Drives the server's tools/list handler plus the same serialization the session
+and transport perform (result dump, JSON-RPC envelope, JSON encode), so the
+numbers reflect the per-request server cost without any I/O.
+
+Usage:
+    uv run python benchmarks/bench_tools_list.py
+    uv run python benchmarks/bench_tools_list.py --icon-urls   # HTTP-mode icons
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import anyio
+import mcp.types as types
+
+from mcp_starter.icon_routes import register_icon_routes
+from mcp_starter.server import mcp, tool_list_cache
+
+REQUEST = types.ListToolsRequest(method="tools/list")
+
+
+async def list_once() -> str:
+    """One tools/list, serialized exactly as it would go on the wire."""
+    result = await mcp._mcp_server.request_handlers[types.ListToolsRequest](REQUEST)
+    response = types.JSONRPCResponse(
+        jsonrpc="2.0",
+        id=1,
+        result=result.model_dump(by_alias=True, mode="json", exclude_none=True),
+    )
+    return types.JSONRPCMessage(response).model_dump_json(by_alias=True, exclude_none=True)
+
+
+async def run(iterations: int, cached: bool) -> tuple[float, int]:
+    tool_list_cache.enabled = cached
+    size = len(await list_once())  # warm-up (first build resolves icons)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await list_once()
+    return iterations / (time.perf_counter() - start), size
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--icon-urls", action="store_true", help="Serve icons by URL (HTTP mode)")
+    args = parser.parse_args()
+
+    if args.icon_urls:
+        register_icon_routes(mcp, "http://127.0.0.1:3000")
+        tool_list_cache.invalidate()
+
+    uncached, size = await run(args.iterations, cached=False)
+    cached, _ = await run(args.iterations, cached=True)
+    print(f"response size  {size / 1024:8.1f} KiB")
+    print(f"cache off      {uncached:8.0f} lists/s")
+    print(f"cache on       {cached:8.0f} lists/s  ({cached / uncached:.1f}x)")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
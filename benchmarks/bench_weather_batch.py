@@ -0,0 +1,53 @@
+"""Weather batch benchmark - N get_weather calls vs one get_weather_batch call.
+
+Runs a real client session against the server over in-memory streams, so each
+single call pays the full JSON-RPC round trip and argument validation. Cities
+are unique per run, so every reading is a cache miss.
+
+Usage:
+    uv run python benchmarks/bench_weather_batch.py --cities 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import time
+
+import anyio
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from mcp_starter.server import mcp
+
+_run = itertools.count()
+
+
+def unique_cities(n: int) -> list[str]:
+    run = next(_run)
+    return [f"City {run}-{i}" for i in range(n)]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--cities", type=int, default=1000)
+    args = parser.parse_args()
+
+    async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+        await client.call_tool("get_weather_batch", {"cities": unique_cities(10)})  # warm-up
+
+        start = time.perf_counter()
+        for city in unique_cities(args.cities):
+            await client.call_tool("get_weather", {"city": city})
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = await client.call_tool("get_weather_batch", {"cities": unique_cities(args.cities)})
+        batch = time.perf_counter() - start
+        assert result.structuredContent and result.structuredContent["count"] == args.cities
+
+    print(f"{args.cities} x get_weather      {single * 1000:9.1f} ms")
+    print(f"1 x get_weather_batch   {batch * 1000:9.1f} ms  ({single / batch:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -0,0 +1,74 @@
+"""Approval Cache - remember recent confirm_action approvals per session.
+
+`confirm_action` asks the user through an elicitation dialog every time, so
+automated flows that confirm the same action repeatedly wait on a human each
+time. With the cache enabled (``--approval-ttl``), an approval is remembered
+for the session that gave it:
+
+- Keyed by the normalized action (case and whitespace folded) and the
+  ``destructive`` flag
+- Only approvals are remembered; declines and cancellations always ask again
+- Destructive actions are never remembered unless explicitly allowed
+  (``--approval-cache-destructive``)
+- Entries expire after the TTL and are dropped with their session
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+from mcp.server.session import ServerSession
+
+# (normalized action, destructive) -> (expires at, reason given)
+_Approvals = dict[tuple[str, bool], tuple[float, str]]
+
+
+@dataclass
+class ApprovalCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+def normalize_action(action: str) -> str:
+    return " ".join(action.split()).casefold()
+
+
+class ApprovalCache:
+    """Per-session TTL cache of approved actions.
+
+    Args:
+        ttl: Seconds an approval is remembered; 0 disables the cache
+        allow_destructive: Also remember approvals of destructive actions
+    """
+
+    def __init__(self, ttl: float = 0.0, allow_destructive: bool = False) -> None:
+        self.ttl = ttl
+        self.allow_destructive = allow_destructive
+        self.stats = ApprovalCacheStats()
+        self._approvals: WeakKeyDictionary[ServerSession, _Approvals] = WeakKeyDictionary()
+
+    def applies(self, destructive: bool) -> bool:
+        return self.ttl > 0 and (self.allow_destructive or not destructive)
+
+    def get(self, session: ServerSession, action: str, destructive: bool) -> str | None:
+        """The reason given for a still-valid approval of this action, or None."""
+        if not self.applies(destructive):
+            return None
+        approvals = self._approvals.get(session, {})
+        key = (normalize_action(action), destructive)
+        entry = approvals.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            approvals.pop(key, None)
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return entry[1]
+
+    def remember(self, session: ServerSession, action: str, destructive: bool, reason: str) -> None:
+        """Record that the user approved this action."""
+        if not self.applies(destructive):
+            return
+        approvals = self._approvals.setdefault(session, {})
+        approvals[(normalize_action(action), destructive)] = (time.monotonic() + self.ttl, reason)
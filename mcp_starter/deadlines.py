@@ -0,0 +1,117 @@
+"""Tool Deadlines - time budgets and cancellation accounting for tool calls.
+
+Every ``tools/call`` runs inside an anyio cancel scope whose deadline is the
+earlier of:
+
+- The tool's timeout: ``@tool_deadlines.timeout(seconds)`` on the tool's
+  function, looked up by the registered tool name, or ``default_timeout``
+- The client's deadline: ``_meta.deadline`` in the request, as a Unix
+  timestamp in seconds
+
+Cancel scopes nest, so the deadline propagates to everything the tool awaits
+(sampling, elicitation, sleeps), and tools can check their remaining budget
+with ``anyio.current_effective_deadline()``. When it passes, the call is
+aborted and returns a timeout error. A client's ``notifications/cancelled``
+cancels the same request scope (the SDK does this), so both paths free the
+call's resources promptly.
+
+Cancelled and timed-out calls are counted per tool.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+import anyio
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools import Tool
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+DEADLINE_META_KEY = "deadline"
+
+
+@dataclass
+class CallStats:
+    calls: int = 0
+    cancelled: int = 0
+    timed_out: int = 0
+
+
+class ToolDeadlines:
+    """Per-tool timeouts plus client deadlines, enforced with cancel scopes.
+
+    Args:
+        default_timeout: Seconds a tool may run unless it sets its own (None = no limit)
+    """
+
+    def __init__(self, default_timeout: float | None = 60.0) -> None:
+        self.default_timeout = default_timeout
+        self.stats: dict[str, CallStats] = {}
+        self._timeouts: dict[str, float | None] = {}  # By tool name, resolved on first call
+        self._function_timeouts: WeakKeyDictionary[Callable[..., Any], float | None] = (
+            WeakKeyDictionary()
+        )
+
+    def timeout(self, seconds: float | None) -> Callable[[F], F]:
+        """Decorator setting the timeout of the tool registered from this function.
+
+        Args:
+            seconds: Time budget per call (None = no limit)
+        """
+
+        def decorator(fn: F) -> F:
+            self._function_timeouts[fn] = seconds
+            return fn
+
+        return decorator
+
+    def timeout_for(self, tool: Tool) -> float | None:
+        if tool.name not in self._timeouts:
+            self._timeouts[tool.name] = self._function_timeouts.get(tool.fn, self.default_timeout)
+        return self._timeouts[tool.name]
+
+    def budget(self, tool: Tool, meta: Any = None) -> float | None:
+        """Seconds the call may run, from the tool's timeout and the client's deadline."""
+        budget = self.timeout_for(tool)
+        deadline = getattr(meta, DEADLINE_META_KEY, None) if meta is not None else None
+        if deadline is not None:
+            if not isinstance(deadline, int | float) or isinstance(deadline, bool):
+                raise ToolError(f"Invalid _meta.{DEADLINE_META_KEY}: expected Unix time in seconds")
+            remaining = deadline - time.time()
+            budget = remaining if budget is None else min(budget, remaining)
+        return budget
+
+    async def run(self, tool: Tool, meta: Any, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a tool call within its deadline, counting cancellations and timeouts."""
+        name = tool.name
+        stats = self.stats.setdefault(name, CallStats())
+        stats.calls += 1
+        budget = self.budget(tool, meta)
+        if budget is not None and budget <= 0:
+            stats.timed_out += 1
+            raise ToolError(f"Deadline for {name} had already passed")
+
+        try:
+            with anyio.move_on_after(math.inf if budget is None else budget) as scope:
+                return await call()
+        except anyio.get_cancelled_exc_class():
+            stats.cancelled += 1  # Cancelled by the client (or shutdown)
+            raise
+        # Only reached when our own scope expired
+        assert scope.cancelled_caught
+        stats.timed_out += 1
+        raise ToolError(f"Tool {name} timed out after {budget:.1f}s")
+
+    def snapshot(self) -> dict[str, Any]:
+        """Statistics for the tool call stats resource."""
+        return {
+            "default_timeout": self.default_timeout,
+            "tools": {name: asdict(stats) for name, stats in sorted(self.stats.items())},
+        }
@@ -0,0 +1,229 @@
+"""Tool Execution - run sync tools inline, on a thread pool, or in worker processes.
+
+FastMCP calls sync tool functions directly on the event loop, so one heavy
+call stalls every session. Each tool picks an execution policy when it is
+registered, next to its other decorators:
+
+    @mcp.tool(...)
+    @executor.policy("thread")
+    def bonus_calculator(...): ...
+
+- ``inline``: call on the event loop (the default; best for trivial tools)
+- ``thread``: run on the shared thread pool (I/O or GIL-releasing work such
+  as NumPy)
+- ``process``: run in a worker process (pure-Python CPU work); only for
+  module-level functions, see below
+
+Pool sizes come from the server config (``--thread-workers``,
+``--process-workers``); pools are created on first use.
+
+PROCESS WORKERS:
+Pure-Python CPU work runs in a spawned process pool: process-mode tools, and
+``long_task`` in ``cpu`` mode through `run_with_progress`. The functions live
+in `workloads.py`, which is cheap to import: they are pickled by reference, so
+a worker imports only that module, not the server. That's why a process-mode
+tool must be registered from the module's own function, not by decorating it
+in place (which would rebind its name to the async wrapper):
+
+    mcp.tool(...)(executor.policy("process")(workloads.some_function))
+
+Workers are reused, so calls never pay for process start-up or re-imports.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import multiprocessing
+import os
+import sys
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from multiprocessing.managers import SyncManager
+from typing import Any, Literal, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+ExecutionMode = Literal["inline", "thread", "process"]
+
+
+class ToolExecutor:
+    """Thread and process pools behind the per-tool execution policies.
+
+    Args:
+        thread_workers: Thread pool size (default: the ThreadPoolExecutor default)
+        process_workers: Process pool size (default: CPU count)
+    """
+
+    def __init__(
+        self, thread_workers: int | None = None, process_workers: int | None = None
+    ) -> None:
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self.modes: dict[str, ExecutionMode] = {}
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+        self._manager: SyncManager | None = None
+        self._manager_lock = threading.Lock()
+        self._context = multiprocessing.get_context("spawn")
+
+    def configure(self, thread_workers: int | None, process_workers: int | None) -> None:
+        """Set pool sizes (before the pools are first used)."""
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+
+    def policy(self, mode: ExecutionMode) -> Callable[[F], F]:
+        """Decorator choosing where a sync tool function runs."""
+
+        def decorator(fn: F) -> F:
+            self.modes[fn.__name__] = mode
+            if mode == "inline":
+                return fn
+            if inspect.iscoroutinefunction(fn):
+                raise ValueError(f"{fn.__name__}: only sync tools can run on a {mode} pool")
+
+            if mode == "thread":
+
+                @functools.wraps(fn)
+                async def run_in_thread(**kwargs: Any) -> Any:
+                    return await self.run_in_thread(functools.partial(fn, **kwargs))
+
+                return run_in_thread  # type: ignore[return-value]
+
+            module = sys.modules.get(fn.__module__)
+            if getattr(module, fn.__qualname__, None) is not fn:
+                raise ValueError(
+                    f"{fn.__qualname__}: process mode needs a module-level function, "
+                    "registered as executor.policy('process')(module.function)"
+                )
+
+            @functools.wraps(fn)
+            async def run_in_process(**kwargs: Any) -> Any:
+                return await self.run_in_process(functools.partial(fn, **kwargs))
+
+            return run_in_process  # type: ignore[return-value]
+
+        return decorator
+
+    async def run_in_thread(self, fn: Callable[[], Any]) -> Any:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(self.thread_workers, thread_name_prefix="tool")
+        return await asyncio.get_running_loop().run_in_executor(self._threads, fn)
+
+    async def run_in_process(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a picklable (module-level) function in a worker process."""
+        return await asyncio.get_running_loop().run_in_executor(self._process_pool(), fn, *args)
+
+    async def run_with_progress(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_progress: Callable[..., Awaitable[None] | None],
+    ) -> Any:
+        """Run ``fn(*args, progress, cancel_event)`` in a worker process.
+
+        The worker sends tuples through ``progress`` (the write end of a pipe);
+        the event loop watches the read end (see `_ProgressPipe`) and passes
+        each to ``on_progress`` as it arrives. A running process can't be
+        interrupted, so if the caller is cancelled the event is set and the
+        worker is expected to stop at its next check.
+        """
+        manager = await self.run_in_thread(self._progress_manager)  # Starts a process once
+        cancel_event = manager.Event()
+        reader, writer = self._context.Pipe(duplex=False)
+        updates: asyncio.Queue[tuple[Any, ...] | None] = asyncio.Queue()
+        pipe = _ProgressPipe(reader, updates)
+        future = asyncio.ensure_future(self.run_in_process(fn, *args, writer, cancel_event))
+        future.add_done_callback(lambda _: updates.put_nowait(None))
+        try:
+            while (item := await updates.get()) is not None:
+                await self._report(on_progress, item)
+            await pipe.stop()
+            # Sent just before the worker returned, but not yet handled
+            late = [updates.get_nowait() for _ in range(updates.qsize())]
+            while reader.poll():
+                late.append(reader.recv())
+            for item in late:
+                await self._report(on_progress, item)
+            return await future
+        finally:
+            pipe.cancel()
+            reader.close()
+            writer.close()
+            if not future.done():
+                cancel_event.set()
+                future.cancel()
+
+    @staticmethod
+    async def _report(on_progress: Callable[..., Awaitable[None] | None], item: Any) -> None:
+        result = on_progress(*item)
+        if inspect.isawaitable(result):
+            await result
+
+    def shutdown(self) -> None:
+        if self._threads is not None:
+            self._threads.shutdown(wait=False, cancel_futures=True)
+            self._threads = None
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(
+                self.process_workers or os.cpu_count(), mp_context=self._context
+            )
+        return self._processes
+
+    def _progress_manager(self) -> SyncManager:
+        with self._manager_lock:
+            if self._manager is None:
+                self._manager = self._context.Manager()
+            return self._manager
+
+
+class _ProgressPipe:
+    """Queues what a worker sends through a pipe as it arrives.
+
+    The event loop watches the read end with ``add_reader``, with no polling.
+    Loops that can't watch pipes (the proactor loop on Windows) get a thread
+    waiting on the pipe instead.
+    """
+
+    def __init__(self, reader: Connection, updates: asyncio.Queue[Any]) -> None:
+        self._reader = reader
+        self._updates = updates
+        self._loop = asyncio.get_running_loop()
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        try:
+            self._loop.add_reader(reader.fileno(), lambda: updates.put_nowait(reader.recv()))
+        except NotImplementedError:
+            self._thread = threading.Thread(target=self._wait, name="tool-progress", daemon=True)
+            self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop watching, once everything already read is queued."""
+        self.cancel()
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join)
+
+    def cancel(self) -> None:
+        """Stop watching now."""
+        if self._thread is None:
+            self._loop.remove_reader(self._reader.fileno())
+        self._stopped.set()
+
+    def _wait(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                if self._reader.poll(0.05):
+                    self._loop.call_soon_threadsafe(self._updates.put_nowait, self._reader.recv())
+        except (EOFError, OSError):
+            pass  # Closed under us: the call is over
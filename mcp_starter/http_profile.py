@@ -0,0 +1,110 @@
+"""HTTP Profile - event loop, HTTP parser and connection tuning for uvicorn.
+
+FastMCP's ``run(transport="streamable-http")`` starts uvicorn inside an
+asyncio loop it creates itself, with uvicorn's default connection settings,
+so the server never benefits from the faster event loop or HTTP parser even
+when they are installed. The HTTP transports (`server.py`, `workers.py` and
+the task server in `tasks.py`) run uvicorn through a `ServerProfile`
+instead:
+
+- Event loop: ``uvloop`` when installed (the ``perf`` extra), else asyncio
+- HTTP parser: ``httptools`` when installed, else the pure-Python ``h11``
+- Tuning: listen backlog, keep-alive timeout and a concurrency limit
+  (connections plus in-flight tasks; beyond it requests get 503)
+
+Either choice can be forced (``--loop``, ``--http-parser``), e.g. to compare
+profiles; forcing a package that isn't installed is an error.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import uvicorn
+
+LoopName = Literal["auto", "asyncio", "uvloop"]
+ParserName = Literal["auto", "h11", "httptools"]
+
+LOOPS: tuple[LoopName, ...] = ("auto", "asyncio", "uvloop")
+PARSERS: tuple[ParserName, ...] = ("auto", "h11", "httptools")
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def _choose(kind: str, name: str, fast: str, fallback: str) -> str:
+    if name == "auto":
+        return fast if _installed(fast) else fallback
+    if name not in (fast, fallback):
+        raise ValueError(f"Unknown {kind} {name!r} (expected auto, {fast} or {fallback})")
+    if name == fast and not _installed(fast):
+        raise ValueError(f"{fast} is not installed (pip install 'mcp-python-starter[perf]')")
+    return name
+
+
+@dataclass(frozen=True)
+class ServerProfile:
+    """Resolved uvicorn settings for an HTTP transport.
+
+    Args:
+        loop: ``uvloop`` or ``asyncio``
+        http: ``httptools`` or ``h11``
+        backlog: Pending connections the listen socket queues
+        keep_alive: Seconds an idle keep-alive connection stays open
+        limit_concurrency: Connections plus tasks before answering 503 (None = no limit)
+    """
+
+    loop: str = "asyncio"
+    http: str = "h11"
+    backlog: int = 2048
+    keep_alive: int = 5
+    limit_concurrency: int | None = None
+
+    @classmethod
+    def resolve(cls, loop: str = "auto", http: str = "auto", **tuning: Any) -> ServerProfile:
+        """The profile for the requested loop and parser (``auto`` = fastest installed)."""
+        return cls(
+            loop=_choose("event loop", loop, "uvloop", "asyncio"),
+            http=_choose("HTTP parser", http, "httptools", "h11"),
+            **tuning,
+        )
+
+    @classmethod
+    def from_env(cls, loop: str | None = None, http: str | None = None) -> ServerProfile:
+        """The profile configured by MCP_STARTER_* variables (as for the main server's options).
+
+        Args:
+            loop: Overrides MCP_STARTER_LOOP
+            http: Overrides MCP_STARTER_HTTP_PARSER
+        """
+        limit = os.environ.get("MCP_STARTER_LIMIT_CONCURRENCY")
+        return cls.resolve(
+            loop or os.environ.get("MCP_STARTER_LOOP", "auto"),
+            http or os.environ.get("MCP_STARTER_HTTP_PARSER", "auto"),
+            backlog=int(os.environ.get("MCP_STARTER_BACKLOG", cls.backlog)),
+            keep_alive=int(os.environ.get("MCP_STARTER_KEEP_ALIVE", cls.keep_alive)),
+            limit_concurrency=int(limit) if limit else None,
+        )
+
+    def config(self, app: Any, **kwargs: Any) -> uvicorn.Config:
+        """A uvicorn config for ``app`` with this profile's settings."""
+        return uvicorn.Config(
+            app,
+            loop=self.loop,
+            http=self.http,
+            backlog=self.backlog,
+            timeout_keep_alive=self.keep_alive,
+            limit_concurrency=self.limit_concurrency,
+            **kwargs,
+        )
+
+    def describe(self) -> str:
+        limit = self.limit_concurrency if self.limit_concurrency is not None else "unlimited"
+        return (
+            f"{self.loop} loop, {self.http} parser, backlog {self.backlog}, "
+            f"keep-alive {self.keep_alive}s, concurrency {limit}"
+        )
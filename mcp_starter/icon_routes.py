@@ -0,0 +1,53 @@
+"""HTTP icon route - serve tool icons by URL instead of inline data URIs.
+
+Inlining every icon as a base64 data URI makes each `tools/list` response
+~250 KB. Over the HTTP transport we can do better: serve the PNGs from a
+static route next to `/mcp` and point each tool's `Icon(src=...)` at it.
+
+URLs are content-hashed (`/icons/robot-32.1a2b3c4d5e6f.png`), so a file at a
+given URL never changes. That lets clients cache icons forever
+(`Cache-Control: immutable`) and revalidate cheaply with a strong ETag.
+
+The stdio transport has no HTTP server, so it keeps the inline fallback.
+"""
+
+from __future__ import annotations
+
+from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import Response
+
+from .icons import ICON_NAMES, ICON_SIZES, icon_bytes, icon_digest, icon_filename, use_icon_urls
+
+ICONS_PATH = "/icons"
+
+# A year is the de-facto maximum; `immutable` tells browsers not to revalidate
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def register_icon_routes(mcp: FastMCP, base_url: str) -> None:
+    """Serve icons at `{base_url}/icons/` and point all tool icons there.
+
+    Args:
+        mcp: The server to add the route to (HTTP transport only)
+        base_url: Externally reachable origin, e.g. ``http://127.0.0.1:3000``
+    """
+    assets = {icon_filename(name, size): (name, size) for name in ICON_NAMES for size in ICON_SIZES}
+
+    @mcp.custom_route(f"{ICONS_PATH}/{{filename}}", methods=["GET"], include_in_schema=False)
+    async def serve_icon(request: Request) -> Response:
+        asset = assets.get(request.path_params["filename"])
+        if asset is None:
+            return Response(status_code=404)
+
+        headers = {
+            "ETag": f'"{icon_digest(*asset)}"',
+            "Cache-Control": CACHE_CONTROL,
+            # Icons are fetched by MCP client UIs that may run on another origin
+            "Access-Control-Allow-Origin": "*",
+        }
+        if headers["ETag"] in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        return Response(icon_bytes(*asset), media_type="image/png", headers=headers)
+
+    use_icon_urls(f"{base_url.rstrip('/')}{ICONS_PATH}")
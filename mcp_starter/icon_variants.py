@@ -0,0 +1,159 @@
+"""Icon variants - smaller renditions of the 256x256 icon PNGs.
+
+Clients render tool icons at 16-32 px, so advertising only the 256x256 source
+makes them fetch and decode ~10x more bytes than they need. This module
+produces 16/32/64 px variants with a small pure-Python PNG codec (no imaging
+dependency needed), using an alpha-weighted box filter.
+
+Variants are generated at build time and shipped next to the sources as
+``assets/icons/<name>-<size>.png``:
+
+    python -m mcp_starter.icon_variants
+
+If a variant file is missing, ``icons.py`` generates it on first use instead.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Color type 6 = RGBA, 8 bits per channel
+_RGBA8 = (8, 6)
+_CHANNELS = 4
+
+
+def _chunks(data: bytes) -> list[tuple[bytes, bytes]]:
+    """Split a PNG into (type, payload) chunks."""
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("Not a PNG file")
+    chunks = []
+    pos = len(PNG_SIGNATURE)
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos : pos + 4])
+        chunks.append((data[pos + 4 : pos + 8], data[pos + 8 : pos + 8 + length]))
+        pos += length + 12
+    return chunks
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def decode_rgba(data: bytes) -> tuple[int, int, bytearray]:
+    """Decode an 8-bit RGBA, non-interlaced PNG to (width, height, pixels)."""
+    chunks = _chunks(data)
+    width, height, depth, color, _, _, interlace = struct.unpack(">IIBBBBB", chunks[0][1])
+    if (depth, color) != _RGBA8 or interlace:
+        raise ValueError("Only 8-bit RGBA non-interlaced PNGs are supported")
+
+    raw = zlib.decompress(b"".join(payload for kind, payload in chunks if kind == b"IDAT"))
+    stride = width * _CHANNELS
+    pixels = bytearray(stride * height)
+    prev = bytearray(stride)
+    pos = 0
+    for y in range(height):
+        kind = raw[pos]
+        row = bytearray(raw[pos + 1 : pos + 1 + stride])
+        pos += stride + 1
+        # Filter types: 0 none, 1 sub, 2 up, 3 average, 4 paeth
+        if kind == 1:
+            for i in range(_CHANNELS, stride):
+                row[i] = (row[i] + row[i - _CHANNELS]) & 0xFF
+        elif kind == 2:
+            for i in range(stride):
+                row[i] = (row[i] + prev[i]) & 0xFF
+        elif kind == 3:
+            for i in range(stride):
+                left = row[i - _CHANNELS] if i >= _CHANNELS else 0
+                row[i] = (row[i] + ((left + prev[i]) >> 1)) & 0xFF
+        elif kind == 4:
+            for i in range(stride):
+                if i >= _CHANNELS:
+                    row[i] = (
+                        row[i] + _paeth(row[i - _CHANNELS], prev[i], prev[i - _CHANNELS])
+                    ) & 0xFF
+                else:
+                    row[i] = (row[i] + prev[i]) & 0xFF
+        pixels[y * stride : (y + 1) * stride] = row
+        prev = row
+    return width, height, pixels
+
+
+def encode_rgba(width: int, height: int, pixels: bytes | bytearray) -> bytes:
+    """Encode RGBA pixels as a PNG (filter type 0 on every row)."""
+    stride = width * _CHANNELS
+    raw = b"".join(b"\x00" + pixels[y * stride : (y + 1) * stride] for y in range(height))
+
+    def chunk(kind: bytes, payload: bytes) -> bytes:
+        crc = zlib.crc32(kind + payload) & 0xFFFFFFFF
+        return struct.pack(">I", len(payload)) + kind + payload + struct.pack(">I", crc)
+
+    header = struct.pack(">IIBBBBB", width, height, *_RGBA8, 0, 0, 0)
+    return (
+        PNG_SIGNATURE
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw, 9))
+        + chunk(b"IEND", b"")
+    )
+
+
+def downscale(width: int, height: int, pixels: bytearray, size: int) -> bytearray:
+    """Box-filter a square RGBA image down to size x size.
+
+    Color is weighted by alpha so transparent pixels don't darken the edges.
+    """
+    if width != height or width % size:
+        raise ValueError(f"Cannot downscale {width}x{height} to {size}x{size}")
+    factor = width // size
+    area = factor * factor
+    stride = width * _CHANNELS
+    out = bytearray(size * size * _CHANNELS)
+    for oy in range(size):
+        for ox in range(size):
+            r = g = b = a = 0
+            for y in range(oy * factor, (oy + 1) * factor):
+                base = y * stride + ox * factor * _CHANNELS
+                for i in range(base, base + factor * _CHANNELS, _CHANNELS):
+                    alpha = pixels[i + 3]
+                    r += pixels[i] * alpha
+                    g += pixels[i + 1] * alpha
+                    b += pixels[i + 2] * alpha
+                    a += alpha
+            o = (oy * size + ox) * _CHANNELS
+            if a:
+                out[o : o + 4] = bytes((round(r / a), round(g / a), round(b / a), round(a / area)))
+    return out
+
+
+def resize_png(data: bytes, size: int) -> bytes:
+    """Return a size x size rendition of a square RGBA PNG."""
+    width, height, pixels = decode_rgba(data)
+    if width == size:
+        return data
+    return encode_rgba(size, size, downscale(width, height, pixels, size))
+
+
+def main() -> None:
+    """Write all icon variants next to their sources (build step)."""
+    from .icons import ICON_NAMES, ICON_SIZES, ICONS_DIR, SOURCE_SIZE
+
+    for name in ICON_NAMES:
+        source = (ICONS_DIR / f"{name}.png").read_bytes()
+        width, height, pixels = decode_rgba(source)
+        for size in ICON_SIZES:
+            if size == SOURCE_SIZE:
+                continue
+            path = ICONS_DIR / f"{name}-{size}.png"
+            path.write_bytes(encode_rgba(size, size, downscale(width, height, pixels, size)))
+            print(f"Wrote {path.relative_to(ICONS_DIR.parent.parent)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,150 @@
-"""Icon data URIs - base64 encoded PNGs from Microsoft Fluent UI Emoji.
+"""Tool icons - PNGs from Microsoft Fluent UI Emoji, loaded lazily.
 
 Source: https://github.com/microsoft/fluentui-emoji (MIT License)
-These are embedded inline to avoid CORS issues when served over HTTP.
+Over stdio the icons are embedded inline as data URIs (avoids CORS issues for
+clients that render them). Over HTTP the same PNGs can instead be served by URL
+(see ``icon_routes.py``).
+
+Served by URL, each icon is advertised at 16/32/64/256 px so clients can
+fetch the size they actually render. Inline, every data URI is repeated in
+each tools/list response, so only the smallest size is listed. The smaller
+variants ship as ``<name>-<size>.png`` (built by ``icon_variants.py``) and
+are generated on first use if missing.
+
+Nothing is read at import time: PNGs are read from ``assets/icons/`` on
+first use, base64-encoded once and cached. ``tool_icons()`` hands out Icon
+entries whose ``src`` is filled in by ``resolve_icons()`` when tools are first
+listed, so sessions that never call ``tools/list`` never load them.
+
+The old ``WAVING_HAND_ICON``-style constants are still importable; they are
+resolved on access through the module ``__getattr__``.
 """
 
-# waving_hand icon (256x256 PNG)
-WAVING_HAND_ICON = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAACXBIWXMAAAsTAAALEwEAmpwYAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAIS0SURBVHgB7X0HnCVVlfc5t6pe6DQzDAMMIFFExYzKuqsuoK6gi7LqIKAoGDCtrAldV8U2fK4560pSEARhXFSSYXVBl9VdRdcEqKhDzkzo+ELVvd/Nde+tqtc9M90zzVBnfjWV3qtX73Wd//mfcM8FqKWWWmqppZZaaqmlllpqqaWWWmqppZZaaqmlllpqqaWWWmqppZZaaqmlllpqqaWWWmqppZZaaqmlllpqqaWWWmqppZZaaqmlllpqqaWWWpaaINRSyyLLmouva2yajE5IW8sPJ3F7hBHSZYBTJCL3Y0bv40/hLRiTv/RY9w9X/8OKjVDLNpMaAGpZVDn6U1ctnyHt7/WHVj2ZNUYBkhYAIfrJQ0BUi9gnwCjfvhkYuzYi5BpC0quu/NXwdTCOFGpZFKkBoJZFled9+KqzZlurXsmtP7DGMEDc5E+dUni1qEcQkak38DUC08DAgCDcyncvbyC5uM1a/7X2GMyglgWTGgBqWTQ5cfyq1sbm6P2zzZVDaXMEaNLmDKAhzzGh4HJtMIBJ5QfQxl5uMwkC4rwgDRER7ADOwRjP+s4Lh26DWrZaagCoZdHkxI9et9tkmtzZaYxBn1t/yq0/i2N5jmkSIO2+ZAJG+QUQUAsAcq0XJJIRcDDAHmcIF7GYfeR7Lxq9DmrZYqkBoJZFk5NPvzbZeP/u93TIyPI+9/3TJOEA4L9GqLmw8MzuUQkATFp/DQSEapCgHARAg4EEgixCdjEjzfd859jWn6GWzZYaAGpZVHnJh6Y+Mstab+9GEQcAruIRyKeOsVz5pWgQULsGCDLOFDQgGCAQ8UMNCBIM+PVihC53ET49nfQ+ePUxu0xBLfOWGgBqWVQ58rOsOTYBX+N5vxf2uLJmRB03D55UemIYANjgoHINDAhkapsrPpMgwPRiQEAwAhQxgps4GLzmspcu/z7UMi+pAaCWbSAMj3kfHJoyOCwF4LlA4KkA4GkBWMUVeA/OBvbhMYG2tPuS4qsYAZPbVAKAVHwNBIxkCgAixQgECxBAgHxNuE/AycYXcXr27Ze9Zo8ZqGWg1ABQy3aXg09myUN3h317GTyBG/O/pgiHc9V+JGcLSCUQ8IgASaXiCyCQjEBvC+svAECCgAYCEsmMwa+AZcdcftIuN0ItlVIDQC1LUo4dZ/uwPhzNVf0lGYODsyhDypWeSjeAg0Gk3AEFChwEYpaDQKTShjxIuD4i9NhLT9r1P6CWUqkBoJYlL8f/C3scB4I3ZCx9aUqyFgcDoJoBZJGJDfBXiAxDpAKNyJmBrB2IsB8Dfc23X736K1BLQWoAqOUBI694O9t9hnTfweMIr0lJ2lRAQIFKENDsIPLZAFFsQJQfvPXbr9r9U1CLJzUA1DIvOfysPz6dNkefA43h5Tx31yckmeZZ+Uluae+FDG6DRvPmCYR1vzgKFz3w9uJTO/tzav+JHqTP73MQECxAKT+VzEDFBXRsINbuQIwCG95x6ev3+BjUYqUGgFoGyvj4OPnvZc8+vTe08lW0uQygMSQ1Cnm0TVTti/Qb46ZWD+pJCaIoyPlVhPC/WQw/ZsPw66sPwxQWQV7yzxP/kFL2xT6mu6WCDXANpwYMRIDQZQKxyhDw+3v9pa/f80tQi5QaAGoZKM/71x/+40xr5efS1k6QNcVgnrbi1OKkHcmnFlXYg3qMD1EReYT7+P4PuCJ+q4Nw5X8/HydhAeWEt03uQkn/y12WPVeAQOqBQKYAIBEggBIIeIowiyL6om+9ft9vQS01ANQyWI7+15/8dqax6lH91jI5mIclTV1949TzO0+RGdWnBvmocj3BEsRmRGCan/pW3ICzv/d/8KOFGuY7Ps7In6fXv5u7BO/tYkakS+C4BbL6MEYVD1AgMEVo/2nfevPDfgUPcqkBoJZKEYr128ZvJmaTlcO9xihkYjRfnFiFNzX8yvIzWb9vB/XIfdAsASQQcP7NyQNRPjnC9RwQPtWdgvOvPgk7sADyslPveXGPpedwEOCZAgaZDRBSOQZBsADgC1Fxgb/QZvTEK16/9wZ4EEsNALUMlBf/vz9eP0OWP0IAAOXWn8ZG+1U9P2gWYE25BgBmQADVkF5V1adcBSSqWof75IIV3MbB4MPkbjjrO6dgF7ZSXvbPdz2z30+/1YV0WLgDAghkylAHBTFGCQRRLG/lkkvfuv+L9E0/KIVALbUMkIS1zmpkBJI+Vxq58IdGL1Gq1siXOFX7UY8rWI8rd58vPQJRV+zz14kmYN2Mb/eB8QV6XaDdPqTdbM9+n32+vwquO+Lr7AW+Q7H58tUP7/aDJIqOalCciVPK74mCrBxO+efzbeAL4wsV64y94B8+/qeT4EEsNQOoZaAcOn5VvDp61Fc7rH1cL25yixrrp8ah+JCrrXIDUG/pUXx2RB+P1KNK0ckYAbfETFXrcFYQ8VUkSni/xz/h9Ve8BP8CWyEvf8stz+PuwL93MY1T/hGCCTDtCoBmAZKBRLAxYvjoS95xwIOywUgNALXMQxi++H0bjugxfC4lyUpO8XkkkAxzVV7Bz+3BFX4XhhiLLj9yEI/MCOjMgNxX8QFZ0y+BwFTv6eHBqm5XAgHhAEMiMsUjBf/8vRPgi3mvsM2Xl79l3Skd2v9Mj39eSphOE5r6ACIBQMYDYvjGt099+Bp4EEoNALVstRw1fu3QCOz60H7ceDSn1U+iSJ7KGD6OEsJDcBG3+kRaegkEEhSoZAISCKSPDnpAjxzFwxUzkktMosvjJDrpsuPxPthCeemb/3hOj2YvFyCQRWK0oQYBwQI4CGgmwKImPutbbz3wh/AgkxoAalkUOelDN66aTpNnMyAvpBSPyCBpZRhzBUQJAhlqQCCKmlOilFIAgFhEoDBSjOBm7ha88IoTG7+ALZA1r79upNXAn89S+vA+YRYEbGpQgIBgAw385RNmDnzS+IOsA3ENALUsuhw3fu3OjIwdn7H4dXx5eAqJZAUUI2n98yG/TNfy2y6g3ELHEEfRTITxiVe8qrkWtkBe9ubrnpxm6X93RKySA5CKB+jPiSNRJgyYcMYRR8d88+0HbNFnPFClBoBatpmIuoI/4vVHcRB4d0obT0w5I1CsgIDo9S1iApIJCAWNUOftBQiIAGFMOVN/6xWvWfZp2AI58ZRffWKWsrd0RUCQgwA1rkdCFAtIYsECfnPp7Ncfz2/0QcMCagCoZdsLDxC85AO/eWGWNT7SY439JCPgWQCesFPKqdt+URkXEECgQYBba74+7TuvWfYB2Ex54/iNYxvum/x9B9jqvmABBmy48gO3/tjgAMDBII7hyG++/eHfhQeJ1HUAtWx74ZH9r5322G9kyzY8qk1m39+G6V6SdSCiPYiylOfueQ6hz6MHPVE3kAKIpd+HTNYP9N//3C/efxpspnxu/ICJBLP3RYxfl1FAvhYLZFQuTCyUxwgYvhEeRFIzgFq2u7z0/b98LKXRed2s+eiUNbhbEPEFZWyA2rZfYlB/pDME3FITfNPlb9zlM5vzOWvWXNxo7rLPDTwWsF9PXDtC6QYw4QI0G4YFZEmW7X/Jux95MzwIpGYAtWx3Of+0J/y6PzZ9yFA0fWYTpyGmXYgFE8gyywagn+oqwh5QwQZS+sm//+w9L9qcz1m79phejPQTEeXOhmAAVC2GAYBiAVEWRy+BB4nUAFDLkpC1b/nr2fPGDz65mXRe18bpfsI6HAj6EgRECS/2uXL2MwkEjC+03yM07Z/73I/fcfDmfM40nf0qDz1uECCAVLsCAgSoUH5ZHixGMRwLDxKpAaCWJSXnnfakLyXJ9PNbZHpKMIGIg0CciXp+xtmAAIMcBLJ+NkQh/fejP3/byvlef+0XD5uKCbtAhhxFLEAoP1MAABIIeAYig0f9/UevPwAeBFIDQC0LJsKYbrjq6OW3X3XUw9f/5PmP3vi/R+17+7VHDcFmylff+9TvJDh7RCua2ZQwBQKKCQhXgANAygFALn2xv3d/JvuKyCzM9/qc7n81soFADQLuIsKUND4CHgRSBwFr2SpZ980j9mFR+qI4Tp8eJ+zgOKGreSpN1O/o4b4RT/WTm3nw7n+QxN9NmsOX4v5rN83n2i9//4//Ju1E3+302yMiVZjK4GCevmOmbFgFB19/xdv3+jeYl/A05Gt/9JcOi/bp82vIOgSRYmwkwHgwkIi0YEIuvfydD3s+7OBSA0AtWyQ3fv3I/RGn3xMl/eMbzSzhii96hfBcPfJcOsrqOlnar+vtZS5fNu1Ppigk55O4/WHc75I5I+2vOO2HR3Z7zW930lbSZwIEiMoOiCKhWFcLcsSJGslkRNhjLzt1n3XzuH044XVXfb5DyRt6QvlJJAEAOACIhfAFG3h/+5e/3pUHDjPYgaV2AWrZLLnxs0c2r//qoR9EtuG6JJ56eSOeTeKIR+2jFGLMuE7y6D3J5HbEU3hELnqm30j07u+NkGT2tUAmb2Dr/v697Lo1jUGf9+X3P+M7/DP+qUFmIGY97g5kQEQUX0TtRSyAxwSEO5Cl2Shl+Pn59hNAkv4Hh5LcDTBxABESEHEACiu7T3zMQ2EHlxoAapm3XH/es1enY5NXN8nEu5JouhmTnlJ4oex8IVzxhVIRuS3WqhuQmuIbVJ8AgnrkX9aGuDsOYzM/Zrcf+5BBn/uVDz7r3+Koc3ZCOhYEZASfgwCKWECmQSCjz3nOx2593jy+CrT6nf+OGKNC+YXoFgcqG8A0ELDosbCDSw0AtcxLrjv3mXtBf/K/GmTyr6TF15Y+0gAgqvnlgqKgl8lFDeXXPcOc7sGmXbAq8OkfAjD1E3bnmkcO+vx2s3sKZwG/i6HLo/eqRgB17j4HgUxY74+tGb+uMdf3OeOMo+7jFGIdMRWBUum55dfzlos1ZexRsINLDQC1zCnXnfXsnUhv5ntNnN4/JjwtJxSfK7pSfKYX6mwLndfKL0XP+Y3OGnUTEAkE6Z4A3R+wu16wX9U9nDF+1EwUpyc0otleDD0OAvweBHXXii/Sg6KYh2b0gOn26Cvm8bXEMIPfIijFV91NnbUgBizb4VOBNQDUMlDGx3mAnc2el5CZh0dc+aXSCytvLT2Vi1JtZlRd/W97+Ygjet5vAwJynzhAkK7mWvctdtcJw1X3cs6HnvurRtL9aIId7kX0uRsg4gFMMgHBAHgggANAxnkIfeeRn72xOdd3Y5D9AUwMwPQ31vRfsQHcC3ZwqQGgloFy7B6HnxzBzHMidJTfKj21Sq/VOwcA5hxl7hmt+FI0EzCxAZI+GtjsRwfdT9K841+TaHadYAERdwWIqejTDAAEI8jYXtiNj4c5BBm5FTVKMQkEYOm/xq7VsINLDQC1VMoNn3/GSkI7/y/GbsHylyk9ckVH5io85NtMb1tWQMBzEVDHCkj/teyuF/9V1T2dMf6amRh770xwlgNAX7oCkgWICL6oEsyYZAOU4pvmKg6ipH+HmdlAgZbTflDFBXYWU6PBDiw1ANRSKSSmp0Qwu1MhuOcuZi4QFgBA2SIl2PZAQHxoxj8i/Shj1TUqew//di0PRP5fhD0ZEBQgoKr5lBsAMhbAHvPsj936VBj0/YBtUoquFgZ6rXGA30LrstXvjWAHlhoAdiBhF6+JROntrT9Z076Yb8NWyHXjaxoEeicT7mvLtJ4O8kmFB9mvQyk8YNHye0qPueWvWtTd5x9O0qfB3cceXnVv3CrTJEo/KNKCEaS6pj/TsQC1UJnOY6+EAcJfl89IhOq7yE1QICCckv2mb4thB5Yd+svt6PLni5+5V9xiR/D8+2FxQp9wT3T3Xo1J1iCEsGfuTjobf/KMW7ja/o7/mX+M2Lx8xVO+ddN8rx3ttv5wArO7EUxz5TdBPqOrGgSMsksFotqfZ3rb3S8AgTG12thbMsAtOe2/lW9VdumdWMe+3d6zd2ME3QNSFvH7iPJiHl0jABF9wVGn3/76y16zR+mU5RGLuxrCNItRQMbkpEYCSAjs6JMF1AzgASh/vPCwQ9Zd9PQfNuLpdQ2cOL0VTxzbiCYf1ownW814mvB1xPeHk2jyEXx7Dd/+XEQ2/nnDT5/9g3t+9PfPGUSvrbDukUTk3Dn9V5VyulpOp8qQCmUhjmITuaDZpiVKT/XiXMfuGzEIg+mz2a0vrazEEyW6JOp+KSLcDbAsQC1qaC/P41M22tvUP7LqGmmb3BhD1IkoBw+u7Ci6g2QCf/jnpzKWsO6nb3nIgsxbuFSlBoAHkPzhgqN2/tP5Tz+nCdM/acQThzfiKZLEsxBHPUgikZ/XS5TyfbNkkMR9aMRd0oimn9FMpq+477+O+M87f/z8gYU3yPqHoEi1CQBQLTvBzP3p+fkaCNC096WO8huFp+BbfVfxCzl4cwNcI6POwHw+T/idH5NOT6QERSzAju0X1l/EAwQIZKxyQM/XPveciZiRs2L+unz6MKaCiSKr0Ot/AjzfZMeTGgAeIHLDlw//66h/368aZOLlSTxDhNLLKjyzoC7JFeW4XEsjopaYUA4IDBK+TuIUeB4dGtHUoSSbvHbdFc95Tdlnidw/0O7DOQhwpcp0sM+x/iairxWdOYDAXOpvtyFYGLjBNw8EwPEvIHspY9WxjPM+/rJ7COl/nxigYjobIGv5dVCQsb9bs+biymvwn+vUBPDrCVf4qM+ZRI9fq9vL+PLh73348afDDi41ADwA5I9nHfbcBk7/oEGm9xD190LhY7moijybnuMKb5SfaNfb1tlEKAfPifc0OCNoRlPtBtn4pRsvefYnQpdgzapDh7gLMAocAHhE3pbJWsX3GIBsr6sVn2hXwAUByNlA6P8XlB8cBiDGD2QPgTviwwf9NjwIeAmPAyigYplJ31k3gO/uOnHwYytLes8557DO+V9++nFNZAc3st4/Jf3e6+Le7MOv/OyT3wkPglmD6yDgEpc/nP7Mp0Y4uTbBmbaqv6da6VWtvVR0rr+Ea7oqsbFhrbzkFnV0m+g/OFcUyl2DVtKBtNt9y3XnH85f8J9vMZ85Owut4bhDxNS/aHP42lZI+o5+Tb9WeEa0ohMo+v3iGDUpBMzPiX2ptKjWiE5MQDjk/Zfyjf+o+n36rPvdOGpQTFNi4hQuCxBtvniw4Gn8pb+GAXL+V57+S776JTzIpGYAS1h+f/azdo9x5hsxzrbtoBuvDNfoE+rxNmgXT/nNomlBxJeEI0EjzqCZTEGD3Pfma0//29eZz42meAiM9nkWrccVKANbHiuV2af80upnucVndBDtB30dNocboEUFA49m160ZqfqNzv/0a+5E0v+dSAeiDljmQ3qZAYJDoJZSqQFgiYp49OOse2aEM7sq/95QfMf6OyCA1vabUttgcYAAHRBoJRm0k02QwP2f/PHHnvYY8dnZHZPTadrrsawP0gpTp0DGKrFSduUdGN8ffJpvXQCWg0DBFQAopAU9ycZgjAzszMMV/xoOFEr5Ic9YmLgFB8QdfljvlkoNAEtU/nz6M54fsdnnCMufW32nDFeyaXQUX6fl3EE2rvK720RNjR1HciYcaDT60Irva8UwecbFa9ZETzzjF/1+t3875f6/YACMZcqamqGyBRYAcmEOKBRTf1Di+4dMAPxMgBCU4fmXDfqtCKY/J+gEAk1ln1kofdiRb5x7cNCDUWoAWIIiovDIeu+Xpa66DNcdaWfrZWwVnmP9mbMUBuAYt0BGBdUEG1EESYLQbHQgwbsPGTvwFqlsvV52fdqnXD8zPUaeaiUHT7GV9QcTJ8yVvUD7w3NQZANCCjUBYiN9xqCmISxKfysKllTKktqSXlviy6DZW53uDbUUpAaAJSgn7vF3h0as82jVZCOvvwenEg9tTb0GADHfNXMUHTDfNyW56LoDqkefBABOAxoNhHZzA0T03vGvnHhoa3YGfp6mcny9YgBSkahnrVmJhVcW1zk2H9ovdZ6BlwlwWQDJIn7RE6p+ryhq/pGIiQPAZCscdmEYRsb2gloKUgPAEhSWdV+qcttl9ff5oJvqwTcOA/CG4gaLcAWImBY7hqQRQ6vFoNW4Z6/m0IaXT3fJjztdJsfXq3QazSm1VnSjwJYBZAELcAN7ViEBSgN/HhMIYgGinyD2T2JsvPR5Pfsjr5jiLGE95rTEgom5Z36BPaCWgtRpwCUmjNP/m2l2hGiiSZyom8pIu7X0gbKbhTrj6wsj8YwQrVScBRA59TZ3AxqcBcQw1JqBJtz/1jt67cctn5naNNKmy+JYNeIUN6EsPFOXFbl2UWTgWH+VDmQyFoA2/Qd+KlCOD4AKNqC/I0Kwzh4Kt//+MCgZH8CDfOz4U866nX/gzh54OIwCCdsFFlnEx9x01dHLYkr34oxkNG7xHyKNpvhPtG7VUy+dhCUoNQAsMbl19ZH7cmO2GrUZ9YfbAticvFV+LF9srl6/x2ygo1m6SiiSLCCBpNngLKADI637D1h/30Of1e3c951enx7bSFTBEfPGA5iAoMpIMH05puME4tbQuABu3p9oa29BgPmgZu7NKL+5dZQ1ASdDxQAhfm8b1AcAhO6EAKY0gzFYBFl31aGtiXsbf99s9J+3LmFPi3v37xUnlIh5EWIRlWlG4vdNJ3/xzOsjklyFmHy79dgn/AhxnMISkBoAlpiktPeISFS1oWlSkS/SqhrrTomzLrP8kCuaVSRTZGNiAqBYQCQAIJIsoDWUwMhIFxr3r3/jxDR+cVmHHdtuZHKWXhGMZBoIDLVGGw/QzIAwHRjUdF/eo2P1LRtwzhcYAHPu19y72MiOZve+dDWuOv/Owg9H6DRLqV+8Z1iJvGbWhgWU6y4+dGS2i2+eujf9x3Y8uYsos04iUW7NeFyFclaFapEZlyjmAdfHcLb1GMDkn7IbfvqH7Prnfoa0V30F9z1nuw42qmMAS0yQZXui7UsHUKT8edGNKcP1Rt6ZIhxbqw85IFDnOiY7YN0AzgAaCTQ4C2gPIYw0Nx1268SBN09NwYY+V6yMpjojoEy8HxPwWYHx95lhAJAfGxgIdLcBwE8HittNG9Dpvrrsd+N40lMFj/q7MR9YxFQlsEDyP1951nO6s/SGdjzz/haZ2aURd6DhDMhS3ZIzOT5Dzpcgj4vS7R7f7vBzMweSaOaLrHfX9ezGo/8OtqPUALDEhOvYSCEo5iq3rr5jnGObfDwLK/DCohyz7QmC252XRMoNUABAYNnYNGnB+lfOzOIlvZ5psOEovmq4AV6+XbsEebLA0P1Q+VkenTeBwVJwYPZW1Vq4E9mryyYT4cHMe7kzw4GAfxdKVGYkU56DaBNGaTav6cgG/m04jvz09MM/mMDU5c1oZs9EKnRaaJFullgPyIoEm5PDDalqhR7zdcyDvElnX4hmvsP+9PwPsq1s4LKlUgPAEhM5N63a8Gg8MyPvqDvijgQK71j6qly7WWwmQIEA4SAQJyIYmECzLdwAhKHm1An3bxy9cmZW+NCiz54uCtLFALp3vqP0DghY4ClRfLceoJQNMChPCYoYRn9PGMUXhr9bhHh5gytaLNKmshcIqKEEcjZh/qHd7HLYChHK/79nHPZvjWjmXU3SRWHtEz0oSyo8OAVbqJSeGO/LTopCbDm26Eku3aAoJZDMvgue1L+Q3XjkNi9WqgFgiQk3rPeZKru8zBYgHGqrgADyclxTgWeVHivotvgU1wUwD6bKBsScATRaDRgeIbBi2eTI+pmxAyan2S39fsbdgExbfirX0hVwKvnUNlW7mckYQG7dy1hJqPhlx43I26bCFfin8Hc751OvurwRZxcmYjpx7q6IyUIIX1AM8e33PvOjDz/+57AV8j9fOvy0BGde0yAdqfhm6LWdFUkoPajRmHIxt2vcElOAFU6OIkszBBB01kCzeRG79uAEtqHUALDEJML4Jknv3TJbvQ4BIY8FBJbf0m4ImIDjG1vRD2MkZ9iVRUHNZpMHA2NYtoxxFrDpddPT0dpul8cBBAtgOQtwmYB1Bxyrb1iBvR/m3FNYqDOQBbggILbTQ9jtx4UNP9nMHfSERtR9U4PN/KbRn9oY96avxf7sK/7z0094C2yF/ORLz3xGDDOnJaTLlV/79l6LdAbupChEV2UStwoT8wKsfIIUBwQEZSG958Ou+3wKtqHUWYAlJlHc+h3tTFJGeObaZQLieaF55J7xh8hmAg0j0M+UHWZrnj8TCRfHjadpmIBjkUQ2IBJuQFO4AZwFjPZhp7HJvdfds3J25Yr72FA7wyRWGQE0U2kJRiDzf3mBkJ8NAD8VaEEA81oAe79MZysxYADo/EIyDsDpfU/0DLzG/e30TL6f0YvJKW6ViMlQ12dTX+LAQhI9KMsMx46k8uc/sx2XoUuzwRuQFey7gGD+DvK36b2B3fLia3Cvi74O20BqBrDEZO/XX7GBQnwD0002mLbuXhVuSKUpaPoNxYE3rs8NLAgI5pkA1w0Q6cBmqwlDwzHstBO/G9I9cnIaft6T2YDMCQaaQKBe21GDOiZgxuSHjCS499zqQ/AdgvgB6H35gvR57KYXP2LAT7nVyi/k/rj3qgRnHxqLiVEgk4u0+no2IWn1WV6vYTslG0VnwdqrxnSUX+4yNYNy1P0cu/OkVbANpAaApSgY/Yd8tJgeBeDQYwsE1AcFcPZLfW67b2i1Da172QBZEyBZQFMGA0fHCKwcmzr41ruHb+t0tBvAfWzrAgTpQANOzKH7zHVL7HHmuwGua8Bc1yBwEexvlIpGBKfCIoporZ5A580JdMEOyeY3qSw/BTOxKLr/mM5AuOlWppXdS8E6C7qDtQSKpDtDf3IctoHUALAEhT9i36YsVsE+Vwdsqkz72BYIWJEduMpWsLAYfCLaYKB0A/TYgGa7BUMjMazamcLkDNtn0yY2I4OBmR8HsLSf5aXCeXowZwL5PbAKSx+Cg7MdIp78ov2XsD+v2QsWSR563/rDYja7fyyU38x+DHpKNGvx9UJ1Y9SyEu1KENC/vQE2GxuQgc5XzjVt+kJIDQBLUB66x6r/4gmt22V4iWGg9Fq5qK8gUsmyPCXnKxXzqb9lBeaBQ+0CODUBia4JGG7A2DKEncdmH3/L3Y07urImwA0GspIF8tQgzY+Vpifd7+FmDDygYMVt+eJ+g2vf22CRBFn3GDEkW1h/GfBjGgCk0hvar629VnIZBwiLtsKArv2bBgFZBg6ipE1g6cmwyFIDwBIUPGYtdwSTr1EW5ek+89wzmSosWFgoKD1AsbiG+SCQfyLkUelIsoCEuwECAJrtJoyMxrDrrhTvXw+7Tk9TSFNTEyA0XHQMcrICzIwchDwWwHIgqKT+7v0XAIFBsY2YTvSz/ivZdWt2gwUWod8EekfKluPC8jvdkXOfH1VgVlp/bfW9Ck1SBAEXfL2/jfN3kdtU/K4vZYs8N2ENAEtUehH5MmOyYz3YphvMr77zQMAG3sD2wvMVzVEuGwfQCwRMQKQEpRvAWUArkSxg+QoCy0e7o7feye+NuwFUTMVtYwG5YhowygOAqrSpAFIhC3BiBr6rwAJXIQAB1huChL0ZFlh+8flDD4ygt6cs8AEzLJuBOw+inRHJmRTFcwNMtsNWaDoLDb6ju21+CEz3gZff8GhYRKkBYInKw9901R940u0qKmsCwHtIjCVljnK7/rfNv1cFAV2LY3xRN0dN1PiAWLKApmYBEeyxO8C99zKYmaW2MlC6AqAZAC2ODfBaibnWvYwFuN/TPRcyABqwANp/LbvhZSthAaVBsr+KzMxIoK0/mGylsvaoS47l5CiuxXdnRgpBwAUD6nzX0qhuKmIBfwuLKDUALGXBxheoKG5lph+QY/nBMADIAcFzC0ArC/WV3gIBFOmn4waADQaqmoChkQSW74TQaikQEMFAxQAyXRWYdw1ywQDcZ9u6ASX3IpQgYwH9B4cBhMpvFkEvumNAZ/4RFlAQ+49H02lYKj/15g9Etyuy24vBzpDknAtjH953c8HQBQEDbtkTYBGlBoAlLPtP0MsoNG4WiaecBZjUW56Dz61rzgzyaDw4SsUGsAAnDiBZgIkFJJIFtIZaMMpjAbuvBrjrHgaznUxXBqaaATBw6wHyW3WZiVMaXFBqAC8o6LoKc7kBIJqX9t/Ifv+KUVggQZo9ikDu96v8vuZLZZF+O1bD9f3Bt/re38FReruExyQA7A+LKDUALGHB8atTzgD+TQYDARwLn1sJ5roELI+2e006PasJg1mAW6cuYwGRbBTSHOIsYDSBFStRhgk2buQsQAQDMz0+wAQFqR4gpMcLeG6Jd1+s2jJ6sQAGXjbDbkMOAKL2n3VXpp3JV8MCCbf+D5OBP2amTWLyqIn4256MTiDQC/qZY5mj/Jnz9xAKnoVAkOnF+bGALmonoxoAlrik3eQsyuJpSlHRfq25boNOOzSXggMIAMWcOvhKVMkC0FYGymCgjgVIFrBMZAQ4C7iLQbcrWECqWYBpHqofXOqkA1mxOtBTYs8iQgk4BIwhXOQX7/FV/83sxjdu9Yi6a08/aohgJrsyoezIrCP+xgXQyk/AmQ250KsBwQt2GuXPtKsj96mayDRzlN4Cgd5OsyFYRKkBYInLI/7lh/enmJyvagJcBiBadvuBIzc46EbhC9a0zPoz50PRKQ/WsQCTEpQsYGeUz+3EhE4JehmBrDQQ6JUGW+PmUHvP6kMAWlDhIrggIJSms+fMhrtfBlspozC5F7J+BKBboPk/jkP/9T74Of/SCVLd72gtfsAAzKzGzGUCIhK4eFIDwANAGGt+mtIGlc8iqICb1iDH93YDb67FhcCqDgCCAgvQsYBYZwRaTWhrFrALJ6Z3361ZgAkGMjcbQB1rDwNYACthKqzIVlywsAzGiQPISUy7fLN3Krvq0K0a5NZLe3uZOQbkr8LMr4J2raSkvFfn91mY5/f8fwiAwFF+sWTUBYAJWESpAeABIAe+7erf92l8ZcYtiezMA2oBpxbft7YBE2CB8hSsrf4g1x0oZQE8IzDUhOGRhmQBKde5qSnKMwJpnhFg1PH/8xiAa7mZ5+KCD0ih1fdYAqtwBdTFCAcBpLMHbIh2ORa2QpCle6kMgPH/bfgPPCgIGYADpG6MoMC0PDBgAf03oKBfw3A9LKLUAPAAEYTGxzMWS9rPWJazAL1mgStgmKstDLJBNAbFwhsAnwXotTNKULEAnREYbsHIsgRWruIpwXs4APQUC6CGvnopQeaxE98VCC0igJcbL3VVgve4LgPIYCA/3X3PtaefvMWNNTj5UX0ZNSKi81cIgQBCIDCBwsJ9QwV7Yb5LYP6O5nfI4B5YRKkB4AEiB7z9pz/up42fZoZeSyVL86CbCwJUBwYp8yxuwee2CgVQHgvwqwNVr4CGHiTUgOUrCc8EcBYgyoM9FpB5D7IpTPJcAid84VlD997KGEFBkQDMBdWkoH2I6OzD9nzoxhNhCwVpujuC6syWqzsWgKDoEmD1RcPf1/0OwHx24H43xNtgEaUGgAeOsH7a+kg/jWTkXcaGTBUeUEuFvQKcSp+b+f6oefBAb7OgLoA4YwQasWwZ1hpuw8hYQ6YF77+XQa+XchbQVxkBA1AyJZi7KV59gscCAPwgn0P1Q/pP9f1ZRdLfS4qI2IvS3a4ICL7vxitfsoVzAdA9QY/398Ud+JsfA/DsP8AgQKhiAuag+32UC1Fsgb6AUncE2g5y+2VHDfWm+k/mlPmxEdI9uHosF48K/7tv4npzO0vj33RHlv3soGPWTrnve2R67WXX0/1+F+HUowjJpHGOdCEK06ko1akHJQNA2TWIKZYq9RDlfAP+RB2gHzrM993nNmQBsWEBPCA42uUsoA+3bshgmscCGg3RJFO0yhLgFEkQQFMcIycP0YAkt9XnmX05ixCazwNnYeB1D5IHaX5/lgGoL6T89i6PB0yvbkD8Ln7wHbDZku0q0n869Q8+9dc/i/jnnQuVXv5FA7Ay/znK7n2P/G1K5N/2ZlhEqQFgG4kY1fWn/a55Vhz1X5lOrn9uEqdDJOGBK9FeC7U2imedR4C5gYd45p7ujWc+8ar+TONctmHjJQeNX9/DcaA/++fkwxGy8yPSV0F6otJOJh+tinGI7jBFwZSugmYCcmIRyvJnVioeKkULAln5s0x0txqeGeMAEDcyyQJERmB4rMcDghTuv4/ByEgGScLviys/EY+WBAHlsiDTaUzZQiySLcPQAIDAB9PuzLYJYzkYuJa4wFmZPa2UXwyfEiygwz+z+aYbv7Xm3AOOXns9bNYfi+4hwYTkMQDPuqPrGICDDaHFRwdAWH6aFb9C4XvKXfH++HZYRKkBYBvIjV85/Kiboh98uBV3HxnH/OEUM8fEQvmZfMhksQlqCs9UMI0202bapUf0ouiIGWzf9OsPP+a93+z85vxpWH0RTq8/LY5mHxbJQL2a5ZfJ2YEzywJULjrKLa+xuMRY29DSQm597AOpxbIAxQQsC+AA0B7twTLOAiY3ZjwjkEGzKSbGSLjRzjhemEwAcRiJcU10D0OXBVhA0p/JtPV378sDBoA8DadTdvI6Ytx+DyKYbiAkX+CXORyLfL78b/XZI5sprtvJWGdfwUF+h5z0q7VhAyEXyN806KMrztlag+gWWESpAWARZd1XDm3xx/LjcTT1+jjuYizm2BOKHzGuHEyOuVEAwOyDa3P6nB1knFI3GrPQSDbtMxNF5z6/v8eJU1P3nLhxpvH/koidK2acEf38KVHTg6N1BwwL0O6AzgygdQNAPZTG2hq/3yhXFQtAzQK4MscyFpDI6sAhzgKW7zwL6wULGM04Sejzz4slKKlpyzUIyHtgevJQsUYdAyhraOoousP4fQaA4KUuxWndj5/ILj5dvswc+vtLXvBygEvOgXlIvzm1E+mkiWUW6Fh9x/JbZHCtv0UBDz31mhUPlYkHvpGYeaTOAjwQ5Q+nH7UzT0v9oEEm3tCIZ7AR61lkokwukZw/LpPzyMViPjkxmWRCeJCN2ECb9LNHmjC0LIbRFYJq33PYUPuma/v9zm33rY/+KAbk9FMeeMuEwvWBBS27mZMNCKvxqtNvAIVouxTMA4JRDGL2y6SR3+PYilgq7dSEvieREaBu16CgQMitEMzCtCCDYhkw5EDlRsm9gKX2IgQIcNcqIoIFzAgg+NgvL14zryabaYftLtOJhpFUiGf10T+jVi44zFP57XkLOnfjQWt7sIhSM4BFkJu/9twVdHb9D2OcfoyaFy6TU0RJ6i91iOUduCL+IBGUvrwyNnnfbqlAHBlEp14iovBklj/33VVpt3P5unXxN4aa9GGJYBUcWJCk8r2EEW11MxUYpMrFYCYgKEkBamvLcr/bthzXtBv0cftA6wOyXx1fxyotKDMCQ20ZC1i+KoON9yoWkMSCncT8cnEeDNSuiWQBxjXRxEJ1QM4Nrp1KvMACmH9f+pBao/ZUmPqd5eQdHATS6Z1bmHyMv+JEmEMYdFfJFKB0AYj96n7832VGaFcWFDwCYAMURfHOMe8ulJBFTQHKT4BaFlTEHG/ZzORFMZl5jGglLaPiYmZdoqbYVtsGALjio5pBFrVllVQg4Qw0bgA2WkAabUhaQ1zJhmFodBTGdmrDqj1Ie/Xq3jG33QF0eppb3H5fpuCYV5LLdD5eD8rRbgBk4KffvBw7g9IKQTB+NiiAsiXCIiCYQKPNQWCkBaPLY3l6krOA1LKA1N4POCwAqF+uXGABmcNIvHQlBvfsMgCtqoiqe69kAaKdd4cb9ZmXXXfBmsPn+vvxv9luwDI7izpaRMp/CjvllweO6Cs5FjbcpwSKcYHwzXL/LlhkqQFggeWmTfefyi3/s2QzSaJmjzETSZhp4dSilJ9YKhDrJVFLpECA82zgZhaiVpsH3YZ40G2EuwNtWP2QqDk8AuTeexh0uqlUOFWTn4KtFKT5RJ5hn4DytmFQ4QYYS2WCgQKsBAsgumtQQ8YC2mMNzgIIbNpAodtJeTajJ+sCgLkg4JYn526AU9nsBPzAB6WCK6AVhTm0AbUVJqin7uprV2AWM9r54rqrTmwN+vtljO2mioAcF8Dj+vliAoIITgRQvSFfoft+KPoM9jNYgBXyey1qBkBIDQALKH/84nP3I3T2NPHQETN1lI7wq2eA+XRSBtYE5Y/U2uwLIBAAIBlBQwQHOBBwNtBscZ97iAfdhjkTaMHe+yNMzQiLy6AvCnGyotVVfrhffJMrG3O68AAUSnFdZQPIFQ0d0BIlwjpm0RbFQZwFJC2ETRspjwWkMj5B9SAXNT7AsBLmlQSHS+nwYJeZVN2bYQAacA0LiJGnBen0gRtvm/jngX9E2l/lRx0xWLu7eeAv122stv5eTICVkAMXGOTV7oZFlhoAFlAa0fT7CHbaIg8doRPdB1BNJd1/YiouO02Uo/wY67XejjQYCLcgaXIQED362hwEhri1bcJueyLcozv0KNotqvEcZYO8TJhSd2x+XpYLZcG3AhMIKKpJC8oS4YQrvWABYrhwk2cEiASlzmwf0kywAFUhqDr3lMwjYNwU6i+FeykEBU1A0KleQj0zn5jx2AGAiHQlCNB05h0/P2/NgVV/Qx4v2V26APk3dW2+svo2M+D+HlDO4k1cxTuHJSwA83P5G2sAeKDIX856zt7AuscSPU20KUpR2TaWDyl1e8d7U0aJJQJvqi4DBEQvIj7AI+8RZwKtYR4TGOPxgNVcATlJ2LhBleOmcmy+VjgDBHZcQJgRgGJGwBt6y6ByyLBTImxYgASB4RYML2vwexP3pEYKZjpLYVqJM5rZe4EgOyHLh8tYAKsCJ1fziL035V6hjLdEYjZf4QbgLER0pkV7nS8yVrS/Umh3N5CjLQE8648+E3C9AusGAEIYMvCkABJY/Tr1bNQA8EARknZO4OmmmECu/MQ8ZaGv6im/3veAwDADAwYaAEyQkINAIsbmjwzByIoW7P4QIgFgZsYZmhuM0YfStKBRNoDCCEFaovy2rNUBgYjYNuKyaQhnAe2xJixbGUOvC/yeRHyiJ0GJMWfIsDdcmHqgBFnIAoJ7KUtVWhagfjM0MRYZZNUpQc4ACAcBHhA8/CdfErUBReHAubvpAqQEPbrvGmurwBoJPOXH4HXecQYFz8IDB70TNxZ1KLCQGgAWSJD1jya6iYQX4A2DVmEzSVXtBbatFKC/7TzU4GYKOAg0xKi80SFYtnPCgQBh/f08+GYCgswMzDHFRXnPPpcFQAZ+5L0KCIzS5d8YbP/ASKcFG7ppCI8FDC9vwOhKhAkRC5DxCd06zAEBM2oRwgFCYaByIChB8FsZcIpk6lRkWFTWUqQEO7IugLAZ/hmdj/3Pmcft6n6ji9eIaf/SPWwVoKOUdhO1tZdgwBwrzryfxgMH97i7kXcaqXhNXAPAA0HWfeXo5TzS/bh8BBkrsZyu4jttpd1+cl53GQcEbM9+DQKxAgHSUENzh5e1Ydc9Ccxy4zZtGnSYgKBVOpoH38IAXOawAC/FBiXBt5AFGBCIZVpQTC3eaCt2MrZTgzMDHqicSqGfGRbgFitlOQMYFAtgUMxS2PtEKGQF0LAAIrMskYhTyJ9NpGW5G8CmAfqTO3c6059z/477HXLwCoI93YMv10y031PXAaABA038Mc8IlNJ/e4zl+yTQfAsaCM6FagB4IAiZmXoUsjRSI/EA8ko1R6m9ZpFEjZAzveRDMLDWFn2FC0GAA0Dc4um3kTZPDTZh590R7r+PQqeT5gFBU43ndO619NvQbgbACpa2JDbgxgEsCPj3JAKCsi5gWFQwtjk7iWF6mkF3NrUBQQa6lTj47c1dFyVkA15NQBkDcEFJu1gSAAwTiIgsv45jkZ6d5gA8CVl3as0PPveCF5u/4+zMxP48jmP1XV0RS5QaA2WFotV3rTs6510wcN/rUg31t6awsjUJiyw1ACyA8Ed0b5l3VzuQF6z4Su9PIGGOu68DKM4jFzxFBgT0yDyUhTgtmRVYuVsiSwhECq4nuvQIFqCDbzICr5U/b77hMoCKEmFWoXxSAnYi7ikRxUF6oNCIcAWEm0JgQhQHyYKlHoTNTNzOQV6K0CkU8l2T8B4BikFKdV+iwCqSAMADlRGCGIyVRCIjMAOYboR0duqL3/uEmoUXyaaH5v4/OjqeR/8RMQgAohMfdH0kLKf21vAjlLsK9oUp3HBrFxZZagBYAOEP7kp0H0JLTdVQXTUaDtWS6W2j+C6ldd9vrgEA3pjyEAS4xY1aTdWggyubcAUmNjEZfJMVgmacAKUQNu6kNiUHXkVekQGU0G/3nkxxkJlX0HQOGlbANLZzk1t/nqqc1bEAqtuI60VCqKP8cg15dgBYXiwEZdWKYYzFAUth/UVJsiinjoWLwl2SJOEgEPN4AE4DnV2/U6+z6YKLx9c0MOs+QgZwMR/r7xpnCAKC6hCzrzNuQUHxPUtfto1l6x786FC3IGFRpB4LsBDCtdn25UcAM5mnMLYRBlZSDsvVLAA1CKDDBMwDY5RNiAxwO0+MGZ/PiBMQTKHNA4LLdxZDczsyINhs8vRXLHLgnCmI4iRG9Lh8PWyYmoYhVLokTFsktDX4rJzaepQbXNqqQIl/+ajBoCFAJlXtwpbtnMKme/s8ZtFTYxvEGAEx45FMklJQITXmgADKltwmJgD6dgrDg11GIo8j+Ln0SBVk8c+M4kQxAA4AzaTHczbItYwvM/hUnkr9NEb9PQuZObe8GCGIAZjvrV9XVuFXJiEohPsSU7CD4+M1ADwQhD/nmwhTrSjU3N1g/6hq3LuzEATTnUcOyqEenywuIb21A0h0elCUDsRcgZpqUE5/WR9W7ZHCLb/nQDBBIeYPOyF9ED0DVN8A44ZQ3SNAFSWpwTkgC5dYpjsHhfekFdEKcTRPPvx6ZI9kJtzf5j9Mc4h7+xkHgV4fJjb0YYYHBJMGByXOSsRAIZPyZNp3V910DQsAO1AINQtAt08AOPdF9G8UgoB0A7jyU6ZGX3IQaCQ8UNrIoNXs8QyFqJ/gcZNNvdfRZXFfDCNGnUZEE/gLGICx9Bbb3ddUWnkoUXZzMRb8beV36MM2kBoAFkAYkluERZfZf2lJKTDDBtAc04sBBKrOiRYAvqJhtVUwO/a4ZgIiNZg0uCuQ6YAgB4E9M7jnZspBgUe+I0WFJQhAJB9w0Pcqi160tRdrqktoRXoQPRZgPlMfs/EJliudEKK9SlHDJKqYubK2aBsyzgJ23r0Lt6/r8phAn99uKjv3KBZANYkm2i0A21lX1k9KJqDpeEj9pfJj7hoQ83sZ75bqbEAkmVDMf6eEA1Kjz8GpIYCAg0CSQXd6ku93E5RsCXIFB7NtdzwXwf97OOuyY66g+0c1yu+9uAaAB4qQDK+jLGaEpZxhazoNTFt99RDb7UyZDbUGbcG0EpkhsG7PvtDyejQTwebhmXEFMq5gKSxf1YPpTV3YuJ5Tcc4CoqgnI+LSuskee8IdUK6ADAyi0z9QWzXJZqTbAvkD6j7cwHLlswpB8u8i6pekK8DxZGQYRlemMLbpfp6l4NaXuyyMW2QJlkZzbWNAJo8LsAKnb57pnYleTwDMQUHfkqdQ2r1CGQhMJCvJEtG/kLOSZp+7Jzw4yQOmfe4uNRJO86NId1kCq/h5lR/a4/bnr1JwV+xv47pUbDBIyG4uiy91EHABZL83/fBuyqIbmU7vycUJ/IGOCTAd7Wc64u9M8KOWDIoReDf4Fvq85gHX03mLgCCKsQKiEGfZCHcFYp5/Z7JVV88ZMkxt7/4sT8M5JcN5aS5AcaQgg/IhxN7Tq8cJEDmOgcgpxnlacGwUdn3IMhkclAxe0p9MroXCSwCQIGQ0Xe2bf/bLM+YwAeb/JhW/kRl/QWQwsKGamTRjaLUIdwUoDLX6HABiVTjkRPzBjfzbWgAANy6CoeUftO9JziqKSMJgW0jNABZM4isojR4mW3yZXDuY2J4qSRUiXX5N/6XxosbwuSwAwHMHcsNYDL6hxnBbG8D9/kwU4vC8+4oerNo9g3tv5a5AK2cBoJkAkbGATFl/2xKM2XiA1E0w9+FYLxMkdIOU1LlfNDQCRBRUKqkY1CjiASxbxre7kHZ7+vsKFqF+BOkSIbWfxxR3sl/XJckF8X4b1y0xTMAMDuJ8gy8JdwVok0GaclegRYFjo+zEJCf89JQecjDQX831/+2fYpA1dyW0/patBBfBbWOcawBYIElpfCGy5M1EKj5T0W3bBhu83pVK57SLkCl31QbdLN13fG9X2YTYR8OxIETTZZMVGOKugIi+r0p54G0WNvCsgOjYG0mKyyPj0k0hcty8iV8omqsAQIGW1uPMVT3HFdAf7RkrE6STD3Ok0E2yExEXVFF9Mb9AX4yaSJ3ptwTlJ8QBAnC+P7HbzME+TwzaGmUyEUTnBpUiR7IgiDEOADxQ2WwKV4D/NqTJU4NE4RHDgAUAYLBvvqv583hSpvwYLOGxwg9JItgGUrsACyQHvu2H1/LH6JeUJdxA8oebOrl/nWM3w3ELI+C8eeMZQFj5VlYD75lFFUmXIwetK6Dy8CPLh3nwrSGZh+jX1+v1874B1g0I+wiaewwLhFjxnlx3AJx7s/GtvD7Algq3BEBxf7wpaga4EnFFxEgzAWJcAeqxA981MNvhj0LzQAHo3xD84JoaJajGCJipztpiGPNIS9YJEBEwjRQwysWwN8fkYxAgBPPnCJEAK/lK/h6DAGbbvodt9TTn85EaABZOOItuflICAI1VLQBFcGvbwQABy0fhuUAApeW4UIwH2MU1J+ANz1UFQi1ojQzxrMAQjwdEMDFJYXamD/1+V1bkebX51HQQ8kcLuh17igsrHnPvjbkMRfJvIKKLUMMMH+Y+dwN1MyQBAtQuIOdLyHIwcEEB8/iAVXx0EMjECFxUMnqGYDsxiQrBJBZxAA5IiagRiOQxpfyqlFixEt8lAP2VrL7mSusotf+5ntj3oH/OYRZiUgMxlwQsstQAsIBy21TvIsoaf6BiEk8acf1Ar9aeBsE16g7GMZ15shLrGlbklSmbMxZegUCihg2LgTmyGq8t23VtXC/adfXlEF05YlAHBm1JLnXWBqSyChbAnHUe8IBCUM482ZKooIpZcssfJVwJG0T2O5EswIAAyUHAsAA7dwJSHSdgPisorQs2QOCL0j8xTBilwgvFj2Xz1Uhaf3FMugCaAdi1GxR0rDaaq3pswP00CBhCqPXue+1rmvDeq2sAeCDJYeNXpxSb76LCvxSz4lDhCiCEQ1zdphfqHOhp4gcpP1Q8487DZEyU7tor6vJlVmCoDSPLhmHFbpzmtgAmNqY8K9CzPfsEA6BemXDAAliVKwDFezW6COADgdmXWKWbdcRikhEi3QDTElG4AsodUAuamZO0K6A6HAeswAWD0F0oLIYFaBCIUA8UIgH9J6pTM9FBQQJOQFBvQxCrACix6Mw/6J1H/5gHINyK/OYhi+4G1ACwwHLAqVdewrPcP2JyKm8CzLj01BmK6zbCYE4HHDMsN6PlPrd8hgNXQIjtI6CZgCk71h2GiYwHcBBYMQyr9mxAty+GDQtXgIOAGaHnzCsAbL6ugMMCzD15zMAs+vtoi6zieoqGY4SyNboYNmxBIGYaCAzt95UcraLrD/XcgWDBAh2RonFIMwGiQSDSQBCpe0PNBHRlIBA/+o8lhtzbL7zIHIOi8oexABEaHk1HYJGlBoAFFpQFdo1TUtbsUwcE8s43+bBXCBphUE23fVeA+QoX1gqEYGAeJOKAAAeAWOThR3k8YKchHhSMYXKT6NnXg37a1SP0nBmH7Qg9t2vPgICgBSZX6d3XaRBgrhXWXXt0S3QbdNPzJBgMM0yg0rqj8wMUzgEU4wAMwLHkZn5FcR8kMhWD6AcCHRcAdU/wPDsAUOrje/us5KDzYhNRtKBh7rO3AhZZagBYBHn4qZf+hoPAZzKbEVCBP0+pKPPAILS2pQFB1a0aSht32DyjEM0EbPtu7mRzVyCWw4aHYWwVZwM7Edi0UWQFFAvITEBQluI6ffxN1sKAGBuUFShTegpOIMSCgGIBeaBNTXyit2UHtBwE3JhZzgTAUZrA0mNo8XPL777PKLQHAJEqFpL7pAwEwGcAZYsVc08IhaHCBQnjB+LvjTvBIktdB7BIkg6PvA8m6YuQ9fdBblmJ9LOZHdQiGbuex4/JefzyAhxm6vAzlj/95pmhzgMVFuNIcV4rA4KgBgyJeADl0e4sg+E+hWy3DO7qzPLUoBoxKGrg1Uw+asSgrM7TZbZmiK6eajB/niU45Dn6PBtnrLW8YbDpD5ua07cnv5caxcP015S6jKirix1aHBjJ4EL2q+clwKz4ewQ6aFJ8suYh0k1aIgV06vVEFgZBifX3o/8VUvARWPG8d7/O6+UMTXRnWGSpGcAiyUFvWDuVkeQNGc/miICgYsqGAeigm3EJmFsfkEfevT59mVJC5QK4lheg0D9AimYBlgmoAUNE9A7gOe/hFSOw0+4NmO0wnhrsQZp1dR9BxQIAdI2+w1ooy+MYlAVWnpol0wtzjjlMwFrpXKv9ZhvKtKKeQcW1vJ6FLShfGQMAKPfL9fvR5Pm1O6J9/5wJCJfEBAOdcmCi79ncR5n1x5LP98AZioLB61i6Gyyy1ACwiPLIt19+JQ8IXiBcgYwrpyoEUvXveU886gABLafZhUIhgNLioIIrAPoBdeoDRFvxdkv37BvhmYFYuQJd4Qp0ZVZAZgb04AR5T8Acl8BfPOU32zbwF7oAAMW0nNIck1qzaygOx8WBhTYl22UWGt3zkIOAHANgGojka5sGtClBzUwsiJR/9NziIAHmv0MukgotOgDULsAiy0w2+uZh0n0mwdldxVBbypVBxbSEQsTgpqvV1N3aFQClN96Q3CzwEy0Vdo4LvSWWS+vjetiwGV3XYJC0KbR5tmFZP4OZqQmZGoyTnhwxJx5+MbW3etrNUF3tuct+AmCH6ErXwIzIk5+t1yZolw/hA2uhmbpZn5k79wtObl0727lxxAFKNm/tA89tkG0MVCxAxEzU6E0A1ZREAxQ46T+EgJEEQICDbk//bQonmH9fcjtbDYssNQNYZHnCv6y9NyVDb+xnLZXd4/TYdOul4KTeTMsubU1Nqy7IWEWQDcpdgQITMItpI6YnH5X1ATwouGwYVq5uw8ysaNnFXQGqawNAj9QDt3WXYgU2U+C4NJ4rYOYmdCP/ZaP2pDj03/lnFR9N0Q16AFGtbWgBxjvmaqx7HetymGCkv+RBQLAswLP+hY9C72NLBedCCnt6T1hkqQFgG8hBb79ibS9rr03TmPvamY64q0kzwabeMkuZ88k88yh8sfgmiAewMB4AORAIsa4AqvECDVUk1BoWk4vweMDqBO67J5NlwnnnXq3wTkzALsztMZh5NQQ5GBjFd+i/o/hG+e2+VaxQ8fPX+3m3EkBgJcdLja5zLfuZucLnyh/EADwQCBYo3k6pBMFIez/efcsfbHdYZKldgG0kPWy/AXpDT0O2aTeiJw9VbbqYN1EMM81EdTMOpgNaniugDug1FA2iVXw3Eq7fL0TAvhw1yCCiDZka3Gm3HgeADTA92YdmSwBAA+R4fdQZAXktYq0zs5YW/BiEEOm6OPdq6a2/a24WyzQIwf9SodV0goilQOBez6YY3M93KLfxoqQrIBQ/b0fmMil0f3MPnAAGuyaBuK9zRzDa72rume7NVI9SBosk873lRZNDx6+KV+y379OhuXx/nqq6NT5w+D/XHoQ92AHl56f99fPbeOs3280JYXw5E4/luPSIJNL3RpKoVBzRQ3bFWhekENlcAysW0JYddNoPbQLAmZQQ8oCDttApV/BeD1inB52JaVh/571wz62zsNvuLWi1x3jMsCnTg6pNlhsQI5YSg6XGCityI80GGOyy59mx4FXKbo5heC5Yh4rpfrb5DLt2GVRZgBV9V8reC8k/x3ymad6qTwNx/g7mbxO7+0yt1QSS4OGX+Gza4vnalSvwgK9NwCLJdmUAL/zcTx6eNpZ9I2OtgxgVATHuJ/8F1h11KXvxZc/Dn8MDWK49/eChncnwrt0OHYtoJ0s72fqpP3evnB5tnM36/VeBnEVITyQqBsLwAGCEqjEHOi3FlTUlMiuQu7EuBTXmi+XHqXMjxGECnrIIQGFq6DBfNYcZLN9lJZB4QpUiE2719SAcdRNgH3TmBB6l9WaYtwfEXK/ktunlZ60agJ+lcH+1QLntvQZKDnOtoWLfOezei+l07Og26O9QjKUg+H4+QhmBKb2NstthUHmb/KEgEHX24Vu/gUWS7QYAJ3zse8OTPbwyi4b2ZTxABhk3iVkk2Oa+mMAVa65kB619Dt4LDxC54dxnrGyx9Hkx9p8F0D8kwv5eiPfGrWaX6w9PsQ31YGi4O9OZ6t+88e4+T7tlsGy5otdy0It4jihoEADIpw5T2QFVGAJQaNSJrvI7YOA+VfKBds+r6L6qD2BqmrEWgzYbkda+L+YYy/LpzZUrwEITLxcDBkqH1P0qHUYwPJpZ/MHiA2+HDBtxtKXM0g/UJnNN5yXMvZeKF7u/neluJBulVH0UFm/FXaBkv1TCvxULTlHxd9gHdkQA6NH2MRTH9qXZEI+DNdXccqZFHIFVPQKv4HsfgSUufzrr2Q+N4867YjJ9bBx1WrLtVpTKOelFL34UbaZlnT33q9P+0MiK7BFjOzOYWg8wdT/PCAhrO5YPTBGKHzHDBABsqy35MBLw4gBWsPjwuebYmGfbgtwBAkNHxUCcJkIL1MCYtNtVxUig23LJ6+luPaVPPECe5UMNDY71B0cJQ5+8zHzOZe2x4n2DAKIMBBRNcT6P5cpPIA8qVrGWQSBQEPPl53letlhPHwqLKNsNABgdfjTAMH/I2nxpiomQ1N1QZXD47/04WMJyz8WHjsxM0ffG8aY3cgBoioknI6H4UcYBQC02aixacQuVEJNhcIVvDYv23X0efU9h490ZTE301DPTynPNxLgA4gw1T5VSQtsuDh2FtgrhPMxuOayX73EBQ5W/GrYh3NJEO8CiZZesW2IGBMC+L2zNZZXd7kMOAgYYrKHFEhBwLu7tQxEMQuUfmFar0EZX19DbUSvC7G/iNTapAqIQAEo/lpVsup/N8mvlgcp9YRFlOwJAi4ieByC65zhTZJnaEc5M27BE5Y9nHPq42en+Nxvx7D6x6LMXp3L6aRJTDgBiFhqmhrjKgFmsqbR6r+nAm7QyaLR7cqacTXd35fBcrxMNoH7uELy5Aqk2S54r4Fgv+zAjFKg1Yf6+3cQ8PRjze6difj+eruR/EKr7Ghoej/r1WHjImf4fNVhgQafQ/F/JAEKFLzk3cHvQMe82S94Swpcx/0Yhgy/sglAVCxgECOh+VuGgAwL0AFhE2W4AgJh0pY2wKOsv/JnbJj3RNlfWffmwQwh2vtOIZlYYxRdKH8VC8anUIan8ch3n0WCTaxYXEV1yE/7aZosrWo8vHZi4ZwamNwiXoZM3pBR9BU1nThvYU0+GCs4FZRye8lf4liS/Rv7Qu7381QhCURfPxP2DSgHakbwYXA/c+6o6ZtAPfcUpHC85N5fiY9k58K9r79tqVbAdXtb5bKv84B8L34POuSrFH4BLpSJfT/eDRZTtBwCA0yZCHBgKtc2EZ7y0ZN2XDntsBN3vxMiVn4gZd7gSE231CVPKTzQA2MkyUR/MQUCKHF1HefytCUNRoubLi6ZgZn1XMQc9v70anec8iDYwSMC2zA4tPbpuQMkXIWUnDLNQ9y2ZiEhBGuRxxvFYjCm5tmfYPKNaovweE6g6DjDAfPqvxbLXhvdTdl0HNN37tikNmBe+2e1Q+V2A8Fiac6xKkO3FrlvTwIPWLkpqfPulAUm0AR3rH/72/NQusITkhnOPXkn693wrwmmp/ELx5aSTumWVCeIRPVLMzpYbLhYEmPZ1MmltW7YLzSTMbOjqbZ17lzqIXmRaQacqFipYHysDnt4wJhCuTc6fmoyBCkoXLodll3fjAegrX0Hpq9gBVHwYVCgzFEFn3hJafCh+LMPKt+RrF3hdNhBs5xct2Q6vS5vQonvzrRthEWS7lQLzZ+pO9R31o6xjAM7PsPuai9k26Y0+H2n3138mgtl9Ikyl0stF+/bGuKu1aiWlFDPSS6wW6Rckqh5fdMIUS9Lgwb8W4NAQNJeNwPJdx6C1LIKZqS6k/Y7TskvX13tDdFlxyLDpKFTVPShcPBcMwW0qYl0Rd1Qc+mW6dthOAQjUgfxvHCi9bWMGAANNKQSvCc7Z88FrGBbPDTC0ULx1X2lNQY916SAv3rFrzNfu67FqwYAdBB8uV/KP9DBYJNmOLgC5HWVpqVZ+IzkTGMpGQIyGug22s9x89jOfinTieJHek1YfVVRcWX7mPI6mVDYo/7KA4LoC5urMYQaEBz4QlnPFXp9ugpnpDgxbJkDUtIFUIY2c2ltbDvX8+FF6qKSbjmDxkAUCo8BEm35Xn9wYI7oXwpKLuvvhdrB22UFo5Sv3AQpgUOabeOdh/lLqijg/gHfa+b09qw/lv3V4TXTSvOa7qoaoB/GdK2ARZLsBQGuk+afulMg1MTQZgHAgC83gkbAEAIBmvfck2BcqKBXeBfbcDde+eqH2M3K2nUIa780IbnygyQFgOU8Xrr91AjozPCg4rCywSCbaoCBAXieQJ6yDB9Iof8UTbwPdCFBoNqoBAFDPHhxeJX+iw3CDPgoYKry5ldK0Wig4x765jv7eYczT/ephsdFcIOACjX/Q3w7xDIOXmsfBAgBWsILQdXDuV76HPgYWSbabC7D3+t3uj5DcL/9+mWo35Y04VenAx8N2lr+cfdiBhPWeJQfvgBm4kz90ecWe/mszZ4E5FjQMQTCDWPXua3GXYKgNreUjsGKPEehnKXRmuSuQdnn2UA/VNX38nYk87Oi7MncgXIdgW+gsBA4TMKqcA4JNA4oj6BwHtPuuT1BeOIQBTS/RoPA4Kzs2F1C413Kkyh2YCxgKigu+gpttq+hYAgQQMEEEE3x1+o/ngAH0ibBIst0AYHwcRZL5d6q7c0nLaTUx5V/BdhaSwjEE+ohuMQwzf3v915QKb2r4XRCI9KKfhhAsbAtvmz5Qo/Ra3BEYbkN7+Sis2H0Iur0edLsdSDMzm0/ewdfO8mtbcDFf0a3yQxEECjEC5ig/gFVStxYeS5Q9OJ4DAgCWWU5P2YPjLHhNQVFLNJSF73WPha8bsF/2GSW45Sm8d4yVgwSBcqAwAEECpbeLOc4OYHeuWQWLINsNAOSHE/y57I4jBrqIh1FUA/ouwFO3dyAQWfp3yLT1B/Cto57uG7Tiy6aSLFB0bzHMwH0wHZPhgQAPDI4MwdBOY7BsdRtmZ7rQ686qtl20b5uKMKcVFwubhlTNNiTZAeQgUNZyLGABnio7im/79WkQUMfc7+Z+R/dY2Wu0lCqmcw0WvmaO924OCLASgAk+Pt9mgxU/fE8IBOCwAG/fVX4BEPzBStnTYBFku44G5H7zT4nMh5upsTB/IJWB3LnXAEF//he2g1x7+sEJ16rHo0nZybp8ADVSD3RxDOq6ca3cVCuywC1Kgj8m+EpViM0RB5LFBzRB/D7DogknjwlM3t1RQbkG6j+cbmOla4JkKpXmDbxywfyaoQKi83kVLoAbYzB23T6wDhDII85x9F4Dg9f21koAouS2C8e9bee3NpcsvUbJe0sFi5sFMAj2wwVKXu8pPoAXB/ACjeJvkz6Tb10CCywLBgAvPf3a1bONFafR1oq/o43RhCXxNRmBD1zx93hD1XsyhtcQIBnKtrmK0aLJdumZpfn6ebCdAGB5tnI3gIlho/RWMWiO2nKKb0Rl/Y2i05DSQb5t/qgEiwBgPofo4GEC8gPFgL1R2SJsI0zfNws4mqfjmEt/KdrpvstNYWBB5TPm7DCfKSiQQ8g7+RSfZNu1R+/lx/PX+IodrMMAXdn9mnsuA4hKECi+1AsOykvh3NeZr9ivHrwZoQgC4O4Hv4dbJ+DgAFeGZy1Gc5AFcQHWfPg/9prpkp/1s+Zr+/1kvyyNHsIZ6XH8WfzZc77HDql639p/Gb03Yuz/xMAXNHQ0BcsCNCCs0aNitofskrezwrxbj7NYWk8VCDDDAox7YBfwm0wULK1WYneqbzm/Hw8KtpsQiVl9Vo1Be6cEZqZmoW9qBExMgOaz/DKnrZhV6EIMwFX2wHVgQSzAKn/JYp5byAEOXWsG5r1la/Bf4/r/ZX/yqseABddgwfHwvPe+ufQJN/9UQemZf9wTVv6z2GPGgGT7w7oXL/i4gAUBAMTWx1I2uieVI/tafEHT6m6EW6/TBylwxMgVIreNOmotWsozHwQOeMEl8NewHYQgRsYKMl00I5XcKrXy+1lGnOMDlN9s2xl+sBoETHBQ9u/jVKDdhnhsGJbtMgrNZUSBQOpO89332ozb3oLydw2Cg8bNMudMxiCcjsy7L/Du1Q/zBcoPgRXzto3lD143UEKlLTk/Fzi47/NAouLa9jwrnpu3sOJ+GeiwipcbUcyC54F7R8ACy1YDgGjpxdjQc1k2xN2UNlfg2FNgbtEfe9T3YZ+q9/Pn/BLZFUlae6aGBev3G3eAP6Mnw3YQnqaccivmGDXTfRsgcJZMWX4BfrJ9t1X8MiCA4DxUg4CZ1MOCgKoWTEaQg8CMYgIGBKhKEdruwoVpvJij+MwJBrLCouYnAOsZFK2/OlZO+/UaC6Ywl6pincq0XhUIzKH47ranfMH15lLCuT4Pyz6w7HzwOgZlNxm8F9X7CXs2LLBsNQDw3EQL6FBbjOlnWcM29TCL7HLDoDKFceG7Gr/lLOB3wg2wD6VulktzFnDMC/6dLXqP9FDSjf3bOaWncgovQ/FpJDsX5Yqv/X/DBDLNBOS9h0rPgog7lLsEADkYmBShcAeaiawRkCCw2xhEQwCz0zOQpg4IeO5APhlpruwOG7AMgII7I3Ee4MzXLo3OFR3NoaLyl8ogrutdSP8GUH0dVgIsDMoVX25jvmYVrw/fV6qzFTdVea+s/DWsAggKv7cWVTDzt2zdiS1YQNlqABjee5+UKwgzE0awEpaDssVslSCPALJzVTpQgQBzWIDY5qDSyvrwZtjGst8//2CCsfg219IrXx896g8WCDRDkIqG4KXcvHQb+CCgGUZem28ebFM5GOXpwYYCgWSZmNVnFAh/HAQTSF0mINwBAQK6YAgotfMN5FTfUXxL/fNJSsFMV+aKAQXvoGPlXYqPgbKXWvwSIGDBdSsVC+ZhrWEAIJRslzGBwutCJjKfm9AvQ/d9ZZ85x7WQDkM8fQgsoGw1ANx0800cACC1FoCBF2gVwp/F4UHXSNrkqwnDjpgGnuc75UPJn2EvIMiZxOvWXMwWfaokV1D+Scg1wur7LMD1+3MWINcGCOS9YwkLgHImYJUfIByUo5TLBAZjywSSZaOcCYwCNhnMTE9zd2CW/3QiLpDKOgEaBAWpAYIscyy+Bgjxm2fMmZMAwItPOBbXqwoEVyXmUv4SoCj50WHO6NocYq2841LZczD3duEzwafqjM1b7/37KgHUgRQk2Bd0mmaHwgLKVgPA1eOHilaek+pBYWalRP9OfH/gLKfnnYr38Bu5SAQDiXQBqFoECJhJZnhAsd+j47CthSZXUNG1SNB+ufh+v1go36au8uu19a9df9vzu8HfDjMFbgUeODEBUTIsmUALGss5CKwe5fuUM4Fp6PU6ulioJxmAnOuPaiCgPhDIRQRezXE5whCs/+9O7CPFUyrzAwUKBptr+YP9yuj/PHx97yD6Cre5TKBsbbfL7rHqYiWvCwEk/I3L3moHftCnwQLKAmQB5Cx3dxvHsTAFHJPPwJxTHCUEPsFZAEWZEQAJAKzPLBOQFpXiK194Adum4wM6zfRSxhobJAiwmCtLxJU9sr6+a/WpWHLAAhbEQwogUDpcF53sQAACbtlwIpiAGjfQFOMGVo/xYxlMT05CtzutZvulXRsXMGMIDCMQSk8zd3JSBVKMmuAfyym//Zui84CWUf9A+csoPg5Q/lKZx3kWfrbhoLh5iu9uu9+38DrmsCPIgcatFSk7HwoLdrzPCvbN70zokxk7OYEFkoVJAwLcgfqGLRA6N8+f533nusbXTsPf8kf720RQZqHwUvkzuaYmHpBBTLP+6YdexbZZBeNBb7h6ikLzLEYbigFQFQCklAQgYJQe8xmyQxAodQVYEImHwUzA7TNg3YEhaK4YhZ32WCZn+5naNAWd7pQKDmY9XS+Q2jEEJlMAEgj8acrzWgDw/o65gfOtsdwaxAAK21BxvMzKzwccDEpV3QcMVnY24DWs4nWVWe0KRS87ZX7QwmexiveZjWwUbp54FCyQLAgA8Iv8GeSst8yPZmsKyX+uR8znOlEK45wFZMTQZ+kG8A0OAsIdUPUF+KQVt868A7ahsOboxxi0OQsQlcGxpv7G4qu1UnzDADCfG7PS+jMfFMpiAiEI2MwA5h2GAhBYuecYYIvBpvWT0OlwEMg4CLCeDAyqqb/zgiFq6gbcackN/XfSgGUPPQ5U1optnEuht0QC4KjSwSoQcPe91+Dg97GKpfJDS15XusYADMyO+Y78oSD9BQsELgwAZOyPkQ4uya6+TimpHub7mPkM6rnwQ/ibGPG8iCsQMZkAAQC9zMYFlJUlp73gKzPbbKTgAaesvZex1nsYa4J0BeQS5Wk/CwKgXQEdW3OYQIH6h2DggQAMrhEwfQaIkx3QINBaMQa77L0cGmMENtwvmMAk/7MIEDDFQmbiz8wWDhUcfod+FkBA01zm7ttA2RygwNzj6LwES94SXKugXAPAZL4gUGn1Byh/maJXAgP614Oqz4MiAyh8NtM/m3hm6JNggWRBACAi7NfIaSXKp53Zsl4HDJb3GrK5x5ySUPiXhMGEZAGuK9DTTEABQ4O7Ahcdd+bdu8I2kn07j/03ytpXCVdAgACluTvANBNg1HcF8m3mgACA37oLSkCAVbMBz+c1gcFIBQZlTIAzAR4Y3HWfnWDZHg3o879LJhWeswBM1SI7/eYpFgkE5p/Rf+dBZyXWvpoBDPL/w+Nl+1XHAAYGAwuvhc2XMiZQdbzMmsuFlV+3DDiqrj8wZsBEHOAJsECyIACQxb3/I9yZRMEAwqGmGgS4/f/b+Vzr/A/hnQmSd8fcshoWwPpUxwMytS2SjjTaqwfJ2hO/wha0MKJKcHycx/6GX0bZ8D0qHsBBICOa9hPHBchdAS8WYN2B4Pdxh+qWNexwWQANg3CmZFgvtk5gGBrLxmDl7it5mpCnjofEmAKu3NzHknP+oUJnhp6fEWp9uTXznk0nNuFZznm4A1XC5gMIWwECbK7XBNa/bF1p8Utew4IPKX0dC9YAbhA2vzVmgi6PXKiCoAUBgAve+ZgNEWS/xyzVOWbwcviSDTA4cr7XS2+EL8aA10TifdIN4Ba0xx/YLrdePREXUHUCWYZPm+zee+626hlwwDu+dhtC+/iMtVPKkpwBuOk/bfVpYWFOUJCVuwRu4ZBXLBSCABZBgAQg0G5BPDoCQ5wNtEYTSDgIEDHjd0zlAqLoQj5QerEgAGCeOvvs2VOOspc9+AAlAFG2rffnnRFgUErL5yObBQJY/l3KvtN8gUCucTDwlIKNG9dwQFm6AmkD0tl5Meq5ZMEagiClVxPhBkgWkFs808iWA8JhXFGXzedaa9dixvPYr4gpTqJIA8qFqlgAX1iXqoKhVEbjj8nuu/3MNRdfvE1AYJ93fe2HXLveSjnxEEFB5Q4QxQak719MBZrfwssMWIBkxaBgIWvAivGAEATMCELZWiyWs/5CU3QbbkMy3ILGEAeBlgABTt4jphbCfBAoY9ilRTS2PYojob87yEpvBu0vu6nNBYEyKQUuV9Eq3gMl7wt/I/s3qjoX7Jeec1kZOBioj8fpo2EBZMEAIKb0+4Q/3ZimssoMgwE9XAna3RiOnu/1/v1jrRu5ofrHhCsX4QCAPabiAZIFiJiA3u8LxYhPYncf8uWDT792wfKjg2Tfd1/wWYrDX1AgEOepQeMSUNcNQJnGLICCHvNQGhT00oNQjAd4IKAXzx2IdMtx3Xa82QTk8YGIBwqjRsQXlN3JZbdy06+0dNJRIxUPsRcADN5SZc1K6fw8Kf1iSxnYVa3DYwXFd046wFl4b7jtuQFQIuIa8iFYYgygM/rDiGbTMhAoXQEwATvlx4t9BidtzjUv+mTjqwng6SIegELRjdJLFiDYANXugVC66GX7dna65Hkf+f0obAO5uX/7mzgIXMo0CFC3LDjTYwJ0UNACQVZRH1DIDkAFE8AgKOha3TAw6AQHYw0EHBBIEnOSwJlATOTpvGM5FpiAp5ZeebJ7HMAvWwaozscvoKKHFnM+ry09F957xeuq0o2Dag/cv5F3vyVuREjzC9/PQQX59mxeqfW5ZMEA4LyP7zbNAeA7JO1z688VNGXesF79ID/9+RezzaIuk/3knxKGP47EcFsOAjylLUHAuAJiXx7vC+sb/X2SRP91/Cd/sx8sshw2fnXabpLjKQz9lMr0YKJcAUr8YKADBKwkLlBeJcigUC7sZQcwf8DKegp4LkGkJyLRrkEUccsfqWm/YjH9F8qpzAwIqMk/Bthkz/2YQ+ZSeDZXtH+BmcF87rnyfXNZZihRdICBdH8u9gQl75Ui//ALMm34ggGAFEwviDIFANIVcIf1KjAQ7fPfsjmX/M7nsBvP9l6YUPx9xKP/IibAuvyaXPllYFCnB5kEAZGbjx/bo82fr/nkb/8BFll2O/W86SQbeR6DkRuoyAzIQiGSxwQqLL8HBp4bUMIEClkVdBTfAAEGSmOYAOYugYgN2CWSvQVFP0Gp/JIJoO1o5s1jiHn2zldHDB7owOctUNwy6l8mm6n0CPNnAlDxujk7DZW9L2BEpeedc6zC6rtMosAIgi/GPBawN7vq0K2uiF1QAMiS7hUxy+4yIACGBZgO1mr7JUd/k+2/Ode98Iyx++IIj2xScmvUN+4AV/guk4sCAjVuQDKBNN6J9pN/P+bDv/ry8f/6mxWwiLLH+Bn3Zdg6ksLwrVTWCCReiXAZCIRgQAtKD1AYLxCuXbegoIAuE8A8NkAiCwAuEKhFTWhqGYBta6iBoFRwDspcImzAuS2x+Ftq1e3nsXlcsyTWMSfAVb3O2fauxapZAysBAdGBZ+/VK2ErZUEBYO34Qb0I2dnCDQDOAJhYRADPDO1VQJDwqP77YTPl659u30QgfmaDktsFCCh3QLsE0hWg2j3gysbPczbAExKNk/o0u+7FH/zZS2B8fGHZjiP7vfvsm5E2j6Bs6D5qCoWySI8XwNIxAq4bYFr8F1kAKy8SCmMFlg24YBC4A+E8BM6YAjGXIRI1yMgAgp3sUAva/5z9YKuU0toKRiiXrVLgLbyW51fj4PeyQSehgq4jlFN+Z7tM2YGVv0YeY/ntMu3/ZXQP2EpZcKVIEP8tytIu4cpPpCtA8wYftrAHjn3+WrbZff4u+kLrj4jJoQ2K6wQIiOyAsPzUsgHFBETakPIUIUuFIjZWZ7Rx/jHRc/772Pf95BmwSLL3+Feuz6LkuRwEJqguGZYgkOXuQHmdAFpXgBWyAlULg0LBkAEDNzAYugWGCVgw0Mf0pJ/EmQBUTlEOYBkBeG2/K6R0nHx4oAQMNqfCb16C8zwXvG6+bIZVnGcl1y9T9vA6VUAh1wz8jIL7gnSrJwtZyF/dynGn3nzmLGm/KuV5aNZoyjp1bPIHSRSiyGIUaXh+zYPST157DG72vOdrXnvfHpBFl/cge1wmKtsinnYUVUOiyIVvE5nnVsUuhIgoZMofXL5wikBY+t8RST9+J2SXXz1+WAoLLDe97xWHEZy9Atl0m3CEIiSV90DEfQldi1m+lgE4pgNxOTMX+3ZKwXBbDwNQawRvrjkvncdyhXQaf8gxFbJYK4NCF2DqvC0sENQgomHAugboTW8FXuxAvTTYNuI9eQibVRpQ+kK2Ge/D8tdV7rvfwaxLvqP3OwTHiXvc2XePE/cc8ycSkcJyQMjEvBOjL8H9L7kAtkIWhRbHjH0oFiygLwKBIkiX6kAdqFF9ivI+Nu3Bu2ALZO2Xdr690aJ/26DRpXHK6aug/D20C+2Cyg70rDtg2IDw0f8mzRrf3DWNbjz23VeNv+ydP1jQqZf3ee+Xr+IsYA1lwz1ZMkxNDwHi1QTQ1GyjzwgkE2AlNQJQESSEYkzAcw3EXbkswHULsHgOnSnA9UNstsNGP1as7mHJMZiDmg/Q1q16X9nNYviikvfN53MqrsnmuCfm3BsLj0GFOwGOe2AQWe/TbKvjW3Ni5ZbKsW+5/TPdqHFKnzMAJkpTmzG3/pFiAroIhVuylCRw2DePx2tgC2R8nJHrb9l4Wp9l704xjagob+VMAOVCHRZAZWdSoucfQzHRp2AEIi3Bc4rI0t9xZnAFYfQHy4Ym//eL48dMwVbKzeMnvQigc2EEMzEhPU6lU80CFENRixOT0wvabRWdl1O3VLIA9Cce9ixGQBul1aBqkbUaZtthAG7QyVh++8zlYGJYQM4AjEV1WABAsO0cM4LOgaonEec66PjxoQa5M+zAPK9fxUxCFhNae3POtf7mdaH1N5N+FtgAFHHZsDrz/VwGkA69Ax926UdhK2TRAOBl77xtZadHft+JmjvTpgABUaMuSlE5CDRQznojXYEYbkta8CTuCtwFWyjHnTR5eI/1zuUuwZ5MugSZHPQi695J7grI0le+jXowDIIGAbsINyHjfCG7nrL0t1w7/kAoXcd/9zu4Gd+QJTCJGfaG4vs3fvmjr5yc675uet+rX0LY9LkEpiMBAsodyN0UCwIRFMDAuAUKBOYBALK3OkBh3nK3pFQGEDOwzUFNY1ALAExbMebTf9dKORph5wOwyoBFpS9VnOBYeOkysWDBgjUM2AZHeTYXBPRnhPftKr75DgUAcAHQOU7CbSgCQHjOFma5f0e+KepisuH3cAD4IGyFLBoACDnurbe/qkuTM9MGp95ivHpDjErjINAksgcY6LQ0B4Gfph145mWvwRnYQlnzyk07YUY/2aP0ZZmYbUyDAOj4gAACCQao1oh6GzUg8F+V2NlJBRhQAQbaGc7AzA7M5HnZn+jHMU3/6WufOvq3g+7rlvFXnwhs+myC08QFAeKAAEYQAAF6bKAyJkDcbfAtCDixAAhiAYYFUOYAACvSUaaVyTQH8VhAieJDCQAAlChNsO9K1ROJVS9gFccGfEbltYP7c88N+g4FpR8EAM7+IOUn+ntYBqC/kywxBQUA6cg4Hnjp+2ArZNFSY0IOHN39yw1G/1PGAnpqTD/rp7p4Rw3oYSor8JQ4YRecfDrb4lr+tWcvW3/xOStObED0dwlr3hClPNrY5wHIPvfDew3I+JqKJU3UkpmFH8tE1L7J42Ntrg/50mfDHBKG+DLCQxdqSWGM+y3LoyxecVgvWfbjF79lcAxhr/Ezz6E48hoeE6AyRWiHEecVg6Z8OM8IMBjcWxCgUC5clhq0a3TovfsEa+WFcDEvcaw96qyAjQ3A1gub7wtz4Jn7TQYQ9A2yeX/I3JcN72ng+ZLXeb+/Ocb895etvTiAd4zCVsqiAsD4OFKeB3hlkmUbSa/Pg3WZrN9Xg3kUKIDu+8cDX8+/N+6fe/BWgICQi7+6/AfRzNjj2qxxSoO17iZpUwNBUwGAXettDgZZKoCh4YCBAgAm10PcUKol44AgFsqBgHEggGin5SwZ/cBc97TP+BlnMRx6HWUjVACNLBv2QMAtDEI/WDgIAKqCgm5gkAXb1pIHQOA9qFj+mrIooGuZvWcbK7bL9sskvC8XBGAzro3zwwxvv+T+BuY/twANWcm2XTMoTf15rppgeDKsvlWyqAAg5JxPr74pYex1ST9jpMtBQCu+GtWnFuj3TabguL2xe+HWNvlYuxZ7F3119HMros4BbUje0aDtOyKu7KTfkkDA+FopvwMIaVMumV4EEGQGDFLDClp6PaSBYJT/EZYdBvOYvHTv8bPOYGzotRQ0E5Ag4GYHSkYNpiorQNOKakGZKWAV2QAoVg6GvQXLtgs5eSzqckh7PZmHMrCK7fm8f0sN+gIRgbmvg3OzgVDhq67vlQo7yp8zgS12mY0sOgAIueCzu309ZtkXIq7kEgC62vp3zXZqu/3QPn3h5OzU99d8dnKrixy+/OVVkxefO/LRZWRo/xZrn9TImj+P+y0mgaCnFirAIOWK7WwzAQJ8OxPHxTrT23LuQzUBKghuw7cpHSHzfbb2fv+ZZwKOvprBSCaZQGaKhSLrDriWn1pGkAOBr/wwv2IhQz29ocTijoIHsowFAEJxnAH46y0wgJXC3CBf1WtgC689n3MVoObFEgexGyg/Z5W37HNZqNj+C1z67wRogZKNsJWyTQBACL17/VublP5nzBUfpfJndlivGtqrFw4S3Ad+GiXZ/77wc/c+ERZAzjkHO2vPa5xzyXlDT+auweObWevjjX77pogrN+m2AbuCGXCF7qkl63ElF8reb0tAUGvNBFK1zeQyJNyEq7lfPO9Hcq/xL32Z4vArGBtOFQiImETkxQQUG3C7DIM/eKi0jwArjw94w4chcAMgYAAAPvWH4GEMQcA9XiVloDLHay0IDJCFsuhlnz/oc9g8v+uga1SdL/fzIVd6Cn62Jr4PtlIWErvnlONft3FFBrM/7hLyqIxnA1iConYYUCwyG6C61YAsVWciQt+NEP8FrvnhZ9auPSaDBRWGL3wZPI6m6ZE8AvEMzj0OoZgNyykOuT4zPTae6Wi6+bvLMtk4gjiOxcjayZj1/mrt50avh82U29/3+hdndOq8iE0lKLMDfZ0ZKEkRxn5tgDnuZQDczIBMd4ITdQ4iSiYlaDoB21oABqVdaUulJFg4V/RfbjvKXWpI3evOAwhgfi+Z12urKhUrsxkYkKJB54Jjpfl+d5uB165NkiLz9wIx8o4vY4fgQd/6GWyFbFMAEPKSN962Z9qPftQluF8WKxAQAACiNFbUBthUF9MgwCAi6TUkJa+76NTdfgeLJGvWsAZXwkf1I3g8/50PosgO5If34snAPXiwdVQ20RJztMt6ecLiJPqfKMZ/vOQM/CVsodwy/rqjkc5cSGCqhaSrUoRR5oAAOAVDqLfRSQ9C3tGnLB3oAoBZW0tSBgDirhy/07VGtqgGoFT5Q8WwL8NyZQouk1PrQOkXSrkHvg4H3A+Uf68qMLDnsVr5Byo++H8vFwTs34ufFMFtGNsdH3nJnbAVss0BQMgJr7pr3y6hP+wh2TdrEGDa+oviIJkXV1WCig1oECCYiSLif8Nm/MG1p6y+F7aZMDz0UGguXw7DSdIZzpJWzJMWE5ddiFtNv4Tcctprn01Y598Rp4YJchCI+goERK1AzIoVgrG/bwb1eUzAAwHmPHBGoZkPAAYELNWcB78uKAhCucWvej1UbG+h8m/u67FiJ1R2e6xEocNzIRiU7c8HBML8P5pBGgYARBFQaxbu7o/hYVdv1XiW7QIAQtacfPteSPG7PcRHUM4AZPIv1s0pEqYYgHzAqQYBkIyAe8oTEdIv9FL83CXv2mer0G+pyC3jb3g6ZrOXEpxcRrDDFdsZQCSsvgYCDKoGzRD/SiYgHyjmr6WBZeUg4Cq/F3gCX6nDzVAZ3O3NAQAPPKpeM0C2CDBw7nspqwasBIBA2WEO5S8AQYn1R/13EtzfVgG2b8BHfX+r+wJuNwAQctzJt+/MA12XcBB4WhYZEBBsgNnOtWDWaFwCqgE16xLGvsFjBGf3f/XLHy98jGDbyi3vef2TELtXEjaxMyGaCZSAQAgEpe6AxwQCBiD/4sbXD3x/N99cJeETM8g/dl9fRf3Dc2Xnq44NkrleX5XXD7+H+9qy7zaoAtC8FoNjJeOwchAIAMAWcui1AYB0+Nv4mO/Ou8lulWxXABBy4onrOJdpfD5FfCUPhlsmAFL5ad7CWrsDqnxXMwJQpbw87nUrUnopd82vxCy55mvjB0zAA1DufP+bD0r7k98jMLGHBAEZGEz9mEAJG/BAwAMAVmQCBgDAVXgKhWKTsihgmVLY4+g/5B4YBPtQ8bqyz5nP8S16LVYATcX3Kt2vOFfJBqDE4kMRoEPrb9I4tidkLIYC/z989BXvhq2U7Q4ARo59xV2vTGn22ZTAEBVAoJmADQbqEX1qQA/TtfyqPl+seSTBAIJoGPZbDgi/ZIjXR5TeyF2NOwi27s6SDZO9TXv04Sl79tYeg0uSMdw1/qb9+tnU93lgcH9CZjUIZHqBUpfAjQeYtQRQLxjI8ofOzTHZwF+4X3JzJiofKvIgC+nuu8fsNhaPl+3PdRzm8/r5MI1BAFDyvcrOhefLlL/S8oP+W2mr77IAAdRi9uyswXeXrcHHfvsbsJWyZABAyAkn3PGIPqHn9gCflEViKiuQ2QGr+JFWejmwR4OAfLjFyD6qv4wBBrESPyLm55ierpSH3BnGP+Ka9M6LPnDgr2GJyS3jb9+dZBu/izD5aIIcBKKekx2gFggwLmEBMijICs1/oEAvAfzxvgH9N7GCUMpYQPjQu68rtaLOxbDi2mX7cx2HQa+XXxgGgwBWf7/CPhYtvTlXOA+Dld/8TbzAX2D9bbAWZc0K9Jbvj0++5C+wlbKkAEDIwQdfmzzskavfzEObp/WRDVMZ1GJ2MUCAaHSZ2h9Lxgc81NQMQawdWst4BA3FEpEpDjOHrv3AI34BS0xueOcbVo4m6WXIJp9CcEZnB9IABJSye5kBFwAicPp/OAzAKDYGyg9l9L8sEAgwd2AMqpUfnZ25lH6uJxQHnWD5ei6fv3A9HPA9sAIUoKj8BWCAOag/FJUfnCHbVI4CvAse+73dEbe+HGqbVQLOV37xiyf2Lzxvj4+2ER7ZouTCBqcEhCfnoSeWGFifL3xNxVpU0fUT2e3HLKq8NpFrNYFnrPrzMbVkomsvXzMQ+80RwOanYQnKI/71C/c3yOq/Yzj2H1SMO8j0SMLUbTkOqkIwzXsKunMQ2tHM4dgAr1IQwZYJFzoMm+1gAQS/es15T3jMlbLjcz3CW3Q+tPa4Be8v2Wcl22zQ+6D8+mzQeVYMzDpegBrdSf57IZS/4o6Xlhz/8jsOzlIy3gd8LmcDSHUwkNl4gHELDG3yYwP5r6fAWj4WEbf+ccKtZSwq+7JG3Njpa+Mrl2TgcN34ia1mNnQeg4kXEZzOA4NxZpkARmGGgDkz/piF5WzAazIhxF3Px/o76zIrH1pB7z04+JoD941il71ogJWvuqZ732XHcK59LLKiMotftl3JABzrL9eZT/+F/98ffSM+6fLPwwLIkmMAoVxw7u6/uOhrux2VIDy+kUXnNvrRLOEMgHQ57+3xlEGvwVmBGt7L5NKUg3lY1rQj/MTgHbNvtmUlFZULoZOdBixR2Xf8nM4fol2Oo7j8bMpGwPYUEOMHUmL7CXiMIOgl4E1SWjZisGDxg20AHxus9UOYVwtsmONYuO3to/NZVVZdH98SthBacAz2oWof/ffjHNafzXVTjjvmZWcAbPmvBABRJdf+D1ggQXiAyXHHTezMMDs+A3xJhvRJ3CVCESyUtfs67cVsTEBtY/B3EwyARAlEsYgF4B/WfqT1CID5D+jZHsLjl3jH+Bs+CnT6bQSnQHYXivzxAxjn5cMYZAVQ/zamoMrolWJK8hPytfxfsyb7H4NySx+sC6kxc6zk/TDHdqmFhvk9tVh1sIQpYLAxH8vvvq80HgLlx9x9L+gHJdbfILYGANEHMBv9Exz83YctlAuw1VMLbWu58MIxUYL7WbGccMLsvr2s9zzu/x5BCf4NB8hR6pVVGhDQb9Z/SBSKDyIWQFjUIP+y1JVfiB5xeOpt73nDBh7q/CDQKf2tTCWoDoCqV8ttop8bj1mK34dphTS/FQvW+hoSBozOGAVwX+vdIIDn2xdeiwM+y3lTeLzsdVVeAFS9z73hss/AOUClEqGg8o2V34/lx5l7CYcByNsNg3/8oMyPR5ctlPLbj94RRAzmiaKZxzACT8qQPIYfejj/lR7Kl134b9ewD6BABMEAErwLGvjWSz6PW9VXfXvIHe855bUAk59HnIxyJpBXDZqYgF2bjIATB7DbTnVgPq7H9f39OIAxhmbfs46l1g6rLSI4rwktc9mTWfW0Vj7FCJUjCjHYcPcRBhwbxBIABlp/d9v97b3Un6n6yyB3CcCU//LtFX+DT/7GT2CBZIcBgCoRwNBqwfJer7cS4sYIZmmSETazYiS57owzcKtbKm0vueW0Nx4XselzuDvQIKSjRxKmshOyO5zYpASJrgxExw1wg4JorJADAp6yg+s2gK8QlQ86Vhx33gvOce/zKvbnfQznPo/h+UFgEJwbBABm7b2X+coPZYE/s9bKD9SupO+fjd4ETz5kf8Txre4F6HzDWh6ocuv4Kc+JspmLESaHSdTxS4djhwkQNyvAClmBUiYQAAIGDziWWTR3v4oV2O0Byr9FIIDVry28p+yzQ8DA8vObDQgs38fguP3NqT5XZv2Zzv03VfnvUy7b6vJfV5Z8FqCWannI+GevZNHwEQyWbRCtymytAKeLWYqF2Ye8bIDIHNA8M2AzBNwfNoMEVX0A2mcRnIUFwetC3YB7ztvW58NzUPbakveCe41Qq0reawWDa5Sdq5KQKpS83v3O3jr4POacNBF+gJzqm8i/mbZN5f1FtooCa50DCyw1ADzAZY/xz1xDo6HDOQjcJRqYKhAQU5RHTttxBQJK4XXK0Ci9TQ+iDTqbwDMLFL9sP1d6cTfogwFAoPgwWOnddbgt31/iz1cpvAcaLnCEn4HBdggormJj+edU0g5Wcj+Owpu1OW7H+9P8d9WpP5Y1foB/vfZPsMBSA8AOIHuOf/pXGWs+neGyv1CqqwbT2Os67E5RzpwW5CEDYPrBs/UCUtExZwSulXerAstqBqzy4GaCgKOIrESBy6QUCLD6uKvoZUpc1h0Zqq7Fivdir1HyHns+tP7a6hu/36b+GtxbaH4OFkFqANhB5CEf/OyNKRl7GoOxX0sQoKIgKskLhuSST0LiWn67zdBJPWNu8Z39fA0BC6haBrgDpWBQojRsjn0rFW4BQLUSmveB+/nhPZRdy31dFTgEBwtt1xxaRd2Un17EyD+e+mNZ6wZ46qOuhEWQGgB2INlr/KN3tKNdD2W44keUjsi5DeR4Ce0OMN1x2J2FiLnugAEEZxsolCr8YBAI/Hxadl7cMUJxnAEUgQLAP+7uD4oDFF5f8royFhCCQwhSMEDh2Rxru82c+2SO9TcggGrcv6hgzdofWcjIvys1AOxgsmJ8fONqsvIIgJ0upmxUgoCa9UgNJGKF6cggZwROuXCu6Ogs4AGCGwNgniIDlFp4q/gMygcPwYD3io0QLLD4vlBYCd13Lbir1AVWUAYWJSDlrr3PZs45liu7a/nDQT/5gB/p+9Ns6Mboj8sXrVYFoZYdUtj4OLmTbvo4sk1vFqXDaNqM6TShSg0yZw0l6UGmMlv6uR+4hnzfS4UhQKEeoHDe2ffW2r/e7AIhHPC6smthMZ1XuB8s3l/hNe45FhxjzjqkRsbvArBpPyrafg/xbM6K4+JnXvB1WCSpAWAHl7vG33IKZJOfRJyIFAj01FTpkZqmXDZatV2XoGTcAIAtFJqH8qOn0Di3wpcCQJkCQrniuTsDwQHL3+dds+Q1m3MvlSDgrMsAwKZdQDEWUfIrqf/Yz8h/PeYpOL449N+71Vp2XLl7/O1Hs2zT+RwEhlG3GUOPCVB+zGcCUjecykGzL8RVdtfqo1Z4a0TDBWB+DAFgHgqH1U8vQvFNAxW/5DgOeN18QMBjAK5/QsEbpu7lXFFb/wZ3x0Zo1ht+anLkhT+FRZQaAB4kcuf4259MsqlLATbtKkGAMwEkqVL+iOo2a5C7BaUuAZQygIL1LwMBu48lABDsl22Du12i/Bi+EMqf7rkq/so+Y7NBwAkIYEmAIxzpZwkB0YG/NvSzZWc2nv31k2GRpQ4CPkhk9fhHfwaN4b+hsNMfmKwVaOYFQzI4SJwUIQZZAcw7UzkGy41lucf8zAFCYf7BuRYIjwXXACgG/cLqQih5L2Ax0FcVaISSezGfY9c44J7dY0Gwz1b5gbMQS/2zbOSOpL/iHbANpGYADzKZGB/feSa7nzOBiacQMg1qXkLBBDIdGwgDgw4bKDAB3Z7dUP8SdlBq1QfuI+S9A8waKizvAIpfOAY+1Q/PzzUwaSArYAO2Q3QIERQcv19Sf9bLRp/Xeu5XL4dtIDUAPAjl9vHxoSjb+DWEjUcjahDgGQLUE5F4GQJSBAJL/d3tCuUvuAJWgbAaDMJjAEWQgOC4uzOXexC+p1LhK87bc6waCMLAH7g0yZmHQVh+lkf9+9nY6Y3nnv9a2EZSuwAPQtljfHzmhmj5GkpWfImxMU7rW7J8WDVRVeXDLA3dAdRVg5j3qXDLhZ3+FWCLiML6AMybkFbRf+eavgsg7hyLVD8sIgIIXIF5vKdA3UvOh2v7upLjNqfPiotp7yWuLcb4y3w/V/60Bf3+6O8SOvQW2IZSM4AHsQgbdc973/ZuYJvehzCFSDrcqve1K5CpzIDHBqA8MEhgfrUCZdZe7mu679Jsc44E7/G2yyz+IBZQcb7M2gMMZgbWuoPPCOy6IjjgdvkVvewk9W9Bmo5N0nTokOYLzr4BtqHUAFAL3HXa216NbOqLCBNxKQhYtwDyZiJhulArsQUDccrGBpg8ODAmUFDukvNlADFIsc0BtytQARgqXIO5toNOSaU0AV1fXx93033MlPqO0JSNrGk+/+xLYBtLDQC1SBG1ApBN8bjAxJAEAVRVgzI9KOsEaK74JkCoFd4NDLpxgc2LCZRsl1UQlp1zxVPWkse7ytoDDLb4hW0HADx/36wdBuD199euhZzfT5RoD0MvG3tv+wVnvx+2g9QAUIuV+9//zqdk/alv8wzBKsRZnSHIZHDQA4HI7yrkgcB8AoOlyh7sh+dcxS9lAFBU+HmDQcX2QHAJAMAe04oOwbaN9qO2/AlQOgRptvyrjReceaJu+rrNpQ4C1mJl5Wn/+lOMVj6VwYobGR2RwUEmZlKSDSkiGSCU9QKpCRKSvE4gQzu0GJxRhd7gIbeWwA30UQRvViIbKMT8nF3c14cLVCxYdMvBOecF/cquieXBSjfgZ3v3B9tmWK9s6mkCfqJfA4/4p8u+f0u7ffL2Un4hNQOopSATH/rQys7shrXINh0GcjaiLjegqlZAsgExfiBgAyoWELACc0xc1A0UAvhMYC42MNAVAOeCLH/jnK4Bm/t13v6ggJ9ZO9tesI+AzfVL2t+GHl32kxbs+Ww8ZnwKtqPUAFBLqVw3Pt5YRbsfRzbxjzxAaDMEaFwCoscP6BJikKAAQedhyBW9rJQYAhCYEwgA5l1KDMFx98S8ld7dL/P5QSk6BlQfAn/f8fkzUeZLl/1vZ3boiBUnfXojbGepAaCWgXLv+HuOx3T6SwCbRgH1QCLs68yAWSqKhqziO6MJy1KGAAOsPRvMAEC/x+2+ay46kAVUbFceY9XWn4VryC2/jfYnkAmfn45dM9ttH7UUlF9IDQC1zCn3fuADB2J38gKAyScgzMjeApINYJaDgHAF0AGCKKwV8IcUl2YLAOZgAzgABILXw6DjGDz5AXhAVYqvZNtigav8qGMUqsJPxFEyKqP9Vw6xoWPwZR+fhiUiNQDUMi9hb/xs8/7l974f2ORbEaYixI7MEsjYABnMBsABgDLFD49JKQOAymOaAXjbFZQ/3C61/mFMrmTfo/wQBAv1wB4xJX3W4FZ/BFI2eubQbPcN+JozltRkNDUA1LJZsv5dH3wqI1NnA514GOAMEOyqYcU6LoCoG43YGoGgitDtMlQysCgHApw/CFTtl63D7cpjVVYfcmtvTjF9AWP1Gc+WcJ9fNGZN07E0heF3DJ/06U9hEUm2u9QAUMtmixhM1E7pOLDpN3O3IFZsoC8XMbtNgQ0gC6oHw0Yjc4CA9e/nCQoA8wQAnQnw/HtXKui+e8pYfTuoh6dLJeVvC3//bspaLxl51Sd/CEtUagCoZYtlw3ve/3hkvS9QNvEUBO7WSpegrxgBhi4B1VY/YAOljUaKLcjmjg0ELgBAOSCE266E1N8W9Lj7ECg/scovrH4mIv082JfRsR/MRI2Xr3rlR++AJSw1ANSyVSKaj27MyInAZj7E4wO7ikwBookNZE6gkNnp2nNmAF7aUCk8K48NABSBYD70v0rx5fYgRs68ld32CoSM4kdc4UVlX4uvR2YoG3738N3Dn1nMXn4LJTUA1LIgsv7DH15GZjrvhGzmFAZTbekWcCAACwQOI9AuAbjjCRy3wLKAMGAIUA4CpS6AKfQJC3hgAN3X7oB7SK4xXzvpPcbXku6zhizrzdjIVZSOvXbsH8f/CA8QqQGglgWVDe/64N7c+r8X2fQJDKZlfACsW6CAAAjN4wIFAGBe6hAK7kEIBKzCFYB50v8y2o/+Kaegh0mLzxVfRPhFVZ/opcBG7khx+J/H3vDB87dnWe+WSA0AtSyKTHzgIwey3uy7gc4cCxwIADrSLQAHCAQzsG6BAwjF4qEKIHBBAKDaDXDXnrDiCc/qo67qJXp+RB7dZ5FSfNYUdH+SwfCnOt2xj696xzsm4QEoNQDUsqiyafyTD8V08m3IOidQmBpC6CpGgAoIFBvIcrcAi6wg7z0IOSAAFMEAoJwBhNsFcS2+sfRG8Q3Vj/k6UYrPhqcQh740PTP08V3f9a674QEsNQDUsk1k8p2fXcXiqVcTNnsypdN7C0YAJlgogUCzAqRa8ZkTEGS+i+Bafygesy6Cu64UPeWZWINpYaYsvqD5TCq+WNo8zT98ZwbNLyFEXxx72/h9sANIDQC1bFPhWYN4hraeTWnvREZnj0KYbQJyVgCqtBgwLyiSNQWYs4I8PciK6ULIYwEeABgJDjKWIwTTdF/Qe2XxI6X00OQg0KYMWz9CbJ453FpxCZ5yShd2IKkBoJbtJtw92ClOe//AoPciYJ3D+NLk27KWQGYPLAioteDoWAIGQjCg/vbB9p5w1C6+Si9Ivx50Kg+M0jf4fpNRbP2Wb1+UJMMXtk89dR3soFIDQC1LQjaMf2p5k/afQbPeEdwtOAxodz+GXRTMAEC7Cag6bBg3wQCCWusLGSCQ8T3XD3CVnyjF50oPoJSeW/tpxOS/GGt8N4vjK5a9851/ggeB1ABQy5ITocKz7/rEnlw//wpo50mcDTyBO+MHMdbflQcQuSbzbAJQCwiSJch30uCJdiqMQFl5QJ6QgDhlGP8ZWPRrgo2fpSz66ehOQ7/Y0ej9fKQGgFoeECLt+vhZK2azqQOiKH0Iy9K9eLxgF8bYKh6uW8HPD3Mg4Pydazo/wB13EVSY5tvrEcg9/PDdHABuYoStG6YrbsTx18xALbXUUksttdRSSy211FJLLbXUUksttdRSSy211FJLLbXUUksttdRSSy211FJLLbXUUksttdRSSy211FJLLbXUUksttdRSSy211FJLLbXUUssSlP8P5ZJtGWX8nM8AAAAASUVORK5CYII="
+from __future__ import annotations
+
+import base64
+import hashlib
+from functools import cache
+from pathlib import Path
+
+from mcp.types import Icon
+
+from .icon_variants import resize_png
+
+ICONS_DIR = Path(__file__).parent / "assets" / "icons"
+
+# Asset names are the PNG file stems in ICONS_DIR
+ICON_NAMES = ("waving_hand", "sun_behind_cloud", "robot", "hourglass", "package", "abacus")
+
+# Advertised sizes (px); the source PNGs are SOURCE_SIZE square
+ICON_SIZES = (16, 32, 64, 256)
+SOURCE_SIZE = 256
+
+# Sizes listed while icons are inlined as data URIs
+INLINE_SIZES = ICON_SIZES[:1]
+
+# Legacy constant names, e.g. WAVING_HAND_ICON -> "waving_hand"
+_LEGACY_NAMES = {f"{name.upper()}_ICON": name for name in ICON_NAMES}
+
+# Every Icon handed to a tool registration, so URL mode can re-point them,
+# plus those whose src has not been filled in yet.
+_issued_icons: list[tuple[str, int, Icon]] = []
+_unresolved_icons: list[tuple[str, int, Icon]] = []
+_icon_base_url: str | None = None
+
+# Issued icons only listed when served by URL (by id; _issued_icons keeps them alive)
+_url_only_icons: set[int] = set()
+
+
+def _icon_path(name: str, size: int) -> Path:
+    if size == SOURCE_SIZE:
+        return ICONS_DIR / f"{name}.png"
+    return ICONS_DIR / f"{name}-{size}.png"
+
+
+@cache
+def icon_bytes(name: str, size: int = SOURCE_SIZE) -> bytes:
+    """Raw PNG bytes for an icon asset at one of ICON_SIZES."""
+    if size not in ICON_SIZES:
+        raise ValueError(f"Unsupported icon size: {size}")
+    path = _icon_path(name, size)
+    if not path.exists():
+        # Variant not built ahead of time - generate it from the source once
+        return resize_png(icon_bytes(name), size)
+    return path.read_bytes()
+
+
+@cache
+def icon_digest(name: str, size: int = SOURCE_SIZE) -> str:
+    """SHA-256 of the PNG, used for content-hashed URLs and strong ETags."""
+    return hashlib.sha256(icon_bytes(name, size)).hexdigest()
+
+
+@cache
+def icon_data_uri(name: str, size: int = SOURCE_SIZE) -> str:
+    """Inline ``data:`` URI for an icon asset (encoded once, then cached)."""
+    return "data:image/png;base64," + base64.b64encode(icon_bytes(name, size)).decode("ascii")
+
+
+def icon_filename(name: str, size: int = SOURCE_SIZE) -> str:
+    """Content-hashed file name, e.g. ``robot-32.1a2b3c4d5e6f.png``."""
+    return f"{name}-{size}.{icon_digest(name, size)[:12]}.png"
+
+
+def icon_src(name: str, size: int = SOURCE_SIZE) -> str:
+    """Icon URL when serving over HTTP, otherwise the inline data URI."""
+    if _icon_base_url is None:
+        return icon_data_uri(name, size)
+    return f"{_icon_base_url}/{icon_filename(name, size)}"
+
+
+def tool_icons(name: str) -> list[Icon]:
+    """Icon entries for a tool registration, one per size in ICON_SIZES.
+
+    The ``src`` is left empty until ``resolve_icons()`` runs. List them
+    through ``advertised_icons()``, which drops the sizes not sent inline.
+    """
+    icons = []
+    for size in ICON_SIZES:
+        icon = Icon(src="", mimeType="image/png", sizes=[f"{size}x{size}"])
+        _issued_icons.append((name, size, icon))
+        _unresolved_icons.append((name, size, icon))
+        if size not in INLINE_SIZES:
+            _url_only_icons.add(id(icon))
+        icons.append(icon)
+    return icons
+
+
+def advertised_icons(icons: list[Icon] | None) -> list[Icon] | None:
+    """The icons to list for a tool: every size by URL, only INLINE_SIZES inline."""
+    if icons is None or _icon_base_url is not None:
+        return icons
+    return [icon for icon in icons if id(icon) not in _url_only_icons]
+
+
+def resolve_icons() -> None:
+    """Fill in ``src`` for icons issued since the last call (no-op when none are).
+
+    Inline, only the listed sizes are encoded; ``use_icon_urls()`` fills in the rest.
+    """
+    while _unresolved_icons:
+        name, size, icon = _unresolved_icons.pop()
+        if _icon_base_url is not None or size in INLINE_SIZES:
+            icon.src = icon_src(name, size)
 
-# sun_behind_cloud icon (256x256 PNG)
-SUN_BEHIND_CLOUD_ICON = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAACXBIWXMAAAsTAAALEwEAmpwYAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAH2mSURBVHgB7b0JoC5ZVR76rfr/c+7YE9003c3QIIMMKiKToKAg3dLd8uCFgCaaOIvPiC+JgiigjTEmwSEhzzglikYTFZ8iNDYyIzHqMwZknlVmBBp6uPeee875/1pvV9Ue1lp71X9uc//bfW5T697/VNWea9f+vrX2ULuASSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkLyFMckaFr33a5ic3P/mo+ax9BGH3wTPCFzfER+dNs9s0dHM4fgKYvZk35q/e+NTXvIWuvbbFJJPcRjIRwBkQZtBHfupRV1K7+60z4qvmzeL8ecMI55g3Ae7h1xAhEEA4NqAmONAMTBufIMx/B7P5f6Hvfd27MMkkZ1gmAliz/O0LHvU1zLsvnNPOIwLwMacWHfjnPegRjtQTwCz8oUACAf3BoxmONBABaM7gzVdj49CP0He98i2YZJIzJBMBrEk+cO2jL25550Vz7HzjnHZp3gTgB40/64691g/Ap3QMmr+7SMBvOtCTIAAajryxADb+PXD4WnrGdScwySRrlokA1iDv+Vdf9cXYOfHHc5y857xZBuAvkUz+DvCZANKvN/tpAH6TLABDAJ0bul+4bjffBT7wTfSM69+OSSZZozSY5LTkbdd+9Rfx9vHXz9oT92ywA+LdwKrL8GvDj4PZ34Yf9+fdr5eOdnvAx/N0kq4beR7GBGe7D8R8+0/5V6+6EpNMskaZCOA05D3/7qvOme8ev65pT14WRvgD+BPwA2i5G8zvjohEEBU7EuaT8WWIwCME6hJZnAvauY5ffM3TMMkka5KJAE5D2lu2f6Fptx7YdOCPwE+aP/067Z96WhT/KfB3wvE8g59FLok1OhJYboJP/jd+8ROvxiSTrEEmAvg85Z3Pf/i3Ncutb5kF8DfC5O9+6V8PZR5+GeTyR1LTZzPAdA8iGSQSaJYbwOJ3+b98wyMwySSnKRMBfB7ynuc99l6zxfZ/IN7p+/tNAH+TtX5U1hG3zEb/kyGB9FNWQB+zzjgHXx7FbOdl/OKn3BOTTHIaMhHArZQ3XPu1c7THfoP45HkNFkN/H3KQr/T3WZAAS6D3Pxp+lZjuQZYYMbELLS4BTryCf+GaCzDJJJ+nzHEHFv7lh27cdPORu80O8KHlNm2dd5eDn6J/+urjOA25bHHLTxCfeAz14F+W/j4xhBHfY7Vf7RddOPYFmMiZexUuvclAxQDI3QA5XtBddsSzeBAO4Q/5uiddRU+a1glMcuvlDrUO4G+v/drzNzZOXhnm4Z8wa/hhwTT/4o2GDzdxAQ5Rsxtg+a6GZv9fmKF/40k+8qrz/uWrPnuq6b/3uQ/9PmqP/3zDO9QTALV5oK/D7KzX/HGlXzjOw0m31HcWl/x2q//mYe6fZk2Z/7frAPIUYHKj4teL7DoEaTuymP8pZkeeQt/6hzdgkkluhdwhCKBbiHOQd34oAP+b5rQ42i3GGRbhpHX3AyDT2vsBTLOgbOc73Gy8oW2b/37s5ObL7vSc197kpc8vedrsvW/74As22hM/Ct6mTvN303xNNMebaPbPInhTXvOQT5MW/kRCqAkgLQYSYG8E6EkMFsqZAhJdiM4qWM7eH66fTN/12nfvVV9dqT/1r7/u4vn85Jcx8X1maC+bNc0lgTRPBnL8DPHszTub8z879/tfNxHKHVzOagL4dJiHv3lr9wUNdp45p+15Wnff4WtYiRe1sVx9lwkgASuc8wyLxexkoI1Xbi/4DVuL5i9p3n5muWzO393Z/orlcue7qT35cIRBP7SL2NePo/6EfOytjC7FmN9MgH9YEdgRwiz8EjOJ36wRgIdjAcCxAuJ5PzwQ/ixxHAt6IRaz38A/e92HiYahSL72gZufPnDRgxjbj2q4fXRD7VcF4ro81FefYtPX1VBu6kmyI6X5kmj218Hn9wJt/Q59/+s/hEnucHLWEsD7rn30Y6k98etz2rlXt/R21oO/DTji4YUbKstve/M72+iCALImRa9NOSj23SVjEbrX2+G4XLZYBsC37S7a5SJgbND8zG3siw8d8sYo7rTeP5FOJoNm6BI0FvSzaAnMYrkaOR0oSYF0ueW4QFemZSjfYhF+LbcL+txiwR/dbXFeuI9LQ5k321D+huJaBSqGRwL/8PNeTtoIgx0brwTNf46e8bo3YJI7jJyVBPCeH3vkt4eBuF/awM7mrF9737pr7xsaQNf9lPa3/er+Dfw4Yb/oQN+GQ/gtu+MyHJcBW8tABG3/62f5W+RR/06GMYZh4K+QQDMMBEbzvy9LRp4Ev+kOKK0vAN8/rQZqtWCSUK7+twjDHItgqSxCmcO97AZOWLbcD0JyIq0M+gj8/nzorgwsNhPjETNBmvOODF6D9sCz6Htf9VZMctbLWUcA73zew39wxid+Omj+/o27XvP3wOc8+JbN/h5wg8alRjZo058e5unisUMMI+jQngA64O9EAlhGAmh7QLX9HGrLnHGaCCCRT2/692TQiLJQLIsggPRK8EyMB4B0FwDQ54kI0qxA3wVYDgSwux0JYNkZAz0BtJwIKyVDg9GRuihpsCS/nRivm6aQAGL98Tz0g+Y/i+WNz6dn/O9dTHLWyllFAO/8sYd/e7M48auhv0+zzuzvzf2o+WNbnSfzu0mj70Ofm2bGAoAEUyeMHiU9CXTmdND0bduDZyeAKpHBsh0sAU6WQFzok8ftQj7NwQ3QoXk4hgG/jZD3RjhuDmUYsETDeSafpj9v+tW+TT/DR8vgtwiu4YelIAC1glB0AXoLoOvD7Ay/0BXoytsRAHcEkMLlcQr0RDQMWDaFlCQ5qa6A6I4gWgO8+SbwoafTd7/87zHJWSlnDQG8+/mP+pp2eezVc5zcnNGi7+83FN+1F/3YZHqXKbhk2pqG3IkkgLReNxFAOxAC9yAKpnSnUcM4wCKSAHe/EJ8PbYKPbqI5ZxN0ZCOAvsmYaahYB03GLWNYEVgMkCFMMelJaPkerh0h7Ibz7XAelDuFX5iFhBoDWHakFRyXuz0B8G43brHEbjT/h4y4LxhR6R6tBr+0AMjUH/WDp8EaeC8ObDyBvuWVH8UkZ52cFQTwF9c+8txzd3fe1vCxy7t19900Xwf+NNU377UY1GDbQASzMvXXCBNXmdTQZjQPK/sSAXSadRm1/25HBhvAzpFNLM/dBI5uxL08wjRgT0gYlgTHdQH5iBFrPp4kAkjX/SH39dGTAEcy4PQ+YWcVnAhn3bKm40Hz7yxFFyAQQCCCYdyCu0nLnGkTATzvB/xmcTsy0xVR5r+4Tto/D6I2w4/n78fy0GMmS+Dsk7NiJeA5i+Wzebl1ebCLQxscRuLtyrtoUCOvs2OK2lWa+oLvyHAflQG9skR3WJXXHpzj+KGD2D5njnYzTZu1fVkoAp8E8HN3IMYfBvU5970pZ0/9YiI4FsGw0q84dK8a92TRuXME53nheF4HwA3wiTnoc8H0v2Gnm8IYugTRqqFcQ8hjE42sE9u1sAOMsqqo1EtZnry8b2Cg/84vedqV9PTfW2KSs0b2PQG87TlffQG3Nz4zrbu3y25L2yQBfuTG3J+mlbSMujGnkfG8Rh/DVF/wO3503v92O9B3Fkecceg1PrE6Vpo+n3N1XQDP0dxnwVHJXJflZGE6pPOOIJpY4EBE54Tz0A3B3Q4ANwUr4BM3A5++pbdimnivA/lwjtVUtU3qgLJ7gVmabM9DWZrdx+PY8WeHi3+DSc4aabDPZTbb+nZqd8+Vu+x0YoFPwoe8hpsu0mh/Z94vo8nPxdxfBJP+s+fO8dFLNnDjnUKH40A33rAbyrEbwN79FujGIBqKc+ok3v+nNu4AFC2UdJTdgkxgCfQcSYGLFUL2xR+Ic/HrdgsKpFSOYQwgDNDjTsG0f9CFmH/l3TG/1wVoNmfDasVcK4UUiukB8cpyPOZxEVmFkiljudKxWfw4v/gb7otJzhrZ9xZAy4tvnPFCmOgMqkJRfIdG2wV9l57kCcT7uS1ky98JffubjhBOHGx6E7/pxxkSqAtwy4rdtOEHCTALPKXBPukHCNATpHmutHyMXywBYXKTMWUyAGFeFAoXhwIV3vs8NPc4F/yJY+CPBqtgux22G4SoDyYYc6rkwcYaUf6ijH29LoP5sXxeuPpWTHJWCGEfy/t/5DF33uYbPtnwVjMM+g0Df00c+R+22S6LbdJCm7ywJU5xzWK/V2u7AS0d8D8XzOetg4jARzbti3kv+/ZpZJ/N6L7tApAw/UkQRBnsKwP/IoHoV44kmQMF+Al4pIkjrw+I7hzT6I6LcM8fPwZ89PhwTjOzAEnOBBCq6b+ZIFjpDpEXz3dBB+9D33rdhzHJvpd93QU4SduPCCZ6I9+174SySUr5nfteYn9+sPLjyjceFu60aZ68HZbMLoIF8KnzGB+/KORzKBDLbBlH8pf9rx/giyb+QAZx0A9tMe0p7vsHFqP/giCGIkLa0MmNtIvW5P1RamVpQsBYCuJIVNLJA/VcfmGIAJefAzziYuDuRwY3pJkPUU42aSZH9c0i1r9Y92H6YQPt4lswyVkh+5oAiHcfgn4Sa5ifl3pO4ipZ9R30W9Gl70hg2a3qa+NKvm4qb7HAZ4+0+Mhdgrl/pFNiwxTeoPWXph/fOv180YcHxMCewKdccZfDaIVeWIxR2WFkTsgAM3tJklAFQBk3iOeSEA6Eiy86F/iKC4ELNkolxnrO4yIs86TiLyuexX300sVdfhMmOStkXxNAgO7dqi5ubnsUj8N1XsTHceELx2W78diB/1jo13/84gY3ntetyov9+yYBfhnBXTQ/UdrtR2r9MoAnlTRFsGkNz0qBSqyqwO61tAio1vwAakZEKZSMn8ZP4rR97xas/m4dAx50PnC/wIRzAf5UsVwsnMKqEOXjQgJyDQXaB/F/uvoSTLLvZX/PAjDdvX/t1ljHXIVDbIvcr80fluoOmn+xGBbwfC7MmX/m0s0wqk99X39YvDOY9kCrzH21s2+/Lhdq+GAoi+6WyPLVCl32970QXiRLDCKcp/VzGlziy/ySn7QMuqff9esvPgQ8OBDBBfMYX5KANPVjGtI6UMBPv0WDA+1jMMm+l/1NANQeGU6MCaza4gD63vzPBMDDOvjw2w4a/jOXbuB4MHU7rZ/BT2Ub7yab+HKdgTDzBdjlqH5fRGUJFHNejTmS7FQ716NWgLxfx2JQaco0qHjZrkAPfNJdg84aOBT+3D+MD9zr0BCeheaXjMtG60OMI3Aij/74EEyy72VfTwMS01Y3skxW9RPK7BWXvv+wJXfnPrz9tn1khhOXHOjWCmfg2x9ImPPkAJiMdU2REMTIviozjJmPwQLIV9KkB1AbA47mp5EgY9dymnDMv4mVmEqcuhiXhOmQc0Kz+MCJfspwqOwWijGIdRZs8u0fzu7FmGTfy74mgKDNj81yI2PVveXY6iQJpPfdO4BuXXQA2xduxlktu2qvLMppIFcVcmUSJVyQh3ZILZ//ACNhS4rDPUDOx3uANTj2GSExoZdvyotQdSPskVFu5pxubOCcgQRuSZufxPWDnX8rH0QkBFnYfrOE2Z0xyb6X/T0LQHzzMLc8XMueaN9me8uT87F7S6/7d+zSgwH8B/KcvvxST/m12QKAmL6DGuBTtq8gA4GnPD5BpmtQXvIBDIGkhLi6YRFAHJnGKgjK5Jf9fxVOnJCJn4AclfvwCxcHui7B0TA+0M0StLpLoMYB2vLeQZ5B6Kdb74RJ9r3sawugweyWpJ2Slk7D/mUB29DvpK7vH9rs1t3PAR+e9dN7ajmu+OnVfALoJZPhMl+j+FdWMxnlbSNFt6Rh++SV2VBEaXzSPOBxgLUQmOAaCXDcLBHA5JXGHe55GNg8CXx0G3WBSBCZLEw3qICLMMm+l30+C9Dmtsj5T1I+RePwssVuaHMnLj8XbQR/AzmPr0f2IS0B0R3Izdpiz+DDooyM+U4qHGUsadCTBjtGSEGShhXa41rGp1XxzCBhCpM2DLzr4WFwsJ8KbMuAX7pOFkIeCOzitpfxtdfu+3dNvtBlf78LQHxhP5oH2WY5axyOo/+82WD7nucFs5XEppdsFvAAZcBPm/Z9+lHzDxgg4RaLEl2LAaCQHsNqBGnseeiM7ooIxoPpE3LGCLw0nEAsTH/sQSzpli4+OBDCB4+LMQBTnj5sk1jzHNz1zd04wLRHwD6Wfc7QfPdeiyP21S34u98G4WQEv1rAE8EP0tN6Sfun9OwoP9Q5FZxkd1JKsmjmWsVy5UcmIy9uvKZV/tJZ+GVTfA+xlrxMgBz/tF7gzoEE7n0UeZpQaX2GmToJ/7anqcB9LvuWAN5/7SPPDY3rK/tv75GxADrgdo1u3oH/ggH8eT4/fq0HGvSSCDpRpr0CQQ22PJDnlJPUX2MBqFgrwD5kop0tjtmLa9IZu4+Km8SoqnSvND+X8N0S4q5r35HAvY7qbkAuP8WdhOJvxk/BJPta9i0BLE4uryHsHiggHnrTFLUNNwP4OYKfsukvLAC5bFcO9KGcyl/vRhDmPExgMoFUh0EEI51X7sfbnOW1CTtGHCoaObySTri2ELIF5RRBhsk/pwgdCdwljAfc4+jwcpWceSCziWjTPpV/66pzMcm+lX1JAHxtV66TP9yk7+9FIEsluHOPAP5DM/Gyjv5KbzTCB80vTH250s9iUA7mZXiT1O7RsoWAO2nfmKtIRTh4gBV4LVOeKZ6jxdNXhQkap/Yc5PQGyOQHR6iQXbICUv7pums1dzsCXHK0kCHJ7cxTvOVF2Fn+K0yyb2XfEUC33uc92w95UYOTDx5ezeXcrprY6HcuOR/Lc+agfmtco/mluS/m9nPXgaRitAOMSQoIhmGyMdSWsDxCBiTcfZCS1sqmGDp8PJHgJxHR79P43YfKApAZyYxRAJ1nC2KX4F5BuZ93UFlDhWCG6VnQ7g/wr175k+xV8yS3u+yrh9J/hPOtH/j5ho9/b8PbaOKrwH0h48c4lucfxs7dzgluO/m9/SbvztPC7sgrt+ZWi3goLYkntdKviZ/lSl/4QfKHuY6NXnYZqjAwm36oLkS6a+kODWKJZwtub/TSJQPAsJ5JT+Y1RiTiKAc226A/uq3K33XLsE153kU4ZzLwSDdr0M5/K4R5Dv1fr/8YJtk3si8IoNP673/BV34dLbb+VcMnv7IDN3XbgKU+fz/WxGgPbmD7XmHQrwn+WOb398tbfBzbH5fdewTo6/MC5uxmCMGGAYltvEl0DCj56d1/oq8PbjKAGxs7cP0liSTQ8QDANCIPoCYbkzacNKuFSiIt+UXi7rxbfXVLuHjfMWRWzQ82HvP7Qc2JMIjwa5jNf4a+a/rY6H6Q25UAupH+GTVP4+X2MxveeXATgA/s9l/dGT7BzWWFaWh8J7/owjDoF4AfwpDYvKO7iUH7C9AjWQAaC2UVYARyXI9fQK1JwIIeQNxbXxOESiNllsKK6+ElHIj3AGhck48RgXXbC+ASx2TytGGVmyEEvaKpjEd0JPDJXeCjJ0oyHCOwmHEopNF9WuwPwfOfx/e94U00MhoxyZmX25wAugG+D9JXfU0A/HcQ7z4lDPQd7bR9D/hu59/+67vL+DUbxLX+jO3Q719cEPr9lLS/0fzyJZ80bgAJeECb/wnAZa98C/YM+pzWkEiT9H6TYS8sABRCoKT9LbBXAJ0S0sj4yzgQmj7GY2gyGLMeVBoOSdj8QLU7izx7EghlWQYSeO/NwE07OloeWkhjC+nXfc+g+7LQxv/CfPPf4eNf/VK69lq16dgkZ15uMwL42LUPPbxFs+9sePn9De/er+vfd7/ehO9AjzSvPCwuWcYtfrp+/+LwAZy8/Hx038Qa4gx788m9+ZHW+MsR/6ZgQhJAMesF0CWICXC7AqjHASRpeO7RVSjO9PYcacDGkBrE+U9NBgQNWogbzXlLIoEhC5HfWF5wyiePcsPRbjxgK1y+/TPDhqNpyjHHb0q5eosibSg6i7/5m4N59y/oe1/9Jkxym8kZJ4AOmh+89pHfyO3Oz8xp566zHvhijh5tVGTDZh6IO/r0u/p023mFEm7d+85BUXSgX6h+f9maWwz8oYBdmv/K9M9te9z0BwDvjb5CANpCkMuHLWnkmh7TyqssgixUug3KOTFB7P9X5MFYbYGIE49k5KCfDZ9IQo4HfDywwAdv0OlAAL7PO52LLzX3N7cRHvrGi3D+8efS0/98C5OccTmjBPCe5z32Xg0d/6UZtq/sPqoxE1tuDfogjvBz3Mgjf8e+7T9s2X2Oe/eS87DTvdqb+v1YFtNfvN0H8AjgoUhBbuTRKGCTthAggH2ryaEcCwGQD7DkJ4/RG0rT23SSv42DFcTCI+mMlAtU+8E5JkugswK6bxa+9VPAzVvIwG/iRoSN95FRubV43J6IN96GWfMP6dtf835MckbljK0DeMfzH/1wws1/3uD4lQ22ewD3C3tCf79BWbKbO4lcwN99jLMfAzg4x+6dDiLN9wPlm4BJhnM9hkQerakGXM5Jusn5cgEGkg1ezamnN/3KWwaQqY7N77MpmF24I8vK4pc0epUY15n1QYUp3geV98Y6mk1SFG9cTaRFQjGhbh1Gtz7g3heg2i4MqTxGEjvnbcq6NQaLLwsm4Bv517/+QZjkjMoZIYB3/ujDrpq1x97QYOsuob/fA78RAFYtL07xsdrXb9jN9+Ql5wCxvw9JGGZdfycV6MksZJFtj0ufPYFNanOWi3NUP3bIiCyZMDTgdUFWj3FX22rX0ZVWZqoJBOSTTEV6rA4jBXIuV5UtnTPy58q6LcUuPQdlCsdJQ5lnDHkrQzrLy9Au3sgvvvpLMckZk7UTwNuvfeSXhXn8321w8oicrssaX77Tn0E/nHcDf103oGsDy6MHsDzcva3czQ6kVX6DJilEkHVwViRlGTAZ5UXKCreA6ekktcOUWEqZAfkWYP66WO4qUIknbRKSzEO+8pb5SHdX2JyyJiolnuqmkfDJ2rCeljCkuzi32XRWwOXnxS8JAVX3oWJLUt6ZBKi9KEwL/7/84qecj0nOiKyVAN577ddeNNvd/sMA/nOaOLWXtLcyVYUp2O8nAT0A2F3vXNxtCLzMceUOvQCq80G4suBT2ypYNOa7IAqypneWmBuZuCyDya8UxRQZsdRxyq7kZLobtAL0TnlYpJODkTH1GeojHikRRW4sugrS3ROrwc0xnScLr9tS7K7nwlSSuPYSkOnEtGh5vzD782vmuzCTrEnWSgA7u8d+Hu3Je1H8lHfZKSYBv4TtXZKCaeOuvjws5lmccwDtwQalZ23W+LtoGUHQisZG5ppNOMraXGtCGs1D2hsQis2WTWi8VBFk0rLK2ALNBpDfOiWnLmQ9DF9SLe6JBBjjFgWT9mCnDCmBJnYF7ha6ARuzkgZVN6HFMViGe9n9P/Ffv+HpmGTtsjYCeOfzHvH4Wbv1dOrMfrRR+wvaTu2Gqf/14OrPy26+yzgWsHPRQQwt2n4SXOnbdAIJXQ+E1oEs9PN8vQ6bzHgCVeSl8iF5tJo4uUlNLlBtM620MOv40s1ecqWOUW0llg0xq9E9cx0YHaOowGrYsTtuhOZ16VE/fMrTZVNDKF33r138a/7l79nAJGuVtRBAZ561y90Xgnep1+K5vy9DUd/XT9Drv9UZwb+MH/PowrdH51h2367LG4EUzR9zQ3orzYXEKFBLA9ftPyO9hPc0oexTDGiLzhR3/uEM7owxMGQ2Ml4201UZGdUGG2Nx2MYVhZVWhQs8c5LvlzVBcSqHsBhkedxEZfci/C49HMYCGlHphlzUbAHre5Hagxb3xsaH/zEmWaushQDe/vxHXhUG/h5KUmObdjk8eorPnMqekskC4GEXn51+2g8gafqnRFA27iwGQL2tl7oGVJc3uznIIGMukIuelJDpPrAeU0hlKSBTZgIUyNwsjL/8mlCdPbxeRhmBR52nxXGffgPovokAbbpulXcppyRolF9H5t1+gqVQ8R5Yp5MZ3bM0Ore+j/gDjNGHMsnnIWshAGq3vyuYaLCfk5LGOCcty5Q/5NkmCy82hjY0luWR+WDyCT0qd+xVKK5LYq5iDLbeVFvLKqLKCYDqzKCY1gn0LCz3ovW9ae/c2OGY5l5hMh6pWBEKo059WPes1UW+7JWLUbFLAmD2MgSmTlkf0/4Blxwu7kxOPOlHUN8eyN2A7rj4Crz4SQ/DJGuT0yaAv7r2oYfRLq+Uc/VyfEma2nJKOM/9R4XSkcDueZsZUFLjl9SsKBVm/DyE0wh/jMQ1FqkbNoJisLgJxvaI+GPtrEz6MYVGBk+y8oSK9QbW0nJbmUY+Z21aZ4AJN7d7AWFVsHaTPziWwJHZsDZA5gdDJC2bvIV3H3TY5g3tzrTP4BrltAlgc7n5cOLlkQH8g+j2EfvIcfAvDzYnQyGSQPdCWUcAcrqvdCVGtL7Q6Kvwn5fksvQYM/GjBsqLVAwPCHOVU+LZmrWEVCwfbdJTCTJWaEs4iiwUk+rwyT3/UjIMpcmVJULioZh0ZDJ5XMGAV043qnsS4btuQIti+rEgQTaEwOKnytxbAo/DJGuT0yYAahcP5vjuvmwtw6WdG4fo+0ttzL3p384pxpdvhZZGrPf2g4rfHyUhqBF4rLAfyIABwmwe0iEvJpftxuq0cwKikI3wS16GMCSYJd5hzP58bYCY6j/Vraz7VoaX6Y1UTnXTomzSQhglIBGvmxa802ZcGETQVoTQCC0MsRki6K8XX9LtHIVJ1iKnTQC8bC8j9YAoEz8LEGXQo4C/tP9g/p9rv1FStIta/28wI5Eiu70kX3yBfj2XfUiDudyDhwkZuFr3rwCJPLVZNDijmkuvSmDKZUi1jscoswXI5ckPAF5+vRYVQCYH7H5WUEmyLnN54PHaJNBNCZ4/jyu/IkG1sk5iJlLb55/49DjzObhhcSEmWYucvgXQ0MJxjVNj0ewXZiZL7ZTOu5fIjm4gfecvNVI5npBaYFbWMR/V9KlY5LItlsXBuXRF+8ffQBrxmrSFoTRnzKgUS2tAbQ2TUIiM6iu6pYA1CK1GtYN9CijRg218driGioFFIm2v3+/yFJsy8HhYmVx3vPAAlHbPecOAHo7m5zhO0I0DnJi2Gl+TnL4FwHyMcx9SL9XJI+VcrAFuy3Vqf4vD834MoA9B0dRXmZRTNeblDRhFjUIkNTSb4HK4jg34squXvUqnTfekWEnSDDT1SKCyQX1mCtZlyaQUNbscSYXRnhDuamGOw042O/negrrhGMhmRaj7YjYysbYczt8oq6J7LKd7imXrn11nCXbThgHjFH7cfZNwI4aJXyI+3Ho2yySfh5z2twEDoP+O8pQYlWeelGUCSbIAMFgBSQt3wZZHZxHYFgDRzdOOFEEuLVABN2ndDqeWGIS7bKfRhNDjCfHQd0cKQWTrOwNyaN2ccusGOOPbg90qh3KPYuMOC2Qm+FNtXaG6rm+aaoU289M1R/CzMIdIEIjMK5dd+qmbR9kPsHNvnDKlPGTaqcKEe3eYHwhdvfvgxPZlOL55OU7O74qtjUtxcnYhlvPzsd2cg0VzEMtwnxzvrWtb3S5Qc97FRnscG8ubcePG3X/hVa/a+FBI9G/blt7XNO3fLJcb77/6aroZk9wqOW0CmKF5d/4QF5NpA002tUk01L6vzd1a/2XvtAjTREMzkVqskIHFf2UdZMtcXhTtW8iGiuJl0ntpZDBxbK8JuAwy2j3zTrRKZ/GDBQMeKFsxspBD+BSxLXl1bo3IW90UaT6kpbgxWdEzQL1mneo6kU20HPpo0l8WsdFxc920gkzYkIYpK4QTNnF85364afv+uDkcb9m9N25ZXIrFRQdyhVMklLIKOdVvqfPhVudY4ED4HcEJvrjze8IskmCT627ZvupVi4+Hk3eF9vWW4PaXy+Xsz665hj6JSUbltAng04cOv/PCEydvJN49n/u9/awOH1ick3bqtKgYoedNQrs5A1WxiiIaNG/xkzwjT8rsndB8QIFw/tadGJFPWhqyXw+hDEtZSZjJiVCIyIylcSRCbY0U7Z/vTtwQBDDlETJhqN15SZLS0pgkwktZCyb57BbrRQ7csSWalJZMKIbDQOjbiy/CZ7YejhtOfgU+u/1AbPPBHuTDD/0sQH5DOB9JXQ85WhIqPt55/Ahrp23uFkpyt3A7V3ZtZj5v21e/evc9wf91wf/VN900e+PTn07HMEkWwhrkbc/+8uupPXnVsOtPG78NKTbRlFNyaeFPnDpsz2ds3XWzb3xN/sYfi2tA7vUHKhpYHamMxpftupqiTXLYJlsKKR6SO6R7dzZoz/TO/3A/BTk6vvaX5YF0TxEhbyhpVhLcIEGQzG8q13lzUVERffxWpCufkgmPlK5BZMozlyHmLQkjB5oFLf8l+OSJr8Xfn3xU0PCXiPqPzz5bROLZyVuzhADUHAaMt1QuPbBsP3E5qvUmzFvh94agqF62WGy8fLIO1kQAb332w76zabf+S7evfwfsWW7H5V8Wjj1lHt4b2L400Mad5hEgcavv3ixMuwf1ur3s90dib8wMalIaxbonTT34Q4AZkWgKwHvYK3ySIAAuFoYgilSV5boAPV/H+AUJ8ZhAmE1s44aS/kAUJK5FpeZddi05iMpKYUEOyNM5OUQBdb0TNP3Hj389PnbicTi2uHOf90CslJc75M8EUs0xihByGYW7dBPno8Lq4BJAJ3GriWHXqZZ3w+9VoQvxm/P57OWPexydxBegrIUAuuXAmycWfzdrt+8MXsbNP3soJV059LmHAQCUF31anLj3BtpDBMrf+ONyzJqfq0aTtXTW9pYMrIYvRKDIoj8Z+qLpU2FKayFaDFR6pbpRF4IrHxlJg4U6b4j0c3NNhU8XCuQQhNCII1C6DAKwEuhy63GwQybltOTjuGXNv4Ebtr4GHz72ZHxq+0tjHTWlrkhYTqR5Rz4vOOB3j875qBgCsFaBJIG0pCC/j9LvRcGfadv2vwal9ItPfOLBD+ALSNZCAJ28/TkP+0labD132PSTyzf5MgkA6RXh8sbgEscecADD677yI5/DSEKDertvAKahkTqHJAVAkMDg1xAJEhncNUCBar9/kc/gnLoRgPz8l/Qf4rDKQ4xGxIwa8yS6eHGAML2dZ3CbK8ADdw/YVlw3mhxyXC6VkxMVloEgopbPxSeOXY2/O/ZU3LK8OAK9KfVMtbYnU8TKDRB1XbvJKlLnI8LmwrME+mOrCWEggHIMJLAMN/zyMJL1s1deufE/8QUg6yOAH33kXbCz80Hi7SPDRz+GxNNxaM5poq7tX/5pDwYL4D4HkPb7G7b8Nl/6gSaAigQgNXIjwkqzX5vkRFJLF395XbvHfnx/MzIdqsCe4+YGPdSASkcBEuKmuAYmiRH67BVvuox8Fn8FZoj4bBAHnXd/HOJyAP5Hjv9D/M0tT8XJcE5K01P+BIH8Fih5P+gsrSWgjB+nOrxzT1aSgLAEkptdZNjG82WbrIL2fwSXF1xxxcbrcAcWwhrlHc965Au4Pfljs34sgBF3fe9l6PcPWj190nt5LmHrHpsgip8FiwOAexGAAjMKYMvn6RtFFsPn+Eho/wRCSRSFFEr6ZBohibh6Xl839hFCyX+QiaMAL2eCAmDC8BacoNFEEnl6rxGkIEEurQcJeEMwGb2JlA7iowH4H7jlGwPwz4v1OENl4hNKb4SgP+EOHcaSwBgZjB5l/ehTDfzoIN3U9gUsCEH+oC0BSQTLZfv60C6fe8UVm3+BO6CslQA+8i8edejG2c5bG965b8PLtDogts/4dl8+tti9c6CKu3Rz2G38FHirLQDTBQBpraLMfxJ9f+OfsYQCTGkx9INYSPkIyyFpdyKnYRbtD6AmkUwSA+Aa05JJtW5EpjQmewK1UpMWFYx6XAAlTiYUewOsw4UR/c+cfALec/N34djyLkOdNPEum2LqK9BS/e3FTAKkiUEBHoIYxG1ZwOe7lvVEfqP1+v/5sMoC4FVdguEXSIBD7+AlOzvLH77mmkMfwh1I1koAnbzzOY9+PO9uvabh3aaJ+wIO+ksSwGABbIfpv907db7DF3+aYdeXigAgZgGUBQBoAlDuEWiWCCC7DENijfheXyMAXQbsUFkbEl9q4LDHWwOKffnBrZjwhXjELp6iLMpNWQMQYTu3GfRIf9pGjUy6MZ28NkFOEw5pn1zeB++++Qfw99sPBrK2F6Z+uvcGtRUgSADmGTWNAb16fr6frFvrfioyBv7+lJ0uQVveUrbdgZYlCfQWwfFgxf7Uzs7f/OzVV993G3cAuRVVe+ry9mc94hebdud7gyUQmmn5oEcjBgG7r/ueuOdBLLtvf/TafwFl/udugGkc8LRKWlFGIAfkNVhFmDTXHwOVz4UlwAoC6IEU8ybZHTDh+pOmb0XUpEFQjuVMJMK5HBnAciGO0vTGjaErBBrQtSWQ8ktuyX8THzr+rXjfsW8KT+Dg4B3K26T7I4z/mnrwrxkJO5CsDls91z2O6laFlJWdwg2o+gZqJgCrrYAEfmsJhCHC1DV4R9suvvuO0C04IwTw/msfee7JW5bvmPHJu8/iFuHJEuhqtYlfBD5+nyPgw8Puv8jhACLTBYCjPVAAXfqixVRvYgNOi2tKOsksj3H78E1FEjV5kFKog6UhwS9G+smMI8QWSmLqrtZsaSu0HAS54KMmfEogzh7kWQXpJyoPxWI4sXgg3n7zc/DZxb0F2Jty3mhgIwFcDv45oO9L04wThyyOrnNxuxg/Mtt6GxcF+rEuARewjxFA3SXofrwIRPCzOzvNj199NZ211sApVuWtl7c++5H/cL7c+r1ZsALktwB7JROXAx6//1HwRreXYAA/LU+JADppBBKLX1n1p1b6peu40k+uBCzxB/9sqFOxBIZsmpJvTDOvEHQ0+5DvDFnLpwYOM5UY70ECU00FZv90k2LQL71PkComr9NXGWo/DAj+6Il/jHcf/45Au90U7CyCmeBqckMErgUADXqvSwA4XQJADSTm20xFN++qnirwpdh+f38e/1SaH6dGAMkaWPRE0L55d7f5x1ddRe/FWShnjAC69T7vfPZX/PmsPfHI4StBbZ4STKb+8QedG9pr9x2BQAK0zMTgdQFSYZXZWWnoBHYSIBWNO7bWBNRGtL6Y7HDex2uyFQA5C4Eyxw+l/ROplHcCm1j4sgx4CNvkzErZ9Wh/zDcrdEIp4EBWRcl3ddYIv5lQkxL4nfl6J7zj2PPw8e1HhCRmQxZS668CPI1r9lUa3yME5LoccQMU/1VuQNVyM49Sbn/qmMSCvXdrxSCgsQSSW5odyOMCsTvQWQOLBR9r291nXHHFgf+Os0wanCGhbip5xr/SvR7ENAzudT+mYbf8YS+Q8kTN81MPmIWCzM+T08iCDMzqXMBaliziQm4LUsCLOK03QHgYJSKnQFySGsKmMvIQj+KEZ/oQSorTTYV2ddKKzusQd6bt0k5aTpsOiNbaxPOl6ABH/+wXW29fwKGQx3e/BH/2uf+Mj+98ZQD5vAd9kwb8GuRfQ+WXvuw99pvNhi3/mxQvuTfFfdagGjx005LXM8etGXdL+avyizKmcxL3lMtI8T5mQ77zWbmv5DZL7nMRN7kHt40NOjqfb/7Wa1+7eNFf/RWfVR8vOWME0Ml207yys+37D4D2v3YAR8SlfLGsmGfSThskwbj0hAWwzf7eLCJzNTJUTjnHLV8myrklYHGcv0hkw/E7BjFuilfyaQeC68O3xa3XOLGDQW0koOFT6Pmu2S9rdsjbeKXPrcX7TkPW8nuAedel4frT21fhz2/6jzjGl6KM8DfKlHdBb8BKBlwq/qyASpKJjDMz5CDzTpp+dKahqcuXgdiU/PPYhChvCjef1QQiCUKmN5uZOALws/ib6x/N57MfuPHG5auuu44vwlkihDMoXbN957Me8JkZb91JdgH6Y3gyx+9/QTjb7rsAw2IgMQYArkxDIn0+mO7smPjIWnuIM4CjdBNKuikN5MVDCaiFHUsfP5n9ZYxhyHXot9ezAukaotuRyCCVmTO7pTcSOcXv0+9IYiYKHLsAcS8F5JGLBvXc/hx/d/K78Z6tfxI4QU7vDeVRprsAjGfWV9dUQJyBm+tUgLopjSzFhXyGQH5m8VS7e0cYf3EtDr1IU99yfJsWCbHuMqQdylvZDTDdgfExgb5L8IGmoSc97nH0HuxzOe39AFZKV5E/jI282aZQbQzSBjsXkCiPnJBwiAquN7dj/31Q2tHsj/sPRNiXmNFRblyS00gGRf+B0jS8VwqXFvYki4FiI2qo3BuLBpbIjCOwU5wln4cTfC9s4W7YDopigfPjFNxgvs/oBDZwMw42n8bh5qM4TB8OeRyD7syKufz+vkW9pW5FSPPdJ34UH9r5+giwqPWthjXAl5p7jAgaEU8Ss7coSAJXuTugdsnBuKdrdzZgFUEk4yg+k3Qfst+P9LxY9MRoADilI+t7qe63z5Pus1i2f/rqV+8+eb+/U0A4g/Ku5z3yvrzzufc2fDJ+M5CLFdB0swB3RrIAYN8D6MLJFYCAsgAGN6nhjR/JaTs97ZYX7uTuSNMDOZOQTLu/4ByvWgiUL7hYD6IsTIdxU/tw3IhH4UZ+MI7j7iHEPObToAxWphbdFiDHV6bPCSRwfvMW3Kn5X+H41yHYCSBTFImO3JBW9wLPW4//FD65ePiQR9L8Dbkj+R7YG+vfGAKIDV5aDIABBByQQLvfmmvvaM9ltVRdqRhOjvwnMgE704Hm17b+IiG9WChZAf1U4Ynd3fZpV145vx77VM6sBbDY+SbiBWVQxz5v39jT8isJJCsMvfvPiChLAhG0OS5l9zT4NzgNpnZ6TTka8DnTvIMRDdfZdM8qgkR+Q/ci9em7tfM3tY/Ep/hq3MCPxiKQgFxh11BZIgyIGYQ+tbm4o2Fg8Ba+D24Ovw8vnoo5b+HOzZ/hLrPXBTL4ixB3gbKdFwcz9E7431s/h88uHyDA39QaaxX4ZR8fur9u4ycSGO7bB7wL1jEAw4BfkrqJaoGfLxs4VmS5pvSYAWW19TsuihkBQJv/fR5x5WC2BMQP5hjqvnvwL33Na7b/UZgh+APsQ9kLW5+3fOzahx6+cWv7vU177G6dhu/XAkSAzGJjPf6AbgeZYRowf1osa8PUAOWLQENx5dt8cpONopliOGSMVRqd4lLalEcBY2ogA0jTS0SEsrQ35VdmDxJ1bAbAX4WP4ltwAnftR466fMo8e/khHYccYq3JVjsMmCZrgMXgX4B5OOXQPfgk7j77A1wy+6PQdbgFO+0l+KutFwXy+aJYLDHKTz7gLfDzEQXkTTTbvPEBQMQnlOcmid2ES2AlCW5JCKjTAXxCsX7q3GvdspsWqztP+aUgRuv3T4PLVGDnvjQvD2UrwLEEwm8nnH/jE55Af4h9JmeMAN7xI1/x75rlLc/ulgP3AGfxph+G9wFO3O9S8LwDv30bENBz75yB3cA+bGPeR1A1YnkwYIlg6M+nOI1qrU2/UjFDMQ7MdWFaxN2DUrpJlQSt3QH/I/gubNFlSOa2fosurv9Pbpk4IoGlUfx0b4xIAENZux2Uhm2tKLfC4YtMbT9mcLfmenxs54pgLdwVaj3/rQC/B/xUbw3V4wGpXuUKQTigtkSRq9qSSPbw45ZnXp9bawB7jBGoIRXSoJfWQdb+KCBP4ZYS/JFElmmNQFonsBgGBwMJbC8WiydfccXGq7CP5IwQwNue+/DHznePvR58cjbr+/ed9l9m8DdxP4AT974Ybf/l6OFloLIjEAwBaIDLd/4B2XjKAqBGtKbS8GLcosYhlw+r6wxyDN0EsYx3WKk3EMNJ3A9/i2fhJvrSfnFN2QRTav5GgHBAEcm3/vLf2C2JLXBoaHHdRBs7Gx0RtIN7N0bQx+LO9J8PXRQatlfr30GQoE/ncurN6dfnaTYaB38nqc/fNA6YUeKSRwQp/KkcRVpeXJmuPZdiw6QuYTpIYuiu0/ZhlgjkWEDnmbS9nCGQFsByKS0BPhZI4Ir99A4BYc3ytud89QUzuvkttDx++bACME3vhWnAnkrjVF9oxduXX4jF0TnyICDKIGAnTZ5C040s9eMbsR4+aVmAc5jSzy5aXr2qiwi5PvwwjVbM8lJFqfG0/VjAUKYObJ+ib8ZH6BlomwNF2zexy5AJYBbL5gxYOrWf1xakD6m2cdEQD2sFhobZZhIY3Kif5gOZOX4BeAV+q/kFULu5btC4uS+tBE97K8J2gHqrQC+O0m+MAJSbCJvCuDMH0GQg3aT2d0nAWybM9UrBNEXYkcDuLt+Abfqqx++TpcMN1iyz5vgvU7t1eQI+kCb8gGRiD+fhYneZ+7iSi9gctZQVfMwFTMM1K0YbBvmGlFlq1KxZ25zmEIEi0AawR5IfHmQEW3e+056HD9LP4O/omQX8TVPM/iZex0G4ppE/5JVuUkOTqoLy9SSO99mGMYml7GcmDdOG7kFceaPn+VEP9JEzuCfCzuJyg2GdhtDuUSwZAAaUBvzyAZL7JEeOjocHfrLpWjcaSVeWlxwLJ7rNzHOS13n1oHiearWis5pwWEhEF+IA/8FLX8rnYx/IWgngHc9/xD9Fe/JpFNf+y9dbKT6a/BCCV7M7fFaQMwmkNiMAibQSLz4ZETbJABYdv5BIBJMa/SGRLzB8z2D418a0Uh8vmXP9NlEh3Mn2crx39p9xQ/PYCPJ5NP1nodHMQwMYwN/kHwrwhXltV9NJ8Eitk8rS5d99Vq3T9m0qU2rFaTzDEkC6Y9HQ091XK/uEpszEEasrAwSotKxMNzlmjWoBZ44AXGZg42UB7QWyRKDIQN6bLS/0vST/5DYzXaIEaiL9PBPQ5WrF2Uz/yqpBeuA55yx/6yUv4dv9K8drI4C/+tHHXIrF1n8g3kUawR4qtQzESTroarDZEd8VlZaAVf1kwrA8F08bZRAnqU9SnxqnvJw33fowqNaY3WLjMt1kYvdmdost/mK8b+MXcaK5J0pffzC5e7O/KasJh6mzovWlOV2NvIsSFq2PDPxiYlJfjiEMxXsYxh2GLg1VVsVYniDfXZJBAr/VyH3O0l16c008BAfMbK6BEQffEqysEAtqdnVFTi+VSWp9eZ2tGBJa3qmnRhBC1vipXhM5NMVaKO8PzK65053aH8ftLGsjgIO09c+bdueCoT9fdv/phON8P0WfvPnGzjK5IIGzl0zbZrUgSU1ewJKzik9cWgHlZRyCHPUZRtVjX88O/PQmd+jEtBL898cHNv4TdpqLUPr1s/7FmkHrzyLgy4Ya0rSUWkM1MiE1+EVfM/c5M7UO9Zj2NjCbp0igW1NfaXWqf32dS/BTDWoLrHQv9mjPrRvL6/iISNRHFS//QVWG3B5SOZ386sTqdLNlRJooEqgT2C0pkCCERhJHBP/cWAOzGT339a/na3A7yloI4CM/96hDaHe+Exn8rajbsi7ePoWeAFgY56l1SnOeBTFwIRGAKtMwj6Cnc5YvB6WuwDCZVzS90PxIGrctUzvht4N74G82X4Td5gL0r9v2rWAW+/wkTMe40EeY/GNamEY0k1173n9NOXY/lO6KiZDp+w/1WAA1E6Y+GbM/N+xEFum5UK3hUzhpBVjxwD8qXIM0ual7kOl7aZgAllhsvHTP0p1EXGntKDIVQM8LoAQJNI1+sUhZCVS7d2E3NkILIv7166/nu+F2krUQwI2fWTwVvHthGsnvRfT/83p8+RXhDkDhera9jA+CFOOzfcsvxx2uh3SRNXZ5nI1U9CJPLmMFjEgOTRls683rYQxg2Wv9Ybptwefg7zZ/Jmj+O2Poa5My/VMXJ035WZCPaVnbwPP8M0MtLGnTNGAkrKSOSQwcqDSbutHahuyWCaKBm1ZBzrnStAbIzH5YlQb5Gt4TD/hw3EgcyUQkk44iARMOJpwkpdzfj/fsDRbm/r8dGGzK24ViUPCigwf5N26v8YC1EECY4/+2NM+POK0m2TyGwqC149tzEdSzrV3dEBSYI9Arfy4Dg4nxJXmI68HEb8pAY+wS9GZ+Aln/ym60RtL0W98NmOFjGy/A1uzeA2Gl+f0M/ia7N2LqbUzjV8DnUnap9fWadNb3TwN5xlPYfn/jALsZ8bNa3g7m5TzIPksoTSpuRQnrpGrykBe8IiH44O2DO+ElAdEeaVXuI88rL4qKkkEff6P7FMjfTFsKZYCQHn/hhXgmbgc5bQLoPgvGvPjqNOWXnyCRALMYxU9fBojBZltlIJBQg189RtaPrqcC41YahOgQ5nfy0xjCYFJztATQg70LNSvzuOH4udk348aNx4Kkau0z1i/YeGAZ/UFXExsSSBaAnQbsHxWVuvBebfZIxnu/XoVP5w1QaUwH+NLfO09p5zScSNZM98KoQUILcnbyojqcHBNgx8/L1opqkYII+ifSiK6UIYFUp7OZTwZyw5T5EOYnX/c6vjduYzltAthczh8QjOYDucUK0aZhIoIhW4p96dnJ+F67fFgoG3CwiJ/22oHwHywJcUxmMsf1Aj14ZtE/an6W5VnGjXea2PfnvnzbdB988uD3ou/zx0+cZK2PMpCZKe4UwB9vcygeyr3ZBSaFDFrTqNO7CDSqqSDKMhOcUa0HoPo50eizK08w+WEPLUzVCZSZLgOyDGeBatPw8nDi2TwrC0bWlZOgKXYdV9SxGgAUg7521mDW6IHBvF5gmB48ErqTv8RWo51hOf0uwLL9UuJhNL+T3EjyyPtg8pPYETCH6l642Q6F2G21H6cBPqoBgCErSl2ABPgMehLEEQf7OmDHNfRpGrCY+rN+kK03tbsBt77/3+ATB56Hlg7GzGaxwQxPV73MQ+JdBHFrUgvqOyiizH4F/GT6l4+pDWkOaiU36DGygQA8zOAd6cZvTVul9Z2mmJ2khhYgIj9ajW/WcQC/rmy8legwdZ7uhVXGMGNNo8mUOgaUtQToOvOmUmXdytkDNTgodlGa9bsP0RNe/3p8M25DOX0CaLsX3GPfv3dI6/GHc/UjMkQwnM+O7Wb6YGvuUwE1BLg5hk6Pi+VHMa15HS8YaUpQa1lOawJixFvm1+DE/Ev78lG0HhC1Psm7FO8rqLsda6Wp7OKtsr4KW28MgESdlkRVYwRczT9m6jfWr6nL6oLXNP5T6afnW2Yo606Ba4UUC0/Ec9JRA76oCVb5i94pRDnkfZEthCq0iANdx8raErMts1k5l+6NWEWYuw+9G7/wNa/h83AbyWkTQNCX50kzvUwCECq1GPfYo7iABfG4cbxNiZV0UtzKGhDpwesKAMPo/gypf5/JRZ6LWYE83daD7zA+dfB7oDrPkEgRiCJRfU6DplIdoj9fphz71YZLq/khWmssL8XREaLVIE8/2++HPs9xTFmlxvNuSz4eq/XhhUt+tCIM15EII0Acc2JDEKJe4BGcJAYGRmcjzD2S9TPPQE77zTytPzI9OGvkoCBdGo4/ittITpsAKL88Jwf6Ys1wATGy5p+B46q11Leen2jjXpmlmlmAl+1gYgaLmB5Mawe4if5peS/i9QDwst0TxSm2Biy6BDdu/IMw5XcpyuNOH/5MVSWGKkcajjuwZ3721VI18p/vOd21mOcX1VsBXB4B/UZfKX7WQkoTYgT4VN+fomDhvwJHVVjPbTyiwKwgDGbtXxVEAJ28cDY8dJo2bipvRaTknDf+bFAzRgry3QHiH3jd67Yux20gayAA3sqQyBVfRqiHo9T8wxnHOfXeElgGEji2zHHVOEgGdmoAAgUpiHng6W3+QgrF9G/zNOAAam7bTF6MA/jcwX88PL1MUkBpDZThL8cakjZfBXC7jVQF+lbeI2sEGuB48/sJ/PLNvxSvkaQBoRmlSTwCdCW8GrA0ci2tIJjzUe2rIsa8sUcGJg7bsOy4yyCSFBmozB/j5wFfLrKSswTuOEFTWwH9WoF5N/i0+eO4DeS0CWDZzj/J1jZEGpEfgNT7ZOB2FsCs98vaOlxv3rIUbb6ALJ0nfZjAhnwsIE9fISSQ6F/HVLkVQI0DbJx2/kc/LXhs/oRe+1O+l0ZUE+X8NdlBNSxFAoIMlnLjCNa7y7St1XAa8Qm0qoGidldjETaecZdVXQGXqiIU91MQWnUtSce4VWRApkxj+ZEfx7MEMp8KAszBeTR7nZ4pl6xna51ZoFs/O2g4y28P0j957Wv5gTjDctoEEIr+vmTKwxngK+dCq3KyCro7HxbWzI6F035JAGktn8x32KcsiAbRRE5AFJp/eM5xG5KssQfXwRpoosXS4MYDTxdpx3SjvVLuJ84YCHNdfTnGrN9fSksgviduN5OUfX/Zxkg2VlEsq/lto0tDE8kiyLVGut3LYQ1YN6lJHZU5psE9oK5S8jL/Ku5YRFbRqnMvmrI+4h+b3578RrJliMRE3fd+BL3UuhkBvCWDmRhDmNG8adofxhmW0yaAI7T5llDcFtksTgBOyTeQ4wPDMuAmWwecRtrbMBh4M0O+Akw5PJDIAJDjAkX612URW39a+dcDivOR8jLh4WWfQYaWsds8ACc2viS6zUG5CxAJTA7bRyuiPxWmuwW290uWQSsIRCqqqhFSrcEBA3ygMkd7t2ZEQ8E0ZNZpVEWgmhhGweKgj3ild+0oKkV178ayvDV+KW1Rj4kQ9iQqLlFzEpI8AdfyklumeVOEamBQjAcEnHzTn/wJ3x1nUE57V+D7/pv/8em3Pvsh76Z290Ekv1MnNutQg4PRPW2qFXVx77Z5I6N7nxAxNJva7g89cwsNT8hdZi42NBBXHMruwPDsN8L8/l2CqX9J4JyLsWguRtucj635l4dK38AwqklIW5INhYmzFGAxPUd5v/j0nc7OqynFHX6mYXkDgooF0s1Dg9Sa+lbjuEQg0pOAtSY+6qxzWXM68hlA3KMpq7z3/FxE/raPTaORTVmg70eWr0oPIg1y8o0PqY/SQH9omU14I6STLwQi7k/WTb6mmhw6sPf30CB/3LkngHg+n2Nze7v95yHKD+IMyVq2BZ/R5kuBnQfFLTV67dh/DCOiYqi0BnJKL8+859HuYAtshwJttVgcnoHT1mFIDC32FYgtiwQr5IeR8ui9DmG7uT+2Nx6E7fkDw++LsZjfPQD+cB8gWRZpv795BHb5Cu/gzrklQz/h6h6Qt4xm0gApoaEG/SrNE7PP54Dbv6z8IMxO+ARhstHXnr9pwDLeCD4sjuqArN0KqZswddACeOHBpq5kGJmmHFdNpNzfW4vRbguZAozVYW6jJO6fBcAxaPT+vBXuiQgI+bOObVMGBdt+TIC+8/rr+QVXX0034wzIWgiAN2a/TsvNH+nt+MEFZbNrKj9Ko++pytInu2cYVukxNm9gLA4RED+3ZVme06e3lFUQ0w7nu7MvxvHNr8GJzUcH4D8wVOzw1R2KqOhCzdIQudisBKnEqsVR9tE3XJ+OmaFVI073Yfw9DQcYIKOAuzGEYFf7JUmvKmQthFrGtJ1TnOp+xgBdafWR9KqkTFym4lYladyzlRLbDFtioRLME/scRgnIRrBZRPdc56zrP4NePD/5HLtx67KrEJ134EAbpqbwSzgDQliTvP1ZD/8Dak/+n033DQDKX79D2gsgDf4l+A8PcKidpieFqBYD6I/faxPLg51bPz4/+FHZW9A+hGVzb9xy8BocP3gFdjbuAfm2ntaUlOPLAbBbWwnudFZ2cNKsGEBYAtIKEMSQi0dQ9+ANLuW+JDnupNOwS3+bRhNPasCV6QxBIIaU1P2SE9aGgZO+E14c9DX5Zc5af4/7AFbfE7y0ixPGGgybCznNm7YQ77eY4zgz1H09iFFtIy6+J4Bu17ydHX7z4x/fPBRnQNb2ZaAlzf9tGMZ7Sv8BcB6+kitBD7GQJtVg0t5pMW4P2nB94IZAApcNKwVJmvciZvftu+MHrsAth56Gkwe+FMNswixvvU1xp5wmPmH5kMca7ypNaDW8HQXPx1RQiEJLSQ3VcbONXml+QwTWzzP3sx9ink0paw4nuitwiirPVZjKMhPlhgNUqU5pxPKx4bgkZsuiT0pYla409U15Zdwcx7EopAVSRTBiH7cki3Tem//LeFsd+S5RdQXa+KyoDBB+xWtes/OQK67oBtzXK2uYBhzky1/453/JzYHfQRhk6+b1u6W4bdx0A/n9/2EcAGIF3/CbxXn5YVZgflOL2bYkDhEPh3HzwX+Kj1z4Mnzq/J/CyYMPCdjfCCOn3dZcwYifpZ13w9xCQ7IS9Tfh07SLnJppoN7WauSOrnOonWBndkdYsea7Gn2HAZAAazUqnEgq9VJkes4PMn3yiUDmaU5rIQeQdZBV0Us0ht814j3KkBIgJ/E9IpI59knJ/lb0zElZE15cj3WZVpVBPWMRrpHPUwDeLupK+eqdhEJbns2+FWdA9nwOt0be+kNXXjzDzW+ldvuS7us66V22frSfytTe0BPnwj6xC1B+SyzOaXDsbt10XPexkK4rsIFjh56KG49+B5bzO6FsyMHV1lz5Bx8sUpOmWlBWga0dq/2hTXd1nl5r4AICT6RzitOVoTXgqPrzzm8mCccx/6WfTLfa4ovqdQPJU9Zb8iMnrGdyr3Lb0997Vk4asM/PKTPIgJpM9JSGmMoZexYVchyropOyz6Qw/dN6EI4mf9ruXXxiXHxRCLu7/e8TIaV7PO5xtMAaZW0WQCcP/plXf2rZbj4DOBDG8+b9jjpprp+5LAxKqwSzRRDd07x/Zz3Mb2HMT3TuM2xtPBYfv+h38JnzfwjLjQsxbLcdt99qhh15FWOmB221OzkaX76S2RitnuJIi0BYE3mHFxvWzOuS/UmGF3GIjCUyAmbkGqtB47nnCKzjJoIS2FLCxj2lm9LmMQ1vss3p8eoAyZ/I97NWBYs0CDX4ZXg5RsMpbVEeRdainkYMGL9rZy/lmITwl69qe0qr2r9x+F0aSOLRWLOslQA6efDPvenlbXPw+S0OoJ9z52LeD6b80MLly0DxtrtvByG9ONQ9tI3PXoDPnPdv8fcX/ix2N+7Zb7vVNMMuPOlXbcVExtyX5r/9SMNM79SaTP152sNdHGdN/cGHmRe/0XnkjR8k+TiEIsuvCEWSCPkNJomnJVdJCsNCeymQjrR+PsXGnw6rkrQmdyqDtz6CnLKoo+OVI9pCOBo+e4txHY/ATqVuU0DP+lAWqSF1rytYPtLSPgVrllO+l1sr7/yhr3shtTvP6r4TQH13QLJ0ec2mZyCO+wjmLwgzbrn4Knzsi/85FgfOA8mPXRLpyiGtJWGOaQWW7QZYIAGoNY9UgaLRSM0nlwRLU8/rHuQ0aW/NKLsSrpanYjH09SjuQ84UgLSfrQOYIxHUAiAqDw2nYvKrMChxbZ7SXwKAxT2eSr72niDjjVx7dcGyPPE61S1DPy8vL3mZnjuJtpLfDxHvg3TmvewSpJmA5L6I3YCuC9B1CU5u8/u+7uvo/po2T08IZ0i6+3/Xs77+R7Dc+YmGd4NSW0Y9P9AqKXYt/X+eHcEn7vdD+NxlVyDtvdfkvv7IBy8FGYz1ky0RjIHfa2B9CXn8KAkhg59rokgi05bmpGw8Mi6lMKYhNyP3lBqu9VP3Z8IkPws8CQqs8qMaJBDuVf7Q/jhF/3y6x7NjwAVpVRabrow/0hZUuUz6UiTpp3aRAN8TQHovZClIIAJffli0I4Au7M42eLHcvv8TnnDwfViTrL0LkKSrwwf99Kt+atYcvZKbI58cugRhXKCbeeThjUAWw4Td7+SR++KDD/81fPayr0faaXf44k756k5lFjumsxr5t/105zeT72I34xs5No3+sENjuhRePirNmU47dSE24iejZPqyG+MRXJ7Pj7+xRlpZMxDgdczrbLXEC7bRT9XsNunmMDziadKtRu4Z2iJD3U1wTXcD8EywJk2SWTn3aMut7mtMH7NJA6LugbxIS1qnkNcwJN7NkvPGWj8kcsYIIMn9f+a61+/S4Qdzc/Q3WzociHATbT9V2C1BmGGYAiQcu/Ax+NuH/j/YPnL3aLqTO2iWQU+oB/Wiv92ddVZtw6x/jem3e/6zWU0Mcj837ze34B8Jm/w2NkqacxE/Ewv5Gr06Z0cpGW23qj9L8Bu4wZ92HHPiOu0xoZGLjCMLfOlnScBEJmhiIBOmMvNtuWncb9RNxkdt1Yw9SwH4TO4ZAw09BmsUwm0o737O0x7KuzsvaNrdqxssaPiWwBI3XfYN+OQDvg/Dt+3TdtvJ3Kd6YIQKCUhtKM1fO4ru/foKcK6TkGolUGrSM9VzP890A5Kf1dKVuYvyxmAyG9s0FtCa7kICuryn5G4aWL5PkZm83tP0l3UCwOtDw9RP6nJBhFd5OfUw1tWQSVfa15SxMXmlNCqAw5R/LF2TFrw0TDwpkpBy+4imfidyHCB9SjydL+SqwNgV2Nnhv3/Tm+iya6/Nb6idlhBuB3n/c576kOXu4gcDATztxns8ZfPT9/4WoF/FF839CPw84NecOvgVWRgCsIOCoDJgqAAQ/2QCINSj4wQ1Wp2APzY2wI5GsWBIAO+Xji5QDSDJAUXZaCuQA+NEB2GKCj8vPjzweWEMuY0CawRsFQGYfKu0pYw9O1HeCtxYXQ8yry5Mr1PSgCCPhE8J2nNxKvd+SOMAS9P/b+VaADEG0PlFAsDW1s59rr764AexBlnbUuBbI/f9t7/fLWn8llf97t99YvfIJT/U7QcwADOBv1GAVfP6BvjuSjrZbWgMEUA8QEMGZBoR4DcgT/t3jo1DBG1rIoqE7EIcleYMedRYjiBnwKEWGjnHWBGsVSI8k7mswBfDqKXDKywcmyZBH73C98FNWlZ7s0knxTm1mxZOtEe4RPTp3MSplhejLqAd/JVdLznbIiXVu1R41KZ2TqGrOO/eCzh7CaCT66478f27NPtBSptudlN9SDfNgzUgAOttq1RpfOkmw5GpUPOzmskye37GLK5Za+xECokIEgk0VPxFknXeEATQDm5tPCZzsV9HLl5fle01lT+BOvuZRqYam2i8nvbzZExbwgJ2BSBVPQK6b+7cW74gE1fcr86g+GWgi3pR4VDCjBGNTRNjJJCE9Kl99oxyP5JYctsjJzmJBaIvD6cvwRrkdiGAl7/82D8Kt/EiAGm/63ggDVip8Q34ZxbkDvBdK4J88EtTEBCgMQ07ndiXRKTmT1Oc1nQviUPdZ04zavn+nfDoHLdYyWMA6b3xDDKIhiO1rQBYBU5UbWxUg/OIlTDmjlguuhXDy16+p0RUzrUL5vi8rGRyWCWs81eIJoxbPeZUtgEi8ezIkCrVbrItDs70ZViT3OYE8Mrrtr56AXpxAHuT1vNnbd/oShjr58uwdiltF92L54IfNfjHjjJsavxyEVD3QHugsn4NFMY6sNaG1WZNTGvJmsQ6UkhvkVWaKObR2MaYwomG62pY5z7HxFXsjmO1gAl+mVM9SotAxR8hMuxVRkHSucviFd4Q2mhXpo5SygmThpNNX/3i3lVi8OvfU0hRmT0Ia5IzPg0o5RWvuPGLlsS/H8B/oHxiOzX0bAzofrwx5eUbVHLJbGwr9bSg/AG1deD4VevuTTpy3EHN1RPUugK5JkG+OyCnKmfN+PiFtHzUeAbMTzbwKLbBs3kWNjwbrcVOI62ER/wckI0FVWnZfFNcR6P22ZCTLgkH1uU0RlgJYvN2yrCqzBn85XI8riTkGLgCPKEmZ9FOw597vOENfD7WILcZAVx//fsPAIdCv2V2cX4nkORvNViTyQ8qACJDFLOZBj5MGrSHReD9JPgqUkFm5H4hT84fw3E+0/P3+Z0ASyTkkEAj7hnj5JSE8h+NAeWPGgRyUCoFIHMN4ye9TgnU0slE4hUJjJVN+quypjCEaj0AmzR4pKxe2aryj5TTs1AqayKBGT7gyQYl5zxoz7bdvR/WILcZASyXd/2JcHjo8ASaAqDob4E3a7DnVJ8FT5KU7mgXQAS0D4HMuX0ALqE0xb/xLIJITrL81lKxJDA2diE1ATlkQFgtFsDkokEEEPWh3D1taS0Qee5p8T00LnmoQPGTQLd5ETl5SEvEK8/Ide82FsgQhpoGFnmxiSvJS2JA3Yj3MON9t21zN6xBbpMxgOuu2/1awqLf2TS92DPcSFNpZjXYZwCg3nsnrF7sI8PaAhl3G4bMSQUwqjWRdKA4iNcP6JnwdlrISt/fj2nI3WJyo06NiUpjZ5NHMo0R/VeyguOv+sGkw/DA37Upi5E0Ypj+wKWczE5Um54AjgI0lfRtHebwtsxk8pT3ZY8xIUVcJhynMCZeujdVGEcII/eGkbYorgc3uhxrkDNOAC95CR8lbP8qaDYbAFk+GZY25bTaLINM/CzQrdYHhDswRp5Ky1tTrBHmdopA3tHkmQFnHni/SxCLtQACWEn79g1BtQbo+kAZBOwIAaQbTB7osuUyxyys600C0wQrACBd3krrk8mXdQFYusUyYywJFvVB2t0CeqXINBI4SSeVwWora4TYRpxVvLHZhnzC4lSc5zo25ZPJm/wuxhrkjHcBDh/e+olQ4C/qzoeGLb4bSDSqvZsRsFuQJ7DkKTWpYSHiECpNLsEv48pRafdBOA85ATXnI8CbuzPG0knhqilK1PXRuzWoSDJlPooH2ajl6QrtBOdeE7D3iGazUo1+Lzf28nfCjN6rCSsJQx5zdyCzgHDTlyU57x6Su3c/QmikaDTybGhVArl98J2xBjmjBHDddcceHCaunwnE3YGz6Z+IAD4BGPCn6a1s8qcMyAe3lFWagkfUpgT9GNgr81NEqgC+x6xEipNArV5dtqCHDi9/qXF4I/gK9A5JOta3irOXWUsj51LsgiipGV18sfE3dcB7lEUOOFYkkNKX9SPdWHMDGT9bWSq+J20pHHnBeORGxtvv/p8FIJ79dGip87ITYPrqzviov9L8VDSztQJGtbpJd2X5qG4QEpQ2LLAiv5H8ScS3i5nU/aJOpzFjHt59KaJiUUbToLz7sre5SnOTbfAMt9GOASEBGF4eBG1hMDzDpeQr43plYG1Oy6xtuh5Z5q4C1+VX8Sx5mHRUOMkmwGjZq3TGSI6bo1iDnDECeNnLjj2Ria5AUfmQ+/R3okBFcE3g3l/M9cPE7UQNrGG1ZH/xsBPoLKvTSJoyvAxTAcwA1puitAl77y2s+sny5oLIowxiwth6W1V3Y3Pxlb/Mwz4XYWbryKim/FZZHC7guM7bWhjMNUGpdmTylmUmEcAaADKPHN8ShBsJ7lTjSknhqT2ANcgZIQBmplnT/OTQiDnp/V5K/x9K6zUG8NJdrnDLWlTktxIQjiiwjj1U8uPtlV6zArwyrLwnZQ3I9Mbiy8KQDivv35KU9PPEXbYs02JdBjZ1oNIX2jylrfyNVMCvCjdOQqssFy8Pq6G9e666KzyS50hBZHh7b9UaBUtgK+pHWCcbWIOcEQJ4xStOXBWK+tD+lTah0ka1WGrA0ECQjRvQQFCNz0OmAYxIxgapzjGenDK55TnbMIIQVBm9OlAJl7Qt2Me6DpW1wqVMFjiqLFIYfneieI+LAfto2lIryiOvsCp4RXoxzKpnV4GeayCm27VlVOnIilhRGe74C/txx8rt8YAii748zV5N9pTkDHUBmmf1m3tk7T9s+C1bngS2XR03BNBjAAosQK1JxxrSragmdi5sdM/UJSdcKmtqWKm8slwSrFbjwxCErCOv6yAOqp5sueViFRLulsRAigd0WlgttuGyLeuYpvPcaQURpPRWFMTeH2QZjPXnZiPqTZEhCy3Pe5QBvtaXcSuLlEVVuYTU7vUYTknWTgB/9EfHHxZG+L9muCotuF/0A7j9W6nhcsFEQ5dxUoVYMoA4lz+s0H7VAh5g5MKXlMeqxT1Jg7ua29HickyCBCnaugJ0eCtqbbqpK9nWch05zUk1PnFUxGDA6tX7aHiTLpujF94bBGTWxLbyPqQb1WFkG7MgteMU6nxF/mQjOfcmVw66MxbGvW2btXwgZO0EEAr2feh3+W4L6IU/GdQ2pLW5IgYRVFa0bfFuvccKtV2GauDLPATpZ4WgSSlt/UVeQGMh9IA0D142jMo6IJGnOFEkKrSaSzwQ+a1q7HBAx1jNgSkM6WvbV1YAMfF5Vfo0Ui4R1wN27zRGMsmPnfqBSNOLPhKGrZtDSCzqhb37ZvjjECY95cfLHaxB1koAL3nJp46Gin1qQXApNRmN3h9lQQQxNI6WAwqgq4bJOl0JMKkxPAaXD85rFKrxQIsEoEzXavIUVoHdqYPROGQGCG1egK99RKN1gSLdWR2Gc9GAKwIRYUaBzKtJlUw+lTZl/1lX92MBbv0x4iZB58Vznj2NMEBlVXnlYW0djRKCCF8VObd1Oo41yFoJ4MiRo08KRTs3J92DPn0iHOMmrgCSC34LFtkYPbBHBw8U0sTLSXkNY0y8RimjcZ2ZBXnysm7Sg6gGe/IfHS+AEZu/09itRVZpIa64vDofq49U+ETcqySBQTnAx2UVzwnAyhNKSbDJz7MYVuWX4kjwypF8Ny6tKFvKk0s6leIS/sM1fQ5rkLUSALf8Tf1oP9KzL8knMzYfCVUf33MfErYZlaOKK/Jh9sPt9XBcrSnTMmWymrgqJ51COOMvHb0BQRtuJYgJq/lsD4QRrQBKylM0/pSWBETV2FGnRxjJw6Zp3NyjvKQ6T/kMVBhGzXPmvnAqZGHK05db7O3YSd40xqYh2l9FMLrMn8EaZG0EcP31fC6juXK40s1dAtSKtAqaPQrmaZGswWVlS7CuakDQ16vMVcXITpicrwQE1WXlPe4nuXtgJ3GhLAmuiSOVFTySvwNIeH57gYxHvCzwRi48cqmyXBWeTZIWpNYfGohj5JTqNHvbNG29juTrNRZmTXhyKrQqjiWKGKBt209jDbI2Algstq4IN3WQ4ld+hgbaDQQOt5Mb8ZiWl4Ec8CR3Zc6SX+cyrMoLxS0HMw+yypJFOS0JmIfLFuEjDQsewEfIQIo7hmLUmfpqnAdCXk1uOZ4BTm6AwlE9i7G0bAGMO3lheUW6wl31nxmjJCPDq+c/UkZ7z7YMVXFtOzC/DFzEgePkZ4CfTtj5qXJxNzNEH8IaZG0EEAr0dVCdztT3L82tAqKIL4EK64fS2Kv27T1EaHO/HkHF3rKikSf3/Ny5vh8ZTnrIaT+2hMZG+wuyTFuIy8FAW65c3awLaOtJgsbwx3BkGPPGtzAqjNl6hiY5Jh2/So99b1dS2Z1nO0YKWaNnxKnkxp+5U3cSsNJTdX3q6Mph1ArxiAD6um35o1iDrI0AQqEek6qu/I1nspWJowX9kJDjJhv2SBjvoaawVbjkzuPhxtLwTNAKMCY//SHUkeRjXUht4lkwWTp384JUSqwiRqd8TjvV8fZqxMKx4gsBJJX+WD0l8ovn1WAYY7TsbD1QK48E1nRU5RIJsch/VJx6GbMMZNhKk+8B8FXh2zDYtrk5X8sHQtdCAK95DZ8XDg+obVK/8ZLxU/60twZQQHHE66+na+e0FGBMhZOJJB9sDKMarJMGO+Wz/fh0bhs9AVVXyatPW17FmwZkJPLNjc+mJzWzugFo1DNc059dhhm9LEFPoQ3ICHtaeB5gzfODyduCmm26Xn2Z8uRsJAmkuB4xsAN+jwRa/uTXfi1uwBpkLQSwu3vyy6n7thfigB/IH8Qi3/qTpqtt2HnelfWDIxme6zRVI4/XEggqmqx0K6ZMFRBEGBblkvGYR+4ZuqwqeaH5c0MjjM8EwBeJU0lEylQ28WW9kJMgjxDhGNnmS69+U/5UA0md9w0fo8TPXn7JnZx0oUFYaWrjbhdxyXNLoEkswao8jVtrCUCkadMPx3cS0YraPHVZCwGE/shDUlFZ2fjjDVOCcyXbr2rZcBqeCZKZU8ZxGjDJa67z6MMQ3C5LOigyWnVThFH0dacNiTJjBOgek5oyVG2W3SgaZDAakAUR2fgEvebLpIORfD2ksLmuhOB2Y2TESkOzCQt9b5VHOhgL04BPHW2bsZrdkkvR4jqcJDgFfhkn3xO/HWuSNY0B8Jd0f/vPfIH96TrSx+IRD6wuMYbqqoGz9qORsKpRWgDCaaNO/mzCsSmHbfTuLdhEkptodC371lIqu7ICyNxnCabO2SuXU0BiAXrTmNN5ju7ciyXXKi8HlF6hKz/RPipge3UK6NF+B6Be+ulebZ3udd8qnxVtSwHc/gAF+gT8VpBD238ymt+KNclaCCAU7IFDlaWvV64Wa+65loDVaOyYqVyn4QKXTUTzMGWFe3l5loICodO4ZbyK3OATThrb8DS+qxSpdJ8YK2p+pMGOteFUHi/BVRZdldYYUICqe6aOJqAlrxEjrM5z7HmOlNUSi8w3p73qKOMKUFutD9HmKjO/Fe6SlFA+FLto+c1Yk5w2AXSbfxA1947GK2RV72Xa88qE1cGLXs4JbuDKZO0qchUKYQBgGrC1KFI4HkkrRVJpAlprsZM2UOXdBah2RRJHt66dhplOZAOUZfPiE+r+bA6fLIURi8Fr7LDlGbmuhPxwNHJeVacFlSjbaEHM8+eRNpbvUcRTdcxOO5B+rQN4RmUltMw3f/Sjm+/BmuS0CeAVr/j4oUACF1p3C9AxTVZN59mLVRWO8YdYVb4FKpd2azNmUVCWRUkGDpWikWlxY6albUhyTbq8H1ql8mH63XAslVX5shPHic+20UM3bFlnFtQjSbp5rCw763MecYcpG8OJ55RBdqGSKIDb9M2zZe9ZA3WZorSmve75yya/vg4zAH/5jGfQLtYka+gCHLoIcQagiN/EaI/r7CYboAlkG77L+OwDW3Yn0jWbMJCEwfWDtpYBOw/cakCZNo8AwA60sakDt4tjSUBeO2MuVZHIL6MED7PJAzWR2vyTuxroQl0nFXGbe87dEKehsDlxSUCGZxOX6jJ4dc9O+rYc8v76ozTjWyiSL5p8RMO3wl28P5DSX7b8RqxRTpsAZrMDF+qWJGxBrDBNDZCUn7x0/G2Fu1lwnSR7YdiPI0mCvMjJjU06Ip6rhWl1Q8vhbD4ivh0E5HhMYGSRxq3StCJj755kPAloSQipvqrZAXHPVVyTNoBaEzMq7W7vQ/pLi8+Lp4AP7N3ubBBzX2MNkWV5EsBNP9/T/q1s4210C46zduePsUY5bQJYLpdHhrM0BrBCpLk1wuyeSI3KfnKVZs5u+QJ1o4ETluFrfFMOjJTDSyO7QQCSVwyCsUl7RAN6ZmwVnJ3bNkTBe9WLk7+ySNgHUZWOAbdLhDIPgksyKk2nTHXme1zL9L2yGLdMLqTLIuui9cgm+QugryIBazGErvbHrrzm8FuwRjltAggjgBvxltEdybPZvApnrGwwKg84Woz9h+alTWMP0OQxJpZ0+FTIwxkUs2Y8w9pLdZpjwKr2TUCxBpSMZFBZBp6Y+1plsYBH3G0QAQILCguYVuRPpi5VOaSfyTADlVV2ulCyroUoA0ZGNGVhp31Zfwlk65fM/lauA0CxFtoS5pUBby3WKKdNAE0zj80uJcV1w/L6mlK4BPNYV4YbNWfH3JxGYc/HzEXbSCXAT8niEG4EuKRXuXnpib59Mv/ZnFcyUtdufx1wrRs26djnWmlwey3ztQUdqXtFjmPtBQb4qNNV15JIUCywimR5hKQwYq15z1/ETfeT8mkNEUj/qgsQzX6h/YPb7suxZjltAlgsFsv4LdzsxvBa0h7CdUOqHgr8xqU01ao0GdVAoGVvlc6Yn3VnDXTYhqWTUuaiV9aKSLi2HqRkYmhGrAAjK60v2+BhgGLyVeQoA0ni8EZsAZdgLdnmH6DANNp9ci6txSCJ1avPXD2yXZmfCmvaE4/Fk4AeGeVPWl/ecwet5ZJvOnTowGuwZllDF6DdGsA/7AMw3PsK45L3SHAE4Gz92D+ODjpCNCLURGEf9lgaIKNBTNmkRnMbJ2N8VN/kZwbVU/b6SKjeBJTx1HUqG8G/T/arVTbqsfIydBgLwNEuB6HK1DO3b9Uzwkiapkxjz8e2F4xkxeKidZ6/HAdIpnzvJcFvSMHODOQuAPNLH/c4Ook1yzpWAn5ueIpxaFMKn0JsroPySNwVWCk/Hokr3C2AgXGCsYw/2vgAzfxwSGZVGlznxXvUH5kLudy6Ig9z7yvTsnWlEnLiUx1kVT3laILNEjFJ7VylCd2FUXmJMMzQ04jCHSP1y5b82I8n87T1xOZcATmGVRpe9v1bTQKd2zKfc9cF+HWcAVlDF6Dbmii98S5rzQS0iHCAVUWXbuZcPSSuG7Y1xVbmK45jcbCKCLxGJeIocw5OY49u3nsSVVEFyMcIRs4cVI/BAsxp2JbIPML06seCQl7bMRB3fQfDfbfB7UGwMyYh4o1ZLF59VPfutC8W5a+6Jij+7Phbk16SgjyqroL4hbn/D/zlX87/B86AnDYBPOUp59/MbRu3KK5bnW3kbPylcHXiBGXf39M2qo3LBxuvq0ZijrIxVA8fdT95rNHJcst0VDnikQguQRF88z6fC2JQ1oATz6btgWmV2OqyZej9ZL0BrsVTtRPSI+9uvqyfOZv05LPGSN6VlbiiPUqTflTEM5RtpFICSftj0O65G7BUI/361/u3v3bttesd/U+yjmnANvw+OtxpsQJU/VrgiQCjD8Nxk+BT4Rww5fJJdxM+l5brfNWl8/AlY3sy5s8mT5l+0pKyXGpPAAnydE0lP3ha1YTLycTwSjOZ8gM14fTuLbSmjJ5VVVgAjuSVCYjh44zNqWkb9lkJ7On7WZGOqwwkiEUaSvvb1XrGbSn69Xlabwk10q+mAFvdTQh9/12m3d/EGZK1vA1I4HcNSSUSGMQ+ZOkm22ulgSEq3IRx+6ROXJsfOSa3bBRKg+cAuozpAcGEs6axp3GsVrDlVs6kzXjhnO9FrQZsUE+zpQgS+FRr+tGNOGy56yLrC67jS3/7jNkCCbreZRzbFmCvYzok49trmT78dNlpC72Qcx8iX9uO5Maftr+f/D3zv23r6+Wi/d2rrz68lv3/PFkLASx5+dedWjDPuBanIVmNziNArpLg2m0MYJVpugKwUrOt1PIiDamx2eZjo3kNDlg9pQZj4qdM7TcDhfmfgO0RSQ4HjGpt75pFdFlv3j1VaViwiPqX966IACa8iWufT3++R1/GkgxQl0feiwW3vR+VRNToKazV6lKJsNLy4lxYAMtld1i+EGdQ1kIAc2rewpVqRKkkNsC1DdyrYBHWSw82PePGIw2UTJwxwJJTljENUTWSsWt2rB5HMiGksgjQczxmgEc/76Oj+SjzMmRITt4pmLQMxsorG7wVRT4OMJUV4ADQaU6aIJywFUGgjqyUDgsv2y5lVCesJTWp0VsD+tYQQStJwK4JyP58/TXXHFjb7j+erIUANg6i26CA4akLoGZ06NCpUlNjVeFNXu6ItMiIeSSOcWATxx4VcbHf6DwiqLoootHk1V/teFmVZnZAQ7ZTDg12siY/aXLIwGY/fcj7JXPLTn2n+5YkYetulGVQx/fOYc4hT9O1GD3MAIVOy94Lwy9Xim/zt23Atmu5FmBZgTmOB1jNz2IAUP9ClMW/xhmWtRDAlVce/kQYCPzwUFFDDQ3/isiHYsHHXiXnSDUIpbfMwF7b+HtJHuSS6Zt05X2QvQcAnlmayqEGukiX0xIjmTwt8O2+AJXWJ6g583yUZIE9hDVhuFYA+ZaCrLuKrKlKIpPNqjKN5V8yRF1x0NcuF8nyce1fmfoM9WkvbxAvg38pBgIdM1/9hN+yXb7i6qs3/wJnWNa0JyAF3Lf/c6inTr3FZiMav0WRpz2lnwia45JtUDJdqQHEw2Hv4QowpqhVGWR4WS5DLGOko5xZ/7r82tbEE5JuJZn4Gb/C3Id0E2MBTaPJofrBmOYiT11ouCLfb3fDiXqSdajOTR1V2OU6/cqygn6G6lTkqTS5vEbtptqMjZ8dyqKeHEfMilT9+eSepvrMlB87RBAIYwmaPQ+3gaztwyDE9Lp0zsK2VfgTFZf8JGi9B6/iGW82aciwMo1KIxvhscY+krfKJz5EyAZk8vTyU+/Ke6a+LIN0NxpfEoXsuCvQN3BfGbabhYjouZxu372FS94WgPK5WutKRzBOply5ORntXgE8PQugqjjv+eXnC58UbBtU7WGkbXmWgHmjrwK/tCii9v+dq66it+E2kLURQBiw/OP+lYV4bRtuAmpFBjKMU6mwjQuoRsylyJ11bDpuo3UaYQpPTtnHyMQ2xNQYpTtXFWKuebwcbjFJAB/QS4GNqd+RQCNJQoYFxocDVtSPBcKY9c0CmGNEXz0brz7akTo0aXhaW5KRih8tmmprt7a+d7ltt8wnAXhp5v+5aHQ9vz9i9sfuws3AznNwG8naCODJTz7y8XAvf57REg+KnY2bByj3IUKDyHsACpQ2DfPQ2WlcKn35s2V2Gn5KVy3agZM+6rRX3WcnckWfJ3KQr5OuC9A0Iq4gAZhugJ1JcIVrIMg+u7w3eeNVkqTTU2AydZvbBky9yfjOc7dWhiq3eDaqzmk8TUADXLYnuYZf3g/YWeDT1msAvIG/ZZ9O+5Nnct7fytoIoJMwEvC7/eCfAZi8rI4SCFgNhjHNUIExlQeoH25yg3ngomAqvdYph7kpGb7a7qlFfdNw8oyX7pqFFJ7MvcUTjkfVPXDGAhI5VDMJxpLwxNat9wyq8roJlUNF6lyTgiVsGa+qf/jlVuFNumOErMon5/dhnjP0yP7SjPa3ew38CatguWzffsvx5kW4DWWtBNDi0O+FO9lNi4LyMzIPcrSxeA8bI34iTn9oMTrbJMHIBtCKJLzIqMtuCURey/xg83fyrQvrN2SvH2Df/rODfTBu1bW0LqRbIgXodOEBzRY21rN6XvJZi9tR92Lru04WVqmoE1Pf8J4BnOds4qgMuEzd5jTkwB4bkC/7xTvVyH5yW3qj/jGNRTfwt2ye8fSn0w5uQ1krATz5yfT3oPaPGRIVUED2gMKiontGZSiNYB88W7CINGRGUkuKg0q3FX09a85ZosoFMMfcsNpx4CuyY3MvEijQeVkLxbZTa8ZX4wDxxhUJNCaeJAwYcBKcBygAOUIMVrMmt0y4ws3GhQkjnFRZ7GOxFp4sh4ognxn77dEStgV/vhYafukN6o2An/Wof2f6/8ernkR/jttY1koAnTCaX+z+djMBbJBbPQyuwQfnoaTKJC8dnXkBtAhDpsEwUDlUWoMB2/AViFEaXDbzyfjDFE+UvRXp51Pp5txf5cY6E0UCyewfsQ5IjBUMkQyRyDJ54jwH8sKkozCZkx/sOdfubNx5pCy53gx55yAMrf0ZFfkqsMs0WE/ppecnQZ20vAL90u8SOL933bltbpNpPytrJ4A3v/nAq8JYwLvS0/Mqvj/Yhg8NPqlNqzSASjOqtC2ZCD+rBcB+o+KxMLZMxtxl0RDRopoJkBmw0/DZSWssrBQLXtXNd8x/1UVw0hrzq4SdupZpGRDKcFWd2WcFx92ElwtyGNrKk3mmcxkH7LRDRqV87JLeZRyxL+/rl2m95dJ0DaRVKcz+ZSGOkw3jmx/2JDqB20HWTgDDe8v8s0PFyqevH7yt8HTdOg8kje7mRSjmgVotxTCgEw1TNTDb0EQ5LTGMNhSu85PXtuHaMltNgxF/QDdmVbhuINADeWXP6/6+WidgAo0Bn8fczT2o8CP1DO8+WTxrmd5IWJUe4CsbiDbi1LF9Nuq61c+z1+5LDWQ53ZcX+8h+/sj5clAeP3TlNfTXuJ1k7QTQJ7px8L8RLT7UnUsgSIBVvzTKKh68ZPdOWvPQVPqiIaTG6z1UGS8f2Wmo6Tr69WlajW6iqEbD8AnBKYOKL8vWCvdW36MM1+/HxHX55RgImX5+9rJdBBuZ6jqx5ZZRlFaWdeScp0gyPbZ5nUrepk1khQGMKokk3nbc3S8v1hFpSEuAW2fAT1oEI4CXc/5ty7/9xGvwC7gd5YwQwNVX0/aSm5/o3hDMIwESDCJsrnSuH1omgVaEb33gYC9gWWDacAyfmJx4NqwXV+XdmrjxPjCSl7SK1D2JOoRJL4nFbQ9qdoANYOxdAhm06h6QrtNUhnSQ5CvLzXDqxTaGdD/ynmxc9uPLZOQgsm0X7vMSYTPQjfluR+7zjj5cAz65u5q/zeMCYcqPvgcrNz8/87JnF+/zlTe8gefHbtl5C2H2JeGn56Mhzo052gi3ft46lrKJ16nAas27yLeJJi0AtQDGXo8enTjVUYbh4p4BQNoP8NPMYag2wXOjFB6VphwhAzZEIRt9ju91p0T4VZaKJR11T+LW9ImpAxlPkpBJxL0W9WZF5iHjrEIZiyTtvSXw2mtlFUBYDFyDfmkIYLHkzzDtfOXVVx/8IG5nIZxB+aOXnXxii+aVRIEAApQV2FETQCOOCfSzRoRtNOBz3MY0KKAe8Bo5qvlwOgXwoz5XjdppcKpRUl3WSgijJis7DpWpTXCtDkUG8EFuuy4eybjlKEWHvc89r51678pA5If1wG+fTYpvg46V25JrZSHAdAGgrQA5wMestT0LKyEct8Ph64OV/CfYB3JGCaCTl79s+/cbzP4BBZQSUQZdAptHAJYMmkYTRl7qKtNKYdKNxQsVxjQSq9Vlmh5hlMgYDDfywT0GftXg44XXQG1j9xotVyeoTOx8HCEAzypIcZjH07H36MkouE0gciKq5xTzUlaTSd+7Hgpt4pp8OpHaPUapgC+X8mbzPtaHNfsz2LnuAgT3Nvh/y1XX0G9jn8gcZ1ioWf4At83jQi1ekN9bjTWbT3l4Ht2zaEyjb+OfJm45mK4TgNMD6+YekuWQmb9LR7TWpBVkPzZri1zgci2VngI8DACkpiWTVooLlJF6A2oLJh65WAU6C9h8nuoaBQyybsiES9HJ1IPUpqo/Ts65dBLPgGSw9JzJAS+X6+qeRV2SuG4hrm052ElC1lcqC5f2lPws8C0JsAG/ALvuDgxLY/7FfgJ/J4TbQF7+8p1vI25e3PSdcxpfnOJpfKP9lYXQlFFMzxqASDvfMKHqJqT40gT1jvnciZMd2Akj/K12x5h2GkE7r3C0AGUTQXUJDGF4/X63K2Dyq80dqPuyt2nHSiz4vecAONdeHVF9KcmrAj3KfbXOvUrAuwQgwQ+o9wFkNyAOFD736m+gn8I+k9uEADq+vu4Pd36PaP7UviuAGvgZ1MBod0CdQxOGbEzSEpDpA+OgloThhRvrj8q+qjyysRiUCcs6b+meQSzDnQohsA43Cv7obsmAZTheQQww5yYfJSMkmEiSsZogySFJctKXcW2abI7SI2l7azVV08+tbwmoozT7uRDAchgkfH7Q/D+JfShnvAswCPFue/MzNub0sFAbl/cq2jRu28b77oB3zgXwqUvA1vyXT53qc2X2m1bDTllGAeiBjobykAS0KZMkH3ZaKKMG7J5iQerF9fylppb3Lu7LalAZlfcqE6DNfFMG+YjUoxAAJNFWZH4k6jeHJwFeHi+f3L8vl8eAf0zze0TgkUA4dt4/HMD/09inQrgN5ZUv33n4gulPwrTgITkg2Dja2vNrzEsssnvQie0+WA1sNX0+F8fK3BfhK20v4kpxrQwZjnSjTpL5xJCjp71OxSpQaSU/J87YqP/YQKJMxxKDBLR3TV6Lo3FLQAwZKetAZYCRqjD1x/YeoIEu75+9hUDiCAl8Rj3/z1gE7fR9T3wS/WfsY7lNCaCT6162/c2BAH6zg2sTW8MqAnDN/mbcv08v+RuCkEcP/DDppOt86Zzbfukq8HtkYYX3ALcNawFSkYgNK90luTjAl2YyULtbMoBO+pQalyVGoCYD5WYSlf15Ql1/CeSK0EQZ7ViH7QIowAN5/UQ7MvgXz4+F4zdf9Q30cuxzuc0JoJNXvHz3ueDmJ7u1AauAX4EcNeiBcq3cZDriB5N+CryKEFKclK46Eel4VoGKZ0khyilhnrUpzSZiyodXJOJ2b0bAPKb93bAiLTjlu9WNzIszQsRSpKYfK1+l8aE1fL6W4VhbA6ob0FYE8OFZg6dccTW9BWeB3C4E0DXl6162/PeBAP7vriOgwA4DWnOdVhFCnDcG2JYcUhpw0rZav9LgDqAVSYg0ZPhMBglxezTqqoaEtwvcWyOs4+a0JGCd89GugUnTG6/wSCFlvmejG6szG9HclzqX5dgD+CzC2/cYFPCj9h9bFxDc39g2+EfXXEOfxFkiZ+RdgL2F+H+/ZfYvw+T9L6ctxPIDgmZe9Wv9RRiWneXGDClNa6q5P/Ewc7p2jXdrRn+hz2EbngQWnEYqfuwcK/PbE5GwNNNzuqgtjlNhk0Riw0WNP4rppGPlN1JW9UyhAWjLZkFagU4+C3Oe3syrPsjR+u/pL1v4L+8sx59/WuATji/88Mdx5dkE/k5uJwtgkGuv5eahX778j2Fq8J+NWgKorQFgvBugtO+KNHI8uYKQtIaHcU8i/TvJ++w56cOUBzKuRWZyi2F4BajYcU/JsbzASCR5ad0dMmFz9MLxSDqnLassJUEcshzKHYVU2+hoCcWGHTP/LdkEBfH34fAdVz2JrsdZKLcrAXTCzPSKP1z8RDObhXEBIgv+ZOrL414E4QI9xR0LMwLe/BEOQTTkkIMdY4BDWOlYAc97ChY8hFPS2qskNXSicXAyO+cOAawiAuUWr/OUXedGmrRKpBQYlXi3L8tiTflO8uIeE8aLU7nH87RUWIE+uof/rwj38t1nm9aXcrsTQJJXvHz5PWjp5wMDbFjgrAR7Hwj+2EHyc+JKjeyOB3gkAbja3SOCihCkEPLS4r5/H/0lQMckgUhew4nHEkynSBwSyNKSWAX+fA1DCvLcHF3ZqyUaQqnOLdANIfTnqQ8vyi3Dwmj7TryuRQhwQ0jrB5/4f+C/hvZ6irW7P2XfEEAn17109+uomf12KNads7aHTwLAKRCBcevEDhi6ZCDDOnmO5pPcV7yOnC9vi5q3bGHcFdCFXwXk5G7APdpVsOfQoLsVnKSLzX567BxT+L20P0ZIwzvv1vMHzf/fMMOzzmatL2VfEUAnv//7W5cfmB14SUDLIyLWVgMd42B3NbkXzhBKPveIJrk1/mwDRsjI5pNR8Hk+gT1BJNO2+RgU5ksnwcqsT8CIEXlEyysSYb9op3L7DJ1epdW5ziuCVZVRglnGdUnEA3+Lt4XzZ17zZHoT7kCy7wigk+uv5wNY4Pltyz8cTKy5BfUqSyCFwV5hVgDW83dNfesfBwMbJz1pZcjzPZR0dZ26DBZEtwZMZAKfynhASoCNn9L+JMIwRjV2cXBITJSNvXKKPNgBuZrLF/m1FuyGqNw1AN2xxUfC4QUHz8FvPO5xtMAdTPYlASS57qU7j6DZxq+EBvtgpZnhEwJOkQj29BsBr6fZybt20st5pjRWIFYBnwrwU96nRBrxIrvFBk0pAQhCgA9EHrn2TH4FesI42G0c67+HjAJ6zJ3hWw8eicg4hE+E+/jp8y7ALz360bSFO6jsawLo5Jd/mTcuuwTPJOYfC9bAeRUQxXl/Sqfu74YfI4hV6Y6RkiADOfagygN7cuvEBe/nK+yeDtdsjvGPBZWnnW2a7tjDeFHq+OLC0/hqLMADOHwiiME+GP783ILw60+6nbbqvi1l3xNAkj96CV/Cm3h+eETf1RBtdm5jgHQBjhq06TA2BgAT3vqtAr9LGCYdeZ1AYbW2DJc9HG1eClTCZaCRSc8+9UHj7ckknkmfDlU/XxKFzAdV1nvn65QjxbPz+tLfXqMGeyKOjkfeNCP80uZR/P4d0dQfk7OGAJK88pV8z+UOfiRYBN8aLIIDnVsFUAgAQwMbcMBq4xs3m74bFjWxWH/vWoYdlQjOPTFqSEJ1NRirTX5HeMTBA+TKa5knn0I+K8qylwUiw3maP18P5x8Lx9/iBX7tmn9A78MXoJx1BJDkuuv4rk2L7w2n3xl+l0otSyMglADOBwNywAdyBWzlOR6uDnDqlX6qQL21YU9HTsV8T+HGAt7aclaWB0aIAFjZVYmnnw0De68Ix98+fC5e+4Wk7T05awkgyUtewpuHD+AbAsi/LWi7K4NTsQrga2gFYuMm44yBmuFodhRNpxwgTPWzvraFMPQA5XgwVW+nmrZXV2NEUIHcmPghrQ+Fiz8K5X1ZmMP/k+67FZiklztSk8Rr/4Av3GpwTRhwuyZcPj7c3EWduwdu6z7qd2s0t9V4Fvi2YfNIGmN+Ng9r8sv4MHmOHT1ZFQd7xLNl3OvasxKMG9sseNw9WgI3hsOfhmRe3zR4zZXX4J1n+4q9MyV3KAKQEiyD2dED+LJw+tjw+6rA/o8ITeAeRtlXprxzWRzvaFr8dhSP5/bixt69Hl9YhsPfhN9fBb8/m8/xpxuH8Y4vdNP+VOULqjmHcYOLwrjBAwMZ3DdYCZfzEncPFXAZNbiQO2uhxfmhRg6FVjXv9i4NDaoYAoT0xfPOtWtcO+G3Hc5PhEDddNGJQDAnuXNLfuHIQ5idEGanbbEI6eyi2y6qwbLpPhoTRqCDW8scLdZwbEhYtuF81q1hb/plqLdaujcVRTyahT9dxt29pb1UwxB4v0Nbd91vZ0iDWyhHE8I13G3k3AbjucEs9J/nIVK3l+Q83O9GPN8MceZtdwxuoeAbGM43g/+BcH0w3M3BkMGBkN7B4LYR/Lp4M+6KSHGHNI5jltTfe/dduWXI+2Q43hTcPh3i3hDcPxHK/GGe4W8D9N/bgf2KK+gmTPJ5yaTPhHRvJv7Kr2B+2WXYmM0wD+CZz0+AFocDCG/G8nMBO0ePYvfYMSye9rQOuJNZeWulq+NwoDe+Ec3WFmYXLzE7eQFmn/40ZhuBTo4Eety4c6jrz2H58Y9j93u+pyPNqZ4nmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkkkkmmWSSSSaZZJJJJplkki84+f8B3YS1o44SN6oAAAAASUVORK5CYII="
 
-# robot icon (256x256 PNG)
-ROBOT_ICON = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAACXBIWXMAAAsTAAALEwEAmpwYAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAKj3SURBVHgB7b0HoGVZVSa81j73vlipK3TOTZOablIDTQb1NxGFsUVBRmXUwREQzDiMNeqQg4KoMIIDKqEFQTKCCIjEhoaGhgY6QtOhOlV+4d571r/DWnuvvc+5971X773qquKuqvPuOfvss89O61thhwMwpjGNaUxjGtOYxjSmMY1pTGMa05jGNKYxjWlMYxrTmMY0pjGNaUxjGtOYxjSmMY1pTGMa05jGNKYxjWlMYxrTmMY0pjGNaUxjGtOYxjSmMY1pTGMa05iONEJYZ9q5c6d53oHFCzoHDjyiO79wrqnq44yp+tQxN+PExDcWNm/+5OzOnTfCmMb0Q0bXvfCFJ5l9+x7TmZ8/f5LoxK7pdtB07oTJye/i7MRnZicmLsedO2tYR1o3APjBzp0zM7fc8d8n9xx4dnffgbt1FhbDjYkKYLoLMGkPsGUzOICJiU/A1q2vwJe//GMwpjEd4/St5zznxyd37/6dqf37f2T64Fw1WSNMdCahmp4FmJoGqDpAYKDudK6uNm14PRx3xhtw568fhHWgdQGA3b/5Oz/SvePON03evu/M6qBl/N7A8roDMrKFsz9dY4HAvrrjYvcdCFhQsAXfcfz74LRTfw3/6I9ugTGN6Rijrz/vhSd0d//gjdO33fbEmX37YHKxBxOW+bvUAVNNWn6Ysnxhj649N445LJ907O+2zdfBiVufhS/9w0/AGtOaA8Dtv/7852249fZXTew9WMGcZe4Fy/y9mgHAHmhBAO1vJUc/AIErqAOBE0+9AU568OPwxb96OYxpTMcIffl5Oy+YvfnKD83ecvMpUwcPwmSvB91BYP4KJmwMqxGj/a3sYezRmfCaAHRt+IQ9ts4O4LSTXoCv/N3XwhqSgTWkO//H7z130y23v2Zi/1zlmb5nmb1nb/QszvQMHxgOZxEs2vsLLp4FgYEDChv5tptPhVuu+Djt/Pd7wpjGdAzQpb/9untO33jVx6d/cMMpE1byW5sfzEIPjOURzPjD8QUGnlmAENa3x8CqzXvtn+/f/uf0u697HqwhrRkA3Pr8Fz3a2vyvsoVD6Fum7lvm7iMXwB61O2xB6g7/2msyQdUx3aABTFrVZ8Ii3/6bdtCt33o3veHSGRjTmI5i+ujvvHW2uvmad0/fcv2O7sEDUC0sQLW4CGZgmX/glGHLI+5wvEDMG+4XO4E3nEbgTILJaReOcPueV9KL3vxoWCNaEwCg57x2cubOA2+aOHigE6Q+M74rFPBBVTqwywWzx5Tl8dmNABvtMWudIDMz3hTA/d+5N1yz8McwpjEdxbRl/+3/a/aW7957Yu4gdAZ9qOyBNTO/NQHAHZ7pnVOcmb7TDcJwxjL9Bnc4HpkO1wMb6c65v6XXfmgS1oDWBAD24K2/PLln9zlB8kM4BNX8Kyo+Osz81tExtdky/fG2hnYAHHccwKYtAQSmpoLdY/bYhO94Dr38iyfCmMZ0FNIXd77+xOr2258zdfA2a+v3be8fON9+cINZQUg0bd3im2xMK/icH8BpwpNTgdk327DjNlj+cMJxNjD/xGTwDRxYuBvccssvwxpQB1ZJriwHDiw+p7IezcD86H19HgA4QvxFDB5/NwS40RZ0i0M3p944Z4d1CpiFELffD8f8rdOwe+uzbMj/gWOYrrjkN07sLCxc1On27mktoc0IOEno9L26MhUaX3FIrkJDpboQwlDR9i8a26VqdH/suQPc2keywVSTfc74qxDXtsTARjaSUKQajDH8pBueNZJMvO8TwizQRqu9f9fY17tEublt7mx23GGzYHNaG4M9m88F+4493U7nyonpzZ/H815xMxzDhHcsPmtqz23T3boHHUNQcfcHnIWattr6nLDV41iQtWKn6nvmt4y/aTY4xZ0DsHLagWsPW7sD5y+zvwcGv2n/vgEThx0SrRoAbtv5qnM3fvv6ewfp71QaCMwfbRsIHUkAoOPmAUyFArpjg5P4VUiMLAAMrOR3SEIUzg/Sk+AYBIB/3/mYzraTTr+4wv3Pnth//UO73cWqa+unsodlet9R0HcWDL/czuivfWXGMRx/v+I47r4PLOLEPyG+5UxAdV+fAr8PUQ0SYREf1Lt1PrJfjOl4GLOggpXNqKksaOyp+9/4xc9az/dfV7tOuwQfu7MPxxjRvv6TJxb22zatHRjberBSH7faO07yOw3AMT5rxk71n7LSfXYmAICT+lM8HEjCVxT4orYXB/r3hhe/41x44dO+A6ugVQNAd//CIzvWo+ltGWLJQHwMRBvgyMhOP6fiO/vfqTQe3dyzDkDsvb5VeRYXwojAYN56Q/v3pzd9ZiM+6xH74Bihr7zmmQ+tqr1v6PZvOH9iYh4mrBTtVGSlhIHKBIY3/Cs855meOSvjS8WAEoAeCNR9nwjlz0iwi+2ZGyJKJACBFmBQYFLcwywfcmA6rwwflcUAhwadR9iO8Ag4Ze736bvP/nU8968/D8cIXfmyN23c/9Vb79cZ9FhfmrBssNlWQ3DyeQCwR21BwFhARGRJPzkRHOGOPzzzmyDxe2JeUxhdQytt5xcfaUPuWgCAuYWzoT9IzO9IAEBMAd+XBCB4BMCBw6JTYfuhs/V5GNAfFhgW3eQhe97tdeBWPNM++HU4Bugrr3n6c7q061WTsLfbqRYt0w8sTzj1kJwa7TsLMmNqHgIo+FwHUAEKRTyKYciSHDLJXzqCcoBQCbVoE1ACzNBr+TVeA/CHG+d2EhAXL4B68dN0za//Np79htfBMUD7F/pn4ly/4y03ssxfb7RVkhzjAQAsEKADg24ABucMdHzhmH2+H4YDneQXpneHGzp32rYzBeYGZ8MqadUA0F/sbfWqSei6IKoqkTP/AvNj7M5VGB2wgh322QLUczYHbLNGAHA2jpP+1v5B5x+Yh/kF2grHAH31Vc/4/U7/5pdOdveDY/7KWK+wdQd7dR+IeQxBhL2cO2JtOmgChInHtGaQvY1ElkOuJAQ4EAsBckshT4eUSbEkEUBbTN81lBbgbZU65dtrBE5SzHVhcMdr6fvPnsHT/vplcJRTvW9ha8f2Z4IpW9pNsciu7YxT/b2PJoBA7WYCuuFxNwdgvxsesP6wOQrg6EcKIDnXxcHuAGCxv2q+WAMA6C8OaodfFtWsreO6nWf+Gn3/8QX27iP710n+ni2Um9Vc2wIc7LPtWoeJQK5QDgCIZwl2DtjrO6CDWxfhKKevvuaXntLt3/SSSWNtQmOZ32o+xrYmolrrwfWVGJ8gN9OTyMf4gOtYFBEisbxS+XVGiJRPocncGJ/LfQ/ybC7+oeD7Yf4o4lusa3iHQMXj3Dwk7E1DNyls70vo+8/5Lp72un+Go5g6vYVFM5jzfbmugxrvhv289x8drwT1Hy0LGgcCA/s77zQEN3t23iUQ6ohkDg3yYYKDtrKu3LpeNV+sGgBqwlt6DAD+2rmXKPgrpEPXdQCAyqo7Hv1coZw6I9OB0Xs4bCXxYe1hnzPTs1pRDf1u5yY4iukrr33Oju7C994wCfuxY8vk1j+hP4J3NDGdaFGiCygizFXwGA4wSkTjkPPWa6UVYG47pPNh7xt1X/Lu1V/n85kM2h3ytFcPAp0ADJWNvDj3Btr3h/+BG19yKxylZA3XmztOAbYAMLCqvR2O8ZN+jBeUwRfmpL6T/jVZE8Ce46IJrOCmzzseMKJZB43BM7+r4G74qSc6q14zs2oAmDPmq3bMyiaEvqGJp/07RyXwZAcn+X2hISC/YUT0BZRDOg+xUcpq42AGb586Z9/34Simbv/2P+oO9mzvWFSvGOw80zuktBUmmhJ7yiBZ5drQLjiL1f/oqW9hPNThVDgKoCXuKGow9RJh2X0um5f8jvGdeWdHf9wCGDf27TWBKkRzfYEWtsOB/S+0V8+Ho5Qe/OAzvnfplbfdYQ28rQMn9f36Pld+y/im46V/bXkBBwEE3K+rALc0BvXUGXGiikDlsHrCwOJE96uwSlr1RKB640mfOWiq+UWLbj3L2D3L8D3roAxD+fbXXg9s+GBgFV6LhP1B5c/JTxOGYN+Io8NrwxhUHGcfTXSgNwWfwIsvHsBRSpe+4fc3m97BZ3VwwVa2K4aT+HUwc0Q1FgBgJ2kYG57wziEP93wNfO3DnddYx8FuvN9+TDTDKP1ScY+oGWfo8yPfyQfJtWP66XA4IDAWCMxkyL+fFu5WwLlOP/ff6I6XboajlFyfHXTMJ/q2Hw+cum+BLhyW4d1yX+v7qi3o1Z0ABLUbEXC8YX1kNJA1ABgOGV4nBlFbP70tE/PzJ5nPwCpp1QBw7uueu3d+svP+OZtR57hfZEd+v4cBAPoBFPqDAALOXzAgd5BFPgqagGN+DwTIiIfeObi4YQYWt1Zvg6OYJg7e+vhqsH8DkqBdHXwkbCoFZykbAhScQk4xI5k56Y8wTdQDA3GY+iV1TUV4eS+71um0XMeDhvzKObWECXBRV13zijcBBxTgYq3HAyGFejLzG2DulsfBUUy92e7bFjtTgekdk1fhoIqZv2sZ3jKzPyxjD8gdQUA6vwEJAETmB1+9gykDB2c779/23GfshVXS6ocBLc1PTb7cOraeOtkn40b1wloAUf/RD3+Qnw4WfAQ11d4ONjQIkySIPeCGbWHjVJwu7D9uwxXbrp18PxzFhP35x2K9EO19Zwt6Y9tPqAsaAHnTyQGArac6OImyYVXk0RTE6IcjdSv62AAK9x9fF3Z95qpT6iW/psWeTyMK0ZQYpu5nzyoTxr9DFoGxH8gPFXOBUHxBzgnsxr/8yMBj7Z+jVgDctHif903MfOmKqcXd50GH4rx/1GaeVJEVgt45WIf+YPwRFCLHD36+RmWBYgJhbkunHmyZWJORklVrAI7Of8fLL53bOPnWOWIzwAt1K/W9n9spvhiubefp2xL2bIg7+rbBe/7aNTtx/dg0rOq/b9MWOnhc57fxn45e9d9TvXgvtEAXJH6Q/DKhi4T5naPUM79xTlX/6wGhVufsTA0+FoygUfPRuK7Tte9U7nyQPxvTJHUUaeXvTkc+27O4boSB+qXg6K15urcf8l10w0n2WOBjPkwCg4V7w1FMF9u+2986/dtzExtoYB2ddcep/5YfLEOnwy2WtY5u6/TrIQU+qfmwN52D3YUtWjBd7Frmn62sYOy8dcerfvXLsAa0JhqAo7mTJn+rf5AeOj2/cA83fR3DfHUrBEwYAnRoVrsp6+SnRVZm4LUB46/DvBC0BaQpa/dvnoW9O457zel/+eyPwlFONOifQFDzyEgSsV6Q1mHGn2Y4JwQdn3ihyNOA08ibGsLDXMCGUYM0bEjqXrgtcp/yiT7IWjdClEZ64lFKpxhiRIhTfbNnYnwM70RQaokr8IAZ3gX0w02/mIDvOXHgNAAHFL3eCXCU08Pf9icf/dwTf+81E7ftfgE69dhQAlJuEs8TEKYHOSHhNOYKwvIPP5HIac+WNwazHdh/fPfKXSfM/xasEa0ZAFz4xpft+fwv/O4T6j5+fGrX4PQKiGe18TCgk0KDIAGdOuxsncqtjvL+PhvX2kM0PQGDbZtg7uTN7zjtzAt/H44Bqt1yHC/5IXCacLcjE+rGq8UONB0A1BA8xsyUcSZtg6FDYD7tV4/jSbxwnTGmJxoypRiHpBNfn8CkmFWYrwGo2Z0jBZBn+hy/r8wAZn53uPs0CHtIDPqZtXK00uUn7v6D+/e2nAx755/mVgX6kSBvBho/7O+GA3lAKPiGMfgE0ElGqzHQpNUMt3Th4KmT3+uf3nn8hS/7nT2wRrQmJoDQRW97xXcPnjL7qIOnzly6uHkKepah+9aWH3ScJ9R1dqvm92qvijqzYLEzbYcyJmBxegoWNm+BuVNPpP1nbX/1aQfOfgbufOwxsTjEAsAuN+jnBJpXz9XvwP9icPhQcPwMBkFVd/OiaguYteWBwSA/+v4+ef4I86fIx/ULxfp1eI7TGFh1eyDxVdz0DgjtIs/HdMOh4/nn65COH+rl99fxvsSvU1g/hDnw96q/Hx5yaz3m7K+b6LU/HP78IIcvBNOgpmNib8hff+Mbe9dtuPAZB3dsfPXi5BY7ALbR4tu0NYEn7TEd1H7HF4vcRpZX+s4JPlnB4sYuzJ80BfvuNvOlO0+deNS5r3ju1bCGtGYagNDD3/Z/rr/iZ3c+fG5z5/c6ewe/O3FbfxPeYRv2YM8O7xI7BS2ydZ1aMwsDtyLwuBmoT5y4or+VXnDua577r3AMkWX+b9pRj4c5DYgFY5CAdVghJ9I//GLSDuoQLBI2V7FFMpfSnykzF/Q9AlRTDDCLD4VET+aGmAl6cVJ6uNQk8ueCJRDOwzSnfkzfF9I7B/nXyHxZDBpAv/NNOEbo4uDL+u3LnvGyjwwOdF4zsZvOw7keVG46/OIBwHn0M+O9488Wv29t/cGJFhxOntq7sKPzcjp+2ysesPPiNZ8Ri7CO9Nnnv3rrju8d+NDUd/Y+hO60r5rvQDXdhe7Gjl/s09/QhbkLjv+3xeOqP//6jRs+fPHR7vBroS/82ZN/fqJ/29u6OGf9HE7f6/vZj27Ew+/6ZFU8Yx1EVafyv25NftgBABsMl9v80LS7ARqqf5PRMQJCdObrdDJVv0xf8pTApi0PMd/8bsPYZvw6IFduN9PTTfUe8D4xFDeOCu90q0I3WHw44xfwPn/3djjG6JKfvaS6+5bdP9XZPfitzpU/+NHubmsW9Caga6ZgcvsMVG5FoK2MA3eb/MIdZ0z81AUvffqdsE605hqApoe95gV33PwLf3bzhJXy/XrC2jKTMLF9I0yfZht3v1V5rLo6s336DVte/bMfgGOUaNPsBxfu2LcP6vmNVXSkMUM4R5BnltpLvLCWItn8qJf/RunMNr1w9kiGhRw4QGkDOm1+qwaA9N4CQETz8CcpHxjHGSFKfkcmggzxpOfaD/2GfNQpXe8gRdaGrMe8t3Hf7vkNH4RjkFjQfeDrv/qKmYnZ7o9W/VmoFmdgYnoWZs7aDN3K8orlj4mOufnUlz5p3Zjf0boCgKOw3MHLAT+5pUuV3wrZGZF+TBwqOJbpouf+497/3Pm4v12kA8/3a8NlzsMgOAYNMw45x9AgTBiNqwFlqFihRu6EC3/8SsJoPmjpLAwpDMv3Sy0hxqX4m1YYasZO78VhzzIoCAjwjGU2I9hkse1eDdhU8Dqf4UWCrsDWIVZPQq8/+3+3XfS6VU90OdIpcEZYS9OhdJAfRl9/WncAcAWsuN+QL6ib4BC2m3ILJapjHAAcLcKmF9f1/NNrWjy+qvp+y62wrIOC4LOenyD9/YBp8P4i+0uiVCfIPfjYlNbiE6Bcmqd7WurLg1qKA6QVQQk4RpselIAJkvRHVmPQD3FhBAM3u61i4PD7H8jsv5qnf5N1evU339rvbHgJHOPksM/5R9LWuei1Qj/xh+iwcMa6A4Dh4UAZ86xigwdJOIBjzuxv0GN3vv22j//PJ/z6YHDg3V3qWTM4zH400vjc2G7lo18XZTBT1ZmX+JoPNUxYMmGp9gO0MK0yIRrmg89Dy/NtcctfDDqJ93FAcHTWvMUg6ckJQfcBt1FewJkwDXqhv6FeoI2/etxFb7wNjnEKDB4MIz8XhgIgyEwxUyOsN62/BlAHNRJ5vqkvUk1xvfCxL/8D/difvf+9H/mD/+/3+gv9V3Q7NVYWCatuAIGKR8hcmCyVbzCaqPuZ+l+q4hDvIdvo6RognxNQqvwpvUztl+dR3kK5b6L4Fd+FaCyyt6Gb8FR1wiYxIgRkhiGawPyL9TQt1Jt/b8ePvvVf4IeIwnypwCMokwGI4HDQugNAmBCiAEBmPMDhK+SRQj/50o+96v3P/5EDC/P0FxPV/IR3gneCPey847JTFrLx12D8THVHZmEebgNUTEzqOQDNtPFZ3lkoSPrcxs/jMlMDZKiEDXBK8YL/IvkBHPM7DcDNcag6MuvRhGXhfqPMLvQGGxYX6y3PO/lxb/8b+KGhAYMtJR6JGkANy92LaTV0GAAgqDUJABjhagGAY98E0PSE13zib97xG4/+spnDv5kwiw/odvvQ6dZhT4yKh8lMspk1o+nrEJjuJZBgCc73MVMlNJNLOOVahLybQIFHAAW9k3DUDNR7UIGODPshawGhbNbB5Zayul2P3UaYbpUcTEAPNnylT5v/+zlPfeeX4IeIBn6VX+INfxx7GkAqXCyoR7kw6WNAh8HQWQVZzzX+x4f/afsAps6xvHlKTeZky0RbbQlmbXlmbamm7e8kIXatudNx+/lTWNXjV/FQ7TZEGCDWPaR+z/4s2iGuRRz0e3vn7ty12KPexMBJf1PznvFJqvp54YaZNJPwmKYWp+AwquCnF9esystNigwcGRSiJyAbevTpYkPZ4BwoDSFGSO8wiBkIuD8VF8ptde7OjUWCqjJe7XfqDpnJRZzacdBU3Vd845NPJqrc3gQTbg091X6CQFUPKHxRtra1SMQr5NG4STHz9sacTX6/TXkf1fVurMyNBjs3UlVd/aAHPWgXZnuuHVlUyVbuov77j4bIBKnkjF1POixOQODChZ1wZJ/wUMgqrgE+MujfP3jJidWg+3AyeJHN3oWf/uD7zwOc2m54Zk7Ytpu/1aFVYoC47Nbbt37+ax2827al3V5wbrtnqqdBpO3G40/itwoj4/A2x/JiRLVhe6zGNccbtVmQgA22pq80iwygYmBMQwDJr3T2mGCCloA4YY9HIAOFq1syYfDYjZXUFGYHsUsxz4BWQRy5tfbi37T1/+UvfOHOS7/whW/Y1viyffaz9v5nLrzwwiNnezmlATicyjQBLyhh3enwmADxyyBtx11rAuzcudM88r73vdAKpSfbjvLTdvD1fLd2yU1XDrPy3IUJH7XA0EGRddzcGabkMPHSX6qTz0PW/8Zya+mrWrqFEVFzLjYZtpTk1JJUZOKlhIoevFeRlcWQS3/+QSgS12EZEECsN6OcCyT16es3HLJBqlsbLzJS8si6TF4oxAyU7J/jbGU90sa1B/2WDaq/fOmXrrAg/kHLb+99zwc+8CXb/nedhuC39yKua/llXvGKy/q7yA+LEzAQKSBgOwfvOuH/Hx9419mDHv6S7RhPtyB0NjDDB6bnTsjnhldmJcmPEQQctUlu0kwf7TlB9XTdwkvQZOUhJJ1f7RJCWLItKUBocHDKV0sZADJYg2iM4Aj1FPVwZP6+6FwUEwR1OEKygQy/hzdA8dMJMS8XmxhhwCIH5ISOyZfChXCLcc+34Hw+GfqDJz/hSdc8+clP/kfb5v/vggsuuAbuCmKNUY+UJRNg/YXj+gOAr/06L1z8Pbzk7PlPvvuSH7Wd4vmDhcFP2A5Sebu14q+zGMX0CgQS0/O52LWoJU8uef0AJ0t8oiTxc6bOGbzJUm0AMAoY0j1xGLpXG9Rvp8jIiTejPE3PtqQMUGo7Q7LQcoHp4fAOTG8kZuCQ57RaidQz5ShG/MUEIOKbCICMGeBk6kvcko3OtseL6sHghZdfdtlHKmNec+8LLvgE4mGSTAPeDRuVA1BrALimi3Vbaf0BIA4B1vlBAQCqw4BynvHf9c7Hffpd73iRzc6DPTOzIyowe878ifGT5M+kTHSwFX4AzIodmavZnYb1r8SciRnZSy9ahHjjpS+rJLW0w+IXhoaX0DWSvZsJDQmMqWLGeqBVHZKbkLQoKnIYHZ7lOzInZ3I6ogYC3VYxL6h0ImBTjazHsX6c9TA+7orLL//i1y/7+p/c5373+dC6AwE7AeU7qlAIyfVn/8NmAhQ+AErX683+n3z3Ox706Uve/kpD9Cg/JMUfqPSM77ei5mthem3rR+nfAgCFutkwAxRfBWm3/L6EbeeYK/KghZtwP5R8mUBDrA9UCVMMRGh4C/MiNPJHI8JE2ktYqVHk9nt4gjQQgPKS5IlCHovPszZQ58CzDA1meRItI+Aq+2yMEb/Ng+3YzQe+9fVvfOrKr3/9d+55/vmXwnpSLIg2kQMI1LAsKF4VHcZhQAGCsDW23/VlHe2cz15yydZe3XsJLPT+W/Djmcj84bt0rAGIw8ko51PG8MOYH2OHykS/J+76GZMiDGepNaAyaWyPok8yU96MTnrY63LGR+XdSCWO11iCAUKZMWp7Q8b8xbPZWzC9CJptFLQDAG1WiJAntsX9+hTjNjGpH20vPn/F5d940wao/+CMCy5Y+1V5A+YFP1lOmQLZsb50mHwAJQjIl0PWxw/wn+/4xycN+vN/XdV0kvfiexW/CgOvLP2BmR+MUvcV8wcmT1/qCd3IZMzcHJYCZasOQ++VofrS1n4RCCMeWEn85SaJQzQWvqIoy4fpQAhp7K5MnQMIWkBAnUemh5z5VVwsACP+jSMSnJSfvlF7x6/9rUxd/9ocVo+/8mtXPPue9z3vfbCWVIUaSl+I0v6xGtKGjOtHh8EHoAslJgDvF2XWVgP46FvfOjtt6M+h13uWV+6F0d0hkt9UidlbGD92IOXxB8jBIJRL4kEMW9JBFusESrN7ZFRPSnSuao5Iuz5+iIRL3hHGzx2kpQ6AQ5LCIWlr5k9MHFR+VIpFAQSYmB+ifwDSb4yCySxwYFDXJ1NVv/eqK771xuktm15wyimnHIQ1oDTIV4wARB/ZseAE9FQgmy/gIHzmeI3oM3//9/cgHPyTGQzO98tMq06w7VnqB+bn7bcKxhdmD15X9vZHqZGcSomw6FzhN9q2DWrp4CtluqIfH7JyuNp8rJBo6DXm16RCG3nCDEF8PVMOviIt0+iC1h4QlJMBpP0y5kflfXCrsYDXrfiJSf7jtVjX9a/P3bnnod/61rd+9l73utd3YJXklwNjzfilGZ8A9IYp60jrDjEa2YiPuGMkDdZkOfBn/uEtPwV17/OdXv/8jq3NjhvWY+ZH0QBMbvNjZHqRCqXqiMs4IPtFGvYsJJf4Kg+CtvweWQcVv8PrrklheFIdZVwdRs02iAjhfXvqWt/XbebBWf3K5K/oMwrOYtPp2qPjTIMLJmr4/LVXXvkTsGqS8f7A8BgZPxyHYxRg3d9B8W8h/d0mGLV8LuvQ6fP/+NZfM/3++9y3Uir27Ptx/So1oNj4keEj48s2DIfQyWPnanb8QC3Ptfp4sOjIQw7+cAeoj3iAfGegwTAF85RxsgPa0znEg4q8Zvkq8zgEGLLq0fnS5dH1rK+ze5DVK2Z3irYSJyF/zD6MAoX5IYYFSmUBwB027DgrqN//3W9++7/BKsh/Udtnoxgi56M+FjQAmdxApQNw0Pfz5QeDQweAL/zjW15Ivd7f2EHcjmP2sLFmOMT2B2xR97U9nwFCweT6l3SYEDZ+idrijDii2xwb4KAnEg5X+YvOrg1uYZ4GQ8CIMiyfWvGMRkQe+uBwcMjqUmlRFMFTp9lW77BkWJonwEChRnui5sj9ynSq0M9M1e0gvPHqb165iu9XpDUxyQxQwhKPBQBQKo0DgZqCBuCYv16FBvD5t/6//02Li//HMj86ae8aRVT+6NlXkp9KBheNAJTaGTIMUHa6kokEDBpaAICW1sRM3eSJdjCg4oAj7Fi//EFR3/mRvS/TnPiRlvrPwKV4F0J7WJxEFM+DY9jI/BGvDXS8KcCagLUW8KXXfuvbfwyHSiijADJbNglKcxiWBB8OMwOo1AAoMH9dH5oP4Itv/X9/iP3e//KfWFRqP8YhvSD5KZP4SvKXYEC5+k6NcOlrWHQoSNtcNSQQpLSo+P5eKd3bQIKWeSwn/jLToyUOWPdjCECo/OmwoHGkOqesTlRbtABCDj0FGGnfkNIgTZwm3gkmQdcCgXM2E+68/srv/B4cAsV9MuI8gDRadgyZAKFgbt6f2/22Zvu/pv6KAeDSv3/Lf4N+7//4vQZdY3SSow9E6ovk1w2LhSTL1E6I4bFz6c6mmDhIfkhSCAoJVNq8rdTWyYsDlnksJ35xn4YccJcfMALkVN0LRfDF1B4yGpDVMzTf0fZujhfHCLRJwP3Kzylx/iWnAbA24A6br5dee+V3fhlWQKmHMghAmhjkNGPTFAtrTofJBJARgPBpcBINgFbG/F95y1t+jHoLf2UgqP3ADj7XIGLfE+SM7zs3NyShtuchVjsVTE6qWRIYBBJgiItpJC0FCDFxABjueNNxWs7bmKC41hKPYGkJPlSSj3rvOhxU/ELbdQPkynJLvavfeL+lriOpNLPQEgwUCKAyCQymFaN+c5OOaAJuZ4u/ueHKq34Elkm1/MU6TgbKhgOPCR+AcFEEgUGQ/P6T2cvXAC7/xzefTf3Fd9ix2S5q775pH8+nzARQEr8Ah8T4eT8h7dUuno8duJAoickKdR+a/TCGFQys5UG2WRQVElsBEa1UayiPkuEaUjOXkBk4wog8x7BmHSTTKtdAdPlaTSRmfiqBA6AFRCAvY6MRlLRXZdTXWhsIv2mxmAcCcTx3/byTCWvWvvO6K688C5ZBBsKmMeHTaWnTnOQAJFhvOiwaAKk5AN6y6bP6T8v79MG1f/d3U735/j8R9bf5hR1VlU3hTQ49Zn5Qkl6r7qA6pOpI+TUqqQJZB0tL+zG7R6A75AgJnzkHi/wRqo6N2TNtIwTtYUsfbVK33S+BLdeotIhUx8PzjC3XZfgy8g2SV2xKekjpUAlWWRpDAI5yxk+ThPP44iCUhWIm+gWqaA5UXb+x43bswyXX/vu1U7AMCvs4CtMT5EOBx8J+AJ4EBPpBA/C7wjoQoGVpALsHvZdas+EB0OHFPGoprzC8fIEgk+rayy9hco6p8wjCi1RDUH0mnkCwBRkw0tz2NPcv7ViTFR2agU1CHXWdaTXvCWVv/103IsjWW8m7/HspMJEsoaaYIxUpPsQtJ20a72ESIKAfVTMG9V+E2GeAZwuaTgh3Kwptv77Q7FhwHzZ5Powi56umIPlxyHL59aZ11wC8zQ9pLoDz/DvpX3v1v8croobTV978xh+zYPEc4q1lveofJb7Y/CZXIylXKaN6rho4qc0QNYAk3TE3AbREhAQCmRZQSCsQMKflHbTCeKVNP8zWpzU+YMTvsDyuJh9R2tdFeB2YrdRWhHdi3BoK7Yya+dJtRrlWEEiDQJgsBJDmCciWcWFkoAtmouuun3vDFVeO9gf4vs+OPyw6DfKEuXWmw7IhiCuQ7JHnRwII2ASoR2oAV7z+9RsWeoM3Dty8i07arCPYYwbiTjKo7EhSzj6ApP5nE+iR0Vpda9UQQ7az23JBWTQl+ZIGAaCECyllA5bSA0YTFb8w5Hqp8EN6MTbPddnKONQiseWZTHUonx31fiqC4nP8Qv35tJrvmXDu9xaVhLjhiTA9DpApBU2toAABUQVYPfGvMaEXGOoCdWtTLyy+8eavfe2+J973vgday1WFXaNQlgOTrJCV3zVrwaF0GJYDs+2PrkiMeP0wIahewgk4X+H/Gpj6LHRjrUav1mPmLyS/SHzN/NEM0A0q9erbbwjT6yjcrzSzNzqw2A6QtIpYBRThgQVN3vMPmyq9GqL2cyoKKqp4WZBsWXADycqKL9AAITjF9QY9WKANlsgEkfkBw4/fwo3D/J6jgkaU44g0RnPrQzVrMEoBMQ8NxP2tHV9bTWBQ1+f06sH/tCF/CK00yFR/bJkOvN50GDQA96dm7Qq9CeCGAQfUgz4Nnwr8tb/6q3v0DD1Pq/2YTeM1rVI/85Cj9pYPzdxI0sxfpkLcW1CL+CHijIZe0VDJnmWTivNRaFHea5O0w+6PSIuG31JEI0GMlgVxKQ7p91OSwcG5DBA/WOI1wTCl1jOp40bRAqR5MkAIUtvFi8AfpFQYOCKF69jWT7DhlwhrCMLz2HGagBV5vcHzr/nqV//u7Pvdr3X1oHw0J3MGgmgDx4QGoEwAf+YAIPgA6hGrAa3kf1ltzIRW+wMsh6NN6sfhI1SefJHIjd6KDRXWCxI+z3hYJIpoE/GruQwLpLmTE1gaW2DZ3KzTJyrCynRakqJCOpaZG9rPRCS2R1YCdHQ6RfZi3BLYoC2eYnqlRUXJy3WNSiDLZ8+MXv/FD0pXMhA8UwETQlz/wVoDUWgg56+sasw0QBYCXuCEe8bvLmLVgLoD9WR3sjsYOIfgU6GgsB8AS37Saj+PCOAxogFEJ6CvNMvyfSf9e8EH0KIBfOVv/vKhfYNPJL9br6zN1/Om+JfSRJ9wnpifWL0Xxh8mZX2WSu0x8hmxlcBqovpirzR6FB/LYnhovl1sDK6rnApgCHpwEQagRFjzsXhOLe9teV0ZtWEX0bCSwLDcj4K3pUnAtiVcmBETL6pZvLEtjTST4S/wetEfdYAEBo75+UNVblZPbBaSxKGoV/1i6UchTT+u7+cHdKHu9n/m2ku/9pCzLrzvF8pSINVRfCW13yV6jGgAxD4AZ//7uuVFQMH91+4D6FP9v6jqosF8gQaoYb4g6QFkIkxw8KaqlF+fB/8X8/PYMyk5CCPDh+fi57QQsnDdrXP1cAVIMIw7Ss2jfKbsFEEPTuG0BLsNuz1KOrfc0tfrT+otmKxwqQ/5tqE45vxOzhzuzv1HR+rweTJ3bhwSUPgsu/9ItVt4wxNva0PBenD3a68qtPgsINaP4n+BKgiThdxUddt73NeKJiew0++9yN5+fFkyGQJEFA1AAOBYGQVgjyaxHyCM//fsVc/PBiw1gMte//r7LVbwE1Cq/oBpSq+2+TXzo5rYI0epMfskKAlFVDcxje5LL0N1HqJo7uCGyiIPIxwSRrA8NGg+lYiGnOswbDkfRm1xWrQOAVIftBooKPKGxTs4DvJ7Sm0gfaGJzbIaWRMIjB++7hT6igf1yn26zTJ8Jbs8etHvVQRpf+8GMKEzUbIVfFrAJkYhR7JyxFWFbr5Kp7JaQPenvv/lr19w2gPPv1zyXWFN4SvApfcfIDkF15cOy0SgMApQ8/irZXqnBTiNwGsAi1ncQUXPs6iJhnU51JJfq/wF89fMx2IGAJUgwJ/EaPBXwUpY3kvsNnLDT1yKqTSTH41UApWjOtbzulJL3aJWA1CAWmbqyTlELcDEXxP6i1tK4uDEbQLq+L8KrB9GC000mwIQoLLWCPLZg+WJ1I8sJ3Zg4L4L2TW00HuevfEsiTno9+3tAQQYKmf/DYCODQAItk0wBSiseq57PBko1wC+8Jcv3mZt/5+LH+fgiowaAIhqn5x9NeUqf7qXAECyQXxCLTkMLSzvyiVP/MVlSGfEhuaeRxihQtOQB2Le4iCbeqAlH7S0PG523JAcYZmidnIOI4pO11QIxSRYQmlrtDLJ5r2YNyw0NNEAQshwADD+8+vGOwgD81ee+cO5f2cleXPaZxL9zkRwoGGEJ00mGvK8UGinOHXYr13p2KHBztO+/9krfve0h513h3+AvwzUnAnoUhocIxpAXAswCMWUacAyCqBNgGrDz1vpP51PvxTmV/Y9M3/u+EtbKkSpL+eJxYFUsxH3eFLdkxoqJ8TcEGBjUk9iDdUJoMnLDZkh6VDZz/Oe3+CDNv4vmUlxGfun481UQoShAJIXDNpAU91qZiVZVCPTprZ7+obKYsn4MbowvT5nxnfXxgQmHHgQsD1kYHxY5YDAauC1/a0ECMidgzcNAiXTQLQBDQJhclEC5jgdIStCAgGa6M7QdO/nbfDrYxlYA0gz/5gf9Pk60uGbCOT3AsA4CzAcVgdYVCZAVT0DjDj9eBWfYr6k9odfP2gSAJcHUCiBBHfaYBZgAgGCCBJBK0hdt9frw65bb4Fdt9wKd9x+O+zdtxcOHDgAC/Pz0O+HDUzqWmY1yvfluJiSeNbrEZZUB+T92fDDUnWaP5q4bhgHjUrILBFnqUy0ZItK56iOk55rzx3FOLE0IdHgE1LoIkyvPz8um3l2rPd9cnISNmzYAJu3bIHtO3bASSefBCeffApMTE36dSgOACpvhpPXApxz0FV/RboH8Wx5/zLDJkHIVPANpEZo4mYSYL4+3IS2ju3jDABO+KHXLsQPID4ADIBwGD5ReNgmAsXJQL7i+iAbhMhagC+87nVn2XH/B+vlF5JAVOtBM7yy/yExdc1MmbQFSu+N93yA7wQ33HADXPntK+Hq714NN954A/QW+5CmgeYqP7G4FlWPNOPFQWMoVNJYCVAyaFbO/FXQOl7P+VbjlCouNAAEFfCFe3WRj/LlpXpRgsMwkNH32jtt25PtsVriRrBrtkmsy4ijku8wzOeNTkzqVmeiA6eefhrc4173gvPvewGcdfbZTjW3wF5bxq8iuHP00KTZV7p5mM/1OhOcjMzjYbQBIVPyBMr8kKMbkeh2HnzjV75yxskPeMD14P1fSvKjdgIO4HAsCDosE4GiBuAXbfCKQL8vQJoHQF14otPNmnZ/+o0aQAvzRxAQbYAZ3/sIorQO57fdfht8+dJL4Wtfuxx237mHMypdrlJ8gFmXxmzWkACBMAn3QANFesKIOoSfQbY7UavlIX3CEggVSfUIsxs1ViXj0A056vLf4SZR091aSUm+Il9Rz9Vj4PoxVCfCSKpaYsoy/BrzwHe4PkDhW8iCgINS9/NpmqG0RhCe59kjcy+78vuLNVx71XVw3VXXwkff/yHYumMrPOiih8AjH/MoOP6EE4M2wFKiGopUJs4yNqq9I9wS5O2jYgyqjhmYySfay9eFoX6x/4Xh+yHvERDWl9YdAGrl3AhMWPkNQYmnOkYfgKl+qtzGq5zTLzZ/jYrRQf2S/FJi/AgIANd/73r49Kc+Dd/59ne8Ki8jDNmEHlbXvBoLqfOWTSmtHOYJtDNqZGqU4SZUUtpETQJiGkqiFalkk4Ww1CSgOWEPqAVAZPJS2yLQdsmarvUpFdJYykDNuBRqCXQx/T0GEQ2enpdZ1ef3ZDpBWdVyEeuUgqTVWk+MW0FepgCad9x6pwWCD8PHPvQRuO8D7w8//aTHw1lnnc2mqnt/0Ao6jaoysSo8/iKpEYgUT4RSrBCnBXRsX3cA4B19Ay6bbAIiTsA+LMscXCWtOwCE6RWDoAEAsAoerv1+ABYAvvva107eVplHuPh5x9ez+rgyi7F+zfyi/tfqcI13y65d8NGP/qtl/KtiuvKFWCNMqXpX4LF0nnecJImy/GICBVBlQN0j4t4DBhKDYpG2gCApSRLSz3lOXbh71FgJP5Ta4yRAa440wNB76Z0C2NTyMmHwpBkEKysxdiqLPF83yxMBQhhecRpqTQcgaldFZtzzYdJPeEa+kOxMgMu+eBlcdulX4IEPvhD+y89fDCeeeGJM3lFV1ErlhxNDWsa0aULhAiEYJCELbjQBH/HdD31osvf37/KCMHzlyGkAsks29+xjRQMgPb7pOTcUNNTrAO4w5gGEZlaxH0iHKo8g5THz+AvzO6mvpf/CYg8++alPwX/+5+ftmKt7gpsQAdKGDpAxPmRn2iGlJFUsSAuhep4ghwnBmghCqHhDQMhEDSEub61VB1dMxO5ulh6mACs1l70FGhKr5lIYW4pD6jyRxJe8FGVNUSD6IdQYYwavbo5I9m49ehHi6dWE4aRZnnQuJlYFBYoyUBZjI74IMq5Xw5e/cClcftlX4fE/80T46Se6yXuTUI6DGEpvkrUBzvyQ0YcGhCrAoqqzsXPCKffvVWzzZyMAAgCr/2jOcugwaACO2OEHopbL7ECnASxC3cWL0qQfYX5IHUhJfH14hamF+d3vjTfdBO9693vh1l23+VzEz3xHJw4zYaEN5zIsZ460noFlHXeCJOX4KWFSFEaH5ntBPwthdyPuJH76Kok6CwBGs4YCr/jCzEulSBhT3g1ZR0YFVMl3oHUcVB59KiSbBk+KtyGyskhYAD27kprjniDqdJglkrcAcJ7lO30y+UjZEuqvaaRZzOwCQgNpxgj/jaM3Mp8BrTN4AP/8jvd4jeC/P/c34ORTTk7NTGHUQHwWHrwNu68xgYA8QNHzzPmw902ne5Ht+jd6viDOu/c2ik7bb9TDetBhmQiE2bTGMObpQMDVizMByFT346hZB8uG/aTZCIvxfuIw8nMM3PWXL7sMPvjBf4V+bxCkPmrVO3WZgP4lVrNsiByO2b2sY8ddXHTeCTKNAlNpor8BeNiqbF80yqzFvP3jBBPtToP4nhY3YiyjToYHsvKupdVnyG6ENfSSfnaTcjAoNQCR9hTKIlIwrq+IcCFVnZg/tULSUUKd11k9IzbBQuo5KQ+FI5fBQ8Abpb1Iht9MrD9379qrr4Odf/AieNZv/Co85KEPZWFE0Rxw/c1EPSC0q584iFItqrRREXKAAfe3Y+A3unkAocac088xvbP9DSRzYH1p/U2AWqS9KxCmwrJGMFh0nwnHexNp6R9qMJvyC5BAAETyi60fQGBg7biP/OvH4XOfuxSkMUXq+5QFmQlV5xFw0MyuOyKfoZaGaXgmAXuKjSVDYXwL6FehMkES8ygu07NKRN33olblUxiPnZYJfFiyQcGY8a5SSYGKu0mOZ+UAjdF6ApW+QzqRqGFlTBhrlQo2p5gX/Qux9WNhISfM/AKpHvggiowvrxLtRsAAMW0WELQvDI49y4xzcwvw+lf/Jdz8tJvgSU/9mfRarwkwYLjZhYRp8ZG34JCXjksJkqZExpxnhd8HE5Oz97/ucZ4dEPRgvekwaADBvgneTu4NbO/4TTzJb6R0rsQOGjbG8f40pTd3/gkSB5XfVl9/AO/+lw/A5Zd/C1xFYpT6yRGnQSBjCswZP5f2AHFJWGT+8JsYR3urfQFAq8ENRhLml/xEEIKib5uYXrppQCsHkZXVyECENgbQfEhQzg2ACtX1D75luGS54lNUDSpcUZJfg4CW9MpbX9QIKziiXVG2yjrpK0Xb6PcCQDn5KFSboG2IK5OK/JURAA5xnFwPp6yGu4lBGLQup6G8++3vgj1798Av/tJ/BeDRgYrz5FcYuhohk4YGlYqX5qMICODd68DxwbzxTM+S33f6HjSBbu3psPkAgNc9h46TpjnWG2e31mg2JYRGJRG09C+ZP3n5BwOCf3rPv8A3rvi2H/eNTMUagGZ2VCphcsgJKbEVbU6WUpgkY+4Np4QNmqEUCAhIBCFuEjg4NouTjoDzTCpPWhvAyHTy/pR+4kyKNQcA2ZsgMn5zjgAWjG8iuKVS6phZ6SFjSEr5JjVZCTN+5fjCfKTKGHMiNc2/me+AVAlB1UEY64+14N+LSWEirUWkrIYscF15qY9Z//DmCQYQ+NgHP+a/bPXMZ/2yZZ4qJuTXEzhjwHC7AiSNE0I5ZVjaUY24AY/fthWvvY4TCPUObpKcf6YXzteZ1h0A0IRpjmhVHJSKUaMA3S2bTgElKzAyfpL+0u3iDD9KY/tW64f3feijcMUV37GWRIdVOZHyYfVXyfzhHED3zKDyubMI30FTwaQSZh0XJMcApTGfgQHG1Jj5NfuwFALN6m1j9BgTluczCCLItJz0DAMuFu8ghEJYcgOoDitpUfKZhzpiRhFziIo8xmH43NNO2WxFyEFUhgW1coAyI4/0Y6BNl9Q7VPm8byVxuMx3QgUVsagKs3S9ka4PMQsgtJ/zQ/zbRz4Bs7Ozdqjw52JZqthuMguxcAhScgay/wE723ec4iR+0gBY8nvptmiTOhbWAtSy2mkAGKt/EJjLVdbk1I6c8YNEJBU7MD8WzB/s/v/43OfhK1/5hqvOsOpKWIRV/ygJlWc2DSVpiZo6UHA2KQ1APMQSi3LVLnUuYiEWVAKMM/xEE0n3ZYZa6rpYXGciM+vywYGY7ufMjPl5Y/8CggyVCNI9BWTy1jSLL2e93ISB9vQBcrCQeAh5ieIQqMpPnHGYUhd9TP+N7QvsIEUFLKI1YV4dlGUh5UMUEohlpwwsZWTGee7f/8/vhx0nHA+P/pHHWh7OBYD2ByDvUyjdhkSbcfFmprbHqcCijjgA8B180W+es950WPYDwMg6FLZAqpMfHycmtg57Lkp8yM0AEcJXWfXp3z7xWZBPg3lvLCbm9++OnnVuSFRyiSV17pRyFEYqUj40Q0KMHdIPAFJ3JmEwvRGo0wUc9KEzvx9wcV4BQdIiAlBJXsQvwup/yxTbHBq4FqK6LM6rYZVYpof5fcwZqVzIk7zmlEYEqKwLYcH8PaQ1EAFGaHE/RrVbg17ytdSdCVu3G6CubN3Wrm4PACweVMxf7ORpYsGY6THLY6g6/T5Ox1e/8pow80dgQDGNgjnw1r99C5x62qlwzrl3Cw58bpswKsB7DCFmWpE2A6zw28L7EAVVNgMDDl9nWn8fAKOtrxLXiRzzD+rUDbrVluy7e9xZE2QkxtdOwP0HDsI//8tHIOzywhJWJsPwRxzF3ksOQc4TYGPqLEm4wE10WKX8JEs5UF1Nwv7jz4IDJ58L/W0nAEzP2PJ0A4Pbck7uuQ2mv38lbLjWaiiLvSjoE4tgDk6yyFxRDj0SAgmoIPdI6PIk7aV5D1veEfAxsWbIF9cJ1yGVaSoswjyL8R6V4cxcEXCZ8dI9y/RVBw6cYOv2pLtBb9tJQFNTgBZc/Xh7vw/dvbfD9A3fhpnrr4BqYS6+DPUoSNQEIAAtUabZoNiYqOGoaWRgpqQIaKFfPfo3r/1r+N8v+xOYmZnNR+0Ep+P8AJH+AMAgYIXfZp9TP5Q1COuMYyfPW3296LCsBkwAUINxPo7eJvs7DdO1lZgLG+47SGwHSZ2WAzPZK+Ef+Mi/wb59c/7bbKGjmqT2S0fAUPGopL+oj7HnSZegnJWko0eW5xlkDvndPgb7tp8Fe855AAy2W8af3Qg4PW0bdBLQfR/OhLkHiyeeCr1zzoMD938MbPnyJ2Dm6m+AaBuZmpwypGog5W84C1PjCbmPEs7SG9R7MUoYiOElIGiIwCHneTTKw7jzJ99dgFhZYwGypBYABI1D3dZwYOtpsPvcB9m6PdHW7ayTlI5Z/KYa4mLvnXAK9M68Bxw4/+Gw8WufgtmrL8/e7U9R1aDLCOfH542rRCYfhXwKwEFy7JKABXFdun4W9ghwcW+5aRdc8o/v8E7BRpVwvzM8k5PY/iCu/217tt5v8s77WubfbQXHHoCp/TzrE44dAEDibZVwi63qbRYkN0OnOwGVbYzpaQPV4uSO3aTVRkFuheCACggQrrzqarjim9eEb7Vj+mCIfLCR+31gfMNAICmhAI3ayw/CyjQBgdAzQk/yOxnJxqa12824hjvOeCAcOOt8gC1bATdsBDMzAyid1JkA7kNxooG4Tr1xC9y59QTbaT8Lm7/wkbBPnWglWi0gLCR2lFeQD+fJZBVIgKLi5/ILVJriEZP3Uh7eeHMZokc8EokQlfZRXB8lXyOLAuUeWMMn4/rWIbb7jPvBvrvdH2DzFkAHrE7yW2CFrqvbTvg2JD9P1tSqN2yGPcftsHV7BmzxdTvI8odFPxIHbZLoyFqk+ohANj9ARABrEJjgEtl5+cmPfRIuesTD4e73uHvse8ACx9TGL15LqxQ5Pfsze+C44yd7bgmMlf4T9pixWmJ1i72+ykb4/mEBgXUHgMXNJ5n9tZWEs7bxDvShmrPMNG8re6EGmdlG3IO06uWoqQHY8X7b6B/51/9IKj/KJ8MggQFA+HQzqs6fdYok62XsOTruJAwEDAIIDKzt2bcAcOeZD7LMfwHAcY75N0E1Peulv5mwHdV2UmMBwHTkw6U8kOU2EpmchgMP+lH/JdnNn/lg7CVBO8Esg9jCYRJHK/1Nu7tZxqSGY6YzpHhFGClmLhuE00gSSrQHVHcptqUkGB28kGx9CrwfloTbuh3Yut19xv0t818IaJkfHLBOB2A1rFm5L/A6AAgjJ65e7bNTPSBbt3MXPMIDxHGfeT8L+wJgs5pR5XZ9xJvahtV98tOFA7MTxK3OxDdAQZMJM/fCjEO3kOhtb/l7eNGf7vR1N5A64slFfqGQ7BsQSh/Mfbc82wKcH02csTcn7dHdYZHh3vb6dtvHdrUNCa0prRsA0M5LJq7fc92LD9y073Gd/XMw0XPLgjowQDf111Z2xyL1gOKa8CTNAHJNgNPj49KvfgNuv2Ov96L7HVcFCExS/Q33Uoy7C8nT8iZIQ0UoqWMWR7y1rnF9Bx30YN82a5OeZhvHSnRjHX5mahaqqRmoJqY8AFQTXehYAKhsR+xUAQT8Cm8LAItdCyD23oEHPhYmbrsJZr59uaotdgYaLSkVFyK2OuZAq9dYFsOA/pRW9DVoNEVtF4OqD0iMXpJMmsGU8xxUEDJbOz5I6m9S9339Wpv+wPbTYN+Z9wPcuBlwxpqIk7ZeJwOwGqtZuY9uunqt3Ac4qwDubgZor9+zdTvp63buvIfaur0ZNlz5ZUialSmATGuDoHf8ygRDyCM7ZhlICUl1l+QwddrBdVddD1/6/BfgIQ+7KKTNq3wRQh9Ak+mb3hnu9yHruq9dMzj07fUCBt9fz/o9Jk5+3OCP3vcK053/I9x58SKsA60LAFy78zVbvrfrqn+evGHfY7sHe9ZpU0O/Z5lpkbyTsxYVq4I0HqsaSJBZrkMDoGekT3/2Mq9iJw0A43cDjdj/BpMaiJozQC37p6TSxfFepXVR0ATCpiV9WLTv3HemVU1nNwXGt52zYztnp2sZ3x+TlvknrKbahUnbGSesFtBhdXXBpnHQdvKDVoL1bIfY94gnwPT13wWz0ANxTooNChhzyhXTIgQwSdo8vPhNiaXAmKYylIXUxJ3hVEh7YRhSDK61rYZ3P3nCvQS3wNq37bf3nIdYlX+zBdQNFkinff1W3WnP/MZqVm6Lr66t18luJ9StbeOBTWTRts3+xUU4aIWB7WKw98E/DtPf+w505g6C9B1soFmY3CNCIjkGmNFr0QYpWjNpolDlVQasZU0LxGff9573wYUPeVDUKpyp58Se0UuTpQP6ZsDA/OwPAZn565cE2D7dI4MHFn4Hzpp8wJ2vec9Tj3v+z+yGNaY1VzG+u/O1m7o3HfzIzPf3PHbmoPXWOiR0cxscALhZjn0IG4NC2scv6WJpFECAIEoQG3T5Fd+BvXsPssQPEjYyvwlagKlMsvvjYTJTIPEEakd/fJ/rAFo61baTHdhxN2tvWrXfSibH9JN22G/KHu53opoIhwWAaXs9a1XWTZOTsGWyC8dNdWHr1KT9nYYN9tmuNRlq69WeO+/BkER4MgNQpJYPNrnkQmxeQ+74jP9EBY7hwH4RHtXXcSHVExRpQB5L3sx5UN0HBbwwtl8EcwA2R1irIjGrwqawB48/BwabtltgtfVj63ai6+p00jK8BdQqnLt6nrbhs/bYZIF3izUNttk63WrNhOPsscE+27FDhWB9LQd93aZsQVGOUCdVrM/wK0PIAKUjWcJF/EsaoIad3c0bv38TXP7Vr/ly1qw9xv0jxebxHczbPkG7QN357O9ADpt238rnffb3msUf2XKj+Qi96TMbYY1pTQHgkp+9pJq+/eDbpm7c95Bpa+e75c7EMxr9Ucv0XYhz+MP6/kwvbUot/v3iV66AbMgP0yaQxjN/FZxvGK61JhBN1th4qJJWDSM2GtW8CejAS5r5E+5mbbRpZv4JmGKm7xqn7nf9MWGPSXtMW0k/00ELBNaUtcdGe2yaMPbXgoaTapOzMH+vB6mOmZgSMIEA8nhyAjB3p4L0oVRQ0g1T2TCdR2bVYajCyvgCMhqYOIxiHgFkfkXJ8Nk7JT5TrF1mDs8g9pg/8e5W0gfmd4w+6ZneSnxj69XXb8cCgatbW+8eZCtbt7Y+J42t1679nbLXFjicH8aCwNy5DwD5MKBMvU5Mrq+57rHQGA2qKhGQLeqD44azkK6jT3zsE4HhuXy1bDqabSbLlWH4cIqi0wTcr9PJnWnQ4cNqPDCwHegHg4fANbvfRpdcMmzt9yHRmgLAw8/+wfMnb9z7uOmFgR/uS8zP24EPEgikVXwU5zsoizXvnPb/zbfeATf84FZItr9Rv0kTCCYA5EwOqSH1K6BFWlEdMlOziuoasT+1EQYz1u63nbPLTO47qM1LZR05xkuTyk9FrrCKbWcxwJt4E/aYdIcNcFqCMxl6O071HmxQDBU6UpU6ljCYYlAvgWJZDGimQzXtGZRmoJchy31U268hYPGciWlraZ+/N8QlLS0V2GC20QKm9mUpKABQW62ov+l4a9+zJmWZfsIxvQl16erUQEfVLVpAYN5wdWpHXR0gOG3MaQ7G1u3guONhsGWHAjolqTOpnkAsOpSx0KgQcuaP9cf+gUxDMPDNr38Lbr/99kzyU6b5KG3APdPlwzkAp2w+p2yhZuzvdBWOSQsA0zYCWhC4sfd4uGrD82ENac0A4Oadf3V2dcueP5k+0INKVP1+mN9Q8+a/VDMQRPs6PKvYFCIjZqkjXHHl1eA3tTTJ8+81fYNx7/fgBwiSE0sQiUmJSoDxxfn70DO+OKncjcG0ZVTHuCZIpcD4oXPKRg7GHvJeony5svCXE0qVBS1jOzpwR80ZPHYviPsjMgOXTJ46Z5JioXj6oyopLmSdWqdR3sMs/ZAbhohMGpYAAc26Vm2ZM0KQjK6i+r5up3ydeG2KAdU4TUcOuZa1+lK3nLYLds5Bp4W5URiwmkDfAoCAFQrAqjpEATTkdONwsonXEIWMPJMgE6QOMK+P2jq2L/3ipTzKQbEfkZ7F5nifIOzjMoWB4WftsdEGbLJ9apMtwwb7O+uY3x4T7rBhtT1u6f9v+quPnw1rRGunAew98KdTd8xNd/pJ5XdMP7DSf+BBgH9rUf/TAp9IsYaVxGMJ+a3vXO/PDSppbyoe7ktaQEJ6UwBL8YvJ96NJgoLqVvt4te2gVrT4eQeVMy8wMHvoCiaeO3eyaDfW7wm9QRjtdFseOAfVgIAnPBrvyKztSIJm9PQFZNUhITE6NA7pqInZYxc1Juuk+t7QA1viKmbItQCVJ6VJCIBR1qCqfoN1xWTrq+vqlrUoMW+8Lszvc1Nq/TLZULeuDt3U+56rVz76xD4GAWULBGTrFhVTg+RQ1x9pAITE/Fy2OIIU70t9QOxDmGk94fdrX/4aZM5OrQmA+AIoqIjThgGgCscme2zsBCCYtQw/0wlagVN37CgI7KEZ2LX4J7BGtCYAcO1L/vpM3H3w4gnX0/uUSf7sqFPZZTVfWp+tOx4oXkXYd+AA3Lxrd1L5MTn90hCggAJG7ADUHVCpuplGEP5IvuJMLZ0nU0VGFymfqdS8lJO09OeOKh1WS6zIUG5mm9cEDWi1lPtWyDMWjF0wbfwXpVc4jzMFMHX8dueWOsr6wZSvVGcCStg85/cCKs2AEVXqJs2t4HOnDWFidiCT1Wm4lm9DQgYC7ld20AtryAQ4K/tYJwwxR2lfRQY3AgyZnyBpTgKe2teUBAsU/QkUKAR2uvqqa2Fufi5qAKQkHenREj8KQMH272IwAaaV5PcmgLN12KY07DC4s/dz9Nf/fiasAa0JAEzcefC/Tuye6yBLeofwg0Gy+8O5MH7uGU47AWlKHcqdXX/DLRCZQamxGfOb1PEw7ciQ0s5UU4KcufQdhdw+gCeGYLPjA2mGwWx5aSyj8i8mTAodk6K6maQ/5yylGzuxvBugVNd1XYVr07gHJXBgE0xyQDExvViLpQbC94Tp9RggaSDP6h6B9NALprfKdbO9Ur1CWa86PIKgCROGWP0X6RyAUaIaHjZWGhiq/LAvBjAH4dyMUvmkVD89Oyx53bXXcj6T4y+Wm02A5BCTxUAUONIx/AQy4yMPFap23Fd34M6FZ8Ia0JoAgJnvPanjpD9/24DYzh+I7c/hag0gpBl+hQ4eGwtiv7zhxlshG/M3Fdv+eijQqNl3wI2R0vQdL2MEiGpqYxSCQ3yHwcR4UDwPWsPw2kwJJtC8FiZBjPkN1yaCWup0SttA5SSM+TQZM2YSW1+DUuMb902DqRNwaBVa+VYUsBBoSYhZHQKDJClgCFWQoCqmE4Ei13gkDd1mkhzpeo2Mi4pxAWQUJflDdJlF4mtwrWI5stEXI4JF8lJDAkFOl2S2gIFrr7oWoqZTOgSTWmQZpE72orcVebgMY8k4rlooZM1q2N97EqwBrRoAfvDKN2yvDi5eYFjPFRU4AIECOVCdo2i8TCJIuJJQt9y6G7Qn1xhpRFDef2BGgfgcCqOVHU6QHCCXuJHCM3FyDmiJCYkpVXwpFEE7kYpWPpc85iKNgsqLrSo4QAKDpAnptHLHnvYlBE0DW5gM1bsjOBXMHk6180/lUdWT5DFX7kiBAaQ025yJuoP4S76b1V12m+/rvCoAU0xeevoh0yZNS5ykZYZXqHBIWkNovqRR3vD9HyQzRzz/qoNEs8AzvwCAZf4Fd/RC+IAPd2/AjNRjp8dc/370lo9vg1XSqmcCmkU8Dw4uVlCHedNEmMb66wRcjsRWU7sDiJzISZiTb9zmp/6atNgHtA9ASx/ye7IRz7ZKGgYqocQdMcp/yY8OkSQxd1LK3SEdEQo+LYqk4nDHj9IVM2kC2TvkhJJpI+XQ783eZiAqu1yRcVqwAfY7lACW/hIpFb4sYCyLh0iQlYZBvSaFdHqxFbd3VkbpA0MgM9NGRlD2ClQaAAMdarACnr5rotAJbZzXJcgU38LmkL4m/gj9NSn/P2qBCLtu2QXSCbU5yN00vKZm6e/Izf6zw+de5e9w33DzAbwqDSFefxB+3XP7awN39M63dz4Jq6BVA0B/buG07mLYxCB+q4/yST9JbRMuLAmVsMkZwI0V7zswnxrV5Ejt4qWNKiA2YJY2lBpGiJhiyYOqw3mVDhKTRh7FKG0QMGMUnXqbxM9YzkD2ztBZJQFK9QBqkxJJvQ2FMuTR5ZH4zPktj8bojLhxeqwG16i6YkM6xzzHuqO41qJWeZG/sS9QKfnzzJUlaoRj6jKxqqVfyM2sTUXT4T3+mDtRJ+jKYUyU2BEaDTNsFCiUdytS9WHLdecdu0F/UyFbkg2Q5gL067y5Fh0A9HgQhPugDHs4r2ePPexzbkHd4FRYJa1+LUA92OqRSepDM3zB66SOMjzrBtJwzqHSW4R+n5K9LyhvkhofbTYIc7z9b87r3PHURyVI9XleGxo7p6z2ir9lDts6LTY6aak9ZNKq2MgkFMNExkNUTKhf38DP1KmShGKdRqRzLJ3WuBT8IUvzrIhZr07pRynHaXNDFzt4ZdgTdnjmHo6KIQEybi7hIKwVTeCRlbZoAlIALdkXz35gcqPeV0HYpNaojUikvvNsRS2SRMtxOaohW6zG9Syap3v3wQNzXnihMDGnQzz/JGbfPev9ACFbwRTgwjhNwC8MYqDwwx/sVAvjn0N301ourR4A+v0pr/4DsIMD41hv9H6CqkhNIzkknC/0epBmyQGAttWMrHhTKi7wJ6FB8Q8BZDvcRJAghb6Y3otlXtLfkvXbCItfKEqFkRFCeZJkSnkMPSnq6/F52ZTTV5/EB82sKZeomFjDQAhLGgVyvaGkWXKx7rE5Z0DaLocRwAeljs6ikwWjSN+UmyzNrKagKBW/VvGdYCMo5seiXmUikERCzjtx3cpOQbLSj6RIUn9U8zukrgX4AhhEQYF1Vm/9ft+vVHQTlKKZo4A8AYvcozS+6ZjdDNJsMgnrM1gQn9f1FKySVg0Ag37d0WObJCgHccSXYypmIx0e7+b9gBu1P6jTNSQfQPLaJsaJXK97aVsv0h278SvMonoapBWKWOQ5poiZMCsfj8UHVLwj5kV8NSoBiZx9zNLATHjmEiiiXXzeeZOr/OU6w9SsEywKqfcUkFehLgeL/iT9Bbhq9U6p3/QwRcAb5ofGJUMzq0PfQ9EmTNRaFCzmXSUVPTzHeBbuE8f16BWhFLKzIHyI0rXcd9uH53UJeXcUx6CPTGlI0C0GqjnfMqEkTnxgM2TgZlP2V82/q3cCDoJrVwNZUHXiRWT2CAURYtOdjHlAVy4jt/bMqqm/Pq6AAKm0QfgBy1qHJlgoVQFlMkszQ5iFlHK3IMof14T6DwHo8X0NXojFG7At8RIVUL3DpK5aIldkHpNzNbS8shmsIgSOocg5WIBN2mIrTu6BVN1QZKuNYRqvLE5QNwxrhllE1I7H+KYICZm0zzImAD3gNEKOQrcJuwOLMHN3aw84NYNbDWXp4ohB1jc0LPAhZoEk4x1qkEACgoNNfYLkkGnVAGBxyAjT5z1FI0JkfX/ErbfUcwzAgdRvtytztbkxUCIyMBjM1Xw1xz86tfhPA/FbVLcohaU3MgAlwrhV9ijmb+ANluUTYMNYHrbEk9RCLT0hgmaUmhHoEniFKqfEHARNXUtlJGSl8MZjEV+ACiDzEwQMxfQS1KMwoh5LnRoVL7WffiEWjkwsslKCgWabhNNclmg2moL5JXmMDJic+Sbt0a/AV3YISi8JoCC+JqSw7j/WonP+Veg3MClr0pDGcWb2bEPUAgiiF50gjq2HWUQAa7Br8JpsCIIZg8uZ9E6IjO7qtI5hOTDgkLSn3HZQJnl10/irYaaSzsMJo9rYA3NxksC9YF00XLGpRAFsBtGbnaniunxDCIcUKOuKDebnvAAU/ZUlWNw5hSs1yy/EcMzthKJucUi+eIcbUDyqwUNpFroKZdss8a3oh+R7e8mMSKp5BAexy1EnqvKpMILaioGJf1AYGjTiSn3y0Cilh0gxO4Y9uvh20W+Y0eNGgjoOyRsViNp7ExMd6DAARP+EqsB4rsutGT+eQ36to68BrR4AopMzH1mPVGTe++JJNzTEchZ93lPXVuTkZAcWFwn0pBOPplGSQEybIiAESUlx5QmrqdKT4ruT9ElDNSknLZC2vAYYFke/PnbGNIEEdURQfVEeInUfIddUKJR55Mtb73HbRMeYUh/4qvwWAMjrYrKJmeJWLwRZn6BYfk63tAMyOcK9iop7Ki4VJStLGgQFQBhu5FCEOBdAS+yoDfpYut9Q4nvpb1wQ4u8RoHw2PnI3wsbNG+0wftI+2vp2JgQzn4wqdOwoAgZ1yCetDQqs2oYIpDY5UE0eCkDNbodlq2J7sizhj9uyMVW++8ubgCT0RuUczFW+NDEkNGwMUyIkzRGXji/+BVU9mNv82KyC/LfltqqeJGkw2afRKSi+DszfH8urNAfQM/H0FNc45VXPJoyVqp4DiOpyPJfSmSJvCJn5oPMfZ91BagdOF2O+eYYjT9AJPGUgYllLpeqgIb2k6Fu6nLrs6dxEHwHyLRPLC7HvpHqN/QnVO0CzNaplIcFc2LZ9W0wqKRSFYFFmRjIF9AGQOdfiDkIwvDJWSKsHgGiGJA5I/xIlGaA4hShHwRZyner47ZtjJwrImyoQdadEjOpWAowEBA2XI4rqqqQtd+g4U0w6cMy2pKGIytLmzC4BUVWNMRIzxE7ryeT5z3wgvDJOg54wowonxbhJCqGa4gv87gSkyfwoAEMYosgPxTRA1WuZF05PwDeCgTAQxa4QfvP+kPcZUFoFDNGKlUT17abKpWo+7yPQBAqJr/sXpTJGoYIFJ3L/OOnkE0HL/ThdPYKH7smx8NDoNP5guz/jl+E8sxJaIw0AYo9P2j1P9FUZLuQsiHqTNagiqcCTTzgOpAM3Gk11uOQs5IouwCBtlgFFOrw9OSRtIJkbpLQtDV55Z8XitvzENsMcIoUlU96qyOChjyimh2Q7I2jpCklrgHJkRDEi6roD9ZviZXUYS6TBJ4FIbJ04yqDnxSPki5Qkb7GW/G/7KlBVj1xv5XWs/pLx9X1Jx7/CRLBJayHSP1D1lXpcqUmqvpS/FUjPkJS6tf9PP+M00O2AoJmfgUgXrix8WjyuSDF/s+oOidbEB9CGSNSKZMw0/P11z2pcOU2Rmej0U3ckiRPgO3Vq0A3IUtUvRKkhDQ+qWXqqDZFzEZw8MhMwZxoSwFAAnEYcIOdy1VHjYigsomTP1FkZdAdMmWTPtPRoGapUs/yygiE2OSEbtpAv82ATcFG9k98fHkF1P2UNuP10WHgdKc1QM1H5ayAa2FwxwREZrjGv8Lx+SfaT5HPJQqz8NI8QlJYi9Ri/UCRliJ0Lw/NAKq6sayBdqaks8SsjyO8FOOfcswE0uBYCxz+aSXNKaUb0KxAQ1LW7HBwJowA6D4qJY7fIxqEo1rU0dlCfsypt0CknbbNe1crPkoSE0aC9r7lkYkDwozXSSTkTel6AnsUmwAKYsZW7NpJPAt7tlXh7n7DZI3Jv9Bs/ur0PqtA2yAMLDgT8B9FrWSAVNorAQZhFlqSv7mC6DnNACEFtNUZF/HQZi6c7cpYGZYJIw0tqM4ZMqTaS2lcPyokeWSFI9aolrmfyMOMt4/UaYt9w383DWuqX95dgBaPmuu3xOpnBgHdxss+ZgSzXNZAPk4bMR7AjGWxP9RI0m1qZgVJKyqqPFHBp4Nhy3CY48aQTotKQtCy+zpsZIJP6Le0Z7xdha7A96BoMA4qqkkqViiAVBJCjXIyaUQl20midTgVnnXE8fOeaXSDqLsUOxU+ivDk0qAxBeZu3rmOH1usB0hi26rBZ/oL0xd4ibxBKtqORBaIaOh4E+EOnDgzcAG+fbOfEsF4DQsd0jeR3eban87yys/bLPAdQHTwIuVquGZI7Q+y8ANkcB1XbkYVFKAkokmJ8goZyEMhECE0AAVE6Bv8HxXPivIYv6HCt+ipExfBUSEYe9lPpA7eVWVxMm69aLnaMW9WhTv1RMfMPyG8u2+O69OPpAwYAV7du+7VB2GbcNYCZO5AAJy4UEORSteeLJ1yJjIOKQ0n5s7g8PMYhlc3p11EAnnfBvf3ej0EDUOtXUIBPc4nmD2l/BQQkf/jQzkKHiKukNf8wSD6lZBiCpUMPL4lmkC+rCXTvu58aAIBjJBSOvv2E0K5Tuy+t1jwzi82MNO4LAHHMG3WQQDaEfelC5+3M7fdfpK3t4TqpY/racnJV1WDc4eZpuy8e2aO28Qek9kRgieU6rd/Dzm2Z1rNddm4OunvvTBJR1WD0AQixuh4+tqkkDuQTh+LKMwAlbXNA0dJcYuv6zDKj+CAMjWkUwTw+pSW0kq6MpIQZcyxpEdi/EmbR+c+o93t+2qwDVvcRmdoeHalXIxNe/Cc2kuJWhyQduLq1MgsWNBZtvdYWUHBhHrq774RoJkaMNZyzOoETSL6lbwhIBNAiUMUVZk+FhlJ7cpEf+KD7+2C/Vb0yAzKsjxVc8EXm+CjioWL+0NebjLJCWjsnoDA0JOkB2a86jy5faLEry7jgU3QA0O12iurS6A6gba6kviqnWeaQAQAsPPBRCgsIBG3DddLqwB6gRQsAVros2t+eBYC+PQb2vO71PSBQLwDDwPJ3b8Eei7ZjumMh/Nq+aePbTmo76MSuG8EcnOO8qHxkXvnU2WQUI5VHbkvZ5dA2pyqaSdOC5fkIFKCeydKURJPZEX0WIs3087ruVHoIpRMw1bfTANynvh0oDnpuAU2o4/5iAFxXt2RBl/qhjgeL5OvV1eW8Pwjmbb0v2gp2W3G5yu7csQs6+/dC6t4IekhVbxWWArnHoPTeJm9RFt7GoACbrfp/7/vcC+Ieg6bok1i0Vybdlbc/DhkpYGj4DFZPq18LUDgBU5VKAaCZ8aibqsI1CkWg0ASmJifgvHucAl/75g/ipAtisBYVzuiOi0Figl+SWccdnKKTz4MPFd5k6byQAYjrSNO7roV9m060HXAGqHJfcV0MG0/6rat7kLYEDz4C6hi/J2Lf5qG27+nxF3AH/Xkr/Q/A7HcuB1ERUw4w75PAU00lL1HqpJpOjBVFr04AdGA+ZJWYUrp8cDaG/FD+GlVJogUEcyqp0JAJxKwNQWlaGCbcpEVcA5i65RpYPO5U6HembZ0u+o9m+g9nup2CKQ3DBsnv6tVqWRVazcqaZDYPfatm9Qf2uZ4F1IP7YcN3r/AzOEuve6ownr0IaeKY+KJ0/cSPeIA4AnVVhPKHL0enTvSwRz4Euu4rxlH6G6UFpDw0+CSrvFFMv3bM72j1JgBhIbcLE0AzesngmGlOTUCM31ELDfWQB97NAsANILvEpq4rlqxiEqlkNxvLa3ziDwixAnAwU1CYzSUqo5/7bUHDL/nkucvTt14HB066N1B3xjr5utYWDcxPFDzZfjMUt0DDO6ysxBpUNh4G9R/DXvhU92wnPQhd9wHLa74NMoyGzFC5EzCUowSB4RQLlNcxg2UEA2oBCtBx9LnqlMr/gNw2aQlzAvv4LcAICKwhgMzkpKQdMOA4cD1wynkeAAb+0+qubg2EHaaC47XyzkBbr9Yf5LeYZ99KH2v/ZeF64NSsA1DdcQtsuvpbEDWbsoygZiRSXhHiO5FeTKCcf/JsS71JKp0uwmN/5JG+fJ7pTWD+KFRQ2lS1jwYALEYbil2fAArt4EjwAdTIraQkU2JL+dX3ZRqjoBvE6s3jy4109+QTtsLdzjoerr7u9vC4k7Q8XpuEkIKBuEEDRkkePugYfAP+FbKc1W0lrdYDIIiqHPJTWZ1+4/WXwd6JDfZmYP4eJMbv26MaOCeW9RHYTuo7auWkP/I73XZOC1ZC7YGtX/qktW/7gIrRUKv+sRNGhVvVEqp6gvway/6A0MANTFyMDJpQDjNCvgsRcXxh6MgQvgnz1suBhu1+ZaYhawHG1knNdgjWfdh4zaVw5702gfv4pquZ4GMl//3AjvUNhHrt+E0yPLBWQbOqnZ1eO5trHsz+O2HbZf8JxtlcaigzKztRYvRsezhmdpIt69O0MZJrSvCgk5Z4D3nohbB1+zaQ/QXzj9UyEMgDAoD+bVJP7HcqQDUPk2PVvO9pDYYB62IKZ6o4R1G99D/c0dTqMSjVHcEFLam4b7vTxzz83hYAPu2lgmEJGt9ESvIHBGD0ZYdfzVLeuZBrXqii/QeK6X0cqlPHtV7d6duug97sNjh4ygUhbT/8ZDvphGX82n0OreuP+O0q/kaBV3mtY8As7IfN3/oSzNz0vSgZdX4FwCLzKabL2xyTr0rATvE/Nfs85AlIh1eRJFwcZZTJS9BgEmMjZXAf8sEAjGp41p3XmPwXJqx5F5PM/Zu64wbY8L2vwoEzHsibyZIfLXEfZu3bA229oq/X8DntoHixl9UB6/xe2Pzdr8KGG67J1W3AVAekWVpXetIKNFMT1cpJLSMBNXdVdiZyh+10K3j8k34qMr0RxleOQIjtpfxQGUNrfqgBtHkYhZMGgSNhHoAnhVhFOPFmESCImxUyxNL76WeOzSiZIHpi3ZyA+9zzVPjGlTfFMePaa+wUtgkDiB3Pz66Dge9M0ii1NwMgSGVA9hOEiUPA195+dEYFyfJQHka0z276/lf983Mn38f2veCcCod1YnVdJw0dFStxAFnpZSUcLh6ELVd/FbZedwXoGXuhAiIbZ+Fas2lId8zVW1RMrEcDQuJaXUeu5RqS8loOJaa0NWSA8pST5A80wMizYmNDmiPP9Sw7OLmvOA/8XIpB0H4sKGy44eu+vveddn+301Rw/HUnrPNv0X8VRzSAwFj8rLX9HbBuuf4K2Hbt5YDFlOPYz7LqRojDe5rBSUl7FZviFmAaKHR/R/iRH3skHH/88UG74S3E48zTDJAImj4AkXL6HFLe9TUq3vGVsDpaGwBomACpUuPafz6yYcIIDi3pcaORdoSwqvFjjzkfvnvtLjvsU+sBBdUH+S3+Jnu8nern/QG1BwrP/GzfEwoQcHzPK7XfhxC8Uw9Ag9amG74ME/tvhf2nXQiDDdsAJqb99+jsMEX4fJPbzbVihqY+TBy4E7ZfZ6XT3ttAf1AiCSk1/Zgo77dRnYGsjosKU+eo2kGqOWk5kIWhUouB64piMhFAIDkISYYTY1aYNWSvO99MmFQSPfQq6r9tB6/4MhPVNadpU5+94XLo7LsV9p3xYFu3263PZdotCQ316kwr104m9CO0dn/3wB2w/ftXwMbdtzCQiHxNq0Alj6E/CSOncgpXp737Wfpz3Up3JO7L2XoFG2/rtk3wBCv9vZCRr1Wj/OYOwCTTlMQnLdG1JqDaV6Sd+ADKLnCItHbzADJGR4WQMq5fFEgdSUGgpMoqECgRfNOGGfixR58HH/jY5cHzHztdipMcTUmN9+9gDQB59CJqWrVku+aGrCCz+JwDijeEdLN7pnffAJN7b4aFrWfY42zobdgBZIEA2QNcWcafmrsTNu65ETZasHBjBeAnh/jcsYRiOYqpSyTTQGlDymHW4oWKlSPj2QJ4oLQK0YrExEgfSSHItQutgVCst7jMWu0gRALKWGoKyJthch5kl2EjFR1ctuHjn/we8WfZMk7aOpv4xgdgYcupML/tLOhvPMECwaT/lJp/ztr8k65u995k6/YW9+3gANZx8hRAmMdR55pNVjwuew1K6lPm+RfmFwalyKBJ9Xd1+/Rn/izMzsyoT9Wb9MFao9X/UNa0TkU6pYBViw/AEw8PZlOD3ckAVktrBgDR3ouiWDpvHSs/TRul7LyZGOUqUAGKrs/d/4Kz4SqrBXz76l1x6FTekqehOncEE2ZAE7qiG66T3ZV8X60DeNgBpvCxSXc+MH7aqo/L4OTk2PQd18D07df6rwfD5AYLAJPhs+A2rvuUeOW+KuxAgZ1SnhlR5HM4UjZzxJP968N9VuF9BrGl3kTSMaPGuf4JHIKkN6mtSmTVYBylpdQXxHdmvMTpCtMg8sYaFOGHmRFi/g2H+wnSLttu+jT2w9eYPT4YD7hTd1xnj+s9cNLELKAFgcq+b8LWbcdqWZU1tyrTSUxGVV4c1lSCqUeZH0C6SGJ+ucYo/dNCHwZUH1inBy096rEXwf3uf0Fcom6U6q8nAYXsNOs71WahAUTJRHncOFcA1oTWBgCQGTorHyWAKwuRHuPgJGmkE6KEY1K5ZCZa2OsD4Qk/9UDY9fefhN175oOA0Z06dlpG7MLrGnewQUjOmMhcNQTrqgNxY0g3kcbasKYWNVFm1oVJPL7hbYeuyJ13oLKd1X+uupLPWueSHrFkrngHFAdGp2QoOnvlsZBqMb38RvIfQAS+xPQpL0pXCMzJaWi7NUpFSvWVwYhoW+JrwDAv3wD7V4g1AqIAQcIctZs9WYd1E9bpR2x+JctBvgXh2mTRf6LdMb6x2kBVdRKYY8wYQIIjLpjY8HlZ9KTe1MeSdBcNIC46AmU62N8zzjwFfu5pT0nqvlb9ox8AMg0gbTQqpBldHYl5QKkpqXylT+gQaQ19AP5E8Tdlv9oMiNK/xQFQmo6ZuIlJkO+l05OTcPHPPBTe8vZPw/ziIDQyJukjUgtVQrLcN5yzPe7sdb+opw6fZauCVlCJBOYGqoXxYwJps4vKTVqpKs/8/jPi3hToQDkrMZIwftZpoyswjx+XMHN5CKD0IWR1b9Lk6NBXtOcFk4mlQAB0ffHqQT16kN4lDj4Epdrxk7kPA7QZ4LjIMzp5p61MwvGS09e7rbtKO+UkrwFkTcWfgnd16+q1Cl/+SfWS9IqM2aPppCbsQJLo8eM1RIUmILY/e99rkcBBCm/ZshH+x3N+BSanpny+KvlUfevnxVI9Bn8PpjaTec2xDaWTC5jyswgMcrW6v3paUxMgkOZaghIIGkgn4Vz5cWKhVnNyMaW2aAK/Wch/edJD4B3//PngVa4zeIXY4QXxoxOo5nDupKb2Et6rzhCGGEN71EF9dGEpq0ktd7zC6/gD85v0EZO4DFUzO7aANxbe/7IeARRXQVT1EQrGVt58juu1ByUx5J58GSe+Jec7SA7BlJrEQczbRYBDYF7uxUlBHhT4TuWqOjzhJT+lug3Mxx1bNB6uX/k0fKrbRhVC2J0YkvSGmJQoH6GfCYPLfV4sFtR/vkOqXupcK5iZnYbf/K1fhW3btrHEr/gIkl8+W6cnAYnYi1pJzDNFYA+FVlpUG88QJd6g5h5KK6XVTwXGmJvUnaiN6eWXVKcByPRYrnyRXCCdl3QHFARIyZ51xgnw1Cc+GN79vi/5ySMhPDFQDYp5OCwOi6HEwCChEKI6CLy7LZYdArWE5q8UYxh2TB+SRIgTeRRjpiG6BAo6ROIBQDrTXnXWbWKt6eqTX4RYR6VzVEqf/+oGQQW2GnmhgUk6LMIQqhGY6JMIIy9+x2AK544MX0v/D61cQQBMrmM/l4K/Cxn32IMIrCqzIBpl1AAoqfeSv5rz42cZulWIOg4lpvN+gLpWWkGY9jszPQXP/a1nwRmnnxY0PaeZVCYu/BEfgBHG978iOSDO3Uj1p6RKZHTtCyiYPwOG1WsBq14MVGPiRhyGWlwolDjZeGdyB8bHoEhCLiiXRPr37uecDBc/5SLodkIHCppamKnnj6TgQphKbMKUXxCGrVhlr4K08Uzd4d9wz6O8s+vduf+1Dj77G+KHX5CdfaKaZxjjhHFz21mGndKmJVKLkmdMgKZ/w8PQJMwdopTSlDxoEZTeiTGfct7IRwkcpPLE07PlPnJYqIcq3vfz+7mO3K/x9eZU+q4/r7zfpBuu/TGR4sgWZtkEGVV0mZTKoEA6jAotniirxtBPkn8nyTBmSBu2efMs/NYLfg3OOefswPws9XP1X6v+COWCKamZqDXRMH4pDyj4xvNOWwdYEa3RhiAlRwKUNr++n40AENucJeMDpBmGoT3zV2TiLtw/58wT4Zk//yi45L2fh71755LEpCQZkkKbGDLlFaN6leqWYvohCvJ95E7Mah6oX7F7FeIjv98/C5hGqREa4BfVe5JXshQlJW51fnQGOSyZ+BKOeX0q7UJP503j5JhSJWUqSG0V2kFuAurmSfWBmBy5SfWV2lFZisUScIbYVqDBLZOS6t3M4AEMa2Z+FiBiAmTMHto/blBTU5T44Z01nHzy8fDs3/ivcMIJxxeSv0oqv4z7q6E/0fIAJE86q8IDWpKrMsXhwYhakAHCETETMIJxCUbtzN8EAYgNn7odx9PtmrcxJG+hXAcGPOnErfCsX/wReO8HvwjXXn9rsXuNzAGP7AhKFjfziRowgIU6t2o2oYdVd9LpMwNphpTUVMcvq8096g0S1alDxzF5nUh6JXoURRBAwJiOJlIfakCdi1hq3VoaOLRzLeazmTrkIIGQthpvNm7SjfTwV3JgYvZuLMCA36W0xDiuTwR6AlAKB5BVjcTfsq/jECADg/194IX3gac//SkwMzPrnZEVH0H6y9BfWgCUVH/OHao8NyqoHAVQPgDdtuW0+TWiNVgNmJTF4kbLb3uY7AMXZzli3h1pGBCU53y9wTppnn7xo+HzX/o2fOoz34ReX03k5LjZl2GzHxSxF8P0yAFESc8dOvKFdFQEmf8amBnSPob8vABRHBJSHUP8OiEl/oS1HuCMErWogyLfoF8Zg9Ve+IoxNQUg47LlocU5MrPpl2i4xATSoMAgag5G5T9pG+kPRiYWxOTJ21zvqvG1BFfgFXhFgK8Okh0g1wIiQ6l64bH+2ZkuPOUpT4SLHvYgz+ie8TPVP3n9jcm9/mkEh39i22ACglKlB30wMERNgcf/4+/a0BoAQB2hONlf/JtdQwrnQ806jXeQE0o7phaPxsiqgrP16Gxn2d+HPeTecM9zT4OP/NtX4KprdnHaSgoTRGYENcMNhtYvqiIhM73Km3IshvZGUK9Mmg4/j1E1jAUJ9YK8FBZY6nENy066ka8U84f35UyNUlbSVZiAKGZKTzoRpssks8p/NglJdthJy5aTmgog5kUQiAjJuaomI8X2VGBBIuAT80tGYuoaCFU9JHUeIIGC8vyLRgC5CRCdzXXwVT3ggefBk5/8E3Dc1uOg430/TuqbKPmD6s/DmOz4Dfya2jVZZwREeZUnN6eMeuh61U5AuVb1msVbHa3RPID4RwWUmdXAkFBPyc2I3Tnvt6CEv5bOC5kkyZZQ2/BtWzdZbeCxcPU1N8K//8c34Ac33RkfSIqojPejsneNiqOkTcyGlsSpOQOQAE+d5edZhVesGdKIgJXCKWoQ/B4EzpOSbIjq1ci2qtjLpF0QoZoRMwACnQ/PbVUGHrFeNKAU8xWStiMMreOL1CcGSdXzTYiHSs0nAKVVqbwrysGNGKuVCUWQgEi0N+K6CejJIEpJE5C/bkUhBDA499zT4ad/6rFw9tmns51fNdT+OOPPe/5Lp18p/RnGEaA5akfpiBqAXg+gVgCKDyDOA1gbWj0AaN0doACD5m/Q8JLar4kAmrMlVbpZ/Wk7ofGMOOOSF/bcc06Fu9nj6mtv8qbB1dfebO29hLJpkQ4pTUZ5vQkgjecmVkmdHVKoknCk47QwoXcIktSLTksYDHXNhbzGd1EEsJQ+psqK+dVtI6pPYA6M3IbZm4OYUumSzrEugIkNN9xs4DxiAsyQLoJy0qReQsQaAOqKikyuNZ7cXenu1wqMUr8T5o+mHe/b7n6rCuG8e58Lj3zEhXD2WacHhheVv4XxxdlnWrb8ikIfUz1HwEKIaypilUfm1owPkC2R1UAhxxphwBqYAFB4sjTTZz0nXif8rctbDQbRXTIm1dAGgJld/UIacJFfN6R87jmneDDYvWcffP2K6+CKb30PbrrlTiAqE4d4TTyVOBtfVo6+8ikiiS8VxKCBZUwlrThd1J3AR6HIEJlkjQDB7Coqtnb1x77EZdBpUz7vQANY6K1FnWf1odlV3jUUjfP8lvc12EbNEHN7PgJCCqtVnyPFJJlVoFV9+fWTfmrfF04//US4z33Ohfudf0/YtGmjV+fFuy+2fpUxfhUn+hiDjeG+OOsPIQJYLLFM585qQKQ8QpL8fM5O7ShcZTFQfGbVI/ie1mwUgDSzS4NgIfmZBO9jJZSdTPeRFlBohMV+IR04aQcaBOTcVezWLZvhUQ+/LzzqERfAvr0H7IjBzXD992+FG2+6HW69fQ/ML/QSKPvOOQAsS4FJKufojTzoDEkiYzlGLbax7LYr2oCaoRjrJndwJQ+4qrgIJDHTsZ4Tc5c2owFSMfL0VJmk50o60ZkF0WTK312rNiEl8eviPQrEUDvkoMEsdV2ACCkIUtJTz+UnCNuNu0HXmekJ2LF9M5xy8g4447STrKQ/FWZmZ5IKz0wevfuVZnqZ4Rekftrpx2Rqf8P7D9yuJByQ2iX9UlEfPAogDr8sTh3rCkjfP3RaAx8AQaMQ3PCY647pvl5wQdRIzRFKA2uB2GB6hGGE6j62aAOIEBnaof99z3fH3UJJbKc5ODcPey0wHJxb8LsA993mFPxtgDizbJiQ5Le2h6lOPOQZAQdq3MWmHNVAuWZEo+8QZJZGvCH4FFNYKlOxFMOrRAib0eUkMhQzZnDWGb+L9Mz0JGzaOAuTU5NJTeeKk/hxGK/SEh8T82Op8huVVgEAnFFtLkZ+AKVpoRKa3gehljPrdQD+AQ0EzDtrNBKwdjsClWYAJlWfQ6JEEgTTxoDQsP5MOhEdKB0iCqWEr6h8AKUWgKonocJiL5tto2+YnfVHOXZO1Ja7UYRLxqAWUNDMLrGgCCtrdmkuWiqfzdTTvfJdACPfJ8IdSNUvZe3TfGDYlQRqrQpUp+CwFmFSeCxif/B/mZll8k5u45t8aG/ILD/do1LW0jujIRjVgrLcYX+JpiAtFgNFYVnGWx2tzUxA7SH2eQsZ1JOAIvNHIpbCK6RWEMDino6gGwhZRUtaAGRAIJ1UEtPVLA0JK6SlmTPeJVUUPschukAWVmoio3lrdFZ1/FGKylJprqSeWtKjYfFWct16W9oflAaQgMCgMD+q65zpobD546w/VH3J4xFlAopkxivqUopUR8XgvHxazwREJf0TIKy4N5a0JhpAtLsUw+doxWGxpUegWMng0GTFtjg56gKUIBBVvhKzC0T2klc1kGbIPNU2JEqp5NKuKad1eNytT91Qfan1DUWmG3Hb7i+bcMj5sDgNxBgCWpEh8kSl7BpscRjKLBfMynejBgD5TQyctu8q1HwXwZghDj9OVNv9WRsWogRTOVGjLWoHoAaFYp8A7QgM54dUG5pWvy04DDKJWTJ4KFbbvXAdHD8AhXIwXMq3xdGSnxL7Z+o+plBpfOCYqU+mZ6nIxLIYUREOuV5u+HLSPJKoTfluQB62InezDqIqREUsgmG40E7yjGpH7Rdi5kc9h9/vKajX9BcaAKAyK2PvggQscmu4thd+RUgqEwAV42tG93GV3wyTo3e1tDYaQDzJmR8KEyCPLWO4VKaSLnHE9bAwH46QHIDAv9EISH/bTAE+9ZoAqXypDjms6ks5qOO2y0Vc4imAFfT2NaAVcVcgLlipR7Wd5zpRI4nsGb2kOSajZ38ulxTDS7tKeBDe+ff7/IJjk6v4GZuL0OdnS88/gOpjmIYlfRzCplDS3n5q0QKkDzY8/0eICZA+HTHqKLtVHb38GiLKyX1DuaiNcqBXDyLkMib3CWCL3i1NELbVa+/MbcxaZhOL8zIFCaGW9NOzTc//ili01JRi4kMqM3OwNbLavLdkF0zvQf0MjUgChd8pfyW2Pt5KIY7W7sJJUtWTECile/hnWux9ZARAgFKDzN6lC4cQRwCwrJEayt2LI8+QXgughv8i1yBkkyEOkdZ4FGA4AGRxgSuD6raUMpag9giHQDkIpIZL0kHHbbPB8wzhyDeVjK8fL5nZQDtz4xK/AMtgBhx2vkQl4iHeW27kZaWBQ6OvJHvCmG3SP/cHaIaHBAgs5SW1KMdFHWgBGlC7Kbm79bBWokL1F1BArQko5tcgUMGqaQ0mAoVcJHW+jfmpaBRRbwJwlEwvNbk8eMOMldvuSwOlhoOGapcaceWMMYp5hz2+HOZeLh3KM5Gaiszy4sszJSC3VQKpH421SuNr0/YQW9JszQw23wktdYqqtTMHHveOqAkAiK6vDcf4vAKEpvBgoR+ZPwi7coe7nLGFip2AUAlWUkf0CxwBJoD74i2UzN8yApC3Ybga7tej0cyvO108Vw2iGi0/k2cEAcqGHSZxcGgWEnjh6hjxLqJRSypa2wCLu6hRgIpG5XAM5zgkLYwSs+09oNqXYHSk4WiWAB8S40Mh5UUgYC7hk92vQSG9p9nyxUSuURUZnXq6DForABWmlgT7YcIjYUcgkeSgJv401jZDQwPADChUjIaYaD69VDiOuo+o+R5S82ETKEZwdN4F9AYWy6WCcYQoMUyqixbxGH8QSIsXlX6acEwjc9F23na99JO4jDjLSe9Q47SIYn0na29INj0IEACkGLpMqEJVfP1OzN8BpZOjxZYN72th/qgBpLjhE9cE8bsAGUAcOq2BE1B/oDNJ/DYNIJWnuE8ApCVEo53bOvDS3TM2UGrxxvPJBlRpDslI2xtJ3R3NasNyqX+Ldw+tECx+cEh1tIDaoVKhdVFbllW8uFxAq/mreF+GlxLWePnQoJz5WQOIp5rJo9Qvak49ox5cglp6BKa0qNbzZ4Sh2Q+g9z3UghVL3lodrYEPICASaanecAiGKq6VTZTFwdRVAWDYfBHV5ivs0Oq7dYClz6DJhKPTxyxHmIXrga62Hjwke1ljlj28LWwYN6yEWjrnqPACO3FUsp6RKHtuhS3WeN/QsCUfhgJLFeNH+x8Kpte/AhEqE9ohiDC0PqRHJB5oQ43C7s8mAAmJVlArk+EIAYBazBJSq8qwqQHkspIKjaHQeFqorA4czVMthFlDDetLiEPuaL6IbYoFH6KKNyIdgEJDHNZ9RoUpwIQ2K3Q5hCsMXwmtRRqH+FrVThlAy3XhfMKGUEjxshG/RprFi9v8GNq6839ICbhS6ssDJRDwtXwYBEHFWR2tyTwAil5JlmahpJBmQSQtQG5FlWYURebC/HylhFmz6uDsDNvgAZv8DTpLKioVjxft38hTg2iph5af1KGw3zBMHabLLEcfaSsOjkgHYHTxcTmB2HKj6AM4JDUc8WItvzHrPbrhRQimc/HGhGCOnfHGABrDfhmDF2sA5HxwBABA2hU8ZSxzBlIp6yELR3UzWwzD94bNV2kNzkACYTQbhPsZCCiAUacqxjAAabumlifSHYlPbQlgS+Sh7Dnq3jBEaUeZpfWB0JXb4g87L58Znk6ChbCOHocjzCFTrgWkHoCq7kXkF30j/jbFRvmO8DUmyPMeTymmnzFzVP8Rkpcf8vtU+AyOhHkABonSl1c0csl5CA970iBfpUIR0RISZrmt3sb0o8LUNY7uwIdGuKw7ZSwaGhmHRGhLpQzHFTyzHFrpsyPenzE3Nu+NSmK5b8chUI05tGEJ/mWeyrZoe1cZQOWlwIDc4N1/sh2bSIUD5Dwl04b1LMJDp9VrAH5LGEGotLiHNFJ5SlBYfhiknZYr9lviDktyKLUkutSEoHWiEgizoqy4XOtBq6yXtcaipV6FS8P50NdnO0vBkk+WeBVMRMz2lMjwLmrKwvwmSXnZ5cjzPK8JoDrXGuAImAeAjAGkZiyRku4QdYO82OFhikgbhwHbmHwp9W+J+wrXlyzNyvoiLjMTo3WcpVJeIurRRbocbVXSStiaQGlc4KjHALKh3kyYtylKuESCSwBD1Ikz9T9/OPzVowB8HhnenvsP3qrD2f3xC7qrVwFWDQADMn2vjPAWYPIJ7bTXD2U6QNiHNmzMmMABV8x6iQ71ueWnOSpvNOSZ4ekNO89T0zFWv+TjaKGc0bOhYWgH8uUohO03cGR6bR6A/Lx4rgCRwNLsD2hrP8TEA1F41uHr1m52bZ9L7ABAjj6lvSbDxrN9WCWtxUzAuQEzPsp+eb5MmvUDEc9jbtYHxb+5ilQSLkNajCJpcoF3zEKLaPFi1CtHyfyVk5ITdOwI/aHkC4iNqg/1ndf7spp8BONjS7wSVMp+kacp2ivKx41VsFJllts/SZ8w4xtm/gEGUPBSHxLjD1SncNqzMQdhlbR6DaCCW9166oE3ZQKa1aS2YnaRSidP2bNpFPOPqM1DBAN5rGR8LCPAoWONYuWVZSx2tFWwPw3JCBZxinsyCqN35C2TaQtvpL0KWjHTjyQcctqAfGjvfdxLMLvKRqtGvVITFfcCXyi13zO8Y36n3/dCpFof5EcL/ZOVjVPZZzrmNlglrd4JONn9Xr9T+YSMB7MEADLpwSs4JHPW8xoKFVMgNEfDFGPNqMD39hgMVsuWOkMYbkUgEAU/LSveqFvZe6mMoDq5vubxViL9WEqRoC1/2P4eHWPJSlR9Ag+R6RsVPUqEtJkBnA/e3SIBUC4q5BUmSwpb0m6DyrZLSuq/Y3439Ofsf6cB1JT8AKwkJIS255MV9Ga718MqafVOwC0bvtGf6i7aPE+k7b3C91nCJ5kx8wLkmyLkFdve+MO7BMGhS4lDfS5LgNoCAVYEWqRPl8HdrZejrpaRmGLv5cVfKlzFUIC/JBjkWLA8wpLpituw5CuZxfXHW4a8Clp4vjXF9mebXwYjnswjmgarXsJHEagx2f6dIP1p09Ri98TN34BV0qo/L3LP3//9ff2J7hf61n6pEYMPA0Ty80YIBJA+xyygl382q41C9OFscWhMjCPCkmqIo56PzI8Qt3HSM5haDYwWGsX8lI6oRal/6QZlcZc62paXr+XRbKwUODpO87SdsDgkeDnM33TtNeQ3DYu/nPAyxYKkb6BSvpwL3YGA++1ZLWCRjz4f/h7/OnPBqdmTlq9mJz+PF1+8H1ZJa7IjUD019Z7Fjnmkscjk/JKxvzmmrxMYOBOATN5wErdhgUU4btESsoiwBPYfCkzg0vdLYT+kU+uyFbfaL6ktSjNwST4ZQfn7SBn+/FvEXbIG1Z4AsWM3oqQWJJUwtr1p6EuH5KQlPg67wPIhbCaxkjkgy6ogyN/Fz5A4+iIq800nlg1rBC5Mtt43xnMsbZiA/ubZ98Ia0Jp8YKw+ceM/LGyYOdi3zokBsiZAPJxZSxkpzGPoA89ncPamGckYeQAWp5iDQnYzMf9SMn35TY2jY2MzYCg2KErSPPuBUsJngp7/0FocAM1f0PmApRULPfJDyf+TlTMGFSg2pHJoVKWVVHSNRlOw5M1woDELsHx5s1eNfPFySM3b8UUXz76T/n3+jWP+dRr3lz0A3NTfKWv779h4sLd96z/AGtCaAMADXvKSW3ubN755odO1TszKfXoxApv/HfAhw4R8HYY70H81hZRqlKqpWcFtEmbJ+NDyUBE6uimLHlZyCA57ajhohMdbGF8zPSQGyxge1OiKwolctacijIpfaLleLaAkxk3AoEABUh4kYgI0uVJ1tBQILMX48SYOfxCWf2tYfBx+KycqTBZXvr4CAZGYpJmfK8Fx6oQVsFb6Hzxuw5s2PvdXboU1oDXaFNTm/+QNfzq/Z/4XcH7P1kp9oDJIe1JOTQK9lremEbp8E4hH0DLU9pZLXMmrhPnLB/WvojC7cZinnCDX7EkHBYbPnqPWJGBkNhozMVpjDb32lYJD4pSEI+Kgsi4oTI/1p/k39FqU8dG0LPTGlfUjLvNQk3KF1kF6iLK0gnOf0qw//4CKo9chO3PAOv9opgsHTth8R2f7cX8Ka0Rr841hSw9/5St3DU487gXzG2ah7zQBrCB8lzUcUSK4YUL3kU2q467GpFR23Q2G0/IRPfoMSop7sGORwhJpyyM6TRr+dsq5nE9zCa8lPihpCoV0rbWk5uFWOUj9Lvuoy9+aj5R+OK9ZOFHziM/XMd34AdWWA5SmIUWP4NbaTnCIlNp2hGrQHn9UmlQ8TSNjtwco0Auqfp1UfTELpLExMH89PQEHtm6Eg8dvef7GFz53TaS/ozUDAEcPfdNr3tI7efubF2Y2wqA7BYOqC7U1Cch9AhtE1YfY2WqqxTyLw51L08qkAy357DAx0tIhCJbJ+MMzQZrZWT/P1eV0rhlapljLF4rrNmYWxm35rQV4dTyStDhdagOVOr27uF8zs8dfARBK726YCKCZXzF+y3msuiXqGZcRsry7K+HmQyDdD6S/e6Znmzg6zoT57Y9l/v7MJMxt3wT7T9n65pNe8UdvhTWkNTMBhDbfY8uzd/fN8XRd9fjOnn22BIsW0bzBn+xAH5PCP4Ppy6mRlDKYqaGQwsuL8nc5hADDnT0rSahJ7cKsQA8t9UGDQ/NeDI+JU3t3lSgICmiG50LHWB4At9dLNBT8e2XrN+T2G/aM0pB83CDxwiMU231EEkNyMSrL5fSeIkf6nTFNXDrZIp1csFBrnDAxzvGGCdeU8ldbjz91O9CfnYbFE7bC/tO3fmDPjsGzYY1pzQHgvJ07F7/7nNf+l1vN1JvrG+78heqOPYDz8+DGB8kjXVB1BAzqYs8l4lrNbfNhXXNptS27G1sMi+uWKKPS1WAz4r1aerWdRwYvASAyfZKaGhh0NvKT5VB7x6Sl0sj6NDWTwYzHQLb6RnZ2hb02Sdm26YXIDgJSIBAzlTFkO8vpR4blvVT2h9FQpm7cOPTla578vBnj58148w4DYLpP09cdaz5PTcBg8ywsnrwD5k/b9o/zNPGs83Y+dxHWmNYcAByd+7rnLthO/IzP/PKLv0i7Nr/Y3HLHDO4/ALC4YBWBvlcn0YOABYSqgjTe394L3ZChGmrmQIDltMAyozGtoFFpqVtUMDxl54mxc9VYmwGQ+QIkTtsLW7iRZWu5VzGNznRLALZGavJDeE/cO1+AFgGyz2857cCwzYf586hAgOLWWbBkm+OIey0xW85VqEvHtMTE0c9FWiIfxGm48vUtsy/a/i9mspP6ddeazTPWfN6+BRZP33FwccemF5758t98La7BNwDaaF0AwBFn+C/+8zmv/QBs3/Zyc8feJ9OuOw0csEDQW7SaT9AIqDsZ1b5RkvmQ87HCG2v26mHNJdJemB8ARjvp1H3RBGgZmdZxFAaQAojl5puWUDEwF/1BL8MW5pePbtYQV9Q1zQBIX9LBXOoPMwVW12YtT1LLvUN6SarnBpy6BXTWWb4wMWOlfwfqyqr7VurXW6z/7OTtde/4ze85sLH7++f/2a9fDa94DqwXrRsACD38dc+92v489Yu//8bz4JQTfgX2LTyl3rP/TNh3EGhh3g5tbEwbJSoq6/tQG3n5Kp2mNUKf+C7pBJSuw/+M4WtxjtbJmw6UvOraH5Cx5SplA+V/lvcMFSq8PxFpKUwPkfGNY36vyRl/XpvwJV6xf6PO4pkf+cOgOJTpNS1psi3r/vBojdcX3Dwse1rzyyCXI/dmZq1X/xQ3kxYGm2ZhcNyG62Dj9LsHWyb/7tw//aUr4DDQGvf0pcl2HPzSH77tLJpfvAAX63P2nI3/ZXEGLjLk1llX/kB7uG8Oov86ahUONw0SKv8td+DvtoOcm3Cd/fqj4g6X7vlzLZVEUrHeKh14OJWw1FrGPEaLTZ9LeeXZFy8/D8fVPAyXhgLrzLve9s5lkUKPdiBp1xRKxSLus891aUxT4ocwW/dVYH7XBrEd3DWmc9Rmg9Io0n7+2Oi1UXwMazbM4ySQ4qdLoIq/Jp1rDcbFN1JuAUBK70epVwH6mkdRav8pvYHVfgd1H+prb/kcffgb74bKXL0wNXH5+S/5hWvXS9UfRuuuAZTEBbyGD/jIm//heJhbvEj6WwTXqAIy6f6Iq1X7Grk6xHijGQRa7iS7P6n1NakhuUEdh9PmrfP0im9eDt/+9hVw0003wO7dd9qwOej3ewEEIGkS5atkotlooU5RwrZ5EXS+M8ecLr7Y/sz0ExMTsGnjZjjp5NPg7nc/Dy44/wEwYyWdMY4JrGfb2rysAAUw8NPBeQ98fjFyA7dpAS7HSLjKxi9Fd6HqUxHWeBxjHaeHWmip4DO3f/oer3vWq+KNlz4dDjcddgAoqdZTQVr1/rwhWhl/OWiwauBY5lMN+1wP4+VRyjH8ME4/gPm5efj4v30IPv2pj8H+A/uLDjkchNIGlClOcLCHsKaZJZ+uBpWzJqg1ck7aK0BZ/MWFRdi/bz/c+IMb4MuXfg7eMz0Fj3zkj8GP/ejjYXpqOuSlU4F429zbnPPLRBQSSU0RCIbq18vW6tdOVIR3B+5PWUCVKSh0/bx2Yw07ZyiaVe/pt1q6ywHAKum12/9EvoGiq1J3xWYT4socBSO0RBx6p3h4hdSUzGLHaxNAZkUGyX/9966Bv3vz62HXrl0+rjOHSKtDBNlClgAuGHFSht20xPbmUgtjt+6Mw0wo4FA+wS/xozgSRiUDRPFIFszm4GP/+j647KtfgF965v+A004/k3e2kRyQZ37PEMEBkL9LN6pu32WDAo4YJlTlx+ZS4eFUCiUa8kTqxdofIF4BwvouB4A1nQl4KET62yKedFWiAtVCTVtm4uV5/h5sj5alv/zOsLT6D0obSCaBAMG3v/0N+Is/fzHceuuu4Mtwvg8ItrDYxImZw2FAJq9guBJ7Wp7E5GTL0kkh2T8Zpw/+F2z4S2KtoeEjd/glldodHMee37rrFnjdX74YrrrqSmsDD6ypMwimTuHTSNOgIZoKur6W2RRZ3TcBrowh7xiWCMLIflAoSI3bEdMwU5jMWmzsv0q6ywHAVoqqBEwdAFR9FhXbhrekD+LOp9KFRloEbS22cnWxqQhmt/iXyhu+g9fRD/ADa+P/7f99HSwsBH3IdznvIHNOqIodZcb/6gMNn3uHJ3rQEPBAdmSJEy4d6B2kxhRhPs2K0w7gEt8DmEAJMXsmAJAAjaRvlCMv/Dr/xd++6TVwy66brBPMDgF7EKCsHoQbKavARtW1M1srA+JIrTAXNytte5XQkKwM7262jAMcAwA5oxcU2otUbkjsRv3lyE3yrJbqQ5A7s9FWS03VOrvVeHWaByB9wjn13vKWv4E5a/tHL7kdFzamYwdAqjCaIQxbHt67LqMdVQQDF+aZ2ajfqmIPfJVAgT3yEo7R+83vRQGRKoCAG3zxIAEeJESrMCUo+PKLRmEiaBw8cBDe9rY3wqDf9/4OWYNQznUYMuNpWLWWUWIDtJqOrXGbt5vxhvUlatXuggarOV+1fnCBjH0AtlcMSNRYNnVjw7Fw9fcVIIwcpROBnAQzO1ywEWXUM5w5WBXRUgGhM3zuc/8BN97wg8BwSk0P9cL5oLYMQ8x4XifsUUH5zeNCMuWL7PhNr0GGBdJKbUrS0s/Sg/h+FKZF/kBUoyJrkGm+Yoxfe+134bKvfREufODDwDhNwI0EKPWfksuf8ynpYaP0bdeNmmqL0BLWGldfx34iHhJII1U6y5nY12kl4RZKQ6ve13+1dJcDgO0YvTg+rnxAcXNIVbFR0dZxY39rtmZoUGEEKEABRwPJimiYFkBLnjvn3yc/+XFW3cX2ZmU6qtahwCI9HJMGUANVJn0xQrRJ78uEFEtWLD9jxYp4TVky8dNukWMopavz4NsV2ZcxiEDufj/5qY/AA+9/kZ/7npYKi3RExfQ6xeJD6COlwVKNi41LHBIt9SMAaBuCHCJAotwnKEwcUXJwDADoNkH30iE1tg+X6wIUynoO56gvil+FutnDLOUgB4IMaFZKtKwg4AL6nx/84Puw6xbr9LMqf1Cx1USlaD+H/Dt72VdVTTxppnxTkt55WSQoyq1Yb+7M8G9QFnTlhXP5/LvuwEGyQ2TamEmQuDyGgMHGR0q7PrmG/N7118Ltd94Gx28/AdLoCDCwtXBUwVyjCVdwhx2bw7QExfB6hDViHUeB2L+0/0LP3ATpchCxLgyA3aV015sAgPPR6yshCE0tioFAq1xaC5DGwRYUHjaVdGSfGj52NKIonOiS0jjFv/rqqywzdxPz+wmOyoHm4wXJjCKJTZFzUa9b36F7b0lKtrKZlM8udH/roHEAMWapITvfZrWS3MCMTmGxVwRs9FqYbz/n8sEQ57rrroId248PTsDyW9etjYPDqrFZ3tYncIk2h1xRahMUqmPKMvbUBylDBjXDJc4A1e2AZObgLqYjYCJQvc/9CjJmfRlFSkG+SETusYTX0j0zHZIQ89TUAhJpxSCp1CuhnHlSaJIQeUDIy2233RacfdHZZtKUU6OQzZetLt6RS/OW0kCzlOVzoeMalLF/gDRezep41BBCuF+jIEBAMWaS+DVBPg9BHsUM3W+97RYg0GPk1CxBRHZVojaQhyWKPrI9h0gHlV4UJKmWIJpIRSq6hZLqz0BCEM2dGmHV23qvlo4AE8DsptjBAUgxh/R14ZmwSCTXAKBkairuATN+htI4cr5JpDLOKkvKspDLEIBrfn6BPfyVL4f36Fdh+M3HF6lMbgENbxmlemXiJ63cQ3Sqggpr5Ig7NOoCKySM6VHo7LKHQ5q4QxDnAzlnHoT6dcAl4BA3e2FtwucTA7AsLLAAJC0xW6ptGTW7MsLitziPfQVinwrtJlDLICD9U4RPfFjqXMyanPHF52Gr6U64i+muNwEG9R2xWkVNipWOUdrHyibFl4VTINPaNSBoBG/RFFiRWDVFSdlKFFEtdj8/d34yagB+mK4Ki2b0CsnAOyHTFBENkjdZFRpbVBuxqZsaiq4kYI++3KL0KwyPlNDUN1btnXh+GysPWHVqM+A5/uzg1VqVgHy3OyEVBzC03rCR27Z77dfNouLImCM0AdVpuDaTUJLQWJUFFOgRDkEEcJti13fAXUx3vQlg8Cb/G9VQyPtChsCQSz1SaJD4KzU2q19IiXkw7/OZU1ebILgcjboklW5+0YJKHHTctm1pnN8DQFqRJlzuzmrHXDVCmtsvjE+t6JVlRcJE+wEAUs4qFHCQxTd+H3qAaPfLNckn3Vn6u7TqOn3V1oe6RT0DVXXCNDo3ofzbtu0IAMamQaMUy633WOJhz60A3bVQ0RpU6nQJ5KJUKTMtT8UEkvT38x6AP5tX3Qh3Md3lADCLizfuRtOzFdQVSzJS2Ys1s4MCW2FsUm1C0kFdPfMzlMajEbBIXzVyW39ZTmdscBw01ESRhGJbn3nm6WEIUE28CZNnkhrvvejGFaJmcFKZyfKV6QxQ+gWCphMygkWGE7Dw+gMQAGXp7uusguTgq7nKnKQfMAgI82NEbMrmuqRK8GU/4xxIy7EB9HyF/DovndThSBraXjikztJjZd0mBUX6J6nStEEtxUN8AMkMAP4Di0RzN8FdTHf5TMDH/vIvz9vmvj7UC2YVJdI8nKM6h+RUyuKENCnV//Bz0HPOqfRBgZ6SnAIljuog+h6oe5Cu2/qh8PndzrkbzGzcYM/995UhfP7FhGvivRAwhIELQ/4F3iuB90kI8WTufRXTAc+g4ZkAIu46bEHF36BKh+y/UIbH9EOm07OyoavhdPk6Vo9C7Fh14f4JJ50Mx+84Uc19wFhb2FZZoNiuUe+jwABbzoorKp4nfVDWR7QqH69lI9+6qe5ntr/e6AXwuvPOO2/N9/hbKd31awHAfxzkm3nlyvbhChAAGuDQ3EMvRcrWFNTpfmmLlXYxabOilQR0MEkoGhYT8+dajomJLlz0kAsjoxIzXPhsmmHgq/h+YDb5FZVbPrIa78eFOsL8Kq5mfJQt2/O0CRVzI3++jZBtd4xpASbgiLM5fZ4Ntxmqtkso7GI98uGPhcroxUuYtB9fXYVKr2oTl63el9Idi2AFJoQK4NUzSnBkAkNvyqI7abmNWwSItH0618W34AigIwIAbD/8Ciuf6QtC1H54EsYW9Ocbkbkhb7TE/AAa3dviquRbLooAAYJmiYqoGP/6AwH0lN8ffewjYXZmJkrfwEACBiZ8WKVmYPA2NjJzuXiVl+g1yX0l5UV6k0nhlICGlMaRrg0DMP8SJvDxpkECmthWAgpS11LShnQO58cff4IFvUflk54wn/cQUsB2qd0msVvaIDfPC2ZveY70SdFftMDQ/akp/SGBgAKJ+GGVCAp0GRwBdIQAwMTnZbJLUM2pwfStYFBIdGpptKyxKEdnDQa11hp0g4NKM7JwowQtZzDcBk2yzB8bN26Cpzzlp/zQX2ROZr46fkRVA4NjxA7HhSiJSYBBJLk8hxWHiXrv3hvMhDYgyM2CoI1oDQTkvaKhxDKJVkCZuk+qMjrdCn7+ab8Ek3YEIC5Aki3eMiBIdRSrsZXRh9+jlppvNgq2xiX+Q1IaopZ+RwoUij5Wl2HuSEufocYvwBFAR8BMQFtBBw5+wXa0PlHIT2O5L4nDBRSKt/8iaU2B0jCNnLOEisOJci3vYmeY9/Qi5GsRXNyh44UIDe1AhUt6ogLnIEDwgPudD7fedgf868c/ByJNBXQ8KNZcCTwrTwNJyFbC8pjNQov2lzKvIMwpDqHZ6IublSeOOwPEcSJDiHkWTQEA+cxams9hoKlOkR/d+LmLnwnnnHUur0wMTk+jzYAW1MwHN5X0Vr4BLMLygo8Gba1ZkArxW5KxGSoviBPTVPLlWYIN7ROguOuTPesvVp3PwxFAR4QG8DPP/+Xdtjd8hdokNUAmyZM0z1Ww7F4tD0GLFgDQrhE070MEieZ5uzTSjKTZPHXaJN1yyemm2/74jz4anvj4x/h5AIkxOQ4mCZ81G0tPgrS1OqJS51mKIyanoDgDwXSi9hDuBTVfnI1+FMUkJ6RM6U3+B1noA/weSMiTbB1/Oj09Bb/0zF+FBz/wobwcWY7cDIBYXyXLJ5ZTmAKNU2q2SQ7G3AaqjailPbWkL6/LbypC1jepoWkm5o+jAl++//3P2g1HAB0RGoAjg/jhPtKDI6MJ8X6RORPp8BBGck08Ri1OnVpmpvG5u+vm0vv4CHGUSxLi8DAExlN7ykk5TOUQsDAgKDmix4JLLaHUBNw8iEc9/CI48/RT4V8+8Am4/ns35e/MJqMbSLnGqB1IWvIVnkz2xefDpB0BGf8TOiarD+5/2I0ozAHgnHrBnrSDUM+QJic1pHeYyXif+1wAT3rCU2HHtuNZ7e9kqj9iAsPcAEBorAArV+OlqoZMO4jllXgpndbNZiEWHVLLF6/m+GqSpWpRihHlWkCg/I6ijfNhOELoiAEAmKjeB4v1H4fdbgtKYrXB+Pkv+W8skfCGU5uF+UlNeHHfYYpgkRo+SgThDYBGJ4iELcJmGGXMjxHE8udFE6jh9FNPgd/4tafD1ddcD1/+6hX293tw5+59AJFJASBOS+UXUFueEprGKcWCnigFTVJOMhbMo/hgqCdMACdLY4P9z7P/kOHOPjxh7fzjjz8RzrVDnA+8/4Vw0gknp12LLABUVZXtchR3EYqjACWQYP5LAK2qPkADHHTUWGMSqBqXUlFb2p1U8oWZoOpYOhPrrRB9WrW2/90cCvwXOEII4QghW1l4yZ+/7bu0COcYN2bNaqvhse64zRWq/f8R1bcAMG6PpcNMtquNWm5rwrZX2NjznSViVEtD/vR+d7isWtNAptRIoHgnOpdiZ6mjs0i+yBs8yLXfTmvfvv2wsNiD/qCvhpNi/Q1FJFLwhQDQnBKcx248LQBM6V16RqIjV7edThdmZqZhdnrWMjkvb0a1WxCr/AEM0jcc9G5CcQRAnIEI8Teve1RCPzVIdoYqZuO8aFt5BFM9Re0oxksvyPpApk4oAABSG772/V6IhINv3/eiu9/rcO//P4yOGA3AVcg//cXb32a79ov8tGAO911XbRuf1HStWge9zk9OMylMO/08o9WM6V71pxDXawMUNeJgyup1XphJhqQgSsabZaF4Q/JYyhBI+UoPuOWh8SLMpA8S1jHItGWqqckZEMmSik4qV/FyBLXb0EUUaFFRintteYC4QjOWNTJ3YvRsj0LIJX58Pqrs5S/E+DIXP8ueMDekuGlPiVytC22KpQCPr49aI7SYAAQF4+dV5KiOGkD6DLutj384Upjf0ZFjAljqIL6lb+CPaOBYsphk6W11pZBJw7OanzG/qP7JXA37V7Td98yPyaxgsIl+BOmfWEhRWA5FJRFijwMorjlNSh1M7Gu/6o7L6zUD2ZhDM2DB9VSowDlRM3ttlHCr5R7larOEFQkKRMrXfoJEZ00NeJPR4h9kRzAxArNhdF9kG7iQ0r4xr4CAI5jFi4wLuU8nO+eViimM4lL0CN6pMopEkuQX9V/s/nrgAL3uU3/wVjiCCOEIo3e++p0fHizQT5poAnQg29FW72SrJYlR1/EzYJh/EizeZ9VUfZ4q/5wVNMwBR2neOrarggVRy1lQ+VN46Cx8rqR5HGOOnQkg8wFwvFKc0yjpXeZOJCGH6JWWox5Lb297EeYwoOouAEHL5B9xVsaw8Gys63iJWY/F/CIPaVwn8E5pF+EIzfCER5ANUmTJJqMu/K253cK3HtwOyO5TYFb9f+8DH3nPn4EjiI4oDcARVvgXVir/pN/2ClLVRtJOwMwhqCQ5S3Yvwb20B97XDjOJT3xPq//hnO8T8aYcUEAlmwYA7c7vIdTUBDDlXScShSyCjGpIXeg6wZhcqqOyk0b7PZNzeRzNNDg840r7pvy5rIkUc0HO/NG+F06T6dQsnuM2cCLleVw+O6dU8KbeocBMtIgiTkoPIqh6B6nEi9Je4Wip9lMsZnSspn4qtj9F/82g5s+9VfQXcITRMrvu4SPnDHznq9/15XqB7u+GosJa+SrXAkoNoJD8cm20w0+dNzSAVi2AOyEW5y6TIl1aaq9pH2aFa9UKZJ58lP+U/6Y4kIVJMjREbg/3Bywp54dGX+6TpRTPHXpK4mfh0JT4HC+lmdJtC2u/LuKrhsucilgkj5DlLcWn4uXarUtJ+vPHQPtB+n/uwkff4+EIR4797+iImAikyTlIKlP9GWCaW55Pq1RH3fZLIMvW9XO1np9dc9ya1KQOKA5qOU9hQCouvwMo7I2h74FOUy844am+IS2ec18cvuOR4WvjjxDKk3EoTMjhT3iEcDIqrhzlP9N+UPuhpwbjSg/Oh88n51dmDqYFOKjqBGL5Y71KPZKqQ6nnIky3Bejzurgm/TyAAC6V4bXug0Vf5D5RSz+V+yzx3YdeB4MAArY8f3qkMb+jI84EcHTFnsvfe48N53+xXoAHy34TIFNh5ZCNMdmhB4VDzzG8YW+/6HAep402C5TIQMpNCxn2Q1LnkKmA4TloiEXtPNO3qHyAdeo0TEfZw1p9x3gd4kWVtvD6tSse2JbNZZPK0YhEsDUogJhch3OEQtRmZVCqPt/X6rm+joJYx1FpZO2k7pO6gVlSarMPaDZtMgkol/4CIFA6/4L9bzP+6Qc95h4fgSOQEI5QuuTV//zo/jz8O9V21FjPAVD757eaAZkJoEyDbNx/GWbAMBMgOgIBGg6kFRCpv+G0aR5k6v4QVb+p5i+DzTXewPpR6aTTKr1W1VFXIJasOSSsTLOMl5Jrb6csP2339APU6gAE0M6/NO4v6r9j/pr6VhkYPOyhP3HeEbH4p6QjFgAcveMV7337YAGe5tVInjkGDV8AQmNCkJ5gom3/zPOfRgBMlgbC0AlBDV/AMAAQWYGQf9IImtpCI6DFT0AtgJGi53GXQ0VeVgQCoyJj9tMIbLXvOQBx2DPtiWfhZVhLu2STfcp42PKKVjAQktageF3a/oH53Uapg7+76Mfv9StwhNIRaQIIdTtTL6DB/I/XPdjqbTGEOCwTV6Fmajuf+1/i3WootbCoit7bT7FlvSXgsIU/vGFQ3sWtX5oBksZQXbFU6YdwWjQBAEolVp7NwSDcy6U+xXSGEeWpFictkaUMw8rXSpiK2ca4nFz+CbgEBKTNBIhNmMwmVYCYnbJQ8Vp59mNThDbUXv4Qj98t5gkOKWqm9rcwP8/krOVz77W/urU7aX4PjmBCOMLpna/8wH/tz9f/z+03h1hqAZjMgSi9c7PANEYJUJkGWKRRmgBBMsUpqnKuJRYWY8+tNdpgvxai1OFbuDTneWp7enTaGbDAOlKzArApQgEzUZyFFkCeP4tDTrQGEd+HKkbZXsuV9pjSDLVYjvknuz95/t1v322x8LSH/sQ93glHMB3xAGAJ3/7yD/5TPU9P9Z7tzB9QqP8tAJB8AW3mABbptAFA0xzwmcpUSt2bVkOFQTBEXI9k/zVg7kNJApcZijgsJo6oP4ShtxGG+BAA2lT8JsAkQBjO/NTaArXY/hSYXw/9kanf9rCfvufT4QinI9oEYKKqU/0adOoH1j08MznGlFTz6j/rbzISgMkGDyt8NZOGuH4wwLBqJyMJWB6UmQMkW2dj2lk4rg5YQzjNO9xo6S1rE5bHuOujDaRkmvWg5Xfb3ISodtOI1BvcCdEWEMkMuo2j2g9ieyhzIP3K/v6ZtSbJ8DlFCy5X+/1ZxvzBCWif+e5Et/sbcBTQGnbZ9aV3v/LjD1pcGHyq7tF0WD4qpkCbGVBoAiz1M4lfaAWm0ABglCngMoS5IzA/XWm10upCl8HEBduvgnRK7YTLvYNtoUPRI79TAEKmWJRqPhbn6gSxJfF4TsVLk9qfJL8AAI8AQL2/Y+gRD3nCPb4GRwEdNQDg6JKX/esv9hfgLeSXyfEEF237l7+mxb5vjA4UjF5uVNniB/BqY/YbzkcrAcuX0UJLKf7LeGhF78Lierm0ok7UYgKMrDOE4fGH1X1D1S8AwZTPlwCiz7UfJkn9XPX3Dj9n+9emAxc//Il3fzccJXRUAYCjd77sEy8azNd/Elb6YdMZmEl402TsxvCfGTINeIgPANK5J8RCMrFkgdURrZVunhJc1aMBvuIeSXDIpcThAbis+CmwZNrE5E3pngMCQDLZ2HTgcx2P1F8JCQuwWAegOmoBTvobU//2w59yj1fDUURHHQBYwne+5JN/PlisnxvMLVHLR0j/EhDMcMY3LSCgzQGfgeI3SZ903ci0Ol+NtF0TovXOAQ4PXtqCUCkMr08Jz7WBUYyPDXV/OVIfQEn+yPwKCPjaVPTihz/l3D+Co4yORgDwC4be9dJP/2V/gX6jrimBAJZmQRsIlCZBSxiWwAAMMBilBWaSHlv6Kq5R7WrP1Qof42xk1yt4dCW0/KIiHMJDoH145Y0cBGD5jI/DslZKfflVAEAJEKCqX/mon73778FdgOWrpaNhFKBBlvksBtBvvuuln53rL/R/Oy2oYXWuVmqdOsQZbHQHcIF+jQqlHmbUc9477DpRmDSSdR4UpTFNFSWlWq7d0g9aVgwNEzjk0fXqoUulm/JGQ/O2dPo8uSfDVkqTihRDx41cZQhPgYJcx58GECgDjCg5/dR1WCruC/Nnlvn/GI5C5nd0VGoAmt79ks//9uJi7+XUlzmBTckPOELKy1wBz9CiPQA/CykOJMkffQISFnMzROo3RNRKSbP1XdDPVvpKrXWMsn2WYRPg0IsUhi0BkbERhmsIbWmitvzzhT5i+/tkDfQJ69969M+f+3o4iumoBwBH737JF35m0KvfMujTxvjhDwhMDNju1EOzxAQgtSdADiIAAjL+THoatnXWRtdcE2qDg6XOsXj2SKOhOIHLeQiXyejSftRMW6klIun1tezH4LuCwd1Y9Z/xqJ+/+wfhKKdjAgAcveulXzyP+nSJdQ7eO2wtjspuB2hsRVWCgMTx6n8baCggAInjT3JnUhsYlLSaWqeWtNr0fxrx3kN0K6w7LbNepP7LwAxzM3BIzJtOysJTcaYcf1xhvvkr+HoH8Gcf8YtnfxuOATpmAMDRJa+/YkN159yfW03gV+pBjUkbwAZTA3v8YZQWIEw+CgT8L/B7oKVGMfuR04atPoIIVtlQK0nA+zyaWAFUsMwoAFkuuJTqiQpe8jl9WTB9EwiSPyDLnEqnwfSs+nPXccKCjME3zm6deMGFTzjlIBwjdEwBgNB7X/q1J1iT4K8G/cGpbleWMCM0MXuy5U2LlA9aQA4akNv+Uf1PPQ5LDueTYXhwxFOb3bBSraGMj8t83zLSLZUuzf0lELd7/dslfrzidPzEsQq+bzrmvz/6mWd+CI4xOiYBwNF7dl62BSfM/x706NmDwaAr24VFld1Lb2Z2ZHPBlJpCugdaAwDN/E3Jj40eWlLiLBe3XSNvcgQWd0eFLeV/Ww6/0ZJ3h4jwkam12SxLUOTtQi/BljhFGBb35en83YVGgOFDJ6YyvapjXj/ZXfzji55x7l44BumYBQChD7zim/fpL9JL63790xYIsA4buPHd3CTIJb02ESADgQgioICgOM9Iq6FjymilMNKINITJ289LiM13+pG2t0xPVuJ/oDLwB4/6lTO+Cccw/dD0yQ+86lsPqxfof1qN4CcdEMTNHSHyZ9QCkp2vpb5oDgoMAJrSqdBNW02A1Rr1rVyzHIlaPtSiR8SNLzA/1/dkQoVe2lcmuVJaab1gcTqM+bPrZn7Zq++PTlXVWOFHTLf6s8c869TPwQ8B/dAJpQ+/4poL+v3ec+o+Pc36BzYMBmE+d84L2kxoOQcBARU3Eqq/sIwaPjREaGNhavkt74F6bhTPrpafm28BWLHq30YF42sAb4uTrpOar4d63afYLePvh4reAV3zuh/91dMuhx8i+qEDAKGPvfTqzYMKL+4v1r9AA3rkoB5U7gMOYX43pOlikc+T55/vFCq/ittK2lSA5FXHpoAqsCgPXC6VfNaGCOtAw6BsueDUyBamp5FjtNZPFj+/1qM3bNvbA/tW1f+UvX779OaZf7roGduOSRt/KfqhBQBNH3nNdSdhH366HsBP1gN6TD0YbK/jJ51TvOZ20oWK3+ID0B27/e5q7YGjmZZ2Mzry1gYMqa0mBispD2kfCONt+x/Y809ZNf+jndnNH37Ur2y8FX7IaQwABV1yCVWbr7/lXkCLD4Ya72dB4DwbfDcLBCdaUJhIohuAliFFBShEbuWAgCkStTw4SjQuR4qX6EPLSH8lroS261H3RqYn/oVSjaLhz/BJNMv8lG2bQmXm7O8N9voqe3zD6viXTSN+6WHPOf4aPIK+zHsk0BgAlkmX7KSJHTO3boXJejvWuHEANA0DmrQdqmu7XXdQU7dCrGz/rci6kozfxbSyvW1gBxMq9wkgL5RqCl8uscMRNmbl9o9rtAG6XuomnvgPytTLbCP5sGFOROE76n6hRGVjDOSOnFSt58ZUOaMM5PYgpW1MCzOFPFBtyBbPfxnHv93w19jdFYXvsUtKxk3Z4o8g8+7P5D7e7OIN7D8bVNs47ut6NZpqUAH2+3W/XxnTs7W62AGzQNCfM/3BHrNh4203bd+89+KLcQBjGtOYxjSmMY1pTGMa05jGNKYxjWlMYxrTmMY0pjGNaUxjGtOYxjSmMY1pTGMa05jGNKYxjWlMYxrTmMY0pjGNaUxjGtOYxjSmMY1pTGMa05jGNKYxjWlMRyH9/7CoHCQSniQPAAAAAElFTkSuQmCC"
+def use_icon_urls(base_url: str) -> None:
+    """Switch all tool icons (issued and future) from data URIs to URLs."""
+    global _icon_base_url
 
-# hourglass icon (256x256 PNG)
-HOURGLASS_ICON = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAACXBIWXMAAAsTAAALEwEAmpwYAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAIThSURBVHgB7b0LoKVHVSa6Vv17n3O6Tz/T6SQdSAKB8BCRp1cGAYmMjEQYR4GA6Diio+idh/c615lx7ozAOI6PGeXiXBV05uYOKDDBODo89I5IiwKCvDTKIwl5v0g6ne5OP845e++/1q2qtVbVqn/vfboTAqTP/lf3f/53/fX/u9a3nlUF0FNPPfXUU0899dRTTz311FNPPfXUU0899dRTTz311FNPPfXUU0899dRTTz311FNPPfXUU0899dRTTz311FNPPfXUU0899dRTTz311FNPPT3SCGEL0vvf//7lu+666zvC5jcj4qVhvTcsq0S0EtbDsDRhGUB5/9N+B+fc1LFQXigeKRWAGPfTWrf1+KxrZ1H3+On2Nzse6+u9n6q3redmZVZ1D/8QsLp/3r3d8jej010z65tvVpY+d7Pnd48T/zA+bMalDdujsF4P65Ph+UfD+ouDweAjw+HwDy6//PJ12GK05QDgV37lV14RftM3TSaTR7dtmxqDLpHmNV6732UOZep55yLZxnom138513Ajj9unf17ZjgtNMVW33pt9gzO5brPt053rlrcZ0JzpNZuRvd8e4w3IoBe/UdM0twcg+N9f8IIXXANbiLYUALzpTW96/Xg8fv1oNMLI/FECRur+yJGmGy4mhirHnTSCwmBTjImYz5eywjGH1X35nJaTn8fP1HJsebZ8W7d59a3KyPfpcfscBoJSli0HK1DpPh9m1dE+214Xtp3b5Hzn24Gtc7ceANV372owBHVDngsG8fiMthCJD88+p2UGIKCwvPH5z3/+G2GL0JYBgDe/+c2vOXXq1G8H5oeJMD/FZdYPq1JbJaMyV7VdM629vmLczGDlXoAaNKpy54CJvYaPuzmgYJlVzrkOAIG8lpQxVTfogJF5/1KWeb5cVH8XAckKTGaAZQd88vH4HLLXS0X056kAYg5woMKZfbf6unyjooQxE/QaH7ezhsgXW43RCpB4b9AGvve5z33uO2AL0JYAgLe97W2r9x46dOPJkyfPDxoAeAEA/WG7uF4zSle66r7L1yLWUrJiGNvYnZvWGGY02MRcqXhTtgWRxIiukuiRnD1vyot/XNZYZjBiBUYAs7WZGgQUJFxVjjxH73NY7ac6urrspAlgXWa3fgVgIF+vLbNbVwWN/K7IEKAACuWXNT84ZKDIlBndrGPxnpLPIwmPeEaECJFqkxAB4Eurq9sf/7SnPe0knOU0gC1Ax44de3mQ/Of71ifGb8OP6L0iN9Van6iBCCIBjCTgtkzSAD03vnhttJOzzU2GaeNNxAwdj0WTI90DAhhx4ZZVbbtQdmuOJUaD/IzUwENZCPU1cjfXEaBIUBAplhitNPZs3ZPZQD1qmGoKJDAzuB5TXwFaUHCuw8iFefM3qcBrGogKiHWAECyjS33TtbXCr9cUCQ8ZHLLkxvQzVR+DzFcozYNMGfzbk7QXe2fr2wuCsHl52HkbnOW0JQAgqPwvmkza8MP4xPiRGXxHdSsaIEsLkkZBwrC8z+da0CbG++gpg0EGi7QoSxIINiQJSLKvxxJTUmnIXJ7ZTw0NiiQkKgACXLlULpFIYQSv9VPAUUDTugK7tbVu3KZdKjtK7ewx15oSX69mO2B5S2YmECZ1zBT5zRWUZDH3ARRnJRm5zO/hdIe3DYNa5swSH0iAW6ISmTERKoGfH0jV727bgWqF2h5qB7E6jVnqp21fHMn67AB+L4IeAB4ZFADgUp+ZH4T5udHVIJDFdnW/Ns4QEMrMw7xW5I1KLD2XNQWqwYAq5pZznpstS7/8NGYt8pDNDWF8lWCJPYmlOnlm5/TIzGcBGPJxZv5ILvOi0VZS227Ts3xas/oet9V84H2OFAQvamLMBDauaAbxG6tzD2U7GFwi8aHSBAitydGCmhegMKuAB5A1gHwkg4wcQwRrzGU4sSK8Fudm30hwxQdR9fNlxlQkNR0N0zP+EBhIuRS2AG0JAGhbGkwCI0xE/SeRZkBG8iAUeY2V3IbczNCysvmpRVKmsyp09Bmo0l2YM12DHekFhQkTU0MGg6JRlMZo703XtCBMR7kOKBs+MxlkAeyJzRLFOzRgEE0bl+vkhc+8qPlqS4v5g2zSOHmBWKYzDsdKxc82vn4L1VoKcIJR6SvbvgPMGQiwAGWXiiPP/FZkkLcymCg/p8v0oMfkt6HcbgrTF/tftJBoDiFuCd7ZGgDg/d2R8duo+suPyFKaf9yiqPMxy+QdWd1RaaUMMo0MyzlV61HUApboug8gTnJQNR5tOydrx+viTE34JMp9xII+H3eKaPEap2YDQXFkijbgpG6ZCesQWrH5k+qU9zOjZokNxpFXvoOCgy0vPbdwcTFtEKqy9ZiCIIA5j/a3gY4mwN+0mDCUQaWO8lEBnuwPmLMNUGuL2SzwBRCEnE/f/EuwBWirAMBHw8/zXVEbjktmfqxYiS+2DQutZJm+VplPmReE6TJMiD6ujSwDglyaNQFt6ERZSsV7PRUG5Wco00qjthKTdJ/XPtcBWPVX5lJAUdRq1QFHlRaikl01iSJtpb7C7GpW6PvW0pnLtppSfvfM6DUAQCXlO2p/fmejMdg68W75+arf1MIFdH7b+pwWk6njN+BDnRwSMSuTphM1pRY/DFuAtgQAuOXhf3Mbo58Nv8oSIbvgihZg2gIaLcBIHcs8oBIQpOkRdJi/SDsLDGifpSaBlk9USc8ivRG8L8/Xhq48h3qvZSQEw4SUn5nNhXSX7zArZAZP30sBwQIZGlU7bDvqMngBI31/7ACoajj5eQTskCADVtiV6vJNELK5kM/pt7Ufluy7zAIF/Uu5nua0oQJsUKUQG9NApL+Fi3g+hAFHKwP332ALEMIWoZ/+2V/4xVOn1n5yrElAlJtAhfbYadB6TDbkDuVis58bL2bJzOfkCmcApKNGl4bcLYfL0BBZZgZbF3Gu2XpaM2Q6266+Dvmick6Oq32eH4VYQKbzvXId5S0I674B1bOg8GNXyhfAhAx6ABZUTCX1/Qp+CLBC/oZEVGsgHcKpHTliwoPZKWhBAMD4BcC8VWD+8HsMBu4/vObKV/xz2AK0JTSASG689tMr21aeBePJt04mnn0BIl1VG1C54CpNQEsozYWFs3iytXkpk2psON9mwYNbk/oK0hHLGBXAgGEYzKE8tgYwS2cgPw0AhqmSJ0HNAysdVULb0GXRt4s2giVUV8qQOiFMS2zEzteC6lu4zKHlPW1noiLpGdw8+eq9oFNPZVYFbnGrQPlCxTpXkCKJrJDxfbAgp7r8XLcCANYMQLBgJu82wA+2J4//NGwRQthC9Ia3vnU7HF37lTHRD05anxTiEhK0qh3VjNtR8wp3qUoIHRVRGccXiQQl/q8XWQZ0WOzJUhZL3ViOq5gzVyTVK4bl0vXqgea3gMQOWHIOSEALqH41LY+TeRT6DFB0H0yl05CCmdamen8oUr7UtpbSqgF4dZLKSf0G2UoABba6o1PKTZC6lefyO3twGSQSwxvHIOafUkBGQBxB61LqyP5PDmk6qGMG+nsOm4YahKvateP/5HWve90p2CK0pQBA6eff/BvPbR3+WGCI53tyjwotZJAlvlmRqAY59TMhhfYhiOtWFp+SjJC82IXSSLyHIjR8fj4S5yOgSnJVVyFbCTVgdAiNfYtQtBBXKR6YGm2TtZnCYDW+iTQ2Jq82aswJOQWYSq2o1g6yVBepqfcRQe0LKAxtPnWWxMpo6TpASVZi/0XWA5CMmVZ8C1xd0VI4FFcAV+51TcP1j/VzTXhWk4AixU0cH+MXaaxlX8sDFQieJoMG7wzv+qdh/ZYf/J5XfhS2GG1JALB09dVX71g/7xv+usXhYzyhSA3MjsLYDMlKMSy2cW4gLF6NREX14Rkychu7uQTYvWSKaapzfEGxW7qXGCYu10O13b1WhHHZhsJY8Y9xJWTVP13ryj0KMNgtM+8X4Jh6dofMJRlwpt6UbHIOgL3MmnT5PEAdBiQNA2OJDOk65YsUZ3GK2OjnjhoZtDfcfOtHn/pPr7hiA7YwbRkfwCY0gpiz4YYJ9TmVtQEUIIDU6w1Lyxc1NBEWx11u6XzCNGqc4kCjgFYMXNRtmOKKKSbpYkaHwavDOF2GZW5bfXvMSj0FAIcWBGpm7x5T4MAueHSeO/c9hDq8XY7T/G0V0tW2nvcdv48395EyvFwn+0kVSesYSw6xUz+Crc78kc58yJWzlHbs2IFVWzRqfyLKqUPyX7YBsgQqjSw3seJXANMCIRfTOQelPHt5t4FX10LVqE3x9X3QKQNmn6sOdE5Y5qT68fVzZ5B+n+4xu87MjbOvm8X8U4TmHoOvM7HWAqKgy9TnnfFt+XsziiG6Lc8bkbb8S27bti1od9LPb4rBrIopraXbUjqMXYsis6q4hcwlNLN10wzO2ozJNiU689PdS5VHrLlTMeYspp1ViJ6nSlGqy57xrnq+85iq3DMCB5oGHqLZP6Ute97pcHNDRDOrtZVoIVAOUXvfW5oWvyTHpxt5BxVmcMFMxphHm1zXlaazwQNO/6wuN8x5VsWc3dc0+5XKjps8EmGuljOL6dDe2y3rTL+nKagLJpVp1Xl+DpggzNBOsNcAtgItLy9Hz48rku50rarTJM+U0TY9MXv79HWBaWP5TKnrJ6DZ11Rq8xzfgt5+pl+uu10VcvpDc8lKdt2Pz9keHPu7g4tn+2D6uafDUzQnOj6UhQCALe8EPHz4MNLuC7BSa/OW7HQdcnCmRPOvps4jNrkUHuq5M7kEyytOXUcAVQe6TpnO3n8Gz7TveQbVnkt0moPxXZbC8phlgPOX6kY8DtfdNQK46STARjtdWAnzbQ5qtCDa8ZZ/yQMHDoS/pKNPABkJb2Wx1ZlP0zBgc7kyfedX2pDsMvXMNUw7yaaI5t46dU33mPUhVNfh5reejqbKDbQvcPxzdgI8amlagg3DdZcEYPjmvQB7l2A6utL5qVQ7mlG3HgC2AkUNAEzwCWe2AIAuVzycTDuv4eMZHntQhPXa2vh2exZN8ewsJMT59880NTr7tJlPAk4PEnuDqv/U7Tyxw2YUNYRn7wLYdSY6bvWtpBb0FcftRwRteQA4duwYA4B6lXIr63KIEm7Wxh8c0ealzBGmD/rZtMmjp/Btk8KnNIl5tsEcv8SmmsOMus3ClhKqnX5uE05+3cqZg2S8/ht2zT+fnYBgy+RaxEjgG9/4xj4KcLbT/v37QUZ2zGEtwtMr+bjJuVlnNwtjPViax3dnRMr4im9zVPLN3p42K7uDjmQP03xQmzpGNSbZZV6I7sASS/YHQzuCqnDBCkzVF2ATwy29R/hyr389bHXa8gBwKP4Rl7Y21Nx3v8oYKbQZA2xmPtOsgw8TnXG77zI8ncG15jqVwnOZY87xWYrBTPPDPDtdQzNusooalWv2P0SX9QXLs4/b9OGp7xvkxdZn/0XQAOKfqZaKUB2mM5H6kBvtPJbAOQc2Z96HESUebKk0fxcNClRmxBz1faaPgeact9dpmaepcLxsx+kM/zm0czDjuWD6P0ABGz3wlflVHnm09TWAQ4dkq8O6xmOFHbW4M4RIVd58Zqa5h2jTy89MttNp9s+YaP7hzIs05/KOZJ55UYf5N9OmuhcYBWAmPdSY9VLT0TTkRU/jooHgA4CtTlseAHbv3k0AMmgeqGSrxRHN492sg5Y1nbZlzyM6g+35h7rncN51tOltUwfmqfH2ExHAbPu+CxSdMqvPp9sEph+FKX9G2faZS19GSx1NzIO69Zz3DdH0797CtOUBYLRvX+ywXv2Y8/lrnpyd1dLNudygaPr8vC5tU5wx4xHmwNxw9maN+gzAoOsPnfoCNF0Xazt3e+Pp9RXzE8zOyydTPtXHqvvCsvwgnX+WRhZw5oAP2frzCf/617+eYIvTls8E3Dca0REZukd/4BL+6bqtWDeMfcXh+F3Qrh0F2jgJfnQiLCdDSwrbG2F7vCYCgmR0mThaT5vLcXFQTZABRvKIPTSVlJK60sZzTp5NJPPtQR6FKA/0mQbS4Drb6cbiOh3PE4HyvU2eyivVKF2jU3o1aYBSGVAj1iGlvfN203D36NgZLg42kgbgiPMBSIW5DB6nsDtdGEjZfMzxCD4Oq77/ZYguyu9SxkYoKBGL8fJbxfXeA08EeMLz4KHQeLwRfoblCgTArs1345ql4UNaWADa8gBw3XXX0eDS8yZlnBuo+d7ovNiOoDn014B3fhzaAAB+FBjdj8IyhgHFwUZbGIR2EZmbx+/zocHH4by8FMUjBA0cNzUSpo1skibdwAIE6mQL/JaWdD9CdW4gue06ii94YVJhfCDI5SeWRqwm7ogDoAwaHtMgMqsTZo/nBvGhecBRLiGChmucTPjJjJ+O6eg7yLMJ6aSgdv6/eF1k1EGDkGPpOvIPMkgRYQYpML9FGltI3hlV3ZHh13T4Lrf9Iigg/eBoz5FPwjfe9Tm4Z/c3wh3bnwJjHOYxAmJpOolMTTSBBaAtDwCrq6t+jWhsPbt5dBmVOLERTzZg9YZ3gT96S/jp18KH2YDhYBL4Lixx8qs2TqHVJmZ3yJNwxIIGDhKjxf1GpHejTAw62w7vJ54DFvuF6Umk6vSgHE1TqjgQScoz8OiwW3of8ghYKomhzNIbGdLL3IIq9YeNjJuHZebexilDu3yvSvUMLIbZ8xBh8WVl+rLpUUTMD6HH4nUezeieVBCPoHwEUjVIrtt9PsCUWT4LDGjq3DLdC/uHt8O5pw7BxaPPwsd2vxLWYWkGz5cqha0NROxNgLOdXvnKV7Zv/9Mbx3E7TwIKtQkQJf+em68BOnFLaOjr0DbjIAnjeHsEk5bTTpNE9SxFG8fM3ySpxip/YinHgEBiBkRK5gCCSEC+x5lpex2yeq7NNZ03zF/zFOYhulxiRAUBYpUfGYD4GldASBjYCeO6RhhfNAMe+yIAg+PKMSg4YxqEJSGWK0hmRlTKagkK15fJCUuPIptzoSI/HzbMPlPAh4PbzoM0y4n53ewvOb1vtukI4Eoc8msMu/1t8JxTvwcf2fZyCPretI+j3LrlRwOKtOUBIIRy6LEv/N4xoBkFSEkcAjvu/zQ0x28M26PQ/iexWSQ1P7aCQRkzE9xAGUcZVIeepqT2l4k6SEBCJLwwvEMFDRCml5FoM2+QUZcLGKCoEKxt8P5wgKDjVahm0Ajj8Zj/LOmVgRvZjut0H7KN70TFR3AVGCSGR0GuOJAmOsPseq5hRm7EZGhExCsASFkZBNCAQLd7Yvqeeh7KOn2sbaGl7gHoeiMzk6M5BtPXuaNBDXCMH8GM2003w2Xjv4TPDp6VS6j0hvTT4TosAG15AIie3Ld/6IZTonxDF/BdkP477/s4eBdaR7DzI+N65HFkebhuduY1yFI92qTDhm3TSMOGjJRGZnxQ25efkYUmQMXEjcMsAJ0wsewmgGEJLRJfeG6gUh6Ljd04FJ5Udbyo74OCINmeL7a8Ew1EmFulftPk/XrdFNsERQtojCaglVTmrwYYhHJOX1pX6uOY5kI+3lwoJ9QEOBNfgEr/OIL3ifDh5KO3oYx2Ao+b/Dl8cfANwRQYVpebEMdJWADa8mFAtuPoBEAZ8cfS8ui+4ORbCwzug1SN57xIbZ+YuXEs3aMtDyrBxZE3iNcbARnbPOsNRZ3V4+xqCN4E4usbOUbC/NnvlgUn5mPJHFaUiG0YUI6B8bqzrY+Njlhc2+0s3RHy8NhYFhLmxlix7tLEAVUHvI6MH7fTIKuNAEHnepTjzmgMKJoBGu2A7ZgCDsrTPJuDaGdxHZZBVP8nZmk7+2NZ7L5sj+8JxQVtPjhy0yLnXODvPf5QLRCqDX8CFoAWYVTg2JgeiCtrIerkIMPR4XA8OPowOvp8YnTvGQTSP7SqfSlSJXkKV0nZLamkl+mz1PPt+H4vYbEohKChHAVI9yFm08CWhyC2voIAqPYsE24AM/+EdAIOAQNg3olsEPkxajCpLompHPstiP0WPDwu35z2FaViYY1UKs1ApCjX8rYytFdmBzYDCAuymSnTytzq+iMAlLG4Zdsa5RJGhe3nAjMu2Bvn7HfMgPU7wvts8IfyUtf4A4T1jsnhoMJdWJQNsEXiA7AAtCAAAIfTj4xFrdSx+yduRSbYUMcdS3nvKTvbIM/oq3Y98PRd2Yzlg0X9Z9teNYHWo9j3RQsm8Zy3ZGLeULTUBosZoQ5LT+V4AhNIgcdsXuhsPcpDjcmdb6X8ATL4sT7k07OS/S+w46D2ZaQHxaGyVdX3VuWXfacSPiOSvIiV9NBR8aGo/Wi2VXvywvxxOPfBObA5AMCMc/KwtduSyp/q1QpqJyDwQf3flpm/KoHHCT8MC0ALAQCB8e/XX1r9TBoKbAerepUwpjFLUTz6DQOCSi8UJiqmLYf7NBxop/7SRCAStZ0Znip/GGsAvO81pAbKTzw4XQSMgStTZbH5wDdNPKOKHhuIms0z6XCbT74wrSPwe0Uw8S2bN2nWo3hPW/wOFKdRUamfkAKLna/AaO395BAEyPaPOkFaKOqTZX4lcZiWbnmqAYRnbrtQjo2hthXmaQFUH1u7PXygCZ/z8pywjkrMKVyttH7O5Mz5Ij0AbBVyRPeWtK5a3/ODnanhe88slKffEqSw02QBlrkBGQhQQENnmbHDyIgGQCiOcsrSPklzKBpvNi0UgLA7bhE7/qImwSYCZlDh20pWYMUC4hdwWWvgB6RIQ9T0PQkAUZoZR9WbPME6kWhClKMD2YNZnBVcaWXyNiOnUf2h5s+4RKDIHwGMCgTlorhajglADyYnx3yBcRwY8DDXz6v0J3YxhHqt4079wGYtIEBwCBaAFsQEaO/O9mSHxoPtQcIvhUZxMgmc2I6TxesQdM46bbxZQzUgYNVaZUfVJtRHYNu3FJEYMPvIbDFSduIRMRXUztcHoV4IDArJ5xYdjCDTW5EAhQEXNNen54mWkbQAkAm0RHPx4kBAmVY8zSEYD6oDT33HXrQCLw9RLUCr6rEwNeq3gQIY+jH0dyF+Ln9MUddWAgBoUh7aH2HGR7M/TFyfvCX+9lI/NnlAZlOe0BKccqsZZ7hIymV68nfDAtBCAICnjTsBVjtHRcoELpwMdgFuHEn2sTjgcyeUZIaizkUf7ytZe3naTjYpK60XSJmOWxSJecB2vBE2ADn3v7FeRizzD6oEV81AOzY40MlAzYy4ck0CBjUFgKW/zdVRPpn4MgkoiQo+UC2AuL4kwh6Ff0SEQv4QyvTK8IR1so+iqjK2/QnASH794HrJ8gVhfyWUazSArE3oS3TJHD95a0FTfRHPmtO625sAs9TDtImk8bV3wALQQgDAKvhbH4jNm9iXTsL4kWL7GC/tg5XgLFJp64zkTNdIo7PtJLVBSRJKrJcTfwB0liGdjZvkOY3MTpBAQBjC+seSoBWGTXzgMPON2u6u0gC4vhpB0I42ylHJf0CQHY4KEpXZIXeoz8IpKKRcAs1xSDDFfOXFt6GMT1m8Q/ELUCdkjyW00WVaVfk1IR/NR165lCV4l8/zB4MpLazKFj51MztY8o/GP0a0/4+H31wPaRXyJYGaU8dvhwWgLZ8HEMnTscNE/qRpqqCtJrLEeMcl4Ud3icm8F7WbmGFY4rMd7aVx5bYtIrpooMYLj3otb+T0X2EYnZnWG15Re0CTghLDI4gPAIuXX7iXIBsEbN/Ltel6B5n50KFxaoqGQEXq67yYWvfsu/PsA/BynV6Vt9U0SGFBkvBaK/uev1Rce92W43oOzTG9NqoLbSvq/2NY+sf4fTQD4rau0zMm4uGX460ci+fWgwk/OiLlQvH+p9/WwX3Dx2TcYFzg92IzwJ843x3unYBbho4cOQH7LrqTmuETmWnMJJ1Buq1vvwR2BVc/eWEolESdPKssNxXutFM692gDYuce29IuKxcSCQCQJJ3iIHRTmqc48agwaNxtXFHf47oRTQDEGZilN2gXYkkGQsiJQeQh9xkozy6mAxotJUULnIQrFTxsqI64o2zUDCLflm7MwEyXY/5QwoEKRNkMgPLyOhgBGTGuZkFk/phw1I7Lx543u4qaGVi+J5y8qVO2AmWs2gDuay4pqGefm1btTc9+9rPHsAC0EBrAlVde2YYw1w1ZguUzvDVe3hfCgdEjrNI5HGvRaLGcwZcbGGLWDrSUVsSoTdaxM06rJqGkHYhtGXJZzhz0RkVNkQrt1SdMnPgVtU9AKSum/CYfgGgSqvrHY1xOkXopM1Z4XPsg+MzXJBoRZE0ghgu9V8lOgpJaoC9rkMUbiW+1g+Scy4WX69qWr932RJH0qgGMzb4sKv0n46INtJLxd+KG8jJSJFfPwSh4/4815xZtzbQFieR8ARaEFgIAIgVp/Pki9uuOQTEVdmPbJUk1ZIjQQTMw296NCc0pH2v7cmrLY3HocexdbWNe5Sw9qo2RVkwJEhPEG4b2hrFVoquaj4AZcOK9iZGRGRwSaPGi75SyEEWyq2ahfoRUvi9mgC4tUe734MUkyOZEzB3whvHtdpex7fG2LUDhRe0Hc11w0MFgn1HtDbNrSm8FCq05H7Y3joblXsh+B1Vx0vdFODy4tDgA5X21bsg7n4cFocUwAQI1k43P+EEcIL6AQBkPC2G083GwdPQzRp2GdJxTdTFlCqrUVdU+Zf8h29Cqgk+IREpT8REQ5eSe7AAkNfnR9BVgn8FAJDzIeX5y8QHoyD5FA9A6AnDeAQMYt2lxbAowpLThcGDoCvO7cM24jYN5cL0450C7MfNAHyiM79kjCfL6gFaHTt5/UR+qGKR+byj73ujfroBxqvTKExkksh9D70OrEhnqmAUnvijgwjY/KHAmQGzg0PDSXOUK8eTAACefhgWhhQEA9Cc/BbRLMl7U1ivn13dcCqvB5gxQUIFAYpaGGcyJ7yAzPIBIYlKeAHH0c0weClAogyv+qIkAIgiXhiims0jyCD7xOmFkNTtSro1XPwWmLMB436Axzj9gJteuy6rJJL70mBjdA2Z/gAUaUBNBjqnE1+MuA1sBsxJV0M/rp5leGa0yyc3voKDsdgQAeLRId4C5s5fWv24NCCe/WOwvKtK/9SHkS0O4d/j4OuIoWZ3SgYJgst4DwFaji7dPbrvRT+4JAZ4LcovDIr0mS7thsnIAmrWbIDEQgQy6oRKYrUPtBMQdf8iON5xSahk8srHAjE7FcWgdgMrwkSEnHorUVqZUKS8hN3Smp59oHOyog2zbp2HDTD9kgtIxSEcCIiqag97rBByqXBtNSY6gJ30ZyEvoUUY60gzhbKiodpQqDh1JTfpZoAoHtlB+j+1PZrMgj+NqEMOCiQUFMjuj+9n7L9qXSv9WojzH3YVwwu2ytZHqcAA2+DjueOnTHn0XLAgtjA/g8ssvXw9q5SfYk219AAYEdj8xNRQeuw7FrEVp5CJ9jaTX485Zm5rXqgFreFCZ00uZ6rFXM8FBieVrjF9z/L2o8a3cC6TqrNj/Yu+nrr2gTkF2BHp5l7jvBTA8Ff9AK/WY+BIeBCjvX8KHXE+uA+S1Mr9XdcazEOWK6YVdHwCVbes3iIy5/GioQn3J3m9ZI2hnOAHbzv6J66VczG6FVtT/iQ/q//KTys8uGgJR5fz48CIMBaa0MACQiMYHWU0F+eGhMv9O7XxS4KFB1igdZrkmnnMsfkQodrVXFV2YmXfLtbrfyhpAeZxt+cSEoB76AjxMUgdkBxYDgsv3kjB2ZnwFAZBEIDETvIKElJXBBIpvgJ2fEs4HWXzRGuyICvnbeXYSqmngSaZX9zK6sphN5A3zo/3wwvzx2LavKw69Vh1+sp4YJrfx/3x9vOYU9/7Lv6nmW7gU1WlpAHcvPbmyOFQRQXFKet/+CSwQLRQA+FMnDwJw6ovKTl3i3/H2AzBafVzY5kHBVN3WkJ9KQU29jeT0vKqcULQFygBSpKqV/mgYXplWF36eS8xrGVc1BCKjHajURpXcvO+whA6dqYs+O+cCoHaG0jwCKVfUfa2f5iMo42Q9ilTKyneWaEG6BuXLKegClfim9s5Ltv/+YJCey86/Sspr6NAkAVnJ30oIMIYVY+afL74D79lfEm1/H5j//uET4MjwQPnZubagCdaxUsO2/SAsEC0UAOwZ3/m50GBuZulvRH8ibswn9z8vtJ0mS1aVjkzqiGNGSnH1XAQ74HLYTb3PUMAiExYprGURlaVIdCk34YvLz0QsEp7vd0kraBUssDC6ggHBjGMKZLmewpfAZk/+MvKOXhh9Iua5agqiAMl5Er+FlDWhbB6UcBsUD2hSoZoi/akb5zehPgsMoNmAogHEXICY/GM0tcj4lEy6Jjn/bt7+/ErqFzDjg8H+/8Lffeb+G2GBaKEA4Morrwwu/vb9uQVWth+kZX3XZcEZ+GixuwtDqoT1WRoCZM+eOKi46y2rza0vqb5ZgmaJDYYJiwzSaIGCDDo1C1xJTcYi9S1zo6kLkYIDg8bEu/w+qkGUfcjmR84bIHE8CuC0Ukc1d5TZU9ktA0Jce4OpE1Ed+PPy6MrFDUAlVyjSyuNCUcuQ03j9ZDbTt2aZWFMhbK/dkUwA8g403s9h2ej5b+B4cxHcu/x4ADABCJujkCC2/f1Fsv8jLZYPIFDj13+3tFRpjEYLiM3jxP7nhzYUAyQu297KuFXPPHX6CdNpuCx5+3Oqbi3dwZgT3YSeYm8X6Q/CmDm1l6wvoAaDoqajgBCYRCJ1LELlM2i9yQyk4qAnKkaSOh4Ris9A/XzaEcku6tfLTkopt812OZecfIFuT4iBXpQkOeW8fpHslY1vJD5ZTaFNZoAP0j+9S1hGLYNmBL62bcL+AG5e/ZZKy7F9G8RJEQIPG/8dFowWDgDc3X/950GtvIVVUm0AANYUWN/zVPDLB9jZRtN2t3XMKbPqiLxE03Y5GC+6BQVlqnJOR/spDK5sF69vXAEDkAk8FHBKnYoGoUCgzOqpPMcCDxlTpTWOwdZjZthi2oB5zwIWNnlKPyWqAzC/mxha8sldjEKvPDHwXpsZnJTRK2Y3gKDnWz0WM//uDtL/hPgwuH6J+cMyDtL/ZPMouHvb13d+ZlX7eXHkr/97T7vgk7BgtHAA8NrXvnbd0eSdaD3QYHwC8X9grpPnXx42B0kxzHa62OEaGlR704YMOfu0SL4SPSjj/2dGwaLCK4i0akZQYV5l0klr7HkypgYVpx0JaGkPQsYuzACijA9QrJ+ilQjzg9FuCLKJkTUZgGze6KAnrS8+gjzwjvpQIH9aqRuv26iSu6UEAKRMDszoWRuQNalDkOq0X2pHQfrfDEUjcuy/Sd+uCfUZwi07XhQHN8sCPwFvCWNwO/CTt2FnEtlFoIUDgEju5P1vTy3I17qrGAVpvbb3G2AStACVJFklJuvpN9IbdSw99ZwXhlKPvNrwZCSsAoaq9irNyUj2XBbqMchl6xwBHPIrzJfs8FbqRgVQgCwjI5RcQT7noLg2ssNTtICJl5OAWfJzfF3rbOtWPu3ERAhIQXb4KMDhXmbsTldfUjNAnIIRIDCBhFwTj6nJsH5XuGxdPP1c10nrEvNP/ABODlj6c70gox5BEQDo/cS3G2+HBaSFBIAf+q4XfAEn4w8iWC0gks5ZC0lirB341sAAg2JbU3GgWXNAB8714vhDKCE5TQZqjbqMzjAvFECxTrzc9bcyNcpz1bTwViOQc9oDUNc5fJglvICG5AeAOPUQ6s5H8kly9+ZG8p8RM2Tkkb/1/jz7L2n6kaj/micR182+YPdfmBjbi/RPi6j+JP36SZk/r/kckV63AW0c9tuAM2sA4gMIob9bd74IWpmpOCOU2v3eyxv791z57EfdBgtICwkA0dNLo5NvZtuSQYBy99biGzgVfAHt9osljdTlxoXGfvZkvfVQHHQRDFD2scThWQAVG10lcUtYbHTE2o6nAiRqLnjt6CKMqFJXmc9TDQwJ1OR+J8d1KH/bTbgoRa7Uxat5AZXjUFV8MGaQmj1cLmRAzD0e3S7wwemXmV0Y3uu2mAIk+/F42/qkFXjxCyQQiOcD88d1S6ylRW1t3LqU8TcO0v/U8DFw9/anGrUfitqv3Zh9LHv9zbCgtJAAEAnv+vQfuXZyrU1R1WGhVVREX8CxA9/OdmpMDELNwnM5ZZils06p7bK3PklfXyQ6iQ/BeuxJpZU3AEEoXYKdcQIa559KuahaW63AOiCFmcmrI9Go86A+jBJ1SOeNr0GPtTmcKeFCX0Khqk1o7kHJaSgApIlFEw3JwQ5ohxcngPWBkVtleDAML2CQwUGYPo5B0LYMBnGbgtOv3bgfdCSnHPMHVv3joJ837L4ip3xB+VWN2Rd/+8knXvmMC/4UFpQWFgBe97rXjYMD6Zey9IcZIBD+b+y6DEY7nxKuakD655VQG48fXI5Jam6JszthRpc1A5RR/dT7r8DACT6uAgplMJvYowlEOYHHaA1aL/5Ri+ofnz3xarPz+6tk1hBn6UOgIMPXlTVfE8vBThQgZw9K5p1qARPxDyRtAHcAxXAfpISbxMzM2G3aTswv+woOkdETs6vkp3LNJMT9W3leSoKiKP2bJP1jyu/h5afCfcuXgnX8sXbH0j/9OmHd0OQXFi32b2lhASDSxXDnf8N29Dm049SpM9BoAscvDFoArmRTAGSeOxQpziGyAgYIztjdTvr7F7VeE4Ly9donwJdrVFo7w9iqIbhOMpDG29UfUaIE1otfOvIos+dkJihuEC9OO6t9TKRDDZ+3pgyXFf0Vk9bkKYjUBzEPWtwDfnghpwi3niV/Zm5efBxcpOVtyMcZGJLk93w+agDt+qGw3ki/R0zyYS2gSX39GQC2wU17vh2qn3EqWSGWN/7My59x3sLF/i0tNABcccUVG4Px+r+rRqxRTcA0msm282DtvG9JY8nxxOGNqLdNltgkjB+lvsbSHaoazOCgDjZPJd5evPllWm9VqzWjTz33JRuP7xs4MD1hiz3espcPrFizKcsakkt+AV/s9tYEwVz2OfA9DRreAShJS6C9FvWcMUXie8f8/uG56Uov31mZv21122gA4fykZYCI0tqnhbLq78drMAmqvw+M7sX2H/tGsh3jegi373ghHB/uB01Aki8AqXb5t44jNkxev4ihP0sLDQCR/B2f+B30409hNWwVmwTZZgx0/MDfhvHOJyUQYNWcpwSOzN+I/c92b9xu0nl1GmbpT8WWb+RezljDvNZreXiuOlyn+QHK2K3Y/klKtyBmCUAJ08XQuYr4YgJUfXGkDBDNQgEolWechxMxFRrEPHRY7nBjzAAQX0DMoYDh+UH672RG9sx8avcznLVp4dTgAgaxkImPQMDH2Fzgc37jHnaaRob3kuffstNvHJj//qUnw817XpR/35z1Z1IUYz2C+v+RK595/nthwWnhASD6AnDj+L+QFggyLU4GAlYEKHUQOv6YVwUn1v5kYyrzxk8Y880xM7RV6cUsiE5CnS5b9j25fJ0mAOk/DeUpI6scUz+CHlfvfyt2tg7EY8/l6AFpGZAn9CGq5aPG63Uo8sjYqV4GOHQ8BDLORZDnRTMgaS+4Gpj/AvC4nBg9qu+tqvmpXwCJfc/bfJ67FXNPQj6nw5LHh8ft8cZhCRs27PkPv4Oq/bG33yk8D67bf2V4bp30U35P7ZAQSqPR/7HItr/SwgNApNe99Bs/GHwB/139AJRHsoWsO8d/k+EOOPbY7wlgsC2ZAaoBDByroqnzTe5J6NLUWiT+gpicoqZCXmfvvfgTuuegmAk6cIdmE6rKbsN7DFbMrOmcagHe8AKU18ouAKsqC6NrQlDbGj8CgDFBKDv8NISIOAyMvw98zO+P13pW38Go/mkgUVlaX7510ggkLTdOWEoCxq0AwWR0PDjs11nNF3s/LqOWnX4jvx2uO/fVsNHsqF9UnSGq4aWkoslvv/pZF3wMeuoBIFKUBMP1o/8S/OQkyNBQlcMoEa9Hq5fAyUd/R+DbpSSJIhDEhpicgskxyEuS+KChQWYnduAZD7+krZacfCdMXuxovU8ThtIEoVCSjOQNwBsmzjlFULz44vfK15P01lOpnrUIeVXt3295SdOftYxcVmBAaIKjbxCYH4bM3K3Pqj8ZKd62nGehk4560Qji8VFQQdqkdTHj6/dv2/WgXhxn/4qYVt4PCgj4Jbhl70vh2LaLyy9lnX/A0h+T+t8+4DbWfgp6StQDgNA//M7nfhEnGz9bfAF1eBDElozN6cS5fwvWz/mmYL0GiSeDh4AAQRX6Iw1RocyuqyYCq/9NJ1Mvj/Yr4T7IyUIgXXCZ6SfiH5hInF6nF1PToOQa1McBxBVGBJpgpGnDajoo6aZK/WLbS0/DNAvwUlD3dwENzgmAuFyBpq+2WfV3OeTqs5ofzysQ8DwE3FU4agLjpARMguPvgWRmsfTnRJ82lMbSfwkO7XgO3Ln7myp+5xcQ7SJ7OpPj719f+dyL7oSeEvUAYGjbl+57U/AyfYZjzqyOdgcOQXEOPnDRy2Cy47LkFEzMLtKeSM0BTKYBd8opSUM5VRXs2IMmHm+cfpDtf+4IZCcBYVu92ObaE670WSj9AsjY7ek+40PQXsvZV6DJQ6S2PZaxPTMQBCk/2A2+2RWAbYkZ2JvelaBDhCW4Ef+AF22EUop/MqtIJD0U+z9vp/0Q7x8fEx9Ew8k+KRcjbLfxuw/h6NJlcOO531F+RAUz48fJqj+0f+6esf/XoKdMPQAYeu1rL19vRid/DH07QnEYYaUFlCGxyQ3g6GODU3DpvKT2IjbZ7sc4zRhxaArR5QE7c7hPO9hA0QBqlVon9ChgUMYSLPuxLo2EDieJd9BiFUNHCQKAuOzA9tBTtT73OwCoNAq9iySbj3AFqImzKDV5PMDWjASSJw9RJiZIKn58e3bqQb5uIttqFmh92FEZ9qPaH36GcY6oGLs/AO+p5ny47rxXBaefDG5t3DY6xp+o/XHZaNfHr7sSsYWeMvUA0KHXfcezP+4m6z+PuR+6JAdVuiWbBJPBzgAC3xsYYkfqeEKp45COJ1jCfDJ3UFqnrD9JJ1ZtIB1HBzqgJ2BJowUoOQPaX8ADZs++agLa6SZemrsqe/UfsEMQRaIrKCCaaAAVwFCTo3KBpFFOgsnjtoECYoInIhkGnQcBZWARLSAfM3kVoN+y5BagVlz9dfHf5IQMKtokxyp37W3E8z+EUTA9rjv/e2A0WDUqv/48PjsRNaXY0eTffN9zL/hr6KmiHgBm0Mjf9u/Rjz9SGlJr+o+LJiCtbrTtAjh66d9PIKANNU63wElDA9YGIiggOwzJOAbjHH5YmQLqLCzn84AkoIlFMuSVOAtbSfPNw5UDgIYS43wDqgWn4b9cMQ94AyCnJJNNBiqdd8A6I0P0g6yjADK/iTMR83mtF+SkIPY7tF59FJDnJeRRkSH7O9rxySDlgSU+NEkDiN80Mn/M8x/BTvjCed8Lp5bPt1M7VHZKlfDjJx90Nx78ZehpihB6mkm/+vufejzu2PMX5IZ7KTBxHC5cpXRkajacXRajKyduhnNueUdobKeSRHTAcTiHRT1GFKkIPLGGStp4gCcV4RmAVTJbrz4DAPFU30kCc/9/J6KbnYggGkGZgCRS0xQn4MCV8uysPigPsmaDXMbDfsUQn1spHX5AwAYx+0U4p4HrptcoxKTRjLwMHkK2fsX0SYDbnhJA4u+ruRTsTA3qP6zC9UHyP7D9EsgPyVoEcBdfGT0IeTnkx6ee+X3PefQd0NMU9QCwCb3lD6/9Tj/ceQ01QZam+QIaHuwPm4r5dQqdlRO3wO6b3xlk1VpgGp8ZHtPE4TrQOLE2jbyOk28OVBUHifpjmXqsMb+QE2+cTkSajsl2PBWlcJzGTIViY+bWs/cko8NhXoN6GrCYASnjD8ozoupPweEHVKYDy+6L7LAsnyRpKPJ4m1ascynodrydp10L3v4Q55cvlLUgdfxFs2mDtsNNF7wKjm5/TEflVwAQn42ME+j8ZNLgxkte9cwLPgA9zaQeAE5Dv/6BL/wbalb+bRokNIJAlP7OAoDLTrwoAVeO3wS7b/sdwCDJBk6DgsUzPkiTiWozB9ES1NevDMStW49rUjJP98314tAZT0c20JuJgUWZLhkYTu8hMSe6AIIZbHQwD9UgWiqgAMHWjo7OMuAH10JHIQIomoQmDTEQsDRvZOwBHVg1mxjx+jT094i3if0h6jtJk3rE/v2wHW487xVwdPUxtdovaxRfDcqQYcGEi8bDP3v1M/f3qv8m1PsATkP77r/237t247dQstWA7ALQzZZZ33kpHLn0+wGXQ2wclgJWLCX12TWDZEa0EUjC4pw6DaMH2/gJiMNciOz8SmaHhL5IJCKPSdDIFOYcgsQsjnlsAvYtQMmDIYYiZsKScqyZfdofIJapeQzaeVl7PoJEA7jPgsvpzqSdoLzkQmiKtHfyLjJQhyTujMWjz9Odj9PQXtFnEsfu9+FbRSdf3B75IWz4JVhz++ALB/5+lvzZnwggzE+F+WUEoQAAv/mqZ5z7JuhpU+o1gDOgq646uLJx8UXX+Gb5CvaEsxZAHS0gD7sVcwBGR+Gc266BbeN7kyPRobq5vPgIZEot9Qkgp+LpyLksMbmVe5HssfSBK4OYO7kOoFxrzQskY6Vgsbu5LJTnst2eRxgGADt9mY4ngHFq9Rj/B+snwJKgBPlgdazqi4CqLURAiYw6kjwABI2UtLIeEwPK2tL5cOP53w3rg13lByEwWkBx+KHa/TS+5sCxa199+eWXT6CnTakHgDOkX7364I5m/yXvCXbwC6MpQGoKSAiP8/6BpaUAQePXYd/tvw+Dk7fA0FEGgeQfgCyaQazetDgz4zA7z6SlS7hN1feUA4AcjWiQjL+ATByfAUJtcOv0y45ChDx6sI7Yy8ddnoGYXRzB/m9WuC45KlGSkNSESH44UfP10hgRSJqFhDEDg6YhvijXsjB/1Bi8qP3Hly+Bm85/GUzcMpfFF/N2lvyG+aPHvx394cYDD3zXay9/7Dr0dFrqAeBBUASB4XmPudq7pZeQ+gNUTbdOQShiN0qnnff9Bey6/+PQhIafGFqSiyIoxA4xGkdPkllCjCVKIFoCFT8A6vUSWRiIja+2uWoAcSeNGUAcPSDjcLSM77I018lB5bjj7r5Oox/N9nRMk5TSwKVQGJ2H5Copy+pzUEaP6b8uMn/SfkoOhDd5E8nmpyW4Z9c3wd17nsXflkxDVXA0iT4gzO/ayX9ff+Doa3rmP3PqAeBB0lUHD66M8bFX+Wbp1UkTyJEBSeTJAKCDakLijuW1e2DPl/44mQSoVrNj9TXto/ScAwYBRNEIMPfzEwnYPZcOZu0gX580BnHJCWg0pTpQhRxBux/zU7RPQgn5Ob4Ho09juTgH+SA79FA7O2lNtYcgA0+09dlxqeVJT8lwdEws+aOP4NRwP9y+70Uhxn9ukfZcCbMt303i/I6HFL/qeHvj61737GePoaczph4AHgJdffXVzQMXfNNPB4fVvw4hQscgULoHg6jQNqsv/Q+Ndc/hv4AdR/8yprVAzEptgDvLRMZtWH5KLF39AwUAYgSh9YX5NaIQAaNxAgBAKbTYCDgw44uJIPuIRUUfiBe/GoZMJxCRxCObroxRHXcDcSiicSy67BfQQUlineMgnxwGNQObQnEc6kQebQCX+3Y8De5MUr+pHKtomD+BI2hyVlT52zZoFf/6Vc/Yu9Bj+z1U6gHgy6Cr/uzWV07c8L8Eb/7OZBLoeAApccaYAtUakjaw7/BHYHl0b5JiyQEoeYIgOXFRXWYm9lmqkzA2UUkwUr+BHU1AtQHVFtRXwJoBawlNxCtxzCGUIck8yGhFyL0WUyZfBjHJPox9H0J0I/VEdGUEYEJNYebRe5jxnfQhYGnfVva+C57+6Oi7AO7a+xw4ubyfP+xc5i9DejlO9jkaYgt//9VPP2fhR/Z5qNQDwJdJV330zicFCfqO4Bd4RmrkkjGYpSY6cZBpxFW1AoLV41+EvUc/CcP2OA9ThV5UdwYFL0NYDRxLfgfqRCQoU3jkJFpmKeczk6fRCx0DhU/+gKJVJKXbqTPQmC6g3ZVZMrM24ORJAgDSpTmGMH26VqDLc91TWnEqp8kDprKDUIZFx0ECgA23M9j6z4LDq5eWDzpD7XegYOfTDEHI6b0fDz6U17ziG/bcBD09ZOoB4GGgqz96+7YTgD8X1Nh/EmL9ySSgjk+AsldcowUsLV2wjfc88DewKywNbYjE5+R6jRZoGJGdeJpV6EU6soZAnir7v0ExJyQRSctyMgam2v8umwPC1FhGPU6Dl+RtgRxEcRKK1Ad+R03dzXoIJS8i6PDoKGUlDz+uBKZ/Cty788kw0Z58kSppr9ts4qT35NF8WkT/H1yz8/VXPgVH0NOXRT0APIz0to9/6VsnHn/Du8HjOE+gEU1AOvkYM8BGCiINJydh9/HPw66TXwzq7XoKhpGovJF5k23vJbMQuTvtQI6DmA7aB38ox+P9jYBA2k7mQJvWKVQXB+2VlN9Ghi9D9fgjp9+6Rns3qse+ODmtf2DsedATNgXUvsdcZvR2TEIU4ejKpXDP6hNgFLaViOqGqACAMkx7eip7+r8QpP4/fPnX7/oI9PSwUA8ADzNd/dl7d5w67n/G4+AfBwfhgJ2CTdEE1FaWmLn2I1BHYbRtd5y6FfacvB6GG/cFBpXurMjmQJLkKVQY7WDKgODynAba51BsZeBuzWx9iwxGdho26cHiDGy4m7JzJSMxMT+xNpMccwICgDKgCdhoh0h7LB2lWuByTgbP/v2rjwvM/+jg7GvAdihM5pFV+0EdfaJLJHW/HYeS/yPuOfIzV1500Rr09LBRDwBfIXr7Jw89c0LwZsDB8/IAotYksI7BSEYbUDBYGd0Pu0/cADvXbwtMsJGYmVVi08fADKgZ+x6oZkDiKGvbCSw5nlF3AK34FLg3QskJkFGLUhdkSUt2Q+7SjLxY9Z5NA5Hu4iPQMQ74uiao+ctwdNvFcHjbYwMA7MkpvJGqHsU56Um/hIb4mPnDkz4YIgk//uqn7fwb6Olhpx4AvoL0BiJ36afv+56w+vkQMnx0YiDX5Dg5GQConXAgkpU4OSf4CVY37obVtTtg+/pdwRbeSD3lQbQAEMmew4jxPplaOybepI4xNEo97hpxGg4aSpI3dhXWEYY4m5H7LEQACNARtocQ+y5w6Zg0AXXotQmoGtkOxwfLcGR4AB5YeRQ8sHResO+bKaanGUk9AKpbkGgtqUvvLeEpP/nKr9t2TR/e+8pRDwBfBXrbX31pFdulfxxi3j8ZVOR9JUpQbGiyrKA+AmHMfChQE5h6deNLCQx2jO6GQQCDOI22hshykhElqztgQHAs+nUYBABI+yEuP0i6P6Wuwzn8R5jMgDTrUcz5dyHM51bCejl1ZvJQHIRqEsQnRbv++NL5gekvhGNL+1nFh5rh7VrfrGZ+VfeTeXJvQ/7nztm2/JbLH4t9Rt9XmHoA+CrSe689uveIx58I7fyfBiDYRTlxSFnAMr+ssWzrdN56RVT9t4/ug5W1AAhBM1gaHY596jhUFuWzHydtIWkMAQCiI23oos/Ay8AgPGpQzgOIdntgYBck/iSo8CQAoB2g0hDoAQw2hufAseUDgeHPC+r9OSlPQDtFVsyf/9SSX9fJe0DZ1j8adt60Y7D0f11xGT4APX1VqAeArwH9188/sG+4Qf8oWLj/OMi8/ZTta6sN1IDAKw0lcjk5mCDHhuOTsPfwJ2DnqZsS8w9xHDSAEQxhFIBhnByKMQowEBGcNADH032lFGDH3n8e+GQ5mQA+zn8QAKANgHBk5bFwx+6nw3ocHETexRtmzz2jZS25SKWuYO19SVoi/6Xw+m8+fmrwltc+A49CT19V6gHga0gxYjD2236QvPvfglx+rJcQGlk2wU6ADLFSErogENc7D/817L33TwMARMnfwkrTJuaPy1IjeQFB/C41LPkb0QIaGe0ojVtAPPJu7J8/pmW4ZeffgrtC3L4r6a2NX0l8mKHqpyiHJCkh3QC+fZNfHf6/V16EvWf/a0Q9ADwC6OBBGty7f+0725Z+vHXuecEeRw0XVmAAIHH2EikAKMwPUEBg1z1/AXsP/Rkzf1D7l4LTb6XhXICo/kfpH9X/5QE7AaMzME1y6tjLHwfziJ1zNvwAblp9Lty68+kV09s1wLRnP4OSWeLQhMFpeTDYJG9uP9O878or+yG6v9bUA8AjjK753OiZG20bHIbwKo9uu4c6fwCk5x0TVj5Du456xP7r354chduHLPG3DWMX5CD548S9QfVfCsw/bKIfQPsCAI8cnEb0wAQCh+hC+Ni+V3AAkmar+rqNUCS/gpLkFZ4IyzsGA/jV77wUr4WeHjHUA8AjlH7387Rv5Dd+oCX40Zbw8SU1RtgL8xhA0+kEsrv98GfhvLveB6sDDytDlfgs9ZeHmNaNAIEEJWRUEeZsGjfwqZWXwC0rT8wDeepgJd4m83TVfMjLF4K28etBkXjbdz22t+8fiTSAnh6R9N1PxsNh9UtE9KZrrpt826htf9R7eGlwHA6SVpAYkHMFypTkkEfrjcvGzkviTNjBo98m4zsNHhKdfTH+H7P+wnoomXwYGb+BMkpky12M7lt69JTNr3MIdB17gh+joG38frjwLdf+FvzJG96AHnp6xFIPAI9wQkwM9P/F5ZrPrV2y4QMQgPvhiYd9qV8fqeMwXZ3H/YtMGqczT1l87Xo0voOEp8TYyfsf4/4gsxgPZFATJyAg+ryfLMFJt1oAAIzdL2CQJH2MQDi4N0j7tzRL8Bsvuwj7yTfPEuoB4Cyil3/dtlvD6qfefwP93D1H7v+PLQ5+GOKowzI0Weq6a0yBNE1YZHO/kabhSTzepGS7cCxyeNgJTr7MyTk3mLsU02CJZ+Yi49H3oIoHx/HblHT0n/xk+K/+3lPwBPR0VlE/LPhZSDFRZvWWP/6xycljfzJeX4d2PAkRNS8Tc9YeeT8Zp2xA346glQXDEgx8Hos/rjGOojVJY+sBjFMKcVxT7IgjaQGml3D2M/ighrQba3945ZOGP35lz/xnJfUAcJbSlVde2brx+n9MzNxOeGz9NBEmyey64pwLTE5t1AA2gqQeyVDckzQqbxw/PwGAToQK3H8gAUEChkntJqayTuOati0MB/SLfa7+2Us9AJzFtHP9gY83cdR+SQ5CnaZb5i2JINC2Y5hMYn+BEYzHo7A9DtrAOPUSbGXm3DSVlgWBpBGM0vRaMtEwdDk8agEhgtDuaXf8BfR01lLvAziL6cCO4yduDGI8MOmSzvWjrKqOuqj6k4+Mn+boCTweZ+NpEuO37QCWkiSP3EzsNIilOQGFZAYU5pdBhnOfBIe48eJvgD6L7yymHgDOYtq5c2eL64l9SywupQnK/D3R6R8k/iSo/3HGsTS4Z5wirHXJARh730WTIQ0OajN6ovqAkwQSmnPkTIgRNdToo40Avfp/FlNvApzF9KlPfSpF66oEfKDKVk8jAvlxUv1dUOt9dPxFv0CcoCN2I0axF1JLcGWk0JgnMHBpN0YJ81oWmaS0Z/6znHoN4CymJzzhCXRT7FBL0ymdOgWYJx0kxKc5/uJw4+RdkvoxE4CT9Js0mjEMBhwKjI7AOLrweDmlDesko2WiUUkEcuj7VNKzm3oAOOuJKtu/HNOuw2aUHTBThuv0YTKXQcwngOFQcnmXgKfd2pYAwHud5luYP/kNgKcS7CMAZzX1ALBViNCoAUUuJ2YFnn2o9TzvX9IEiGS0odgtMDB+M+TJP2OaoDgEHKwwAECK+KX7yRftAqnvS3K2Uw8AW4Zoak81A+/LhCKxz7/Lnh+eyCRO+w3NMgNAMgfYs4BLq7C8xIw/iZdOUrpQsg7IQd+VbAtQDwBnOVW+OMOQGhQovff4Gk0S4siBXNWIGRB9AMOh5AsH8T4JPoAhX9+0KUeQn+ZZK0DsEeBspz4KcBbT9ddfL5a8yPqONZ5S/GW48cYMO1aGFFPDnucm5IQg8fQlX0CTxg8YDswiEQHWIuL4HtSjwFlMvQZwFtPe5z0PTx5Nfj2Y0selX36ekw/YIRg7DKHMBhTTgWOIEMYbQbcPTWFCnAUYzYDYC8ivp7wgLT2OJETiFJyMUxSggZ7OauoB4CymHbcurZzYBUtlLB7gUXbTrD88inATxPVS4NxhGvyD0tBfPK0XyGSkG9wjMM6yF6faa8UHEEHDb4f1DQCr6aeUAWRNIEQTl98dNoHv7ukspB4AzmI6tnPw5DR/l1AaZTeN8lvU9DjVVxzks4mDgTbsGoxDgOWpyZLKP2HJTzxeAGSL4ARsCADkHCOzDIKFsHwzPCmc6Yf5Okup9wGcxTTC5kfi9B8yUTcMME4MGgf9xKSuJyBoBgEjoqd/kCb8cCHc59wwMO9SWifHXxw0RN36Xuf6S/GD1D8o9ReasNo/Dstog5cYHQg+gh+Gns5a6gHgLKW3f+SW72th+ANplN800QfxgpDAQKYc4TCfC8wewnxxSUk+bjloA8OgGSzJ/pATgXCJ8wHSlN0RWBrO+28l/u+5w6BGEsaTlB/wY++7cfJy6OmspN4EOIvoqoM3r+zYufqyiff/a0v4LQNKHr00ki8Pxkmc4ZcAII30B9FP10SmdiWPn3MBHDN+zAGIIJHSgnX4n3i3T/tpaACq+wlpd+O4BCdhsDbcu997vf8AOf/raxvN+658CvY+gbOEegB4hFMMs13zmfueNRm3/4DQvWpjAvt5xl6ezBNdwzP6CFOrlz8BQvLlybBfMk43DxXGDgKUocQy8zsBgNSLKI4nxgOHSjIhZwBKXkGaBNyJu8AjevLfhi1+28rQf+l9N7bvGEzc2/7OE/GvoKdHNPUA8Ail3//0oQs3Wv+97/zEvT/gCb+OmOWSdw+jF1/m8ouM3Dj27DsZGESH9ue1Syp9jACwXc+5AGkWIHJlvC/spvZhGQfA5BnpsN+kSoIMERY7GCUfItEFfkI/MYH2J/7H9eNrB427aoxr7/zOS3fcAz094qgHgEcQHTx4cHBoxxOuaGnwQyfG/iU++PR08tAk7YXxeRvNUvZVA3Cy38QoQCrDc2KQnI99AgZDrLv5xbTBPC8Au/7R9DTW7MK8b8cK0PECYg+htMQRi+kbxhN6E+DKLwQweG9wTv7nE59u/mc/I9Ajh3oAeATQ7//1Peevn2p/6G7CH2lbvCTxpIjWLtM7Pa6qPnC2X943zO9Swg9l+71JTMpDiadDvgwcknR5J8Z+EuVyZ0kxyISm35GezosMGOIJBQzSk5ZCWd89bum7tz1tfOP7rh+/1dPgqpc9Ee+Dnr6m1APA15B+58O3PmUyGPyz4yfa1wS33bJO/4Vqo3ekO4qqXyQ/q/iJ+WW2IETMtr5yZxoLIHXjZTnu0nwCwrKtN+nArhj6sfswTff01clH6lGI9CTfGnnfqeaQFAwBg/AvOC8f13r/i861b3zvdZO3o5/80nc8eeV66OlrQj0AfA3oXR+7+TmtH/zLU+BeFmxnx4zvxF4XAx55ZJ4KANI21CYAYL5HO/jonACsolMaLVglduwKHJiQuwknTcAXx5/O94Xi6geYHhPQEEIZJmwuYbmOPGYwCL6CbS35Hwm+iB967/Xj3w2I8QsvffzSp6Cnryr1APBVpHd8+IankFv+ubFvXupTIi4W55tzxRln7PkMBlgkvF2ytNfkf+gMDRDH/Qvc59sgf5s0t3ACgbQVTQAvWkDMEnQ+3xM5No0YbNOA5Y9qFzougDoIMiAoKBgtADB3MkwgEOsQPYkT8o3z/pUBBV/xni9s/G7wevzUyx63cgP09FWhHgC+CvSOj910PvrmDRNyP9R6NyRh9FrqF8ZHVzM8GA0gu+JRzQWsHHKZUM15Stk7YtZD23IkgZLKLxqAjiEeEST1H5Zj4j+whoBNC9btbAlUO1BAYsY30RmKKA5SmhYf3s6/3I39y97zhfVf30bLP/O3eX7Enr6C1GcCfgUpMJ/77T+7+UfayeDzG7750Unwu5MLMfy4yJQ7aVqvlK8v0l/WiEUjQHSVFlBpA/FB1j2PhWFJuJIdf9Gm96IR8BwApN1/Scb48hYMvMJDBQIZDOSZ2deQvJF1FcEqMM7c4zrH0xLYP3yHCQ6WWmh+/BSOvvCe69a+v+9u/JWlHgC+QvSuP7vpCb/9kVv+ODTot06g2esjs4vU10UdfZnRnebhb7IIF5HE6S176OjeFQiAqPIUHYFlAhAFAZBzoGl+CgbpGvEDmAWws0BhbhQQ6DK5BSfs3K/X5VlGBQjC9zqXoPmv771u4w//4GZ6DPT0FaEeAB5mesMb3uDe+Wc3/aMRNp+ZwPCFsbMOoV0MsysQVI6/piP5O6JWVP9Ozs7U+NzKsDxfYFwmMgAIM3mcS5C8yen16virwcCbZ9iIYX4uzgEGy+Rd/IIaHKq1AEHUjFocBDAYvHgyGl/7/hvWfhB6etip9wE8jPS7H//8vlPjld8ckfsur4xfzaip2wDW5u86+SJl2x5qzinj/RYiY4/XJ4BV/yDReThwSglAIJE/jgSoBiDTC1hAIF/NF5LNDXPMrDLFunjrGDT3acDB+gZSghJCFU5U9cZT/Ia4M1Tlv7z3urVvWx6s/ei3Pe6cY9DTw0K9BvAw0W8dvOE5J0crnwp2/nclyWVU/or5nVH5KzFYRCam4bsgg4Km73Yl/2yVv144/s8zB7eeu/PF7Sj9Ua/SoX5trx+k6pBKfpqxdCMF3WNT2zPMgOxDsCZE9hG45DfxOHz1Rrv6yfddP3o69PSwUK8BPAz0jg9d9w8mbvjrgem3seR3wqyNMDAn6xQDuajy6Z+zujJIGM9yCGQvf1eadl1kKjyzECU2AdgBCHlSDx7n35VB/1MoEKCkBXP40Arl/PxAe5YAHr0trIdpTIAQ1wc4PgH40jrAPeu8D7PqRvW7dLWZKYoXxKonFaeJGYaPd37y4T/4wqnXvuRJ298NPX1Z1APAl0FXX311Mz7wjJ8d0/Cf83Acrpb6lREsypax5VF15MzR/EfV/sJ8WDGOEuE0w0+RSHTJzRe1wfNEocTpvkUTUN08y/Gi6suz43gDT9kNcGBl+lHbAoCctwww2glw21pYToXtTta/DR3aKuIUcpkLJEGRz8XvO1xtyb3r/TdsPPklj1/6mX568odOvQnwEOmqgwdXxgee9bYJLP2L4KhCnxlfnXgygZ7TifSwtvs3AQZCrI8BbKrmw5y1snBU90lAwOtip/qpUn6pmgbIPicqKs8+ZzbzW1oKr/T4VYBvORfgiTtZQ+g6BW3UYCp06KYX1wh4ONYGgn/FBRh74/uv3/jNgwepF2QPkXoAeAh09cHP7hgOLv7dMQxfE219L0zPXv7C6NNaAG8TFnU/Ut4HmBlvn2J4qgWktdN1v5xjZlcNgM0BsfFV6le+ACh2QufZT9zFKv+ZUux89NgABC/cD3DZTuloCEbiyyfAOWBQgYA9n3oyc6QAmuEPrV80uvrgzbQCPT1o6gHgQdJvvf9ju0aDbe8LIb6XJOaHwvxgmZ/jWTPEW/H0kzr9pkACpgChIqM/i7O83ofaCVjUe0jMn8DAS7ovWYlvS+Cb9fnbw+tdvB0eEkWz4bKoEQQgOH9bh/nNJ3JzGD9HSGUBk0BEMW8gOF7XJuP/8Z5P3vkQa7i41APAg6Ao+WHnub8XPP0vyAk9Tkbfk1ZKWVTBtBYAVqU3tn5mYOy40KfV/0iZwanWCGzHHbIXQ9EC9G7yvM49/jx10EMMCDl84TY4vcPuNLQSPsuzgv/gmXsBlmV8k45yJBOXFkBwHVMAuvvIIBC0gW8b7D73ml4TeHDUA8AZ0sGbb17ZaJZ/J0j+y1PWeh52EzuS3+yDFXV2KYzNKyPtM7PjtPSfAQTz1oWPKSX7OWF6NQMKCEBm9mpwEKDKtNi9BA8bXRDKev6+sFZQUeY3n88ZDcBZLWGGf4A/dQoVfvtGO3rnJz9JD8JQWWzqAeAMKHr777p9/J9DHPrvaHIPmaG0NOynST+EM0RbVwMw4o8Zf5aWwKvMnzBf0k/Z/2R9AcUHEBcHIBEBMhfaGwG6HsaVh7mlLIV3e2bwKXzdrjKHQZUm0cFVZ68x2/oz5P4EOPx79+3e+NW+D8GZUQ8AZ0CT85/+xgkuf2+09z2UMJ8m6EDOYjE2vW1+RuKjirxO85xp689S6aFzrGsGQM27at7zulwcH8/9gCy6WFuCymHgWcNm1vHLpEuCwv6Ne9gkqHwCAgbOagBd5rfOwSqNePjDf/jF0b+Enk5LPQCcht71oeu+f+KWfyoyvjc6p7X7rUe/CPDM7VCn85oL0foDQFR8nFL1u5qApdMDBDMzDxnOhgXPDqzSH6y3sPPgwvUPTKbB5eGivSGI95wAAjuXjO2PNZO7jlNQfQVdQFBNAJrBv/vD6zf6+QpOQz0AbELv+tO/euYIl34tML8rffhF6uMMFX9qGww4dI51HX0zXGyqxM5lbrmta/tDJa1NCJAoJfzFY62H2lOIONuJIKuY3We6Cj3sQLASHv+/hFDhOUv1p7VRga5GMNcfkFp1HC65+X/+6PqNJ0NPc6kHgDn0hx/97Dlj2PGuEOpb9WLfZ5W/YnzoMD7MOA6b8fkZEc07dhou5IE/oRrTX81+2kx9SHWlDEKHAgAcmxQQ+EoAQcwTeMYOgP3LM0DASP5ZTkJrJhRNoNnlG/fuD3/h0E7oaSb1ADCDYpfe+9vlX29xcBmJus/ZZ2JwduNXVWKPBQGT9Tfl/KuvJQMcUwxFm+5OHasZkzvvqtrvJGs2zRuIBgU8ddQLTMOFaa1jKZ89yr4ACwIPNxDEr/v122sQsOr+rPyAvG4MEEiYMYQHn3JisPtXoKeZ1APADHrCC1/9AyHW/0qW+K5k981T/TPZNN/qsKzni3+c2mCi02zPO28PRvU/PlrNfCc9/RIoWNU/vxLm6toyj44B/jKAwGgGCHRHDvpyKH7pp4QQ4b4lYWiA6Shr1/7HTiJRxup4ovmBD3zx1KugpynqAaBDv/2hz1zWuqVfjoN2csiPWxJZGx5s6I73p1X7kvE3W++vzQXaxDY4XUCLNjmejJak/heHH9v/lOYNkIvKu8i5HA0oVUx0XzAFPn4fwN0b1Uzi7EfsrL8cSppAAIHdg6Jc2YxB140WdMKCU+HBZvlXD95Bj4aeKuoBwFCcmQdwx1uC3b+bVX8sqn9H/KCCwJRXv4BBBRJYhu2eEvdz8GFq8wy0g64U1jCfpPYnnm6kTp5IeFwrXL9DpcSY11xr2Rz4SACCm08BbBCDQSyqhdok+HKAIGkCIUy4fdCR8sLYdn8qeoBQ+QMC3O0bb0ze0ucH1NQDgKF7hhf+wASH3+qzxJe1LAwG/Mm0L38xB4RUquNmXN3VGDZvk9ZZT2d0YdkmkeIO9VCMAFCZAkCv9bY6+s6zLRn9JKNwz80nAT52P8BNawwEWtTD5R+Is5dFEBh2w4AAU74Adc9MRQfEHPCu+Y4P3jJ6NfSUqQcAoav/+C8fNaGlnysOP1d5/Kekvd1N29NMjDO2NiVz2UNhmFkagaYrdXv+pupaYYhGC7BaQQcBChyWc3Hwj9j3/xNBK7hrVEyDnGIAXx4QbAvPeeLytOrfNQmqECFOg0M0ySYw/OUPfJ72QU+JegAQGg93/LsW3LnZ6w8ly4+s1x+wpPpOMXbHBMBZ8nPeeg7NKGKu429GUZhsfmZqlvbIgpL4zapC0tQA5d1yDZWRAKrXRijH4zIO5dwQNIJrTwCc8psDwYOlvaHSFy3BlC+g6xgEo/pPRQ1Sa8cL/HL7RugpUQ8AgX7ng5/9phab7ytSv+Pxj4QdiWi5Y0padjjRCNep06fhf6WHpBFoBKDD6Gr3kzoqlemznTDbBKg0gI6EtftxaLC/CiBwz2TaMfjlAMGjG3YKWulucwBsT0ILBuLH5e/PtsOPHPzixtdDTz0AxI4+o+HyzwepP8iDb0KR3mQkP1ORkDUoIFTj9arTbx4zzaCHZCfjnALkeAz5aQ2SigziBBRnIFljPV5lUEolvpXyFhfNlygSGZgRY5HRL3DTaDpaoFV9sCAQy368jEGIXUa30h+LBpAdgwIQ8iGG46b5ReipBwB/4KkvCTH/F05JfzBDc2W1HutdMMdm7mNHY8A593SOzkGKmaq/dQxiBwMwzvvRVrZ/ksAEPHW4ThCKXVDjb+BkdiAr8SvbesbiOsx5aAxwXQgZjqVOm2kEZ0KxV/Ilw2l73xkAwu4rucL8xSpzLzl48/iFsOC00AAQw34tDP9Py/xW+kMt46pWRR3pD6eV7zNoKnpQU5cpEDa9fDa14yTLmTkwMb7qJmnbSWk4/Z5xWvGujV1J/nlAADVTnggcfn0AgQ2YDhE+FCA4N5S5p5l+LmDHHOhGDiQ/QHsNTgBfDwseFlxoALjXnf9iD4Pn5Hi/1QC6LXomGcZH6zyffUO3cdOD1PnnOv82uyHOCCTMr7k9qXaEMhlHB+TAcEtQ3oVXqlfq2vyzvO7d8zFEeENQA0YwOypAc5Z5dEnDo5jPAwEw52z2th7n38u98IO3rL8AFpgWFgBivr9vln4yJ/yAGYFHwYB3AKzuuIm8wCmtoF5jpwDslHU6pj5jUYWlQEeTvGv5INY1RQe675n9AHHdVq+d1W6Yz/xuk/0YJbh5wubAZlqA3+S8LtEUuGAAU34ANEw+D5zIqDAhLPgvYIFpYQHgqd/6XU8PP/7zWfqXLJIKCKA7LNccMMAzk/jVPfNO4Zxrsbb1c/m4yYODh8+l2YBBhvqPdn1JUW6cAB11RGMOnIdrqMNkMM1cMAsI3PR+0gTC5bfNCBHO0gZmpRnb4/tDecsz6jQLCKALElkzcC/+4E3rT4QFpYUFgBGu/mho/I2N1ddOP24laLmyYrYu5+HUccQ5l845SPmPPTBjexOqQIR4AtAGylTiagKkH55kViIbK0seMzWwIU13Mou5LPPPcwxOgYAsa6EOd9FsKd8NEXZBwJ6Pj79Aev0ZHp+23uQVK3zLgBrbQPM6WFBaSAB4759duzewxZWq6ud593ITEsqtB6BuYtUF9SZO7cAscIhEM4o5o+1NqIoCBPvfHmEG5FmG4po7AwmnNoM4xn7g+OhiH8jiAni0U29e2dtzgGGWam6X4+HU/TDb7u+mEsMm1+wKy/bKtoH6c6PZnFGn+Poem+//6O20DRaQFhIA1nH573rndlOWhdISEDpAMINxhcHR6pj1yblUCXGETbX3M6FNFRJgAKj7AnC9o+qPygGNSP0EAJHph7w0DAADmkwzN8yRtliO5ZyAznF7z31h+xTMn3R0FiDM8hHsd3V9qu9rmN6aAXY7fJd9p8Zr3wELSIsIADih5ntKui/U4iDt5z9QiZCpkqY2zrQK6e+DYXalB2MV4GQjMyD3ApQnk4G3bKAb9Z9n3EnHh8lvDzBLEZpibDDMBbM1ggoownIvzO5BOMskmAcGq2HZplqAfTf7LWYeNOYGDV8DC0gLBwD/88OfPjDBwbcA6LCYWBqBbcEd/u82K7In0Z4xrb9D+GBxAh48SNhHNHf/dXDijWEQ+HlpECR/QIClINgHDUpyDKUwIfjgl29HyeufKALCYDncNIT96zfXtnRHsgPO0ARg+l0tQNgvGSMCh2G2dO/a/vOiA3F9joMygahduh9FD2FdMXLu2w/efGQPLBgtHAAcwx1/J6j5KxUDZ4lsW0q3B6A5Iw41a6DOZ1TslPflEZ7hBTheh+XP/z4MG58YPi7DhtX/xN+pN1Bkncj8a2F1Mrjog2W+cSJsB1/9ZJw46uJTH4Vlz3l8s6weqyxV3neAKUcczAGF8EQINZgp3Wd5/2edjwZ8nrvAeBErkwA7moDZDvGSbUTbXwwLRgsHAC01L4XOAJ/K6ChryFu2xZeWXDvvsLPu0Gk5dnPq3n46EOE5Pgi2f/LtsLx2N6wMwvYSsOQPEj+a/I30D0gdAeK0QW3QAtqYrxvYcBRH+FjjJWgFTXsfPPXIB1LSja1Pl6krULCfC8p2VzDbd7IOwXmMP0sbiGsNKe5y5XnUrStN+2CgA07B3flSWDBaKAA4ePDgjoD0LyhdfWtVvk7vhRnMi3O2wYAHzGV63OzkHKKZZczakUOBqVc//Q5YvfNDsLrUwsowqP1J+oMwf9AIXBzo3POggAoCk5ihE5eYrhfMgVEAhPVR0gT2nvgUPPXwwZQTYJ89j6HzMfs5Zkh/ux11jAfgzJx/ut3tZLSK3KDVnDMK2vRviuWcXheiAd92kBZrqvGFAoAjg/Oe3qI7tzSM0nzn9t2fAoPZTF4zKj4kZp9dVoc2KbJZOwZ7//zXYM/tfwQ7hm0AAAzSn5l/KGq/9g7UeQLTaB4RCOJ63PIwP2PPObsxihiHAZ60cO7Rj8Oz7n4PrAYtIX0qml217insSOPN6AF55DxVv4XC9C3MBodVYwaIMqS78yusYEB4Ad46fiosEC0U2o1g+C2s/kfC2UbtTHk2j3DuVVONfh4jzHj0Zk9MiTxYHjJYOwor998A2w9fBzvuuxaW/HEYbB/AcrD1hzgJEj+8dWB6mdQsCfy2ZQBoQmGDOF5AGggkFqaAAKwuTJoqLLjjgZvh2SffCUd3Pg6Orl4ER3ccgLXlbbDZKwGdHgSUOSNTx/yAzQbxp866e2y14fkLKjONOsA0A8A4PRhh1MILwtZnYEFooQCAcPA83pqX7tsxZCupX7iz7vcvZeBmjLuJ/num4lHIBXt95eitgeE/H5bPwfaNe8KPOIElF5h9GBk9SnnHGXzkAl87TvgRbSZ2BfbEeQCxI1zsDzDQlD4v3eW8hgTlGI+qGVY+lHkK9h79HOw9dn0KFY6Xzg2A8Gg4uuvR8MDqueDPED9nvXbcD65I2A6nBwu7bdX46KuI2s5GWw5ms4JmAAjW9Qlf5vlh9WZYEFoYAPjoRz+67RbCZ5SOP8UHgGZfxaseP1N6MNfOJWmFXebAYKNvP3w97LjnL2H7/X8Dy+2JcH4cJHubbPqo1g+C2B6k6hNP+BH3MXbmiTY/1694wWMkgNOAm4YdojxQWAOlv2x+OLBiLmwUVQiMvXCiGjGB4cZdsH98D+w/em1oTavwwM6L4f5dFwft4HzwTfVac7ftOi4KAt1PAzPuA6gBIK5jZuD6pDYBujdNKQEKBOieE0yjgJnpxbc8LQwAHFpfvdgvufPqGXiYIyonUdrGGVJ+3noe4+Np9P35h5S2HbkVdtz9iaDa/xUMxkfDjzUOEnjCjrzE6J4lPrCHPxY1QLbto6MPk9rvc1YeZwBCYn59RwIo/R1ceX+ul1rbmIExDyiYZK2EEhMY+BRN2PXA52DX8euAmp1BK3gMHNn9WDi2fVf1rl0QsOtIEQBWYDZlh92c++N6qZm+hzoFUGdRn0F4kwv/5Iv3Xxg274AFoIUBgI2llaeT5O8SGEM6G9VGza/IHjfx/7l8/+A0gcqmB5b2q/dcC7tu+xCsHL8p2OkhFBcYPzJyjOk3gbEj46MwfpTfPM2XBDcpMjprAQwElN639NqTjkECBKwZYAEzNLJYpw7DtnyK6t1JNAZlI5+0gsD9SUPZe/SBYCp8DkbbDsChvU8ImsGFbFHA/E8opcA6cJffrqTubs8CgHhPMgMmogFQ+dZJw6Jp6Z+BMDSSllaeDj0AbC0Kqt0zuC1YZkeYzmo5TTnQ6SF4hvedjtxkBDvv/AjsvuNDwbF3b7DdA+NTG5i0Dao+M32UspHdUhwfmfG5g09kfEzH0lvJVGBOtNgBd/0LwOBM/3x+f1b/i38je8wSM7dmLC0PlepT4aWABTsKZNuBahBL67fBo+6+Cw7ctwcO73ki3Lv3scG/6GomNBSPxz4CgxnHu9uz1nFZbowZAMUUmDsICwJbN2Fz4gbPCKv3wgLQwgBAcHw9yXr9K7XQNuyOL6BLuMneXA0C5591bWT8j8HOW/4IlkaHgrAdQRymwgXGidJ+QDpNiRdGBuBpvVQD4BfRAT9T/x6Z+2/gyuMbx0ChvQDzG+eedCIaURThzMht53W6FrsxqpHKkgDEMXCkdQCz8SHYf98R2Be0gvv2fj3cu+cxgdlmf+eYFzCBOk59OgCwv+nQmAGW6bv83zUBRMt7EiwILQQAxJF/g+X8eJV4bAF0M/rs9hxGhnmq65kAwfS9q/f8Fey67hoYrt2TVP2oPjPjtxyzl9BdVOOByDCyMjOX08wapSdVQxkecvqyk/fmYQDKyL+JaVMWjVXnoRRc1TyyZlO/ahKfkoaT+htrSo4FA0xahRvfD+cd+iice+TzcPf+Z8KhXRdwER3uXEdO8dVvN289a1s7IU28OUezy+huB1qYAUIWIhFox44dq6EdXDT9g3eH/ppBVXbgDPV//p0wA1kSuck6nPPZd8Hev/pNGJy8M2gBa6zyQ1hwLH3wW3bioU+2PCfwUNYGUs3F449ZI+AFSK9l30BVBRngo3qvrl3f9QHYVBsLEImxScwDc4+YK9mMAHEUaipP7FvgN5JG8Ki7PwiPu/sz0MTRi6FW2Td8nfxzxgtxbtNwRt8AkLKpc8y+ffi6j0vzRC4ALcRL4ra954RmL/klszrlzPXowYN7kNlUe7rydyMsHb0F9n72t2Bw/PbA9BtpzL5BTNhJI/CKc0+YeYAFonIGnzB2Ntdd4eX4hDRAjpOuv0nac16Ajs7D2o81duTmZOILA6fCYoowcoJQ4hhvNAE5hnIdOaP2S5mpWFf8CUnzQnmGlOEZLHYe+xt4ctCCbjv/m+DItr35G6bkRMi6Rn7H7jpvU63ON8bh153wOF2GBQyqnuDgdjePfnasyCHY4rQQAHDKrV6sCjOpoyrSbAF9ZjSVRbhJAcS2/q4b/wBWb/tgkHYnwXkJ6TmR9MBhPXYzkoyhx7WOXn0dnVfBQJ+oS+lzz606pjazNsC9/5gBMPs/UghQAEbmCTNYpdJcKq8spj4CBYO4VlUfDUuqSZEAQSrWnX8AVHNwSUsYrN8Nl97+B3D/nqfC7fueAmMZ2ndEPO6f+ZRT64rxqezrREdpkep2r1ewyB+UtGYuTiXeA8BWoAkNHyWmP4A0fJrJ/YU56sNoVxWdCW6s3P9F2P35d0Fz/I5g628kxnc4kTg+S3328nMf/UYYU239VFuDN8kkcJrYQ9mpl/zuKfSHAnGc8KPaR+0fgOq9M+egke6WqUmNaX2ScE/sSOSgiFDr/HMdF55XTcGAgmoHwJ2Szrn/U7DrxG1w63nPgfu370vdEoYmociUNuXZt6q9nf14KhQIBhg61+j+WtteBAuQErwQAECNO8C/rNGVo6e8y77Y4YuZVJ+k01y+69aDsHr97wW7/2TgiXHy8Ef7nqWoZzteYvVNytlnia8NVrvuOmMONKIdlGxlkr9YOXVQWzbyaMD1iRmvZTkiUjSkNYGgDC1czqm9kQFCwMFeZ+cdQHUs6j4U4CCjDWzcDY+74/2wc99z4JZzLoO2KdWzjJylPkA9+5HZjmDaUuc8QK3YlM1iFrmlA7AAtBg+AOfOi+v8QwuXlxRgafUWJB70Qzr7oUHvuf49sO2WDwR1fy3N0ONieE/SdzmWz9I/hfWchO2IxOnH1cpMTJCH1haezpKL/QN8A4p9rdH94rRkcwArYU/CwADFBNCvlHoEmYt9KUdVezL7/KHNvlZUK+kK52WTwDw4OxxVG/Bw3n0fhsHkBNx+/jPSKGVaO+gyO8zWAvTntAxO5p55xNfTebAAtBAAEBzM+8jhJqLaSKTq2CaXb0IuMPs5QeVfuuvjwfkdPfzjpPLHvvoovuqSsy+qPmjyDmX71alBaphTz+khDuth0RL0VbCurN7HpkDHpJkWgUXiZ1DQFD5fHpC1AgGCpDFoIZIIpHZH9htI2WRd9GA0BdkWx+M5Rz4NyyFicPOBb4LW5m9sogF0TYBs63eQoNo1iCBfbB8sAC2GBoDunCLoi/TJv/lmDI2bX5SPCh80o5NwzrX/FYaHPxsk/0YKeaXEHuQ0Xg3h6ZhEjdjaLqvrRe3P6fcCDCr1dZ4/bcLOpPLq4J+zgEJTgG3ZNVld2dXHklQGKFMDKVdJ+pzGJtLMo3JebsvqixXDua8NGk7GrACk89FnEEBl9djn4PHh4I3n/S+w0XCTnWn/21eQ7fKVzGIwiyzwGURAbM6BBaCFyAMIjrE9lc43pa7PuAn1D07fOFN/JBieug/O/dT/Dc19fxO0gPUAACN2+ElMn+P6JF59Ei811QyeFqxmuyUydUnCkVtrihCIVNWaqsqfpvb0mBOemCGoUn+reTGp+14GDLpeNPJQudu9OW6BQfME0o/gy31V2SaHAEz+gNeOSJM0ZuHKqdvgiXd9CLaP1hLGEGnXZrP46WMzfyqAznfofIZUPu2GBaAtDwBEyfDdkXkoE1armuapBFk81OtASw/cAfs++Z/AhTh/4wPzxwh2cGgNJczH6r9J1hHd1Kr/zMQSBsxgABkoiFQzYFs/9uvX99LRjU22cNa4NU0YoIBK4QwjJrNe7KFieF13dWzqLNg9pmX6muEpo0bZpk46D9oxgBgEBhtfgifc+QHYtfZA9Xhvscg8RrezcKea8bvokHfTWAmbjkuyZWjLA8Ab3/jG2JS2A9qsP0topP18mpUBmCRqWC0duxX2fuatgCfv5TBfnJFXJT+xw0+lPmLx+Gt2X6MJ/VDSe3Vf5Xfq8WcnwJD7EDs/ItbApqDhBSls5iOa9ygFE0xpA5bxLbODrjtZgvl+myEoZeuiHImdh1VlCxCk7sZsTrnxEXj83X8Me9aOzQYBI/l1GxHmMvssLUDgdhUWgLY8ALz+9a+PPLek0K/Njaa0AYL5IIAwpR4LrRy5Cfb95W8ABPUfg81P4u1nxtfsPlmki25jyohA0HoyvjcqPgDzNKuFqw+ARO21NWdextwxSGIB2fFnzQXet843/QyV7VF9hnwh2YpBvd9l6uoCLYvqMjW9Mas+VFSVJM7TAIWQ+ktMjsFld/8RnHPqcCX9qbsNNaN3f0Kya3OdVGshpgrb8gDw7ne/uwkNSpydVtLYqwwLbYIBXRqePAR7r70KYO3+lMsfvf0oefxO8uFT19ys4lNO7EmSWWxy1QRArlNVVuuGpg5FTTWOQipSvVZjbd+FAgRlLkRzyjJ/emxHKkfy9mN0WWrG9WnbT5/X762aAJZ3ylpF9l7KEqIofJxNAmyPw2X3fBB2jk5MM3wHELpV7NYcu+f5/mVYANryALB///6oeS9VjTsSdjZw6oQhmjrSTNZh79+8DWD9/jR+Pqv9zPxqhLKtLgzvpdkRZ/u5zMylbJeN83Kf9ikwkkm0gVJPNA57Zk2stvOr21fNZWBhbEWfLH2hgEI+3uUqfXDn21otQJGqCkFQ2TdmyYw4ppz2tWkQgbY9AU+690MwjPMaQK2MVMoGQOUjsIw+dV+5a4mI5omDLUNbHgCWl5cxSLtGQ8tMpsGpCJricZyzHdsfwZ7PvxvcsduCMBqJl5+z+9i7zxyFIuFYs6WsAajUb0yXXlbdqVLz+cm8kUb0JaOiWh4hw2Oi/ldxcLlGcqC5jFmvl/VlFb1QM+LM7yTkfdnOD0CoY/+G06pyLVDUjyv7VpMQEEhjEt4LTz70MZhl48+ralV+XQOzT0NYANryALC0tKQ8YX5vYwDCZiA/+9yO2/8Mlu75TAjzrSdnX+rjriG+PFCHFzuccqeeotVS5gU0gBDPat8arwyLGudXIABW44l5Tn0B6V5jyufwn5zL4/6ohM3MDgBdQTfLmM6fZM79Hedjdizab7kZR2Z7H0zB5pw6QZw9H0FhAjtPfhEuPfKF03r5p4hmXEK5rg0sAG15ADh8+LB2jZ9BeJrD0y1o5YHbYcdNfwA0Xgt8P8k2f9ty+Monu56lFZFMvqFr4AhA9rGpSSAgECvaSrdc7rnGa+9LCFDLTdXEWkOPQ3wzmBSwQTmZ8uEzWOhLdkT/LPXbHs/pvyB2h3junGgM+X4niT+yrfvO1dc5cw5lSPI84om5h7tEQvZsZochgI5afOGxT8C+9SP5dTI+0TSGdU0Eu6+/UvhuC5Ejs+Vf8tixY2m8DPsDR9pM7kPFJMZgCJJ+93W/C+3GycCY7JEm34Jv2eNP4pLG3IxKGCwyLZ+mxNBeHITegINup7Ytv4ynIgBjtECrlhNdqI4Y+HSdNnzkbTBCNL2fS+fI6CTcEUcZXZgxL4ap474bGKaWa3Ra8XhOl5i1p+f0vkbP2fsG5n6zWHBwpoehgkJ+8TYNMHLZfR9NwxfUv2Gx+4lm/MQziMEZMIaQYYvT1ke5/ft5XWmoOOWAOxPafu+14IIGoH35QXL7vSS3kCSxJAb3JfmFGZ7ydXE7MnMb1hPP2yDHYp3GQVxHjaLcx+CR5unwlIa5IokgxONxv/XcFTiSF4nfKuiRvjNmxuewoDOLzAdQMX5cYgBFmBaHvB+XRmcMMutmSdYDKDMKhWMDc50bdLaF+ZsOUHSBAbmnYNEewCJz+u5L43vgwPFboYsBrSJgR+HpagWVVRM+VAghw1anLd8XILL/7eIBEMWZ/3YTg06H9eHmbXd/Kkj7cWDCYPMnpvUwCcvQMTOnXrzZ+00coyfKA3rEJ04Icppv6/kYJZuesm2vGrVL92JqwNFX0Iodjy6WgzzZJ5R0m+RzdIWdY+leGZ6MtI/HwoUN8hrRMr+DKSBw5pxrplV3Z7SBSE41BsN12as545tnh4jZVh+C8S2mocRgyGXnyIX0UUhOWIQDJ66HO3ZektX61mQfz2R8mq6Obr/xjbDlaUFGBZ7hcc6KcWGeKRDAcm8zPgnuyM0wGU8C87cJBBRCWi92fLThpd1GVkiggAIEElqL7T9Nv4c8mUd6fmR+J7a+2LlJeUCW6mlgTwe5340jyJ3x2liOokA0lfUhTjoGAQ8KMvFcRvQTxGMD5GnB4sCgLuYLxAfrlGCNTA/mjHZAxuZPIGK0BxLzITskhPGlTulY7k3cYfbKY0c1AOi+piYnDel4moGIfYBkFr5k+6k7YWUyhrWgZcRLxn5az9NvZ5vEFP6nEM7WR4AtDwCHDoXf8kDKulHbLpGV/tM/fr4IdOAQt/EAjMejNGoNSa+TBlitj8wd299AmDuPoQEgo/JSznlJTGrK5+68lFNWfeDoZIIDSIqw9OCTsTkGDeQEn9iIB6GwMaHkFXDBMVWmIciRAAUMjMzvmGESsDjWWpr0eXxJwNNeecnmkINJRaeCm43YGI2HPDCh7Y+cZyKBWuqnKEf2SsCU8p3DhSLi876s47ff2AjPjYl6Tcn79fJBcATbxifgpNubJjvuUpfx9feeCloQwSLQlgeA3btHdI9g/NRPOiXxccZ5yaZrR9BOJoFBYwIKD+WVJDyoVCdR/yEDgib7aNscCJ9MiHP7W2HI7LmXRR1/sQHr8cjoKf3Fl2G+07Pkz4DHEeOGrOaFhB95+LDI8KHO3nF6crho0DCjpbX0Rkx8HuwUF9AHHefhJ4d404p24ArDgysVVLU/M7xhfh0I1GpZ+VNT4b7M6AAVAIDRCrJHb018EjFcPygaSbhtMh7DaDDNwwrAxXyAagS0zrUUfAD0hje8AbYyLcrEINOWXlfl7ya8yDWatOaX9yTnnA9cGWfsaT07AJP3H9npNwFmOu7nL1NzNZRVTB4an5kyCc9oy7dW2vPas9HPAph4jL8UASBkswHLaD+Tls2PcYsJBBKYCB+6LJjjDEMO7JRgsX7jiUuzBbWtYwdmnHOw4dmE0UUfQbgn7fOSniuM7iqmF7UGbVhQAcB805ShBKIFmPVUdmFHK/DmXB6bMC5jUf8FjPwAfLMDTgx21UV1WsJMQWCUG2PAbHna8gAwGo0It7EJMOXl6YJAl7CYte3KbhhtOx/88SOpY0pUmQfITkCUBuywZKvpnH3thIQXSvqvmgA604+G/JSpGxkPLA6GmTz84kBLQCCqPjsSMYNBI9ewvwDzACBOmDYNNZ6mBiPQ+QEjOKWeiQlUWDMYNCxJ4zker9AnDSBeH8EiPVvAxEl4sBGvJsrLYGUGmG+c858FHKaMb6rXU5oAFJXHdDTUfIuo8Z9YOR/WhivlJ+4wt13b4sg+ljSZeuvTlgeAffv20ZEWJWeujgQUwjnbVoAFeX/pC2B09xcSV7qgBYyBZ98tKb4yE69I9w0q8/eJcZD3I41FZdewtg7ZlaIG4XkbI9YIxtJs9TggZZDArA1gdhZmjQJBBiBx8nSfQCQydIqsyaCkTrIVI/OPnS9pxvIc7rvA8wrGodWGSdPGVFasGZs2DAzRA0Hx2vjApGmoJgM8E1Gqr2d/BZEMFCS/DCqfc0cpkFpb5tQwqu5zyNMloByH5966/1n5t8v3zTAF1LKoLIKMEAmgZngQth5teQDY2NggHKIOTCUkTc6k2E6TlV5ibz/2b0F7w4dhdNunYSAJP04cVnYgD8iZeiUFuBENpDXFJnWfWLKrWNKRgeI6Ho8qPgGr/uMJZOEZJbSTurPqb0cUglwGS20va2bWCCSpU50ARuOYzVzLz4xhRp5VmJk2XY/iNIzRA4lejJBNCd9IqNLxd41mkRMzAB2Dlw58QgpaqN8I5PtBzoZMX5SKhaDJTq1ERNQVwAum0OqEGji+7wlw7wVPhXlEUxu15UHsClEtpTcBtgKtra0RDZLBzqamYehEaovOtAUQKq9VEJtLz/thOHnNv4LR8UNJSg1E/Y9SaejEDy/iJSeriWRLcXtRfZPVmtRzKJqCK+p93B9pBEIiGAOnjINp6uumYnRBEIQ8UIhqDTpD0DDcMJHrOXRPojlwLkJk+hHynAMJANDeL6DjqDghtZ/CRMtRtwCyxZX9FcUZCVDGYoaiC+RF+dGLg1XTpVOKFaE5HgEBJeHJwcbSbrjj676zDFTcKQ/Nzz1FVF8jGkgPAFuFUNFcuTGDAHb4XmxqxGwrluPcdJud58LOF/8zuPc9vwj+xCGZKIdDgjpjr3bwaZwd078oG8oonCQExQutDAeQpXsyGxxWaj2Di4T0ALJELROB8nUDdQbKw50jOY7ZQYhYJhlhTUDyCtCaESD3YplxGIvmELULzAEBEj+HhCBdja/OSH4Skyj7+QQoE3x61ZBYu1EzQhcE7oUxDg7ASXDQHn3m98F4+44Sbp1Fs4ABaz+BOd+iqilbmLY8AJw4cYJoB3WS/tDMVIWFMxGra6pwllkvP+pJcMFr/gPc/YH/DEc++6Hk0ucefpRV2ORKy8xQVH5VOXV4L/3boFq7nOEXL2waje/L7D/iwFNn+lBMiBi6s74FfSVlwFge2+3sLNT3zhEBYeoGOZIQnepRW+AyUK4Rx18jPQvj9TyksYAJGg1GMxbFxGmYy5wwmwMOaTZY1HsvmkG2z2W/O66f+nGS9I8emIufDv7ZVwB1mL871kjepqL0EUAH6A1RHwXYKrTUxLz92FMOJynrjZyIOJQ+QnaGTaMFAJh59IAqFbFZGsJjXvJjcO6zroDD138STtxzK6wfPwqjE/fDZP1kvo7Te0lLzhJVx/LPWoHZ9hLrd+xeSIyVRvgFUb1BJKsXZFEXp2PmbFzJeWhcCeupwzCm9aa+OCCOO0QBBifS3LFWkFChSeCRIgHx3KRcP2hddgbqN6sX0WQmHMZsnBmaTL6ofln1naiz1DJ9ujesh8srMNy2Cwbbw7L3fFi6+AnQnHMuv9P6GmQ1j/j7+uzV10hBfrT00oSESMmpaLpWJwdkaDPvf//7l6+44ooN2MKEsAXp137t154bVj8WuOYF4ae8ENKQYNLcNFMGhHeohMW0SaaGJ60PMxgYkUJG9VYOlBJL+ybT2IVx87H6HO+73OA1aqDpyWrPZ4hSyWnqCFDMhpwkRKLe2zoA5NBgurd73kQVEsPrA7V858z7u4xqrKE4M8uuM5pG3cxymXpc6iFfIoNmBKfUqaoCZZHyRofnxELMGlSqh17Q8fzpvQroZLyAGezF/A9tYxLe664QAflTbJpff9GLXvRR2GK0pQDgrW996/aNjfX/NB6PXzuZhNhfytknTt1FKCEm1Y+NtAKASnqpDu2MAasSls8rwylDO6hm3MmMxCG42JiLp94yKhYGx4IxzkysWdVLRCOKEltfV95JwYYBRRnYCS+pAgwz3r/UmahEGtA5qWOpb36mvh9oajPWwOFKedgBqdIBCs1LcNiRTIqeXsdEVRkZmzNQ8w8XfTMFu7lWPvsTSDQOeWc1QIyAqH8bpKZprlpdXf0nz372s0/BFqEtAwBXXXXVytGjR9+3tr7+rTEVNEqOuDDPq/fHSOQsVXjfidRAkWQgjSIzhZGG+V4Qz7YwMgsxlXxFLVcJGU+4inmMPQ5otANmmAI42qZdfo0u4yox0KjHHcxztN52H0wLsGCoTAEVSAovgR2hCCsJrwyPHZCt61ie7cpdFjQBC+PrXwQDgLb+WBnyWseZDTtrRt7oU0UwyJ7JOSINrOT3cK754Pnnn3/FZZddtiVMgy3jAzj6wAM/s7a+8a2j0RjatmXml/Cc/oDqpIMZUr+NPuXcWH2RJtrYyINV3/N9qYu6TNSB4pvO2gC3pJwIE9tqegA3UZXdKF4ppKKdOFdG9UXxWKqhEdNsWDgqexRAaonr5aFmPFLJnDhMUw+NFMcCZHnbgGC6ztjw1TBlBjRAQA8BDJjUWo797qCfw2hXGU5y2BByffX8lHnFxZsVlnum3IGyRdmmMz6CstYxHQisqYDfevjw4Z8JG/8ctgAhbAEKNv9FJ0+tfTFI/6Wg/vNgGsQj8ZL5wRPNkFxFUkOWlFUDrSRjDR7O5L27rFV07jeagB63moBzDrpqOHTrAVAYWpjAmc43LktNuccVIClMWerj8vu6XK6+ozNai9bF5fdBk4Jsj3W/06yyYcb7TL+7giBmkCk+kqINQP7t9HBXE8h/M++X1lDZ/pnxue+wmgc6vBtpW5J7wvcZrW7f/rinPe1pd8BZTltCAxi38Kpx65eit1hz8ryoikWdk4ZkWg9RabxERWKRSpl0FSYJrFKHB9cQ6RQ1AJXSUfYrU4Awn2nIKJJZ7yfD3DqGQJZuZrIOzSGQmpTy9b7IGLHRGibSd4ubXsuhwrSpeomh5FsYMyatNHJgmdW5wrB5v3wX1Q6cMrQCXwaAAgYKUlzfUiZgzbA1mGDtQzC/v54DhEozUOdAZnr5lir41dGaIn5pralH4jCU3ykHDOR4aGdLa2sbrwqbvwRnOW0JAAgY/c2xd572D0nr7ESqmoqZECOzN49Vgcr4mBtj7cwq+WvsoILMQHpPgY3CoOoUS7HvitGlbLL7phwBGS8AlBmK8p05LVYBCEiZLl+R31VNAD7qUn0o1xZzj92UxS+AoqCVTApTdnF+ctnsdefn+/IFhOG0HCjzfWBxCHLSpIdK9a/S+aiS/AAmHIv6Z8aoHwBQq/vmmIKCSfbTDkUq5e1+vfj0/hNsvxl6AHhkkG/9BTwmHktkbuyRzBgAubGoJJ+3FgkJRb0lNEyKBTAKuChYFOZMajZilsBqfzMYuBxy0mNIRfVV6asJMdkTLwypjJ61CPPMWgOBxIVowEvL9d6EDb2CiIRFozQXDzqKjyOr+cKsrpLyBNZcKqZQAUl+NhitQSIRlvENWNeSXH8+BYay5i3KWwAwZfFnqW/vVbUfQEyDoioUICiqP/sBSkJpeOIB2AK0JQBgEuK1nCuu3XLc1FD30JH8WcJjaUqkjAelAeoxUFCx9wvzKUDYY/G/N9c687y2I/ETk7satLJ2YetDMM1chuGLCSGM7jELTtVDwBdHozJuOudkLfzBryPOSsQMAsqICMaPIPXrqv4FcMGo7nKO1QDD6JhBCCwQdH7CwvZK5kj3sBxjACB9ZLlA5l0AMD4BWecwIRmQyH08ou/FT2AL0BYxAfCmsDyvTb92wyPzyO/blfyRrGqvaqoycZYlhmFB9meBRGZOU1YBgnLOy/MQzHOUoVxJZqmZxXV8CJBNmAweVDQTFI2hcqrla/JXyOq+fpm02ZbehHyvlc7T+Qv6WdOz5yUVCTnzMOwwa23TF8AA872g7PJvkHMhOtd3qOgJlqhAhpSTtYOsJUBlCmRtQZ2AMUrk6EbYArQlACCok3+MzdL3xzHvvNiUWboLU5iWmVZkpBTVLTJfo0Cg9xMWiV3tV9pEVxJmsTYlCflWLExuz6mWkBt6ke56Lr8/YPETkGV0NIwuAEamz4Dek/e1qqolUIkY6lfrjEMgDgOumy9XVk6+KUa134Igx/ZhhgaAXUaezfR2v3ybwsQOc9/C6n3yFlF+jmoBXcmvlMZIAPogbAHaEgDQnLPzmsGRtV+YuMEF5MlkeUElAjLTyzG193NTlkaYnYIAhamV6aGWhHZfJXjaNEwspzpqsXk2Whav1xXDS70TY+fjcqUclxctjJuZGrJKXzQAAlOlzJBqFqR7dFB9xTEpr77PKubqD6AMbElHqzk0g5t8eNE45KQ6BetbyjbWkf38m2rZ+sOZe0nG98AKTgpjV5oCqZZQ/gIV0Gqw+VIzXr8GtgAhbBH6+bf+1mvWW/9bo3Hwz7Y+Yb0mAiXqokGkqUYCYNVOzK2+XJTPoj1vGV8bvZFXVWNGmOXswqqcollg99mmDth59vT9ANZJWF5n9jMz89p6SWnKU5mB0Joz+t5QvxfZZwJYez/+z0MClps6jC5/Kl8Bgf2F6p+IOu8GkGN+5vfJV1ng6D6Xqo38rk3jaNg03/uKFz//nbAFaMsAQKRffNvv/fRG698wDiCQ+gFEISQZgSSeXusEMptMM76GbfB1g7YtTyUmmnvkTG7EUNu2phXW6mxh3ryHtnqd6yuQQO7JVpkS0/VFFZM2vFhxBtQgVW1YO9/UufCn0Zq61zG5SoLXgDLdX4Cmv0vHwQemnPy9qHt++r0ADBBMgaIxU5AdoU3TBObHN7zmxc/7t7BFaEsBQKQ3XfOBVwSe/+WJ9xfx9Fo+pwVXC9jUT7UVQda1WOhmE2ZlAkrb6egWmXCm6Jk6O3VNbccWRqbuXVON3DbkGcfNc9A0/M5lMOPM7PrCJs+f+VGKedFl3+oqlMSfpCZ0rusAYn6efUb3PQyoWCBV34te001oSgOsugYGrrk9MP9PfN/f/sbfgS1EWw4AIr3//Tcs34r3XxHCcN8c1IDHhfXe0JpWQ3taCU1vGDt2Be1gwMwv5nNiaE5jIesEyltYzAlLRLO0yJlEtUMCKv1TVF3ZmfF0Pt6NedfnZ+13RfMMrmTRW0nH3F1Wn0abMfU0ZQbWZ0rZmgFR+jXMujnDxNxHdcFrpmQHV4EFWpWehy0Lbp/w08f/4OKULDFCOw5O5bVw5alw7ohDujGo/R8hOvIHr7388nXoqaeeeuqpp5566qmnnnrqqaeeeuqpp5566qmnnnrqqaeeeuqpp5566qmnnnrqqaeeeuqpp5566qmnnnrqqaeeeuqpp5566qmnnnrqqaeeevoK0/8P8LJXfwUTB+AAAAAASUVORK5CYII="
+    _icon_base_url = base_url.rstrip("/")
+    _unresolved_icons.clear()
+    for name, size, icon in _issued_icons:
+        icon.src = icon_src(name, size)
 
-# package icon (256x256 PNG)
-PACKAGE_ICON = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAACXBIWXMAAAsTAAALEwEAmpwYAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAHkdSURBVHgB7b0JvG5XWR/8rP0OZ7jnzkPuTchA5jDq96m/iiNIASkhQBWtn1UpP4MQCKNSFOQoQwiEKRBDQD7qUGzTT62CVLAVWi1tFYtaM5CEJCaQ4Sb3Jnc6wzvs51vzep5nrf2eczPd4d1Pcu6795r32uv/TGvYAC211FJLLbXUUksttdRSSy211FJLLbXUUksttdRSSy211FJLLbXUUksttdRSSy211FJLLbXUUksttdRSSy211FJLLbXU0vFNClqaOrrxcx89D3D5O3vdmbqemf0fF/zIq78NLU0ltQxgiuh/f+Hqnf3hylU9Nf5/OhV2QFUAVW91DN1PLq1s+tXvfOkrHoaWpopaBjAFhPo93/DHV/1kB0cf6VbjXZV560r5l6//rTowwt49qHpvPv8Fl/17pRRCS1NBLQM4yenWL1z9pMFo5Te6MLi4UznQa4DzRPa+AlQdGEPvS+N67nUX/bNLb4GWTnpqGcBJSoiL1Y2fX7i0qofv61b15soKddUAfojaAGqzYAydlbqafV+/P3/lk5/9ihVo6aSllgGchHTTn3zwfByPruuo0Q93tAGgKMhV/so5U1D2fwSjDfRvGWH3dRe98LIvQUsnJbUM4CSir113XW9294E39tTonZWq5yuHeIj/kvtASpWGgGMCxkmoGQFq/8C/G22YefNTfvBV90JLJxW1DOAkoRv+6OrvVLD8ya4afZdR95VQ7cGbAJSaNAKRwDKCcd19WM8WvOP8H919rVIvH0NLJwW1DOAEpzu+/JnZ5UMPvl3h8Je6FfYqAvRJAE8pUNv91jsAzQmtOuCchNj9Wt3rveaC517219DSCU8tAziB6YY/uOr7q+7okx01vqiytr4JpZLfX6AqvGkHfgVq7VHgy3U5KqihMx5B9xP92U1v107Cdu3ACUwtAzgB6eY/+vTGcbX/vd16+JpOVVfUvmfA5xdQjgp3CJOGA2UU6M2CGrr3jLHzlvNecPm/08ynXTtwAlLLAE4wuuGPr/pRBcNre6o+UzVK/bVfK0+LTkuwS4Ym51Uq6g3218wWaCfhn437c6+96Lnt2oETjVoGcILQ1z531Y658fhD3Wr00x2Fijv0BQMQar2HNvtl6RCLMwRFKpoSWhtQnRU9ZXjl/OY9V57+rJcvQ0snBLUM4ASgGz/3wZ9Q9eCj3Wp8SmUC2FtT+VUDmHMGUKAJpsPkPMqvHejeOsL+a9u1AycGtQzgOKa//dyHTuvj6JouDC9xU3s0VjVb92vM7E1kAuoRDgkyW6B9AzjCzvXY3fimC5/3ynugpeOWWgZwHNLi4mL1Y9+58ZVdNXh/V9Vb8r05KnfdUanfgPA13X2KplhXjgbyawegc6CG/ju+Pbvv2mc/e3EELR131DKA44xu+KMPnVup0XVdNXqOUnW2fqdxvn6N6bx1qf8ydczU7EWYXIw3C8zagapz2QUvuPyvoKXjiloGcJzQl7+82N11aP4NXRj/WkfV83FWjdjka/jn1xTYAb4ATRoAScACSIT0EaD/Z4LpYDYYIXbHI1V9oj+7pV07cBxRywCOA7r5P33kGfVo9VM9GH1PlQEtQX9N2z2iu5yyxB+OVrnPC1RuFiG0IZRI2+IXItkpQ+jcO8b+Wy584Wt/rz134NhTywCOIX35M4uzp+yY++UO1m/tqHFfFUS0OupXtLYpQOmRMgBcozyhN7AWOEbQ+89Yzbz2wh99zTegpWNGFbR0TOj/fP6Dz9qzffZv+mr0jq4Bf4hwjnT/czTL65STwLEgzNAXAEn/JhFOri2miX/I88X8JiL+Gb/GCLqw8txOffhvb/rCR37t7q9eP4eI6jOLPzcLrVB6Qqnt7CeYbvjyNQvq8PK7tbr/WgWjjgqyMpvbx6OQ/kJ1mOCza5LOBeXjKJiPTIyFKOR1ovMbLK8i3Hbrvjsf3Hu4B5Xarfr92zozc2/7uXde9YfQ0uNOLQN4Aummz33oeQoH12l1/6yKyUm1Tk//Oij4AtZh5JdV9HI+hethCJj+RRqGWbq6Rrjzjn1w+617NS/QT9zpQtXt6tnDDqiu5gX9mc/Nzm+5/F+8bfFOaOlxo5YBPAF003/++HZYWbmqg4Of7ViPWO0iqOPO3ie1/6im6+J1IMJUmsS61A5K4aV4Rk2Ap0nQbDhmcQcPrMA//P234dDDS95yqTQD6EClwV91O44JaIagGcGRztzsu+fqjR96+eLiAFp6zKllAI8z3fC5D/9YVw2u1m6vPQqDNEzdngS2skBxMY/mtdApO3+Nag1xP4lK7AgLeCcOAK0uYOAKkTsgjMcI37z1Abjzm3tdfDi0xJxQHBlBBZUBf1U5JqAZg+rN3tDp9S/7mXd+4L9CS48ptQzgcaL//UcfO3VDZ/VjFQ5eVlmJP2Fynt0qgKPQASbTpLLWqkPGY8B2wcJXXtKH+wR89Nf79x+BG//+HjhyeNVL/QB+186wjMAyAwN+qwVoZlB5JtDpopqZ+a1qofvWn/nFq/ZCS48JtQzgMSbjzf7Gn3zkFRUMP6D/tikkcJEqedTUH+vXUNDfpblRJCyXgVgEPQLmtj6R/CZ+NBrDLTfvhbv/cV8qVxHgAwt2l8r9Y0wCxwiceWAZQbe/r5qZfdvtuPDpxcXFGlp6VNQygMeQbvn8b5w9hiPXdWH03ArNsXkSUILioH+iXkPJoM+dAAzuGdNAYLgnYOcqP8ADDxyCG//PvbC8NCAS3zMWxdmeEjMVcR0E8Q9YBqB/QZsGnf7sf5/pzVz2k7965d9BS4+YWgbwGBBef33nlg3fuhxw+C4N/g1mrtsRE/O5cw2Bn8r7WGn+GU1yAKQ4xElJKfAJ/OPkfxLGg9Uh3HzT/XDPtx5OGk5gdqrA8hS/zxmDNws8A6jsbxeg2xt2ZmavHs51fu2Vb33/IWjpqKllAI+SbvqTDz1d2/if7ODwnygYQ1wNM6FrlYLoBFNI1HP1uHGASJllj2ukJr49nsFJfCQS3zCD++49ADfdcK9mAmNu69t/iPOT1NK0jUAJ/ml2GFaUEeg/NNpBb+bubn/D63/6ne9r1w4cJbUM4BHSrV+4emaEw7d1YfyvKxzOUAnoaFLXeokoZ8zU0bnlHglFIb+WPwCFrCfAx3if1P/VlSHcoIH/wH2HiPpujfkM4KpwowTfLD1nYCLKfOKM+Qa0NqA1gqo/+3nV33D5z7zj3XdAS+uilgE8ArrxC1f/Ez2nb6T+05PUX2dXWvRxPVt5lQAVmQMgRT4i4Bfyo3RAZnlQNi3dIJX2xGTQjO/uux/Sjr77YTSsmdSX4M+egfooiwkmmQrKzxI4c8DNFJi/3pFqZu49s7DwwXbtwNrUMoCjoBuuv2ahO7/66x0YXm6W8XJb/2iIjHwSgsxTnz7uEa0ETOqynJJTArjsjE9s9gDQdmRaQdQCEKiDzwEfYUk79274h3tg/4OHwYE96uqTpb4IWENXysNoXlURv4BbOwD6GrozN3Zn+5f9y3dc9RVoqZFaBrBOuvHzVz+3AwPt4R+cbVfy4Roe/nURRW1TGW5PAE7KLYtpRHuuS2DRFkiqPVCp78PQLOO9cx9885a9dnGPlPpcUgOb6iu1UzU/elZWqUwlnIRuHYFhBF3UU4a/rTZ2fqldO1CmlgGsQTf86Ye2dWr8QAdHr6hwpLit/+glPw9Tk/HLqIlxTAp3peMEL7+7Smp/DPHXBw8uww16au/gw8tC2ntn33pUfgB6TABvXnOW5nBF/QNyytAsL+7vU/2ZX/6XsPE3Vbt2gFHLACbQTZ+/+mVa6n+sowanQh1W8wV6tF1XgvpaZSJM0hSAzTHScH/VIOwT5IWaTxjBWD//7d98EO7Uf2YjT9h6HIEHhSdRzc1SAOXHKYSthwko8o9dTaiB39HmQH9+AYzGVo9rE/bleuv8xVobOAItWepCSxnd+Kcf3tOt8eoKl3/M7F134A/0WPFMnBCu1hEvqQB6UhSWigEUXv40nRcT6euHHlrStv59cOTQigN9dZTqPolQJf7U0KWPrKddpf3+LHR62ltzZL9W2kbWLBiN8Nkw2PhaHX0ltGSpZQCEzDLem7/wkZ/t1qOrqnq4HbD0Edy1bPbHpCUN4QFVWM5ScClgCfkIReC72yT1zTLeW299AO7W9r7zNahs7T5rnZT0qrmZWXyIUA1pZV3FAKXN/i7MbtgI49UjMFpagU2b5uCcC06HTZs3wOGlMdx598HnQcsAIrUmgKebv/ixJ1fj4Sf01N7zwEj9zNZ/IoAPhTqbtAHp9i9eAgtFEe/Bj/E6pEN4UHv2b9RSf3l5AMzOD5JctITf5G2e2GtNZkKDtlCeGVAW+FrQw2j5oJ0IOOucXXD6mTucxmL8AqprvmCEY+z+/qg/+4YLfuTV34Ypp6lnANdff33nOzbed5nCwXsqHC5AzY+vT66544QoKHBtg8GlixY+NNr5HviD4Ri+YZbxfvthYI69piW8oj0xUcnmPwpSR2EadHt9Df4FGK0c0krbALZu2wDnX3QqzG/oh8ZbE0A7AXwB5qjy6uAIO+88d+7Ax9UUf7NgqhnArV/4xFNALX1Kq/vPMlIf61pIuMJIPpaUm/YT0hZ28CG95va/+e/++w/BzTfcC6srI0hTew3qfvyHXmC8k3yh0ekHDWWvGe7aNbthE1Sq1uA/CN1OBWeffwqc+qRtXlNQ4A8asOsFAjNw2cM3C6qvj7H3mvNeePn/hCmkqWQAN9xwfb93971v1cD/FS35Z7Amtn7JSPVOb7ZsH4AvAESWw6URlsOa45+q8UG65lET8mOenkh59MCn6d0y3hHcdNN9sPe+g7GxaVFPQerH0OZWcSawJrti+dYT3tNOvpn5eavu43gI23cuWKk/M9tztdHdh2axkKpIQcl5iWAOZ+uMR9D9VHdD/5fP/IHXPARTRFPHAL7xp1d/j6rHn9LTe88w3mFr6xdNbJUQ7sdvNoxJAMO6dGRN8OlhoVypUU+k2EY5v88lvjyhJ9j939Kq/q033w/D4RiotFeFpXy5Wi44nL5WnvOl041KVGAICM2bgsiVadfcwiadfqil/mHt7e/AeRfshl27NwNpfEjtrs3CoMS5Qoxfh6B89ZX5ZsH9Y+j+4rnPv/x3p+WbBVPDAL79tevmD+9d/fWuGrwe6kHXSv3iK27Qdx/BcKBSEAvhj5gwu+DlofTqJ89+0AKWlodw4w33wf4HDrsG2bl8BQwnvrUcC82tf0SDaSLwOSvszcxpCT8Lw+UDdmpv957NcO4Fe6DX66bKiZqvFDEB4oPJpwPGOGo0jKD75+NR/7Xnv+iym+Akp6lgANrD/5xOPbquqgfnRqlfpEffHY8a3GsSQtH5l6n/Sdq7/73Hv0a4666H4DazjHdUQ/PUnl+AzAILNk+Q/DJ6HTRZ3Q+gNHsiOlbq43hVT+8dhlmt5p9/0R7YvmMjaR8HeNRgrPpPy+NGiSrYN0YbqKGzqv8+MDOYu+K0i1+1BCcpndQM4I4vf2bLaPXQ+zXwXwk4qHA8bkjJLHc46pH8uJFvB1HbcwaDzDnI5vUJ8M3/hw6v2Km9hx9aIqAvSP2S7S9qVqKJj4TUmmEK+rNzWvLPaKmvZyVwDKdpB9/Z554C3W4FEvSZCUClfyxS5XUVH145s6Du3D6Ezusu+NHXfwFOQjppGcBtf3rNJVgPrqlwcBrWQ6Be74ISuE56vBkDKR/jP2WNgsYjTUV9AU7dr/Xsxh2374M7vrlPq7jJaVFS+Zm0ZG3i7EdlmsAaj0WKXY/kN7v7Zhc2alN/GcaDJT2lNwMXaKm/ZetC6qVM+vuWKYimQO7LKDCAeFNomTLagDngrfP743HnjXq24FtwEtFJxwBu/y+fOmU8XL5a1YOXa1sfmIe/SEmFpUMbhQ/76GkSsygAXfF7nJSPzuujBH6y9831ww8v22W8hw+tEGmfkJhwQ79IIHUNqjYju5OaASfaq809IiE5M79BS/iulfqmTWecuQPOPHsHdDRTwJiMnJ1AJL+CghbAKmtg/4q3F0QfGW1gjJ2DY9VZfOjOuY9/16teNYSTgE4aBqDHu7rlS9f8y049+KAG/o4g9XMqvGReEjQNVyXSrf/jXaI+MrtgnHTKzy0iYDOcpEaA1LEX0tQx8Ujb97fd9gDcdedDqY6i1FfOzqbtE7b+5G8WrM0EJm1mpu2Iy3gHR6DWkn/jxjm44Cl7YGHTHEQmxABMTID4bDw+czCq8lPwQP7+FfmnNv4B1fk6qu5rnvxPT/y1AycFA7jpP117VlcNr9W2/gvMSjAr9ZtwXnTLK3FPMtLJ/5A57GW1khuAHaOj0sSSy6qYZKYbfteCDo1IW3RThNy0E1Lt23cEbtJS3xzYEdrD5/UJuOUCfnrqSOqFvEEZNT+JmpDDXSgt9RfsQp7h0sN61k7BWWfvhNPP3O43HlEJ71kSBSthbAm0Kq+YaA7rbShnlOHamgVjPW34m8uIv/zUF7xpP5ygdEIzALOM95mbHnh1Bwfv1VJ/o1kQYqVdMXVJZZVhJQkIILhDIS0PTwdrl+qS1w2USfwUwYHvw/R/w8EYbtHe/XvufthX48HB7F4Vqyd4gfyZITKyyW0uP9daJxsEGHZ6PZjV4NfOWsDRKmzeMg8XPuVUmJufAXH0T5LHiv9SRhJLV+VaExNsbFhsH0I6jEWJeHOBypoF94+g+qVznvf63zkR1w6csAzglj+75iIYjT+pnXzfb6aHsF7/OQ9yyOagDlSyiScN7FLcOsAuqwQi8e0NkkskYWFBTw179x6Gm2683x7OmbzfwEGiUgVlOdgUN+mZ8udTE8N9DUbqm807Zhnv8kFt8yt4svbuGy+/S5LAnD+Dr0EwCFJ6YWQrXlwTKcieMvtaEy1AObNgXHe+PKq7r9VOwhvhBKITjgHccP1iv7d55y9W9fDtOF6ZxbHZx/FYMd6oYML6pPVRgrtEkae4i/yjHEnaJ8Hvwa9/V1dHcPPN98Peew8CnQZTRJLJQU0KB5JqHQ0NJZT7RpF/ZT5aQ7c/Q5bxDvR8/gKcf6FbxgtFUAvwM8kvn28CwifZ/6kAcavWkc4xXK0NrOq/D87smHvPad91YqwdOKEYwM1f+sR3dXD4KTVe/Y56VJD65j0I85yPUcLJFbGp1+gFCfPHpNOQ6hMS9Oki+/wWJql/zz0H7Wm8RvVP017gMRE6gUpG0QAfGtqQSTreIIAGLWhSf0ipP7uwCcwhK2bnXq9XwTnn74bde7aQlwVAQZ2t4FOKlSmBqHilojHrYAAigWqKoE0i5ddutuD2MarLz3nBG/8EjnM6IRjA1z533fymXv1OwJU3qdFqt7YefjhqksM3ZxAiYbheo7w1sxGmxKnwEA1TfNTWX14ewk033Af7wjJeKGzeUVyBbX6GtThgU3zyd5SeXApIs3mnPzurpb5bxrvrFLOMdzf0+11g6n56AIiPQcAPQJ5IQV7npPel1vfpdfs0sooJmkDGJKw2YB2Fvz+C2Tee+/zX3A3HKR33DOCmP7v2h7v1+Do9KXx+bT38DbZ+9sImUY7GJ7YjmiV+vCocyInmDP67HoZv3vKAdn+4fkhz4MBUYjWxXjoPUJrMbPKHAOQAzxkAhZnZh0+X8c7M9OC8i/bADrOM1z0AK5eDX4k0VCOgpCQvyOLDz3res5wYESIjK1o1FGLXDtTVIT1t+M59x+nageOWAXz9y5/ZsmF1+Qqt7l9aj1YqIzWch1/l0nsNKc0vjo4euw7C7LZsApSl/uHDAyv17TJe27DSoFYTB/naz0I7U167EkJ7cz+JvIK0jHfJLeM99bStcPZ5ZhlvOJhDsXazcrKdfTSdrCnLLkix7dxrUT62VHO6YjR9N94sgM7fDrG67Nznv/6rcBzRcckAbv3ib16M9fI1OFo+vR4lqa/W8zIaAx5d+keenAN/0pZd+hulvn72O+/cD3eE03hD7SrAEUD8PMI2N4Hf3a/lJqSxbhmvlvqDJbuMd26+Dxfoqb0tWzf4xAryhgupHyJonKxoTckvUq7zpeUqfbjm/dI8hqQvQtm/Gqt6gJ1Pr3a7b7voua/dB8cBHVcM4LYv/vauGg9/WM8H/4t6uKzqsTupib9kLvYncX7VeLOOtOvwAZQprZzzt8U0JdU/efqdl//gwRUt9e+HQweWE+BlQ9XaEj9XktZjCQN7HhlG3wN9P/3ZDdq519FS/wAYR+vpZ2yDs87eBZ0O3bzjE8cfCX5FohVLnnI3zc/LVJPiSzmg8P75mGssUlSm+D/+t4IRqr3aLHjFWc879huMjgsGYDSzb3zh2p8CHH4Yh8s7nYc/ufElyFP3YpEDTGIKLGodT/+IOoh+s4sSCrC7HwiAD+Hmazu3f3Mf3GVO4yXLhqnsWUuVPfp251I/L0s11lP5Zbz1qlvGu7BpFi646FTYaJfx+pTZi6RAUVm6MgNXIEqZ8LCESR1Fh/Cy1eT4LELl/UWYmf1mQdXTTsbOWFX9Hz/lhy89pl80PuYMAO/48uydt9/x6cHSwZ8aaieRmddn8p0JDfHyMyHS8LKOlhlMEJBlWYAilsflp/5IDSBoCwj7tY1/8433w9KRVV8il5phVbJa63keBa2tLSCTzDNzC3Z7rlvGC3Dmk3faDTxQNR/Eka/ay8FSblCBHTW+K/G2HgnTVA11ZulUWT8gTMF8sajT62sNadZ+w3AwHH37/nu+dfZTX37sPmJ6zL8LcM+37vmMHjg/OVg6ZNfwx8ml4IoVHr/0L6GILiK1/ACjwTGEcHWKQ1Yq13KjB8kJ5MJSXx/O8onimIMv/PoGDkc13Kq9+/d866H4UBEYijdbDsIyU3rk5MoKJSoWGqU1kmW8ek5/uLoKm7bMW1t/w4aZ1DIJfiHp87364kkmgb/QzzStMFAmOfKbi5HjoJh7UtlO6nc6Pd1fMxr8M5YRjPVY1/6t0zZu2/lMneyv4RjRMWUA933tT55+5MG7fmLlyAHdGUPHRVXFsWw7XxFwBTSEH77XLAwMROq59uANKVCkz4MdRZx6iYfIw4soB+AHb7p/0jjCjBE8oOfzzVHcK8vDuJedakCCZxXp0YCfAqAk6xjT9R08u7CgBbxmXEf26cGt4MkX7oHTtJffSP24b/CowB9+VDMYoQDWxgcvbFtuAH9zMRzcqiG+KPnBCaGq6kKnq6V+f0b/9mxZw+EARoMV/bsKI5jbA8eQjikDUFh/32iwpMbDoZ3j9oHOTlLeaQTATIK4LRWDOkyBDgVmkA7AZCqhwlie5xjA1W0uyks79KlsBF8HbwRnBPF0Hh8+GIzgGzc/APffe8A1SanCLjeYOHAnUoaWyeVMKjPw3a6WYDNz8/YY7uHILeM9T4N/dq7PS1H03SnOaSX4WWNLjjv6HgqvqPhcZbZWonIxhfZk8eI+Mgpl1z8YqW/6y3y3wHyotB6PYaRBP9TgH4+HMB5pLUD1KziGdEwZwBhrbSh2nNTXDMBKbWMG2HPcDJiqtMItagFhMJGXG9Rve6uoghCJMwuMkjkwCXfny4+EpTGYYmNYLvGzaw/84OW/775DcMs39mrVecRVfSJpSwNvXcBnbSlTkVkWEoWuNoN6ZqNbxjs8vE8P6goueNppcMruLTmXIvYw8wGUgM/yTnpiIW0nMLfEegQJftBcK2u9SFCS9/Sdaamv7fuulvpdbetbqa8rHg008Ica+Fr6j7Wfy5zSZMdCdTTuyceejq0PQCPeqEed7gzgSDNC0zEwth/jtOAi2oDxCagA/ii0FTSeWBvenFefcZLaz7LwgdOk7YcwRSRTYiw0A5JKEJZXhlrdfwD2PXAoSn0GDDE4QTzd0VGziJwgPFN9/hG6M7MwMzvnTuPVkmvXKZv8Mt7y5h0l7tfb8kktVaXgBuLPVnjSNRWDlIfKlpx3pYAwTg3gndSfsfdG6hvgGwZgpH5tBFztFnc5t1I9xQzACFHdSd3+nFWRRpo74siYA2NnEphfPW+qKoT4ZRf0DkIE4jMKfZgGSwCkAibHozIRkwPjFTws3BJJ6ApIo4/CH0So/Pbet799AL55y157Wk8EveIqb9NoaBwlhOetletoRprlv1qNNQt6QE/LGqnfn+nAeU87HXbs3OQTlcFfOrCj2NDGjUogRH0Dw1ITbycmmtwXpSlI2VYOfif1Z6ytX2nV34xfo+obld/8GUZgz2MkR7NbBmCWCR5DOsYagOettgM111QdywiMT8Bs+HErAM233Z2kN0zAnhCDKm7siIuDIyMI4KNo8tWYlFRJUCRWaAjCEihI+CwSpLrvLhGOLA3g5pv2woH9R2LFiv76So8a/LTKx4hCXT0t8ftkGe/u07bAOeftdst4BSBArN6T03rUIMgqgrWB3RC0TlqPrkNrwUKuBvCbcWulft96980UnxmjRsUPTr7xaORmtxDZNxrCwTU4zRqABrX1/AW72Jz/3unqOVLV1VzT7KYaQTjH33agYQIY/AKVV6F9fuUdhCUfAQRQI5PwiS2wpBlD4DpECiveew5vWlPbM/gfhju/+YBbxhukpMrrnDgKoqYDRwX4uP59PWn9P2aKyi7o0WrrQEv9Oe3cO/+iJ8HWbQs8YbiJ7VdRW6IAmVCbuCoFPBps0E4DCCqjWpMfFObzfR6u8lfR1jc7Hc21EVhDC3xv61t1vxZfZYo6YRi308sAjHUV+wZTx5ipk552jo61OTDSnmbzxV73JR905oEKGoHyDkOC3DDoVRiUFDF0FxykqzwwG4ecH1AugiKz4/IHDq7Yqb1DB1fS1J4ibVhLApaAuw4mwIb9UYK/PzuvbdcejJbMWoQannTGdjj7nF16cIfv6nFJL9UXLh0n1KbKjwWNT4LCuKOculhkoQwFkw/sYq1nYZLpVVWQ+rNO6uv/7FgNjr7RyAM/qPupsfI4t3o0nmYTIPHE8JPMa93RppOtSaBVKa8NON+A0QbGziTwswUOYGGhjsuPXvwl5yGm78EFkCnIHYQZ4EkbY7qwwi+9YPuflvR33LEf7v7HfVbqKyL1UwXhsgHNyLEl42J44XqiO6DBBDcM15zBP149ouf1D8GGhVl7Bv/GzfNec2pa3qpIOapQYUM7moLYM0nIq+YC1pTqTaQKVyJccanf6XSt09pJ/Y715kcnnxZW1tY34CcSHyA/sj14h2qcZh9AmKS3f5h+IWHOmAXWSWjnTU0HS22giv4BCKYB5FpAGERJnnhCxcY0P7gDYzi9B1IGnVo0Z/B/Q9v6S0dWICxqitJJ8UGmRHk2THHp3cQfmsDPyxbUoN2YZbxmo45Z0GPcK+Y03jPO2mEdgKFRDISCM+UarBJMjjzceikyFBTgb0pbCiSSX0ZnnVwoMAgOfyOlvqHRcGhtfePkS1N7RIohGSNM/fc3WpZ1OtNsAlRYFFh8wR1aVBrPqmEG42pgVw3WtVOzrH9AESdhXD+Q+IkKyFaFAdW0cSdE03Zkv+56NBrD7bfvg3vu9st4leKgV1zWqBJifTOYjSqZgGLVsuawiZAJFDSerp6umt1AlvFunrObd+a19I+VKVo1eRhamCxcPFYx3cQGAnmQidCPyXjxFPwwIX8pntx5weCkPl/Ga6byzIyVXdBjhJIBvpX6ANn3GujBLuLe1jjNTsDxOCnXjnEmVYn3E/oXXVknYaWdhLbjwc2rMiehMAuAgN8RRVsSuSEZl5TIZH7+i7Bv3xLc+o29sLri93N4UyTUxDRXBMhEcQB0UQ+GItiLtAbwIXaBssA3Zr1x8pllvOeevxtOPX0blLbjUl1FTQI/qLJABQVNJ3E0S2aIta31+RUls5GOaFQOJoI/zdDYzTtR6vdsnPFJWeBbqa/VfXsyE1HxM+ADsJOcFZATnsySF5xeBhD1frlN1oOCLvOlaZTdVeXWDoBZXGHODQhTLcQ3kMwCBWyAqubWUInNJX+4dn9DLfVvu/VB2HvfAQ76uLAnkSLFNAnDNO4xD8RC4kKyJgrJO/2+Vvk32NN4h+MBbN2+Ac6/4FSYne8B6xgBfiU5GUumSihcg1lMoEnlFJ4rMjZFn1SVikrlQ0lrSM9qZ6OMh98v6IlSf5CW8RpbnwosYIJLagE+zofRhtRYTbMT0Hvl4j1keEN6Id5o1TFrrLU2oIxvYOhmC6w2wM0C8GsHwlt3AolLJld02GmAYhjxxpnNO7fdulcPhhFkc/oS/CXVImgf/kbFKcyQCZrBT8LWA6vQtrkNYRnvg3br7tlPOdWexsukPitUhPtyCqVnl7yhqrldjW1WQvNai2uWA5t0DlV4Rir1A/CN6m/Ird8PC3pG1rmLSUq5VgrvPvX+x2dBMcDt8JtiDUAPvnTCJxL3CFK1ifxEFz9FSmXtM7vZIjgJMTgJydqB8ImpwAh8UXHtAPiooJHE15Je7KoGvPne3r69aRlvsI0T+Amwo/obFGiKXDJ4ALkAC9VOYARpFSRwjAjNIC7jXTKn8Q5hx66NcN4Fe7QXu5eDXZFrX4mi8ROwWKZHNrbjtwwnlBG6UOQE4C2WOYrXtpvt5p0+kfqVVfFH2sM/tB7+oXU+x2PZohovgJ/Z/PEfoA1GP971RPg0zwIEE4BIYOQ2kvslHVfn4LRsQGsCqmdWErrZgmzKEJU3DRTYUytspSoHGflegAWmZxJm884dtz9gHX4qqPzZGJVoZM/q+YpKozckJ01hWSW/8/GKCpJSGnAD2kh9cxrvQEv9Xr8L5134JL+MN1XGW8vBT4uXz/nIoJ0/WokSc2tOlcWI2RxSWuEq3Csv9bt2x56x9auO27wzDOr+yG3eQSn1UUp2Af4UydOIFzWeah8A6Q3zrmsiIDPwIxnj7ILP/TuzoBOnDMGfJsz8AyZD/OikIrY/Cn8VwsrKCL6h1f0DDx3xEtENmnxcqvI9MTVURK5QnWWwvCZps8UsAvzmNizjHRzxy3i1qm9P4+11SdNSG8pr98NdEVW8wiJNgvgkuY5AGdS6864H/ESrcFK/47bs9mfsOn7DNGu7jNep/NTWd48kgJ4BH4qMIWkD9OV54VVN8ToARFUHvpim4+jSACyYAFLYpbvgN7YbjDQ3r602oPvX7ivAqA24nYVhSXHaV5Da5VTy/Q8tw8033+Okvh4cVLmkw7tp0LnJB4wSn/seSPO96ZBUX5QP6Uougd/+ujLtMt6FjYBabV01y3hne1rqn6adfQvAGBIrQ6jGKvVkVs8EQBdamy4n8wLgCf0vqnXmWds8kesX3Ak9fkGPt/Vrs3lndcXN6/sFPdnUHtAxmTv84l3mDwD+bBBGuW5LfTQe0seejrEJMELWL/SPUDgYM9cAGphBAFVltmZqbWDcsU5CZxYA8JWEyrsFVCpMX97/wBLcfNO3bFrrPzAMJJ5RUl5SrKRKTdUJJDFE0KXc6JMiMKkuJHwMi8/pbvpz83ow92B4xC/jPd2dxlv5M/j9cCsWNFHKq3UFkbi1x/PE/HQ1VAHUakIpqniVGITbTBa27M5Cr+u+QGxUfLdzzy3jjQt6bL4A4gR8BmoitIAyBMjNAMScCYyn2QkIqhudgJnAI9LfxdOOJ2kIGLxSBVwrqCynz5yEtdcGQEVNIGj3+x4yH+G4K0lkW5xual1BUtg8eIpgTuwq8gCmBYRmUp2ennbEqoACt4nXcfPO4Ii29Q/aZbzmyzubNs1DsuP9r0qQpxIx8RElnoGHZaTygJQvR+/6lADBKNeZX7af5VDkXL5usPW71kdkd+2RZbzJ1nfPwJzR1I4nYOeaQGQHkDEIIOm8lqNwivcCIGLOOF1M6ibONIHbUdltTBj8R3GDkTJOQiMBRo4RhF2G9iXXkQkMhzXc+A93wXg4cpLfOAxrVxZUhgkEZlFFbYCbrmEAJ0YUTArawnzuGnPMUCww8LvAmfkNZBkvwplP3gWnn7VDN1lBzj3K15xdCjpq7ZRyLpVHHY1KPzF0LVWF7ByIUt8B3+zes1LfbN6JB3XQZby+sVTqN9n1VMI3aAJI36v0CVitb6pNAGI4sQ7ysYzD8mhsHLXoga+SNCGIc0uKK7+AaGAXEIUpQ3M6wzdv3w8rS8t+is84DGs7JWQlf2AEypsDBGTODMdwC0kfCfoA/5xWZjCEpiLQJQIcUz5Bp9uFmQ0LMDbLeFdW7Kad8y/cY5fxKibtJ4M/VVsGFJ+OK3e1LHqSCcAdrHl9iqt8DbxAZbl4UJq6NAzcSX1/UIf29hugj63U98t4x7W1/4vAD42mv/46DtwG4LtkCfAZUwi3Uz0LwNYBhF/SOUzqkUsxThLAZaALF8zXSm8jEZJZYL42PIbVVT3dd+9DYE8psE7J2moAZoDYacRKxSlAwxjofUXNCEy7Djncw9oAFxZYQ2KAfqaADn5bXhojM1rd7+hbc0KP4Utnn7cbTn3Sdr8Hip983KTys2uABn9bM/gZNgX4Uooscg0NAGEy5bpKSSuw/DlKfefk69rNO24Z78gv6LFTe+M69+gTqZ+CkyaXmivS+7vIQICHUalPYqZ7NyBGQz+BPvU9YQTkoqwFIEtOh0o4R1SSle/BLFAdqw08dPCI/kXLIII6iAHoZkMSepPAmgNIzAGl3QNOY2AmASRIJoYQIQoJ+0FbQebWiFIfwO5As6fxLh+EwWjVHtBx7gV77IEdRekeFQvF7OMS2BuVbixHNqZfKwVCo1QvBvv0it7IHOTZ7CStZe7moI5ZO73HlvEOna2PTOpDNr8fasu8/01hbPwV0gFJ5+PC4tCp3gxUUQ3Ak+Tz6EUZeTekv3OmADR/UMvJ2MnkiEprB5ZWjtgzCNLegjqyaTN6a3CHSgSGQLcauPBaaANInovuRET+tDEojorEQJQ7g187i2BwyC3jPedCs4x3q01HaygxDhLQeJXjUsGEyGKytRNPjmpKn+Q6Debgd3eV3Z+fbP2ebU3ctec376Dw8DOgJ2ENDKyhYiyESalPNYZCWAz15ul0nwdgPoIXFQD0/0FSCoT0D5coNAZGsSzg45HizPEUEu6lfqUHz9wGbSO6pZ8wJluO0TETC3JvDjiNwIPdThV6bSCsFPTOODr1j8EkoU2LTkIf6h/KSLB0Gq85g38jnHP+qdCf6QIyaCjeSygW9tDuCdtcRZ8lnwHp0QbAxrZneF8Hwgt5SrlKwOeppdTv8c079jTeVevlH9vt43X8ynQcQ3EwiPv4U2IQBaBnnupJYWkgmrI6Uz0NiCUfAL0BiLoSCumNOX9AaFIFirEZdc1uuYWNMFrpwWjVHfRgv1U4dluOLecfY7Qr6qgJVMB2IIdtybrGyn/gJE5vB4VEuRYVJa/OM2cW9GjQrx5+EPq9Dpx9oTuNNz9ZqLCcV/HrFN8w1hj4iWaABWUCcuaxHtxHhrEuivYLexb5jMpL/XAar3H4mSx2405c0DPiU3tU6scgMvikAEmJUvOwGegoV/tRplFgHvU0LwQaYTK4JO4TMSUBuIdWppJhkBccuruGtEYnlOlX0/XN9JqWKNVqz3qMzQGPtWUC4ewBsINKWY0gzBQox6yCRmB4m2USdXIcxq3CycMeHIOBGfRmZuNpvGbh0q5TtsCTz91tP7kdwG4fAxVVFgAFQKSURh7KsYVBM1GF3oe1D9Jc96o94Mxp3Um41Ldmm0oLeoyTz35vTyzjRbGMVwLfvvk0sEIIHWwpzAcVgU4dgjIdFJiLIvc41RpAFXuMSvcI+AzUlGuTYrLpQ8gTEeAHZGS+AwSrKhrqGAeSHmBD7VBSZkDpv9rvCEtThwBupkDZ2ZzkG/B+AGIWxL/Ky2IFhAm4BT12845Zxnton1b9e3Du+WfA1q0bPYB9Pq8+hDHGF8A0jaVyeM4E1odjzg8UNH45oxQqkqrJqSFJfir1+Wm85kUMw4Ke4SBu2WUSWIBaTuVN9OYTQJd8Aus2CwB5G8AMxylmAL3KnP7viXpZaYfH+DxIgphnw1SsEnkxK8glIK/CeI4NOMNJuUM90MLBjzgKx5X7TUZjdB8vib6Byi4aTGZB+sJRWj7g9yAgWO9+r9eF4ZH9lqHsOW0bnHnWTi3hOr7ZiixsAgJ8IvkpgDlChRYAGQhpB8msPB2U+w1JIlVMUTRRiuZPvFU8TqUz+KOt78/gDx/gcFt26YIegLX27TeGTWQIqa9AmgAyny9fkXvW1zjFJsAYUWjumMYi/QuJgjvAhzWYZRBfFe9vKHCQFK6Aa4eG7HJh/fK0bTmzoWePhTIbRpw2UDn/gP94SVo7gB78nhlAkPy2QGPzOb+ASaOl/vzGTXYZ7+qhAzA3P6OlvlvGG5hDWIqcpo2oCi+uBRMIY6vAC8S95BB590QqDlc1Ia4Q3FBP4kdJo1H21kv9cC6f//LOYOA37xip7z+5lcaFf5lFBx4RDiKMjyskPEEKpjLQ0zMShkB+KfjdC51iDUDbzXwaUADev844+lEyhJAtexG80Mn4RxEXuAypCp2i1jUqpzYLRuZvddVOLUWzAGu2diD4BIxpYFcSmnL8MgHjF+j35mB2bk5P7e2zGsJpp++A0/WfOYMfC2CkNr8DuEpbCRR3BKY0mOKawM047gQmADycMiBIegrk2oUoIDAyUWh+b6Hvz+VLtr798s7ISP1lP7XnF/Swd0ZeXgn45Lrs0HPhFKqhPJZXMgiSjo87wlxoWpj2MwHlsT9eCidGEBNm17kWn9v0zF4TacNI9BiR2XIpieBWBOoB2J9zTsLhatdPGXqzwB9HZpyD7psAaeWf0wac5O/3tVmhvderh/bDwsIsnHveHtiwYdaB1dcdP4bs+yWQ8pJdibZF7DIcq+JjJwbh+02p3E5XhduMOYQAxfttDRuiPEWpYmQu9emXd5bZMt5wDHcJ1NzBNyGslDchGzJGItPR/CyvBD4P84xwmj8P7m0A0idFsJN/RL+mFPTcPTLQaVHIRjDl/DSZS0NX7LEWofP+V9ocmInagB6QFXUSprUDziSoLfi1AWBXqJkyzUc4Tj9jB5x62narLSCtK0pRLw2JtHdnGQAzCSYygRLomaBXAKx2Oa24flpXHoSM4yoGfir157zUN0evpzP4a79ltwR8OlaAxHF13/2DJS8wCPBPArqw/9MY42MYJ4zrqdYAjAkQn953ph3s7EURwlIpgtvG91QCeFLvObJLFXkNgYaEsg2Aaj9tNzvnfAMrPacN+IMjgZoFtbX+NQvoms3J0K+GcOHTzoC5uRnWPgq8HJZAmEACNlPzIS9nEhNI/afyzUNNXMCHq3WyCJVJf1WIVU4UWqnfI7a+27xjvlsQvrdnnXz+89rxvUdAhzamt1YCvkvCuD7Ed52p94W8xTHHZxXo2AEolBlf0DR/Hnzk/KMUh9JZkn74vbhknV3GNZbGQYES8FU5Oz020KqhxplntuaOzHf1vFlQ2zXnfjmxKc+uOzBawxCe+tQz7Rl9yachZK9QUvhKQs4E6KfSmQrOuAQ0A3oSTWACdt1CkwMbIarylOTuxGjtm7TmNF7j4e/7Lbuw1jJegCTdOcCawtbPECTQC3kjmGl5hPGU6i6kNRYjHEM65guBVAOMGZWCmXcXJl+TMlAWXCo7qNnQLAQBknQ2A9NgwZy7X3X1dGHXMIGuk1jGLDDoNysItVZw3nmnasmmnI+gSoeMuLKovE+gTgifpAkAU/vRJ1BC8vNZgmi9A3jNi88ylCi1rZkmQZ8zAeMgTVJ/lnx5JxzKOUy2PpGu6bIAvnhZCJvIEMqOO3fLGUQZ+AC4TmYQ3lWlppgBpG+DNaCVXrP+L6AWS+WAeDnAXwIUksc8iscHMxVFWkiauPFGGwD1Zuft7r1RmDI001TDMWzfMQPzeqrPKgV2NyH5NYWERQLBM6kw+QEAvN2fThIIDVJsRiAxgcQl1skEShS6n6VTUHKeso6C5jh5Gm/Xb94x5NbvkzP4g0cfE/jLwIey1McGacwHQ7G8xGgKcdL+l0xG1s1+U1un2glYdVWdvVgovVBKBQSy/CFvuMp9CggoXADipWcWePbjS+ZhyrfZ/Bn71cwW1F23dmDl8CHYtXsjxINKLPjBOQz9x2Hs6mE2HHg76PkCQUtJT65icq4lyO8ekCJZ43Pg0mSSVDGBlPNc2gffgf3yjty8Y7fs0jP4hdSXDj4CYD6ZVABfE/DluGmS+nJ8CuaROwML9j/m49s/GBxLOuY+AKkchndO+i0R7S82+JvDsCEOG/udq+GTKLzQMNjjzAG6JcVWqPdnoK+n/JbGB7T0n7XTW3Egxm8c+I0JZl+B20LQ0J7EamxtHunKd1w8c0iRXAhFiU8lOPrWR8keqpUPSyJkD0n7PosJHn6/jNfZ+j1b36hwBn+UvkVw+/dYYAYJ5JANHmTpRRikPCWgl+1/ns+XKOpucAZ6qmGKVwIict4pd1JJIVXAf4FRIB0n/N2yl09CG5kBAV4yyAW5jT1OFfe5qOIwdqcPmyTmKGpVGQdXnWYJzH+1XypsiqnckuG0jhiSkkhs+kIz/ElEip8fGJiDUmXpr2jCwqOzMJVMoUJYiFHy2nj32ZbdWf/lnZGb2iPn8jmNUAAMkTNwwQxyKQtQNA0kKEVeXn6Ka57uizdQZCbQrDW4b1CYdzXNC4Him+VDGnn3sgGQAgFKUKDf9uPgn3zPSbG2qHjVoBeE5bqWUbhyKQjcNwnAb1BR9rhye/6AP5jUDR4kh46iNwu8c6D2IFMcl/yEIXL6oJwZECI/XNr0vkD0vgX2gJMYBAmTij8QW98ekGKl/oyT+mZqD8Ft3lldSafxopDQKKVtHsaZtwB5EaTNDCQDasxSYBCsLbQdExgMGWxce5lmBlB5hZO8cJQgzVBbuKGDwF8rlMmRJ0dZIEsdiRkEKlWRCVHFeZkszcK89gPFgE3bwXbZrz15aGRzxP0EQYT7DUTFr8d5Iz991AQ5E/Ctp0yAHfKZPUQKZ0KdxrH70EYAeqGire/O5XPqvv/yjgpn8K+SBT3j2CepAeFSzs3zdCWVPhWBDel5ugRWyXBk/px5hE0+wvtUNBcCk2X1w5TvBkSzHThTq3Ngx5Bo60IBr1jI6uHA1ME8c0mzdzkT/DEODFp+uHYRKT1JQzLYr8rS758ZoFTmFSRtIB6RUIdzBNCCiW0p9nkT5To9tVjiUwRmAMCnEn0nlMwEhAatJyZQhDuCZ1oKOsbDbyS+//KOmQp139tbdk6+sf/QJu0koqonrPI4FAwitRIEcFN4SYXPgU/rFUCHvJ2EreRlyvSlNoQRNt3nAQjoobxGERaABknYYiEp5RgZ+H14HBwpAxVmdLHP5GeApJ6TupSoyjY9nEwT1fww9145swDHXiOo01w+0QbApqNtIgzHI1waBejzpnUNCej2PjIBYV/Ea8WvxROyf1VYxuvP5bPLeN0Z/GHLbu13UDKpj/m7KGkEJQmaJC5NO7m8EvBJDBT9Bxn4C4xGDEKEvH7uEjTnTNbth0HyiPhPvMdyAQBC6vKcWMgnGQIWYkSJQWzmVZEwFTWUmD9g16vmlgGEuX9r26dynXDXTkJvFlhmEJ1hRBsInzr32oAFM9MIFFFLFW9eADsSpDMbhz9/0xoVRWwEZ3gov4zXb97Rkr9jl/GOyVd2yQk9gnNzoIq40P/0XQCN4+kh3hbAnKWjEJXMI9WTikWQgxEDd+chYgwLZlAYlceKjrETsKasGpo7RnZ6cxxkg8lfSl5TSKfEdcY+sNCugF5XCY+OPgMXXiMCPazCJrGLeAiDsctizTJhMyVofAN2I0HSBqxGUBGNwJRegeROlumE1YBx+KVpQhPE/QP8F6RGEC+Eo88AP9r6Xurr/8wyXnYGf13ngCfSEgphHFclIOd5GdDWYBbIyp7EPHJGlDGTyDhEmGwT+9U9NZ7mhUDxWHAz2OjRAFgAG3/nbgQDdfqKF1K+yoon3H3TbAce7lUwGI4htsvXUyYiPgvtzcL8LFf6whCQs/jcgHfLBJRbE2Bs5zqcRegBoXwBKtnephsxHjnm8wcHId0PEBmCu8awhoC2t6gRBGaQ7HwAJab2ZpLUH7oFPe4TbDWb13f1MM4cK19TExDp6buDQl4spidwbHL8kbhms4CnZWON1UPyq/SLvpx6uk8FDuKQjjwUwCFSLXtJWYHlOHEtJXu4W5ip4IJTF+C+h1fhwYOr/p03SPfUKpCMh0bRMWk1ADPn30mOyXBAqGMIGJlDWBBknYRo1hHQ3YXoGId3ELrNNG6BkTuOiDaBf5EgAN9eeubgpD5FPSmAOfnSBh56Lp/9yhLQzTvhXL6a9x0DqW8VliUu5dDSVGu00UsMRJSLIn/OeAhwSRuyukgdyOov1cOfmdavcDzNDKDDEcsYK7mPHa2gwJBZAMasyIoJaSRvEe/YHuZ56tZZ2LqhB9/atwxHVkcugmvYnKjUFGXSbMnDT6bvAvhjHie94yfL/X4As5PQ6IvMSWj3EdRcMquwqlBlzUtqO0KYfUKfDcR+ghSR8jltw0v9vtu8YxiPPagjSv0hWdBDOxk5YArXEPoDCkyhkSEgy380ca7rc4YxcWmviCuVyeqP2djghjQ4pnklYKf2PpS8wzLEoYwX4USBaCYhkmMZKJIgzPUrOHf3Bth/eAj3PKSl2rgulkjx0ti8WI33Afgc1v6vIK1ZsFFBMlJGAN7V4B2A9hsF46gJOHyOIX6YwH7RGKOfwG05C8Aizj8AtnoxHC+Wg58u6Mml/ogcnR4/vuHBh+RaAlJeexYPmKVP6coAh8RMZbmNDCOPa/ItYCkfrS8yk7weOmGYyLsTLR9upwH9NYvg/S3TZIOjkD9LT18GDRZNIHnMm9m+0INNcx3NBFbhoSODQqPIOGhUE4i0p03zKr8Dn2Kr89AjM+7590B3WkHHA9X7BgC96SC0AX8QaTqaHOJHRAPrQtJy7tkHcEuPja3fyaR+2LxjD+TMTuNF2TFQsrcVQGb3YxHcE8qFsgqf5WsKj82T9ZalfsqW6kMWJ+op5edjZIo1AG8CRK4fw91vWs1XBhWXCjF34Ufkz7h8Nh5IUoSulqBnbJ+Fbdos+Pb+FVjRTkIE8iGNJhVAhFt8eFUwrdpL9fCsCqKyEBuprNofv0ZkVgkayQ/pbDyXviZqg9hPEHYhRnOANlsB/ZgoO5dvxjj5+jbxiE3tjdLiJqB9iryfIQdZyelGr0tAbbTRJ4CWJRXtOzrHH2kLrmc9QBPwWbnTrAG4tbGsW9BJBr9CvghK8Ol4FOZ+gVhoNhbzspEnlukNLehZgvP2zMMDBwdw/4GB26seExWkPwGWnbMPElK5AaWEBI5TcfGGFq8gOQmR7A/oWEeg1QbAL7DxHzN19YL/QAlhBJEJ+LqV0AQgSP2+BX7YvFP7L++EZbyIY4IzDjh+jYU+LoIByE25PADAdTkLBVNYl9ZQXndQYh4o7mPopLYWf6f58+BNC4FomvhPzBOvMxUypslKEJeT0stYHmbq3LWpD1vmu1obWIWDK0OAiR7ClLuu0wBTKnweDOI4cvPwST1nzwmJeQAzCcD7CcynwxwjiH1kGUGYVgDnC/AnEFkGUqXWBeBbJ5+R+kbd789pm79ryzMbd4zUt06+8TgHcBF89LoZ3NhUzhqqN0BZ2uZMnpRTLKPUTipQJPBF2yYxnlgDYQgqxKvp1gAQxUIgpoKJfingOB84PINg+jxHIT0bt3kCoAX2uxU8eeccPLzUhXse1tNfozFkjCDeevdQcAKylTcybXKEOQanqMku2kaYiPKfJlPmlfpTiYEwAn/8GMZjyMJv2q9vlvGahTzGyWcYgN2yO5JSvy50oAC8KQ6xoW8RygyClIkpXRPwed4Cw5BtRGwEOqwJdDpMZZkNjEe0pzF8mj8OyqYBCTd2H9jxAwnowAEexry+QK45eDNGQbucOW1EXiyno/UYTWCjNg3u02bBvkPDBm0CRZ2pGRboghEEIeHSIEkrfANxBsDHWmHvzxOoytqAPaA8gj984LRj7Xvzhd3ezJxW/bu2vMGKcfI5qR8/vuH7QoknlEDCQhgUACQ7BdcBTAXrdPz5uOz9R0BzgDKNIGMmE8oU7aMMjLQKMsZjefs07wXQ04AoQSbfOx0U+ft2pBJ3lu+qmCG8COTJZJpiWTEoBZpz/U/dMgNb57RZoGcLlgbjmI/hviZzz2RrnjyimvIDrlW4PDHeoiGZA+EPrTSHpA1AnZhOMEMM+P1UoVls1JuZt18mNsxjNBzak3jd59HHSeor4pbI1Sv3XKVOawBaDEPen7n9jyS4wf7OyqQQRcEUgDGzyFRikpArZyY8vFQ/L5cBPpShXBmYncX+xNOxnwZkjy9t6SLygKJTvneVhWGevVR0EquQcxjMkxbymrUD55wyZ9cO3KfNgjGVHpjS0t14ITxOAfrikm8AM23AleOn9WJY8hja9MH0N7MF0fOXBnk8fxDd4ZzG4WcY1Gi4xHbthQdIx4759tLG+3qRXNOHK4Er9RsJawIbS5vK97Pp+UvF9TIJwk5Y26SGQVuC/H5N4Ic0Tf6DadYAai8SS53GEsoXlEGSvyuQXJpmKpSBkNWPolyeXRacGJe52q6nCzfPGt/AqvYRjFyMAjJrQHgfPaCD1kum6bDQLZQZ8OXE5C8eKhSmDYEMRqf+WwagNQUzpTceDNxnzuowzcmfjqr9SNrBOpL9wgRA+LACeFkNmOfLnXs+FEt1QAPDLtfPVuw1AD8VIcshTIExTNkvrJ2tE9CQlP3BHOCBHGjZwCL3Np6CBxvMgwlllEOKHCFL2NVO+TO2a7NggzMLEnqSqLc/XnuIC39ic8VXAqLFoEQ/2UKI2UDGU9huHKf+KrvUOSSxX2WozaGcwyT1CfCB+h8xtdFF0d4n4QXTYBLQKdiwAKg146AsrV0VyHtrggqf6hBAl23FEnOSTIGUj3IQJ6ZgY6Z5KXAXu+hX2jdy78BJmWqP8iUSCl8S9unyePKDcviSSjDLApkaCtwVpjCPNWsHzt89B9u6e2DT1nkrjWNalYYZPYAkAt6nC8XS2YGETBWbRZ6ck5/3t/a/P3Q0qvTaXTFa1VK/cn6LcGQYXRvgAlxD/HwGaZMAQfg3ewE56NS6tANsLrNB1afMHmO0XGbsy8aGugGYXY+8sPiyi8wABcMi8THc78eY6g+DdGdUPTpCAhxL5ImkY7A0wNlAKUauL9wGeeVa8bLXrBMhG8whq7HCd+3YyDLbZUAo7ok1QM/8V/HQUeAOQJBtUwKgRK+qld885OP9J8trvw3bbjAK2oF3QOSqf7gXz6g8U2INQ94JhbAysAtgE3EqA76Pk3Wxl5Pb4E3+BSwyE/E8KOsrpRX1QIlJTLEPYIC167KsowIhu2SDmkX5GPbOMSuCpybRiJDJzwLAQeaDvGx2qUppsSBF/T2me5tKBc0nMIEAgPAxT8I4kA5oiDsJrYZZEcdgpRyAEONvtoYfUl9T88NdYjzGku6k43WT2Q5a4iSA+ucsx3HwpXeW0jRJ8sx3hIUNR4V7WLfHH0lzsYGZifuY13bs9GoAsBq+jZx5ABxhfoMCY8zZE34RJxe1VgDKe/+yQiSWsk5qv2ABBOghllqCrrY0sMKJvjaPBxubGfDNy/cPeI9BrdLJwkFyeeerCqcNiWdUBYNCMb9FGvTcEIIIOscEaCkcXDFMgCYDEQNm+IfXxcstS+fJ5eV1Z0wCJ6RjdeR5GTNQJBXiNC8Frr3wQfYOwiAN45S/rPSrsCShyUugYQh5/YIfpwvJDFIZOd9AWWhMo2hAgcchUKcfyRMcfkrEKV5U8IuwKUPv/URWA5I+A/+lYvSfJCBMIBJxtqp0YEgCNHk2IAyLPZn7ZT28LuD7fOtiCnm5zZIcGBNwt/Q9F4AKshzRxollyvpLzwlT7gSsqnoQ7/iLyyTcJEKavxhZTk9+Sg60SYcWN91JYMSwhmfwSjy/D4d1IHH4ASQA0lN+g3quiAkUv1Lke5GsLApp0fsCHLPNHAtA3X2ZDyCcWQDyWZGFZQBvDGsCH0AJiLFG0ebGLb3xHyRF8rRNzrwS0LM2AsLEQ0REW4OPyZt508sAsO6k0UNA7LVTIK+FZEoDCddXDc0CTCKkFNn4z2rGZHOXK8c8GKFYl8pyoi8f/MDAzAdJp+aiL0DJNqvURlqAsJtU/ChA6G8EZgKo9DxMI4n1k3aDZAQcGC5e+gSEBC8xh0kSmeRtiitpAuzNZ+XLtLTPsFzmBOZRZBog22m0sCk2AbpzVT1cCgOAd1HsJCzGAL8RVibKgegCS9tv+eCT5dJbzCICZJANynJ+lg9TG7IUyK2FxBSIyg/ANPu0tyg4CUmJQYUnD41U6lvwq9goxlSUiu31lgU7w8+VmQa3kg8IHDio8jiQoEIeN8kUKK3sy/NAo1qepY1jCSe3gwkR0SbaDghCA8p9AlP+YZBB3B+bxmK6o8QHaZJWk30A6Va++An1yGQTs+Saw8TyC7eqEJHC00lC0SSiZwmCSrY5A3oYsHE+ITEXRYFP/yBK+pQzAR2JiaFUenbFBn/6V5X6vKBe03uEyUwBi3ETwNhYHzSYC3mb02p1UR8DNB03sl3kXvF8FvrTvA4gbQeOIQDF/lDp9cSBTfOR/Ay8yKJ4MsyvszILJoiMKbSBVkscvg2leKgnnkZUbhSFAH+mCH4AKqYpSMmcHUR7P36ZlmTzTCBpHCo7LzBOPSL1ECSmw8Dn/5XmAdNOYBJIJwEOmoEu4mCSk24NxpJaze9lO5ngQgF6SG+5wU8wxbMAK2PkAwaAGez0GvzgC/PhAtAZwgrg5y8SiqDExhtaDop4KgG4Ck+lAsF3yqaQjSnF6mHmePH4gKhVR5ASJyK48sNeARU4S2ACgB7QCIFZxI+GBAkFEJcBK1I5gljPgNzGBxFHmYAEEOs8ct1kc5M3AM3qPB8g+XFkUj3PgQ+k7SjqcrdNeQr9IJ4jnvsyzSZArWcBwiBi3n4sJEb5EiBPHDo5G0tNqjoWbtOLx0I6bLgQww2SBx7kWEovH6gKrUjOBO8ENPCSVwFdRxwYA62SnSwMAayKAJpqAB7YkXmEtibdNIVjOj04lEvr9L9lZgACGKJTRDxOimN9j+Rd4WRmkzGByfcZ0H0Z2PRMk9JBziS8ljXFJkBd54zc3RUvRW4ej1Aaclwcs+wCuI3gLxXKA1EWhKUMIVyxhw245XW7axXWmyOQZcKYFgMpUrRXD8gxA5DWq3v3p7n124Ap+KP6H5somY6/Jk7AtEYhLAOm74M4BgUgWdoQKtW5AmiRvZSmONKvBXU71cfDS7Y/T7ceJtNQb4m5hGtlDnOf5u3AvS6qZWB9AkXgJJufvWfGAxDKlaAolr8wapshC8zLlMwiJlEirZKJFbnCchOJZM0rJEwgFUfNfrc6T9F0YsbDXySeQZYZh8pC2Ui+JuQz0zqA5QO/klA+GwFIfEgBBPkyGTBJ6gYwFwGJ5fKazIk1Pf4N7ZJ1ZQwKxbPGdgfwuzTVNGsAvVFVj2NHIesn11eiA2kns/5GnizGy3Bk9WMelAdKJsPqwIbmYWN5IT6q+ZjQTAFLU0XWgemcQMUTsg9+uvvoXoz5Qx3BF5DUfy+FlcpMkrwIJI5CF19eGoyFDkaQUjY8e7jn0pnmL4BKvFdqk8fyxH3GiCaBH3PHH05sryib9UHJBLCh06sB1PUSh58ZVPEDPJEtrEEChIUc1BbDEoBDLhR5UQABoVyOqI1Rpg0AG8hq4hMmb0IGpABipZIC4l318XN+cdCSrxDYPnbfJ4zxoaPDgGe7AYNpgVG7CGYIsHahaHVysinM0yRmhKkNqXNg3cCncROBn8qUUr9xFV+T0y+mkQOiIZ9gBKKu6dUA+p25ehUOpgD24lOYtLNEJNBcWRFFpBYLKzajqEXI7Ih5iZJ5sMLlrVgOHLAaqpbXpF2KGemQvjbsmUMCr+KHEWNyvCpMIFTEXogAzfIB0TBKzAxJN5WAQp4cG4Dt06K4jzWy98FeeMF2p2shkOVD0S4U5U1c288Gm6gXmhiLv1ahZ6ZYA1jWBkBQQWNnpv4Dhm4SVhIoLC2QsuItQpkvIBs/SeaGQZ2NL+bFLxJmF+Uw4PWqYhkAwSZPUp0Y85DAyQNIhH8kU0YVyvDjXGGyXymDANoPvEuATl2y5b3iPrZFPhTiGvehNPpOJzOF5ByF9HAkXfM+gRKAAZramWsP4ZqXzzUW0WYyNtU0bwbqdzr1sEkCCJzEZaTxXZDhhvlAKY07fu/yA9CxnaNbqqZ8jKBQMCRSQAwyiPUBK4ffKlEaaV2U/gqBMYHQdEWdf0pUgumwExVPTkp+gMgoEIBtB1aQ1hhAiEfuB6D9ThYFMfMl46QAlHGU7Gmgz48EaCQvk8r+HuV4kukIcBFL9eRthAn5MkbA2iTbEtBvD2SZXgZQj0dR7JFuSRQDUUQSoGGh4EaAQl4OFspsyIAiHEtZmKYREuQlcm88hzyPL5XgwwnHiPf+c+KcEYpdEAHMtH/jwFXCwUeC0bc31ofkKYj0Z74VCpoC0H18BBjJj7K8RqkeyuFlTgY+QK5NyDplPc0Mgj8LNsQhIOH+bi3GNO8GnBkjHkLa11BWGWmU7NhSvsYageWMxecDikkQBP/isKFIFE1FHscKEW0gLXBVoEB/+PqPl8io/PoAMj+QbpN0TtmL7VLRrMCEHV9Y2koMbGVgahfGOEXMDcYE5C9ioR1NQIKitI89lYE7t+U5GHkd2MQcRP6J6Wx8U/sRcj8Cby+pY4o1gEN98oYx9iOmW0HIw4IIpoOLohtFTszzZuGlioPey5LwurPWFcvMnyi1G4Gu7IlTfZiYk5xei97+qAKEeAV88oJMCVL7AxGSuhwS0+PGyswlxId+oDMCySQQbRZtTw/fDMAsvgDImBN5mSXg5yCFYtmsP8hz5u1pagPNU8hnO8i/lak+D2B8kKKHxuR4YXY+AFXfUKYplMcZgxKJ6CiHBJ6SVoEkbd6CDHQBRKnYAsuPY8SDB1OpdFkwLZn66WJdnodwEEKczlOKDHpUrH3p2TF2l4qFkPYrshKRtMglFYCAHDhN22PL4DwaWx7YmGgMnwB8G4IpP2ciOCFPqd0AnEFg+Rmm2Qcws3ljvbpvSWj9GN8TvXU37h+aXIIn5CkyERJHigOAkuOvwJt8WiwNWopRckk903Fskeoa7ft4zYHDJaoiecKmH+D2vrA5LStQ4R7JLEB6Dgd0JRSK/Dk5M0sg45pKyBQGPG1/DiYGvAYbfyLwab5CeGoSB3c5XQnQZWZBnx8K5kJqr2CO0zwLgMYJ2KRC2wAKNHKBUA5npMSLUJBJ9CIz8BeSKWWNTyU3hvFCY7P4M6dgWVSS8sE1r0Q8RgmfEpMmk+O6Yz3h3IAogdJ17CYAiOctKsgYAWUykgmEMIiMCyCT9iIsZwp5uqKJ0CTxbbLUhhyg5H6iqo+kLJkGG8uNofTedXQqO9pWU6wBHBgPcdZe0Q4N95RQjCFcA1cMvSkPFfSZxiDTx5qBfp8rRinZhgjZVChTLCal99JZQe7Zjw10bYiLglSaLQh2eDwSjILWl6WoIW9/wsyATyQ0L9K0wtMh0woSE+BAIXCCoveftCddyzICmBrKXk94vKWAXjtfyiOYwyRGkNVL85AxhJFJTC8DmFvu1Kkz/EX4EePEXmJeBuvMLMJTsGNJZXk0ZnVkXFwmkPWAMDvijYrZFElXOjcfgQtzdy8XArl2KPaFYfNTAz0lNAEzcaKgcYZzAOJSXFEbPUgkluYbp1hbkT45pBGNrA/4+xUvtwnErP+RjxPk+UvlT7TxySAoSutYT7ktkpkhKY/noWlI3ZGmeCXgeH6A1QGCENpfQAZVGHlkUMVkwkzIhyPQxDxvVg9nBjJVM2FzumygkKjoGCPAz4Cblxk+BhIkGfPCh2dQNahSftKlQWtyxXjQWy2D9zUzMXyyZhPAMzeEvF9EXwDm8SUVPDwXa7z/xULZyAeIT4p5ugIjQvIceXtC2c3twqw80WZIYX4adXo1gPFwTrO/wwDihcVXz/oa6Q/kNzRcXnuglRiHyMg0MjqIcq4hXjaIRYSYmxYN9WLhzjGEcC3nAkR7iGqpwkk/cfB6EV6lxoXtwnGgUzBj0iBcYoiDnG4E4u2TJgB5i6Q/InOloJH3TTb5JPA2hfvycB35sQR6kudotARkz5r6iLUrpJ3mWYDxcIC2AfFdIR2PkbD5QrywFJV8ApRxhIGNJGlCLg2VWgfHsoxDkO3j/ghhfwNkgCHNSHI72u4UWLlJkNgEQDj6y8bT00FCERHfrqPd6UCubekLwP7zYaE9sflhKzB9Dt4HSgAFSN+UwUz7Dknf0b5B4GCUZQCsZ/kuxrJkeDOzyPNw9R5JG2U5/HlpP4VY+6HW6WUAmxdWcWV/4K75gOG/HCzph4AxhiO9JRcKMrXTBmOmWfCBkJsG3GxQZLiVKkagB2jwkohzDUUohmFCmUFqVwQdyp7wH/p0nwBi/ofAD7jvQADRMyMlupbtDCTPmz/XBGbQcF8C9Xq0AZxU3gRVPaUq5RH5pWlggwplSWkv7X/LVD3T9Uy0Ho2nWQPYoPtxuQGswAYDghw7SJFD3iOKWjjjQBnOAA7xZStSFAO+LF6whWxygGRig1zJcG7xK1mKWEZMTYGkDWBaBEgGX/ywaPiikLM9UzkBBwjphGFqCinSegTyZSDM24vI2ilBJxcCBWckFNIm4KZndU+LYjD4Z2fvFGO/YJER0PJknQK4JcaBIr6oPdB2Im+nf28wzceCj1c36rH4QJBFEC0ADC+N9425q+krwZwpsFdHx0MogGYo5IMUBJCBkP4iZClQDnoQaXLwi1hwY4IwBZX25bvfpItERxsZ/O47f8lxF59DKbbijx306Qdowj7VaVKbwkX6wm6DCcAeHtmzo4hfly1PwYZ5/pJvAdcAK2R5ci0BS8CPcaJtjGmsUWeoz3Xm9DKA0eYVVHvNFVIcAH2JTPNHZGqs62ipnJfIpcslub/nZja7RnGhSnWVzIr4IwAhgEAlOS1ByeKUtP0DE/CSjpoBYYAi+E1EkD1LWgjk8yIw5sSOKIkn/gI/3UdxJiBBlO8O5H0wCWzpmjIiBNq/WGAW2FB2UmKwkVk0MQfKeKiqz+NouaEvUnux9Kx019UxomP7efD7zT9Ixj8HAvgw8T5jKJYiUrZ0wdIB8NU2PF/SPEptgYwh2aQxOebtLgzYOBgVHXyEGQirmg7ekNKBPg3IAHyWx+8kjGVTF4Jvu6Jt8+NViY8OBrXfJlFEGxGSUUp/qdqnmYkCY0D+y/qySYuYpF0IsHNmQcEI4p7m5XVQ84ECP5VbSNfEOOILmWINYLh1GfsPV0jBT/oO2CAkVyjKYaf6skhkDMMS/boGzceAF9IC5TgkTpF4EI0B0RahoWTqIwlXiQnI1rhSqAGAokIi6WKRtffge0ZgV/9V4rkwnuqbKuR9zA4ajUl9GxUf+JkJUAI18nandOLdZgDP80lgpbqgEaAgGFHRocfSyfrI8zCwh34gfULawZlaMO2meC/AYPkI9ohan7rYfwqMjSUsaNqYAxDIS1JZBABgIQvyQQkAYTotojwqC0k7oG45nr3AQIq10kU8wACQbOx0JSqNg1+R8qlNHL8DGPOZfvUfBjC/9oAwJL4E/6OEZyowJ/KQ9HQgx5pCi3JgK/asvK9R9r3oryYfQUl68/fAQZnyFBhBEbC8LUydJ+WnNuIELYC0IZc/08sA9uzcigfuvj+PQA5EdyHuS5Sp8zQjjQj/lM4DAI8XYe1TcFMAyrhQb7SlaR6kD8KgnTci1aAKdalYUQB9qgNlfCzPaAQVeFGd2uU/Epi+HCRaEWx/avPTvp30i8BAt9ZpOjnwZRwVBAglyewLgKL0jvdCOtO6RV+y9KXyCYNAkY+MMkhSREUTAKfZBLjzToCtHQYLPoaQAEpQeF+0owsp1iDBMGKBNFCqpTHl5BKpFFENaVKtnukQKREvCaBtgGcXEvRMnCCrS8UY9GZBBXQlIMtrihQ+EkVaGqxWr6MxkwUAGeOBiQDM4zngYCK4c0ZBgQnk2RraUSo7MitedpOqT5kACg2E1wHp+cgRTfbd1FNsAjzplEN45EGBh6jihpfm/pECQVz42zhEWVr2AlAU06BR0FdHS5TQZwOsqTwKUiXaT64j7JAAkMiQ9JFPZG1UyAc/1RjkeYOhHaoE2piE5FGpJhefgBJVe9aaUC8CNEpxfp/eA3/nFFAS/PzdpTZl5bJ73gbupSd1NqUpXZN6pQ9AjgT2GP6vmmYTYHB4v+6r2RRgeyV3c9Ho1OE0EIBzfpFBpvXEgQ2QcWw2fgUzWKNsmqexTSXmwcz2GthJPnQJLpOaBHQhnlcY2AdE9UKJNpj+c4dU5hqLz5Z2EJKyFWECDFAcnBzADfcUeA35pDTm44EDMge7L6Foq5cAnupB5OElZsAOpYkXGaslpRqjrDuAY0jH9rsAD+3Bzuz+9PqY3Zw7vXyqdBXsKX/PAB24McmCwG9yoAdfOx2XXOYjzwC8SA4qBkeh1mYlYWm6z5eDyZ/I1PEIXtqI1GfJuvQejXDmgKL8hDMQJHZqKDOsDqQfJZGOPf4mRJsm3mNsi7TRwzU2lIGkjNjnKPuulJ6Xu9bGHpa3wEhyTYK8bt+zoYlMA9WmGPbm/yccQzqmDOD/vvTe8dd/a+aI7pnNbCwTYvPygBloMb6oFC6gRUsj+Wg5KJII0Ioi8ksZmO63nP0s6G89BwYrq7Cy7zZYuf/vAcerrO2pxWKhU3S+pZOBKdCY+k0AKkZfooq0UaXByw8GAXBcgj4T4UDimeMXgog9HOLX2gtQni5L6ThDCPlKcTy/zIcTGArVNUtqfZEJ2LQ16WZkXeXIvTM2LgkTsOEzm/ch9j8Kx5CO6WEESi3Wq8PRF3GSGaQoEBWTgJwQkuQILwkgVx2BDADMSqLqJNK0rHwZJtrh/9245wJYOO07oDszDzMLm2HDnmfA5oteAr0tT5Z8QhSXbhgwUIwiAD/Ign1LfllbRR30hnQKxl8kdaV6GBigqa6UD5GkRGQ2cjYbgOSZIzPh7xRJmbGOAEyqhiNtQ7lcFH1F1fgUDqTt9K9mz8K6yzelRqdxmfi6NvfuD+11BXVny73Y33XJC9/6sW/BMaRjygAMDZZW3z4Y4cPpo6DcxWU7V6VBy4Z0HHfIgtJFCfwMBQRgabDL/CJLumGNAWCSV1/3FnbDeDy2t52qgv5sH2Y2bIZNZz8bNp3zPKhmNsWyKONJRSAHNQVfGGkZSLHQB/SPTuOFx8ZCXemZpDccmSgTICKAZaggwCMVM+BKcAMBWQJ2Hdsn6yuCPV6HZwGeLmMCEPM6oCOAZBCE8bDejU1X9q9OzXVMQP+NcAbr7o5/s7rplKe/8Fc//t/hGNMx9UAG+rMr3vSdHYW/2+9VTwlqbnpRQKSPCAOAJFnsHWC0txIYkaiv9kelC5TMIJREmEG6DsZ1qi2GR4Cmabqt5z8bZnecF8txU796YOiRMBqOzHkIsHTv38GyMQvqkS1DvhC6K1CxXw9mBoKUPqStzFVlzgNR1oSIf5Xdi66noTr6V1uCnbELq0IaIH/J1AgnCrM2MG6SxwMFPblHdp+nDVKWMZCmNCQdsmtZH4rxQZgDC8MUJxgXivFCeRzGx1GCKXS01N94B8xs+4WL3/3JL8FxQh04Duh3/sv/uO8nLvruT49mYUmj43urSvXEJ204OO2/BA5NbAxlTkoKuMOIZEKeTdHyiDbiftKshWzr3LYzobthRyrTP5MBY6fbharqQG/jbuhvPgvGKwdhvHowVkTrjKAma/TT1B2y9MGRqEi3VDafXw0QQR3WObrlweYIMaDhlAG4RiQmEH/5W5H3DPjsXYj7IqBTGcg6Nr2ctEgMyTshAKcMQaZj1wAo6uJlI2TAx5wBJOArpg3UMDfG/raPLcxf+OPP//UP3gTHER0XGgClL77rLU8GNby6161e1O06C4Wrh0A4NrCXzePdP2lIOpssDZ4ULjWBFJ+GlSu4vDoQeYExzZZzfwjmdl4AGSkHu6BQjEZaGxiNYeXB2+Dw3f8D6sER4YcLm3uALcd1YK8Zk3BpVUoPQCS6k+6VNkdiWK2lv9JyoFMn6V+FtMiYgCsz1M1/Q8crhRyorJ9BMAUEbIwLPcleKGcIlGFQJhLTlcsqS/qcSUiTigI+/SrGAIIyY9V/I/W7m26o+1sufcl7PvVVOA7puGMAgT6/+LqXaSbwEW0WnG5PTcqATzgykmGUcXZgLzFGSbMgxmE+a5f4BqQBRosjdZFBv/W8H4IZwgB4Z6u4UceArdZAHg/HWgtYhsPf+mtYuv8fLLgztV8ptgaAetq5Wk7Ab36rpP5bc8AyAR1hTAAomAAVAX5RC6BtSD1BgZpmKGhP5Yd08A5FJn2hAEyI+Ut5Qz0pf9kkIH4EyoyKaj9EkMcnRvckOejBSf1qbqB6W658cLZ67ysW/80KHKd03DIAQ3905S9t7Kwsv3OmW12utYFemoUmAwgbGAAFPbsGYHqBAD+KNjAzgY5loMyjVB7CFs0AZnde6KKD5Izf3rN3jAmYP+M0HGuNYHBwLxy847/C6PDeWDb3B1DgI1Ag0l8q+elf5YEO4yr6AHSgD4fMBxDrVGXpr9jDo+iMAqAleIV6DqyPeZ5kyxfiITBkCvYUVorHAlNh7IaCH32Po5MiGMIiA+gCdjf9lZrdeunF77ru7+A4p+OaAQT63K+/7pkdhGu0NvB9Rn11DFgAML40Bck77NKlJBTMPi2UAM5fPsuSgb0MfnO59dwfhNldF+UFQbDnIZoCytvpwQlqTIJ6NIQj9/yD1gj+F+Bwxaf3+YGDKQBQBTNBFRgAQHL+RRPAaAAdwGACVMoeIBw0ANdWjGUlhiPUf9Kbal2MwPdT7BsKfA5YBlzCOJoATsvNfAGCgTgAF4CPpMUZA4Ao6cNQM9djmF/C2W3v3Dxz5keevbg4ghOATggGYAgXF6s/rve9st+FK3rdznbldrK6OBDmQGmAYAZtIf15HH3paXCEW5bS3cfDN1ParedpBrDzIigfFEjA7ziAB6vzezizAC0jGC0fgoO3/4X2EdwCEewQtAAOxhhHGQAo7geITAC8BiB9ACpK/lQOqUetQ/oT4ClxX7LraT7OFEIeaGQELipnBEhUfWkOMNufvPsS4GNr0LO/UH2Y34eelvqb/xw2bHvVJYu/cRucQHTCMIBAf7D4ll1dXL6y361+ptvtBC8hA2OTs5APPj4G6csnd/l9Sk6zivTubovWAOaMBkAzkS532n/wzqvoHAwSG7zUHo9rqLVpsLzvH+HgN78C4+X98Vkj+KijDqj0d3dVYACVr6OqXNpaeR9ATXwAkPkAAIgvwD+LYr/x4UHa7uuJK4E+9iQDN4kjZfFpujw9U/tjGl8vNjn6wkxR7uhLtv6Gh7SH/61fnznj04uLi3E1y4lCJxwDCPQH73jdD/VUbcyCp1aeDzBGAEQqFH8FI0iZxL37h4Od5MIEaxSawdZzf0CbAE9J5UTHY3QCRCYQf4kpQP9MNuMfMGbBoX/8azh8119pCTQUkj9dUwZAzYxKagAj8D4AxwDAM4BKUQZCwY/JNBBAZkuU12EGZJqAACkDrygDC4wAi8yBmAMlZkDBzzbuuPtQrfyrsQ/Y2/JHVf+Uyy5+z4e/DSconbAMwND1i4v9/vjBN/U6+PZur7MhTJOHF+t++K+/AaYJxDiVDTbk/9Aoci8CfJot534/zJ3y1HivwpncrqpIimoBAvxgwVhF5lBrnbPWZsHwyH54+JY/h5X9tycmgBScoTyMwHdlETXf5ByD9QFYBtCpiPRXxPb35VMmkJ4UmjYBlXYsMkYgpD5Pw9V+fi/SA585kE49pOEl4JPmsGvv5IMA/LCMt1q4X81uv/zF7/3U9bEbTlA6oRlAoD9cfMNZ1Wj1Y91e9SLtH2CDo7iCq6QBxIGjGMIlAxC8gDESXp9hAD/AGECS0J5TEckPISbY6eClcWQIFWMKziyoYem+m+HArX9uFxK5spBoAGQ9APEBBC3ARowwzgI4BtCwClBxlV8pDmTOBBi0xD0SyQ7pBGOSL1P1RZl8mhCgrN7zfHQpb2wJslYSGx8z6e88/DP6/82/U83tefPFix98EE4COikYQKDf/5XLXtqr6o/0ep0zqkoJLo9k/BGAoxwkIn1MBxBwGwcmptThX+rv23zO98P87qdlZTMvgFq/GRD9Ap4Z2I0mmgmMByvw8G3/FY7c/TcQAQqeryjCDLw5YD394YtUQ0hOwA5xFpZ8ALHJgZFFmQnSDAAG4jJgUzrJpMv3VK2P7zG+z1zFp3kSk09Nya4jA/C11IEBmM07m++sZ7a85qXv/dR/gpOIjoulwI8VXf8Xf33zT/6T53x6gKs9zbO/WwOlE4VreNuU5WF+uAUnlhgiBxDAp4wilGtobtsZ0Fs4xcerhpKTfe7uAviJDU4QLSV51e1Cp9OD2R3nQHduCyzvvTU6A6M5wJiAikuDzQ8a0WbQXmG0/6NjMvZJvgcg/MZ0GbdsYAQU4JmqvxbwAagKH/MCZn4A6RSkryyyEfL6kn2vbEBdu+tazWlzf/s1sPOMH3vJOz92A5xkdFJpAJT+3Tte98z+eHjNTE99X3QSesr8AkL1ZNKfqIyRCWDuKGQh/tJqAHuenmkKgSLkowWgmMMuTQ+SP2sWVCTMiWqs3Vl/D93yFf33ZSBFAl/fTxYBmRYN6+QEDBpAhcIH4NpOtQHX8tR/iSHwPuUSPt0jTU/BDkwcQ5ry487BTOpn2gV3/pHWJEnv24nZxh2tWWHXLOO9CXqbX/WSK37zL+AkpWO+Hfjxop9818f+7u/7u39waRV+fnUwftA4zyyRsaiIKx5FHB3MSAcqA38aWYpnIVJLNXJZFL+prjy8FIikbVWnY6X5rqf+CHQ3bI9PGBhWumfNBCCAoQ42qhdnZhJHi29FcqxyVT31oTmSPG7TDXFIcvvy0pbbOt27ylN+5OlB5q/DNWdXsvlhn37YrlvradERLgzrmVPeu/mpT/2/TmbwGzppNQBK17/tdTs7MLiy21U/2+1UVgNmtqaULiWbNPIPB2oq1Wz6UKj531sKW4wGcOozQfoT0pAkhgBx3zdKf1UOCz4Bk9nsKj509/+CB//PF5LlUAXbn5gCVpPQLRuMiQYQZgFcnFuTxOf/owlAnICKcU8O/NC/tK8Tm8vTYfGd0HBIDAAI8Gl+BMbkXPOUZzJO+gNyHmb5BZhlvFu+BnNbLr3kXZ/4OkwBnbQaAKWXX/GxB/75Fdf9q9WRes7q6vgfzOo6SmufzK68lkDER8iLgiGQ3XD1cNnnlr4EwXmJWh2SUH7BbGAQRaHAl/5vZvu5pD2QOJIsgqi+Ia+v0IdT0IYKa5DoSdKf/IV8WLOGRigjb4+U7O6aaAwIXCsgaWN+IvFji0OTAvj98t2a/Rlbf2EJZ/a89b6Dm541LeA3dFI5Adei//CXX/vHf/7ciz89HiwdwfHoe7WE66ev50ARI1mECiEFqU6DrBo61j6Ap4l0vj7vUlckONr/TPqHSBWrV8FVGDUCSL+2DRUcvP2rmhfVLq0i9ZHZAPsUY/+dAL/sN6gNcQbAFh2Ylv9VCeBl2192KL1P8UkLC30nrwFyrQCBagfr2bKL8VfFJtXhpB7oaVt/61fqTae86KXv+eQff/5v/uaEW833aGgqNABKL19cHPz4+669cgU3PG15FT83HI6B2rh2eASQR+Aq8ivVBTKgQyY/IFcP3Q+Dg/dFUCewK35fJORSUjKbYjvcL7JQFBhMsYq0lyOG9wcSSc+kP5TDivdCA5Ar9ZA8b5LudfmaSn8KfiLh3XSeSvfmN9j5Yyf1x9XGA2rm1F/424ULf+Rli9fcAlNIU+EDmET//pde/ZJuNfxIr1udqSoyZ4hIsELtTP+DXMoVfQP6r6+nAXd8549DWM5LkUw7n/kA2ExAla6LvoCKheEYYTgYwN1fuhLM/jTq/ecLgVx19epA12A2s9TakajS/L8i3v84C0B9AQicOzVvCaYSnPVvw7XvccYMImPLtAAHbqI/+Hxk0w7Qvfrmegawt/lzMLP7spe850N3wxTT1GkAkn7i/df+x/Hsk562MlAfGKyOh1jXfhSphNBwTxhCtNsj+CENXjLOB4fug4f1tFzwE0b1XbQDs5YFuCGPx4IygJ4hEY2FuRWQ/wV7mNrwQGzooDOnFZMEhPa3hpLdj1HCY7LJWd+kMjLwE2nO8oYyMYWnPBC1ByRVhNN4Hdi9um+lf6Wl/ua9am7PT73kqs9eMu3gNzT1GgClz77l1c/oVqNrep36+zts7QDRBsIg9PY2G8Dxh2gB/nJ2+zmw9fznQKc/V66c8Bu6E1B6/uM1SI3AaQJmunM0GMK3vvg+8Av9LeOJuwHDX+W+EFyvaA1A9QC6dB1ASFfyARBp7/umcRkw1YYiAwj9WdAGJmgFmGkGMTck64UfKEv369dqFqG35bO97ulvfOEVVzwALVmaKifgWvT7X/3a/U/9py/+rW2ry3fV4/H3VRXOK6bV+0Gs5MIBJD80TEVwjJb3w5H7boCqOwu9hZ1J5QeIzCQ683xgWPcfAU/0h9wk8PmtpKvhwDf/wt4EpyGrjCo3o1FyAoatwJD0D6r+2zSe+bGPidj2J+aQ9QO9F1oBkniUGkFkvDRdrAXiLIbVzuRinuDtrwA7W+6C/q6fvuT9n7ny3/7lXy5BS5FaDaCBzNqBerB8ZbdT/2y3q6ERVs4hl2x2cNZS0kFUtRMAgsoA0Nt4Kmw5/9kws3GnSxsB6f9VKvMFlEBfWhdgHFxDowF8yWgAI+4DAEg7/Szm9aTa6qq+74Hq+nUAzAfgJb/QAJLnXzCCBM3QGRB6gRrk0izATOL7fo1aFZIaPcBD7QgNUl97QMwy3t6W62ZOP/tfv/DyxYPQUkYtA1iDfu8XX/0DVb16Ta+LTzdLip2w4wMT6ABFKt3oPXg3QpCaHVg49Ttg8znfC51uP1WoxGwBmQosMQBpFhgTYDgYOQZgzgtQRKqH5b0xn2YAK6tQmeMW/VJgu0kongYsFgGpJtCHX94fGWNgTLEs6ZnUZ8BPC3ko8IExAK/u2zP4N39Dze289JL3XPPfoKVGak2ANUibBXe9/PmXmLUDh8fj8bP00Os7+5lSmDcM9yh+wYKKKw6opwjv1WbBTVDNbNSzBX75bmAA9DdqA2toAB4YZofgwdv+EoIJEMoNP4mpmHUAQzfTUKV1AOwoMGub8BkArgWUQM+ZApaYALPpKUPFXOI7zknUfRCSH4jU3zDE/s4P7Drt//6pf/r2d38TWppIrQZwFPSZN7zhrNnq4Ee7Vf1ibRYUHIHxn8xUkAeSMNK3M9vPhm0XPAd6G7Yk1d/EqbIzkDEAINOAQQP44pX6ekCkfwK+cwI6/0S9sqKdgF3tBERhAiA3A0BIf0jPSsPkzr2QjmtLwvaXDADStF76FgNX94FJfHNrNu9s+Tr2tv78S9937d9AS+uilgE8Avq3b3zVJZVa/Wivg2fa2QKp7gM3DyaBn84aKK2Kb3ry98Lms77bbu5JjIA4AycwgDALYBjA3WYWwDAAAGEGAHH2GR/AivUBGBPAmjid4IxEN0fMDgQRwBeSPl5H3Zx78hOom1R9zLopzucDkfTApX5dLSxDb9u7Tjunc9V3veqTQ2hp3dQygEdI1y++ZmF0cPCODgze0O1WfRU94RzUUsplWkIIjBsS9GzVhh2w7cLnwfyOM4A7ASGq+qritr/UACwDGHMNwPwjz/ozDCD5AHInYOMWYGie/mMqP73PNAIk4MZYagiPhgbnKXFRTw32XL7/1lnY9qqLFz9+M7R01NQygEdJZu2AGq18vNMZ/0CnImYBUYO5eeAGf+IXCICFgnXYhj1Pg20XabNgdsEGKaIFSKcgEA1gFBjAaNUzEPBMIzED68ZAygDQrQOooOFEYAp8AChJf5SagJT4uUmQz+sTe19K/gj8Ss/rbzwIM1t/+ZK5J12rTsDTeI8Xap2Aj5LM2oGnv+Alv7V1eekurEfGSbhBSbaaaQQKhDbtmIJdX5BU5cHhvXDo7r+zawdmN+8G+kGPJgZAnYCIY676Q5oJCBoFjozGbCR/7Y8K598CCOo/kcfgam+S/jKcajtU7Q+dE7ccATuEEyCz+d0Z/GYZ744vdDbt/meXvOfa//xrX/lKiX22tE5qNYDHkD67+OYd8PC+KysY/Vy3Yw7zrbgzMAx++0OlJuR+gqhJuMv+lifBzqe9EOa2npJpANQPkDQA7QQcryRAR2ciMQHsNOCy1QCU1gCg684DqAzgKyDMgIA+qi5CA2BqP3jpj+L5AoMIrMSZPqhEd6DbdAxU6tsFPZsegP72N734yuv+rSrrTS0dJbUM4HGg33vjq38A66WPd6rRMzpV+sKxE/AUMMClp9UM6nDr/0noMId3bjrre2D7RT8M3d5sBDZjAOgYwF1/eqX2ASzHF+yAHYAfPhleaxNg2S8FRnEsOELpRGB7uxboSVx2WAdwrz591MzBB647UM2i9u7/+9mFU17//MWr9kJLjxm1DOBxousXf7w/2L/pDR1YeYd26C+ELxxz4ABEO9lfc9saiJwL4FPQmdkEO572Ath8+lMT+Ku0EMgxgCs0A/DfE/RqP5sOtCsBa+8D6HofQEXAn7QEVVL7SyZA1Ay448/rAECdevGJCqCHKPXN57U3361mtr/2kiuu/WNo6TGnlgE8zvS7b77sTDU68pEKBy/pdBVxoAVvNzcFGIOgjAJSNPjc87sugF3PfCHMbNweNQFj/y8f2A/3fvnDtszkzRcmgFfxx9YE6EYToCIagK0n2P/BGRjbmjOApPJzsyZTdoBL+3gf//xpvL1tn8KFs/71SxcXH4aWHhdqGcATRL/z+p9/cVUvfbRT1WfZU3kBADPQ0+sGMenfmMejBm4ftp7/Q7D1vGfZJcUrR47Ag//792H1gW9AcEYG0FcgTADrA1gSswAqqf8q2f2qSepHlV8ygcIjATCnHpP88c+ey3drNbPj0ovf9/GvQEuPK7UM4Akks3Zg9aHlt1f1yhu1k7CvoqdPSn1YO8xTZARml+GG7TBeekh79pdiXDYLUCm3wMdqAHV0AloG0A0+AAp+hOYlwOj/58+QNRtyaS8ZgDuXb8NI9bZ9uFo4Y/HixcV2194TQC0DOAb022+5/GnVysPXdGD1B6tulc+ry7UDBPQq0w7oS0yqPgTAg/fmV/ksgLIawBH929fgTz4AuwpQcclPFwNRWz+1DaHQtEyBKUl+resbqf+31cyuS1/8vo/+NbT0hFG7DuAY0B9+9X/tfcYLX/rb21dW/7EeDZ+lZd+GiOIIasmbVeEOs1j6SxkBz6ui6oCjgZ1dsJzFqwly228CP9EGMo8/a36jvZ/Z+p2FFZg9ZXGw8exXvOzdV079CT1PNLUawDGmz775zTvGgwevqOrVf9XpYMWAXXKXB02AxZMwUH7+3pkX+SIgoQEsH3GzAF0QswC+zDgFSBfb1axepuqLJoewWlwj9gF62/6yM3/qpS969/tvgpaOCbUM4Dihz77+0u8fD5eMWfAMM1vQaPcHcRrcB4BkUw6R/AH8oMR+AEiefggmQM+ZAN4HwM4D8H6A0Bb2NV9CTbwql/zm89obD2F/268M73z4N17+H/4D/0hDS08otQzgOKLrLr20Nz8zeoMaLf1qpxovuPX6IVYyghBGlxB79d0ziHBqQeYMrNymIHcm4JG0EIg5AQP4XT3yq78oTBbWJAC2fDeq+6B9Db1tf1pv2v7qly5+5E5o6ZhTywCOQzJrB3Dl0IdVvfzSbvDSBGkfboTIpSaB1/6TE9CDOB0MinFxUL182J0H0IPEAIIJIFYASqlPqmfXTOrXfvNOtXmfmt35pkved83vqLSzqKVjTC0DOI7pt1/3yothuHR1Vw3s2gGKNAW5sR1V/+hIDI47la0FCN/9q1ccAzAmAGhuE30AwvkX/IbC+uBOv0zlN1J/FtTMtutXF3a9/uWLH7gPWjquqGUAxzld/5rXLKxUS79SDY+8qdOp+6qAPiqllTAF+O4+4Qi0JsDhdCJQrwP8JCDkC488ZVYJJNcEhE9uYcdM7X27M7fttRdfce1/hJaOS2oZwAlCn33jZU8drxy4RpsFP9QJ5/cZwqD+x3+iOUDV/7geIGgC/kiw8fIhtxTY+gA6zAEYZwvlKJGSH4TUV/O19vD/v93eKb/0ove97yFo6billgGcQLS4uFidt/fbP1OPD1zZgeGusLiHLiKKswCIYjYAgB32GRcCHRImANkIBAB0HQE13Mtr+M2Cns23dea3/8LF773mv0BLxz21DOAEpM+++dId46WlK7T4/lfdqq64CeDScPBjXOBTQXIAOifgIf3rNQBrAoBbJhxUf6H7I7AJCO/p1yVXG0ba1v/o7K5t73z+L151BFo6IahlACcw/e4bfuH7cPngNRUuP7OjiL1OZgYUMQuCc69S4VSg2jKAqurYNaGq101HgoVMhJLrwU07OlvfLOjZ8ved+VN+/uL3fPivoKUTiqb+46AnMv30Rz7x35dw4buxu/Utw7p7yHwE0wE0Ketsvs3e0IW+Xk9AjnS2dBcgW75rDh61H9pUm1ZhZs87+6Pt39OC/8SkVgM4Sej617/+jMHKgx+B0ZGXdjrE1vd6ujsSDKMmUHkfwHj5oL7Wqr9ZfdjrcOkv1f/AAEBL/f7Wr85u2HnpC9714RugpROWWgZwktHvXvYLL4LB/qsrXH1yVVEHoJ8FoD4Auw7AMQC7F6Db9bsBgYyMpO7bZbydjYe7/e3vWPme537s5S9/ebuM9wSnlgGchPTbb3nLhmr5gV9RK4feXFWjfhXBTxiB+RoYcA3AOAED+O3qYlOYt/kRZrTU3/5nnfmdr3rxu6+6A1o6KahlACcxmbUDeGT/NWp85Ic6cYWfNwHArfmvNQNQlgE4DSAyAAge/w5gZ/P+anb7Wy658jf+TbuM9+Si1gl4EtNPffiaG2499YLnwOzOnxtBf28ddvQKJ1+w72sSbqb2xjAHOLv7/8OFc5/2kvdf+5kW/CcftRrAlNAfvO1t21ce+tYVMDz0yl41qsKioOgD6CQNAM26gN6Wezobdr7ukis+9gfQ0klLLQOYMvq9y1/zLFjZ9xtVvfTMTjUGXDnkTgSyDMCcDTiPam7HZ+Y3nf6LL1hc3A8tndTUMoApJHPuwObe4HWwemARVvdvNKcS2kVA8ztvr+a3/cLL3n/Nn0FLU0EtA5hi+oO3vGXX6oF7XwY43F3NbfrGru1P+sNnLy6uQEsttdRSSy211FJLLbXUUksttdRSSy211FJLLbXUUksttdRSSy211FJLLbXUUksttdRSSy211FJLLbXUUksttdRSSy211FJLLbXUUkvHmv5/MOvZidgU48YAAAAASUVORK5CYII="
 
-# abacus icon (256x256 PNG)
-ABACUS_ICON = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAACXBIWXMAAAsTAAALEwEAmpwYAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAALvxSURBVHgB7X0HgGRFteipurF70uYESFBMmMUcefp8gmJeVJAkAhIWxUDU55hFVBBMrAqIeVfRZ8BveA/1qc+sYEAkw7Jpdid3uKnqn1Ph9u2entmZnR7YxT6ztff2DafSSXWqbh2ALnShC13oQhe60IUudKELXehCF7rQhS50oQtd6EIXutCFLnShC13oQhe60IUudKELXehCF7rQhS50oQtd6EIXutCFLnShC13oQhe60IUudKELXehCF7rQhS50oQtd6EIXutCFLnShC/cjMHgAg8T6bR4cLInh4X0cFq12omQ5SLFSZmIRB1lmMgs4gIfPOfgwA8YYvaRaRRok9rxwxHdAmNuc62P+m8554bzN86JYSN6m4HzqT2HLMu2zovGjFSebGX97nKL5wXbvzAbvrt7jM5Vhmnda70+Tr72sasIaNaJelgz/AWTS4QkHFqXMqXLujjDmbEs4H/K5u3lisbt5v6MuqcEDGB5QAuCOwTcvcrdMPBWi2lPdJHqyK5JH8zRd7aSxw4UALgVgvwMDm6ZvgF02TPHl2Z4Xr7W9bqTMdO8Ur8Esn58VntZjC146YXLX7832mq1rK05TPmmzLFybFs8unmHTtAVjrFAOk0g6M9QFmIC7KLy9VPLgXuk4fxPM/a10wl/3sPA37MRLR+EBAnu1ACASvfvUUx/BorGXufX6i9y49iQ3qnluGoMjMqSvrIXp9VutNAEwx4YoMDFrx9jtmHwXQkIZF3ScSWhMhwtgZubeFQO1u8ZniWu2eNu9P13bwS6eaz1v8zybNY7Cw0oI0JEbYcCVIADuqSRZABmEqXSD30oIvg9e/7f84y79B2vYi3sd7JUC4G+nn76qpzL8OrdePdavTT7aq1eZm8XABTF8ppmdGB8K/a36WXcyM2pBV57NvRWmI9zpGH1XRD/d79lcn+7aTM/cl0eA2dVpd8939RzsCgf1v2wRBtIIAnvNCAVlGVAK8DxAgVCSKSv/RfDSF1MWfKn3xE9thb0MGOxFcNuprz/Umxx/i1OdeGVYHffRzEdNnyLTp01aXvcbMTrXSUlz/Vt3pOnUKapiljAdAc+WaefKENNdm+nZXR3nysDtGHqm53eFa671nQ7/XOs0U9vbYQkrCgXQ58qDIM15USD4eAxRGPRGKe+5FtzSx/zjrvg97CUwR8q/f+CW0054qjc2PhhOjr4ANT5ziPGJ6UnjW6Y3mh2dODqhBGckrdV5waQrMn8uAOYIs2bgAiHN6vl2RzqRM19veqZ4fZp8i9cAds2wTeemTrvCAbPMn83QRvk7rW1gf7cpy5yZnzXfbxIGYIZCskUQZJALhLwcOFQgq4D3SOD9P0ydgUH/uE/+BvZw2B3yv8/gn6eddlAwsf0if3zklX51krlpXWl8Rg49IBOfKeZWjI9jNWJ4ndyc+ZtMOAI2HXW3/GydDWi933o+G4abLVPOhlF3RfAz5Qm7er/AWK3vzfTubK/xlvK1nre7N9P12bTHjO8wmML8vHCdWyFlBY9sFgaojBoWAtGcjxYBCYKBb8ay79zw9Z++HfZQ2CMFwC3r1gV8cse5wfjIeeHEaAmde+Bkidb4TOaMz5V5j8zuuIbpXTVGY2A0PUHuWQPD0G2qbPq17bXp7tljK5MB7B7j7w7hTvd7tu/P9T2Y4dpc32nXLnMp81zaZbZ4mwQAaz5v/d30LjF/agSBtQ6IBslx2F+TzuIP8uU9H2ZHXB7BHgYM9jD4B47zSxPDV5bGdj7aq00CTuEp55516nHS+ErLe8j4HvK7qzy1lulZO44sMvDu+mutMLDQlnBargHsHsPvilkA5iYwZnOc77O7g7vTbdSpZ3NGN+eK4VnzUQ0ri9fpWSISsggSfVTndAMtAr70L8xZ+np23Cf2KP8Agz0EBgcH+es23frWcHTH+0rjI76DWp8T80uhx/lMMz53iPEDrfXVeJ96SfeUrgxrMLkZounzAgfLghTYHYHQjrhazdq5EPps7u0uQbc7zvbaDO83TVcC5AaXnE0e82mHXdxju9s+re9Z5i/6AtoKAUwObwgESoqoyBpIGsMDiVTM+mLpLr+Q37bPx9jgYNN6sPsL9ggB8Kc3v3nR4tEtV5VGtr8MvfzgJHXgWarn8BkrML6vjuRw0cxves2uHGllfDtMoxPZODQ9l0NRxbc7b1xTvxi0XwMA05zPxNjTXM8XIxaq2BY/wNwZqHicz7W5PFMs167K2/KOXScxZ6ZW5w1HIcvvmT5tujZNmmIJmPcd+l0QAI6jz+nIbL6ptghIEEgSBOgodJZ9i5VWn8iOumgM7mdgcD/DP0477WGlye3fRuZ/uFedAPLwq7G+1FqfTHzS+ByZP3fu5Rq/wBlS5gwvC7M2+e/WZKs+rQXQavMXYDoGnskKAJieyGd7PtM1KDBJ8do0z84F74zvTXdtLnnNpe7T3Zv2vu5HNkUYFARA4XlG97l+Lr/OZYsQgIa2LyYlAExy7ZoBek8YIUApM+vDl9wE7vKXsmMuuwXuR7hfBcAtZ5z6tPLI1u8Eo0PL3GoFTf4IaMmums9XWh81vhvo8T4xvzH3mxjfMLq0DJ+Zc5VYgfn1O7KV4acIgBkY394rMvh0wmAu9zpxbbpnZniu1VxnsGuBoa0RNqd8pjyz2/WUhXPWuDYlL5Zfn7oUuNCHrfcLTK+PRIdSCQAtGIqCAAzjg7EAmLYIrCVAAsBF/xT5qOh+bg1gEigIBOHq3wH+yiPZay7/NdxPcL8JgNvOOOl54fCOb4ej23udWkWP98nZh3+cmJ8YHxOnZZj5WN9qfdZgepOk9bkIZjQ/K1gC0ggCLQFkPhawMBPTtwM5S4ZvMEpxMqL5OdaMD6A94U+5boi8OI893TPmqL93klOHE/a0bRmZObDCewymMmK7e7s+yoLgyY8M2pdRHWWhLHpGqHnK0pwXPxBqGgLIHI9tF5aX21gK9qjWkpj7XJpzKwiMMLAGaZMAYEYIuCZ5xiIgRFnDGhBEtD0T4K56GTv6E/8D9wPcLwLgzjPf8G/e8PbvhiPby4r5E+3sU8yPEpO7IR4Do/VpPMWbGF/xb8aUFFXHXOszc8TrQksFOkpiemrsogAAKAiBRjO0igJZeEIWrxaJqS3zmx+GoBr3WhmGqiXzx+3vRrFkE+4Gs7CGI664tqHpNz0oAKYwicXLpuDXx9ZyM2hePcmm3lPlYvklCe3r2qS52wmvNnVuPjYYtwFFpm6tozR9R8wrCs9bC6EgHExd1CIys4KUGedeY72JzJMSAk6LIHCsAGgjBDxP3wfRLARkqQohWgJH3fdC4D4XAHesO+2pwfCWHwcj23qdqmV+o/lpWs8yP439QS/kUVN81owvavu0YQXIzDC5IKZP8XeGcoA0P7Gpg4/QSi1XfemlksFNvSaL3LdLaCWyqUfLpOrcMoc9ZzB1KUITcRevFYmdNfKelnHMj5byNGlTaLEmWt9vOrbgKloDxdV4tkytOACmL0s7oTOTUAKYRhi0uycLzWGfkc1tYAW4EQyMFpYxpEOW6iNHJzSdK/2jrVI1/ew4RjCAuUcCQGhBQEJAWQGYXKatAZeb4YARAJ5vnIRmSKCGA0TIpQnwVrzgvh4O3KcC4LazTj24NLbjl8GOrcudykSz2a+Yv2ScfR7Ydfw5x9hFV4rxpT5XlgBq+IwYPtFHvJiBh8ZAGTK3D7IQU6mcZK5/p+R8EzjeTumwUcQ9gTMzERJywlQPCiVLmkzHdhM1vOX7fvOCMP9ztUYRoGWHALV+QbR8sr/LeSD7LFZKMGqEXX3IP/XdttcFzIxqNs8Un22BpldnW+QZnxOamQqt3HjN3tN3dN624WxJRLv89AfADDVDloUSRB/y8CIpk6VISPu5Mt7fkVXPgUnk6Ul8sIZ8m2rrABmYqwVoJBBYQxA4slkQWGuAhAD5AjxXCwA/0EJBcR8RcowHmi4sD0GwzzPYqy6+zxyD95kAuO3ccweCHXf+X2loyyMcnOrjcd2s5S8yf0Pzs3xAyrTXlDR8aphfmf5CMb3IYqPtHch4L6TBYkj6lyVpT+8vZCn4cVwOf1FeVvrjqo+8vQJd6MIs4W+Dg73lseyJXhQ9k4vo+U5WeYYvhz2XjSJfV5FWkXaVANArUbkRBLkQcKExFHDNVCExvbUClBDwjOAjS8AIAdZ/E0QHPp2dOHif7DlwnwgAWuRz0tbbvxFu2/Ryb2IUeFQDlmXad4LannulxphfLeXVpjkpPaWWifkTqc18q/FxxoAEAGn71F0CSd9KSBct/V3SW/pctde79mHrB3dAF7rQIbj5rYPLwqjyCj+tvMFLx57ksx3Iz2NoFSRGAHjaMlAMjy84oiEEcgFgEgkASkE4VQikeHSWfhv+sc8r74vFQveJALhz3RveWt626SPe6E7gdZSeaaLm+XPmz6f69Dr+fMwvtMaXqTAWQIrDJdL4ddrLSTP+on1ktHTZD5O+3vc/6MrBXzKYfma/C13oALDb1739mSgIzg/T0ReGbDvyPQkCHMq6vhEEXH0cmFsCbsESUMnVloBPQqBsZggINQ4HMhICJDxWvp29+hMfgQWGBRcAd7z59MeFI1t+HQxtDZzqpHL6qa/51FRfyTj9/HxZr2Z+M+bHhiDmJxNfotAQaQ1N/gxN/R6I+/eDaNnqX2fL+962z2fe+0voQhfuY7jrzDc/AwXBR0pi51N9vh2FQEUNCzhqdea6yj+grQDQQsBlBaegowUADQWCkhYK1jGYRZj8CEqrn8pefvGfYQFhQQUAjqP8Rff+8zfh9k2PcyfGgcW0xDdTX/EpxlcCgJjfbTA/FJg/yQzzR+gsReZHwZD4yyFaecBYvHzZ21c/KPj8nrKmugv/miBxeHv39q0nlbPxi0ts+4DHh1EISE3XShAwIwDAmP9MMz8NCcgpqIRAaIYDZnaAnF1I8yD7boCB8lMW8itCFxYQ+obvebs/tuNxTrUKjMx+Yb7hV2v6A+1JNWv6c4+/GvOT5s+UU0SmdRQENTWNF/ftC/XVB/yutrTnNft/+oO3Qxe6cD+DUUCfvfPMM3+SZt7XemTwZD/bhpciNbXI0UelprMVCND7UmTm5RTMXIReNszMEIHGDzR8SCcfCxPlt+OT74MFgjnMK80N7jjvzQf446MXuJVJYLS+P9PbdhHT51N9Znlv03RfRlN8xPw4rZdWVMq4D9HSg6B6wIOvrDxy6bP3//SHuszfhT0KDvjEJ+6o19hzxtnyz9ZhDeqwAGk31s5qcuxl2o+lxvdqGluYc7yXJJgifU5LhM2uxGq9QDZ+vvzWeQfAAsGCWQDo7f+wNzZc5pH+so/G/YrZSftz/R1/g/mt9hd6KkQxfxVTDZk/hPrSA2W0777nrfz8pRd3nXxd2FPhwKuvruPhlHvXnXCLzOCiktjGAGmYK5L1G0NcuxCKEq1kJcZXVkBkvhtg2iKgL19FVIZ4/CJ88tWwALAgFsAdb3vTU7zx0Vc5dW36k0ZXi30YMj5vXehj9uojyWfN/qSqBECGwiJedoCI9llzOjL/h7vM34W9Afa5/OqLJ9yB02uwHGeuAz1zRWP63AqQjXNlCWRaCOBzyhpQy9iZtgRoAZGYeJX8xvlPgQWABREAXnX0XWgBMBajxz9N9ZSf0f56+y7zcY/dpFNN+WV6SSRKTJlVQaAJFC/eF2prVp+38srLPgNd6MJeBA+67IufmXQGzotgGeo2D2k6VoJAD28Lw4HMJCUAjBAggUAKEWxcgpSDGH0XLAB0XADced66x3uTYy9Ui31SvXOv3sPPU0n5AHLmbzX9aXFPRS3nTfpWQHXV6s+uvPKTF0MXurAXwn6Xffnicd73uYQtQRLnSgjQIjal7CzjZ3pla0MIJFoIKCsANI/QcCCbfKH8r3c+HjoMHRcA/mTlzd7EGGNoyljHn/L0O41xPxS1P4EwH0XQuB+PabgI6ivX/LbKk7OgC13Ye0Gm4+V1k2zgdykbUF+mqqXraqibGcVXTJkZDiRaIQrzJSdZASxlUN/5ZugwdFQA3H7Bm1by6sRR5PjT2t9M+zFXjf8bpj8raP+G6Q+iDplbgvqy1RPVxcuOMU6VLnRhrwWi4cQpH111Fk1kUNbL2EVSGAqYpKwAqRnfDgWsFQDmwyJZe7X8r/evhA5CRwWAX4teh+Z/qLS/2slX6qW9dttuNb1h9k+zn30q7U8Okppe/9O3DOIlS8/f71OX3Apd6MIDAPa75Eu3TrLSBTFHK0A6eihgPl1XTC6MABB2CtwIgcz6AoxDUNYCiHe8DjoIHRMANHvpRtXjea2mTX/l+QfF9Nyu8zff3+cBO6T5vjetqyFA5vei9l/x6+UP2vfT0IUuPIDgt5vg01XW+xv6YlWqr1kTtcq1aRhgBUEuBJJmK4BWCYrK8bKDK3g7JgDuPv+tj3Aq449Sa/0z+7G+cf7ZLb2Ke6nrbX3Mumd0/uH9uH+ZjJcuPru7vLcLDzQ4auPGrM5Lb6mzPuR/V29aY4e/rVZALhTSxnUwawNE7VFw7TseDh2CjgkAJ6q8nFcrjBkvJxONvfx1MisfWNH8z7T5r7R/GZLFS7+76vJP328bJHahCwsJB3zsa7+qO+Xv0cdsDStAtBEA1gowloDd8Vqtlo0Yzgi8DDoEHRMAbr12BI8ibfoLE5qbFYJ3sMLYX/G/2RyRtD/+jPtwqmTZkg9BF7rwAIbILX0owmEAWQHE9Hqvyja+gHyq0FgBsrA9XFo7AjoEHREAQxed08ei2qE8H7PowjIbxst6/O2HDzaEUpYo7S+8ANLFy3639NJP/h90oQsPYDjgoq/9KnF6fi94qDeuVUOBghVgNq5VqegolMXtaaMnyf+6qA86AB35FiAeSZ4W1Kq+1v4F7z8rTvsVzX+hd/OkHVDwSPv2yd7+q2CBgJwmf1876NUWg/vEkUdGbONRGXQYfn/KKd5qWONtgc3JoevXJ9BhuP65g27fQ8EvjUD6yI2DSaeXRW9Yu9Z52r5P8+vpHeIhl10WM8Y6in9PB6KRW9et80P3QL7vpn3jhaARC3XuX1Xi5UOddFJZAExZATTN5xhBwJt9AXZpsIWsGoAYeRqe/QjmCR3xJt775lMGS5tuf5c7OqK2++JJqub9Hdrtx9Pf/OebIpIFQPOgSRWgslPNd9ZWPyRJH/WUNf2DndvG6+ZTTlkmdo6/OqiLw93UeYKb+ss8FnLg5cTxS3fIIPhV1le6dnnlgB/uTmff8La39XibNr/Cq8ojvYQ9yU3dNa4IXdcppcwv38vC4DfQU/5OZYn77f0ueUsN5ghXoEB5arV6eDiZvtyP+NMQ//6eDDyHlwS26Xbml/6QlYMf+CuCDQOXvGUY5ghE8L87/vhnuRPRWi+CZ7mJd7Av/ICzssR+GwE/uMEplX8Ei/2v7fOpt94DD0D4y4kn7icr8WvDavoCP3Me46X+YhcC1FmlOnP9W1hY+oXoCzYsv/r8XzDonEC89W3Hrlgkt9/bm9zrOjwC7gdqExFAS1jvFOSaDUPsrkGhPld7BZilwv6+g+zVl70b5gkdEQBbzzzhW+GmO1/mTIwBq9PXf0J99ON4ZUyh2h1FB0fw9CwAOf7qEwDVYbQFHKgd9Oif9V79tedCB+BPJ5ywyB2dfEc4VjktGE3LQd0DLwvAlSGaOwE4XAccYQEK0b4SJEvKt6T9/jsGvvCWjbPRqn9bu9ZPufumYLx6TjASLwurHLzYB08EGj8L1F4HQPh7Q8gWlbelA+EH+x8y/kmc3Uh3hZ8Y84bXHnOMN155TzgaHRhWOPixroMDOg+FH4lGlkMcOpUnRH/4ib7F4QfYp86YhFnA/x199PP5RP2icLT+hBK+EcS2jTAx2p4NExKeKGH7DASJWFT6orOk58IVnzpjKzwAAK211c6O0fcHY7XXlSZSL4xc8FMfXNWHvupDRh+tYRtkPQFkS0p/SBf55y76wrn/DR2CbW9/yc/74k3PcuUECgAXFSXmZ/cKVBuHOlphBoHZNMTX24opvxkKAWf5f7HXfnbezsDOCIA3HnNLeO9dD3EmsTIRhfeSSKShsgBIAGjt7+ltj0gAZDjvXxtDAYD2bNAHtYc94YL+T372gzBPuOHYY5/ibt/x9XDbxP7hJDJmGoAHJUDNj22HAoBR59JnmSSIKEiDD7LkgViMPohVPd+oLGEnLb38rPFp8b/hDQfykZENwfbxQ8OxDPy6i3mEiI0Ip4EfWdZ8z43H0INsIIB4ZelXsKLv1eXLT940Hf7/Pe20xX07dn4h3DF2ZDiSgF8jwsQ6KMY0+DE3TgSqNo3wQAbIqH0+RMtLt8GKnrU9nzntT9PhJ+E1xpyP+TtHTy+PxCxA4RUo/KFifI8FOX6HeaoOAgkv6cG0orQjWlw6cfVVZ34P9mL4v2OPPTIYHr2qZ2d1aVhBvkp88AXRiW4D7FFsA19ZsAA6KpUMXMgWezJeVf7EnWn1bYdsHIxhnrDp3Fe9Y1F073u9bAeSIhqm2M5cMX9ghICjk7IAzNZhJADslmF8yW3s6KseAvOEeTsBt178th50/h3AUOsz67zQC4Ab439eWP7LdDAGHREFD6VeyHr7572n35+PPvo/3M1b/6d09879g1EBbuopbU+NqkwsNKEoMd+aWHo4wmIGzjAy8721V/XslP8zdvbnlrTFf/LJhzgjw78qbR05NByNwa1xcDJkSPrAiTaDNPhJmkPgNIY7OFp3sDylzdHTnW2VX42fsf6h7fDf8MY3rhjYueNn5e3DR4bDEXhVBm7m6b0TCL/n6eSTZnJ0HWh1ZYr4JySUtsYP5ttqP59446ef2w7/HSecEI5z59ulHTvP6BmusxBHYD62EQkVF/F7Llls+Bvby8Oyu5g8FNxBxqGnKqF3a7KsvCP61o6TP30C7KXwq2OPPSnYMfyt8tDEUn9CoOWG9RTUh3ozT8dp9KU2xbXVyhIH3B2Sle6qr3sw7/mWHLwqhHlCwkv/myJ9SrUHpmiTis5AaXxmBUehSPaX13+yF+YJ8xYAyXh2EI9jl7V6KnOHnzEyWMtGCCaggyj3ZXLx8htgHvDnk056vDc09M1g83DZrTG954CnzVjaqZWYnSFBM8ucqPWhx6SSDuDI6gz87ckT/eH6t+TaQb+In0xGb3z0B+GO0VXeRApO7KitnvTmjza5DeGCWh/KBn/ZmHMoaPyhZD9/NPrB+FuvWFbET8yJw6fvlIZHH+1PJoifKStCxUtwCvhVHRyNv4RF7DV5+FoQBMNZLx+Ovz3x1s88soifhhVDWfL58ujI4aWJGHycSnYEEbzdxVbjdzApcxQ1HqN2MW1E7eYJBr1jwg12Jp8dPvPzh8NeBj8//vgX+WOjV4RjVcdDA9TJaAdqU3+7QY1LQtb4qlQbm/bt1WY5q2Abb4qPiG8d/dy8V+MFS29IeCgoQpUKXWdSzvQE6jN50RACxSi4GY5bxocOgnnCvAWAn4lVatMPs1hBB3Blep+/fPcTOwVYWAWocudogvfcs+S883Y7Tvo9Z59d8nYMfdXfurPHqYMKJa6YnxifViHa/QdsxFYkbt2xeL8PzSo0z6HPMBEynrczfvb40uXvsPipOqVq5fPBzpH93IkEHZxUK7fBOI6NEIPJ4g8L+Pvp6OvrqE29nclBzljStNR5ksn3BSOjT3EnYxxCIfNL/e2E0vCF8iv8VsBYwqQ8CD8KGoae5HAkHciG4q/IwYYQ+9NJJ50Yjo4dHUxE4Cr8dnm2qz7PdmiHZpMHR2HFlADzDX6TymQWO1CelK4/llw98bZrVsBeAr9+05tWlmrVq4KJquNEqHOxHzgN1Wwb50c+PY0sCnWboGXmbY6OSU6+7HiYBxw4eOloxv1NKkSd4vmC5icohrGWBQvAnpMvIK6vgnnCvAVAWk+WqOm/PA43gI25V1D30LQVkgKUeESEgX8zzANGdm5/k7tt6GG8mmmmNGab2k+NBIxdgEQMpCS7ZpacsBWTBrqzkQmckQycrdW3bz3z8gMJP3qKXxIM7TzcHcbZjRpObyrm9Mwnmua7BhsSmjR9YLS+ZZ5+g783UM9wND1hc/VVO874+PMI/42nnPLwYMfIWe7OCnA0tbngegGVCZJi8SshYPEXiZNw9xn8eJ/K6G2uPXbo3oFTCT9aLwPuzuEP+jsmwK2iczYl60Izvl2l2cCP14rE32vw94f6iNcp7FYwIVaISjJvD/R9BuOj73ErleVOTMzP8gVqoOJQmOCzTTRS7ENT/wFMi0rK8mJjyLY70w/Jwcv6YT7AvX+oOJVNQWstg0PzMCC3DOy58gUsgXnC/BcCObKvaQGDhVzzAzRFl2VmNZPa8ERteXQn7CaQ6eyOjb+Zj1WVVlYOFMv8ZrsxZvZXy7UzpbLWaNBjGIeOylTHd5CBnNsqodgyor699u7edo57F05vjqOPQzhaWxjhAoVPmwm/YlCrPS1+mwfhJ/M9keDeVYPsrpHzVPNt2vo277btnoNOPx5TY1nmtx9NWQFmAkpYBlX4Teo1+SkrA0l6cwTJXaNvo7UJbMvQ673btq1wd6J1UQOl/ZkRXnaFpjo6pg5WwOT4A4PfXCf/AAoRnP48YXJww7w10ELDL848c41Tqx3vxNi+tAmvCjvnatoDW3/9tZ0WsG5jiGX7sGyEoU1kOQ3FK6N7nRNhHpByfqcaAoD9NkZCY9mvgaIgaHpGRci9/30AkKQlKGp/Bcb8N+dQHArwwtCJvMyOOwS7CVWPv4ANj65kiVDjN+3Y00wj7V6DUGQgKwQ8nUIzZqdrvtHgONZ1dgiQN+98zR9e9PJHOLcNPY2PooWjTH+nsJNRYT9DawVQ/hafzSMwY8rA3KMlUqhB4B+jh/36lace7Ny2/VXOzgR9EKAXgIBTwF/4fsItEKjF7Rv86miGB9jGHB18zk3jDyptDp/N79x+rLutrq6xTJe1uB8jM/jVEMMzOPyW8uf5mP3ssfhuJQuz0dpa2MPBTaK1PKoHPDEfp+nInZD3nQlD12TF5X1Y6E819DLCl37jUICPJ8fCPACHVNsV8+d8X+CjVkFQZH714bzaTagM84R5CwAupc/s+N9caz3qEzbVbaKirDq7HbRTVir/zio1zYDIfNJxlMkvobHNuLSOSGVtOOZotlniBb9EIfY9Qy3K766tSG/a+lZvpErRohuEw4tDm8Y7uZBxCgLHWgm570O1GFCYerY9ddgNt5/rbpsY4IRfcLN6sug81cTJLLEWy29T8XnTzkxoIVP5yz3HsHtHH6vKL3WYdZYHsreBWBplZDlup7n8uRVn8iIhSRNhtewFsKdDFP87j1GAK4VpmL2dEOeNYUDeBpZGipasivajFQUOOx8vB7+yDHYTkkxUNctbv1gxFaD1sjpXQmDeK3nnvxSYSacxrC+uVy4eoZln7HVs8Pp+B67bdO13XpMSXWHNUilMYCA8oueTgnZneB7HMSSUanWoVSpQHxuH6q03H9hPO6yiJSHtNweyIdW1dG0WCGCDj1BZUyNN1dbM0uzIItUtlnCItldfp/m2gFcYhrb4gTcnafIhgmNmSyeKbpyIxp7weN9BbRxvGz+WgqVITzOnzUPaMkvNcLKIVxWZNXaQATNeTA1+tYRUP1PZOXZMmKWclYNCGRsdIaUhbskL7WXLT+1qnU9cl7uYdDM+78/f/d6fyXNObU/CV1gLj+Uzwpo0AHKrsEHeLYSeX5VqCawwNKJyEtKQlzTKEGkDp5KJRtRWW+iITpMU4iiCGGmkjjRSm5iE+OabHhZQhCky/2WxDXSbUp2lEYp5/YWhEbsU1/ZhKhuRxqndJjN+07L4l7/d8PWacjLnNaKtv6Ry7GUUzzKjmJYZZEkMKZYvxfJFlUnYNH7n8gHDM0XeZq2aH2SLc1DaocH9LwCYtiUbv4tnbMrT5midhdhoA0vXOP0Da9Q3AXSJjvQtgRIAeK5Cg+HUGz6bYecIlObEIDEyVDZeBeVEsdqq4GWUJj/bqdJ2qt2WmWLHc9ObtD4vFjqlMm9rt54FEJpymz5gFp80+GUrfmjglwY/CRjCTWYohTwTesrHqQpfhlo752WXDU0ui+UnoSC0dld1IFwi088S09vyR0JHUdbl99V6liJjW6KXBSFgCTwz5bc71oLBT5WlrxsoTxJkmRn11DKcLOSP9VyzlJU7RsYys3SdgSXvIoEXycDKCFm40MQS0rxrmN46zEgxUDuSEMiIuXBcL2UEDg0HIVGf2ceVCOR4BR3musx5GxSsKzCBaLUTnjfXn0kjAEALwdgIWaktPqJVXzgPLZd69fQh4w1lrQSUUOUUmRYEJACSKIY4QLrlASTVHSrqtSqGnEYcFnVqLh1M4vO34OctAERm1VIbaHvZqgTdsWohUFBCnpGK8UV+1AIgpc5F7w2FARfohFPbBwYJJE6gJLdU+6YDWDNeN34LwVufiWJ0qTWzZR5pOr2O1+uZInJFWNLKcqm2NdeIDS7WzLD5zAxpmSJ+1T1cC4DI4I+l/hK60EakxZgZ1umpVMP4OX4jXKygsvgdQxWiiF9bTooAQeZlA+OnzemniF+YRGYYlZ/GJPRhSprph6mNUpMH3VffrnCVr0AJI2lpsvrew+z6ZPpBDaegmaEZGB6UTdQwlXCsZmydFlNz4qJxpKTGUKkuM1pWktrYTVRQGdWfqW6jXOiRtm9qA64ZPCu2sfkWn5v6KysOlIBVQpAsHWR6xy+BE/ZoH5SygsAIblMHKZQys1GAhB9jM4WI1gc5tghkreAEnAkK1k+DcCSDecL8hwA0byXn8kJuvihKEEg8GRIREWtGzcakIuCMzCgkdIFahcxK9aEUxVx3sBewASluQAZmmq9ZZxRzaj7J84VmglKSyHSYYX4qj7DFNUzT+jlIzktFO7c12Tzsd96kuYygs3+NMmp9KNtUwhaZtdal2J7CasdG+bVMkbnykMBamI415dNcuZY2ylemaWtBCQ3a4w7JSKoYeIWhBGtu9vzYMjTQxZ9KQLIgIaQ2vYww0DRC5rXMpaYeKmkXBX2Hkqr1IFQmicJXpSZTu7mdpbUap/SfbN+n9kXlN2gEu5HFna5Ve2vlQXTMFT2nahbGCXAilnwoXk+hQSBXirvkatuActeP7grmLwDE9LeaK8Oa71Bl0byP6gnUq4nS+nqIhcwvrAUg1RAgQ+mZotRNUPrGNTzWaczn5GM1OSWvVuJjhfKwRnla1ZFdkVUgEzkNzmLbF68zvRJqxkYRRcYvvM9aNIHNRwJAW6nQJqPiTJJhl0bZppyxtvUr2JvQrvxqPE59g8OxKprZgr4dID+G4yrLoGj+W/uwfT6tckfmdch/ywLTFlbMqSS0eU0h42mMrWgELbkYUxoR47tG67cBBgXcBeG0K64qvEBDrayeQlRLzcSCdUJbN5MR9GY4kNHzaJEkaEnRpr+0GlEaR7W0jCRhliBnYr1Zw/wFQAu0Lz+b+hA1CjpnkokI6hOxHtIq818fhR1DqfFTpsZQaZSiE1DSBsJo5nFlrsl808SW/FusKjldYYsqtaht1W/WzNxNyBoaqikD2aauOX5ZYMx8MqeRtaFC1h5BM2o2pVQ5HspFSMs8rClPMPdlAXfzPcu60zC/zQeldYYCuT5JO9yiWeszZS5LbocART+ANMOmqQzfVhjkJoIs1KshAPSp8aUYP5HA8pAASJG5khqF5MN8Y1criSmdz2ZgNNZegMuWNqGOS6j+6JQex2lW9INITlqeN/dxQVipchLNR5jQ/+/HduWf6Qc2He20KSNQoN15uwAWIjgoa3PaogNU+YVy7kWjE1DrqeYObD3+txazkfDUeAlaCTGO/VEIpBUcLKCU184d0VAzUCCbJuZv05JFGisoVFlgUqWpWfOjjdetv8H8LhgWbZtDFkfDtkRsSlFsaWWb4jZLt9YHiuwNhdRwaray9ZwtyLy9pPIrZEjIdST+NKGPlWS+nDYzPpK8W4yl1U42FuvdtjpQtAqKAkAqGlL+DmMFZMhcWayFQFZHzKkLDacq5G0+VSDC1IJNqXtL4clKxXzqY3WYHKlg1VMUAMYCMhk2hpANh6XAmYoUZ7PSOgrOKGmmzekYfpoCCjF/G6AzAqCpbQrdOW2FDGmik6U6NAYTMK7G8+TTEEbrZlrgq0pqU09qYZDg/QjHm1HZ7Cymx4CyqZNbz9nMZW7R4k3M2WRgyLYEOy0hNVcatNddFrSyYVaTfzsFkDMpa1dw8zsvgMzNf+Pfg5wRpS17YXYBimVnM5SfTamo6g/UupVhvOsl6ARjyhmnTGDWWH9h+U/mFWzYGDnqXAAbkZCPhVk+7odGFY3+aMwISGET7bCFdJSgTykK0cRGLelqS9FmlovHJoneTgQBTH8RjFNWQHUkhnGfvi4S+RAACtaP9ckodWK2ACMhICl2RpS1tPE0wmAaOb1nWABTysDank4lIqmcq4uj7R+6t/Kor9En9BBrR6s9pyN9islsNjTOotmucgJ+eQmEm7LrYDhbQ17ddg661mML6bUFaTzY2nnGisaFJsg2OIv5tPtlXm4qgWXuqYzXPg8J09GiBGjxRzQER8NKKdbDknth9bn53YqtfR5Kq2GD87KTOumip0rmpeq2mljxVB/6+EddyJ2UOZkr1Qf0tl8NNP20ny7Fzbk2LvqaHmL9m0GbchKR+Im+QZ92hFWXldlvWELBKXT5AJpNtaJVoH6zFkHcZFJaGpbaREWcqxP2ziHo/a6ePvSbXrPg5HWgM09znUhgdTD0Ghaz8xq423H6DFbaHmEBTClDW/tpyqkSijiNNVCK7j3yoiN363PgPx3xotjOb0113DWmBHMmUA8UvVISWr1UMteiloHslBY00U5jSgka+bRyq83DrhGQUGA6/b7yA8hmOdrK8Lbcth6sqULN5/Y9USBwyRr1aBg7rCWvwpDGLpSyFbILjxThG+1LK5YDLvcbvvPGQ9ef2vE9EDsBG9au9Z3QkWySvPPN2lb3w9Q+tP1UuAj5zIcs0DZZVOjzWOrD3a947+7R710XHPdsWp6tZlOgnZCXMyPYY3wAcg7Xc3XKGsstdzdbBjVmNxiVReYwc/OWacwcPe1BypnQmzCSyarCLQkzx40mWiR0NCbQDERjWRqKOLQAR+pJLigwk2JcaaaZOJgoZ0KvG3DsHDIzC4Gkml9WQZBFY82NHfYo1PjHjfkszfy/Lj/Ld1EnRxOjN6nMagbUzFHT3HcklFkuTP3VwikSMkLjtmslWF5+rhYEE35h8AvS7PRWVlxnYNqI2Dw2praaloXk9pHFnXBGLxRk2MUJ81RwSjV3L+16AFlYCShMH1L/cammEhWNEGkqgjJrOdQ6CVpspbfspmcFF3Pe7zEHu3bNiuYpyt60v2xz3Qjj+cL8RcisoFCDojEwXwnG2XZF1Jlsmudt0sqKuE1KyDmEz+I0ItQoZTrhVA4JAHUfcZFDktwzEWMTmWY3s7q2wfhCNpjUDO2UgMmIQQh3vYBf5SHUvSyV+WLEiDuTqdRCRs0UM2sRsELipvzKalS7QQlatFRrxa8dYAo/FhBHmZA4vIIzz3kEamEsGiUU8vJzE7qaafxUB9tGVawUTXEZ/FQHWrlGjlr6rkg4cuioBdw9d75A0XiQRoZobb90ndxBZ1dCNrUD1V/1oXbuNdo2Ne3QoBO1EIjagCYZHLbbH7PlMKPl3+6mNJfnLwE6KgDaGwItY5uiBTBfcJwbpe8oL6sSAkLmloA1yRUTKeJmmkHrFIcUO7mCxEypqlOGBJ5i59PiN2L+Ojp1+Jq+r8WoQtKCFS9y7VlgUkU8TDGPqFPcBiSOIv4a4Rcav2HOCDW53Lf/qxESpl2ApgWATYU8hC6/ZU4qf4Z4VR2q6FnGlFr8ZBxgxdHHDM6KRV+LAhf5minlpa0Oi58rCyEz+DMqP+URafwp4qY8pMlDIgNIEjCo+RLCrxbdsXnt5HRfACqAv0izGQwtGbfDIdWPtLzaCkDBG22sppqp7thilKpZsyBM6DsFbIcSE3HA/wrzAdbCH40xWuvJgkBHBcCUsue/2ldCGo23uyBLwY+zcgklO3mk9QcX6gMiYVeJssa5ikNS0HKkjVWiRUaoLWmncqEZJ3aQQfcJtiUHLvpYvS+UNJuUGitQaT/FmNrEzpBwMmKgjGnzvoA7LaSE8kAhFUtifgm15U4GD9//otqS3tEYPdW0romEACXLlELh1+cp5UN5JMWyG/yIO021cElM+ev92LkPXfOVaGnPnxPEn6D5m6IGVHkovJALl8wm00ZpE37dPmRZJKnQnzNgW0Q+/vbhx7CHg+DsR0JZAFytUbBCVgkBqYdBqn1zK8u0caTrL83QTX/LoRN58xOc9kxK7h/3+eipHdjKnk1ViEULgE3zTgfgPhoCtAM9Fp1PAcaD8o/T/p6tInDVXLBM6cMhM21oBUFmmDNjTeHWUpMU46ea+dG6hihAx8JSZJQH93/tyJ9+9x/Rfn2/ihd7kIZMCwHIPxpsxHAs5JEaRkpNcFdinpiYRwkXxI9O4PoAg+jBff9zxA/W3xat7t0YLwkgKeNglQQBaOZMjXbOWhk008TaVPbMCBeyLAh/H4P6Q3ru8sWyn8drFl9TXxZC0kP4GQ6ImfmgTw89GrhN+U0bFfGTcFF5EC9gG9Qpj15ej0riG7CHQ5r4GxLuRiQEBAkBh+XfPQloCHI6pkrQavrQwrAhXOlcpPRlaoZtKKBeRjrp4dfAfMH6fGZ6pq0vTXbECXgfCIBppjfsd+bzgMOuvrouSj2XpH0l7FypLQBaEJKZZcR5anwtm+SJiFqo80gxv2GefgaV/YN6vLLvUsoj3WfRh6J9+iAZwOktjykGJebRx8bHhSpRHooZ9Xc0iukzzfwRaX4sY9TLobKfJ9N9+lQcRLFy4KP1/QaSZLEPSUCaGjSTIv5ENj5Mayq7zUMYxrfCC62ICAmzusqFZN/yxYf9dDD19l98Vf1Bi7YnS1EIlByF35Zd1aO1/DYPqYcSNtFmRWT2R2gN1UoM4l7nykP2gjgBh228emvK/KszRw8BBGdmOCebhLkWhDZStxlKCd3GKV6kz9MT+iwd26IeSKgudbaGQf/VMB/QXuXChWnG++2AHu3ANODCCoDcw9n2Rkdg2aL+y+LF/TelFMCBdsSi1VaZltQZ+gbSQqKxa2I7kpiGEvZ0hPfqpNlCHO4tcaG+3L/osKvPv5Pw/8e3v/H9aFHv95L+ENKSC7S6NGZaG6ovZAG0w41wgyYQZeZTynSqY351fKfmI3MucqC+Itj4nC+e/z+E//DvbLw56itfGiv8WkvHTPshUtDHxOBPJeTnqvxZIZHfgjaq6eNQXen/aSjLPkv4j/jyl8eT/t5z6/0liMsN/CoZ3JbJ7Xmeh/ElRGTyU/ugAKiihVRZxLd5YWkQ9hKIA/Gu2Am2Z66LNIKMjkOkFFOGmjxl0tCG0HW3dGKuxYpeqC3wHPu3jkOfymIOEwPOecuvPGkC5gE8n4m0StLMBjTBHNcGzLUMsACQr2afya4xK6bmK8MORCsgDkpHR4sHJtMeDzLU4ik68OgD4gTnzhLQKcYrMUtVJ0aUiClRUNSI+bGgNdTu1T4XKsv9n5b6F72/kIWMvJ6Ta2Hp7jjwIPa4MoNjJB6VJAkQg5/OFX48Cp3qBn8dTc8qmuETy/1bq+Xs9GIdNi8u/WctKP0aHXZoZZAVIJWQiWxZDf4Iy0+460SIdMTrSrgg/iq+UymhdbHMG037gmOOKgSveMm1X/lCLQy/VPd9iNFpGjlSlT1iwrQHlVvjjsx1lbj2V9QdI1xCDpOL3bTe7x1/8FWvn7/3+z6C5331q9tQAJxQZ2GaOkgjOBRQQoCTOZ9ge6d4bNCH7luZn1Nb1LEdqj5o5l8VXPOwr75t3ua/0Ntn6x925WDu4Wcz8LlhrD1iCNB2JaBs+d0OdEU7IYGe8e2Nf856+l9RHxioRGU0dX1kUnLS8AQ7MUbCjpFJEjwm2JGYsKMp1VgGNaXVUGsOBFBZVfptutx/RevClhehGVnr7X1hJQy3RL62AsiLr5lQ465hqjLCb/AicVWRcKr4XBU1f6XfhcmVwd0Ti/gRz7/mgp1F/CeiEMtKwUtqQfnGyPPQzMYxPBEdlRMn5+tY/ppKmI/Jg+7XQOOvEHP2kPAKx+tLgpc+54tn39Ta2MPj3snVoPT9mucDzTwoi4fKSeXGOlRVHWKFn8peQyFKqUq40XSeROE0vthPq0u8k574xdN+CHsZPPfbV/4g8kon151SFjMUhJwEuTBMnygaUUm1b2aSZvwaDXvQB1RZ4sH4mvC7fKV3CnTKPW+3WiuuMlPQfuq8CfaIdQC7LERrOxlzh7HOTAUaeOp3vvTjyZ7yv1X7+++ooxCIUNMpZxURM9PEXeGY8LyCDFRBDVBFbVtBq2FyeQ9Mrg6/nvYHz3/Wp08faYf/xV///E2i3P/0ek/vb+thiLg5MgoyCBJQlXAjE1XwOMlihX+SGBOtikrZh8mlZZhc0/uL6oD79Bdc/aZb2uE/YuNVQ/XSkufUenv+i/DHnqOJj6eKOQm3Slj+SWTcSaxXBQVFJUTGX1SCiX16/omm/7Of84Uzf94O/4k/vbqe9lVfUevpu6walmTNc2kVlS4/M2XH9pl0EoWbyj+JwnESx84TWIfx5eFQdbn/kqd86Y3zd3zdT3DYdZ+5Og56XlL3+4diXkIh7uqhmRKssRLgVWyDKqcjCnBFI9jGJbLcSmJyTXhpbXHPKw++/KwIOgaWH+zvuciVPeVjoCZoHcewqffzcU9n4Xnfu+a3vz5m3eNqO9ILeCDOYJNJL4v0jjBq8odJsxeko7YQlz09IBaXbpb93gXP+cqJ34JdtP7h3/7MnVeccsoz9727fCbzxXlOJVvBcF5YbTctNX5OK8nUFtu0jz5OUS4ubxEDzvth671XPO/amYODvvzbl45KOrxw3WvSEN7rTKQP5gq/3jGIm/JzWtVG0YLCMuIvjaeLg8t2LokuOupTb5wxOOhRGzfSsOBN33zRW74tAnFRUkmf5OD8Nk+EWrRIy2Ro8R/hV5GIghJAfzmGAe8L4SL2zmd+7uRtsJfDv/2/y667/oi3PybxSu91atlxnMdoDqSgN06Vqo0bfUjxI7APFwW/E/3+OU/70mk/hU7DtLywC/7o0PKABf4cuHU4AHllGbAFEQJP/fLlFNzzvJ+87PyLWV+2VsRwOHp6niAzd4Xa89ktReCGt/NS+CvZW7p2JAl/ctRXZr+a7dT162l4cMl3jxy8IuurvYwl/MWI/8mQ8X2ZdF3mhDjrVLqHhcFveTn8jluW3zns6hPrs8Wvvkz4f5d/dfC5gxsfv0/8H7zGXoYC7Okscw5g0gk4CzLwwq2OH/yB9YfXeSX2jeddfeIozAFe+f2PXY+98pRrX/LOp4tIrkXF90wckD6UCbcE3JeuE+zkfngD6w1+5Jecrz/vmhPuhQcQHHbdxTR7cfJ1rxh8d1iHo2Sc/YdI5WO5YEuQRhjjXo35/j956P8i63M3HvblN/6qk+HBm6HBB/abjNm+1glYAAFQANVk01gDbJrpwQ7B87/9QRpnf8YkuOKUK7yHogdsqNKTdGL56pHfHazi4SsmwfXPHXThgP3dTuEf/KmyFr5vEmxYu8FZ3lPx/unH2akd+PhGCZrvvPeXeKoCsw4ODvL973yQ31O5S7xs4/mEf2GXoO0BcMS1g5vw8DGT2O9PucKdQBr52QF3xYOD5xfs69NgwYAVxv5N7LALP9qeawHMAuxHKQvH/1PAMM2CfbV2mGbYFBYIjFBZsHX3KACI4GdtqTwAQR66wDTSNlP6L99F2V5pVY5t/Gi0dyabPwctwDSgLiyb4V6TI7ALXfhXBcfOmc3kM2sHho+knLcd0BkBwKZOYuzqeR2QArrQhX9dyADkrub6Z4BOMG9nBEBTWds4/tqBtXJ2fzuALnRhrwY1nsv9ZEWzf1czaeaRDnDvAi0FZoX/291qrXAXuvAvCm2GwbLd1PmU99TXnHuID2Caacyp5k3LLECX/7vwrwzG+p3eXp55YM3Z/KcmF25LMLs9V7tnC/W5r0YAa3EabfHiEb5mzZbMeLw7CjSNtnnzameh8Y+MLBYbF2IXHinZ4Lt/6vztkUNy41F77i4/CwlrN2xwDvn7cjb4rudmwBZq3r8ZpkYsaro747tCZvNWoQs7DTileLIg1BZW/Z9y7hUDFeG8si79w4UTPiFyg1Vb/QO9ofBh1bWX/t+toe/9qhS431pzz7d/tjsMe8IJV4XJ0vTFEfNfnPLwyX+Ig/1gTRhs9x8avepjv7wrDP3fln32nZFNpes2Dh4SzxU/Mfzt9Qf9Wy3mr4jd8Kl/jIKD5OqwxPYP01c97Zeb/dD/fcl3/99SVrr2wyc9fLe+SjvhreufVGPe2pj7zxTv+ObD/uCFvfz2JdmrLv35kB8GNwQu/1G/DDd+/ORH7/UrANvBGy747MpK4h8VO8ELUjd8TPT3cPkfPXBeccmvJ/1P/O7mIPT+N/SdjVcc9+jfw4JBYyg81zgNXO4pFsB00G4zw7bHzsHpp3+ydzzk52yP3LOqUBpInDJkvITJxyFJAEx4A27mPzEQ7hPLGV83+aCj/nLyF159wWePf8T3ZoP/uYOD7n7jq08dTcUFlbRnTaTwU6xCikXnY408zxP+IUHmHlLKnBNL+8l7TvzC398zWfrrVbPUrOzYt37m5TcOe++fBP/hhD+VWH4sOzDC7/tY/ocEqfuQkuO+ZsKDjx1/zT8uWRL2fPSSo/ab1QaVx731k8+spO5FWxLv6ZHbAwmWX7JQhfiioJVu5j3IT70HhY575KQnLz72S3//fIk7g+uPflgHdr+5/+GUwSuWjU54795S819f46UwRfqQEusPuo2dzF/iSu9pYeY8Lcj4OUdfc/Mvejxx7mdf+4hfQcchj9xofhWBTe9Ik3vsOoBdgJxpgcP84I3nXfb4YY/9cTgJ3zkOvQOR2wex34sJmcjvgQyPmdcDsVuCKhL8KJRgSJYfvVX43z32mpuvGfzuveWZ8L/hnM/uu2pkzU93RMEnRmXfmqqD+L1ehTsl3EX8SFRjEMJOKO+3XZQ+69Uf/+PTN/xt1Uz4zznn831Hv+mKrw/X/W8Oi56HT/J+iLw+SKjsAeHvUXlZ/ONIsDtlacn2LHzv5ij6/clfueWQmfCjVeEe/eZPXTxSd3+2Mys/fZIPQN0l/JiwHoLywfInKBRI8FRYCUZZb7hThmeMALvx5K//8/mwl8Nxb7vy+UOj3l92JuHpY1i3GtEI9ZmiEeq/MrZFCWInxPqHMIE0shN6njmUlv73+K/cetHaDbKjo1a5K2e4nP5iJyyABRQAbBaXWceWtp3ylo8fNjbJfj6ZhAfHDDvSwU71qFNRsmOHCnXE5KOm9mjzkAA1nw917ORxJPTtsnzsrRPxj8/dcNtAO/ynnfOph1Uj+L+xJHxGlWkGyZARM8Rp8wA8UlL4nUCFMK+hVp1ARh2SpcOGo/KvztzwjwPb4T/j/C8svTcW148m4dpJiULLIWbU+DODX+I5fcRESbgafx0tDyLUHbL0yFHp/+KMDXc+rR3+wcEN/u1jKzeMRd7bJkQvTzgKLrds8tC4JbWTOoaq/Di0gRhx17Cuo7x39bD0rnvDN+54LeylcPw5648ZT+C6cVFaFWH7pmRduVhXTIKO1K70kZjn4zVf04jjQ4RtPMHLHPvwnJK4c8PaDX/zoWMg82hR7e5NC/Q436N3BJKzuC474gQ864KPP6oWw7drcdCbgCbc1KXO9NUxdXWHUsdSHHuGiaujjmtP5nuE7wyL4OnbU/aNweuvbxoarTv/yuXVNPjBRBLuW0eNQCYz+hUUgVCSKiEeyoO+0iP8ngcciYdTmGp8NsZ3Rlh44HgaXjf4rTsWFfETc05G6bcn4+CJdanxZxa/18Cvyo94mUf4fRWQkvIATPT8GAsXDQv+vTO+dtNDW5qI3T0+esV4FLy8LsnkR8J3SoroSZAIVXZ9BIXPU21D9WAOJRrioEZ0er0J6X7hjG/d+TzYy+Dk8658fjV2rqrJ0COTP1XtS+3mKfpIsd8EnkuKcEx9iOdcHW0f+opG0Bp6RR/v+xR0CLQP8P7bmvO+twAsFCPbzAPWrbssqE6Kr1Zrbr9ifoe0r69Syom5PZUkETV2roPJw44NkLFKyEQhHumcOlkxqQiev3XL/ucW86glzmcnouDAOo4TU8P8wggVIprMsfjRg4S4PbweIAOFPiVf4XdJEKGgQSHz8Huq4pNF/PdWq4OTUfDMqtAaN3NDg5vKr/OgBKr8OEbHPHyXyu5DCfMooYXgkTDDco3LYElVhl865Yrfexb/qW+78piJ2DuhKkqKiBXxm3Yi/NK0EwX35HkdsI1MPQJ8zsMykSCouT3eJPO+eP5PNi2FvQRIgNdS+cW6CLwULbIUx/kZw37jOjVoxFXCz3F0/W0bh4ZOPC9QwnkkdU8685t3Hg3zhfmav3tMYJA5uSI67PjzxZn1CntUJjxIqGPJdFXM72Lnutixro5ayxxw8Ohjx4bYsWXUpD3InL3YuWVfCwGJRIBmNGyvwwVv+epf9iP0J5/7pcN3VL2XjqVobivrghjeVUkU8XNHCRcfU4h5lBFvD6ZexE35hEabomMPtsXOa9ddedNzCP+pb//ywcNV760jSQBVGSih1UyYroo6q/Dj0UP8gePp8iv8vsJf9kkwoJbCNtga8ycxv3QS4X89+hWG6+7Fw3FJ42eG8ZVQcfM8GDE/JtfgLzm6DpSPEpSunwsZHHKsHq0674K9BGpCvqueuKtS7NsUNPPnTE+J6QhVnGH98ehzV9OIq9u57HuKRkokBPA60cF45l48uOFvvTAfUOavnMEPMDOvCCb3ECfg7mjyDhgAZDondfmWKOaG+a1UN8yPLUyDDNp83CXmp47F+yXXLXSui4ykmZbhvYp04bY6L9+9U7yJ8tg0ys67s+rDqCALwTeMibiZThRejPAr4YLEEyj8hJvwego3nYeep7R3DSde7ooddudkch7hv3dSvuW2ycAfzshf4CsBo8NMO5iPY/Ab5lf4TdldT+EvK/yOKr+L9Y/Bg82JA3dNZueQw2p4gp9w66S/agcKsCpov4cWXI4qvzT4KdKsh9cJv2J+lYeuQ9l18JpmDE6ak/wCkr/h/J9PLIc9HN70/s+ujDN+UiIpaCmWHWzfOTl9ECdiDzaY36E2cA2dUPtyTAz7EPvY00PIceGtGXL7jof5QAYmxmTxI7nZ88Ue7gSE9usAJHSE+Qkma1v/vV4Va1LZMPMtUUtVNU3cpP1dTD4jBsKktBx1NMMjGhG0QZCLT3IiEhe2Cxf+MZwc87KT1z/0n+POs3Yg81eAtCsKlgLjNxEP/k8h6ALDRKGyBDT+AB/38ZwIjAhwhPBPiH9/2Xk/OOD2Uf7qIWT+SYqqq8xSR+UhKRF+ybUAw3PC71tBRnVwC+WnnYIYR/wOjGF7/L3CDqz+9b+ffecYO34bMv8kIwHm5eW3+FVkZVMDr9A+Cj8xPeHnOrm0E5FiHBeFiV+qjk6uhT0ckqq3NsYxT4oWYipdVXbbbzrZ+us29o2QpbrrpOtO7avamYZhXAvaesaPg3mAjsGqpwBnDs/eBjrkO7jv1wEUhZYO0xT++rrr+pseG8a0RB9g2PzQv9Rh2Jz/9rb0iDihmHoNrZwxrsJeSVkgbmkS/ZEwIHJnKlak2RnDxGmkqDEUTRKfuDtGk3HEedtO5rPAJ+Z0FQMyw/jCMqdhUCsEXKaTtgu0DBRgl3twxUApPrklQzbbtPPCrXG42HMJt7ZcuOoSR4WsUgEsFW7959pE+JnGzy1+840F1TnF90dRyNy8dfx1ozX+eFTj+J7Ow6E6FPAzqcvOTfu4ph6OqoPBb6ejzYcrJGRifCoCOPy66677EuwpMKzpYtj8R3Ry42Z2eIxtEUstWLOi5rdt0NK+VHd9hKl9SG3BtZKpZ+yJH/nmH/d/ZGnryHRlmbZ8CMnQbwMVaXXOw2IGndqgaEEFQOs3TU13zKLAyoEPu3gRuB9WIbfUBw54XEQRfSQswcbJegcgyxLI0hLU4xjqYR1Y1YHx0QkQMWMJOrYyivtGjKk3/NPETcwvmUma0G1EWDABPa0TRu3kIXRkGBUnDokjQi26rSZOzkroHCPiwWuZ1NoecuY0UYOJiWzEWXrf4M9M3xaDe6TSMCni2jqZviHhmjkFFE1SnidbdlYQNrb8KpQV00kF9MhsHZgq686xyuujDE14g1sFIDVCMcdv2olLfaQ6SKFDVlP5KSqxsDEQZKMO9Jwr0hcHYd8oCTDaodox21SrvRctAdiONvRK96Z+xd640Hyv8Kw0YdXt0lmK/KTCFOvAHVmWQlIegCiKwanXccaiDsmYhCROWYIWViIdJRgpFJgs0khLG9toyzZisl1sK7iuvw2pRvRQRXNtn2DijhBpxeHMCHmpy7p4mZ7ew46SFKwmTSFbjoIIyxbW6hBNTsIdcT9bhHWQRnjPfimw5h+xZ24KOg0Uv3TUPakuslIveKUezbrYGDrktg5QwYRQiUJ+0e7+xKmCtnHOOHrmBaB2Q03kKK1tO1WPqSyj2041XGICeVLUF7W5pl5QpYlbFIWAxjGOpnNZ8kYQSTChpc2XTizXoizPQ4WaynT8PGnwExElJrwchfXKhC4b4S953IQBN/kYoWLxWgZtEGUjhJc0mllFN5eNyEGZeX8cCT9QZdWCRRri10LE0eUXDcGoAmSaeIoKvwnepASAFTJS4yeBUaGhF9kj6Bz0lRBgyooqGrTtR7UyP9g18PY5KWHKG1LKhgAgejBHUhZCxT4nSY4CGulCbTMhU0ixUeqRgHGkkQgM8zPTzrnTzTK+bnNp29jUnxUFgGgoisz0F1kTOKuCM6Y0s0RDTa7rLm20aqFC1gkKVoMI0zRGf3EJaa+GZUfFMt4DMmLQdu/MJqaZjqfmvxLwvhMAUyS78X4GZSxFCA1q0J3NVKRfLT21t4TrfnaxB9xEeXIjqQPANzSm7lTd9oaR1EBLRwrOTMgunjbMWhUnjulo3nUTI1AqzWcYR+pIukI2BEzO8PbcEA4xNhEe10pElYjyJcKhskYGP2kWKSz+Bl5hwnWzggDTYYI1Qh3EEtQuwXSL6yZS5ad9qqn8FIosM/HMrSbPw6SbUNgaN+Tlt/VRuDJtSSAPKVtERVhmDSETSR1Wi+qmGIGGFDjzQlOs3FHiSn9HI4tLW+RUIlDyXypLVhbumctmeawlC5kfKRAs0Y5QYxPaiVkH+eJYYIf8ODQp42TIZBSnyVfKgqIjK+bntv8aQtVaiMpys/WnDuMUAl1vBaoMDW4EgBG0qnaMqzUezE3VDsKuo2vMpNZyJKSAQtZhh0sPy4QzPYxTrCX0RwhyLvRA87L42VoA9vH57wjUGQHA5njdFpsaEhlZStesiJZKqmvhIE2Ib2bCfUvV0dR4wHTK1J8N92wyVF8hsuZCGGLP9ZE0Bog0ilvqZK9LHZvbXGRWJjVwNB2tQcMaik0256PkkWjOx/5omLi2fKy53EUdKhv3LN7iURgTVWlLm1nh2QZ+nZi0R2iEVG8pd34sJJWP6itoWEfEVIKb4akWELKJ4Zt0en6QDTMgB2GEh33f9r8+l7lFoIWcFlzFzmNIIyqR00+Y4JusYb01TbtJs9+vSrypP3IaMTRhaaVRFSNUjUNRCRcoiDIjPcgyoBahmRZleTr4BgkptAZyYTwnC4BBG0LfLVi4z4F39bAx7aNqDLVKrBg4VaG3NQHQ+E4HaSTTSUCCYjmKM4irOBioollFUS6FKOTd6kVlTfdy6m1tVNm41BAMsklgaKo2zAE6qnFzTmx6Y62Av2n4Y8ti8moquyxqhca7chr0UEBrGcMSVWOZaUNg5XnnP1mDlmSL3jblb2VfYoQY+6VaSYCLBFJPKh+AtcMsm019s3CU0MTozbdkUyGkERa6jnqoqKNACxUMNkVaStB0idDsj2pIN2RaZ64WalOaU7ZeKPyypW8B1vyGNHQao9lVR2amuJTKMWvMeWbKmfsBqKzop8jQfEjQ3EwxOUlhSJmLjl0wfaH8nDlz4rx2sLAWwAwPKG1PY/tJdIhMxJrxgcxKaTQZRfUVOmWZEgAJCoC0hr/roMZOZErnVCrb5bKLgrUyJxR4s4lu5RTabdxraPsmTpHNjxd5vyGMzDtNx+bSt9gyU4rQ9JZsObEavk15GvfbXAdoeif/DQULQOroyrVJ9MJkFHSzRQAYBMocLjCPzLV7g82kaXA2pXy5DaC1vCmAEgRC5j6ALDM0QmHMcYyS1XE4FqFVkjjNdJErgNaWLdyepv45rRTohCIzR2mCw8cUBA5Nua2/hIJPQ2pllwsAomP0UaAiC+JMCwmYDR9PfUZ0IDrwwloAcroHpDF/UauPjEO9NJmHabaWqxrZUSfnVgAmbLwMZwJkLVODUYc8MkzmJreGWTB96yXZSniFY1vO0CdFwsppo6Bkpygc2LWslO3ODeKm34WyyZYy69/TSbRmpm+nA21erF3hDANS2GyyAGpVnJXBvkhoDIz2rVoqANoRWDAyAOQuiES2v16cBdAGk2wMCdWwSluKFBE6zbQVkCJjZSoiFNc+CTvkmbbxWeF/aEuu0MaKINqsVnDGoVZT9afpQw7WCQpmps74AshqUeHrkfljtJhwNgDNFbCCb+7AOrKI5/6JCwDWnBNQH5qoT7JqLJQTjBsaY8b5JnW8dtXZpPHR05r54KUO9AhacLOzty50lGWDtLUr8+s5tGntZiItcFJDlbXVG7Kg2hrMyaarsGYe2cqphfvNpSnKmqbnWnNgRYGV47VEb0zgQj1mbIP2t5tloa0HWQE7+XiE2i9Dz6rjaGazu73pvFjOxe3rI5ueaTzQIgBA04weLunSyNzBK9X0bWYcnwzpxEs96GU4O+FM9EesDV3IqS0wnYiCpno3zsm6icdFrV6PkxSHAUoAsJaBhJS5UxCEnhGQlNBacVPh4+Ph1IxmIxJkR6IDz18AzLR10nT1sG8g6+4r7z7nie867xP587vshQb8+sRLb+cVeUCWa2A2nSKZ/nfrrVamtASaX2NT8DTr1uYbU5g1x8va3GhDhtZrX3iw1VpprCZtfVerLjZNGxSVmixibqOtWUFR27uBz5OtD1+9/F1rH9mZYBpz7P9dwVln/cD3Qz6JY22XFUw01tSGMyiLaYponUUuNsq2ffc77V3HPPga2A247byjz2QRv2xqHrvQWKahOjEEmL8Ike1VXnM7tkpeo6VozOS76KBlOgFrnM8iqeWvAPn4u8mEayPhcwmea+NGajjOWt5h0GAICe21Z9HaLuKHljygONorCJYiQ+YaJh8hN92TxqSfzlNfFDp6Tt6IRjmNPJaNd6ScoY2geE1fJN/35pHanPpsxjTH/t9V2rr0t1It8WZ2erLFvmoV5m36Ubb2Y6GNqf6u6+x2+dSn3ZzlDdteXzarl+Zr84f7eCkwNGxQ+kcCYB4iCC3OmopqK5mZ/sJONhPwdmGHXiqnVxbqOV71gmYMM79L6qsuzRx9wwnR4Cpj7imzTsjGtJEAMxUFesVcRv4KqSaLuQl8ouaPmZ4/j9VKPZkzMYjGPDgz15hJuZVg1jLYlX+0DoDwO4ZuhF0HILVXvrkOxgNtqJZe4Ra/gDw/Regt5c9wfp1JMzdu6kDtFIOerfGV/GLJyOLbO74BasfgkY/MnN+I1OXMdYQWhVZh2HozAfl6Eb0OQCoaEVyoVZ92CpD60SyvUIt7WCbUgjWkh90Pp2Y9phJyQT1VCtgLsu3r84UF+xiItTlTIAvXHT7PxYxsKPe6ms4sMiYlZjpWLetUQoCcVzrRwhy1eCbViz8StWpLL0KiFYiOEJN6qhEZWki1AUuejygwayGP1OJOKEGedB60sEkzJhGQI7OKmiemBS2Uh0qGKAtJT48YBiVPN+KJcDqJyk+465QHXTf1A1MHR8iqLq/Gy00exfZS5bcLh6iNUs0AhK+OqZboNopSI8AyKju1RYZJ7NiTdxA2ZdtBy3Tp2w/6CkILQKbDraNQ4LaNM0MjqVYScUL1F6pt63kb63vkcKQ+w/qDK8UQ7Caojz3BOifnwgmGp/bcwCC7gnZmzW4AhxvJgqKVcSwrJNOhLGs+ClpNnND6cOzguMCkqfZoZ6leA8oweUkC+4bsG64WBMisyFCSzhvCAFS+Bn+qmSdTeQjELxT+ehF/plc2csTvosRZE3gbvSzThIQ4PSEbTCpsfQoESnlQ+RNDoJhHjeqAuJX2TzV+Kr+D+Jf3lDaGaHMQszoqibzsKqmyswJ+qQUA4UfchL9uhZkhflq7QaaUo5L4C+zpIPmNHqOg32pRHtDMuWOYn5l2YKYdpKk/9R8JWFX/RLcx9SO1Oc1GURtQH/oiFYEn/wq7CWoae1rmnwVvdMD2uo8/By7c6oAQc1znv3EIphiIp8YsQ6ZxsiIDyXwNJ2lfInLsN7W4iJiJzoVhfMWYaQoBpn15OrR/D/vIAMTSx57yMFlhwI0G54Zx8pQaJkoMIRmhIhK96IkhXoeECx5XyFg8Zrn3oaVOMkH4KbnS5mGEjCJMaQSYVInqoASNwW0TTTExxZSpwr8ojeGRy4KvLHOyv/g43eojXl826sBMG/G0Gb9tnzwPWrhiztWybKHz8FHSeUz8GPZwQG3/ExqreypJJQCYFbQZNAS4qj8oIaD7UChBkCSaVlI1hafHYLqdsf4yu+GDRx08TwtANs2OTJmtaAud8wEs7I5Aueeo9XlTTT4/C2AkTH7o+bCdFgVzpfWMIEgbAkEzkCh8kkdaTH/5I/NP9PB97FQPCbuEzLMMO/egstxw/TeP/tu+YfzbJSyBHmSekJiUTHclaGySJh/z+V+mPwCROX6tMal8Gn8CSwh/kP3sO1e+9OY15fgbSwk/Q8GjGNRqapMIv6qTHpvbzwpFEb8VXog/xOMAHh8cpPccmC65fk2P+NJyHkMfSqcwx28EQWaEmbGgVPmNoJQmD2GsFok4lebDo4vl783iiKfRRtjDAWuyAQeasWssgNx6y5WEFrK2H3X9hRIEtg9FkuWWIUfLykliFLIxCsFofp9CKwvA8MLusEIHpgHvAwugTc1ap9Z2EzZe8pYa89hlHs5DE3M5qnNIiwu1SMgKA5vAmMcsZ3w9+Od4dJExA0wDSNz7O3G0by+7hPJY059dtE8YwWInRgZC7YrjCMtAWgBkKh9iHpY2CKWRl9X8Cfg4rOjLYthHRrBPH3yI8K8YSD66X0+ULnESKBF++qhFpEbQZCoPLWC05tFM2pwXN/g9TD1ImKsIvy8uWb/+0OSANenn9itHO5e6MZRpQyzEr4VAqgQMM3VQeaQmn7z8DQEDxrogC6mURtAj4i9eedLDN8MeDtdcctS96F/5kkvTdmB9IMIwvxHcqW1T0dQOULAMVRtj/7nYvpTKoj7UH9SvhPmAtQBYYaYH2kwnTwt7wjQggZzjdWAwf/bXEDj8EjeQt3iMzFJNoI5hasd0nmLCLNXnmRpI47VEMSajTzRRopNUDzEtETEs4+lH17/z0NsI/8Yrj/n2ojD5UT8yaMhixaA+PuOiIKBEGpFwKlyUR/F3Qg6BBn4fz0nArHTi//rCOw/9EeH/5mdP+NtAGH9ywE2gTHVAnCRkXInvKSa1OLMcL7f4TR6UHMQdYB79KGBWsfpfly5bonauvfrSE0cXBdmFAyQA0NLwpcbvmfKTKcsyTeA2j7wOKh/dViRgiPBDZP7FItqxSLjvhL0EmCPegf6bneRj0ZaPoQNhBF0hFfuPZ5qOOLUvMT+2L6VSWkeLLbng0hMfPwrzBWaXTBX8Yoy1UZCd4phm6IgAYLO40nxL7uqpWcP69adWcZB+jBtkVRcJ3Ms0UZM25EiwxBgcmYKZ3yyzvyNknDomzaC+YZ7lUP/VwKLwPYUCS5fXXx/weHMAxECW+fFocHElCAh3ovATbp4hfkw80cnD1Iv5Lxf1O/tK8pRiHXrlxAWI/w+E2zIo4bb4WSHp3xo/T01S+JHB8bhU1ieWONkxl591cGTxf+mzr1uPwmtjYPCTcHEEreGP1JELfLSAn5KjjpE6Ujmo/CVsryVpLeuX0UmfOuPArbCXwJcufeUWL5MneeS0k0ILAZlp4ZYVU6wUgmNoSNNPpGjIxfpTKiPzD7Do61ed8YjPQwdAL9IsLmGTUx+YDsQePgSYduFJ01rR+cOXP3vK73wXXu07Sd0FTbAudpyrGKSukpPWsIPxPKvhb0wZXatjp9ZRc0YwgJ2MjrkbloX8pUXmIbjmMyfc6zjiiACiIaX9kTFcxYQaB0s0bpbZPOoqD40/Upq/D4ltpYw29zrVF33m7Y/dXsRPQqwXoiNRwNxEzjU3tQyoy85Uqukj5uGoVNdHvOZjHj2YlkNUWcqTV3z6wife2NxCTJZ53wkBT36C41ZVHkXY9FUV4gXVNjXdNpQE4hVYdrzvptQ+qPHwuCyriWUyPv3KdQ//DuxlcM0VL/ovn8szSjgVE4pUKQjHKgJKqv9IIOp2cbH+Hh69lIRrXaU+bIOlUPvRMtFzYseChzZWbTX9zGGGXMQeMwQw0Ci83OVDlv87VYBrrjr+e0EA/17i6aZQRoZ4ayo5SQU7t4LEjSmtKuZ0kWk9RdiklRNYw+Pv9KeTz/3o29rHv/vSFa+5oSSSZ5RYckNADKQ0OzFmFRmogmkSzzEfPDpZVQkcwk/j5aVIaGtY/LvFTvaMKy54wt/b4V+//tgtfok/q8yyH4ZG4zoGP1P4qQ6Tug4GvxVei/H51RDfudRN/+3T5z/mJ+3xH1n10+qRaLp+DvFLP9Xl5zn+yRy/i8nDaz7mEWLqx7ZaLesjK9z0Vevf8tD1sJfCF6944WfKTKztF2Kklxym1M5GKTBFFxVT/yrWnxL2ITI9DXuWikgud2rr+wP3JZe8ZXYxGHcFNDuh+aC4ErA4HABoXt7aDHyPWQfAWn+y6R9qWgLQ2XHNNVce/Yu+UD52wEk+MYD2fZm0XVJFRsEUV8CJJ9XRj6tQjokxabovuXOllx736Xcc/LJLB2ce01199TG3hHLiqf1u9o5FkIz0IGGQdvQt/gTxo7DxEH8pqsMiNMvXQLJzjZues0+WPPPS8x9x54zl/+Qrdj50/xuOQPxvWATpPb2opUKlfaoKN5WfkhdVIYxqMID494G4usZLP7rCn3zc5ece8tuZy39i/UtXvfrkARdetJilf6UhD41nUTCgoETcyQSWHxPmEWAdejGtzOrpPjz+0iJee8wn3/Kwb8FeDld//t+vXVKOH7vMEV9eitMa1AahEtYkVKtKWVBfqj6MsQ9RQKzm9b+ucCZfdOW5h5zaah3OG4wm3DUnLIwPoMNLgWcqpGx+pINDgCJ8/vNH0aar604/fcP7o1r42gTkEThUejxO6CyiqV8XZb3Pnbt9X/yqHMhrJ1ZXvn/ZqYfO+mMWYiI8vH/duusur9XStehKOjLl8kmYxwpaK0TfK7qMbwtc5ze+n313qQPfGHznIZOzxW9ClX9+cPBvX9y8+e6XJkK+LGXZ0wSDfYVktPOccLkzjDMffwz97LreUvmrH7xgbnPRV1758h9gPj/csuVJz0P8azPInpkxeZCQ0neklFj+CYdnNwSe8+OSL778kXc++g54AMGnPvUf9+Dhdaed9pP/zBL3mMSR/46z/I/B1CelwxwmY9Sut/uu/EVY8jYsza79n8ELB+dvb7cCL/r7ihp+lozRgRLNmwU3n3XihT2b7n6fMz4GvF5VU2KcBeB4JeAqmKWOZwe+pzfIp4nX2gTIiVEVkbX6iMeuW/KRyz8BCwhI0+zd7/5DCe1cLEBffXDwkBg6C2xw8PoAoISVrcWDg4fpD707CChwgqVLl1Aww/Rd73pijXVqDGrgilN+720JtpcmAyfr7X1BbXCQdZ7g92AYHJR8cvJHpah3wIlWu7X1c1AKuwt3vfu4dX3R3Zd56Qg4HH0SLkcNUkLeCTXPuCpghUmOiSSEKkdGejq4/NAL2TGf/gDMAzpmAcxNkpjdY+ml+2AluWGWKiwcSGR6sgx2/8OQXcDllx9BQkWZn4OD0HE4db0i+AUn+j0VjMCrwH0JhQE4M0Pi6fmo6BuQHbOe5+0DUAjmVBg7A2Be6mi09S50YS8CUfwYaM6xgfaCbwGagDUdWk670IV/PVDcZ75LVtDqDVyYPQCmFGE+oITQTGVrOyHA8rUAzv31QWIXurAHwJRlv028tDBMX4TODAGmg5YpzdZ7esTzL+Vr6kIXpkBxLcD0ZvEeuhSY2HfazT92BWzhJVwXurBnQ8sQYMbnWqADxvO8ZwF0BJhmmJUYuI8dANcPPtfd98mPdh5y+NKEsc7P6coNa51be1e5f5rcmh511MaOz23gNAO/9ck7vU2lv2SHHfbTFDoMhP8HS3Z6K4JIHHrqesL/ryad2e+vOMXdHgX88GGkkcHBBTdNGw70GczkBYaOTANOW0w585MLWb0bP3ja4khOHBX40Qt5kDzBLcuVMH63c/t3Ntdv/+FrbndK4a/AD6590FNW//fuCIRffezsUhwNvSxwkxf7YfzkG8eTfdz0bu8xJSe55YevvscpBb/BOd3vxCv87x588OVzXj22AQXKylt7/sP3qi9zg/Rpfy796UBvWAZryouzW//fq7c4of9H6ZevY1Hpmwcedumcv0ojY/O/P3DcUz0nOsr102f+rvTnh64qybLXw8VN1x210w39G7gf/MiD0tcf9MxP7PGf/e4O/OKi168JnPqrfS95gRdmj/XK25cuXQZ808Fbqlt+9pqbuV/6hfTDDSuf8OnfMLZAArFpK/rpoPWLQXOtAyKqoysBp7QRa/VqTv3SqdMuwF8PHtPvc3E+y+49c1Gp0uuVU3BDAW6JAQ/Q6ejzXuZ5j2Hcf4zk4RuH/lC5aduf33jhysd9ZlbLXFFLePWhyhlO7Y7zFvuVlUE5Ab8kMQ+pYpw6AXe56zyUs+Ch0g2PDcfCzZt+f9L793ni+BWM7doyIMb8+fuOO8r758T7Qn/LQ8JSjPgzoLUhFr/j8gO4ExyAP16R9ZU+uuWPJ36cOUs/vOqxH5nVPPYPBk947v+w8YtKfPuTCX+A+P0SgEfLjAIGrueu5o63GhvshcItfXDzH064mrvL/hPxb4cHAPz3+9+wsgfG3hPC9hNKft3X9ZfYxtLUn/U73H0StvGTkEbOrtxw7G8mbgzP7XvMZ38GHYQG/9pvAWb4rn4uXwnNARYsNJi2bOT0zy+A+v/j+15/qJeOfD3kYwcF5Qg87FhXMScDJ+TEPMB9FDpeCsxDXnRikG7tERFUrt15w4lfzdzSKSsO+dS0y3Z/+b6T9k+3jXy9l48/JQwjJJq0QDjEoJgH4ndU7NIaMCcB6dXWJFD95PCNfa8Z+uOZr1n+hOm16Y8/dMrAL+PRq3rk0MtLYc0wpmZ+nQi/VHlwLwLmIn63PpAy/z8jlrx621/XvXrloy6/YTr8JLzGtk182JVDZ5XDKi9h+YOSMHVgCr8XUB6Zyof7AvHHQQreqXWIX77tr288buWjPvND2IvhF+8/7vBA7vhC2RtfruuP7Yv19wOm2sBV9Udl4SXYvkgjLhpvzuRTMlb6n+rfT/x4qeqdyw5d38EFU3Z7ZjqfgSlk8b6xBvaYj4HafbykfrDCvYUdUt44eNzzw2jop7186KByMAFhUIcgSCBAYg6QmAOPEqjk0w5CDiXU3rwOve4kph2vDWTtJ6M3nre4Hf7/u+ikR5TE6K/6nZGn9CBzlsIM8xCIW0CI+ENkyhDzoBQg/sBFokIGDRB/D+Lvc4ef5fujvxq95e0Pbof/9x85ZVl/MvLTfjb68t6gCuUwhTA0uAMJpcDiB43bQcJ1UAA5EZTcKvQ5ww8rsR0/H/7bac9qh//6wRPCyW0T3yyLkTcPBJO8F/GXsfwlwu2b5GF+iLvk0hHbDcsfujH0+DVY5I+tCNnI93b8/YxjYS+FX3zgmONLYuQ7fd7Y8h4U4GGA1o+P7exlqh+JRnyKcYiJ0f5hJACQRgDb13FHeMndcnbaW/+GvGVdAB0Ay3w2gtBUHpnutznu2QuBWEv5C2rf7BXIZGeEwh/f8/rHesnItWUY6gmQ2XwvBg+1vIcE7WGnusTw1LEO5qmiOTCTuDoyxVAR9CBzO87Ob8jfn+IV8f8FTcbedPIHPXx8TYiaN0CC8YlBFLNroqGk88BaEl7auJ9+4DlTS7oTFARj+zvx0A/G/nb2kiJ+Yk4WTXynF8YfVyL8KLR8jwgStbMhSiWwFHESftBld7jKg2FeLpYHBVm/D5PfGb/xrQ9vaSKGzLy+V44e2evXkdFReHnCEL1Q+BtCS5g8mKmDzs/FZ/vCmlvio1eO3rTuBbCXwS8/dOJ/lLLJz/U4FTdA7e65qepDSkQflBzaLlglaerOG+1MwsAbx+HB5pcIOXlFJxbjav41+8q3XQrcuhCo9bNbNu8yLOCmoHLmZ2bl/Ng13IHMU07GvhJm2/s8ZxI7KEETXDMK7RjscKm+qVCMbzuVbjpks5fMwNpXH144tO8fjPzbuOdeUCw547XPleTI/r5TU1aDh8RA+xC6jk06H7XJqWFK5BjQ44KSOToqJnyJjR0MafVTxTosDrN398qxp4VuHQlSE6ba55BrS8WlOtCXY9RbKg/X4A8L+D0lyErOxCIGo18uCrHfXHTicSU5dmzZrSmtTsJF45c6qTx00SlYiyo/jWNUG4UGv4vDGoYWQ9313eo1E7ecvxz2EvjlxW9cEWSVL5R41aX29bAfqN+I4RV9cAq0Ykxqqj8v1N+h9i2bRB/oVPD2luOzm0/vjCWUx02ciR8s83Teiu7YEIDN4plZXpwT1IRY59W3P9JjE4rBuMNVkEoKBkEMybn+8EhxD6kycgI4hnEc6tQe3blq8E4GAUr5dOjczb986/6E/88fOO5FpWzoxQFeJytBMT8REKdgkJqAiHgU8xfx57gt/lAJIIdXwRfbjxr69VmHEf4bLnr9w8J0+OyAjSEzxkiYmRIoiigpOg3T55r5CT8SIW8lzB6D38H60r6FO54wlILaduzXl63rLyU7LyrDqC6/o8vv8UzlRXk4RtkzkpJN+E0bObb8JARoKFJdyWFiEPYScLPqYCAqKz2eIn1QGG+hrEESeIrfFXkYGiHmV44i04cOtW0fIqHUa4TAGDbFjovkP87pg3mAZj5jAUyBorVc+F0874AJfb/FBdDxtOZnwdxy2Tocwo2d7WZj2G/I/KjGSAAww/RcJcU5hjkLxG0ZVHWwIXD1bBW87K6Sm256M+VRzracG8gtyDQTyDCxZnwiIMU40uzqMg1+lUoNAaDMENpqaxOT0d3nEX4v3vbWstjk+XyyIQAYJYM/XzFpbH9FmIiTlwtlLzXwM9qvcBtAdO/brr9+0C2N3XNiSdyzMnDGEX9khJc0uKn8UsfOU+/a8ofN+F2Dn+pH7auEVO31k7dfsBL2cPjth09f5WX1E10WYz2N0MZ626hc6sjsGbWx39LGth16tSBQR3p8aBXwsROgIzDD+J8Vp/9a+GWP8AHYllTQRkpNOSeQ7S/PEdLx6gt4fXi1w9AjrgjT0SYsMzstSON30AN/07lI4CzUnUznStqbpN6jAB1jwCZve+3vzz/y4UF61zN8jlYBT3Lm54qAdFLMyQzxgK/zYIHBHeh8VL6eiQSBBAg4VKnf/ry/XPGyBwfxXWt9Poq4I9RKaW5VUHB0nUdBwLTFb+tg8AOWUdKuNrcdsHrLH57N63ce58MwMn8dSANqyyVTWlCFC1PYLfF7Br9pG5sPs3mYSSPyR/A6+szrr4I9HVh8lCtqoYPtwhi1qcg/RdFtSyFJDX3kfWjrHDa3s7KCQkMrVUwTx8E8QAX3FbNR4qzNgiG2Z6wE3G0pZEJX1/sGHvm7jd86XA3UgbY7yPItAlKz3i3LUnU9wgtZhMeoAlG1Csn4X48tZVWkW6kYX5mwTOtLFf9NdS62ku1g6emkmMmBxrfI1sGiJRIRipttXSkd+d5AjqI/LFDLlu2yBp4/baLvNhGQZ44WPwMdAbQhKYm5Azns1Ef8Dy2W2xd5iul0iBqyWNQfg0b5CY8s4m7Bb9pSKxId7M9HIVDZuen03mzr4zx8zlHMnak2IqZ3JOTCpSkP2YqfT2kfCiLIUKOKFI766Q9/eDs977qN77qnW6aYQfuvv2mHbsrSKZy3R5I150EPpyYoU6bXWkUp0k8UKRqpII2I6p/WOhJNf4ZJCQE9385NT5i4waYPvZY+tLQDpn2tJeYZAVB5/B9+dPXLJyoD9cxpLmJq/6fyZZn+TeUiGsZypVi+4fGbH9EvTYDGaeWAsQ6apgGtxTB/CTBvAbDLrwHbgrUAOKSrHnTaooFFp+noWlIF8BHqqKPcpiJT0WkS2tZbYAOymgqCKaM6VCsVoAZkqPkU89tOUrMqTDNdnhxzNCuoVPRcG4EzU0StI3zqYKAUZwDqd7+KrN/GWE3mbMCa8Dstedk8hJnmTUEH37OhhMn0Rm1UufNVng0I2ggJrJnYRgaGFvyiBT81HLfBCbMCfmy/8c2v9IFM3x6l+cAQf7EOuh5OIfG8DXX5pW4jMHWgukhN5SJJnl12nWc7vo9GlqcG1LLwaYtqNWmkprQ93+LNljZkuiyQBjNyzdzJw7PL/Fxg2YQJ3UsxF7PMQ4WBU3airnZlUUVOYkjqqCAkzuljG5HgVUFBFC5mArtSm7rN9VcRpaVJmWFqG6TRfP1C9CYrTtlj14reHmV9SrNcUBdLqjKqY0Y0jEoM/Qc+CQFEEeG9HbIX9pfSdgZMD6z9NTH/MUBHvgVoQEsl5AzXTThsHvagk7kMjYDsmnzIv5EJHc0nw86jbstU2O1EaUgSCrQnPukNyYy0LmpxhY7pzrSdqjrcMD4xi2McMJyIOtHRQ6UmerpVdtDjCz1Q5M3cErPMkzNkgXAyEypYmJBkKvhcrPErJtXlK6EWcWRJ6SAbgD63MCTPU1MdVFgrG+7YIFIMacqvAl7odvQByy+8Qshx3a46FLnR7nkevNE+mW0f0Hmo0MGp8i9oQZmq93ynrsbTvueiU0z7KDQT6D4QVpBYI8V0Oyv8zkmiQCvFe9IyiDTXpQ53TuG7pQq1TmZ9qkLEk+VGAyxl45CSiBO1c7Ka2pMF4SfBaH3WRnCzPMSbaks1pDSMjz4aVXdltmufCU2pZq5d/aUFoDAyXAkpJQi0EqMZKu7GiNInGwxHbUj3c9pfWE5zvvvQ4U1BW2CmMb4xW5lfQroJlBaUYCS81HHtaawtlV1A4bJorpt29cNpPvTYcyy6eocZe9ESm6JX3dW5FSBsxxrmp1BX9DIpNSIOQVsE6uAYloGkmRJWobZb2r2h/VlDKxeZX4WVahAu8MTgjwyTasuAG8ZkRhg2EmsQqODNzG+FF5XdbihBAowEDJVfhRDWloHFz41gAdkYtrBcODrNxJ/XIdXtZOOHk4Bksc5HCQFHldtF34uH2s9B7SaZkxvX0pTfVi23YnPCaGH0phPZcmqf1fShNSwKAGJ4ohMsP6c2wAoL7LQMzxP0iTgk3ISxfKRsCHDCZIWq1fy2D3PhynRoMNuItg1I0BoBSEMFz3PAIyHraB8M1T+TWsIJY8UKYwVkWCaOQoOT/UfF9XsAZuUIk4V2a7RfJ/YFX9hdgdsJqVz7m0i32PAiZcb8ZwXrnBkziqn7NskMK51RxxrCZa3ORlbIRwsB1sRc0EyRsnBRWtENuW+j8a7MNXfDvjWM1FS34v0C3iJ+q2mNcrWrQXMchfI30gzllwaRsV4sTtkYcWglBrK5fMCahA5IaMFZOG9tJ+obKXQ04czEt1MCWwt2mQt01twc6tjC+TNaBFA0Dk32Vgg0rHShIkAzTRsU8jxzNI1QvXkhM5nXPO/Dqf3Wkqls1Dkfr5t+Ic1ODG6d9baMwgg/LVSFKhcomqVhiKt8Mox8P1OAtfldHPsXYE8YAuwaihWwoHuPIs7GVRwTVWId+JYkJoCWmFKPociBQk7ALMExVIyphr9r+FTCFQG0qmf9syAEYGrWbY9QYE6ZF9FozkLPtkObE0+LMLCUzQrPFKwKaYUMa8HcrtzthGu7uljhKqFlrZXhtCnIWYtQsI+zadrPthOatejQiqraKnBcPS5W3gfZsMByXoICA2v7pvC7UMbi74IUaPIHGF+AFNoCUGNscq6hxZLEGcR1VCZ1ivjrtbRNUze2qZupd7FdoKX58j7SbRDXyLEXab+ysYDUMEAwMwzQZdWCAmkXy5fU0adVQ+spgZb+KR5nNJ+hU3AfDAGmKSx1IHXaRB2i8UgxvwlRr5nfCADbwSk+K0gI1LGzUQDISIfNVrGeZd47sOutFVkb5i9cz5koL2ahzPmTTZdY6wNT6tqos/1tx8INn4KEaTu9tQxtCRNaBFhh6NIqnJrwymbalq04W455BahvUIBPJsgHsWEAFX9XvSzMFKwsDgNMG08nV/LqSMhN/kZ+9jldQGkZSznaMm1iowBIE0zoZcvUcJ01GLopAm/RlG5XGIDmmZXWe3QilNmRogCo1epq9ak09Zem/jRSUsadMMKKnJVJgmVL8L0UaTgtSOlWS7aYYSvsaUMANpebtiep41CDDI9BNRwHG54+d74aISCNl5eepcZLkgiH0th4sfHYi7SZ8HcJsunQuCzbML8de1oigmnGtDCVSNpdkzBFIwnZIP7i88VLrF0e0+ZttKhkLVnJZv0v54ITWoSM1n4Cve61cfS612gNRqrWCVgGsE5ZbTmzFtRsisCTcppC5O1snYDmlxnbSEMjSlGQQsmQwVAIZInU5jdrzVvm5Wo2TVphGoHZcCJgiqE+gdON4xMo+2ItAIwjEIwF0GiuTA9plSJDAYCzWGiqQD5GmxZY+3ZRsDcMAXI11GoeayLKdo7+fdKN7pLCVZf1NKBxJAlDtjjWF+hokeSsyXDOGefySxR8xOHPxWmd0hRqlW20fCsD5tdaGj9nfkOozBKNvsdan23D1FPybfNOEx4GOXtONY2nIVJZkEbFIUah7lOqK5sfbSrAFGhpRyi8pG1b5Wao7wx/iO5s9RWUYGYmhjPtZONaEAjTo2oWFLQjUhbyLNa5iUys81K/3fy0cExxhKEP+oXX1LjfQxoJKEANdzh7AeMNKcCgmBFrFr5t6aNwXhSCYKaOY3ljZZtzr/6QQqryCNLMoohDWyzMCDFB/oDUgSDN9seyPdKWrNk6aQetw8D5fwzUGQEwRa0UfspWW9KOz6Xq1zXu1k8/avA/dysy0E1nvfAOmYoD9GDaUj3bZbGaoeAvaGHanFkkTPEttKOLKRlLmMqgDbJtyPE8P5bnlT8qpzfd2+ZnTy2z5wLNjLtbBESTWdOUWgT2lIrSB1duus8Lvv+SQzv6fXzn4G+Da/26wyu0rot+Nzn+YIY+bBUG7YSCoblHPG7Txx57/IVfgN2Au/7zmHWsxi8zogjmDFLuxkvN0OFvAWYrkEy5SUO4ux8ZhD6D5WqVhibgJvNcFo+shbil4cDCS03DCJY76a0lIIA1PyqhvfawScjmB/OXdVn0bZYLAtkiVKCQVzPewlEU8hHNhcpxsYaAKVq8xfaR7WYZprRRIR8adysEHJ4IezboFaIs/3I29xHZBWP5eRsaKfabKLSxnWIBmvmbx862jpM7gmYXFmT3s5oOFtYHsAtrhlZPzStbCbV8Lsgyl7AEzZUZKkVxHQDouV0ar6qGN3O+NE9vFwIJbabla0GMRmbCTinqhTOEV5pjYw7Z4Fdz0gD5Ih07T2/XAEg9Ls5kg67slCIlmteWhTya8Kt5er3EVKv0Iv5UM6cpe5Lp6VQ9A8jMgiPWKHshNRYZSb3OIMlykzbPg9PCq0S1mcbBko23j8x/ILpA8LdHQvbQf0LCBH3EoPWsZmizRkTo+X+qC8tsG5v6q34ETSNqUUhm6Mb2o15vkWVst8PB6Q+RAIoW57TA2jzRAfXdsc+B53RdATHg/LJHDNulWbwizfy3ZnozBhVaCKg52MwwkOIMSqlOtHyUkloElGlcpv+jzJ3I8H3tnLR4zRoFy0gZN2sTLH4jPehDhiRp4FcpBe0912ts4sSdTHP8hJdrhs3rwPOU41fzpQZBET+VP9VEKYwASDO3mqq5aqb9pQa3UGNmrsbLtvyNOkjN/Aq/aZ+EcEeNOtAqu0xZREMLsQNyp0CVTbCddjm1FqpOLrSlbQMjCPL6p4X+U21s6x/p88wu5nJp5eGcIjNPBSOYdgXteKkDorczXwNOB23rJhs35+nCyJjzFwmeWlCkiRI0YWZ6wZDIiMA1katFImqxCBQYyAgB1cmG6Om7AzxEMXYu22djjO9n+L4WBBqnMIzfOEcCSgt5JFmBiSwDJfkKQTpECWodf83XY1rDbnBnikF5ITk6jyb8hkAV/rSBPzEr97AdUoUfy1Fa/vUoCwXJu0YeVsg45pzwu6YOto2MEEiK+K2wEeqZJHEwe/dG2MMBZyVuyD/ukU4utAUxr6INrDs65CS1b2L7z9bf1D2OTBvERhgkqq2ytCzScflXmA/Mkv/bw8Kyb2dgiuSyU2raQzwfEE74E8nLukOxw9AhiAmnWhJaNciVt5VShudNHZwnK+1FTti02hA1M9TEyiHB9/lILR2QCTJJqnAxbSSoo/6t8FsNmrbgJ0KyeSiVLJWVHiHz1NOlWbz4kRdVxZJxLQT0ElIlaBR+Jy+/SPW5Xp7KWvAXyp9JVaaY8Cd9wAce+pUIlt8YpT7edtDw4Tl+YfLIrIAjoZmygpCxgkYUzkHdF6mLeQT4TvBj2NNBuj8WpCSEr5neCr1UC24txLWigKY+lC30YQVuaixIF2VB6c99z758fhYAm3Iyu5cUX83fBJi/AFCr8VovFjzrbYE1HXYXyr29P0zdvm1CBDiERwsg0UtTiZCzRC8dzlTijaWiaRshkOnOJqaI0hBq6VLs3wO/9rRLf3JTja/+dZwOYP8HqBS4EgDaGmBKKKSpFgCUT85AllGzqfjjzEfmXwR1fsD1Tz3nm7fUnFUbI7EYaaoEStAY3Dl+lXQ9iGgVbivIzEeAeuihhVeUeoi/H+rsoLt5sM/PqnzVF+tiGcSinOO3KTOCLDNCkvKSTW1UZAb9WyLzR3EAtbgv4k7/RtjDQUp/YwpBJGWohIBUmp/nQpzqrZOml4aSsNYAGIvIWF2JXoUq4l4cIvZ9EeYBmn0LJgBj82WJOcMC+QBm4dWY/xQmHDh4dT1xej+esQHsPA+HwUYIKEEASggoAaCEN1N+G/U9R1HC0yKjVGizPA1Qcy6GanZAPYZVl1AecbDsoshZha/04eMe9j9DOhB2tKCYU48emEpqXZJiyobmV/jxWkzMmQxAJd0PIm/NRYQ/7Vn20TpfkyRyET4eaPzoEKBPnlPRwGvzycwHeUXhovFLLD9p/h7EvwoFzOqPHnrq+iQp9X2+5uwzlEgUarKkrIBcoeVl18rNpszWIdeCoDU/ar2YmD/qwbz6rl7x5Iu3wh4OTxi8cnMmwmtSFLBChMp6aXxbov2myp+XC1loML614JKCNUQrDOMS1JLl21H5XAnzAL2Qj8G04wA2zTnxF4OOrATsjACYqwVgPZqs/QYRc4FaNfl47C65OZX9qnPVEI3G2dhZqU0pMaxQjKuYN9XLRjOk9gRTjPfrymwuQzVdCRW54iOPPe4TdxD+p170je9EzpIfxMigCRJQgo4kRQeIh1IiaK+CBm51jZakmqTxZ4gby4r4K8lSHF6s+uZjXv3pnxD+p73v6zfVncWXx0BWQI/S0koAiAbOPNl8FF5MWar2SYjxWKftC9Asr6IAq2Srbgy8fT9D+P/9oo1jsd9/fk0uQZy9EKMQixF/rPBn+K5UeOk3tVNSSKkRLMoPiFovSnyoxihgoqVDmSy/C/YScHn5P7HuO0RWBrIWyexX9TJ11PXOTNvq9hCpFtz5EICEQEyaHy3EeDlUo6XnL33q5eMwD2gY8C0M1E43tnUC7glDAIIZGb3Nj9xAmL8VcOj671YjZ/HREVtRSbJ+7NhAaX7N+NipiWGSPMVouiVQR695PaWEzIPP11CqV6hjk1U/Z3LxewtZSFHuOakiBjbFoh8ZJkBmYYZBiYGIARGnwhur35Ew+DONv5YS85eQeZA5kzW3V4LlbyzWIavW3lHJBn4XZ4RfDwW0gEHhITR+hbcpUZ4J4k6xzBKTh7jRukhWjVXZ4qMPOWowtvif/d4vXFmFga/VcOgRpSV811EbUkS0lp9wC902VG6VMi1UaPeaOhJ/hJqxhsKlgmbvZH15Vhd9Jx70vI9vg70EDhn81NZIBCfGSX+WooWUkk9EDd/0RjONpNvZ0osSCvRtQYzPIfNHMfXhCpiM1nxl+fM/exXME7QB0Nif6P6Ahc15pmlA1rmsH3vpVX+MvYG1NVhVi5HIE5TSpLHihLRvhJqrhkRchbqoovatQS3DhNc18zjINH1I3KvxuN8fR2DJK4rMQ3Doheu3VET5iGq6fFuEGjZCZo5w3FhXTBLhsaZw17MK4seUUh4RWhOEn2NCrRmjZZE8aFOdLzvi0CMHdxTxP/2SjbVJ6D+yki37a4RCoh6XNZMq/HWFn/DWCbepQ5XwI7FWkTmrCQmvZZj2m6yJ5S9/8qsu+ltTUyON+bXe11fTJT+s4XP1tA+Fnot40fLJqB0QJ5VdJcJf1/iRQWooHCvYnpPRAEzUVmfVbPkpD33hpd+HvQye+MFPfi9ii94YJ0uzJOlH+giRNpgWfNhfdaKPrGr6sW6ENwpyFK41FK7o84BJpJGx5EE/qAZrTupYrEC7QeGulGE7ZbrHrAOYDqYb5++W53NmeMylV/4gZcv+rSbW3F1PliMToZMmoTF3hgRex1RBgqZUxRQhMwJMklaOlqNJeyBeO+ibo8Hqw57yigt2tsP/nIvW/yWC/qfX0lV/rNdXIkGgoy32Ea/Ad4lhKmh6I34kogoyTwVNyQpqzclkCTLQ/vj7wF/HsPrpj33pO29uh/95H/j4tlQseXY1W/39erQa6tFizCNE3KDKq8qeTZp8MD/UThU0ySvxIkz7Iv6DbovEyuc87pXvub4d/qdfckltZWnlS2rZik/XamtkLVqKdUfBQQyOmq9C5cY8JvPyC7znwETUB+P15TAWPWhnVa54+cNf/IF5jXvvT3j8hy7+XMSXviLKVu+McCgWJb1aENIQTSmFiqaTrKaEawWFfAVpZDJeAuPxfnI83veTY5VlLzvwsMHdXvxThCYn4Kx8Yp2ROUXo6EpA1vxz5lkAK/nm6wQowGMvv/zXf3rz4GPRVH+nk1TeyGC0zGACs6lgSsxyUBeYLKstnqWzFKS3/NbMHXjH41751g2wixZ+1ocuvf26deue3tOzz5vd+pK382x0KRfjwGUFOIv0d3DMBU7fJ2W0ffQSEO6y7ZL3fTAbXvrJQ089NZkZ/4dGpJRH/vzCC49NoiXvdrLRA7gYRfyTiL+OiXZJovIHwNRW1YtxKnT5pHD7Pll1/fc/86XnTsyE/5BBZdmc/sMLLvhWFi/6cJyNPc5B/I6YwLLXgHbOpd1quPTRv9SDdRnANlqWgNv/5cwZuODQl529BfZyeMKH3/edX5xz0WNKsvf9PJ44hsNOj7FRQyOx2fGZ2jhEI7VXtbF0l/wpc8JzH3nUezo67Zlr36atv4swnVCQrRh2GxYwPPg0lWIzvjRvePylgxQq+61/PP8DH0qTFa+WafUIGcePlzxdxmgNr+PHjId3gdPzK+n2Xlu9aeL/HTb41nS2+I+4XIX6vuj6wcFPQrT0lU4SvRhY9GT0CqymlSacuyln4WbmlH/Dofe7vNz3rUOPPLU6W/xM7w56ze9PueKrEyu2v8gR9ZdBVH8aGqv7S5l6KADQA+EPMV7+ows93x+Pejc8/zVn7oQ5wH984AM/RkHzhJ+8833PEdk+a5O4+kzEfzCTCYVPRfzBmOuFN7hezw9T5n/9Ga99213wAIJnfvhcCtB64i/f+pFBTyx7LaSVf2e8/lj08g0wtaWQW2csuBVY+AsmezY8/jXn/9z0S0dBWQC5+S9hKlPIltPOM01HBEB72SXbmzX5QkDz6egCLSR9wgcvoAUanzCJXbfuMt95UuT6+1Wiww4bnDXDTweHDQ5SFOEvmAQbBgf9gdUHeUtrtfjQk06d99dxh65XOL5tElxxyhXeAQeX/CwZTY847SzS5PMiSEPQPzUJNmzY4Bw0MhJM+L54zgknRAtB8HsaPOOjSrB9iBIKRPbTd18d9C2O+e2LF0dHHXVUgzKPuwAWDhrTgPY7JNZ0b+ppDnvElmAtVkjbwrcCK4wZOjgEmAHkEZefRZo7ggWCo7R5HcMCwalaICzYZ7eG4LWlcuKJ8K8GRuB1ZGw/V7g/JW1nVgIWIK/MdMEOlLBjZtXTAo0DutCFvQgYFKcU5sATe8IsAGdN++K2bLrQKgGKJg2DLv934V8d8vgvjSvTPFj8oV8QHdgRaN4CQEg5TSF24dSYbvljF7rwLwWz5IE2WpbvMdGBZ12MxkcPnS1AF7qwt8IMVvKuXtkj9gMwwNpdmXJRNg5mCLDHbifThS7crzCTIOic23DhtgRj0z3YLBjuKwvglCtO8eKHrnEqQ39LNi7ALjZr5Vqn56eHeEc895HJUeyozuPfgPiXH+IdAJAOdmAasxUGBwf5zicv8aIVgVh/6KmE/wE/DdgEOJQ95Q/r3WAg4ksfMpwMssH7RDfpqb9ZWAFTfAByDwkPTtDGQZFPahavNT22sD6AkzacvSRyxNp6KA6XPn/CzoCv5H7F8Q9+WP3Ev73v9pD7/+e7/rWb//TLn+yOQDjlu4Plqhx9ad1Lj8x89iTxS3ffyfKk960/3xCf8Nf3bAq88Deh539nMRv47uCBJ855eum5g4Puvo/f+R+xDy9LPXhaFvADJ/yJ4CY/SI//23u2Bl7whxILrmOu/OalB549CnMFCez4a9/89CoXa0XInvEXf/xh4FdLXubL4//83p2BG/7Z98IfeeBuuORhp90LD0A47rtn7xNx+erMg/+QP3/rY4YDvtSZDNjI3/3qSTd/6J+hG/wikHzjxx581v/BQq2LaNnENQc20+/OFWXeHLj1rBMv7Nl09/vc8TFg9RrwlJarBuBQ5FMvxORjQjnj4zFwdCSfaAKgNgaZE0Dt4Meu6/vI5bu1LXg7WPeldf07HXFBNcjOqJdlryhzYAHmj4n7mDwPi+NjUXwImQeh8P5R4t6Fl+53xrWzwU+WxORy/8yqm5xXK4sVWchBIm5GuH1kF8LveJhdgPgxD+luCSV//5b9Vn9m42wsA2TMY791xqsn3ey9tVA8JCkxVXZmyk9BOD0KM41tF2IdSsIbL4H/cd/ru+gjq46rzKIKcMLGNz93DKKL6mH25KSE5Q81fgfL75j28amNsB9D6cUh+Ff3g/OfHzjo5L3mC8CZ4IQNb1816dffW/PFcVFJYic5wDA5hj7cAo0ERCPS/W2YOedcst/pP4MOwl3vPW5dX3TnZZ4YAhfli8N9cJ0SMOIb7GMkJL1rtuIfx2h82hAi0ouAgodeyI799AdgHrAAFnhhM5Dp9glo4wzsBJx81ZueNOQkfxorR+dW+mRv0uNCFvqQlnwQeMzCAESAv1EQRQGDKrbzeFk8fMRLvnnmlk99dXD7ht6Z8J/w1TcfML6S/e9oWP3YRF+2Ii47iNtTuAXiloHF7zbwl8Tq0VB+YvnWoevPGfr8mpnwn7Lh3IHXfvu0a4eD2lfHe5OH1HsYZIg/o/IHlAKVVxp6EKPgqQUAE2XZPxwm75yUE394y6bPPHZG/Ci8Xvu1N166g0/893hv/ORaL4OU2qiMdaA8TMpKLuJ3oIbCYaKX+6MlccpOP7vx7fdc9ULYy+HYb5x1xKhXuXGklL5hsof5MdZd9WHgK1pRCfsvxfpHIfYhCuDxsnzyWCn7nzdt/fTHTvn9FR7c72Bm2NgeMA2ooN2nirmV0m460F7vnClz2hfWPX/Sr1xfCaKDEmS+DKV5hhoto471A8g8ZFCU6hKlu0SrROAxRaka+8hI2MljQfaaIbHzv8+761OL2+E/dcO6R0bl6i/Hw/gpEX3rg0JEIH6JuFUi/IhX54H4UYKnKMETzKMeKvzPmhD1X523/XMPaYd/3Ybzl1eC0Z+Nh/WX1Q1+GSBh+hqfzkPjB8oD8WeoGWKPK2GDguZhlUD8/O3br3pWO/wnXHVCWFnsXDsRRm+q9gielbD8qPlFQHXwVT7C0+1DbUPtR4KSvg6I0IqaKPEVY1763bdvuvo42EvhxG+cffy4k/zXREkuj5DJE6IPqivWWyWnuf/oXortm2ga4aNhdnZpP/jGOnldAJ0Ctrt8oPar38OnAaf7gIHJmd+bI6z74lseOymr36q5cU/qo1Yj5vdMwo4UTiNJ7GS09YBhRzM6ep4ysaiTJwP55FrgfPMU2Szl3/Rfb1pZLafXVYJkDY7JFWMTgQiLmxPeRmrCj89IVzPTZMj2n4TsB+dv+sLSIn5izvHS2H9NhPFj64HB72n80inkwXXZFX6bhyq/ZthKwPorLPnOOzZ/7hHQ3A+MDZQ/WwnqL66HUmk4ahvF7K6vkiy2EearcGO5gRI+K8giKDsuttHnz9v2pRfAXgav3/jmw8d5/fP1QLoklDPXJKxvVqg7hRCgtgZHJ+bqRG2QKkGbvMQb2rQeZGccWCq2IUBzUJhdglWycg+xAKaDGb9mNEEn5gmDVw2G1WTyKzW31ovOMkixU4WDxI0pw47MqEOZowJXMvzNMTkOjbV87NMAx7oB0nigxn5kEUx48rD+zXBhsRYVL/3cpFffv+5JSCkGniGazDAmEQ0FhkRuRPy+wR+YsXSg8nGUZkUh4MmH1J3ap4p1cFf2v3vCrz+t7mr8CjdvJM38XqMOhJ/w0hjVMXXwtDCo+rBoHMSXrygIsZO/ve74CS96HQ0ZEixDMQ9N8GhtUOyMvI2oDp7C73va50D+AfITRCXHrXF5zQcmNiyHvQTeeO3bVkQ8vTr2pEP0kXGddL0dRR+WRihxR9OIqr9qX2oHbHOfrEnsQz857oLtnz8W7kuQbX50wDF5P67D6cwswA6546y6rDwy4Zp5UkczfWI7mL46VIFhsGPx6CFx+5z8PgGUlCMtVA47T2lWF6rIhMMyOve8mz59AOE/+ftvetGQW33xuCsgQnwpMSUyumAqKATFJlDMzwx+F+838GvcGj99w+9CHYsyDPHac+785GGE/7QfvOlhw27l7FEvg5rDEb+jyp8RfqaFl8TEMNFeAC4j/OhkxDwIf+hSChShcmTUBHGM8OTxN9+RnUL411032D/q1T807KdQc5nC39B0Fn+jfVT5yYlJTlKX8sAjEn9AQsAjZyf5T2DlWD15N+wlkCTiPTWerUg5fezLsN5Mb6jJDH0Q82NfMkwOtq9HCdshdDzlaA3RGUp/PteCPEZLYNJNL7po6PN9ME+QdoPPaYE1HZp+7DEWwG4VY/72/7rr1gWJqJ0d8QQ1mqtSrtEoUqyqHnUsx451VMf63HSqo5k05LqDSTAwfK+OxLGVR+FWNvpmyuMuPnreXW4Eow5TAkDlQRoDNGOCCrjFkTkRPxj8Kuk8KIoxJRIKpFlixD/EE7Y5GT+P8N/Nxt56u1v1RrCodcP8luklNAiTNupQzI8pYH6jDuSpJ+JkvmLgBPEPsxS2pONvG7x+0L0zvfv1t7qTK4cdqQWMowWLxW/roPDjn4f3yPNd4ob5qR5Yr4BqR0LI5agFOe2PeeL7t31lJezhcPqGwVUJT09QYSGI+VX4bqKLRtJB0xzVAj7W3/ZhoOqu21cJANB0wnFYVPeyVaMZOxHmAWpKKA9BPx3McJM5e7EFYHyD8xkEuNvcF9Sz+qqMMWPWeUqiZ2pvHk3Ylripc1GHKQL3DZETM6E9oBiXmIsp7c6hiq9tysZfc+Q3Xvvw252Jpw/j7ypqjIS7OeMr5pHInFIzpyOJfRzE5mom5ZpRLX7640qjo0MJ632vmHje0T857aA7YXztDrReFH6mNb+KM58LMCy/LJQfyxBwnYcuv8ZNuTOmQ3RHnPBXDriBTz77bhg7dgitlwoyf8wcg98IMNBxDtUuQGofHNM+3DAC04zv5zm4ah8HiWWNkEeqjK+FPRwErx5V51mgwzRwE6jcJNkQALqFHfXnQ4NGPNXuLjTOfDWMTFEhJE42z2FApoOs7nKLvGm+qemABdCZhUC7BVoC1FesPvJv3/veauqYWEWSFzrorVCR1k0sPjyTGcRxDHVMtXoNqrVJuKly73NiN9UaU5n5ZiynN+fKA3mqjYBkcydzkxjYaPVWYGjmQDN9ZTmJPjPCBUWZh9RsmKW0vQmoqTSHCRhqxYz947KBvwE817qTJDmGR67cuihZ5LESzu4i4TFdMsIPhbJzkxx8xZVa2Dh5+XlhnoWrGIbUlhEKxfHhnYNbeP1xtLWXa5jfgQZuMEnjdxvtIxv1YGA2bskjwGB+OPQkc9qP4NT/+fmPVrs0bi7oElbUK20lvIBm3SNM2wi7xq3tu4oyROGGMLSSptg/Qh3jOIMoqUO1PgnVagQ3xve8NPFp9hyVBJgoz0Xmp7YQjm5fEoLStCy2h2oXxvOy6o92uaEzbGOZPeG/frLxop7US6kF1LDCbtKhQi0xqWhXZJBmWEak3bReh6QeQRxNwqaR2w59hGxMm8vZbgtmL3UgPPgCrAScDlibd7CNlq58QVjqewHF8HSxPoISUDwNAZmkRLH0MrV7K1M2U4r3JES1GMa8CsS9TJvNinFNpNs8NQsBkI1IwRR8k+JBMmYD60gtdNQ2BtpUvAVGn5Mi83gUUotry6LBnExFDAZrBdh88qCkRAuIicxOxEj4KVaICioqtRl6C4w8J0Hmd0FbFCpoZ6G8TOgELeWXJmCtMHxE+FPCb4OYGiFwe7rzWVV0/JWYtlbIuhFGMEFeDycXMsy2j2QmwjCSpLEyM5WHjpMhTIdHTD6K+e6jXOX01EJACVTZmAqe9vNw2Zggzo92VZyEgiCQ5p/5RWUCTSc60CrSiINsTQwmExxmRSATHfCkElVhDIVBhM7bBPNPTfvaiMi6D3mh7xzTBjwPOp0xHbhbu6ylicrOlCVUZwlPep1zgrRHDTG5rbsqmjABa00ZUThlXgIJ+msiXlP9VOU96p7qjnY80sQshfbr3Oz5AlsAcpofpvNUpYIyOpbKWi4rAaAlLcOGQfmpjorzKbCjCuKKDYmmWCyVFlVms7CmnSF+aT6yZoVOtowvTDTeVEUB1uupqZMpGAddy0yEYWKOGrWO1BpQmjxs6HHI8zCCwAoVhV/j0nG/hco6lRa/1AxMBOBqYaPKzLR2UmHNpWUilpff1kFqmlKxKqiwSjczilsh8JpQ+K0SqinCcnS9HS14lAmPvxk3Asa2jyzWweBHXLRJpuQkwBA/CWRljWmdSLMWZHHRlCH5N8jKsAyQb/ciGwzdoF8JjY/gZRv6li2ywggBGi9TUbEcRCvEZDr4eaYFJ20yozaiSfAZT4Vtm8RnI2J+Yx3JonIQvEEjpt1t/9k+lBQe3BSe2iDLhQBXTuOYVmniQIlmDcha4HZOT2g6JwaX2E+Om+G0I4VYD/F2iLjxPa9X0yzsClqE55Tfuw8LKwCmHaEYqqCG95D5yUMOel0DN1YAdSQzHcxkqgnWIesLDTlOgwXXdKzW/AwajJ8no42tYMiMVkspnBYXyuiX0oTbE0JFzNEMRHH8pGYUQxgqXLcJ5US/c60hrcbUjKXDhRGHIC4VW94yaKaCfZBmEkaDK2bPQ40Tfi0IwAgZq/1t+YXQIcIcKgfFpjdtRo+lwkT3MQJGZGBwy4LVwYzDieXlLjK/FY4UAo9xElxM4VeCl8x+qQUMCU5OgUipYmr2QI+LlbOSa1zFCSrepOano5Nc3xeuQcHKlbpZpLEAwDAnllNi25IGFkgjXFniaKsx2p0tgNT0uwq5ngtwNtXKyhWEjt6cmJBrig4pD2aGpKDbgKk2xYZxyDEaqGlTvaOyFtxgFADnupyCEy6Kueap+IQBbe7m9gDkQ6wZF9MsGCzc14AEEqas/i3eI0JKY6nCrmemU1NjBShGlJpZVUroOWnC1DMdMdcz0lMyaPKlqEVSLeXIGdUwgZVB6rowRolmHiu9wV5rR7yymBomr8yT1MQrWWOxh7D4TBIagbQK0WoOxhoLxNqlQv55uaXW/DKT+W9dD8jrC9BoByh6JyzRyha8puK2TupRO0yTWljGEQo2EkU0C6NEMTGUNEOBlvZv0ez5vVaQhdGwPbdtKGVTysxQS8U3pAjsyPcixjJT+HWK/Gvbf5q2ZAXaaK67qb8ScqD8HnlxjdamNqDIQUmcKUGgBwH4uCj0pTSCODPBWBNdNhICjKIW75K/G7Q1pdH2hK8BudzFYgTZcrTn1CkUm6+CDpHJyATQNcyfE5g2OfMYe9TYNSSzKgXno+GD1aSyoUSM+SnyzqUbrG0ZpL3GoIUwZD7OLjJikY4BYAoxySaBUGAoptRHg5GEbCKOJiHCmtuLWWO6XZ5T2ljm5W8IsWI5WsvKpvZPO9yFd22bCWNJ1bD/3MRTQwylAUn7585R2x/QZhjQLLCNqMmrUSyAlI2jtQCkGQIIskpQZWcmZmKMiiKpI+3U8NnY0cMzKE61FfqmHZh+sGUtlrFpmCK1AKijL4pS5jBtiyrLAowvRfeDNMMAQeUkGkahmdbQho0KyIqNMxuwAmaeMH8LwJlBALAZ3qMOTHA8PzoBcU9Fm+fSOMrACAEyx2hsSw2H4l0kOLaLYpA1dAjWcVhQtra0k9O+xt3mKAuUZ5nL8gsUrQJDLGYMLOUMOGeqpBU8lnhNnVuFRkO4yKnMbcrTmqfM7021dHIh04SL5fdscZu1c+F9aLkuoaUODeInhquNV8H10UHKUjWHoOZD8uFFIx/b1vlesbLZAdhUB2i+IFvzbxIApCgyrSzIEYg0ksVIK3UcKqYiFyq5EJLQ3KetbV6oY9MzTUpCP0Dj+zp69StjkxA4ia6/aBZ+dkpLUJToTAekpdmABN8L61HL1t4M2i/8aW6RwuPT3Jg9zF8AkN1nSjKFFaYrnomEIikI5fYhqDv9etwtmR066bG5MTNJypP0lNjBLI3BiWs4BVUHdxGO9ZT5bjq5lZmgyCDTaFFLGfZ6PgTQiZlr2hfYYklImCpY5DRaozUV8lBAGoPykM15NCwQ1lZAFPOQtjxNdbBSAdq/Xyhrbra367cW00ePlXHKbWQcCT/BacFATxzmTjXWzAjSDjo0Q6sP2Vrs37wrWoZbxekxXSVp8BjaEJoZU5kpIUAx1FkSgxsLNbPE29SnrdpqJwyK94oErgQQCcBxqAyh5cE8Mz2rBaAdBjBDzGQB0PMCy6dmBLB8rDZWGC+wqfk1tUxrAVWDztsGmLcAQA+xaMjYNsBazotfMGLl3dGh/1dz9v1fKooWlnpgkxrniBaQNAdP5qWPV0KclitDL07P+e7tb8PsF2ctncZaxuTTEb9s+5s1EawsCoJWk1qaSrXkL1ufh9YysGZBYKfFFR0YBnYa+CUU8oLp6zPFb9Dy/PR+hYKFANM8w1raCdSO0IKP9b5LikAkwtXTpFR0UVwHwGceqloS5roJigrRTqurY9PzokD5wsSWEeZzee0WLuOf4/Zxz7nl3Q6jxb8tPg6Yxs9iYMo9K7AKz5FbNXb8b4gh/0+JWXuS0gBImOF5ZvrADvnUuaN8XTQ06ZPVZ+HEQeETa1kwmfL/WqDQAWIPEACZJLc8y5m7SEPthzWk6Rzt7cbKLgsmfnnwxcfu1qYGx19ywsnY7ItTkA3t0ULErA2jwIydqz28dj6cycYY3Wo01g5fS55aCLDp8xUFD3whj1xgiHZlle3LX6x70adgz40ja0YroigMoH0eOfOoukmc+3eyX/3b9ovWH3rqggUsmQ+s3TDoe3XnXZxW/xetjWJb5r+b03SKgxX6giyL2iHie8e/9LVfgN2A2//zmAtZnb2wWcICNA0FiiALhZOKj+a9Ndy8/YiMy6hRVn0iC/9D0znTzEZTeoxrueHyXthN4GaaKnc2WU9/3oFtNK05l7mH3KwHsPfVdBA05vezAoPmTFlgrPwd85xx9jWcfC355+XQONQ4uZBU3qIVfyHfFrwNx2IhL9moQ3O9ZEMotbRHo51kA5edtbCzIzZfvVpqOptvz4G/q1Cw+XpP1sTIrL3wbSMIpBmXat8H5FN8VH8+j9BWyAL9apqRFduS7aJhbWepw7wjXXVgGpBV1NJK1m4MY6kzf1ZXjjtq2ojhmA3TPrCbwISoGUMi13ZMmPGXKCzQoVWZ6KWlufE0VZICaLU9LTSiqVy1yk2NaY33n0w3WjyuF5DjbAVTJjmt6tOLTcDMH9s89Du0doA+OiHnkwAtnMBMMdM6A7X+QC07xHsou1miViGp8jX9FfDbemj80ISf1kwA1YuZ8tN1EmaZbgddbiOcbCQmPCrByRpz4FbQyRw/LfDRJrWa7zbrAMghq/0xeh0AvpeM3L64A77oBYJHPjJj8a9pma7rqvUATA1JmLXuqG2p7R2ujtS+ag1AqteJ2HUWepU40+sOqJFM/VWSoga7CZjjmoazANps8FP4LWVRKgM5pTLGZh10djqYtwWA5ZpQgzQaq7LGRX0s/jaJnnUcJQTUir80PQh2FzK23TELBVU7ZqxwNJxHwV4zyBmIfEQkBGJkFpUSQZ+L4jVaS05Tk5IcEDhDIcGJ+ARLNbNyPPLMEExmLAOTmGFikTKFg9YsEM5YJamOFj8lIiCJRjOvs0kWcyVoVD5YPm7LTnVSuHmen8RyCFV++sSV6iBNHhp/ZvGTYUjlj3mF03Qp5UW4aTxu6yCm1oVwWyFJTNCog26jBn4tZFAADW08qvM7IHcKqGxYzyEHCdPB+lJcZS4grzdTv037ikYbZLbu2KaRbQM1FU1CXHv0qQ9ZRuss2XbYTcDcDtJfKBSuFeNmmmG1BmuSNAQAMtwYzBPmLQAyz9kpiKHzXX7NMKA4H9U0jmLGAvC0+Z4lj5CDg7tVDs74jY7SplIlbpiGWw1rGIsYjLShSIwASAyTopeYUkrEjUdiemIchue8LmBF2rPBjRAfvkejLVrJ6VhmTQ2zkspMuclDOaCNALDJ4MckEsM8MSacplot+77ux4gHr3PCn+iya2GjCdOWH9IGcery67Ir/LYOljnxXEYClrK+DaUakjnlgclJdPk5llcLnMa5bSNV/lTjz5k/tuWnNkLbQwkXSThvhD0csPY3usjkPgkAWkVp2paSQ21M9c8a/SfSRv/Fqn2zvA3SJFPtQG1AyyXdRE1B/BV2A4jmHUgfTm7D3Oq3vN66Y7Z1pkmzjFRoL7HjleYUFr4dzN8CYN49agcebtaZq6LawRM0DwXsHA8JANpqiU7r1UUjIewLuwMp/2/qRI4dwhVhauLMmT9rMI/aTNVodhIExIxK49F1WjVK7xEe7GiGzLOo7m/fTyz66KIalwESu4/JJcJXzNpgTH0EYzVoArJ4VR6YZKwFiyonMQ4yf2+NZQfzZRctrXpjAY7kivh1+ZsFmE30oQvhzIwwyEweEAtTfnwfhZdfk3CQv/Iry5PgxhCFGAkaN27g5wa/xssL+HU9sqRRB5kTvW4fwkGLWFCg/Bj2cGDS/7GbOeAphgeVlDVUoBHW1LaaTnQb6/ZVwg+1v+rHmBah4XwHJieGPw8+7NQdsBvw177xfbioLiazTzO/Hf6Z4XRRIuRTuWYIQkNX8LCQpbthnjBvAbDfWHR35ro1qawAKHjUrWfKCgLZGBLQp7t+oMbUvFbBkUz9ibAbkK5Mf+hm/jZHEWammUsxMuRJm8ONJNURmSYG1aGswPgOErVfl9Bb57BGDHz9J2d//qZ9o/Kvl0QcekgIoGCguWWrsS1+lrBGHjEYJpK5RaGYX+EX4CFzluoM9kn7rv/mGy+7ZU3a+41lsQu9+B4JGq1ZC3UgIrX4Y4tXl10JLlMHbphS4wfYJy7fvbI+/LPVce8Xl0cu9LXgh7SI37RN3GijKXWIdR1sPphHtMjr2Qh7OHCRbvRSLyIB4CsLrkXIFmjD0opoU38Za63PYpygjnCqsYZ9GbNrYDehFFcP5VlN7V6h+b3I/MYCsPyk5IBl/kzrUyeswCrYBPOE+c8CrF9P32DepLS6qgBdtWvRC5o/l2Cg/QBuoL4ic6Iq8Inxf4PdgKtPvLruCP9SD8fRLgoAFzvHVZJZEyqLddJMCIqBILYaWWhpjkzJoyxnzjIy5+p6ub40W3wJ5fEg6PnQfnEJFuNYOoy1AFD4I4sfDIM0hAtExsyn+wq/Ti4KlzIy57KaDyuy/osI/8p04KP7R+VkaeIgfqkFTGw0eUGAQCEfe05DFVbIw0XLIsQ8FtddWJ71fHT9qeuTJcmizx8Y9w4tiz3owfJ5pvxOZMpebB/D6JLKHwldfpMHN3VGUQ8+up7KsXv14CFHbYU9HK486cObncy/xss8HMJxzfyJoQ875LN1Lwg7mTT6UFlXyjJEJVMn5k8hrMH2gUheBbsJrqgexmUV+VsYPmeGf8zHQU3+QMM7wgoAchq6N7EORIjqwOcEJI3cv5AFII0Q0FY/rdArLIAXhUS1o51WaTPONKJhwAvlbs4qoVS/zE9LN7t1YuAEmQCFgGLoTJvzhoC16VZIkTb1GUpzhozj1DIIkLj7qx4sisKLP3HUyXcQ/i+t+/h3FyXlH/QhA5XIjFa4U2NxEO5M40u0adiMPzNJEw0JmJ6aA8vinm9e/qrTf0L4v372h29alPZcPhAFUE7IVCcBpk1MZnA08IucGBWDmvtKgFG9SYDVOCytBzeuEqs+Q/g3nnfR2CLRe/7ipARltGTIirH4VR7FMhfwMzMU0sILy49t5GIbeVW0kKrOEFTid8FeAuWk/J9+HOzwUxwKpEIpCR7rPmSJ1eyiLY1AnBnGT7ANMNUSCCpoZVWc8wafetY47AYQrfO0djiXdf21oZmdYcxpWAB5Mm8UzH+9LDXYLd9DK3REAKSe+0fawpo0uw1ZLvPpCiMEyHGhd6wALQAoUlAIapuNidGHjAxe8GjYDVg/uL7qifLRQRxU3BoxQYRmPKbICIO6NtmICUGlTH1HQJKcmQ6l5FapU4l5Sj9blPS8r5CFDFPnpHJUvieIHAiUpZBqYsA8mMGtvk0gZlWpcM3iR+YJKwwWV/zbl7DgjcU6VJKl7yjH5d+GkYflRjM+0sTGo0SVPS9/nOX1sNd53ZYfBRhq5oGaP9aX+EcPHnVUbPFf+eb3XInl/2oY+bSLD+JPVdmdFvw62fJroudU/iolFGA44ds36Wao/U/4+PP2nihBnzrjnK1BGp4YJmHmxQ5aAiRkkzwx6kcUCJRAHbPm9q3H2A4xtkGMfSigv+Z/+ZJnnXk17CbcfPFpj3bSsYcwNOW44nOeJ7DDgKIVoIbTWcMJCLR1XfhH6AB0RADEnv/zjAJYqOk9MwyQMl9Aob9TNUdhTBiyFmgzEHQgupMjwMdHj4XdhKsGL/1jSfS/qlQPq0ElRRMVBUCtjoKgjswaIfNFyCSx6cgIGROtDrzv4HMcO9WtZNBDzF/t/cOSkeSVReYhWH/2B7Z4Sc8Rpah3m193lACweCkRTo64CS+zvxE/R/yOwU/CZUmlvGlxNTh88MijmxxHG9/ylpor/Zf0RH1/CeooBOhLMcRHwsyhsprEVNlNHVSdIlUHt0paCRB/OLE4CV920atO+FtLE8kJ1nNSX9T3/0Icfij81B61Av5CHWw7cZOHi20aTqJ1NOlnA3Fw8sX/dsx1sJfBZ88853s9Wf+p5bg389ES8mISgljHqG6OlGKTDI3YdsE29ioRlCcFLJ4Mr1skym+Yz5bcflQ51hPjyPypGfszvVyJOQ0B0DQtYPkm1XwFJVSgi38BHYDdMrtbQW5Y6wz9ALaWh7YvcyYnlERV01lOiFMVoY4LaAJwQBgA9AQq3p36uH94K2S1Sajt9/CtvY968gHsrLN2e3XTGy688KmRU/9a5NX3TwOK2UcRb3REHcqfAl2oRR+YHK5XiNGGl72iDItl7zf9uPf1g687Ylqz7rQPfvCgKqQbJvnkExOcE6SoMWBxY6LdYrnF72j8tJFnjyjBItn/f/1p8Op3vPZl90yP/1OL63zsmklWeXHdiSDzmW431+Kn3XcclQdtvEFrfNCLAqEIYBH03TYgg7X/+apX/Wk6/GsHB/0+r+eSClROq3k4P+ghMfm6X3QADNfkwXT7YPKQIAPpwwD07hiA0omDr1j7PdiL4bSPXv6SSV65ssInlqa0nyT1oQnewog+Xeo/phJ3pGljBr0ykAOy9Mne2qK3tiqIucD1gyeED4Hx20vxLas9VgUPFaHD0T/hlLHty3po7DgmmQ8kyFmDwwUQVTUaEO7+O/kjHr2qEz6AjggAgq1vOHpDz45ta91xFACoeclLTrvEcBQAzAuMAMAUYCqjUCj5atccQO0vhzdDXF4K8cGHvL7/g5fstmOF4M2Dg4smpHxnxuI3Rm5cpkhBkoIsGgGgNm5w9P76ZV6GPtZ3a5/be+Hg0S8nj/Yupfrg4AZ/k3fXmyKon1PntWWpi74Oj6kIOswj5qQOddS+8gErwQDv297Lej+4rbLjk+tPncWaeSnZGz946etqrP6eGqseQIKG8DOXqzyIQTk3uwOzEPp532Qv7/lEfy34wLknvXQCZgEoaJ5fTyc+jPgfn3gJEhQSghJmWoBRHVy1M7APWPakz+35Uq8ILrzw2FdugQcAnHPR59eMOBPvr7PqMXWn6lEfIkEo5iemo7bmaMnSNuglbIM+3vPHHl465wNrT/hvmCfc9oE3nNhT/eeVvtiKfZipdnZ4gAKgB/M1QUG5YX5XLQnFt1AnosMQBB19iP2Dvxmc9sVXQQegYwLgrlOPP27RyI4veKPDaJ7WtJOJvo9GK4D7QSFKMFawRFYARQ7GSsZYsZ1bIIvraAU84p+9T3jGo9ip8/+45K2DVyyLYfw1iZMeLh32BPRNLAPPQSUdxK7j31lyS78qez3Xyk1/+eHg4Nwl6dsuvqYnjsZfUWfRkZLLJ2NajZof+9NLfTfYHDilX5e88Lv7ZqVvn3rqkXNesnnKKVd43kHyiEzUXp7x7Gmo6PfHeniO62ee4w/5jv/Hklf+/tK+gQ1vOeqFwzBXQEFz9gc/++xY1tamPH0mirGDkeACx3Gk5/mjHg9uCNzSj3q88lff8frprZa9Gc790BceVHUmXps4yQuwjR+DfbgIVT5DBRF5rnuL7/r/WwJ/4/uPP/5/OxGF5/dXnOIt27Ljrz3xbQ/12CSSP9Pan5fAoe3BXB2cJhcA6jMDYgWr/emztwGIeg45ofSGT34BOgAdEwA3nXHG0uXjWzeXdg75vDKpHEq0zJKkW0MA2GGAb6wAT0u48WG0AragFbAYqgc94vQlF1/+aegssHWXXeY/KjjQ2bKlNx4cPGzeplMrXHEFheJag2lzcuqpnf86DoWUu3r1E/0tW2rp4ODum6DTwYYNG5yRkVIQRU62bt3hMesAwe9NgNPW7PLLf+APB5nzt8W1aCGWON/2vte/sVy79dOBtNrfUfspkvbnbsnEI3T1JorK/KcuIObHJGtquXLq7Bu7A49cw47/4LxXARJ0TAAQbDnx6O/0Dg8d6UyMawcKLc+leHlo2rCiH4CsgHKgE5nnZAWQL6CKvoB9Dt4BKw58ZN8HPzgEXejCAwRu+cC65UF0199LyR3LPF5BAUDRqsj819qf4ZS40vy0SI4cD2p6gFYjWfOfzgOIgod8NzzjSy+BDkFHZgEspL5/dRaU1FhV73ALai0A7YSSr2FWe05narpFbT9LQs5Ha6BnAMfmOE89dM8yMb7jEuhCFx5AwJMdlwQpOslZjUYZagtxZnZUZtxtLALKPwOw8/6JmQGg7X96IXMXXQkdhI4KgPHhyvfiINxEnnclBJjdkTVT+6GZfbkLQiDRR6p4qU8JATdCz+jQPUePvv1Ne3zYqS50YTZwy/tff1SYbDvGgVFkfmE+x3b0VuoU8p0Xpv+4NcrNtB99WKLW0niQukvvKUP8feggdFQAHLJxYxz7wWcEWgEUb14vDNJ7pykBULQEUvXhNTo4E/VppRoe9CwCHpbBH9/OnO2b1g+d/5aHQhe6sBfDTR84+aF+fet6Xw6hjzVWU6vcRHrmPFQBaaG4AlCBbHxRpub+aa/MMqR84DPs1PUd9S91VAAQVJzSFVHYMyFp/t11GsEc1IfmZscFZQlkeghAVkCsKwnI/NC3BIcCDgRD9ywKhrZee8fgmxdBF7qwF8KfkHZL8Y5rQ7F1QJn+5NdTmt8wv1KSbvMHQASK6U1SCtODhC+dyLy+9dBh6LgAeNj69Ttiv7Q+C3tQAGjzRoX8oB1RRYH5s4IvgIQAWQMkCXv6AfqXgoeVD7fecciSLcPfkIODIXShC3sR/OpjZ5f6YdM3w2TTIS6bQI+/0KHDKKlQ8b7yAeTmPxS/+ksL5j+FpOtB7//iK/pP/ehufXo8E3RcAGik/KKo1Dsmg1CtsFIOQdD7oss0a/gBMmMV1GM9FEh1hBnyBZAl4KZ1CDff9rzxzbdfe+/gYBm60IW9AHC+v7xy/J5vlpN7/s1jY8j8mXH8keYPjOnvN2t/s1W+3oTBmv/024eYLRuTbNmHYQFgQQTA6quuGqqH5Q+lpV61DFcqK8DOCKSa0dOCFUBDgXpi/AH4IC0fRn8A610MHk4RhltuO7zv3lt/uOX885dDF7qwB8MNF79xxeItO35UTu4+3GcjyPypZn5l9uOUuFPCFDSYP3f7mx1/ZNrw/AvaDr8fEn/5B/vOWphp8QURAASpEJdGYf8/BY7rJa21JitA6hBJekYgmzoUiIwQoNWPNJ3YS0JgEfgJCYFbn9mz+dbfjL79jCdAF7qwB8I/3vf6Q/sn7/1NT3rXMwJumF+t9kPmZz76tsrK/KeAqlD88s+a/iIpWADELyWoOyv/ubNv+cdhgWDBBMCBV19dr3uldXGpX6qhAG0bRnsv2ig/FH86FY2pwTRtCAHyCZDJEJBTcLGyBrw0gtL2Ow50N939i+EzTzpdStnRRUxd6MLuAm1tefN7XndmKbr7f3uyuw7wjdnvqg+29Fy/Q5qf0y5YnvH6m3G/ClgiGtsQKc0v1bRfzJbK1F9yxoEnDtZhgWDBmWjz697w2d6x7W9wx0eB1+vAMqGDSDpqs2a9MtB1TMJG8V39wRAlWiVIK1LjGsDkGE4xjKgwUHF5EURLVv93umjJmcs++ol/QBe6cD/BjR845eHleOgT5Wzb83xArc8i4+3nZrrPan5kfma8/lDc+ss4/fQedbnjL4XFUPMO+mz/2z91CiwgdCY8+AxQK/O3Ocni5/UkyYFk6nOsJAXiICuA5A+H4v5noHfVIVA7CVkBgT6BXt1gvDYBQWWY4gM+L65O3DB88nFXZMuXfHD5By59QHyp1oW9A/5+ySmrUamdH9ZvPzWUO3yXVZDxUx0b0DI/eft5uVnzF2No5NvkGbNf+QDQ6y97IHZX354EK94GCwz3iRm96YR1Ty1NDP8sHN2uPxRCc5/CKKuGos9olSVQsAIcbr4ZcLRFQInGBBT8vV4BqI7jUKGqLKU07INkYFk1LvddnfX0fXz5xz75T+hCFxYI1MKebOQsLx0/MZA7yorxWWKW7xtPP4kB5e0vKW+/mu6bwvz0X2Y0v92JlGRCiOP+faJxf9/nrnrrh38NCwz32Tj6nmPOXNc7sf0yf3wH8GoVeKZi2xSEgNMQAupbaK7PPSMEPK6XSZKkjHFIVJtEYTCB1lOM/hIXsrAXkt7FIin1/kyUyl8T/b3f7VoFXegEkLb367UjnWTsNZ4Yf44vR9GQryE5EuNLw/h6Rx/18Rujab5AnUPO/G08/or5rdeflsz7ELGVUPMPPHPJORd/Eu4DuC8daeze157+ud7xba93x3cqf4AKLwV684VcCFjGz4WA+e1b68CMm1KaMagpIUA+Ago1LkkQ+CXIgh5Iy30i9Ut/yzz/l4nj/yYpeX/z/IE7Jycnxx+ydGkCg4PF0J1d+BcGtSHt4CC7dclO5Fjo57V4fwbVR7C09lRXxs/kovIoZHyczK4i+dE+fpmOBUyMb7byYma8r8f6gdb60OLsM5k1PvJprPaTONxNYCnUgoM+P3DuJSffV7R5n3rSbzl8XdDbG3+/Z3zb85wJdArGEXAhVVBpxvVONNoSMMMAKwQcaw3whhBgRopaQUCfFFtBoPZN90C4PqYQhOdD5lByQXAnldypowipogSoYjMn2Fs0OSnVhwszgNnOFCCPjMl0EBRupDrA1Ba1Czxa474xWfjwAwrvSpNPYVNIVszd5M1b32NtnoXm8rTi4YW159DmFTb1Yv5G67Mt80nKWGs5500vFM5b68IKxZzSnlPftbhFO9y2vE3XVEfTlgcOdjsyvSzhFHUPk2nIZOySn4pJpE3ARLFvWaqYXoWyA+3gU8vdiPFJANBHPSxQAqDB+Mbkt4WxAXKEmML8gj70gUWk+X8y1CNffPBZl8876Ods4T4VAAQ71w32J/du/kl5fNuTHPTs8zhWQS652RVV70lXYHy7NRIvCgN7zVgDecC8uknYfjg0UB8hKb6mLuc65d1oQpkXQpq3gsz/Z4VrBWYpEiOT0BTmNbf4WMtvaP8+WKaS7Z8hKNATM2XP8y46UqEZb/P1NoKqqRyNOrCmOjDzjzU/pza0bP9+jmPafGRz+wAUrsm2bTS1Ts3tJS0OKNwH2dS2sqnHhfmdmWd1AE5movCyQlsrTQ96A09Q52i1ktZvYnwtHHRGhcqrVX32Cz97RGc4yqBE4qxWcODv0t6HPH/pWbu31fjuwn0uAAhuOu78pUsnhn8Ujm17glNBSyBJtBCgxrWWQHEIQBrfmeZIQoDrTs6jf6oAd7G2DshxiNdoBaIUulOliVkoZUMbSkuUhWvQ8r8G1kxgJslWZrfMWmDaZgEhG7haGTR/tg1j5+e23gXc9hFWZIpCeW0VC+d5laYwZOPI8nqwNu+0w9XybMv94tGWVZp8ZCF72VT/aQRjU3s27jX1m2H+VgErC/eay1kQeIahddBOYnqup/MYBR73cmGgG6gd4wM0BfUwR6mY34VUDkA9OPCPk2zlC/a94IKO7PIzF2BwP8E9J529xN9R/344vvWpbnVMDwe0XaYdg2Z33XyzRl5kfqYtAs4KQsDWxsQisKFurVAQhc+R84Al2kjNu7+tKVAgJSsXWEsiyPMvMOyMDFx8BpoIl7FWIdPKaLKZsVvzheKz07yTCzLWfL9dGaFxC6ZlZNM4rJB5a1mKzMZaBQ5MrTPAVMYvCs3pytNyTbY+Y87lFMaH5gdyy4dDUevrzrZMbzPkbRgfzNd8dopPGJMfmV+4aq4/8g/6DevZ54iBt7xl7vs6dgDuNwFAsP30wd7s3pGvlSa2vMitjODcfh2YMF5VrqUut0KgyPx2u2TOWhI0M2YemKQd40sTpEQ0DYvzI0Bz68jpmGUa0x9gqpCY9TNFnO2YhM2Mr5PHVvwwzTmbw72Z6j4Lhp7xmVldn47xZbOkK5rzU47Mmn0N7WCZnkDI5lBeajiqPE2QCR8dT8vI7L8u8xe/Zvm5585qN+eFAAb3M1z/3EH3YYvHLwrGt53tV4aZgw49LjLdzDQcINPQ0Xu1N7R/4VhMqn9YC2HZHikc87DlrffmAHMl3Lk8P9MzuzrOFQfMMY/ZXtvVvemuLUQdp3s+v9fa/zO8WGT2/AgN5s9jYjaUjt4PgzQ/Q+YPIWGrZBzuf+mSjJ/DBue/t/98gMEeAve+6tzX+OM71gcTQ31OfRKnCPVUCwXAUGGT6MjZVEGgrDFeEM4FQUDQTurb37vB9433YWZmb3cOtnyzNWEZtNVWMx7tO6xB3MzggjbmdJPZ3q7MxXaUU9+ZroxTztvkPxPTT1vHdvWY5l2AXbcZtDyrqiinf0BZkOaehGbGt9GvjJUphTBfwJJM4JCKXojcfSfTcJ9Tlr/jHV+FPQAY7EFw56vf8YhgfOzLpfFtj3dr6BdARx5th6D3UGP6aARBwxKAhiAoWgKW6Nt1eCdqPRcBMBsinTMjtHl/d+7PxCwwx/d29VyxLLuq61zaYHeFwZTzmcaA0EbbA+Rh74uMbzS+VGN91PqZr8f7wYP+BP7qY5a98+ybYA8BBnsYyLWD/takfoE7PnSeP7EjcONKYUjAcmGQCwI7TCues4JAIMgJgXWO+Yt4d5d4pxMEM53PBi/M8N5Mz7YrH8zxndk+PxcBMNO1+RynuzYTGLdRzvjGrySNMJDGyadHAKj1ZQ8k7uo4DdZ8aHR40QcOvvys+2yOfzawxwkAC3e/+v2P8sZ3XO6PDT3Xr+FUYVoHBxtbf0RlnYRgPOas4a9pEgDmfFoCaKm+/Slbzu09CTMz8kzEPB/iXkhmmO+9XTHTrt6bS/3mUre5lLPdvSI0aX6ZH6Ux+/VBqKk9ShkyvlBj/WWQhmuuT8srz1p14Zs6Es6707DHCgACmrnd8sp3vcIZG/2AN7HjoV40jr6BuCEI8BlmZgusMFBDxFZHIGMzE9CcgDUOMxHydL9neh5gZiKGWbyzO8/AHO7N9t25lGdW9S/6NYr3W/wRTTjsPQbNU6aw6zq2gjTThhIa2t4yvdL8WuNnIoCMLYLEX31zFiy7cMV7zrmWzc/btKCwWyxwX8PvTznFW7VjzTHu+Ni5OCx4uFsfB0fEamig1vVxMyzIE5h5aUMTTYTBptba/s61PdO9XPxyq9070zE428UzMIfrs7nWiWMr/t15d7prrffnUseZ8p62DoW1BrtyGELrNdnCrY3fDY1fYHrl93MwBZDyRZB6K/+RhksvWuVUv3R/e/hnAwz2IpBrNzjb4NYXyfHR073K6PPdyqjj4NCAi0Q5CzWvtwoBlgsBy/+22k2VLwqBwg1ZuKYmDtot7Z2JmXclEGAW12ZzbxbPsOLvds/MhHtX+e7qndmUc9bXCh3S8pycE7O3vNO06Muc21Wj0BAAQu3Tj0l4kMkSpM7SLPOW/iQNFn96zT/3/R7b2Pm4ggsFe5UAKMIdr7nkgFJ17LW8Vn01r4w+xq2NMxIGTNKmIyQMzIp/BkaRs8YR9HH3a2+IjxXwzIb5ATonDDp5nO292b4707XdqX87fG2Yf1ocrDFt3/a5fJmwOW866jOaxpNqsw7U9sT0fEAKb/GNwuv/uvCWf2XN+99wF+yFsNcKgCJsO/6yB8uJiSOgVn2BG9WfxmoTS9WCoiwCJlKkFSMQkGiap6xb5q+Ltp9tGVnQNMXmmgvzzlYI7PLYovXy38UyAjStUiziyIWebGGudu/L/Egi067LZzOtSzDnTSY0a0abM+IsmBZm8yzMfpw/nXUgzbvSXJR5IrvSBcECELwMwunfKdzw/8Dt+xELBq5b+b5Tb4O9HB4QAqAINEzY3LfjIe5k7UmsVn0UZPHBPE32YVLugxOyyyBLAiYy9QEwzdWwaVcDWonA2roAmh5jba5NuV/khJaFOkVGbvd+u/Pp7s3m3d3BP5v32jZSwZeinmljvu/qOJOgMc2Yf+ijrlkB1ua9/FnzIn0NqnbnpShWDip5F51L7k70JN8rHG+zcPxbuNNzY+qXf7fm8YtvYUftPeb9bOABJwBmgusHB93Hje7fG6XOYlaP+nAcF3IuXJZkDm3ejtM3qj3UBmRC0AebjU0TzQk943AuMyGYg89knH7jsXCdnqNzgDR/Xr8r8vN2QPclp2/E3KZrze+kKvAqHXAGhKWQQivO4jvF8rTLn3HMUzSXL3/Hx+sFN1bGzftNDTO1jOp9Vxe1CHmZDB6Gz6VN9zTidnWmutpyNvIUzfWmvqBn3FRhYoI3PUN9Ie1v7kiHqip5ipfqMgwmkC5Gh4YnJw9df2pH4+91oQtd6EIXutCFLnShC13oQhe60IUudKELXehCF7rQhS50oQtd6EIXutCFLnShC13oQhe60IUudKELXehCF7rQhS50oQtd6EIXutCFLnShC13owm7A/weUEW7sSNl7agAAAABJRU5ErkJggg=="
+def __getattr__(attr: str) -> str:
+    name = _LEGACY_NAMES.get(attr)
+    if name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+    return icon_data_uri(name)
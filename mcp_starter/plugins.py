@@ -0,0 +1,183 @@
+"""Tool Plugins - extra tools discovered through Python entry points.
+
+Installed packages can contribute tools by declaring an entry point in the
+``mcp_python_starter.tools`` group that points at a ``ToolPlugin``:
+
+    # pyproject.toml of the plugin package
+    [project.entry-points."mcp_python_starter.tools"]
+    word_count = "my_plugin.spec:WORD_COUNT"
+
+    # my_plugin/spec.py - keep this module cheap to import
+    WORD_COUNT = ToolPlugin(
+        name="word_count",
+        description="Count the words in a text",
+        target="my_plugin.impl:word_count",
+        input_schema={
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"],
+        },
+        annotations=ToolAnnotations(readOnlyHint=True, idempotentHint=True),
+    )
+
+WHY LAZY:
+Everything a client needs for ``tools/list`` (name, schema, annotations, icon)
+comes from the declaration, so startup only imports the small spec modules.
+The implementation module named by ``target`` is imported on the tool's first
+``tools/call``. With dozens of tools, most never pay their import cost.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from typing import Any
+
+from mcp.server.fastmcp import Context
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools import Tool
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+from mcp.types import CallToolResult, Icon, ToolAnnotations
+from pydantic import PrivateAttr
+from pydantic_core import to_jsonable_python
+
+from .icons import ICON_NAMES, tool_icons
+
+ENTRY_POINT_GROUP = "mcp_python_starter.tools"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ToolPlugin:
+    """Declaration of a plugin tool.
+
+    Args:
+        name: Tool name
+        description: What the tool does
+        target: ``"module:function"`` implementing the tool, imported on first call
+        input_schema: JSON schema for the arguments (the function's own signature
+            still validates them once imported)
+        output_schema: Optional JSON schema for structured output: the function's
+            return value, or ``{"result": value}`` when that isn't an object
+        title: Optional human-readable title
+        annotations: Optional ToolAnnotations
+        icon: An asset name from ``mcp_starter/assets/icons`` or an icon URL
+    """
+
+    name: str
+    description: str
+    target: str
+    input_schema: dict[str, Any] = field(
+        default_factory=lambda: {"type": "object", "properties": {}}
+    )
+    output_schema: dict[str, Any] | None = None
+    title: str | None = None
+    annotations: ToolAnnotations | None = None
+    icon: str | None = None
+
+
+def _call_through_run(**arguments: Any) -> Any:
+    """``fn`` of a LazyTool: calls go through ``LazyTool.run``, which imports the target."""
+    raise RuntimeError("Plugin tools are called through LazyTool.run(), which imports them first")
+
+
+class LazyTool(Tool):
+    """A Tool advertised from its declaration, imported on first call."""
+
+    target: str
+    declared_output_schema: dict[str, Any] | None = None
+    _impl: Tool | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_plugin(cls, plugin: ToolPlugin) -> LazyTool:
+        if plugin.icon is None:
+            icons = None
+        elif plugin.icon in ICON_NAMES:
+            icons = tool_icons(plugin.icon)
+        else:
+            icons = [Icon(src=plugin.icon)]
+        return cls(
+            fn=_call_through_run,
+            name=plugin.name,
+            title=plugin.title,
+            description=plugin.description,
+            parameters=plugin.input_schema,
+            fn_metadata=func_metadata(_call_through_run),
+            is_async=False,
+            context_kwarg=None,
+            annotations=plugin.annotations,
+            icons=icons,
+            target=plugin.target,
+            declared_output_schema=plugin.output_schema,
+        )
+
+    @property
+    def output_schema(self) -> dict[str, Any] | None:  # type: ignore[override]
+        return self.declared_output_schema
+
+    @property
+    def is_imported(self) -> bool:
+        return self._impl is not None
+
+    def load(self) -> Tool:
+        """The implementation as a Tool, imported on first use.
+
+        Its structured output is not derived from the function's return
+        annotation: the declared ``output_schema`` is what clients were shown,
+        so ``run`` reports the return value against that instead.
+        """
+        if self._impl is None:
+            module_name, _, attr = self.target.partition(":")
+            try:
+                fn = getattr(importlib.import_module(module_name), attr)
+            except (ImportError, AttributeError) as e:
+                raise ToolError(f"Error loading tool {self.name}: {e}") from e
+            self._impl = Tool.from_function(
+                fn,
+                name=self.name,
+                title=self.title,
+                description=self.description,
+                annotations=self.annotations,
+                icons=self.icons,
+                structured_output=False,
+            )
+        return self._impl
+
+    async def run(
+        self,
+        arguments: dict[str, Any],
+        context: Context[Any, Any, Any] | None = None,
+        convert_result: bool = False,
+    ) -> Any:
+        impl = self.load()
+        result = await impl.run(arguments, context=context)
+        if not convert_result:
+            return result
+        content = impl.fn_metadata.convert_result(result)
+        if self.declared_output_schema is None or isinstance(result, CallToolResult):
+            return content
+        # Validated against the declared schema by the lowlevel call_tool handler
+        structured = to_jsonable_python(result)
+        return content, structured if isinstance(structured, dict) else {"result": structured}
+
+
+def discover_tool_plugins() -> list[Tool]:
+    """Build lazy tools for every ToolPlugin registered under ENTRY_POINT_GROUP.
+
+    Broken plugins are logged and skipped so they can't stop the server.
+    """
+    tools: list[Tool] = []
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            plugin = entry_point.load()
+        except Exception:
+            logger.exception("Failed to load tool plugin %r", entry_point.value)
+            continue
+        if not isinstance(plugin, ToolPlugin):
+            logger.warning("Entry point %r is not a ToolPlugin, skipping", entry_point.value)
+            continue
+        tools.append(LazyTool.from_plugin(plugin))
+    return tools
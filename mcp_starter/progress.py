@@ -0,0 +1,164 @@
+"""Progress Throttle - coalesce progress and status updates per progress token.
+
+Every ``report_progress`` call becomes a JSON-RPC notification and a transport
+write, but clients rarely render more than a few updates per second. The
+throttle forwards at most one update per ``min_interval`` for each progress
+token (or task):
+
+- An update arriving too soon is held back; a newer one replaces it, so the
+  latest value is always what gets forwarded, once the interval has passed
+- Final updates (progress >= total) are never held back or dropped
+- Updates that were replaced before being sent are counted as suppressed
+
+Used by `long_task` (through ``report_progress``) and by the status updates
+of the task server in `tasks.py`. Not for updates that each carry new content,
+like `ask_llm`'s streamed chunks: those would be dropped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from mcp.server.fastmcp import Context
+
+logger = logging.getLogger(__name__)
+
+Send = Callable[[], Awaitable[None]]
+
+
+@dataclass
+class ProgressThrottleStats:
+    forwarded: int = 0
+    suppressed: int = 0
+    failed: int = 0
+
+
+@dataclass
+class _Channel:
+    last_sent: float = -math.inf
+    pending: Send | None = None
+    timer: asyncio.TimerHandle | None = None
+    inflight: asyncio.Task[None] | None = None
+
+
+class ProgressThrottle:
+    """Per-key rate limiter for progress notifications that keeps the latest update.
+
+    Args:
+        min_interval: Minimum seconds between forwarded updates per key (0 = off)
+    """
+
+    def __init__(self, min_interval: float = 0.25) -> None:
+        self.min_interval = min_interval
+        self.stats = ProgressThrottleStats()
+        self._channels: dict[Hashable, _Channel] = {}
+
+    async def report(self, key: Hashable, send: Send, final: bool = False) -> None:
+        """Forward an update now, or hold it back as the key's latest pending update.
+
+        Args:
+            key: What the update is for, e.g. ``(session, progress_token)``
+            send: Sends the notification
+            final: Send immediately and forget the key afterwards
+        """
+        channel = self._channels.setdefault(key, _Channel())
+        now = time.monotonic()
+        wait = channel.last_sent + self.min_interval - now
+        if not final and wait > 0:
+            if channel.pending is not None:
+                self.stats.suppressed += 1
+            channel.pending = send
+            if channel.timer is None:
+                loop = asyncio.get_running_loop()
+                channel.timer = loop.call_later(wait, self._send_pending, channel)
+            return
+
+        if channel.timer is not None:
+            channel.timer.cancel()
+            channel.timer = None
+        if channel.pending is not None:
+            self.stats.suppressed += 1  # Superseded by this update
+            channel.pending = None
+        if final:
+            del self._channels[key]
+        if channel.inflight is not None:
+            await channel.inflight  # Keep updates in order
+        channel.last_sent = now
+        await self._send(send)
+
+    async def close(self, key: Hashable) -> None:
+        """Send the key's pending update, if any, and forget the key."""
+        channel = self._channels.pop(key, None)
+        if channel is None:
+            return
+        if channel.timer is not None:
+            channel.timer.cancel()
+        if channel.inflight is not None:
+            await channel.inflight
+        if channel.pending is not None:
+            await self._send(channel.pending)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the key's pending update without sending it (e.g. the call was cancelled)."""
+        channel = self._channels.pop(key, None)
+        if channel is not None and channel.timer is not None:
+            channel.timer.cancel()
+
+    async def report_progress(
+        self,
+        ctx: Context[Any, Any, Any],
+        progress: float,
+        total: float | None = None,
+        message: str | None = None,
+    ) -> None:
+        """Throttled ``ctx.report_progress``, keyed by the request's progress token."""
+        meta = ctx.request_context.meta
+        if meta is None or meta.progressToken is None:
+            return  # The client didn't ask for progress
+        await self.report(
+            (ctx.request_context.session, meta.progressToken),
+            lambda: ctx.report_progress(progress, total, message),
+            final=total is not None and progress >= total,
+        )
+
+    async def close_progress(self, ctx: Context[Any, Any, Any]) -> None:
+        """Flush the request's pending progress update (call before returning)."""
+        meta = ctx.request_context.meta
+        if meta is not None and meta.progressToken is not None:
+            await self.close((ctx.request_context.session, meta.progressToken))
+
+    def snapshot(self) -> dict[str, Any]:
+        """Statistics for the progress stats resource."""
+        return {**asdict(self.stats), "min_interval": self.min_interval}
+
+    def _send_pending(self, channel: _Channel) -> None:
+        channel.timer = None
+        send, channel.pending = channel.pending, None
+        if send is None:
+            return
+        channel.last_sent = time.monotonic()
+        task = asyncio.get_running_loop().create_task(self._send(send, after=channel.inflight))
+        channel.inflight = task
+
+        def done(_: asyncio.Task[None]) -> None:
+            if channel.inflight is task:
+                channel.inflight = None
+
+        task.add_done_callback(done)
+
+    async def _send(self, send: Send, after: asyncio.Task[None] | None = None) -> None:
+        if after is not None:
+            await after  # Keep updates in order
+        try:
+            await send()
+            self.stats.forwarded += 1
+        except Exception:
+            # The client may have gone away; later updates can still succeed
+            self.stats.failed += 1
+            logger.debug("Failed to send progress notification", exc_info=True)
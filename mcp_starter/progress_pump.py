@@ -0,0 +1,111 @@
+"""Progress Pump - non-blocking progress for long-running tools.
+
+`long_task` used to await every progress notification inline, so with
+thousands of concurrent calls over HTTP each step loop stalled on its
+notification write. `ProgressPump` takes the write off the step loop:
+
+- ``post()`` queues a progress notification and returns immediately
+- One drain task per session passes them, in order, through the progress
+  throttle
+- ``flush()`` waits until a call's notifications are written, so the final
+  update is sent before the tool result
+
+Sleeping between steps stays a plain ``anyio.sleep``: a shared timing wheel
+measured no better (benchmarks/bench_long_task.py), since the event loop's
+timer heap is not the bottleneck at 10k concurrent calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from mcp.server.fastmcp import Context
+from mcp.server.session import ServerSession
+
+from .progress import ProgressThrottle
+
+
+@dataclass
+class _Update:
+    ctx: Context[Any, Any, Any]
+    progress: float
+    total: float | None
+    message: str | None
+
+
+class _SessionQueue:
+    def __init__(self) -> None:
+        self.items: deque[_Update | asyncio.Future[None]] = deque()
+        self.task: asyncio.Task[None] | None = None
+
+
+class ProgressPump:
+    """Queues progress notifications and writes them from one task per session."""
+
+    def __init__(self, throttle: ProgressThrottle) -> None:
+        self.throttle = throttle
+        self._queues: WeakKeyDictionary[ServerSession, _SessionQueue] = WeakKeyDictionary()
+
+    def post(
+        self,
+        ctx: Context[ServerSession, Any, Any],
+        progress: float,
+        total: float | None = None,
+        message: str | None = None,
+    ) -> None:
+        """Queue a progress notification without waiting for it to be written."""
+        if ctx.request_context.meta is None or ctx.request_context.meta.progressToken is None:
+            return  # The client didn't ask for progress
+        self._enqueue(ctx.session, _Update(ctx, progress, total, message))
+
+    async def flush(self, ctx: Context[ServerSession, Any, Any]) -> None:
+        """Wait until everything queued for this session so far has been written."""
+        queue = self._queues.get(ctx.session)
+        if queue is not None and (queue.items or queue.task is not None):
+            marker: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._enqueue(ctx.session, marker)
+            await marker
+        await self.throttle.close_progress(ctx)
+
+    def discard(self, session: ServerSession, progress_token: Any) -> None:
+        """Drop queued updates for one request, e.g. because it was cancelled."""
+        self.throttle.discard((session, progress_token))
+        queue = self._queues.get(session)
+        if queue is None:
+            return
+        queue.items = deque(
+            item
+            for item in queue.items
+            if isinstance(item, asyncio.Future)
+            or item.ctx.request_context.meta is None
+            or item.ctx.request_context.meta.progressToken != progress_token
+        )
+
+    def _enqueue(self, session: ServerSession, item: _Update | asyncio.Future[None]) -> None:
+        queue = self._queues.setdefault(session, _SessionQueue())
+        queue.items.append(item)
+        if queue.task is None:
+            queue.task = asyncio.get_running_loop().create_task(self._drain(queue))
+
+    async def _drain(self, queue: _SessionQueue) -> None:
+        try:
+            while queue.items:
+                item = queue.items.popleft()
+                if isinstance(item, asyncio.Future):
+                    if not item.done():
+                        item.set_result(None)
+                    continue
+                await self.throttle.report_progress(
+                    item.ctx, item.progress, item.total, item.message
+                )
+        finally:
+            queue.task = None
+            # Release flush() waiters if the drain task itself was cancelled
+            for item in queue.items:
+                if isinstance(item, asyncio.Future) and not item.done():
+                    item.set_result(None)
+            queue.items.clear()
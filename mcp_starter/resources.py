@@ -6,6 +6,14 @@ import json
 
 from mcp.server.fastmcp import FastMCP
 
+from .tools import (
+    progress_throttle,
+    result_cache,
+    session_sync,
+    tool_deadlines,
+    weather_cache,
+)
+
 # Example data for resources
 ITEMS_DATA: dict[str, dict[str, str]] = {
     "1": {"name": "Widget", "description": "A useful widget"},
@@ -56,6 +64,56 @@ hello = "world"
 - [Python SDK](https://github.com/modelcontextprotocol/python-sdk)
 """
 
+    @mcp.resource(
+        "stats://weather-cache",
+        name="Weather Cache Stats",
+        description="Hit/miss statistics for the get_weather cache",
+        mime_type="application/json",
+    )
+    def weather_cache_stats() -> str:
+        """Current statistics of the get_weather cache."""
+        return json.dumps(weather_cache.snapshot(), indent=2)
+
+    @mcp.resource(
+        "stats://result-cache",
+        name="Result Cache Stats",
+        description="Per-tool hit/miss statistics for the tool result cache",
+        mime_type="application/json",
+    )
+    def result_cache_stats() -> str:
+        """Current statistics of the tool result cache."""
+        return json.dumps(result_cache.snapshot(), indent=2)
+
+    @mcp.resource(
+        "stats://progress",
+        name="Progress Stats",
+        description="Forwarded and suppressed progress notification counts",
+        mime_type="application/json",
+    )
+    def progress_stats() -> str:
+        """Current statistics of the progress throttle."""
+        return json.dumps(progress_throttle.snapshot(), indent=2)
+
+    @mcp.resource(
+        "stats://tool-calls",
+        name="Tool Call Stats",
+        description="Per-tool call, cancellation and timeout counts",
+        mime_type="application/json",
+    )
+    def tool_call_stats() -> str:
+        """Current per-tool call statistics."""
+        return json.dumps(tool_deadlines.snapshot(), indent=2)
+
+    @mcp.resource(
+        "stats://sessions",
+        name="Session Store Stats",
+        description="Stored, resumed and cached session counts (with --session-store)",
+        mime_type="application/json",
+    )
+    def session_stats() -> str:
+        """Current statistics of the session store."""
+        return json.dumps(session_sync.snapshot(), indent=2)
+
     @mcp.resource(
         "greeting://{name}",
         name="Personalized Greeting",
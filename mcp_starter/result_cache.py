@@ -0,0 +1,168 @@
+"""Tool Result Cache - memoize read-only, idempotent tools from their annotations.
+
+A tool annotated with both ``readOnlyHint=True`` and ``idempotentHint=True``
+promises that repeating a call with the same arguments changes nothing and
+returns the same result. For such tools we can answer repeat calls from a
+cache, skipping execution entirely.
+
+Tools that take a Context are never cached, even when annotated: they talk to
+the client (progress, sampling, elicitation) and replaying their result would
+silently drop that interaction.
+
+- Keys are the tool name plus the canonical JSON of the validated arguments,
+  so key order, coerced values (``"3"`` for an int) and omitted defaults
+  don't split entries; arguments that fail validation bypass the cache
+- Lookups try the arguments as received first, so a repeat call spelled the
+  same way is answered without validating them again; entries are stored under
+  both spellings
+- Entries expire after a per-tool TTL (``@result_cache.ttl(...)`` on the
+  tool's function), looked up by the registered tool name
+- The cache is a bounded LRU shared by all tools
+- Calls with very large arguments (e.g. bulk arrays) bypass the cache, since
+  they rarely repeat and would crowd out everything else
+- Hits and misses are counted per tool (``stats://result-cache``)
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+from mcp.server.fastmcp.tools import Tool
+from pydantic import ValidationError
+
+from .plugins import LazyTool
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class ToolResultCache:
+    """Bounded LRU of tool results with per-tool TTLs."""
+
+    def __init__(
+        self, maxsize: int = 1024, default_ttl: float = 60.0, max_key_length: int = 4096
+    ) -> None:
+        self.enabled = True
+        self.maxsize = maxsize
+        self.max_key_length = max_key_length
+        self.default_ttl = default_ttl
+        self.stats: dict[str, CacheStats] = {}
+        self._ttls: dict[str, float] = {}  # By tool name, resolved on first call
+        self._function_ttls: WeakKeyDictionary[Callable[..., Any], float] = WeakKeyDictionary()
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+
+    def ttl(self, seconds: float) -> Callable[[F], F]:
+        """Decorator setting the cache TTL of the tool registered from this function."""
+
+        def decorator(fn: F) -> F:
+            self._function_ttls[fn] = seconds
+            return fn
+
+        return decorator
+
+    def ttl_for(self, tool: Tool) -> float:
+        ttl = self._ttls.get(tool.name)
+        if ttl is None:
+            fn = _implementation(tool).fn
+            ttl = self._ttls[tool.name] = self._function_ttls.get(fn, self.default_ttl)
+        return ttl
+
+    def cacheable(self, tool: Tool) -> bool:
+        hints = tool.annotations
+        return (
+            self.enabled
+            and hints is not None
+            and bool(hints.readOnlyHint)
+            and bool(hints.idempotentHint)
+            and _implementation(tool).context_kwarg is None
+        )
+
+    async def call(
+        self, tool: Tool, arguments: dict[str, Any], run: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached result for these arguments, or run the tool and cache it."""
+        if not self.cacheable(tool):
+            return await run()
+
+        now = time.monotonic()
+        raw_key = _raw_key(tool, arguments, self.max_key_length)
+        if raw_key is not None and (entry := self._fresh(raw_key, now)) is not None:
+            self.stats.setdefault(tool.name, CacheStats()).hits += 1
+            return entry[1]
+
+        arguments_json = _canonical_json(tool, arguments)
+        if arguments_json is None or len(arguments_json) > self.max_key_length:
+            return await run()
+
+        stats = self.stats.setdefault(tool.name, CacheStats())
+        key = (tool.name, arguments_json)
+        entry = self._fresh(key, now)
+        if entry is not None:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+            entry = (now + self.ttl_for(tool), await run())  # errors propagate, not cached
+            self._store(key, entry)
+        if raw_key is not None and raw_key != key:
+            self._store(raw_key, entry)
+        return entry[1]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Statistics for the result cache stats resource."""
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "tools": {name: asdict(stats) for name, stats in self.stats.items()},
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _fresh(self, key: tuple[str, str], now: float) -> tuple[float, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= now:
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: tuple[str, str], entry: tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _implementation(tool: Tool) -> Tool:
+    """The tool whose function runs: a plugin's own, once imported."""
+    return tool.load() if isinstance(tool, LazyTool) else tool
+
+
+def _raw_key(tool: Tool, arguments: dict[str, Any], max_length: int) -> tuple[str, str] | None:
+    """The arguments as received, as sorted JSON (None if not JSON or too long)."""
+    try:
+        arguments_json = json.dumps(arguments, sort_keys=True, separators=(",", ":"))
+    except (ValueError, TypeError):
+        return None
+    return (tool.name, arguments_json) if len(arguments_json) <= max_length else None
+
+
+def _canonical_json(tool: Tool, arguments: dict[str, Any]) -> str | None:
+    """The arguments as the tool will see them, as sorted JSON (None if invalid)."""
+    metadata = _implementation(tool).fn_metadata  # A plugin's own signature
+    try:
+        validated = metadata.arg_model.model_validate(metadata.pre_parse_json(arguments))
+        return json.dumps(validated.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    except (ValidationError, ValueError, TypeError):
+        return None  # Let the call report it
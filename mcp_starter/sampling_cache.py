@@ -0,0 +1,118 @@
+"""Sampling Cache - reuse recent LLM sampling results for repeated prompts.
+
+`ask_llm` round-trips to the client's LLM on every call, by far the slowest
+path in the server. Agents often send the same prompt again within seconds,
+or several times concurrently. With the cache enabled (``--sampling-cache-ttl``):
+
+- Results are cached per session, keyed by prompt, max tokens and model
+  preferences, in a bounded LRU whose entries expire after the TTL
+- Singleflight: concurrent identical requests in a session share a single
+  outstanding ``sampling/createMessage`` request, which keeps going when any
+  of them - even the one that started it - is cancelled
+- Failed samplings are never cached
+
+Entries are scoped to the session that produced them - a different client may
+be connected to a different model - and are dropped with it. The cache is
+off by default, since LLM responses are expected to vary between calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from weakref import WeakKeyDictionary
+
+from mcp.server.session import ServerSession
+from mcp.types import CreateMessageResult, ModelPreferences
+
+
+@dataclass
+class SamplingCacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+
+@dataclass
+class _SessionEntries:
+    results: OrderedDict[Hashable, tuple[float, CreateMessageResult]] = field(
+        default_factory=OrderedDict
+    )
+    inflight: dict[Hashable, asyncio.Task[CreateMessageResult]] = field(default_factory=dict)
+
+
+def sampling_key(
+    prompt: str, max_tokens: int, model_preferences: ModelPreferences | None = None
+) -> Hashable:
+    """Cache key for one sampling request within a session."""
+    preferences = model_preferences.model_dump_json() if model_preferences else None
+    return (prompt, max_tokens, preferences)
+
+
+class SamplingCache:
+    """Per-session TTL + LRU cache of sampling results with singleflight.
+
+    Args:
+        ttl: Seconds a result stays cached; 0 disables the cache
+        maxsize: Maximum cached results per session
+    """
+
+    def __init__(self, ttl: float = 0.0, maxsize: int = 128) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stats = SamplingCacheStats()
+        self._sessions: WeakKeyDictionary[ServerSession, _SessionEntries] = WeakKeyDictionary()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    async def get(
+        self,
+        session: ServerSession,
+        key: Hashable,
+        sample: Callable[[], Awaitable[CreateMessageResult]],
+    ) -> CreateMessageResult:
+        """Return a cached result for this key, or sample once for all concurrent callers."""
+        if not self.enabled:
+            return await sample()
+
+        entries = self._sessions.setdefault(session, _SessionEntries())
+        cached = entries.results.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            entries.results.move_to_end(key)
+            self.stats.hits += 1
+            return cached[1]
+
+        inflight = entries.inflight.get(key)
+        if inflight is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+            # Detached from this caller, so its cancellation can't fail the others
+            inflight = asyncio.ensure_future(self._sample(entries, key, sample))
+            entries.inflight[key] = inflight
+        # Shield so a caller being cancelled doesn't cancel the shared request
+        return await asyncio.shield(inflight)
+
+    async def _sample(
+        self,
+        entries: _SessionEntries,
+        key: Hashable,
+        sample: Callable[[], Awaitable[CreateMessageResult]],
+    ) -> CreateMessageResult:
+        try:
+            result = await sample()
+            entries.results[key] = (time.monotonic() + self.ttl, result)
+            entries.results.move_to_end(key)
+            while len(entries.results) > self.maxsize:
+                entries.results.popitem(last=False)
+            return result
+        finally:
+            del entries.inflight[key]
+
+    def clear(self) -> None:
+        self._sessions.clear()
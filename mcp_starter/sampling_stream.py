@@ -0,0 +1,75 @@
+"""Sampling Stream - incremental LLM output for ask_llm.
+
+MCP sampling has no streaming response: ``sampling/createMessage`` returns
+only when the whole message is done, so users stare at nothing while a long
+answer is generated. Streaming mode generates the answer as a series of short
+sampling requests instead:
+
+1. Ask for at most ``chunk_tokens`` tokens
+2. Hand the new text to ``on_chunk`` (ask_llm forwards it as a progress
+   notification, so the user sees the first tokens quickly)
+3. If the model stopped only because of the token limit, ask it to continue
+   from the text so far, until it finishes or ``max_tokens`` is spent
+
+The caller gets the concatenated text at the end.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from mcp.server.session import ServerSession
+from mcp.types import SamplingMessage, TextContent
+
+CONTINUE_PROMPT = "Continue your answer exactly where it stopped. Do not repeat any text."
+
+
+@dataclass
+class StreamedMessage:
+    text: str
+    chunks: int
+    stop_reason: str | None
+
+
+async def stream_message(
+    session: ServerSession,
+    prompt: str,
+    max_tokens: int,
+    chunk_tokens: int,
+    on_chunk: Callable[[str, int], Awaitable[None]],
+) -> StreamedMessage:
+    """Sample a response in bounded chunks, reporting each as it arrives.
+
+    Args:
+        session: Session whose client performs the sampling
+        prompt: The user prompt
+        max_tokens: Token budget for the whole response
+        chunk_tokens: Token limit per sampling request
+        on_chunk: Called with each chunk's text and the tokens requested so far
+    """
+    parts: list[str] = []
+    requested = 0
+    stop_reason: str | None = None
+    while requested < max_tokens:
+        messages = [SamplingMessage(role="user", content=TextContent(type="text", text=prompt))]
+        if parts:
+            messages += [
+                SamplingMessage(
+                    role="assistant", content=TextContent(type="text", text="".join(parts))
+                ),
+                SamplingMessage(
+                    role="user", content=TextContent(type="text", text=CONTINUE_PROMPT)
+                ),
+            ]
+        budget = min(chunk_tokens, max_tokens - requested)
+        result = await session.create_message(messages=messages, max_tokens=budget)
+        requested += budget
+        stop_reason = result.stopReason
+        if result.content.type != "text":
+            break
+        parts.append(result.content.text)
+        await on_chunk(result.content.text, requested)
+        if stop_reason != "maxTokens":
+            break
+    return StreamedMessage(text="".join(parts), chunks=len(parts), stop_reason=stop_reason)
@@ -9,19 +9,58 @@ A feature-complete Model Context Protocol server demonstrating:
 Usage:
     uv run mcp-python-starter --stdio     # stdio transport
     uv run mcp-python-starter --http      # HTTP transport (default port 3000)
+    uv run mcp-python-starter --http --workers 4   # HTTP on 4 processes
+    uv run mcp-python-starter --http --stateless   # HTTP without sessions
+    uv run mcp-python-starter --http --loop asyncio --http-parser h11  # Baseline uvicorn profile
 
 Documentation: https://modelcontextprotocol.io/
 """
 
 from __future__ import annotations
 
+import functools
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anyio
 import click
+import mcp.types as types
+import uvicorn
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
 from mcp.server.lowlevel.server import NotificationOptions
+from mcp.server.session import ServerSession
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from pydantic import PrivateAttr
 
+from .http_profile import LOOPS, PARSERS, ServerProfile
+from .icon_routes import register_icon_routes
+from .icons import advertised_icons, resolve_icons
+from .json_encoder import ENCODERS, install_json_encoder
+from .plugins import discover_tool_plugins
 from .prompts import register_prompts
 from .resources import register_resources
-from .tools import register_tools
+from .session_recovery import use_session_store
+from .session_store import open_session_store
+from .session_tools import to_mcp_tool
+from .simulation import set_seed
+from .stateless import use_stateless_http
+from .tools import (
+    approval_cache,
+    executor,
+    progress_pump,
+    progress_throttle,
+    register_tools,
+    result_cache,
+    sampling_cache,
+    session_sync,
+    session_tools,
+    tool_deadlines,
+)
+from .workers import run_workers
+
+logger = logging.getLogger(__name__)
 
 # =============================================================================
 # Server Instructions for AI Assistants
@@ -35,10 +74,10 @@ A demonstration MCP server showcasing Python/FastMCP capabilities.
 ## Recommended Workflows
 
 1. **Test connectivity** → Call `hello` to verify the server responds
-2. **Structured output** → Call `get_weather` to see typed response data
+2. **Structured output** → Call `get_weather` to see typed response data (use `get_weather_batch` for many cities instead of looping)
 3. **Progress reporting** → Call `long_task` to observe real-time progress notifications
-4. **Dynamic tools** → Call `load_bonus_tool`, then re-list tools to see `bonus_calculator` appear
-5. **LLM sampling** → Call `ask_llm` to have the server request a completion from the client
+4. **Dynamic tools** → Call `load_bonus_tool`, then re-list tools to see `bonus_calculator` and `bonus_expression` appear
+5. **LLM sampling** → Call `ask_llm` to have the server request a completion from the client (use `ask_llm_many` for several prompts in parallel)
 6. **Elicitation** → Call `confirm_action` (form-based) or `get_feedback` (URL-based) to request user input
 
 ## Multi-Tool Flows
@@ -53,10 +92,12 @@ A demonstration MCP server showcasing Python/FastMCP capabilities.
 - Resources and prompts are available for context and templating — use `resources/list` and `prompts/list` to discover them
 """.strip()
 
-# Initialize FastMCP server with instructions
+# Initialize FastMCP server with instructions. Tools from installed plugins
+# are advertised up front but only imported on their first call.
 mcp = FastMCP(
     "mcp-python-starter",
     instructions=SERVER_INSTRUCTIONS,
+    tools=discover_tool_plugins(),
 )
 mcp._mcp_server.version = "1.0.0"
 
@@ -77,6 +118,174 @@ def _patched_create_init_options(notification_options=None, experimental_capabil
 
 mcp._mcp_server.create_initialization_options = _patched_create_init_options
 
+
+# Tool icons are loaded lazily: fill them in just before tools are listed, so
+# sessions that never call tools/list never read or encode the PNGs. Inline
+# icons are listed at one size only (see icons.py).
+async def _list_tools() -> list[types.Tool]:
+    resolve_icons()
+    tools = await mcp.list_tools()
+    for tool in tools:
+        tool.icons = advertised_icons(tool.icons)
+    return tools
+
+
+mcp._mcp_server.list_tools()(_list_tools)
+
+# =============================================================================
+# tools/list Response Cache
+#
+# The shared tool registry only changes when a tool is (un)registered, yet
+# FastMCP rebuilds every Tool model and re-dumps all schemas and icons on each
+# tools/list. Instead we keep the dumped result, keyed by a registry version
+# that add_tool/remove_tool bump.
+#
+# The session layer always dumps a result to a JSON-mode dict before the
+# transport encodes the JSON-RPC envelope, so that dict is what we cache.
+#
+# Tools a session loaded itself (see session_tools.py) are appended per
+# request; their dumps are cached alongside the shared list.
+# =============================================================================
+
+
+class _PreserializedResult(types.ServerResult):
+    """A ServerResult whose JSON-mode dump was computed once, up front."""
+
+    _dump: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def model_dump(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        return self._dump
+
+
+class ToolListCache:
+    """Versioned cache of the serialized tools/list result."""
+
+    def __init__(self, build: Callable[[Any], Awaitable[types.ServerResult]]) -> None:
+        self.enabled = True
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._build = build
+        self._entry: tuple[int, _PreserializedResult] | None = None
+        self._session_tool_dumps: dict[str, dict[str, Any]] = {}
+
+    def invalidate(self) -> None:
+        """Bump the registry version so the next tools/list is rebuilt."""
+        self.version += 1
+
+    async def handle(self, req: types.ListToolsRequest | None) -> types.ServerResult:
+        result = await self._shared(req)
+        session = _current_session()
+        if session is not None:
+            await _attach_session(session)
+        loaded = session_tools.loaded(session) if session is not None else []
+        if not loaded:
+            return result
+
+        definitions = [to_mcp_tool(tool) for tool in loaded]
+        # Let the lowlevel call_tool handler find these for output validation
+        for definition in definitions:
+            mcp._mcp_server._tool_cache[definition.name] = definition
+        merged = types.ListToolsResult(tools=[*result.root.tools, *definitions])  # type: ignore[union-attr]
+        if not isinstance(result, _PreserializedResult):
+            return types.ServerResult(merged)
+
+        combined = _PreserializedResult(merged)
+        combined._dump = {
+            **result._dump,
+            "tools": [*result._dump["tools"], *map(self._dump_session_tool, definitions)],
+        }
+        return combined
+
+    async def _shared(self, req: types.ListToolsRequest | None) -> types.ServerResult:
+        """The shared (all-session) tool list, cached by registry version."""
+        if not self.enabled:
+            return await self._build(req)
+        if self._entry is not None and self._entry[0] == self.version:
+            self.hits += 1
+            return self._entry[1]
+
+        self.misses += 1
+        # Read the version first: a registration during the build leaves the
+        # entry stale, so the next call rebuilds.
+        version = self.version
+        result = await self._build(req)
+        cached = _PreserializedResult(result.root)
+        cached._dump = result.model_dump(by_alias=True, mode="json", exclude_none=True)
+        self._entry = (version, cached)
+        self._session_tool_dumps.clear()
+        return cached
+
+    def _dump_session_tool(self, definition: types.Tool) -> dict[str, Any]:
+        dump = self._session_tool_dumps.get(definition.name)
+        if dump is None:
+            dump = definition.model_dump(by_alias=True, mode="json", exclude_none=True)
+            self._session_tool_dumps[definition.name] = dump
+        return dump
+
+
+def _current_session() -> ServerSession | None:
+    try:
+        return mcp._mcp_server.request_context.session
+    except LookupError:
+        return None
+
+
+async def _attach_session(session: ServerSession) -> None:
+    """Restore a resumed HTTP session's loaded tools (once per session; needs --session-store)."""
+    if session_sync.enabled:
+        request = mcp._mcp_server.request_context.request
+        session_id = request.headers.get(MCP_SESSION_ID_HEADER) if request is not None else None
+        if session_id is not None:
+            await session_sync.attach(session, session_id)
+
+
+tool_list_cache = ToolListCache(mcp._mcp_server.request_handlers[types.ListToolsRequest])
+mcp._mcp_server.request_handlers[types.ListToolsRequest] = tool_list_cache.handle
+
+
+def _bumps_tool_list_version(method: Callable[..., None]) -> Callable[..., None]:
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        method(*args, **kwargs)
+        tool_list_cache.invalidate()
+
+    return wrapper
+
+
+# @mcp.tool() goes through add_tool, so this covers dynamic registration too
+mcp.add_tool = _bumps_tool_list_version(mcp.add_tool)
+mcp.remove_tool = _bumps_tool_list_version(mcp.remove_tool)
+
+
+# Dispatch to tools the calling session loaded itself, then the shared registry.
+# Every call runs within its deadline; read-only, idempotent tools are answered
+# from the result cache when possible.
+async def _call_tool(name: str, arguments: dict[str, Any]) -> Any:
+    session = _current_session()
+    if session is not None:
+        await _attach_session(session)
+    tool = session_tools.get(session, name) if session is not None else None
+    if tool is None:
+        tool = mcp._tool_manager.get_tool(name)
+    if tool is None:
+        raise ToolError(f"Unknown tool: {name}")
+
+    def run() -> Awaitable[Any]:
+        return tool.run(arguments, context=mcp.get_context(), convert_result=True)
+
+    meta = mcp._mcp_server.request_context.meta
+    try:
+        return await tool_deadlines.run(tool, meta, lambda: result_cache.call(tool, arguments, run))
+    except (anyio.get_cancelled_exc_class(), ToolError):
+        # A cancelled or timed-out call must not keep sending progress
+        if session is not None and meta is not None and meta.progressToken is not None:
+            progress_pump.discard(session, meta.progressToken)
+        raise
+
+
+mcp._mcp_server.call_tool(validate_input=False)(_call_tool)
+
 # Register all components
 register_tools(mcp)
 register_resources(mcp)
@@ -87,17 +296,209 @@ register_prompts(mcp)
 @click.option("--stdio", is_flag=True, help="Run with stdio transport")
 @click.option("--http", is_flag=True, help="Run with HTTP transport")
 @click.option("--port", default=3000, help="Port for HTTP transport")
-def main(stdio: bool, http: bool, port: int) -> None:
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    envvar="MCP_STARTER_WORKERS",
+    help="HTTP worker processes sharing the port, with session affinity (env: MCP_STARTER_WORKERS)",
+)
+@click.option(
+    "--stateless",
+    is_flag=True,
+    envvar="MCP_STARTER_STATELESS",
+    help="Serve HTTP without sessions: any process can answer any request, "
+    "but sampling and elicitation are unavailable (env: MCP_STARTER_STATELESS)",
+)
+@click.option(
+    "--session-store",
+    default=None,
+    envvar="MCP_STARTER_SESSION_STORE",
+    help="Keep HTTP session metadata in an external store so other processes can resume "
+    "sessions: memory://, sqlite:///path or redis://host:port/db (env: MCP_STARTER_SESSION_STORE)",
+)
+@click.option(
+    "--loop",
+    type=click.Choice(LOOPS),
+    default="auto",
+    envvar="MCP_STARTER_LOOP",
+    help="HTTP event loop; auto picks uvloop when installed (env: MCP_STARTER_LOOP)",
+)
+@click.option(
+    "--http-parser",
+    type=click.Choice(PARSERS),
+    default="auto",
+    envvar="MCP_STARTER_HTTP_PARSER",
+    help="HTTP/1.1 parser; auto picks httptools when installed (env: MCP_STARTER_HTTP_PARSER)",
+)
+@click.option(
+    "--backlog",
+    type=click.IntRange(min=1),
+    default=ServerProfile.backlog,
+    envvar="MCP_STARTER_BACKLOG",
+    help="Pending connections queued on the HTTP socket (env: MCP_STARTER_BACKLOG)",
+)
+@click.option(
+    "--keep-alive",
+    type=click.IntRange(min=1),
+    default=ServerProfile.keep_alive,
+    envvar="MCP_STARTER_KEEP_ALIVE",
+    help="Seconds an idle HTTP keep-alive connection stays open (env: MCP_STARTER_KEEP_ALIVE)",
+)
+@click.option(
+    "--limit-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    envvar="MCP_STARTER_LIMIT_CONCURRENCY",
+    help="Connections plus in-flight requests per process before answering 503 "
+    "(default no limit, env: MCP_STARTER_LIMIT_CONCURRENCY)",
+)
+@click.option(
+    "--json-encoder",
+    type=click.Choice(ENCODERS),
+    default="auto",
+    envvar="MCP_STARTER_JSON_ENCODER",
+    help="Encoder for outgoing JSON-RPC messages; auto picks orjson or msgspec when installed "
+    "(env: MCP_STARTER_JSON_ENCODER)",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=None,
+    envvar="MCP_STARTER_SEED",
+    help="Seed simulated tools for reproducible output (env: MCP_STARTER_SEED)",
+)
+@click.option(
+    "--public-url",
+    default=None,
+    help="Externally reachable base URL for icon links (HTTP only, default http://host:port)",
+)
+@click.option(
+    "--sampling-cache-ttl",
+    type=float,
+    default=0.0,
+    envvar="MCP_STARTER_SAMPLING_CACHE_TTL",
+    help="Reuse ask_llm results for identical prompts for this many seconds "
+    "(0 = off, env: MCP_STARTER_SAMPLING_CACHE_TTL)",
+)
+@click.option(
+    "--progress-interval",
+    type=float,
+    default=0.25,
+    envvar="MCP_STARTER_PROGRESS_INTERVAL",
+    help="Minimum seconds between progress notifications per request "
+    "(0 = no throttling, env: MCP_STARTER_PROGRESS_INTERVAL)",
+)
+@click.option(
+    "--thread-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    envvar="MCP_STARTER_THREAD_WORKERS",
+    help="Threads for thread-mode tools (env: MCP_STARTER_THREAD_WORKERS)",
+)
+@click.option(
+    "--process-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    envvar="MCP_STARTER_PROCESS_WORKERS",
+    help="Worker processes for CPU-bound work, default CPU count "
+    "(env: MCP_STARTER_PROCESS_WORKERS)",
+)
+@click.option(
+    "--approval-ttl",
+    type=float,
+    default=0.0,
+    envvar="MCP_STARTER_APPROVAL_TTL",
+    help="Remember confirm_action approvals per session for this many seconds "
+    "(0 = off, env: MCP_STARTER_APPROVAL_TTL)",
+)
+@click.option(
+    "--approval-cache-destructive",
+    is_flag=True,
+    envvar="MCP_STARTER_APPROVAL_CACHE_DESTRUCTIVE",
+    help="Also remember approvals of destructive actions "
+    "(env: MCP_STARTER_APPROVAL_CACHE_DESTRUCTIVE)",
+)
+def main(
+    stdio: bool,
+    http: bool,
+    port: int,
+    workers: int,
+    stateless: bool,
+    session_store: str | None,
+    loop: str,
+    http_parser: str,
+    backlog: int,
+    keep_alive: int,
+    limit_concurrency: int | None,
+    json_encoder: str,
+    seed: int | None,
+    public_url: str | None,
+    sampling_cache_ttl: float,
+    progress_interval: float,
+    thread_workers: int | None,
+    process_workers: int | None,
+    approval_ttl: float,
+    approval_cache_destructive: bool,
+) -> None:
     """MCP Python Starter Server.
 
     Run with either stdio or HTTP transport.
     """
-    if stdio or (not stdio and not http):
-        mcp.run(transport="stdio")
-    elif http:
-        # Port must be set via settings, not run() parameter
-        mcp.settings.port = port
-        mcp.run(transport="streamable-http")
+    set_seed(seed)
+    sampling_cache.ttl = sampling_cache_ttl
+    progress_throttle.min_interval = progress_interval
+    executor.configure(thread_workers, process_workers)
+    approval_cache.ttl = approval_ttl
+    approval_cache.allow_destructive = approval_cache_destructive
+    try:
+        logger.info("JSON encoder: %s", install_json_encoder(json_encoder))
+    except ValueError as e:
+        raise click.UsageError(str(e)) from None
+    try:
+        if stdio or (not stdio and not http):
+            mcp.run(transport="stdio")
+        elif http:
+            # Port must be set via settings, not run() parameter
+            mcp.settings.port = port
+            try:
+                profile = ServerProfile.resolve(
+                    loop,
+                    http_parser,
+                    backlog=backlog,
+                    keep_alive=keep_alive,
+                    limit_concurrency=limit_concurrency,
+                )
+            except ValueError as e:
+                raise click.UsageError(str(e)) from None
+            logger.info("HTTP profile: %s", profile.describe())
+            if stateless:
+                if session_store:
+                    raise click.UsageError("--session-store needs sessions; drop --stateless")
+                use_stateless_http(mcp)
+                session_tools.shared = True  # Nothing outlives a request to load tools into
+            elif session_store:
+                try:
+                    session_sync.configure(open_session_store(session_store))
+                except ValueError as e:
+                    raise click.BadParameter(str(e), param_hint="--session-store") from None
+                use_session_store(mcp, session_sync)
+            # Serve icons by URL next to /mcp instead of inlining them in tools/list
+            register_icon_routes(mcp, public_url or f"http://{mcp.settings.host}:{port}")
+            tool_list_cache.invalidate()
+            if workers > 1:
+                run_workers(mcp, workers, profile, finalize=executor.shutdown)
+            else:
+                # Not mcp.run(): that ignores the profile's event loop
+                config = profile.config(
+                    mcp.streamable_http_app(),
+                    host=mcp.settings.host,
+                    port=port,
+                    log_level=mcp.settings.log_level.lower(),
+                )
+                uvicorn.Server(config).run()
+    finally:
+        executor.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,296 @@
+"""Session Recovery - resume streamable HTTP sessions from the session store.
+
+With ``--session-store``, a session outlives the process that created it:
+
+- When a session opens, its initialize parameters are stored before the
+  client learns the session ID
+- A request for a session this process doesn't know is looked up in the
+  store; if it is there, the session is re-created under the same ID by
+  replaying the client's initialize handshake internally, and the request
+  is then served as usual
+- Tools the session loaded are restored on its first request, and stored
+  again when it loads more; a DELETE removes the record
+
+After a process has attached a session once, later requests only consult
+a local map: the hot path makes no store round trip. If the store fails,
+sessions keep working in this process and the error is counted.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Awaitable
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+import anyio
+from mcp.server.fastmcp import FastMCP
+from mcp.server.session import ServerSession
+from mcp.server.streamable_http import MCP_PROTOCOL_VERSION_HEADER, MCP_SESSION_ID_HEADER
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.datastructures import Headers
+from starlette.types import Message, Receive, Scope, Send
+
+from .session_store import CachedSessionStore, SessionRecord, SessionStore
+from .session_tools import SessionTools
+from .stateless import buffer_body
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Session ID that the session being admitted must take (set while resuming)
+_resuming_id: ContextVar[str | None] = ContextVar("resuming_id", default=None)
+
+# Request headers replaced when replaying the handshake
+_REPLACED_HEADERS = frozenset(
+    {
+        b"accept",
+        b"content-length",
+        b"content-type",
+        MCP_PROTOCOL_VERSION_HEADER.encode(),
+        MCP_SESSION_ID_HEADER.encode(),
+    }
+)
+
+
+@dataclass
+class SessionSyncStats:
+    created: int = 0
+    resumed: int = 0
+    errors: int = 0
+
+
+class SessionSync:
+    """Keeps live sessions and their records in the session store in step.
+
+    Args:
+        session_tools: Where a resumed session's loaded tools are restored
+    """
+
+    def __init__(self, session_tools: SessionTools) -> None:
+        self.session_tools = session_tools
+        self.store: CachedSessionStore | None = None
+        self.stats = SessionSyncStats()
+        self._ids: WeakKeyDictionary[ServerSession, str] = WeakKeyDictionary()
+
+    @property
+    def enabled(self) -> bool:
+        return self.store is not None
+
+    def configure(self, store: SessionStore | None) -> None:
+        """Use ``store`` (behind a read-through cache), or nothing if None."""
+        self.store = None if store is None else CachedSessionStore(store)
+
+    async def created(self, session_id: str, client: dict[str, Any]) -> None:
+        """Store a session that just opened."""
+        if self.store is not None:
+            self.stats.created += 1
+            await self._safely("put", self.store.put(session_id, SessionRecord(client)))
+
+    async def lookup(self, session_id: str) -> SessionRecord | None:
+        if self.store is None:
+            return None
+        return await self._safely("get", self.store.get(session_id))
+
+    async def attach(self, session: ServerSession, session_id: str) -> None:
+        """Tie a live session to its record, restoring its loaded tools (once per session)."""
+        if self.store is None or session in self._ids:
+            return
+        self._ids[session] = session_id
+        record = await self.lookup(session_id)
+        for name in record.tools if record is not None else ():
+            try:
+                self.session_tools.load(session, name)
+            except ValueError:
+                logger.warning("Session %s: stored tool %s no longer exists", session_id, name)
+
+    async def save(self, session: ServerSession) -> None:
+        """Store the tools this session has loaded."""
+        session_id = self._ids.get(session)
+        if self.store is None or session_id is None:
+            return
+        record = await self.lookup(session_id)
+        if record is None:
+            return  # Expired, or the store is down
+        tools = [tool.name for tool in self.session_tools.loaded(session)]
+        await self._safely("put", self.store.put(session_id, SessionRecord(record.client, tools)))
+
+    async def forget(self, session_id: str) -> None:
+        if self.store is not None:
+            await self._safely("delete", self.store.delete(session_id))
+
+    def snapshot(self) -> dict[str, Any]:
+        """Statistics for the session stats resource."""
+        if self.store is None:
+            return {"enabled": False}
+        return {"enabled": True, **asdict(self.stats), "store": self.store.snapshot()}
+
+    async def _safely(self, operation: str, call: Awaitable[T]) -> T | None:
+        try:
+            return await call
+        except Exception:
+            self.stats.errors += 1
+            logger.warning("Session store %s failed", operation, exc_info=True)
+            return None
+
+
+class RecoveringSessionManager(StreamableHTTPSessionManager):
+    """Stateful session manager that stores new sessions and resumes unknown ones.
+
+    Args:
+        sessions: Session store synchronization
+        **kwargs: As for ``StreamableHTTPSessionManager``
+    """
+
+    def __init__(self, sessions: SessionSync, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.sessions = sessions
+        self._resuming: dict[str, anyio.Event] = {}
+
+    async def handle_request(self, scope: Scope, receive: Receive, send: Send) -> None:
+        session_id = Headers(scope=scope).get(MCP_SESSION_ID_HEADER)
+        if session_id is None:
+            if scope["method"] == "POST":
+                await self._open(scope, receive, send)
+                return
+        elif session_id not in self._server_instances:
+            await self._resume(session_id, scope)
+
+        await super().handle_request(scope, receive, send)
+        if (
+            scope["method"] == "DELETE"
+            and session_id is not None
+            and session_id not in self._server_instances
+        ):
+            await self.sessions.forget(session_id)
+
+    def _admit_session(self, requestor: Any) -> Any:
+        transport = super()._admit_session(requestor)
+        session_id = _resuming_id.get()
+        if transport is not None and session_id is not None:
+            # Re-register the new transport under the resumed session's ID
+            new_id = transport.mcp_session_id
+            owner = None
+            if new_id is not None:
+                self._server_instances.pop(new_id, None)
+                owner = self._session_owners.pop(new_id, None)
+            transport.mcp_session_id = session_id
+            self._server_instances[session_id] = transport
+            if owner is not None:
+                self._session_owners[session_id] = owner
+        return transport
+
+    async def _open(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve a request without a session ID, storing the session it opens."""
+        body, receive = await buffer_body(receive, self.max_request_body_size)
+
+        async def store_then_send(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                session_id = Headers(raw=message["headers"]).get(MCP_SESSION_ID_HEADER)
+                client = _initialize_params(body)
+                if session_id is not None and client is not None:
+                    # Before the client has the ID, so no other process can miss it
+                    await self.sessions.created(session_id, client)
+            await send(message)
+
+        await super().handle_request(scope, receive, store_then_send)
+
+    async def _resume(self, session_id: str, scope: Scope) -> None:
+        """Re-create a stored session in this process, if the store has it."""
+        pending = self._resuming.get(session_id)
+        if pending is not None:
+            await pending.wait()  # Another request is already resuming it
+            return
+
+        self._resuming[session_id] = done = anyio.Event()
+        try:
+            record = await self.sessions.lookup(session_id)
+            if record is None or session_id in self._server_instances:
+                return
+            token = _resuming_id.set(session_id)
+            try:
+                initialize = {
+                    "jsonrpc": "2.0",
+                    "id": "resume",
+                    "method": "initialize",
+                    "params": record.client,
+                }
+                status = await self._replay(scope, initialize)
+            finally:
+                _resuming_id.reset(token)
+            if status is None or status >= 400 or session_id not in self._server_instances:
+                logger.warning("Could not resume session %s (status %s)", session_id, status)
+                return
+            version = str(record.client.get("protocolVersion", ""))
+            initialized = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+            await self._replay(scope, initialized, session_id, version)
+            self.sessions.stats.resumed += 1
+            logger.info("Resumed session %s from the session store", session_id)
+        finally:
+            del self._resuming[session_id]
+            done.set()
+
+    async def _replay(
+        self,
+        scope: Scope,
+        message: dict[str, Any],
+        session_id: str | None = None,
+        protocol_version: str | None = None,
+    ) -> int | None:
+        """Send one JSON-RPC message through the transport as if the client had; the status."""
+        headers = [(k, v) for k, v in scope["headers"] if k not in _REPLACED_HEADERS]
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"accept", b"application/json, text/event-stream"),
+        ]
+        if session_id is not None:
+            headers.append((MCP_SESSION_ID_HEADER.encode(), session_id.encode()))
+        if protocol_version:
+            headers.append((MCP_PROTOCOL_VERSION_HEADER.encode(), protocol_version.encode()))
+        requests = [{"type": "http.request", "body": json.dumps(message).encode()}]
+        status: int | None = None
+
+        async def receive() -> Message:
+            if requests:
+                return requests.pop()
+            await anyio.sleep_forever()  # Never disconnects
+            raise AssertionError
+
+        async def send(response: Message) -> None:
+            nonlocal status
+            if response["type"] == "http.response.start":
+                status = response["status"]
+
+        replay_scope = {**scope, "method": "POST", "headers": headers}
+        await super().handle_request(replay_scope, receive, send)
+        return status
+
+
+def _initialize_params(body: bytes) -> dict[str, Any] | None:
+    try:
+        message = json.loads(body)
+    except ValueError:
+        return None
+    if isinstance(message, dict) and message.get("method") == "initialize":
+        params = message.get("params")
+        return params if isinstance(params, dict) else None
+    return None
+
+
+def use_session_store(mcp: FastMCP, sessions: SessionSync) -> None:
+    """Serve ``mcp``'s streamable HTTP sessions through the session store (call before running)."""
+    mcp._session_manager = RecoveringSessionManager(
+        sessions,
+        app=mcp._mcp_server,
+        event_store=mcp._event_store,
+        retry_interval=mcp._retry_interval,
+        json_response=mcp.settings.json_response,
+        security_settings=mcp.settings.transport_security,
+        max_request_body_size=mcp.settings.max_request_body_size,
+        session_idle_timeout=mcp.settings.session_idle_timeout,
+        max_sessions=mcp.settings.max_sessions,
+    )
@@ -0,0 +1,349 @@
+"""Session Store - HTTP session metadata kept outside the server process.
+
+A streamable HTTP session lives in the memory of the process that created
+it, so a client whose requests reach another node (or a restarted process)
+gets "Session not found" and has to start over. What a session needs to be
+picked up elsewhere is small and serializable:
+
+- The client's initialize parameters (protocol version, capabilities, info)
+- The names of the tools it loaded (`load_bonus_tool`)
+
+Requests in flight can't move: they hold live streams and pending client
+replies, and end with the process that runs them.
+
+Stores are pluggable, chosen by URL (``--session-store``):
+
+- ``memory://``: in-process dict (single process; the reference implementation)
+- ``sqlite:///path/to/sessions.db``: shared by every process on one host
+- ``redis://[:password@]host[:port][/db]``: any server speaking the Redis
+  protocol (RESP), e.g. Redis, Valkey, or a local stand-in
+
+`CachedSessionStore` puts a read-through, write-through cache in front of
+any of them. See `session_recovery.py` for how sessions use the store.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Protocol
+from urllib.parse import unquote, urlsplit
+
+import anyio
+
+# Stored sessions are dropped after a day without updates
+DEFAULT_TTL = 24 * 3600.0
+
+
+class SessionStoreError(RuntimeError):
+    """The session store rejected a command or could not be reached."""
+
+
+@dataclass
+class SessionRecord:
+    """Everything needed to resume a session in another process."""
+
+    client: dict[str, Any]  # InitializeRequest params, as the client sent them
+    tools: list[str] = field(default_factory=list)  # Loaded session tools
+
+    def encode(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def decode(cls, data: str | bytes) -> SessionRecord:
+        return cls(**json.loads(data))
+
+
+class SessionStore(Protocol):
+    """Shared storage for session records, keyed by session ID."""
+
+    async def get(self, session_id: str) -> SessionRecord | None: ...
+
+    async def put(self, session_id: str, record: SessionRecord) -> None: ...
+
+    async def delete(self, session_id: str) -> None: ...
+
+
+class MemorySessionStore:
+    """In-process store; sessions only survive within this process.
+
+    Args:
+        ttl: Seconds a record is kept after its last update
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL) -> None:
+        self.ttl = ttl
+        self._records: dict[str, tuple[float, str]] = {}
+
+    async def get(self, session_id: str) -> SessionRecord | None:
+        entry = self._records.get(session_id)
+        if entry is None or entry[0] <= time.monotonic():
+            self._records.pop(session_id, None)
+            return None
+        return SessionRecord.decode(entry[1])  # A copy, like a remote store
+
+    async def put(self, session_id: str, record: SessionRecord) -> None:
+        self._records[session_id] = (time.monotonic() + self.ttl, record.encode())
+
+    async def delete(self, session_id: str) -> None:
+        self._records.pop(session_id, None)
+
+
+class SQLiteSessionStore:
+    """SQLite-backed store, shared by all processes using the same file.
+
+    The connection is opened on first use (so forked workers each open
+    their own) and queries run on a worker thread.
+
+    Args:
+        path: Database file
+        ttl: Seconds a record is kept after its last update
+    """
+
+    PURGE_INTERVAL = 60.0
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+
+    async def get(self, session_id: str) -> SessionRecord | None:
+        row = await anyio.to_thread.run_sync(
+            self._execute,
+            "SELECT record FROM sessions WHERE id = ? AND expires > ?",
+            (session_id, time.time()),
+        )
+        return None if row is None else SessionRecord.decode(row[0])
+
+    async def put(self, session_id: str, record: SessionRecord) -> None:
+        now = time.time()
+        await anyio.to_thread.run_sync(
+            self._execute,
+            "INSERT OR REPLACE INTO sessions (id, record, expires) VALUES (?, ?, ?)",
+            (session_id, record.encode(), now + self.ttl),
+        )
+        if now - self._last_purge > self.PURGE_INTERVAL:
+            self._last_purge = now
+            await anyio.to_thread.run_sync(
+                self._execute, "DELETE FROM sessions WHERE expires <= ?", (now,)
+            )
+
+    async def delete(self, session_id: str) -> None:
+        await anyio.to_thread.run_sync(
+            self._execute, "DELETE FROM sessions WHERE id = ?", (session_id,)
+        )
+
+    def _execute(self, sql: str, params: tuple[Any, ...]) -> Any:
+        with self._lock:
+            if self._db is None:
+                self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+                self._db.execute("PRAGMA journal_mode=WAL")  # Readers don't block the writer
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS sessions "
+                    "(id TEXT PRIMARY KEY, record TEXT NOT NULL, expires REAL NOT NULL)"
+                )
+            return self._db.execute(sql, params).fetchone()
+
+
+class RedisSessionStore:
+    """Store on a Redis-protocol server, over one RESP connection.
+
+    Uses only GET, SET (with EX), DEL, AUTH and SELECT, so any server that
+    speaks RESP2 will do. Commands are serialized on the connection, which
+    is reopened once if it drops. A command interrupted before its reply is
+    read (e.g. cancelled) closes the connection, so the next command can't
+    read that reply as its own.
+
+    Args:
+        url: ``redis://[:password@]host[:port][/db]``
+        ttl: Seconds a record is kept after its last update
+        prefix: Key prefix for session records
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://127.0.0.1:6379/0",
+        ttl: float = DEFAULT_TTL,
+        prefix: str = "mcp-starter:session:",
+    ) -> None:
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 6379
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.ttl = ttl
+        self.prefix = prefix
+        self._streams: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None = None
+        self._lock: asyncio.Lock | None = None
+
+    async def get(self, session_id: str) -> SessionRecord | None:
+        data = await self.command("GET", self.prefix + session_id)
+        return None if data is None else SessionRecord.decode(data)
+
+    async def put(self, session_id: str, record: SessionRecord) -> None:
+        await self.command(
+            "SET", self.prefix + session_id, record.encode(), "EX", str(max(1, int(self.ttl)))
+        )
+
+    async def delete(self, session_id: str) -> None:
+        await self.command("DEL", self.prefix + session_id)
+
+    async def command(self, *args: str) -> Any:
+        """Send one command and return its decoded reply."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            for attempt in range(2):
+                try:
+                    reader, writer = self._streams or await self._connect()
+                    writer.write(_encode_command(args))
+                    await writer.drain()
+                    return await _read_reply(reader)
+                except (ConnectionError, asyncio.IncompleteReadError, OSError) as e:
+                    self._close()
+                    if attempt:
+                        raise SessionStoreError(f"Redis at {self.host}:{self.port}: {e}") from e
+                except BaseException:
+                    # Cancelled or failed mid round trip: the reply may still arrive,
+                    # and the next command would read it as its own
+                    self._close()
+                    raise
+
+    async def close(self) -> None:
+        self._close()
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        setup = [("SELECT", str(self.db))]
+        if self.password:
+            setup.insert(0, ("AUTH", self.password))
+        try:
+            for command in setup:
+                writer.write(_encode_command(command))
+                await writer.drain()
+                await _read_reply(reader)
+        except BaseException:
+            writer.close()
+            raise
+        self._streams = (reader, writer)
+        return reader, writer
+
+    def _close(self) -> None:
+        if self._streams is not None:
+            self._streams[1].close()
+            self._streams = None
+
+
+def _encode_command(args: tuple[str, ...]) -> bytes:
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg.encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    line = (await reader.readuntil(b"\r\n"))[:-2]
+    kind, rest = line[:1], line[1:]
+    if kind == b"+":
+        return rest.decode()
+    if kind == b"-":
+        raise SessionStoreError(rest.decode())
+    if kind == b":":
+        return int(rest)
+    if kind == b"$":
+        length = int(rest)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2].decode()
+    if kind == b"*":
+        count = int(rest)
+        return None if count < 0 else [await _read_reply(reader) for _ in range(count)]
+    raise SessionStoreError(f"Unexpected reply from server: {line[:40]!r}")
+
+
+@dataclass
+class SessionStoreStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+
+
+class CachedSessionStore:
+    """Read-through, write-through cache in front of a shared store.
+
+    Reads are answered locally for ``ttl`` seconds; writes go to the store
+    and update the cache. Misses are not cached: another process may store
+    the session any moment. Records change rarely (on initialize and
+    ``load_bonus_tool``), so a short TTL bounds staleness when a session
+    moves between processes.
+
+    Args:
+        store: The shared store
+        ttl: Seconds a record read from the store is reused
+        maxsize: Records kept locally (least recently used are evicted)
+    """
+
+    def __init__(self, store: SessionStore, ttl: float = 30.0, maxsize: int = 10_000) -> None:
+        self.store = store
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stats = SessionStoreStats()
+        self._cache: OrderedDict[str, tuple[float, SessionRecord]] = OrderedDict()
+
+    async def get(self, session_id: str) -> SessionRecord | None:
+        entry = self._cache.get(session_id)
+        if entry is not None and entry[0] > time.monotonic():
+            self._cache.move_to_end(session_id)
+            self.stats.hits += 1
+            return entry[1]
+        self.stats.misses += 1
+        record = await self.store.get(session_id)
+        if record is not None:
+            self._remember(session_id, record)
+        return record
+
+    async def put(self, session_id: str, record: SessionRecord) -> None:
+        self.stats.writes += 1
+        await self.store.put(session_id, record)
+        self._remember(session_id, record)
+
+    async def delete(self, session_id: str) -> None:
+        self._cache.pop(session_id, None)
+        await self.store.delete(session_id)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Statistics for the session store stats resource."""
+        return {
+            **asdict(self.stats),
+            "backend": type(self.store).__name__,
+            "size": len(self._cache),
+        }
+
+    def _remember(self, session_id: str, record: SessionRecord) -> None:
+        self._cache[session_id] = (time.monotonic() + self.ttl, record)
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+
+def open_session_store(url: str) -> SessionStore:
+    """The store for a ``--session-store`` URL."""
+    scheme = urlsplit(url).scheme
+    if scheme == "memory":
+        return MemorySessionStore()
+    if scheme == "sqlite":
+        path = url.removeprefix("sqlite://")
+        if not path:
+            raise ValueError("sqlite session store needs a path, e.g. sqlite:///tmp/sessions.db")
+        return SQLiteSessionStore(path)
+    if scheme == "redis":
+        return RedisSessionStore(url)
+    raise ValueError(f"Unsupported session store URL: {url}")
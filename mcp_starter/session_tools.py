@@ -0,0 +1,103 @@
+"""Session Tools - tools that are visible only to the session that loaded them.
+
+Registering a tool on the shared FastMCP instance changes the tool list for
+every connected client, so over HTTP one client's `load_bonus_tool` would make
+all clients refresh their lists. Instead, dynamically loadable tools are
+defined once here and each session keeps a small overlay of the names it has
+loaded:
+
+- Definitions (schemas, icons, the function) are shared by all sessions
+- Per session we store only a set of tool names, dropped with the session
+- Lookups are plain dict/set operations, so O(1) per call
+
+With stateless HTTP a session lasts one request, so there is nothing to load
+into; ``shared`` then makes every loadable tool visible to every session.
+
+`server.py` merges a session's overlay into its `tools/list` result and
+dispatches `tools/call` to it before falling back to the shared registry.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+from weakref import WeakKeyDictionary
+
+import mcp.types as types
+from mcp.server.fastmcp.tools import Tool
+from mcp.server.session import ServerSession
+
+from .icons import advertised_icons
+
+
+class SessionTools:
+    """Registry of loadable tools plus each session's loaded overlay.
+
+    Args:
+        shared: Every session sees every loadable tool (for stateless HTTP)
+    """
+
+    def __init__(self, shared: bool = False) -> None:
+        self.shared = shared
+        self._definitions: dict[str, Tool] = {}
+        self._loaded: WeakKeyDictionary[ServerSession, set[str]] = WeakKeyDictionary()
+
+    def tool(self, **kwargs: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Decorator to define a loadable tool. Accepts the same options as ``mcp.tool``.
+
+        The tool is not visible to any session until ``load()`` is called.
+        """
+
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            tool = Tool.from_function(fn, **kwargs)
+            self._definitions[tool.name] = tool
+            return fn
+
+        return decorator
+
+    def load(self, session: ServerSession, name: str) -> bool:
+        """Make a defined tool visible to one session.
+
+        Returns False if the session had already loaded it.
+        """
+        if name not in self._definitions:
+            raise ValueError(f"Unknown loadable tool: {name}")
+        if self.shared:
+            return False
+        loaded = self._loaded.setdefault(session, set())
+        if name in loaded:
+            return False
+        loaded.add(name)
+        return True
+
+    def get(self, session: ServerSession, name: str) -> Tool | None:
+        """The tool if this session has loaded it, else None."""
+        if self.shared:
+            return self._definitions.get(name)
+        loaded = self._loaded.get(session)
+        if loaded is None or name not in loaded:
+            return None
+        return self._definitions[name]
+
+    def loaded(self, session: ServerSession) -> list[Tool]:
+        """All tools this session has loaded, in definition order."""
+        if self.shared:
+            return list(self._definitions.values())
+        loaded = self._loaded.get(session)
+        if not loaded:
+            return []
+        return [tool for name, tool in self._definitions.items() if name in loaded]
+
+
+def to_mcp_tool(tool: Tool) -> types.Tool:
+    """Protocol-level Tool definition, as FastMCP.list_tools() builds it."""
+    return types.Tool(
+        name=tool.name,
+        title=tool.title,
+        description=tool.description,
+        inputSchema=tool.parameters,
+        outputSchema=tool.output_schema,
+        annotations=tool.annotations,
+        icons=advertised_icons(tool.icons),
+        _meta=tool.meta,
+    )
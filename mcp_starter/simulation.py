@@ -0,0 +1,83 @@
+"""Simulation RNG - optional seeded randomness for reproducible runs.
+
+Simulated tools (get_weather, get_weather_batch) normally use fresh
+randomness. For load tests and perf regression runs, start the server with
+``--seed N`` (or ``MCP_STARTER_SEED=N``): every simulated item (e.g. one
+city's reading) then takes its values from a stream derived from the seed and
+the item's key alone, so the same item gets the same values across runs
+whether it is fetched on its own, in a batch, or after other items were cached.
+
+The stream is SplitMix64 over a hash of ``(seed, key)``. It is stateless, so
+concurrent requests never contend for (or perturb) each other's values, and
+`item_uniform_columns` computes it for many items in one vectorized NumPy
+pass with the same floats as `item_uniforms`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_seed: int | None = None
+
+# Unseeded requests share one generator, just like the `random` module
+_unseeded = random.Random()
+
+_MASK = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+
+def set_seed(seed: int | None) -> None:
+    """Enable seeded mode (or disable it with None)."""
+    global _seed
+    _seed = seed
+
+
+def get_seed() -> int | None:
+    return _seed
+
+
+def _derive(key: tuple[object, ...]) -> int:
+    digest = hashlib.blake2b(repr((_seed, *key)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _splitmix(state: int, i: int) -> float:
+    z = (state + (i + 1) * _GOLDEN) & _MASK
+    z = ((z ^ (z >> 30)) * _MIX1) & _MASK
+    z = ((z ^ (z >> 27)) * _MIX2) & _MASK
+    return ((z ^ (z >> 31)) >> 11) * 2.0**-53
+
+
+def item_uniforms(key: tuple[object, ...], count: int) -> list[float]:
+    """``count`` uniform floats in [0, 1) for one simulated item.
+
+    Args:
+        key: What identifies the item, e.g. ``("weather", "london")``
+        count: How many values the item needs
+    """
+    if _seed is None:
+        return [_unseeded.random() for _ in range(count)]
+    state = _derive(key)
+    return [_splitmix(state, i) for i in range(count)]
+
+
+def item_uniform_columns(keys: Sequence[tuple[object, ...]], count: int) -> np.ndarray:
+    """`item_uniforms` for many items at once: shape ``(count, len(keys))``."""
+    import numpy as np
+
+    if _seed is None:
+        return np.random.default_rng().random((count, len(keys)))
+    states = np.fromiter((_derive(key) for key in keys), dtype=np.uint64, count=len(keys))
+    steps = (np.arange(1, count + 1, dtype=np.uint64) * np.uint64(_GOLDEN))[:, None]
+    z = states[None, :] + steps  # uint64 arithmetic wraps, as the & _MASK does above
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(_MIX1)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(_MIX2)
+    return ((z ^ (z >> np.uint64(31))) >> np.uint64(11)) * 2.0**-53
@@ -0,0 +1,102 @@
+"""Stateless HTTP - serve every request on its own, with no session state.
+
+Streamable HTTP sessions live in process memory, which ties each client to
+one process and costs memory for every idle client. With ``--stateless``
+each POST gets a fresh server session that ends with the response, so any
+process behind a plain load balancer can serve any request.
+
+Responses are plain JSON unless the request needs a stream:
+
+- A request carrying ``_meta.progressToken`` gets an SSE response, so its
+  progress notifications still reach the client
+- Everything else gets a single ``application/json`` body
+
+What needs a lasting session degrades instead of hanging:
+
+- Sampling and elicitation need the client's reply on the same session;
+  stateless sessions never see the client's capabilities, so those tools
+  report that the client can't be asked
+- Loadable tools (``load_bonus_tool``) are visible to every request
+- Per-session caches only last for one request
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.types import Message, Receive, Scope, Send
+
+# Whether the current request needs an SSE response (None outside requests)
+_needs_stream: ContextVar[bool | None] = ContextVar("needs_stream", default=None)
+
+
+def needs_stream(body: bytes) -> bool:
+    """Whether a JSON-RPC request body asks for progress notifications.
+
+    A plain substring test: a false positive (the text inside an argument)
+    only costs an SSE response, which every client must accept anyway.
+    """
+    return b'"progressToken"' in body
+
+
+async def buffer_body(receive: Receive, limit: int) -> tuple[bytes, Receive]:
+    """Read a request body and return it with a ``receive`` that replays it.
+
+    Stops once the body exceeds ``limit``; the transport then rejects it
+    with the usual error when it reads the rest.
+    """
+    messages: list[Message] = []
+    size = 0
+    while True:
+        message = await receive()
+        messages.append(message)
+        size += len(message.get("body", b""))
+        more = message["type"] == "http.request" and message.get("more_body", False)
+        if not more or size > limit:
+            break
+    body = b"".join(message.get("body", b"") for message in messages)
+
+    async def replay() -> Message:
+        return messages.pop(0) if messages else await receive()
+
+    return body, replay
+
+
+class StatelessSessionManager(StreamableHTTPSessionManager):
+    """Stateless session manager choosing JSON or SSE responses per request."""
+
+    @property  # type: ignore[override]
+    def json_response(self) -> bool:
+        stream = _needs_stream.get()
+        return self._json_default if stream is None else not stream
+
+    @json_response.setter
+    def json_response(self, value: bool) -> None:
+        self._json_default = value
+
+    async def handle_request(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["method"] != "POST":
+            await super().handle_request(scope, receive, send)
+            return
+
+        body, receive = await buffer_body(receive, self.max_request_body_size)
+        token = _needs_stream.set(needs_stream(body))
+        try:
+            await super().handle_request(scope, receive, send)
+        finally:
+            _needs_stream.reset(token)
+
+
+def use_stateless_http(mcp: FastMCP) -> None:
+    """Configure ``mcp`` to serve streamable HTTP statelessly (call before running)."""
+    mcp.settings.stateless_http = True
+    mcp.settings.json_response = True
+    mcp._session_manager = StatelessSessionManager(
+        app=mcp._mcp_server,
+        json_response=True,
+        stateless=True,
+        security_settings=mcp.settings.transport_security,
+        max_request_body_size=mcp.settings.max_request_body_size,
+    )
@@ -29,6 +29,8 @@ See: https://github.com/modelcontextprotocol/python-sdk/tree/main/docs/experimen
 
 from __future__ import annotations
 
+import os
+import sys
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
@@ -39,6 +41,28 @@ from mcp.server.experimental.task_context import ServerTaskContext
 from mcp.server.lowlevel import Server
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 
+from .http_profile import ServerProfile
+from .json_encoder import install_json_encoder
+from .progress import ProgressThrottle
+
+# At most one status notification per task per interval; the latest always gets through
+status_throttle = ProgressThrottle()
+
+
+async def update_status(task: ServerTaskContext, message: str, final: bool = False) -> None:
+    """Throttled ``task.update_status``.
+
+    The status itself is stored immediately, so clients polling ``tasks/get``
+    always see the latest; only the notification is throttled.
+
+    Args:
+        task: The running task
+        message: New status message
+        final: This is the task's last status update (sent immediately)
+    """
+    await task.update_status(message, notify=False)
+    await status_throttle.report(task.task_id, lambda: task.update_status(message), final=final)
+
 
 def create_task_server() -> Server:
     """Create and configure a task-enabled MCP server.
@@ -118,19 +142,20 @@ def create_task_server() -> Server:
         data_size = arguments.get("data_size", 5)
 
         async def work(task: ServerTaskContext) -> types.CallToolResult:
-            await task.update_status("Initializing data processing...")
+            await update_status(task, "Initializing data processing...")
             await anyio.sleep(0.5)
 
             for i in range(data_size):
                 if task.is_cancelled:
+                    await status_throttle.close(task.task_id)
                     return types.CallToolResult(
                         content=[types.TextContent(type="text", text="Processing cancelled")]
                     )
 
-                await task.update_status(f"Processing chunk {i + 1}/{data_size}...")
+                await update_status(task, f"Processing chunk {i + 1}/{data_size}...")
                 await anyio.sleep(1)  # Simulate work
 
-            await task.update_status("Finalizing results...")
+            await update_status(task, "Finalizing results...", final=True)
             await anyio.sleep(0.5)
 
             return types.CallToolResult(
@@ -151,7 +176,7 @@ def create_task_server() -> Server:
         action = arguments.get("action", "perform unknown action")
 
         async def work(task: ServerTaskContext) -> types.CallToolResult:
-            await task.update_status("Waiting for user confirmation...")
+            await update_status(task, "Waiting for user confirmation...", final=True)
 
             # Request user input via elicitation
             result = await task.elicit(
@@ -196,10 +221,10 @@ def create_task_server() -> Server:
         prompt = arguments.get("prompt", "Write a short greeting")
 
         async def work(task: ServerTaskContext) -> types.CallToolResult:
-            await task.update_status("Preparing to generate content...")
+            await update_status(task, "Preparing to generate content...")
             await anyio.sleep(0.5)
 
-            await task.update_status("Calling LLM for generation...")
+            await update_status(task, "Calling LLM for generation...", final=True)
 
             try:
                 # Request LLM sampling from the client
@@ -258,7 +283,13 @@ def create_task_server() -> Server:
     return server
 
 
-def run_task_server(host: str = "127.0.0.1", port: int = 8000) -> None:
+def run_task_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    profile: ServerProfile | None = None,
+    loop: str | None = None,
+    http_parser: str | None = None,
+) -> None:
     """Run the task-enabled server with Streamable HTTP transport.
 
     Tasks require HTTP transport (not stdio) for proper operation.
@@ -266,11 +297,22 @@ def run_task_server(host: str = "127.0.0.1", port: int = 8000) -> None:
     Args:
         host: Host to bind to
         port: Port to listen on
+        profile: uvicorn loop, parser and tuning (default: from MCP_STARTER_* variables)
+        loop: Event loop for the default profile, overriding MCP_STARTER_LOOP
+        http_parser: HTTP parser for the default profile, overriding MCP_STARTER_HTTP_PARSER
     """
     import uvicorn
     from starlette.applications import Starlette
     from starlette.routing import Mount
 
+    try:
+        profile = profile or ServerProfile.from_env(loop, http_parser)
+        encoder = install_json_encoder(os.environ.get("MCP_STARTER_JSON_ENCODER", "auto"))
+    except ValueError as e:
+        # Bad MCP_STARTER_* settings: a usage error, as the main server reports them
+        print(f"Error: {e}", file=sys.stderr)
+        raise SystemExit(2) from None
+
     server = create_task_server()
     session_manager = StreamableHTTPSessionManager(app=server)
 
@@ -291,15 +333,16 @@ def run_task_server(host: str = "127.0.0.1", port: int = 8000) -> None:
     print("  - generate_content: Task with LLM sampling")
     print()
     print("Note: Tasks require a compatible MCP client that supports task operations.")
+    print(f"HTTP profile: {profile.describe()}, JSON encoder: {encoder}")
 
-    uvicorn.run(starlette_app, host=host, port=port)
+    uvicorn.Server(profile.config(starlette_app, host=host, port=port)).run()
 
 
 if __name__ == "__main__":
-    import sys
-
     host = "127.0.0.1"
     port = 8000
+    loop = None
+    http_parser = None
 
     # Simple arg parsing
     for i, arg in enumerate(sys.argv[1:], 1):
@@ -307,5 +350,9 @@ if __name__ == "__main__":
             host = sys.argv[i + 1]
         elif arg == "--port" and i < len(sys.argv):
             port = int(sys.argv[i + 1])
+        elif arg == "--loop" and i < len(sys.argv):
+            loop = sys.argv[i + 1]
+        elif arg == "--http-parser" and i < len(sys.argv):
+            http_parser = sys.argv[i + 1]
 
-    run_task_server(host=host, port=port)
+    run_task_server(host=host, port=port, loop=loop, http_parser=http_parser)
@@ -24,29 +24,106 @@ See: https://modelcontextprotocol.io/docs/concepts/tools
 
 from __future__ import annotations
 
-import asyncio
-import random
+import time
 from typing import Annotated, Any, Literal
 
+import anyio
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.session import ServerSession
-from mcp.types import Icon, ToolAnnotations
+from mcp.types import (
+    ClientCapabilities,
+    CreateMessageResult,
+    ElicitationCapability,
+    SamplingCapability,
+    SamplingMessage,
+    TextContent,
+    ToolAnnotations,
+)
 from pydantic import Field
 
-from .icons import (
-    ABACUS_ICON,
-    HOURGLASS_ICON,
-    PACKAGE_ICON,
-    ROBOT_ICON,
-    SUN_BEHIND_CLOUD_ICON,
-    WAVING_HAND_ICON,
-)
+from .approvals import ApprovalCache
+from .calculator import Operand, Operation, calculate, evaluate
+from .deadlines import ToolDeadlines
+from .execution import ToolExecutor
+from .icons import tool_icons
+from .progress import ProgressThrottle
+from .progress_pump import ProgressPump
+from .result_cache import ToolResultCache
+from .sampling_cache import SamplingCache, sampling_key
+from .sampling_stream import stream_message
+from .session_recovery import SessionSync
+from .session_tools import SessionTools
+from .weather import CityNotFoundError, StubWeatherProvider, WeatherCache
+from .workloads import hash_chain_steps
+
+# Opt-in per-session memory of confirm_action approvals (--approval-ttl)
+approval_cache = ApprovalCache()
+
+# Time budgets for every tool call (@tool_deadlines.timeout, client _meta.deadline)
+tool_deadlines = ToolDeadlines()
+
+# Thread/process pools for sync tools (@executor.policy), sized by --*-workers
+executor = ToolExecutor()
+
+# Dynamically loadable tools, visible only to the sessions that load them
+session_tools = SessionTools()
+
+# Session records in the external session store (enabled by --session-store)
+session_sync = SessionSync(session_tools)
+
+# Results of read-only + idempotent tools are served from here on repeat calls
+result_cache = ToolResultCache()
+
+# Opt-in cache of ask_llm sampling results (enabled by --sampling-cache-ttl)
+sampling_cache = SamplingCache()
+
+# At most one progress notification per token per interval (--progress-interval)
+progress_throttle = ProgressThrottle()
+
+# Progress notifications queued off the step loop of every long_task call
+progress_pump = ProgressPump(progress_throttle)
+
+# get_weather reads through this cache; swap the provider for a real backend
+weather_cache = WeatherCache(StubWeatherProvider())
 
-# Enum type for calculator operations
-Operation = Literal["add", "subtract", "multiply", "divide"]
+# Upper bound on cities per get_weather_batch call
+MAX_BATCH_CITIES = 5000
 
-# Track if bonus tool is loaded
-_bonus_tool_loaded = False
+# Session tools that load_bonus_tool makes visible
+BONUS_TOOLS = ("bonus_calculator", "bonus_expression")
+
+# Limits for ask_llm_many fan-out
+MAX_FANOUT_PROMPTS = 100
+MAX_FANOUT_CONCURRENCY = 32
+
+
+# Client capabilities behind server-to-client requests
+SAMPLING = ClientCapabilities(sampling=SamplingCapability())
+ELICITATION = ClientCapabilities(elicitation=ElicitationCapability())
+
+
+def _require_client(session: ServerSession, capability: ClientCapabilities, name: str) -> None:
+    """Fail fast rather than send a request the client can't answer.
+
+    Stateless HTTP sessions never see the client's initialize, so they have
+    no capabilities: the reply would arrive on another request and never
+    reach this one.
+    """
+    if not session.check_client_capability(capability):
+        raise RuntimeError(f"the client has not declared {name} support in this session")
+
+
+async def _sample(session: ServerSession, prompt: str, max_tokens: int) -> CreateMessageResult:
+    """One sampling request, through the sampling cache."""
+    _require_client(session, SAMPLING, "sampling")
+    return await sampling_cache.get(
+        session,
+        sampling_key(prompt, max_tokens),
+        lambda: session.create_message(
+            messages=[SamplingMessage(role="user", content=TextContent(type="text", text=prompt))],
+            max_tokens=max_tokens,
+        ),
+    )
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -60,14 +137,10 @@ def register_tools(mcp: FastMCP) -> None:
             idempotentHint=True,
             openWorldHint=False,
         ),
-        icons=[
-            Icon(
-                src=WAVING_HAND_ICON,
-                mimeType="image/png",
-                sizes=["256x256"],
-            ),
-        ],
+        icons=tool_icons("waving_hand"),
     )
+    @result_cache.ttl(3600)  # Pure function of its arguments
+    @executor.policy("inline")  # Trivial; a pool hop would cost more than the call
     def hello(
         name: Annotated[str, Field(title="Name", description="Name of the person to greet")],
     ) -> str:
@@ -82,43 +155,56 @@ def register_tools(mcp: FastMCP) -> None:
             idempotentHint=False,  # Simulated - results vary
             openWorldHint=False,  # Not real external call
         ),
-        icons=[
-            Icon(
-                src=SUN_BEHIND_CLOUD_ICON,
-                mimeType="image/png",
-                sizes=["256x256"],
-            ),
-        ],
+        icons=tool_icons("sun_behind_cloud"),
     )
-    def get_weather(
+    async def get_weather(
         city: Annotated[str, Field(title="City", description="City name to get weather for")],
     ) -> dict[str, Any]:
         """Get the current weather for a city"""
-        conditions = ["sunny", "cloudy", "rainy", "windy"]
-        return {
-            "location": city,
-            "temperature": round(15 + random.random() * 20),
-            "unit": "celsius",
-            "conditions": random.choice(conditions),
-            "humidity": round(40 + random.random() * 40),
-        }
+        try:
+            return await weather_cache.get(city)
+        except CityNotFoundError:
+            raise ValueError(f"Unknown city: {city!r}") from None
 
     @mcp.tool(
         annotations=ToolAnnotations(
-            title="Ask LLM",
+            title="Get Weather (Batch)",
             readOnlyHint=True,
             destructiveHint=False,
-            idempotentHint=False,  # LLM responses vary
+            idempotentHint=False,  # Simulated - results vary
             openWorldHint=False,
         ),
-        icons=[
-            Icon(
-                src=ROBOT_ICON,
-                mimeType="image/png",
-                sizes=["256x256"],
+        icons=tool_icons("sun_behind_cloud"),
+    )
+    async def get_weather_batch(
+        cities: Annotated[
+            list[str],
+            Field(
+                title="Cities",
+                description="City names to get weather for",
+                min_length=1,
+                max_length=MAX_BATCH_CITIES,
             ),
         ],
+    ) -> dict[str, Any]:
+        """Get the current weather for many cities in one call.
+
+        Returns columns (one list per field, in input order) instead of one
+        object per city; values are null for unknown cities.
+        """
+        return {"count": len(cities), **(await weather_cache.get_many(cities))}
+
+    @mcp.tool(
+        annotations=ToolAnnotations(
+            title="Ask LLM",
+            readOnlyHint=True,
+            destructiveHint=False,
+            idempotentHint=False,  # LLM responses vary
+            openWorldHint=False,
+        ),
+        icons=tool_icons("robot"),
     )
+    @tool_deadlines.timeout(120)  # Waits on the client's LLM
     async def ask_llm(
         prompt: Annotated[
             str, Field(title="Prompt", description="The question or prompt to send to the LLM")
@@ -127,18 +213,34 @@ def register_tools(mcp: FastMCP) -> None:
         maxTokens: Annotated[
             int, Field(title="Max Tokens", description="Maximum tokens in response")
         ] = 100,
+        streamChunkTokens: Annotated[
+            int,
+            Field(
+                title="Stream Chunk Tokens",
+                description="Stream the answer as progress notifications, sampling this many "
+                "tokens at a time (0 = wait for the full answer; needs a progress token)",
+                ge=0,
+            ),
+        ] = 0,
     ) -> str:
         """Ask the connected LLM a question using sampling"""
         try:
-            result = await ctx.session.create_message(
-                messages=[
-                    {
-                        "role": "user",
-                        "content": {"type": "text", "text": prompt},
-                    }
-                ],
-                max_tokens=maxTokens,
-            )
+            meta = ctx.request_context.meta
+            # Without a progress token nothing could be streamed: sample once
+            if streamChunkTokens and meta is not None and meta.progressToken is not None:
+                _require_client(ctx.session, SAMPLING, "sampling")
+
+                async def forward(chunk: str, tokens: int) -> None:
+                    # Not throttled: each chunk is a delta (the throttle keeps only the
+                    # latest update), and a sampling round trip already spaces them out
+                    await ctx.report_progress(min(tokens, maxTokens), maxTokens, chunk)
+
+                streamed = await stream_message(
+                    ctx.session, prompt, maxTokens, streamChunkTokens, forward
+                )
+                return f"LLM Response: {streamed.text}"
+
+            result = await _sample(ctx.session, prompt, maxTokens)
             if result.content.type == "text":
                 return f"LLM Response: {result.content.text}"
             return "LLM Response: [non-text response]"
@@ -147,102 +249,220 @@ def register_tools(mcp: FastMCP) -> None:
 
     @mcp.tool(
         annotations=ToolAnnotations(
-            title="Long Running Task",
+            title="Ask LLM (Many)",
             readOnlyHint=True,
             destructiveHint=False,
-            idempotentHint=True,
+            idempotentHint=False,  # LLM responses vary
             openWorldHint=False,
         ),
-        icons=[
-            Icon(
-                src=HOURGLASS_ICON,
-                mimeType="image/png",
-                sizes=["256x256"],
+        icons=tool_icons("robot"),
+    )
+    @tool_deadlines.timeout(300)
+    async def ask_llm_many(
+        prompts: Annotated[
+            list[str],
+            Field(
+                title="Prompts",
+                description="Questions or prompts to send to the LLM",
+                min_length=1,
+                max_length=MAX_FANOUT_PROMPTS,
             ),
         ],
+        ctx: Context[ServerSession, None],
+        maxTokens: Annotated[
+            int, Field(title="Max Tokens", description="Maximum tokens in each response")
+        ] = 100,
+        maxConcurrency: Annotated[
+            int,
+            Field(
+                title="Max Concurrency",
+                description="Maximum sampling requests in flight at once",
+                ge=1,
+                le=MAX_FANOUT_CONCURRENCY,
+            ),
+        ] = 4,
+    ) -> dict[str, Any]:
+        """Ask the connected LLM several questions in parallel using sampling.
+
+        Returns one result per prompt, in input order, each with the response
+        text or the error, and its latency.
+        """
+        results: list[dict[str, Any]] = [{} for _ in prompts]
+        limiter = anyio.Semaphore(maxConcurrency)
+
+        async def ask(index: int, prompt: str) -> None:
+            async with limiter:
+                start = time.perf_counter()
+                text: str | None = None
+                error: str | None = None
+                try:
+                    result = await _sample(ctx.session, prompt, maxTokens)
+                    text = result.content.text if result.content.type == "text" else None
+                    if text is None:
+                        error = "non-text response"
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+                results[index] = {
+                    "text": text,
+                    "error": error,
+                    "latencyMs": round((time.perf_counter() - start) * 1000, 1),
+                }
+
+        async with anyio.create_task_group() as tg:
+            for index, prompt in enumerate(prompts):
+                tg.start_soon(ask, index, prompt)
+
+        return {
+            "count": len(prompts),
+            "failed": sum(result["error"] is not None for result in results),
+            "results": results,
+        }
+
+    @mcp.tool(
+        annotations=ToolAnnotations(
+            title="Long Running Task",
+            readOnlyHint=True,
+            destructiveHint=False,
+            idempotentHint=True,
+            openWorldHint=False,
+        ),
+        icons=tool_icons("hourglass"),
     )
+    @tool_deadlines.timeout(600)  # Up to ~600 steps
     async def long_task(
         taskName: Annotated[str, Field(title="Task Name", description="Name for this task")],
         ctx: Context[ServerSession, None],
         steps: Annotated[int, Field(title="Steps", description="Number of steps to simulate")] = 5,
+        mode: Annotated[
+            Literal["sleep", "cpu"],
+            Field(
+                title="Mode",
+                description="'sleep' waits on the event loop; 'cpu' does real CPU work "
+                "in a worker process",
+            ),
+        ] = "sleep",
     ) -> str:
         """Simulate a long-running task with progress updates"""
+        # Fail fast rather than run into the deadline (the tool's or the client's)
+        remaining = anyio.current_effective_deadline() - anyio.current_time()
+        if steps > remaining:
+            raise ValueError(f"{steps} steps won't finish before the deadline ({remaining:.0f}s)")
+
         await ctx.info(f"Starting task: {taskName}")
 
-        for i in range(steps):
-            await ctx.report_progress(
-                progress=i / steps,
-                total=1.0,
-                message=f"Step {i + 1}/{steps}",
+        if mode == "cpu":
+            # Progress flows back from the worker process through a pipe
+            await executor.run_with_progress(
+                hash_chain_steps,
+                steps,
+                1.0,
+                on_progress=lambda done, total: progress_pump.post(
+                    ctx, progress=done / total, total=1.0, message=f"Step {done}/{total}"
+                ),
             )
-            await asyncio.sleep(1.0)
-
-        await ctx.report_progress(progress=1.0, total=1.0, message="Complete!")
+        else:
+            for i in range(steps):
+                # Queued, not awaited: a slow client can't hold up the step loop
+                progress_pump.post(
+                    ctx,
+                    progress=i / steps,
+                    total=1.0,
+                    message=f"Step {i + 1}/{steps}",
+                )
+                await anyio.sleep(1.0)
+
+        progress_pump.post(ctx, progress=1.0, total=1.0, message="Complete!")
+        await progress_pump.flush(ctx)  # Progress must arrive before the result
 
         return f'Task "{taskName}" completed successfully after {steps} steps!'
 
+    # Defined up front but not listed: each session opts in via load_bonus_tool
+    @session_tools.tool(
+        annotations=ToolAnnotations(
+            title="Bonus Calculator",
+            readOnlyHint=True,
+            destructiveHint=False,
+            idempotentHint=True,  # Pure computation
+            openWorldHint=False,
+        ),
+        icons=tool_icons("abacus"),
+    )
+    @result_cache.ttl(3600)
+    @executor.policy("thread")  # Array mode can be large; NumPy releases the GIL
+    def bonus_calculator(a: Operand, b: Operand, operation: Operation) -> str | list[float | None]:
+        """A calculator that was dynamically loaded.
+
+        For bulk scoring, pass equal-length arrays as `a` and `b`: either JSON
+        lists or base64 strings of little-endian float64 values. Results come
+        back in the same encoding; division by zero gives NaN (null in lists).
+
+        Args:
+            a: First number, or an array of numbers
+            b: Second number, or an array of numbers
+            operation: Mathematical operation to perform
+        """
+        return calculate(a, b, operation)
+
+    @session_tools.tool(
+        annotations=ToolAnnotations(
+            title="Bonus Expression Calculator",
+            readOnlyHint=True,
+            destructiveHint=False,
+            idempotentHint=True,  # Pure computation
+            openWorldHint=False,
+        ),
+        icons=tool_icons("abacus"),
+    )
+    @result_cache.ttl(3600)
+    @executor.policy("thread")
+    def bonus_expression(
+        expression: Annotated[
+            str,
+            Field(
+                title="Expression",
+                description="Arithmetic with + - * / ** and parentheses, e.g. (a+b)*c/2",
+            ),
+        ],
+        variables: Annotated[
+            dict[str, Operand],
+            Field(
+                title="Variables",
+                description="Value of each variable: a number, or an array (JSON list or "
+                "base64 little-endian float64) to evaluate the expression per element",
+            ),
+        ],
+    ) -> str | list[float | None]:
+        """Evaluate an arithmetic expression with named variables.
+
+        Array variables must have equal lengths; results come back in the same
+        encoding. Division by zero gives NaN (null in lists).
+        """
+        return evaluate(expression, variables)
+
     @mcp.tool(
         annotations=ToolAnnotations(
             title="Load Bonus Tool",
-            readOnlyHint=False,  # Modifies server state
+            readOnlyHint=False,  # Modifies this session's tool list
             destructiveHint=False,
             idempotentHint=True,  # Safe to call multiple times
             openWorldHint=False,
         ),
-        icons=[
-            Icon(
-                src=PACKAGE_ICON,
-                mimeType="image/png",
-                sizes=["256x256"],
-            ),
-        ],
+        icons=tool_icons("package"),
     )
     async def load_bonus_tool(ctx: Context[ServerSession, None]) -> str:
-        """Dynamically register a new bonus tool"""
-        global _bonus_tool_loaded
-
-        if _bonus_tool_loaded:
-            return "Bonus tool is already loaded! Try calling 'bonus_calculator'."
-
-        @mcp.tool(
-            annotations=ToolAnnotations(
-                title="Bonus Calculator",
-                readOnlyHint=True,
-                destructiveHint=False,
-                idempotentHint=True,  # Pure computation
-                openWorldHint=False,
-            ),
-            icons=[
-                Icon(
-                    src=ABACUS_ICON,
-                    mimeType="image/png",
-                    sizes=["256x256"],
-                ),
-            ],
-        )
-        def bonus_calculator(a: float, b: float, operation: Operation) -> str:
-            """A calculator that was dynamically loaded.
-
-            Args:
-                a: First number
-                b: Second number
-                operation: Mathematical operation to perform
-            """
-            ops = {
-                "add": a + b,
-                "subtract": a - b,
-                "multiply": a * b,
-                "divide": a / b if b != 0 else float("nan"),
-            }
-            result = ops.get(operation, float("nan"))
-            return f"{a} {operation} {b} = {result}"
-
-        _bonus_tool_loaded = True
-
-        # Notify clients that the tools list has changed
+        """Dynamically register the bonus calculator tools"""
+        # Only this session sees the tools, so other clients' lists are unaffected
+        loaded = [session_tools.load(ctx.session, name) for name in BONUS_TOOLS]
+        if not any(loaded):
+            return "Bonus tools are already loaded! Try calling 'bonus_calculator'."
+
+        await session_sync.save(ctx.session)  # So the tools survive a move to another process
+
+        # Notify this client that its tools list has changed
         await ctx.session.send_tool_list_changed()
 
-        return "Bonus tool 'bonus_calculator' has been loaded! The tools list has been updated."
+        names = ", ".join(f"'{name}'" for name in BONUS_TOOLS)
+        return f"Bonus tools {names} have been loaded! The tools list has been updated."
 
     # =========================================================================
     # Elicitation Tools - Request user input during tool execution
@@ -274,6 +494,7 @@ def register_tools(mcp: FastMCP) -> None:
             openWorldHint=False,
         ),
     )
+    @tool_deadlines.timeout(600)  # Waits for the user
     async def confirm_action(
         action: Annotated[
             str, Field(title="Action", description="Description of the action to confirm")
@@ -285,7 +506,13 @@ def register_tools(mcp: FastMCP) -> None:
         ] = False,
     ) -> str:
         """Request user confirmation before proceeding"""
+        # Skip the dialog if this session approved the same action recently
+        reason = approval_cache.get(ctx.session, action, destructive)
+        if reason is not None:
+            return f"Action confirmed: {action}\nReason: {reason} (remembered approval)"
+
         try:
+            _require_client(ctx.session, ELICITATION, "elicitation")
             # Form elicitation: Display a structured form with typed fields
             # The client renders this as a dialog/form based on the JSON schema
             result = await ctx.session.elicit_form(
@@ -311,7 +538,9 @@ def register_tools(mcp: FastMCP) -> None:
             if result.action == "accept":
                 content = result.content or {}
                 if content.get("confirm"):
-                    reason = content.get("reason", "No reason provided")
+                    given = content.get("reason")
+                    reason = given if isinstance(given, str) else "No reason provided"
+                    approval_cache.remember(ctx.session, action, destructive, reason)
                     return f"Action confirmed: {action}\nReason: {reason}"
                 return f"Action declined by user: {action}"
             elif result.action == "decline":
@@ -330,6 +559,7 @@ def register_tools(mcp: FastMCP) -> None:
             openWorldHint=True,  # Opens external URL
         ),
     )
+    @tool_deadlines.timeout(600)  # Waits for the user
     async def get_feedback(
         question: Annotated[
             str, Field(title="Question", description="The question to ask the user")
@@ -342,6 +572,7 @@ def register_tools(mcp: FastMCP) -> None:
             feedback_url += f"&title={question}"
 
         try:
+            _require_client(ctx.session, ELICITATION, "elicitation")
             # URL elicitation: Open a web page in the user's browser
             # Useful for OAuth flows, external forms, documentation links, etc.
             result = await ctx.session.elicit_url(
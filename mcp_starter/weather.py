@@ -0,0 +1,357 @@
+"""Weather - pluggable provider behind get_weather, with a per-city cache.
+
+`get_weather` stands in for a real weather backend: repeated cities and a slow
+upstream. The provider interface lets you swap the local stub for a real API
+client; the cache in front of it keeps that upstream off the hot path:
+
+- Fresh: within `fresh_ttl` a reading is served straight from the cache
+- Stale-while-revalidate: for `stale_ttl` more seconds the old reading is
+  served immediately while one background fetch refreshes it
+- Negative caching: unknown cities are remembered for `negative_ttl`
+- Bounded: the least recently used cities are evicted beyond `maxsize`
+- Coalescing: concurrent requests for the same city share a single fetch,
+  which keeps going when any of them - even the one that started it - is
+  cancelled
+
+Batches (`get_weather_batch`) go through the same cache: cached cities are
+reused and all the others are fetched with one `fetch_many` call, which the
+stub provider generates in a single vectorized NumPy pass when NumPy is
+installed (the `perf` extra).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import asdict, dataclass
+from typing import Any, Protocol, TypeVar
+
+from .simulation import item_uniform_columns, item_uniforms
+
+T = TypeVar("T")
+
+WeatherReading = dict[str, Any]
+# Column name -> one value per city, e.g. {"temperature": [21, 17, ...]}
+WeatherColumns = dict[str, list[Any]]
+
+READING_FIELDS = ("location", "temperature", "unit", "conditions", "humidity")
+
+
+class CityNotFoundError(LookupError):
+    """The provider has no weather for this city (cached negatively)."""
+
+
+class WeatherProvider(Protocol):
+    """Upstream source of weather readings."""
+
+    async def fetch(self, city: str) -> WeatherReading: ...
+
+
+class BatchWeatherProvider(WeatherProvider, Protocol):
+    """Provider that can fetch many cities in one upstream call."""
+
+    async def fetch_many(self, cities: list[str]) -> list[WeatherReading | None]:
+        """Readings in input order; None where the city is unknown."""
+        ...
+
+
+class StubWeatherProvider:
+    """Local provider returning simulated readings.
+
+    Args:
+        latency: Simulated upstream round trip in seconds
+    """
+
+    CONDITIONS = ("sunny", "cloudy", "rainy", "windy")
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+
+    async def fetch(self, city: str) -> WeatherReading:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if not city.strip():
+            raise CityNotFoundError(city)
+        temperature, humidity, condition = item_uniforms(self._key(city), 3)
+        return self._reading(city, temperature, humidity, condition)
+
+    async def fetch_many(self, cities: list[str]) -> list[WeatherReading | None]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        keys = [self._key(city) for city in cities]
+        try:
+            import numpy as np
+        except ImportError:
+            draws = [item_uniforms(key, 3) for key in keys]
+            return [
+                self._reading(city, *draw) if city.strip() else None
+                for city, draw in zip(cities, draws, strict=True)
+            ]
+        u = item_uniform_columns(keys, 3)
+        temperature = np.rint(15 + u[0] * 20).astype(np.int64).tolist()
+        humidity = np.rint(40 + u[1] * 40).astype(np.int64).tolist()
+        conditions = np.asarray(self.CONDITIONS)[(u[2] * 4).astype(np.int64)].tolist()
+        return [
+            {
+                "location": city,
+                "temperature": temperature[i],
+                "unit": "celsius",
+                "conditions": conditions[i],
+                "humidity": humidity[i],
+            }
+            if city.strip()
+            else None
+            for i, city in enumerate(cities)
+        ]
+
+    @staticmethod
+    def _key(city: str) -> tuple[str, str]:
+        # Same normalization as the cache, so a city's seeded reading never
+        # depends on which spelling reached the provider first
+        return ("weather", city.strip().casefold())
+
+    def _reading(
+        self, city: str, temperature: float, humidity: float, condition: float
+    ) -> WeatherReading:
+        return {
+            "location": city,
+            "temperature": round(15 + temperature * 20),
+            "unit": "celsius",
+            "conditions": self.CONDITIONS[int(condition * 4)],
+            "humidity": round(40 + humidity * 40),
+        }
+
+
+@dataclass
+class WeatherCacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    refreshes: int = 0
+    errors: int = 0
+
+
+@dataclass
+class _Entry:
+    reading: WeatherReading | None  # None = city not found
+    fresh_until: float
+    stale_until: float
+
+
+class WeatherCache:
+    """Per-city TTL + LRU cache with stale-while-revalidate in front of a provider.
+
+    Readings are keyed by the normalized city name but always report the
+    ``location`` as the caller spelled it.
+    """
+
+    def __init__(
+        self,
+        provider: WeatherProvider,
+        fresh_ttl: float = 60.0,
+        stale_ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+        maxsize: int = 4096,
+    ) -> None:
+        self.provider = provider
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self.stats = WeatherCacheStats()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[_Entry]] = {}
+        self._background: set[asyncio.Future[Any]] = set()
+
+    async def get(self, city: str) -> WeatherReading:
+        """Weather for a city, from the cache when possible.
+
+        Raises:
+            CityNotFoundError: If the provider doesn't know the city
+        """
+        key = city.strip().casefold()
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        if entry is not None and now < entry.fresh_until:
+            if entry.reading is None:
+                self.stats.negative_hits += 1
+            else:
+                self.stats.hits += 1
+        elif entry is not None and entry.reading is not None and now < entry.stale_until:
+            self.stats.stale_hits += 1
+            if key not in self._inflight:
+                self.stats.refreshes += 1
+                self._start(key, city)
+        else:
+            self.stats.misses += 1
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self.stats.coalesced += 1
+            else:
+                inflight = self._start(key, city)
+            # Shield so a caller being cancelled - even the one that started the
+            # fetch - doesn't cancel it for the others
+            entry = await asyncio.shield(inflight)
+
+        if entry.reading is None:
+            raise CityNotFoundError(city)
+        # As requested, not as whichever spelling was fetched first
+        return {**entry.reading, "location": city}
+
+    def _start(self, key: str, city: str) -> asyncio.Future[_Entry]:
+        """Start fetching a city in the background, as an in-flight fetch others can share."""
+        task = self._detach(self._fetch(key, city))
+        self._inflight[key] = task
+        return task
+
+    async def _fetch(self, key: str, city: str) -> _Entry:
+        try:
+            try:
+                reading: WeatherReading | None = await self.provider.fetch(city)
+                ttl = self.fresh_ttl
+            except CityNotFoundError:
+                reading, ttl = None, self.negative_ttl
+            now = time.monotonic()
+            entry = _Entry(reading, now + ttl, now + ttl + (self.stale_ttl if reading else 0))
+            self._store(key, entry)
+            return entry
+        except Exception:
+            self.stats.errors += 1
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def get_many(self, cities: list[str]) -> WeatherColumns:
+        """Weather for many cities as columns (None where a city is unknown).
+
+        Cached readings are reused as in ``get``: fresh ones directly, stale
+        ones while a background batch refreshes them. Cities already being
+        fetched (by ``get`` or another batch) share that fetch; every other
+        distinct city is fetched in a single ``fetch_many`` call (falling back
+        to concurrent ``fetch`` calls for providers without one).
+        """
+        now = time.monotonic()
+        keys = [city.strip().casefold() for city in cities]
+        found: dict[str, _Entry] = {}
+        missing: dict[str, str] = {}
+        refresh: dict[str, str] = {}
+        waiting: dict[str, asyncio.Future[_Entry]] = {}
+        for key, city in zip(keys, cities, strict=True):
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            if entry is not None and now < entry.fresh_until:
+                found[key] = entry
+                if entry.reading is None:
+                    self.stats.negative_hits += 1
+                else:
+                    self.stats.hits += 1
+            elif entry is not None and entry.reading is not None and now < entry.stale_until:
+                found[key] = entry
+                self.stats.stale_hits += 1
+                if key not in self._inflight:
+                    refresh.setdefault(key, city)
+            else:
+                self.stats.misses += 1
+                inflight = self._inflight.get(key)
+                if inflight is not None:
+                    if key not in waiting:
+                        self.stats.coalesced += 1
+                        waiting[key] = inflight
+                else:
+                    missing.setdefault(key, city)
+
+        if refresh:
+            self.stats.refreshes += 1
+            self._start_many(refresh)
+        if missing:
+            waiting.update(self._start_many(missing))
+        if waiting:
+            # Shielded as in ``get``
+            entries = await asyncio.gather(*(asyncio.shield(f) for f in waiting.values()))
+            found.update(zip(waiting, entries, strict=True))
+
+        columns: WeatherColumns = {name: [] for name in READING_FIELDS}
+        for key, city in zip(keys, cities, strict=True):
+            reading = found[key].reading
+            for name in READING_FIELDS:
+                columns[name].append(reading[name] if reading is not None else None)
+            columns["location"][-1] = city  # As requested, like ``get``
+        return columns
+
+    def _start_many(self, cities: dict[str, str]) -> dict[str, asyncio.Future[_Entry]]:
+        """Start fetching cities (key -> name) in the background, as in ``_start``."""
+        fetch_many = getattr(self.provider, "fetch_many", None)
+        if fetch_many is None:
+            return {key: self._start(key, city) for key, city in cities.items()}
+        loop = asyncio.get_running_loop()
+        futures: dict[str, asyncio.Future[_Entry]] = {key: loop.create_future() for key in cities}
+        self._inflight.update(futures)
+        self._detach(self._fetch_many(fetch_many, cities, futures))
+        return futures
+
+    async def _fetch_many(
+        self,
+        fetch_many: Callable[[list[str]], Awaitable[list[WeatherReading | None]]],
+        cities: dict[str, str],
+        futures: dict[str, asyncio.Future[_Entry]],
+    ) -> None:
+        try:
+            readings = await fetch_many(list(cities.values()))
+            now = time.monotonic()
+            for key, reading in zip(cities, readings, strict=True):
+                ttl = self.fresh_ttl if reading is not None else self.negative_ttl
+                stale = self.stale_ttl if reading is not None else 0
+                entry = _Entry(reading, now + ttl, now + ttl + stale)
+                self._store(key, entry)
+                futures[key].set_result(entry)
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            self.stats.errors += 1
+            for future in futures.values():
+                future.set_exception(e)
+                future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            for key in cities:
+                del self._inflight[key]
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _detach(self, fetch: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+        """Run a fetch as a task of its own, kept alive until it's done."""
+        task = asyncio.ensure_future(fetch)
+        self._background.add(task)
+        task.add_done_callback(self._fetch_done)
+        return task
+
+    def _fetch_done(self, task: asyncio.Future[Any]) -> None:
+        self._background.discard(task)
+        if not task.cancelled():
+            task.exception()  # Errors are counted in stats; callers see them too
+
+    def snapshot(self) -> dict[str, Any]:
+        """Statistics for the weather cache stats resource."""
+        return {
+            **asdict(self.stats),
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "inflight": len(self._inflight),
+            "fresh_ttl": self.fresh_ttl,
+            "stale_ttl": self.stale_ttl,
+            "negative_ttl": self.negative_ttl,
+        }
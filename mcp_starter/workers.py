@@ -0,0 +1,320 @@
+"""HTTP Workers - pre-forked server processes sharing one port.
+
+A single process serves every HTTP session, so one core caps throughput.
+With ``--workers N`` the master process forks N workers that each bind the
+public port with ``SO_REUSEPORT``; the kernel spreads incoming connections
+across them. The master only supervises: it restarts workers that crash and
+forwards shutdown signals.
+
+SESSION AFFINITY:
+A session (its transport, streams and per-session caches) lives in the
+worker that created it, but a client's next connection may land on any
+worker. So:
+
+- Each worker mints session IDs that carry its index (``w3-<uuid hex>``),
+  making the owner a pure function of the ``Mcp-Session-Id`` header
+- Each worker also listens on a private unix socket
+- A request for another worker's session is forwarded to that socket and
+  the response (SSE streams included) is relayed back
+
+Clients keep their connection open between requests, so most requests
+reach the owner directly and forwarding costs one local hop after a
+reconnect. A restarted worker has lost its sessions; clients re-initialize,
+just as after a server restart.
+
+Requires ``SO_REUSEPORT`` and unix sockets (Linux, macOS, BSD).
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import re
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+import uuid
+from collections.abc import Callable
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from types import SimpleNamespace
+from typing import Any
+
+import anyio
+import httpx
+import uvicorn
+from mcp.server import streamable_http_manager
+from mcp.server.fastmcp import FastMCP
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from mcp.types import INVALID_REQUEST, ErrorData, JSONRPCError
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .http_profile import ServerProfile
+
+logger = logging.getLogger(__name__)
+
+SESSION_ID_RE = re.compile(r"w(\d+)-")
+
+# A worker that dies sooner than this after starting is failing to start,
+# not crashing; restarting it would only loop
+MIN_UPTIME = 2.0
+
+# Connection-level headers that must not be relayed between hops
+HOP_BY_HOP = frozenset(
+    {b"connection", b"keep-alive", b"proxy-connection", b"te", b"transfer-encoding", b"upgrade"}
+)
+
+
+_SESSION_NOT_FOUND = Response(
+    JSONRPCError(
+        jsonrpc="2.0",
+        id="server-error",
+        error=ErrorData(code=INVALID_REQUEST, message="Session not found"),
+    ).model_dump_json(by_alias=True, exclude_none=True),
+    status_code=404,
+    media_type="application/json",
+)
+
+
+def session_owner(session_id: str, workers: int) -> int | None:
+    """Index of the worker that created a session, or None if it isn't ours."""
+    match = SESSION_ID_RE.match(session_id)
+    if match is None:
+        return None
+    index = int(match.group(1))
+    return index if index < workers else None
+
+
+class _SessionIds:
+    """Stands in for ``uuid4`` in the SDK's session manager to prefix new session IDs."""
+
+    def __init__(self, index: int) -> None:
+        self.prefix = f"w{index}-"
+
+    def __call__(self) -> SimpleNamespace:
+        return SimpleNamespace(hex=self.prefix + uuid.uuid4().hex)
+
+
+class SessionRouter:
+    """ASGI middleware forwarding requests for other workers' sessions to their owner.
+
+    Args:
+        app: This worker's MCP app
+        index: This worker's index
+        sockets: Private unix socket path of every worker, by index
+    """
+
+    def __init__(self, app: ASGIApp, index: int, sockets: list[str]) -> None:
+        self.app = app
+        self.index = index
+        self.sockets = sockets
+        self.forwarded = 0
+        self._clients: dict[int, httpx.AsyncClient] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == MCP_SESSION_ID_HEADER.encode():
+                    owner = session_owner(value.decode("latin-1"), len(self.sockets))
+                    if owner is not None and owner != self.index:
+                        await self._forward(owner, scope, receive, send)
+                        return
+                    break
+        elif scope["type"] == "lifespan":
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                for client in self._clients.values():
+                    await client.aclose()
+            return
+        await self.app(scope, receive, send)
+
+    async def _forward(self, owner: int, scope: Scope, receive: Receive, send: Send) -> None:
+        self.forwarded += 1
+        # MCP request bodies are single JSON-RPC messages; the SDK reads them
+        # whole too
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in HOP_BY_HOP and name != b"content-length"
+        ]
+        target = scope.get("raw_path") or scope["path"].encode()
+        if scope["query_string"]:
+            target += b"?" + scope["query_string"]
+        request = self._client(owner).build_request(
+            scope["method"], target.decode("latin-1"), headers=headers, content=bytes(body)
+        )
+
+        async def relay(cancel: anyio.CancelScope) -> None:
+            try:
+                response = await self._client(owner).send(request, stream=True)
+            except httpx.TransportError:
+                # The owner is gone (e.g. restarting), and its sessions with it
+                await _SESSION_NOT_FOUND(scope, receive, send)
+                cancel.cancel()
+                return
+            try:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": response.status_code,
+                        "headers": [
+                            (name, value)
+                            for name, value in response.headers.raw
+                            if name.lower() not in HOP_BY_HOP
+                        ],
+                    }
+                )
+                async for chunk in response.aiter_raw():
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+            finally:
+                await response.aclose()
+            cancel.cancel()
+
+        async def watch_disconnect(cancel: anyio.CancelScope) -> None:
+            message: Message = {"type": ""}
+            while message["type"] != "http.disconnect":
+                message = await receive()
+            cancel.cancel()  # Stop relaying an SSE stream nobody is reading
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(relay, tg.cancel_scope)
+            tg.start_soon(watch_disconnect, tg.cancel_scope)
+
+    def _client(self, owner: int) -> httpx.AsyncClient:
+        client = self._clients.get(owner)
+        if client is None:
+            client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=self.sockets[owner]),
+                base_url="http://worker",
+                timeout=httpx.Timeout(None),  # SSE streams stay open
+                limits=httpx.Limits(max_connections=None),
+            )
+            self._clients[owner] = client
+        return client
+
+
+def _listen_public(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+
+def _listen_private(path: str) -> socket.socket:
+    if os.path.exists(path):
+        os.unlink(path)  # Left behind by a crashed worker
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    return sock
+
+
+def _run_worker(
+    mcp: FastMCP,
+    index: int,
+    sockets: list[str],
+    profile: ServerProfile,
+    finalize: Callable[[], None] | None,
+) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    streamable_http_manager.uuid4 = _SessionIds(index)  # type: ignore[attr-defined]
+    listeners = [
+        _listen_public(mcp.settings.host, mcp.settings.port),
+        _listen_private(sockets[index]),
+    ]
+    app = SessionRouter(mcp.streamable_http_app(), index, sockets)
+    server = uvicorn.Server(profile.config(app, log_level=mcp.settings.log_level.lower()))
+    try:
+        server.run(sockets=listeners)
+    finally:
+        if finalize is not None:
+            finalize()
+    if not server.started:
+        sys.exit(3)
+
+
+def run_workers(
+    mcp: FastMCP,
+    workers: int,
+    profile: ServerProfile | None = None,
+    finalize: Callable[[], None] | None = None,
+) -> None:
+    """Serve ``mcp`` over streamable HTTP from ``workers`` pre-forked processes.
+
+    Args:
+        mcp: The configured server; workers inherit it as-is
+        workers: Number of worker processes
+        profile: uvicorn loop, parser and tuning for every worker (default: auto)
+        finalize: Called in each worker as it exits (e.g. to stop its pools)
+    """
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise RuntimeError("--workers needs SO_REUSEPORT, which this platform lacks")
+
+    # Fail here, not in every worker, if the port is taken
+    _listen_public(mcp.settings.host, mcp.settings.port).close()
+
+    profile = profile or ServerProfile.resolve()
+    context = multiprocessing.get_context("fork")
+    socket_dir = tempfile.mkdtemp(prefix="mcp-starter-")
+    sockets = [os.path.join(socket_dir, f"worker-{index}.sock") for index in range(workers)]
+    processes: dict[int, tuple[BaseProcess, float]] = {}
+    stopping = False
+
+    def start(index: int) -> None:
+        process = context.Process(
+            target=_run_worker,
+            args=(mcp, index, sockets, profile, finalize),
+            name=f"mcp-worker-{index}",
+        )
+        process.start()
+        processes[index] = (process, time.monotonic())
+        logger.info("Started worker %d (pid %d)", index, process.pid)
+
+    def stop(signum: int, frame: Any) -> None:
+        nonlocal stopping
+        stopping = True
+        for process, _ in processes.values():
+            if process.is_alive():
+                process.terminate()
+
+    previous = {sig: signal.signal(sig, stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        for index in range(workers):
+            start(index)
+        while not stopping:
+            wait([process.sentinel for process, _ in processes.values()])
+            for index, (process, started) in list(processes.items()):
+                if process.is_alive() or stopping:
+                    continue
+                if time.monotonic() - started < MIN_UPTIME:
+                    logger.error(
+                        "Worker %d failed to start (exit code %s)", index, process.exitcode
+                    )
+                    stop(signal.SIGTERM, None)
+                    break
+                logger.warning("Worker %d exited (code %s), restarting", index, process.exitcode)
+                start(index)
+    finally:
+        for process, _ in processes.values():
+            process.join()
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+        shutil.rmtree(socket_dir, ignore_errors=True)
@@ -0,0 +1,37 @@
+"""Workloads - CPU-bound functions run in worker processes.
+
+Kept free of heavy imports: functions here are pickled by reference and run
+in the tool executor's process pool (see `execution.py`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any
+
+
+def hash_chain_steps(steps: int, seconds_per_step: float, progress: Any, cancelled: Any) -> int:
+    """Spend each step hashing a SHA-256 chain, reporting progress after every step.
+
+    Args:
+        steps: Number of steps
+        seconds_per_step: CPU time to spend per step
+        progress: Pipe connection receiving ``(completed_steps, steps)`` after each step
+        cancelled: Event set by the caller to stop early
+
+    Returns:
+        Total number of hash rounds computed
+    """
+    digest = b"mcp-python-starter"
+    rounds = 0
+    for step in range(steps):
+        deadline = time.perf_counter() + seconds_per_step
+        while time.perf_counter() < deadline:
+            if cancelled.is_set():
+                return rounds
+            for _ in range(1000):
+                digest = hashlib.sha256(digest).digest()
+            rounds += 1000
+        progress.send((step + 1, steps))
+    return rounds
@@ -0,0 +1,86 @@
+"""Approval cache: remembered confirm_action approvals and their TTL."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from mcp.client.session import ClientSession
+from mcp.server.session import ServerSession
+from mcp.shared.context import RequestContext
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.types import ElicitRequestParams, ElicitResult, TextContent
+
+from mcp_starter import approvals
+from mcp_starter.server import mcp
+from mcp_starter.tools import approval_cache
+
+pytestmark = pytest.mark.anyio
+
+
+class Session:
+    """Stands in for a ServerSession as a cache scope."""
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    # Only the cache's clock: the event loop keeps real time
+    monkeypatch.setattr(approvals, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+@pytest.fixture
+def cache_enabled():
+    approval_cache.ttl = 60
+    yield
+    approval_cache.ttl = 0
+
+
+async def test_approval_is_reused_within_ttl_and_expires_after(clock: Clock, cache_enabled) -> None:
+    prompts: list[str] = []
+
+    async def approve(
+        context: RequestContext[ClientSession, Any], params: ElicitRequestParams
+    ) -> ElicitResult:
+        prompts.append(params.message)
+        return ElicitResult(action="accept", content={"confirm": True, "reason": "looks fine"})
+
+    async with create_connected_server_and_client_session(
+        mcp._mcp_server, elicitation_callback=approve
+    ) as client:
+
+        async def confirm(action: str) -> str:
+            result = await client.call_tool("confirm_action", {"action": action})
+            content = result.content[0]
+            assert isinstance(content, TextContent)
+            return content.text
+
+        assert "Reason: looks fine" in await confirm("Deploy to staging")
+        clock.now += 59
+        assert "remembered approval" in await confirm("deploy  to STAGING")
+        assert len(prompts) == 1
+
+        clock.now += 2  # Past the TTL
+        assert "remembered approval" not in await confirm("Deploy to staging")
+        assert len(prompts) == 2
+
+
+def test_destructive_approvals_are_not_remembered_by_default(clock: Clock) -> None:
+    session = cast(ServerSession, Session())
+    cache = approvals.ApprovalCache(ttl=60)
+    cache.remember(session, "Drop table", True, "ok")
+    assert cache.get(session, "Drop table", True) is None
+
+    cache = approvals.ApprovalCache(ttl=60, allow_destructive=True)
+    cache.remember(session, "Drop table", True, "ok")
+    assert cache.get(session, "Drop table", True) == "ok"
@@ -0,0 +1,128 @@
+"""Calculator: scalar and array operands, and compiled expressions."""
+
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from mcp_starter.calculator import (
+    calculate,
+    compile_expression,
+    decode_floats,
+    encode_floats,
+    evaluate,
+)
+
+
+def b64(*values: float) -> str:
+    return encode_floats(array("d", values))
+
+
+def test_scalars_give_an_equation() -> None:
+    assert calculate(6, 3, "divide") == "6.0 divide 3.0 = 2.0"
+
+
+def test_numeric_strings_are_scalars() -> None:
+    assert calculate("3", 4.5, "add") == "3.0 add 4.5 = 7.5"
+    assert evaluate("a*b", {"a": "2", "b": 5}) == "a*b = 10.0"
+    assert calculate("2", [1, 2], "multiply") == [2.0, 4.0]
+
+
+def test_lists_broadcast_scalars_and_divide_by_zero_to_null() -> None:
+    assert calculate([1, 2, 3], 2, "subtract") == [-1.0, 0.0, 1.0]
+    assert calculate([1, 2], [0, 4], "divide") == [None, 0.5]
+
+
+def test_base64_operands_give_base64_results() -> None:
+    result = calculate(b64(1, 2), "10", "multiply")
+    assert isinstance(result, str)
+    assert list(decode_floats(result)) == [10.0, 20.0]
+
+
+def test_mismatched_lengths_are_rejected() -> None:
+    with pytest.raises(ValueError, match="equal lengths"):
+        calculate([1, 2], [1, 2, 3], "add")
+
+
+def test_invalid_base64_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        calculate("not base64!", 1, "add")
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("(a+b)*c/2", "(a+b)*c/2 = 4.5"),
+        ("-a**2", "-a**2 = -1.0"),
+        ("c/0", "c/0 = nan"),
+        ("10**400", "10**400 = inf"),
+        ("0**-1", "0**-1 = inf"),
+    ],
+)
+def test_expression_scalars(expression: str, expected: str) -> None:
+    assert evaluate(expression, {"a": 1, "b": 2, "c": 3}) == expected
+
+
+def test_expression_arrays() -> None:
+    assert evaluate("a*2 + b/c", {"a": [1, 2], "b": [3, 4], "c": [0, 2]}) == [None, 6.0]
+    result = evaluate("a - 1", {"a": b64(1.5, 2.5)})
+    assert isinstance(result, str)
+    assert list(decode_floats(result)) == [0.5, 1.5]
+
+
+@pytest.mark.parametrize(
+    ("a", "b"),
+    [(0.0, -1.0), (-0.0, -1.0), (-0.0, -2.0), (-8.0, 1 / 3), (-10.0, 401.0), (2.0, 0.5)],
+)
+def test_power_agrees_for_scalars_and_arrays(a: float, b: float) -> None:
+    equation = evaluate("a**b", {"a": a, "b": b})
+    assert isinstance(equation, str)
+    scalar = float(equation.split(" = ")[1])
+    result = evaluate("a**b", {"a": b64(a), "b": b})
+    assert isinstance(result, str)
+    (element,) = decode_floats(result)
+    assert str(element) == str(scalar)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "__import__('os')",
+        "a.real",
+        "a[0]",
+        "a if b else c",
+        "a // b",
+        "a % b",
+        "'text'",
+        "True + a",
+        "[a]",
+        "lambda: a",
+        "_divide(a, b)",
+    ],
+)
+def test_expression_whitelist(expression: str) -> None:
+    with pytest.raises(ValueError):
+        compile_expression(expression)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "-" * 400 + "1",
+        "+".join(["a"] * 300),
+        "**".join(["2"] * 300),
+        "(" * 300 + "1" + ")" * 300,
+        "a" * 1001,
+        "(a+",
+        "1" + "0" * 400,
+    ],
+)
+def test_expression_errors_are_value_errors(expression: str) -> None:
+    with pytest.raises(ValueError):
+        compile_expression(expression)
+
+
+def test_missing_variables() -> None:
+    with pytest.raises(ValueError, match="Missing variables: b"):
+        evaluate("a+b", {"a": 1})
@@ -0,0 +1,103 @@
+"""Tool deadlines: per-tool timeouts, client deadlines and call accounting."""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import anyio
+import pytest
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools import Tool
+
+from mcp_starter.deadlines import CallStats, ToolDeadlines
+
+pytestmark = pytest.mark.anyio
+
+
+def tool(fn: Any, name: str | None = None) -> Tool:
+    return Tool.from_function(fn, name=name)
+
+
+def deadline_in(seconds: float) -> SimpleNamespace:
+    """Request ``_meta`` carrying a client deadline."""
+    return SimpleNamespace(deadline=time.time() + seconds)
+
+
+async def sleep_for(seconds: float) -> str:
+    await anyio.sleep(seconds)
+    return "done"
+
+
+async def test_tool_timeout_aborts_the_call() -> None:
+    deadlines = ToolDeadlines(default_timeout=None)
+
+    @deadlines.timeout(0.05)
+    async def slow() -> None:
+        await anyio.sleep(10)
+
+    with pytest.raises(ToolError, match="slow timed out"):
+        await deadlines.run(tool(slow), None, slow)
+    assert deadlines.snapshot()["tools"]["slow"] == {"calls": 1, "cancelled": 0, "timed_out": 1}
+
+
+async def test_client_deadline_tightens_the_tool_timeout() -> None:
+    deadlines = ToolDeadlines(default_timeout=60)
+    fast = tool(sleep_for)
+    assert deadlines.budget(fast) == 60
+    assert deadlines.budget(fast, deadline_in(3600)) == 60
+    assert deadlines.budget(fast, deadline_in(5)) == pytest.approx(5, abs=1)
+
+    with pytest.raises(ToolError, match="timed out"):
+        await deadlines.run(fast, deadline_in(0.05), lambda: sleep_for(10))
+    assert await deadlines.run(fast, deadline_in(5), lambda: sleep_for(0)) == "done"
+    assert deadlines.stats["sleep_for"].timed_out == 1
+
+
+async def test_passed_deadline_fails_without_running() -> None:
+    deadlines = ToolDeadlines()
+    ran: list[bool] = []
+
+    async def call() -> None:
+        ran.append(True)
+
+    with pytest.raises(ToolError, match="had already passed"):
+        await deadlines.run(tool(sleep_for), deadline_in(-1), call)
+    assert not ran
+    assert deadlines.stats["sleep_for"].timed_out == 1
+
+
+def test_invalid_deadline_is_rejected() -> None:
+    with pytest.raises(ToolError, match="Invalid _meta"):
+        ToolDeadlines().budget(tool(sleep_for), SimpleNamespace(deadline="soon"))
+
+
+async def test_cancelled_calls_are_counted() -> None:
+    deadlines = ToolDeadlines()
+    started = anyio.Event()
+
+    async def call() -> None:
+        started.set()
+        await anyio.sleep(10)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(deadlines.run, tool(sleep_for), None, call)
+        await started.wait()
+        tg.cancel_scope.cancel()  # As a client's notifications/cancelled does
+    assert deadlines.stats["sleep_for"] == CallStats(calls=1, cancelled=1, timed_out=0)
+
+
+async def test_timeout_is_per_registered_tool() -> None:
+    deadlines = ToolDeadlines(default_timeout=60)
+
+    def make(seconds: float | None) -> Any:
+        @deadlines.timeout(seconds)
+        async def lookup() -> None: ...
+
+        return lookup
+
+    # Same function name, different tools
+    assert deadlines.timeout_for(tool(make(5), name="short")) == 5
+    assert deadlines.timeout_for(tool(make(None), name="unlimited")) is None
+    assert deadlines.timeout_for(tool(sleep_for)) == 60
@@ -0,0 +1,74 @@
+"""Tool executor: thread and process policies, and process work with progress."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from mcp_starter.execution import ToolExecutor
+from mcp_starter.workloads import hash_chain_steps
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def executor():
+    executor = ToolExecutor(thread_workers=2, process_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+async def test_thread_policy_runs_off_the_event_loop(executor: ToolExecutor) -> None:
+    @executor.policy("thread")
+    def where(x: int) -> tuple[int, str]:
+        return x, threading.current_thread().name
+
+    x, thread = await where(x=1)  # type: ignore[misc]
+    assert x == 1
+    assert thread.startswith("tool")
+    assert executor.modes["where"] == "thread"
+
+
+def test_thread_policy_rejects_async_tools(executor: ToolExecutor) -> None:
+    async def tool() -> None: ...
+
+    with pytest.raises(ValueError, match="only sync tools"):
+        executor.policy("thread")(tool)
+
+
+async def test_process_policy_runs_in_a_worker(executor: ToolExecutor) -> None:
+    pid = executor.policy("process")(os.getpid)
+    assert await pid() != os.getpid()  # type: ignore[misc]
+    assert executor.modes["getpid"] == "process"
+
+
+def test_process_policy_rejects_functions_not_pickled_by_reference(
+    executor: ToolExecutor,
+) -> None:
+    def nested() -> None: ...
+
+    with pytest.raises(ValueError, match="module-level function"):
+        executor.policy("process")(nested)
+
+
+@pytest.mark.parametrize("watch_fd", [True, False])
+async def test_run_with_progress_delivers_every_update(
+    executor: ToolExecutor, watch_fd: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if not watch_fd:  # As on loops that can't watch pipes (Windows' proactor)
+
+        def add_reader(*args: object) -> None:
+            raise NotImplementedError
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "add_reader", add_reader)
+    updates: list[tuple[int, int]] = []
+
+    async def on_progress(done: int, total: int) -> None:
+        updates.append((done, total))
+
+    rounds = await executor.run_with_progress(hash_chain_steps, 3, 0.01, on_progress=on_progress)
+    assert rounds > 0
+    assert updates == [(1, 3), (2, 3), (3, 3)]
@@ -0,0 +1,28 @@
+"""HTTP profile: resolving the event loop and HTTP parser."""
+
+from __future__ import annotations
+
+import pytest
+
+from mcp_starter.http_profile import ServerProfile
+from mcp_starter.tasks import run_task_server
+
+
+def test_explicit_choices_are_kept() -> None:
+    profile = ServerProfile.resolve("asyncio", "h11", keep_alive=30)
+    assert (profile.loop, profile.http, profile.keep_alive) == ("asyncio", "h11", 30)
+
+
+@pytest.mark.parametrize(("loop", "http"), [("bogus", "auto"), ("auto", "h2")])
+def test_unknown_choices_are_rejected(loop: str, http: str) -> None:
+    with pytest.raises(ValueError, match="Unknown"):
+        ServerProfile.resolve(loop, http)
+
+
+def test_task_server_reports_bad_settings_as_usage_errors(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    with pytest.raises(SystemExit) as exit_info:
+        run_task_server(loop="bogus")
+    assert exit_info.value.code == 2
+    assert "Unknown event loop 'bogus'" in capsys.readouterr().err
@@ -0,0 +1,88 @@
+"""JSON encoder: orjson and msgspec write the same messages pydantic does."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import mcp.types as types
+import pytest
+
+from mcp_starter import json_encoder
+from mcp_starter.json_encoder import install_json_encoder
+
+MESSAGES = {
+    "request": types.JSONRPCRequest(
+        jsonrpc="2.0",
+        id=7,
+        method="sampling/createMessage",
+        params={"maxTokens": 100, "messages": [], "_meta": {"progressToken": "t"}},
+    ),
+    "notification": types.JSONRPCNotification(
+        jsonrpc="2.0",
+        method="notifications/progress",
+        params={"progressToken": 1, "progress": 0.5, "total": None, "message": "½ done"},
+    ),
+    "response": types.JSONRPCResponse(
+        jsonrpc="2.0",
+        id="a",
+        result={
+            "content": [{"type": "text", "text": "Zürich ☀️ 東京"}],
+            "structuredContent": {"temperature": [21, None], "ratio": [0.1, 1e-7, 2.5e15]},
+        },
+    ),
+    "non-finite floats": types.JSONRPCResponse(
+        jsonrpc="2.0",
+        id=1,
+        result={"values": [float("nan"), float("inf"), -float("inf"), 1.5]},
+    ),
+    "ints beyond 64 bits": types.JSONRPCResponse(
+        jsonrpc="2.0", id=2, result={"big": 2**64, "negative": -(2**70), "small": 2**63 - 1}
+    ),
+    "error": types.JSONRPCError(
+        jsonrpc="2.0",
+        id=3,
+        error=types.ErrorData(code=-32602, message="Invalid params: ¿qué?", data={"x": None}),
+    ),
+}
+
+
+def wire(message: types.JSONRPCMessage) -> str:
+    """As the transports write a message."""
+    return message.model_dump_json(by_alias=True, exclude_none=True)
+
+
+@pytest.fixture(params=["orjson", "msgspec"])
+def encoder(request: pytest.FixtureRequest) -> Iterator[str]:
+    pytest.importorskip(request.param)
+    yield install_json_encoder(request.param)
+    install_json_encoder("pydantic")
+
+
+@pytest.mark.parametrize("name", MESSAGES)
+def test_wire_output_matches_pydantic(encoder: str, name: str) -> None:
+    message = types.JSONRPCMessage(MESSAGES[name])
+    expected = json_encoder._pydantic_dump_json(message, by_alias=True, exclude_none=True)
+    assert wire(message) == expected
+
+
+def test_other_calls_keep_pydantic_behavior(encoder: str) -> None:
+    message = types.JSONRPCMessage(MESSAGES["notification"])
+    assert message.model_dump_json(indent=2) == json_encoder._pydantic_dump_json(message, indent=2)
+
+
+def test_only_what_the_library_rejects_falls_back(
+    encoder: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fell_back: list[str] = []
+    original = json_encoder._pydantic_dump_json
+
+    def pydantic_dump_json(message: types.JSONRPCMessage, **kwargs: Any) -> str:
+        fell_back.append(type(message.root).__name__)
+        return original(message, **kwargs)
+
+    monkeypatch.setattr(json_encoder, "_pydantic_dump_json", pydantic_dump_json)
+    for message in MESSAGES.values():
+        wire(types.JSONRPCMessage(message))
+    expected = ["JSONRPCError"] if encoder == "msgspec" else ["JSONRPCResponse", "JSONRPCError"]
+    assert fell_back == expected
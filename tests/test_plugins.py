@@ -0,0 +1,96 @@
+"""Lazy plugin tools: import on first call, declared output schema."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from mcp_starter.plugins import LazyTool, ToolPlugin
+
+pytestmark = pytest.mark.anyio
+
+COUNT_SCHEMA = {
+    "type": "object",
+    "properties": {"words": {"type": "integer"}},
+    "required": ["words"],
+}
+
+
+def word_count(text: str) -> dict:
+    return {"words": len(text.split())}
+
+
+def word_list(text: str) -> list[str]:
+    return text.split()
+
+
+def plugin(target: str, **kwargs: Any) -> ToolPlugin:
+    return ToolPlugin(
+        name=target,
+        description="Test plugin",
+        target=f"{__name__}:{target}",
+        input_schema={
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"],
+        },
+        **kwargs,
+    )
+
+
+async def call(tool: LazyTool, arguments: dict[str, Any]) -> Any:
+    mcp = FastMCP("test", tools=[tool])
+    async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+        listed = await client.list_tools()
+        assert listed.tools[0].outputSchema == tool.declared_output_schema
+        return await client.call_tool(tool.name, arguments)
+
+
+async def test_imported_on_first_call() -> None:
+    tool = LazyTool.from_plugin(plugin("word_count"))
+    assert not tool.is_imported
+    result = await call(tool, {"text": "one two three"})
+    assert tool.is_imported
+    assert not result.isError
+    assert result.structuredContent is None
+
+
+async def test_declared_output_schema_with_bare_dict_return() -> None:
+    tool = LazyTool.from_plugin(plugin("word_count", output_schema=COUNT_SCHEMA))
+    result = await call(tool, {"text": "one two three"})
+    assert not result.isError, result.content
+    assert result.structuredContent == {"words": 3}
+
+
+async def test_non_object_result_is_wrapped() -> None:
+    schema = {
+        "type": "object",
+        "properties": {"result": {"type": "array", "items": {"type": "string"}}},
+    }
+    tool = LazyTool.from_plugin(plugin("word_list", output_schema=schema))
+    result = await call(tool, {"text": "a b"})
+    assert result.structuredContent == {"result": ["a", "b"]}
+
+
+async def test_result_not_matching_declared_schema_is_an_error() -> None:
+    schema = {"type": "object", "properties": {"lines": {"type": "integer"}}, "required": ["lines"]}
+    tool = LazyTool.from_plugin(plugin("word_count", output_schema=schema))
+    result = await call(tool, {"text": "one"})
+    assert result.isError
+
+
+async def test_missing_target_is_a_tool_error() -> None:
+    tool = LazyTool.from_plugin(plugin("no_such_function"))
+    result = await call(tool, {"text": "x"})
+    assert result.isError
+    assert "Error loading tool" in result.content[0].text  # type: ignore[union-attr]
+    assert not tool.is_imported
+
+
+def test_fn_is_not_called_directly() -> None:
+    tool = LazyTool.from_plugin(plugin("word_count"))
+    with pytest.raises(RuntimeError, match=r"LazyTool\.run"):
+        tool.fn(text="x")
@@ -0,0 +1,72 @@
+"""Progress throttle: coalescing per key and delivery of final updates."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from mcp_starter.progress import ProgressThrottle
+
+pytestmark = pytest.mark.anyio
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.sent: list[float] = []
+
+    def send(self, value: float):
+        async def send() -> None:
+            self.sent.append(value)
+
+        return send
+
+
+async def test_burst_forwards_first_and_latest() -> None:
+    throttle = ProgressThrottle(min_interval=0.05)
+    recorder = Recorder()
+    for value in range(5):
+        await throttle.report("token", recorder.send(value))
+    assert recorder.sent == [0]  # The rest are held back...
+
+    await asyncio.sleep(0.1)
+    assert recorder.sent == [0, 4]  # ...and only the latest is forwarded
+    assert throttle.stats.forwarded == 2
+    assert throttle.stats.suppressed == 3
+
+
+async def test_final_update_is_sent_immediately() -> None:
+    throttle = ProgressThrottle(min_interval=60)
+    recorder = Recorder()
+    await throttle.report("token", recorder.send(0.1))
+    await throttle.report("token", recorder.send(0.5))
+    await throttle.report("token", recorder.send(1.0), final=True)
+    assert recorder.sent == [0.1, 1.0]
+    assert throttle.stats.suppressed == 1
+
+
+async def test_close_flushes_pending_update() -> None:
+    throttle = ProgressThrottle(min_interval=60)
+    recorder = Recorder()
+    await throttle.report("token", recorder.send(0.1))
+    await throttle.report("token", recorder.send(0.7))
+    await throttle.close("token")
+    assert recorder.sent == [0.1, 0.7]
+
+
+async def test_keys_are_throttled_independently() -> None:
+    throttle = ProgressThrottle(min_interval=60)
+    recorder = Recorder()
+    await throttle.report("a", recorder.send(1))
+    await throttle.report("b", recorder.send(2))
+    assert recorder.sent == [1, 2]
+
+
+async def test_discard_drops_pending_update() -> None:
+    throttle = ProgressThrottle(min_interval=0.01)
+    recorder = Recorder()
+    await throttle.report("token", recorder.send(0.1))
+    await throttle.report("token", recorder.send(0.2))
+    throttle.discard("token")
+    await asyncio.sleep(0.05)
+    assert recorder.sent == [0.1]
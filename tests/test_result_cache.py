@@ -0,0 +1,113 @@
+"""Tool result cache: canonical keys, per-tool TTLs and what is cacheable."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from mcp.server.fastmcp import Context
+from mcp.server.fastmcp.tools import Tool
+from mcp.types import ToolAnnotations
+
+from mcp_starter import result_cache
+from mcp_starter.plugins import LazyTool, ToolPlugin
+from mcp_starter.result_cache import ToolResultCache
+
+pytestmark = pytest.mark.anyio
+
+PURE = ToolAnnotations(readOnlyHint=True, idempotentHint=True)
+
+
+def pure_tool(fn: Any, name: str | None = None) -> Tool:
+    return Tool.from_function(fn, name=name, annotations=PURE)
+
+
+async def call_counting(cache: ToolResultCache, tool: Tool, arguments: dict[str, Any]) -> int:
+    """Call through the cache; 1 if the tool ran, 0 if answered from the cache."""
+    ran = []
+
+    async def run() -> Any:
+        ran.append(True)
+        return await tool.run(arguments)
+
+    await cache.call(tool, arguments, run)
+    return len(ran)
+
+
+def scale(a: int, b: int, factor: float = 1.0) -> float:
+    return (a + b) * factor
+
+
+async def test_equivalent_arguments_share_an_entry() -> None:
+    cache = ToolResultCache()
+    tool = pure_tool(scale)
+    assert await call_counting(cache, tool, {"a": 1, "b": 2}) == 1
+    assert await call_counting(cache, tool, {"b": 2, "a": 1}) == 0
+    assert await call_counting(cache, tool, {"a": "1", "b": 2}) == 0  # Coerced to int
+    assert await call_counting(cache, tool, {"a": 1, "b": 2, "factor": 1.0}) == 0  # Default
+    assert await call_counting(cache, tool, {"a": 1, "b": 3}) == 1
+    assert cache.stats["scale"].hits == 3
+
+
+async def test_invalid_arguments_bypass_the_cache() -> None:
+    cache = ToolResultCache()
+    tool = pure_tool(scale)
+    with pytest.raises(Exception, match="validation error"):
+        await call_counting(cache, tool, {"a": "x", "b": 2})
+    assert "scale" not in cache.stats
+
+
+async def test_ttl_is_per_registered_tool() -> None:
+    cache = ToolResultCache(default_ttl=60.0)
+
+    def make(seconds: float) -> Any:
+        @cache.ttl(seconds)
+        def lookup(key: str) -> str:
+            return key
+
+        return lookup
+
+    short = pure_tool(make(0.0), name="short")
+    long = pure_tool(make(3600.0), name="long")
+    assert cache.ttl_for(short) == 0.0
+    assert cache.ttl_for(long) == 3600.0
+    assert cache.ttl_for(pure_tool(scale)) == 60.0
+
+    assert await call_counting(cache, short, {"key": "k"}) == 1
+    assert await call_counting(cache, short, {"key": "k"}) == 1  # Expired at once
+    assert await call_counting(cache, long, {"key": "k"}) == 1
+    assert await call_counting(cache, long, {"key": "k"}) == 0
+
+
+async def test_repeats_spelled_the_same_skip_validation(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = ToolResultCache()
+    tool = pure_tool(scale)
+    validated: list[dict[str, Any]] = []
+    canonical_json = result_cache._canonical_json
+
+    def counting(tool: Tool, arguments: dict[str, Any]) -> str | None:
+        validated.append(arguments)
+        return canonical_json(tool, arguments)
+
+    monkeypatch.setattr(result_cache, "_canonical_json", counting)
+    assert await call_counting(cache, tool, {"a": 1, "b": 2}) == 1
+    assert await call_counting(cache, tool, {"b": 2, "a": 1}) == 0
+    assert await call_counting(cache, tool, {"a": "1", "b": 2}) == 0
+    assert await call_counting(cache, tool, {"a": "1", "b": 2}) == 0
+    assert validated == [{"a": 1, "b": 2}, {"a": "1", "b": 2}]
+    assert cache.snapshot()["tools"] == {"scale": {"hits": 3, "misses": 1}}
+
+
+def needs_context(text: str, ctx: Context) -> str:
+    return text
+
+
+def test_plugins_taking_a_context_are_not_cached() -> None:
+    plugin = ToolPlugin(
+        name="needs_context",
+        description="Test plugin",
+        target=f"{__name__}:needs_context",
+        input_schema={"type": "object", "properties": {"text": {"type": "string"}}},
+        annotations=PURE,
+    )
+    assert not ToolResultCache().cacheable(LazyTool.from_plugin(plugin))
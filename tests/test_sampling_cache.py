@@ -0,0 +1,123 @@
+"""Sampling cache: singleflight and per-session TTL entries."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import cast
+
+import pytest
+from mcp.server.session import ServerSession
+from mcp.types import CreateMessageResult, TextContent
+
+from mcp_starter.sampling_cache import SamplingCache, sampling_key
+
+pytestmark = pytest.mark.anyio
+
+
+class Session:
+    """Stands in for a ServerSession as a cache scope."""
+
+
+def new_session() -> ServerSession:
+    return cast(ServerSession, Session())
+
+
+class Sampler:
+    """Counts sampling requests and answers them once released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> CreateMessageResult:
+        self.calls += 1
+        await self.release.wait()
+        return CreateMessageResult(
+            role="assistant",
+            content=TextContent(type="text", text=f"answer {self.calls}"),
+            model="test",
+        )
+
+
+async def test_concurrent_requests_share_one_sampling() -> None:
+    cache = SamplingCache(ttl=60)
+    sampler = Sampler()
+    sampler.release.clear()
+    session = new_session()
+    key = sampling_key("Why?", 100)
+
+    waiters = [asyncio.ensure_future(cache.get(session, key, sampler)) for _ in range(3)]
+    await asyncio.sleep(0)
+    sampler.release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert sampler.calls == 1
+    assert all(result is results[0] for result in results)
+    assert (cache.stats.misses, cache.stats.coalesced) == (1, 2)
+
+    assert await cache.get(session, key, sampler) is results[0]
+    assert cache.stats.hits == 1
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_sampling() -> None:
+    cache = SamplingCache(ttl=60)
+    sampler = Sampler()
+    sampler.release.clear()
+    session = new_session()
+    key = sampling_key("Why?", 100)
+
+    owner = asyncio.ensure_future(cache.get(session, key, sampler))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(cache.get(session, key, sampler))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    sampler.release.set()
+
+    assert (await owner).model == "test"
+    assert waiter.cancelled()
+    assert sampler.calls == 1
+
+
+async def test_cancelled_owner_does_not_fail_coalesced_waiters() -> None:
+    cache = SamplingCache(ttl=60)
+    sampler = Sampler()
+    sampler.release.clear()
+    session = new_session()
+    key = sampling_key("Why?", 100)
+
+    owner = asyncio.ensure_future(cache.get(session, key, sampler))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(cache.get(session, key, sampler))
+    await asyncio.sleep(0)
+    owner.cancel()
+    await asyncio.sleep(0)
+    sampler.release.set()
+
+    assert (await waiter).model == "test"
+    assert owner.cancelled()
+    assert sampler.calls == 1
+
+
+async def test_entries_are_scoped_to_the_session() -> None:
+    cache = SamplingCache(ttl=60)
+    sampler = Sampler()
+    key = sampling_key("Why?", 100)
+    await cache.get(new_session(), key, sampler)
+    await cache.get(new_session(), key, sampler)
+    assert sampler.calls == 2
+
+
+async def test_failures_are_not_cached() -> None:
+    cache = SamplingCache(ttl=60)
+    session = new_session()
+    key = sampling_key("Why?", 100)
+
+    async def fail() -> CreateMessageResult:
+        raise RuntimeError("client went away")
+
+    with pytest.raises(RuntimeError):
+        await cache.get(session, key, fail)
+    sampler = Sampler()
+    await cache.get(session, key, sampler)
+    assert sampler.calls == 1
@@ -0,0 +1,75 @@
+"""Streamed ask_llm: chunks as progress notifications, when the client asked for progress."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from mcp.client.session import ClientSession
+from mcp.shared.context import RequestContext
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.types import CreateMessageRequestParams, CreateMessageResult, TextContent
+
+from mcp_starter.server import mcp
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_every_streamed_chunk_is_reported() -> None:
+    chunks = 0
+
+    async def sample(
+        context: RequestContext[ClientSession, Any], params: CreateMessageRequestParams
+    ) -> CreateMessageResult:
+        nonlocal chunks
+        chunks += 1
+        return CreateMessageResult(
+            role="assistant",
+            content=TextContent(type="text", text=f"[c{chunks}]"),
+            model="test",
+            stopReason="maxTokens",
+        )
+
+    messages: list[str | None] = []
+
+    async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+        messages.append(message)
+
+    async with create_connected_server_and_client_session(
+        mcp._mcp_server, sampling_callback=sample
+    ) as client:
+        result = await client.call_tool(
+            "ask_llm",
+            {"prompt": "Count", "maxTokens": 10, "streamChunkTokens": 1},
+            progress_callback=on_progress,
+        )
+
+    expected = [f"[c{i}]" for i in range(1, 11)]
+    content = result.content[0]
+    assert isinstance(content, TextContent)
+    assert content.text == "LLM Response: " + "".join(expected)
+    assert messages == expected
+
+
+async def test_without_progress_token_samples_once() -> None:
+    budgets: list[int] = []
+
+    async def sample(
+        context: RequestContext[ClientSession, Any], params: CreateMessageRequestParams
+    ) -> CreateMessageResult:
+        budgets.append(params.maxTokens)
+        return CreateMessageResult(
+            role="assistant", content=TextContent(type="text", text="whole"), model="test"
+        )
+
+    async with create_connected_server_and_client_session(
+        mcp._mcp_server, sampling_callback=sample
+    ) as client:
+        result = await client.call_tool(
+            "ask_llm", {"prompt": "Count", "maxTokens": 10, "streamChunkTokens": 1}
+        )
+
+    content = result.content[0]
+    assert isinstance(content, TextContent)
+    assert content.text == "LLM Response: whole"
+    assert budgets == [10]
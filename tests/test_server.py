@@ -0,0 +1,80 @@
+"""Server dispatch: the cached tools/list and per-session tool overlays."""
+
+from __future__ import annotations
+
+import mcp.types as types
+import pytest
+from mcp.client.session import ClientSession
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from mcp_starter.server import mcp, tool_list_cache
+
+pytestmark = pytest.mark.anyio
+
+BONUS_ARGUMENTS = {"a": 6, "b": 3, "operation": "divide"}
+
+
+async def tool_names(client: ClientSession) -> set[str]:
+    return {tool.name for tool in (await client.list_tools()).tools}
+
+
+async def test_registration_invalidates_the_cached_list() -> None:
+    def temporary_tool() -> str:
+        return "here"
+
+    async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+        before = await tool_names(client)
+        hits = tool_list_cache.hits
+        assert await tool_names(client) == before
+        assert tool_list_cache.hits == hits + 1
+
+        mcp.add_tool(temporary_tool)
+        try:
+            assert await tool_names(client) == before | {"temporary_tool"}
+        finally:
+            mcp.remove_tool("temporary_tool")
+        assert await tool_names(client) == before
+
+
+async def test_loaded_tools_are_private_to_the_session() -> None:
+    async with (
+        create_connected_server_and_client_session(mcp._mcp_server) as loader,
+        create_connected_server_and_client_session(mcp._mcp_server) as other,
+    ):
+        assert "bonus_calculator" not in await tool_names(other)
+        await loader.call_tool("load_bonus_tool", {})
+
+        assert {"bonus_calculator", "bonus_expression"} <= await tool_names(loader)
+        assert "bonus_calculator" not in await tool_names(other)
+
+        result = await loader.call_tool("bonus_calculator", BONUS_ARGUMENTS)
+        assert not result.isError
+        result = await other.call_tool("bonus_calculator", BONUS_ARGUMENTS)
+        assert result.isError
+        content = result.content[0]
+        assert isinstance(content, types.TextContent)
+        assert "Unknown tool" in content.text
+
+
+async def test_session_tool_calls_get_output_validation(monkeypatch: pytest.MonkeyPatch) -> None:
+    server = mcp._mcp_server
+    definitions: dict[str, types.Tool | None] = {}
+    get_definition = server._get_cached_tool_definition
+
+    async def recording(name: str) -> types.Tool | None:
+        definitions[name] = definition = await get_definition(name)
+        return definition
+
+    monkeypatch.setattr(server, "_get_cached_tool_definition", recording)
+    async with create_connected_server_and_client_session(server) as client:
+        await client.call_tool("load_bonus_tool", {})
+        # The lowlevel server's definitions are dropped whenever the shared list
+        # is rebuilt; a session tool must be found again without listing first
+        server._tool_cache.clear()
+        result = await client.call_tool("bonus_calculator", BONUS_ARGUMENTS)
+
+    assert not result.isError
+    assert result.structuredContent == {"result": "6.0 divide 3.0 = 2.0"}
+    definition = definitions["bonus_calculator"]
+    assert definition is not None
+    assert definition.outputSchema is not None  # So the lowlevel server validated the result
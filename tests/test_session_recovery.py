@@ -0,0 +1,91 @@
+"""Session recovery: resuming a stored HTTP session in a new session manager."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+import pytest
+from starlette.types import Receive, Scope, Send
+
+from mcp_starter.server import mcp
+from mcp_starter.session_recovery import RecoveringSessionManager
+from mcp_starter.session_store import open_session_store
+from mcp_starter.tools import session_sync
+
+pytestmark = pytest.mark.anyio
+
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+@asynccontextmanager
+async def server_process(store_url: str) -> AsyncIterator[httpx.AsyncClient]:
+    """A client for what one server process would run: its own manager and store connection."""
+    session_sync.configure(open_session_store(store_url))
+    manager = RecoveringSessionManager(session_sync, app=mcp._mcp_server, json_response=True)
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await manager.handle_request(scope, receive, send)
+
+    try:
+        async with (
+            manager.run(),
+            httpx.AsyncClient(
+                transport=httpx.ASGITransport(app), base_url="http://test/mcp", headers=HEADERS
+            ) as client,
+        ):
+            yield client
+    finally:
+        session_sync.configure(None)
+
+
+async def rpc(client: httpx.AsyncClient, session_id: str, method: str, **params: Any) -> Any:
+    response = await client.post(
+        "",
+        json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params},
+        headers={"Mcp-Session-Id": session_id},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["result"]
+
+
+async def test_session_resumes_in_another_process(tmp_path) -> None:
+    store_url = f"sqlite:///{tmp_path / 'sessions.db'}"
+
+    async with server_process(store_url) as client:
+        response = await client.post(
+            "",
+            json={
+                "jsonrpc": "2.0",
+                "id": 0,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2025-06-18",
+                    "capabilities": {},
+                    "clientInfo": {"name": "test", "version": "1.0"},
+                },
+            },
+        )
+        session_id = response.headers["mcp-session-id"]
+        await client.post(
+            "",
+            json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+            headers={"Mcp-Session-Id": session_id},
+        )
+        await rpc(client, session_id, "tools/call", name="load_bonus_tool", arguments={})
+
+    resumed = session_sync.stats.resumed
+    async with server_process(store_url) as client:
+        tools = await rpc(client, session_id, "tools/list")
+        assert "bonus_calculator" in [tool["name"] for tool in tools["tools"]]
+        result = await rpc(
+            client,
+            session_id,
+            "tools/call",
+            name="bonus_calculator",
+            arguments={"a": 2, "b": 3, "operation": "add"},
+        )
+        assert result["content"][0]["text"] == "2.0 add 3.0 = 5.0"
+        assert session_sync.stats.resumed == resumed + 1
@@ -0,0 +1,53 @@
+"""Session stores: the Redis store's connection handling."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from mcp_starter.session_store import RedisSessionStore, SessionRecord
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def slow_redis() -> AsyncIterator[str]:
+    """A RESP stand-in that answers GET <key> with a record naming the key, after a delay."""
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                count = int((await reader.readline())[1:])
+                args = []
+                for _ in range(count):
+                    length = int((await reader.readline())[1:])
+                    args.append((await reader.readexactly(length + 2))[:-2].decode())
+                if args[0] == "GET":
+                    await asyncio.sleep(0.05)
+                    data = SessionRecord({"clientInfo": {"name": args[1]}}).encode().encode()
+                    writer.write(b"$%d\r\n%s\r\n" % (len(data), data))
+                else:
+                    writer.write(b"+OK\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ValueError, ConnectionError):
+            writer.close()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield f"redis://127.0.0.1:{port}/0"
+
+
+async def test_cancelled_command_does_not_leak_its_reply(slow_redis: str) -> None:
+    store = RedisSessionStore(slow_redis, prefix="")
+    try:
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(store.get("A"), 0.01)
+
+        record = await asyncio.wait_for(store.get("B"), 1)
+        assert record is not None
+        assert record.client == {"clientInfo": {"name": "B"}}
+    finally:
+        await store.close()
@@ -0,0 +1,166 @@
+"""Weather cache: coalescing and stale-while-revalidate for single and batch lookups."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from mcp_starter.simulation import set_seed
+from mcp_starter.weather import (
+    CityNotFoundError,
+    StubWeatherProvider,
+    WeatherCache,
+    WeatherReading,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class CountingProvider:
+    """Provider that records upstream calls and waits until released."""
+
+    def __init__(self) -> None:
+        self.fetched: list[str] = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.version = 0
+
+    async def fetch(self, city: str) -> WeatherReading:
+        self.fetched.append(city)
+        await self.release.wait()
+        if city == "Nowhere":
+            raise CityNotFoundError(city)
+        return {
+            "location": city,
+            "temperature": self.version,
+            "unit": "celsius",
+            "conditions": "sunny",
+            "humidity": 50,
+        }
+
+    async def fetch_many(self, cities: list[str]) -> list[WeatherReading | None]:
+        readings: list[WeatherReading | None] = []
+        for city in cities:
+            try:
+                readings.append(await self.fetch(city))
+            except CityNotFoundError:
+                readings.append(None)
+        return readings
+
+
+async def test_batch_shares_single_fetch_in_flight() -> None:
+    provider = CountingProvider()
+    provider.release.clear()
+    cache = WeatherCache(provider)
+
+    single = asyncio.ensure_future(cache.get("London"))
+    await asyncio.sleep(0)
+    batch = asyncio.ensure_future(cache.get_many(["London", "Paris"]))
+    await asyncio.sleep(0)
+    provider.release.set()
+
+    reading, columns = await asyncio.gather(single, batch)
+    assert provider.fetched.count("London") == 1
+    assert columns["location"] == ["London", "Paris"]
+    assert columns["temperature"][0] == reading["temperature"]
+    assert cache.stats.coalesced == 1
+
+
+async def test_single_shares_batch_fetch_in_flight() -> None:
+    provider = CountingProvider()
+    provider.release.clear()
+    cache = WeatherCache(provider)
+
+    batch = asyncio.ensure_future(cache.get_many(["London", "Nowhere"]))
+    await asyncio.sleep(0)
+    single = asyncio.ensure_future(cache.get("London"))
+    other_batch = asyncio.ensure_future(cache.get_many(["Nowhere", "London"]))
+    await asyncio.sleep(0)
+    provider.release.set()
+
+    columns, _, other = await asyncio.gather(batch, single, other_batch)
+    assert sorted(provider.fetched) == ["London", "Nowhere"]
+    assert columns["temperature"][1] is None
+    assert other["location"] == ["Nowhere", "London"]
+
+
+async def test_stale_batch_entries_are_refreshed() -> None:
+    provider = CountingProvider()
+    cache = WeatherCache(provider, fresh_ttl=0.0, stale_ttl=60.0)
+    await cache.get_many(["London", "Paris"])
+    provider.version = 1
+
+    columns = await cache.get_many(["London", "Paris"])
+    assert columns["temperature"] == [0, 0]  # Stale readings served at once...
+    assert cache.stats.stale_hits == 2
+    await asyncio.sleep(0.01)
+    assert cache.stats.refreshes == 1  # ...refreshed in one batch
+    assert provider.fetched == ["London", "Paris", "London", "Paris"]
+    provider.version = 2
+    assert (await cache.get("London"))["temperature"] == 1
+
+
+@pytest.fixture
+def seeded():
+    set_seed(42)
+    yield
+    set_seed(None)
+
+
+@pytest.mark.usefixtures("seeded")
+async def test_seeded_readings_do_not_depend_on_cache_history() -> None:
+    cold = await WeatherCache(StubWeatherProvider()).get_many(["London", "Paris"])
+
+    warm_cache = WeatherCache(StubWeatherProvider())
+    await warm_cache.get("London")
+    warm = await warm_cache.get_many(["London", "Paris"])
+    assert warm == cold
+
+
+@pytest.mark.usefixtures("seeded")
+async def test_seeded_fetch_matches_fetch_many() -> None:
+    provider = StubWeatherProvider()
+    cities = [f"City {i}" for i in range(50)]
+    batch = await provider.fetch_many(cities)
+    assert batch == [await provider.fetch(city) for city in cities]
+    assert (await provider.fetch_many(cities[::-1]))[::-1] == batch
+
+
+@pytest.mark.parametrize("batch", [False, True])
+async def test_cancelled_starter_does_not_cancel_shared_fetch(batch: bool) -> None:
+    provider = CountingProvider()
+    provider.release.clear()
+    cache = WeatherCache(provider)
+
+    starter = asyncio.ensure_future(cache.get_many(["London"]) if batch else cache.get("London"))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(cache.get("London"))
+    await asyncio.sleep(0)
+    starter.cancel()
+    await asyncio.sleep(0)
+    provider.release.set()
+
+    assert (await waiter)["location"] == "London"
+    assert starter.cancelled()
+    assert provider.fetched == ["London"]
+
+
+async def test_location_is_the_requested_spelling() -> None:
+    cache = WeatherCache(CountingProvider())
+    assert (await cache.get("london"))["location"] == "london"
+    assert (await cache.get(" LONDON "))["location"] == " LONDON "
+    columns = await cache.get_many(["London", "london"])
+    assert columns["location"] == ["London", "london"]
+
+
+async def test_least_recently_used_cities_are_evicted() -> None:
+    provider = CountingProvider()
+    cache = WeatherCache(provider, maxsize=2)
+    await cache.get_many(["London", "Paris"])
+    await cache.get("London")
+    await cache.get("Rome")  # Evicts Paris
+
+    await cache.get_many(["London", "Rome", "Paris"])
+    assert provider.fetched == ["London", "Paris", "Rome", "Paris"]
+    assert cache.snapshot()["entries"] == 2
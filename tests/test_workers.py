@@ -0,0 +1,90 @@
+"""HTTP workers: session ownership and forwarding to the owning worker."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from mcp_starter.workers import SessionRouter, session_owner
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize(
+    ("session_id", "workers", "owner"),
+    [
+        ("w0-3f2a", 2, 0),
+        ("w1-3f2a", 2, 1),
+        ("w12-3f2a", 16, 12),
+        ("w2-3f2a", 2, None),  # More workers than this server runs
+        ("3f2a9c", 2, None),  # Minted without worker affinity
+        ("xw1-3f2a", 2, None),
+        ("w1", 2, None),
+    ],
+)
+def test_session_owner(session_id: str, workers: int, owner: int | None) -> None:
+    assert session_owner(session_id, workers) == owner
+
+
+def worker_app(name: str) -> ASGIApp:
+    """Answers with which worker handled the request and what it received."""
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        request = Request(scope, receive)
+        body = await request.body()
+        response = JSONResponse(
+            {
+                "worker": name,
+                "path": request.url.path,
+                "query": request.url.query,
+                "body": body.decode(),
+                "session": request.headers.get("mcp-session-id"),
+            }
+        )
+        await response(scope, receive, send)
+
+    return app
+
+
+def router_client(router: SessionRouter) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(router), base_url="http://test")
+
+
+async def test_router_forwards_to_owning_worker() -> None:
+    router = SessionRouter(worker_app("w0"), 0, ["/unused/w0.sock", "/unused/w1.sock"])
+    # The owner's unix socket, replaced by an in-process app
+    router._clients[1] = httpx.AsyncClient(
+        transport=httpx.ASGITransport(worker_app("w1")), base_url="http://worker"
+    )
+
+    async with router_client(router) as client:
+        forwarded = await client.post(
+            "/mcp?x=1", content=b'{"jsonrpc":"2.0"}', headers={"Mcp-Session-Id": "w1-abc"}
+        )
+        local = await client.post("/mcp", content=b"{}", headers={"Mcp-Session-Id": "w0-abc"})
+        new = await client.post("/mcp", content=b"{}")
+
+    assert forwarded.json() == {
+        "worker": "w1",
+        "path": "/mcp",
+        "query": "x=1",
+        "body": '{"jsonrpc":"2.0"}',
+        "session": "w1-abc",
+    }
+    assert local.json()["worker"] == "w0"
+    assert new.json()["worker"] == "w0"
+    assert router.forwarded == 1
+
+
+async def test_router_reports_unreachable_owner_as_missing_session(tmp_path) -> None:
+    sockets = [str(tmp_path / "w0.sock"), str(tmp_path / "w1.sock")]  # w1 never listens
+    router = SessionRouter(worker_app("w0"), 0, sockets)
+
+    async with router_client(router) as client:
+        response = await client.get("/mcp", headers={"Mcp-Session-Id": "w1-abc"})
+
+    assert response.status_code == 404
+    assert response.json()["error"]["message"] == "Session not found"